@@ -0,0 +1,90 @@
+import numpy as np
+
+
+# struct-of-arrays state for every Button. one vectorized update per frame does the hover expand/shrink
+# animation for all of them, Button objects only keep an index into these arrays
+
+
+FLOAT_FIELDS = ("x", "y", "width", "height", "hover_w", "hover_h", "hover_x", "hover_y")
+BOOL_FIELDS = (
+    "hovered",
+    "clicked",  # held down, or an active mode
+    "active",
+    "visible",  # only these take part in the hit test and animation
+)
+
+
+def _clamp(value, low, high):
+    # same order as vector2_clamp, so a collapsed (negative width) button behaves like before
+    return np.minimum(np.maximum(value, low), high)
+
+
+class ButtonArrays:
+
+    def __init__(self, capacity: int = 32):
+        self.count = 0
+        self.capacity = capacity
+        self.layout_version = 0  # bumped whenever a button moves or resizes, see ui_input.GridIndex
+
+        # hover_* is the white rectangle that grows out of the middle while hovered
+        for name in FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        for name in BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool))
+
+    def _grow(self, capacity):
+        for name in FLOAT_FIELDS + BOOL_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def add(self, x, y, width, height):
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        i = self.count
+        self.count += 1
+
+        self.x[i], self.y[i] = x, y
+        self.width[i], self.height[i] = width, height
+        self.hover_w[i] = self.hover_h[i] = 1
+        self.hover_x[i] = x + width / 2
+        self.hover_y[i] = y + height / 2
+        self.layout_version += 1
+        return i
+
+    def update(self, hovered_index, mouse_down, dt, speed):
+        # hovered_index is the one button under the cursor (or -1), found by the input grid
+        n = self.count
+        x, y, width, height = self.x[:n], self.y[:n], self.width[:n], self.height[:n]
+        visible = self.visible[:n]
+
+        hovered = np.zeros(n, dtype=bool)
+        if hovered_index >= 0:
+            hovered[hovered_index] = True
+        clicked = (hovered & mouse_down) | self.active[:n]
+        self.hovered[:n] = hovered
+        self.clicked[:n] = clicked
+
+        # hovered buttons grow their highlight, the rest shrink it back, held ones stay put
+        grow = visible & hovered & ~clicked
+        shrink = visible & ~hovered & ~clicked
+        step = np.where(grow, speed * dt, np.where(shrink, -speed * dt, 0.0))
+
+        # growing clamps to a square of the button width, shrinking to the button itself
+        max_h = np.where(grow, width, height)
+        self.hover_w[:n] = _clamp(self.hover_w[:n] + step, 1, width)
+        self.hover_h[:n] = _clamp(self.hover_h[:n] + step, 1, max_h)
+        self.hover_x[:n] = _clamp(self.hover_x[:n] - step / 2, x, x + width / 2)
+        self.hover_y[:n] = _clamp(self.hover_y[:n] - step / 2, y, y + height / 2)
+
+    def flip(self, indices, dx_width, dx_position):
+        # page flip animation, moves every button of a page in one go
+        self.width[indices] += dx_width
+        self.x[indices] += dx_position
+        self.layout_version += 1
+
+
+button_arrays = ButtonArrays()
@@ -0,0 +1,257 @@
+from collections import Counter, deque
+
+import pyray
+from pyray import Font, RenderTexture, Shader, Texture, Vector2
+from raylib import ffi
+
+from ui_input import InputSnapshot
+
+
+# every draw, input and gpu resource call the window makes goes through `gfx`, so the frame logic
+# (Button.draw, Window.draw_contents, ...) runs the same against a real window or none at all.
+#
+#   gfx.use(HeadlessBackend())   # before the Window is made, bench_frames.py does this
+#
+# the names and arguments are pyray's, RaylibBackend just hands them straight through
+
+
+# everything a backend has to provide
+BACKEND_CALLS = (
+    # window and frame
+    "open_window", "close_window", "window_should_close", "is_window_resized",
+    "get_screen_width", "get_screen_height", "get_frame_time", "get_time",
+    "begin_drawing", "end_drawing", "clear_background",
+    # input
+    "capture_input", "set_mouse_offset", "set_mouse_scale",
+    # drawing
+    "draw_rectangle", "draw_rectangle_rounded", "draw_text", "draw_text_ex",
+    "draw_texture_rec", "draw_texture_pro", "measure_text_ex",
+    "begin_blend_mode", "end_blend_mode", "rl_set_blend_factors_separate",
+    "begin_scissor_mode", "end_scissor_mode", "begin_mode_2d", "end_mode_2d",
+    "begin_texture_mode", "end_texture_mode", "begin_shader_mode", "end_shader_mode",
+    # resources
+    "load_render_texture", "unload_render_texture", "set_texture_filter",
+    "load_texture_from_image", "update_texture", "unload_texture",
+    "load_shader_from_memory", "get_shader_location", "set_shader_value", "unload_shader",
+    "load_font",
+)
+
+# headless calls that count as drawing, the rest just keep the fake state going
+DRAW_CALLS = (
+    "clear_background", "draw_rectangle", "draw_rectangle_rounded", "draw_text", "draw_text_ex",
+    "draw_texture_rec", "draw_texture_pro",
+    "begin_blend_mode", "end_blend_mode", "rl_set_blend_factors_separate",
+    "begin_scissor_mode", "end_scissor_mode", "begin_mode_2d", "end_mode_2d",
+    "begin_texture_mode", "end_texture_mode", "begin_shader_mode", "end_shader_mode",
+    "update_texture",
+)
+
+
+class RaylibBackend:
+
+    # pyray functions as they are, no wrapper call in between
+    close_window = staticmethod(pyray.close_window)
+    window_should_close = staticmethod(pyray.window_should_close)
+    is_window_resized = staticmethod(pyray.is_window_resized)
+    get_screen_width = staticmethod(pyray.get_screen_width)
+    get_screen_height = staticmethod(pyray.get_screen_height)
+    get_frame_time = staticmethod(pyray.get_frame_time)
+    get_time = staticmethod(pyray.get_time)
+    begin_drawing = staticmethod(pyray.begin_drawing)
+    end_drawing = staticmethod(pyray.end_drawing)
+    clear_background = staticmethod(pyray.clear_background)
+
+    capture_input = staticmethod(InputSnapshot.capture)
+    set_mouse_offset = staticmethod(pyray.set_mouse_offset)
+    set_mouse_scale = staticmethod(pyray.set_mouse_scale)
+
+    draw_rectangle = staticmethod(pyray.draw_rectangle)
+    draw_rectangle_rounded = staticmethod(pyray.draw_rectangle_rounded)
+    draw_text = staticmethod(pyray.draw_text)
+    draw_text_ex = staticmethod(pyray.draw_text_ex)
+    draw_texture_rec = staticmethod(pyray.draw_texture_rec)
+    draw_texture_pro = staticmethod(pyray.draw_texture_pro)
+    measure_text_ex = staticmethod(pyray.measure_text_ex)
+    begin_blend_mode = staticmethod(pyray.begin_blend_mode)
+    end_blend_mode = staticmethod(pyray.end_blend_mode)
+    rl_set_blend_factors_separate = staticmethod(pyray.rl_set_blend_factors_separate)
+    begin_scissor_mode = staticmethod(pyray.begin_scissor_mode)
+    end_scissor_mode = staticmethod(pyray.end_scissor_mode)
+    begin_mode_2d = staticmethod(pyray.begin_mode_2d)
+    end_mode_2d = staticmethod(pyray.end_mode_2d)
+    begin_texture_mode = staticmethod(pyray.begin_texture_mode)
+    end_texture_mode = staticmethod(pyray.end_texture_mode)
+    begin_shader_mode = staticmethod(pyray.begin_shader_mode)
+    end_shader_mode = staticmethod(pyray.end_shader_mode)
+
+    load_render_texture = staticmethod(pyray.load_render_texture)
+    unload_render_texture = staticmethod(pyray.unload_render_texture)
+    set_texture_filter = staticmethod(pyray.set_texture_filter)
+    load_texture_from_image = staticmethod(pyray.load_texture_from_image)
+    update_texture = staticmethod(pyray.update_texture)
+    unload_texture = staticmethod(pyray.unload_texture)
+    load_shader_from_memory = staticmethod(pyray.load_shader_from_memory)
+    get_shader_location = staticmethod(pyray.get_shader_location)
+    set_shader_value = staticmethod(pyray.set_shader_value)
+    unload_shader = staticmethod(pyray.unload_shader)
+
+    @staticmethod
+    def open_window(width: int, height: int, title: str):
+        pyray.set_config_flags(pyray.ConfigFlags.FLAG_VSYNC_HINT)
+        pyray.init_window(width, height, title.encode())
+        pyray.set_target_fps(60)
+
+    @staticmethod
+    def load_font(font_path: str, font_size: int, glyphs: str):
+        # baked subset atlases, only rasterized on the first run or when the glyph set changes
+        from font_atlas import load_font_atlas
+        return load_font_atlas(font_path, font_size, glyphs)
+
+
+def _recorder(name):
+    def call(self, *args):
+        self.calls[name] += 1
+        if self.log is not None:
+            self.log.append((name, args))
+    call.__name__ = name
+    return call
+
+
+class HeadlessBackend:
+
+    # no window, no gpu. draw calls are counted per name (and logged with their arguments if keep_log),
+    # input comes from a scripted queue of InputSnapshots, and time moves a fixed step per frame.
+    # window_should_close turns True once the script runs out, so Window.run works here too
+
+    def __init__(self, width: int = 500, height: int = 800, frame_time: float = 1 / 60, keep_log: bool = False):
+        self.width = width
+        self.height = height
+        self.frame_time = frame_time
+        self.time = 0.0
+        self.frames = 0
+        self.calls = Counter()
+        self.log = [] if keep_log else None
+        self.script = deque()
+        self.idle = InputSnapshot()
+        self.next_id = 1
+
+    def script_input(self, snapshots):
+        self.script.extend(snapshots)
+
+    def reset_counts(self):
+        self.calls.clear()
+        if self.log is not None:
+            self.log.clear()
+
+    def _new_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    # window and frame
+
+    def open_window(self, width, height, title):
+        self.width, self.height = width, height
+
+    def close_window(self):
+        pass
+
+    def window_should_close(self):
+        return not self.script
+
+    def is_window_resized(self):
+        return False
+
+    def get_screen_width(self):
+        return self.width
+
+    def get_screen_height(self):
+        return self.height
+
+    def get_frame_time(self):
+        return self.frame_time
+
+    def get_time(self):
+        return self.time
+
+    def begin_drawing(self):
+        self.calls["begin_drawing"] += 1
+
+    def end_drawing(self):
+        self.calls["end_drawing"] += 1
+        self.frames += 1
+        self.time += self.frame_time
+
+    # input
+
+    def capture_input(self):
+        return self.script.popleft() if self.script else self.idle
+
+    def set_mouse_offset(self, x, y):
+        pass
+
+    def set_mouse_scale(self, x, y):
+        pass
+
+    # drawing, the recorded ones are added below the class from DRAW_CALLS
+
+    def measure_text_ex(self, font, text, font_size, spacing):
+        # close enough for layout, every glyph half as wide as it is tall
+        return Vector2(len(text) * (font_size * 0.5 + spacing), font_size)
+
+    # resources, real structs with made up ids so anything reading them still works
+
+    def load_render_texture(self, width, height):
+        return RenderTexture(self._new_id(), Texture(self._new_id(), width, height, 1, 7), Texture(0, width, height, 1, 19))
+
+    def unload_render_texture(self, target):
+        pass
+
+    def set_texture_filter(self, texture, mode):
+        pass
+
+    def load_texture_from_image(self, image):
+        return Texture(self._new_id(), image.width, image.height, 1, image.format)
+
+    def unload_texture(self, texture):
+        pass
+
+    def load_shader_from_memory(self, vertex, fragment):
+        return Shader(self._new_id(), ffi.NULL)
+
+    def get_shader_location(self, shader, name):
+        return 0
+
+    def set_shader_value(self, shader, location, value, kind):
+        pass
+
+    def unload_shader(self, shader):
+        pass
+
+    def load_font(self, font_path, font_size, glyphs):
+        return Font(font_size, 0, 0, Texture(self._new_id(), 0, 0, 1, 7), ffi.NULL, ffi.NULL)
+
+
+for _name in DRAW_CALLS:
+    setattr(HeadlessBackend, _name, _recorder(_name))
+del _name
+
+
+class Gfx:
+
+    # the backend's bound methods get copied on as plain attributes, so gfx.draw_text_ex(...) costs
+    # the same as calling the backend directly
+
+    def __init__(self, backend):
+        self.use(backend)
+
+    def use(self, backend):
+        missing = [name for name in BACKEND_CALLS if not hasattr(backend, name)]
+        if missing:
+            raise TypeError(f"{type(backend).__name__} is missing {', '.join(missing)}")
+
+        self.backend = backend
+        for name in BACKEND_CALLS:
+            setattr(self, name, getattr(backend, name))
+
+
+gfx = Gfx(RaylibBackend())
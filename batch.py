@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from input_parser import ParseError, parse_text, to_sympy
+
+
+# streaming batch mode, no window, no raylib, no fonts. reads equations and writes one json line per
+# result as soon as it's ready:
+#
+#   python batch.py problems.txt > results.jsonl
+#   python main.py --batch - < problems.jsonl
+#
+# input lines are either "M DX N DY" or json: {"m": ..., "n": ...} or {"input": "M DX N DY"}, with an
+# optional "id" that's copied to the output. blank lines and lines starting with # are skipped.
+# m and n are written with the calculator's keys too, everything is parsed the way the = button does it
+#
+# at most --in-flight chunks are queued on the pool at once, reading stops until the oldest one is
+# written, so memory stays flat however long the input is. output is in input order unless
+# --unordered, every result carries its input "line" either way
+
+
+DEFAULT_IN_FLIGHT_PER_WORKER = 4
+DEFAULT_CHUNK = 8
+
+
+def read_items(stream):
+    # (line number, id, text or (m, n), error). only json is decoded here, parsing and sympy happen in the workers
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        item_id, equation, error = None, line, None
+        if line.startswith("{"):
+            try:
+                data = json.loads(line)
+                item_id = data.get("id")
+                equation = (str(data["m"]), str(data["n"])) if "m" in data else str(data["input"])
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                error = f"bad input: {e!r}"
+
+        yield line_no, item_id, equation, error
+
+
+def chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# worker side
+
+_options = {}
+
+
+def _init_worker(cache_path, budget, solve):
+    import engine
+    engine._init_worker(cache_path)
+    engine.warm_up()
+    _options.update(budget=engine.DEFAULT_BUDGET if budget is None else budget, solve=solve)
+
+
+def _check_chunk(chunk):
+    # (worker pid, its canon table stats, results)
+    import engine
+
+    out = []
+    for line_no, item_id, equation, error in chunk:
+        if error is None:
+            text = equation if isinstance(equation, str) else f"{equation[0]} DX {equation[1]} DY"
+            try:
+                equation = tuple(to_sympy(tree) for tree in parse_text(text))
+            except ParseError as e:
+                error = f"bad input: {e.message}"
+
+        if error is not None:
+            result = {"m": None, "n": None, "exact": None, "error": error}
+        else:
+            m, n = equation
+            result = engine.check_exact(m, n, line_no, engine._worker_cache, _options["budget"], _options["solve"]).to_dict()
+            del result["index"]
+        result = {"line": line_no, "id": item_id, **result}
+        if item_id is None:
+            del result["id"]
+        out.append(result)
+    return os.getpid(), engine.canon.stats(), out
+
+
+def run(stream, out, workers: int = None, in_flight: int = None, chunk: int = DEFAULT_CHUNK, ordered: bool = True,
+        budget: float = None, solve: bool = False, cache_path: str = None):
+    # this process only reads and writes lines, sympy is never imported outside the workers
+    workers = workers or os.cpu_count() or 1
+    in_flight = in_flight or workers * DEFAULT_IN_FLIGHT_PER_WORKER
+
+    counts = {"total": 0, "exact": 0, "not exact": 0, "undecided": 0, "errors": 0}
+    canon_stats = {}  # worker pid -> latest canon table stats
+
+    def write(chunk_result):
+        pid, stats, results = chunk_result
+        canon_stats[pid] = stats
+        for result in results:
+            counts["total"] += 1
+            if result["error"] is not None:
+                counts["errors"] += 1
+            elif result["exact"] is None:
+                counts["undecided"] += 1
+            else:
+                counts["exact" if result["exact"] else "not exact"] += 1
+            out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    pending = deque()  # futures in submission order
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_path, budget, solve)) as executor:
+        for items in chunks(read_items(stream), chunk):
+            # backpressure: don't read further until there's room
+            while len(pending) >= in_flight:
+                if ordered:
+                    write(pending.popleft().result())
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        write(future.result())
+
+            pending.append(executor.submit(_check_chunk, items))
+
+        if ordered:
+            while pending:
+                write(pending.popleft().result())
+        else:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    write(future.result())
+
+    from canon import merge_stats
+    return counts, merge_stats(canon_stats.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="batch", description="check M dx + N dy = 0 for exactness, one equation per line")
+    parser.add_argument("input", nargs="?", default="-", help="file to read, - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="file to write, - for stdout (default)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: cpu count)")
+    parser.add_argument("--in-flight", type=int, default=None, help="max chunks queued at once (default: 4 per worker)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="lines per task sent to a worker")
+    parser.add_argument("--unordered", action="store_true", help="write results as they finish instead of in input order")
+    parser.add_argument("--budget", type=float, default=None, help="seconds per equation before it's reported undecided")
+    parser.add_argument("--solve", action="store_true", help="also find F(x, y) = C for exact equations")
+    parser.add_argument("--cache", metavar="PATH", default=None, help="sqlite file to reuse results across runs")
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    start = time.perf_counter()
+    try:
+        counts, canon_stats = run(stream, out, args.workers, args.in_flight, args.chunk, not args.unordered, args.budget, args.solve, args.cache)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    print(f"Batch: {summary} in {elapsed:.1f}s", file=sys.stderr)
+    if canon_stats:
+        print(f"Batch: {canon_stats['unique']} distinct subtrees out of {canon_stats['subtrees']} ({canon_stats['dedup_ratio']:.2f}x), "
+              f"derivatives reused {canon_stats['diff_reuse']:.0%}, verdicts reused {canon_stats['verdict_reuse']:.0%}, "
+              f"terms reused {canon_stats['term_reuse']:.0%}", file=sys.stderr)
+
+    return 1 if counts["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from font_assets import FONT_PATH, FONT_ITALIC_PATH
+from font_embedder import write_legacy_module
+
+
+# compares the old "import a 1 MB list literal + bytes()" font path against the mmap asset path.
+# both are timed up to the raylib hand-off (the buffer load_font_from_memory reads, every page of it
+# actually touched, a bare mmap costs nothing until then) and again with load_font_from_memory itself.
+# every run is a fresh interpreter so import caches and rss don't leak between them
+
+
+RSS_SNIPPET = """
+def rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+LOAD_SIZE = 32  # raylib's default, small enough that rasterizing doesn't drown out the difference
+
+# raylib is imported before the clock starts, both paths pay for that the same
+LOAD_SNIPPET = """
+LOAD_SIZE = %d
+import json, time
+from pyray import load_font_from_memory
+from raylib import ffi
+
+def finish(before, start, buffers):
+    handoff = time.perf_counter() - start
+    rss = rss_kb() - before
+    fonts = [load_font_from_memory(".ttf", buffer, len(buffer), LOAD_SIZE, ffi.NULL, 0) for buffer in buffers]
+    loaded = time.perf_counter() - start
+    print(json.dumps({"seconds": handoff, "loaded": loaded, "rss_kb": rss, "bytes": sum(len(buffer) for buffer in buffers),
+                      "glyphs": sum(font.glyphCount for font in fonts)}))
+""" % LOAD_SIZE
+
+OLD_PATH = RSS_SNIPPET + LOAD_SNIPPET + """
+before = rss_kb()
+start = time.perf_counter()
+from font_hex import font_hex
+from font_hex_italic import font_hex_italic
+font_data = bytes(font_hex)
+font_data_italic = bytes(font_hex_italic)
+finish(before, start, [ffi.from_buffer("unsigned char[]", data) for data in (font_data, font_data_italic)])
+"""
+
+NEW_PATH = RSS_SNIPPET + LOAD_SNIPPET + """
+import mmap
+before = rss_kb()
+start = time.perf_counter()
+buffers = []
+for path in (%r, %r):
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # one byte per page, so the mapping is really resident like the old bytes copy is
+    sum(memoryview(data)[::mmap.PAGESIZE])
+    buffers.append(ffi.from_buffer("unsigned char[]", data))
+finish(before, start, buffers)
+""" % (FONT_PATH, FONT_ITALIC_PATH)
+
+
+def run(code: str, cwd: str, repeat: int):
+    # the old path only gets its warm numbers if .pyc files can actually be written
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def report(name: str, samples):
+    handoff = median(sample["seconds"] for sample in samples) * 1000
+    loaded = median(sample["loaded"] for sample in samples) * 1000
+    rss = median(sample["rss_kb"] for sample in samples)
+    print(f"{name:<24} to hand-off {handoff:9.2f} ms   with load_font_from_memory {loaded:9.2f} ms   rss +{rss:7d} KB"
+          f"   ({samples[0]['bytes']} bytes, {samples[0]['glyphs']} glyphs)")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(FONT_PATH, "rb") as f:
+            write_legacy_module(f.read(), os.path.join(tmp, "font_hex.py"), "font_hex")
+        with open(FONT_ITALIC_PATH, "rb") as f:
+            write_legacy_module(f.read(), os.path.join(tmp, "font_hex_italic.py"), "font_hex_italic")
+
+        # first run has to compile the literals, later ones hit __pycache__
+        report("old (cold, no .pyc)", run(OLD_PATH, tmp, 1))
+        report("old (warm .pyc)", run(OLD_PATH, tmp, repeat))
+
+    report("new (mmap asset)", run(NEW_PATH, os.getcwd(), repeat))
+
+
+if __name__ == "__main__":
+    main()
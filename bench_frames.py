@@ -0,0 +1,178 @@
+import sys
+import time
+import tracemalloc
+
+from pyray import KeyboardKey
+
+from backend import HeadlessBackend, gfx
+from ui_input import InputSnapshot
+
+
+# replays scripted frames through the real Window against the headless backend, no gpu or display needed.
+# reports frames/sec, draw calls per frame and python allocations per frame for each scenario, then the
+# button scenarios again with the static layer on and off (what F2 toggles in the app)
+#
+# usage: python bench_frames.py [frames per scenario, roughly]
+
+
+def center(button):
+    return float(button.x + button.width / 2), float(button.y + button.height / 2)
+
+
+def idle(frames, x=-1.0, y=-1.0):
+    return [InputSnapshot(x, y) for _ in range(frames)]
+
+
+def click(button, hold=3, after=2):
+    x, y = center(button)
+    return (
+        [InputSnapshot(x, y, pressed=True, down=True)]
+        + [InputSnapshot(x, y, down=True) for _ in range(hold)]
+        + idle(after, x, y)
+    )
+
+
+def type_keys(app, keys):
+    frames = []
+    for key in keys:
+        frames += click(app.buttons[key])
+    return frames
+
+
+def scenarios(app, frames):
+    keys = list("1+2*3-4/5") + ["DX"] + list("6*7") + ["DY", "C"]
+    buttons = list(app.buttons.values())
+
+    return {
+        "idle": lambda: idle(frames),
+        # a new button under the cursor every few frames, hover animations always running
+        "hover sweep": lambda: [InputSnapshot(*center(buttons[(i // 4) % len(buttons)])) for i in range(frames)],
+        "button presses": lambda: type_keys(app, keys * (frames // (len(keys) * 6) + 1)),
+        # "..." then wait out the shrink / expand animation, an even number of flips so it ends on the base page
+        "page flips": lambda: click(app.more_button, hold=0, after=59) * (2 * (frames // 120 + 1)),
+        # a few hundred keys on screen, the camera scrolls and the text is long
+        "long input": lambda: type_keys(app, list("12345678+") * 30) + idle(frames),
+        # 50 000 keys already entered, holding the left arrow scrolls back through them
+        "huge input scroll": lambda: enter_keys(app, list("12345678+") * 5556) + scroll(frames),
+        # the 100x100 direction field and its level curves up, still and then dragged every frame so the
+        # field is rebuilt every frame and the curves keep being recomputed in the background
+        "slope field": lambda: show_plot(app) + idle(frames),
+        "slope field pan": lambda: show_plot(app) + drag(frames),
+        # not exact, so the curves are rk4 trajectories
+        "trajectories pan": lambda: show_plot(app, potential=None) + drag(frames),
+    }
+
+
+STATIC_LAYER_SCENARIOS = ("idle", "hover sweep", "button presses", "page flips")
+
+
+def enter_keys(app, keys):
+    # straight into the parser, clicking 50 000 buttons would take most of a minute of frames
+    for key in keys:
+        app.press(key)
+    return []
+
+
+def scroll(frames):
+    return [InputSnapshot(keys_down=frozenset({KeyboardKey.KEY_LEFT})) for _ in range(frames)]
+
+
+def show_plot(app, potential="x**2*y - numpy.cos(x) + numpy.sin(y)"):
+    # what the worker sends back for 2xy + sin(x) dx + x^2 + cos(y) dy
+    plot = {"m": "2*x*y + numpy.sin(x)", "n": "x**2 + numpy.cos(y)", "F": potential}
+    app.slope_field.set_equation(plot["m"], plot["n"])
+    app.curves.set_equation(plot)
+    app.plot_mode = True
+    return []
+
+
+def drag(frames):
+    return [InputSnapshot(200 + (i % 200), 600, pressed=i == 0, down=True) for i in range(frames)]
+
+
+def run_frames(app, backend, script):
+    backend.script_input(script)
+    while not gfx.window_should_close():
+        app.frame()
+
+
+def bench(app, backend, name, make_script):
+    script = make_script()
+    count = len(script)
+
+    # timing pass
+    backend.reset_counts()
+    start = time.perf_counter()
+    run_frames(app, backend, script)
+    elapsed = time.perf_counter() - start
+    calls = sum(n for call, n in backend.calls.items() if call not in ("begin_drawing", "end_drawing"))
+
+    # allocation pass over the same frames, tracemalloc slows things down so it's kept out of the timing.
+    # tracemalloc only sees live blocks, so "allocated" is the most a frame had live on top of what it
+    # started with, and "retained" is what's still alive after all of them
+    app.press("C")
+    backend.script_input(make_script())
+    tracemalloc.start()
+    blocks_before = _blocks()
+    allocated = 0
+    while not gfx.window_should_close():
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        app.frame()
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    blocks_after = _blocks()
+    tracemalloc.stop()
+
+    print(f"{name:<16} {count:6d} frames {count / elapsed:8.0f} fps {elapsed / count * 1e6:7.1f} us/frame "
+          f"{calls / count:5.1f} draws/frame  allocated {allocated / count:7.0f} B/frame  retained {(blocks_after - blocks_before) / count:+6.2f} blocks/frame")
+
+    app.press("C")
+
+
+def _blocks():
+    snapshot = tracemalloc.take_snapshot()
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    backend = HeadlessBackend()
+    gfx.use(backend)
+
+    # after gfx.use, the Window picks up the headless backend for every resource it makes
+    from main import Window
+    app = Window(500, 800, "DE")
+
+    # the sympy worker warms up in its own process, let it finish so it isn't competing for the cpu
+    deadline = time.perf_counter() + 60
+    while not app.evaluator.ready and time.perf_counter() < deadline:
+        run_frames(app, backend, idle(10))
+        time.sleep(0.05)
+
+    print(f"{frames} frames per scenario, headless backend")
+    for name, make_script in scenarios(app, frames).items():
+        bench(app, backend, name, make_script)
+
+    # the scenarios the static layer is for, the plot ones draw the same either way
+    app.plot_mode = False
+    for use_static_layer in (True, False):
+        print(f"static layer {'on' if use_static_layer else 'off'}")
+        app.use_static_layer = use_static_layer
+        app.static_key = None
+        for name, make_script in scenarios(app, frames).items():
+            if name in STATIC_LAYER_SCENARIOS:
+                bench(app, backend, name, make_script)
+    app.use_static_layer = True
+
+    field = app.slope_field
+    print(f"slope field: {field.grid}x{field.grid} segments, {field.rebuilds} rebuilds, last one {field.rebuild_time * 1000:.2f} ms")
+    shown = app.curves.shown
+    if shown is not None:
+        print(f"curves: {shown.curves} {shown.kind}, last one {shown.elapsed * 1000:.1f} ms on the background thread")
+
+    app.evaluator.close()
+
+
+if __name__ == "__main__":
+    main()
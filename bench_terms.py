@@ -0,0 +1,104 @@
+import random
+import sys
+import time
+
+from sympy import cos, diff, exp, sin, sympify, symbols
+
+from canon import CanonTable
+from zero_test import equal_within_budget
+
+
+# editing one term of a long M / N and pressing = again: whole-expression diff + zero test every time
+# (what is_exact used to do) against the canon table's term by term derivatives and cancellation.
+#
+# usage: python bench_terms.py [terms] [edits]
+
+
+x, y = symbols("x y")
+
+
+def potential_terms(count: int, rng):
+    # a mix of the usual textbook terms, the equation is M = F_x, N = F_y so it's exact
+    makers = (
+        lambda k: rng.randint(1, 9) * x ** (k + 1) * y ** (k % 3 + 1),
+        lambda k: rng.randint(1, 9) * sin((k + 1) * x) * cos((k % 3 + 1) * y),
+        lambda k: rng.randint(1, 9) * exp((k + 1) * x) * y ** (k % 3 + 1),
+        lambda k: rng.randint(1, 9) * x * exp((k + 1) * y),
+    )
+    # k // 4 keeps every term distinct, so none of them merge
+    return [makers[k % len(makers)](k // 4) for k in range(count)]
+
+
+def equation(terms):
+    F = sum(terms)
+    # strings like the ones the calculator sends, so both sides pay for sympify the same way
+    return str(diff(F, x)), str(diff(F, y))
+
+
+def edits(terms, count: int, rng):
+    # one term's coefficient changed at a time, what a user fixing a typo does
+    out = []
+    for _ in range(count):
+        i = rng.randrange(len(terms))
+        terms = list(terms)
+        terms[i] = terms[i] * rng.randint(2, 9)
+        out.append(equation(terms))
+    return out
+
+
+def whole(m: str, n: str, table=None):
+    M, N = sympify(m), sympify(n)
+    start = time.perf_counter()
+    verdict = equal_within_budget(diff(M, y), diff(N, x))
+    return time.perf_counter() - start, verdict.is_zero, None
+
+
+def termwise(m: str, n: str, table: CanonTable):
+    M, N = sympify(m), sympify(n)
+    start = time.perf_counter()
+    dm_dy, m_reused, m_recomputed = table.diff_terms(M, y)
+    dn_dx, n_reused, n_recomputed = table.diff_terms(N, x)
+    verdict, _, compared = table.equal_terms(dm_dy, dn_dx, 5.0)
+    return time.perf_counter() - start, verdict.is_zero, (m_reused + n_reused, m_recomputed + n_recomputed, compared)
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    term_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    edit_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    rng = random.Random(0)
+    terms = potential_terms(term_count, rng)
+    first = equation(terms)
+    changed = edits(terms, edit_count, rng)
+
+    m, n = first
+    print(f"M has {len(sympify(m).args)} terms, N has {len(sympify(n).args)}, {edit_count} one-term edits")
+
+    for name, check in (("whole expression", whole), ("term by term", termwise)):
+        table = CanonTable()
+        cold, verdict, _ = check(m, n, table)
+
+        times, counts = [], []
+        for em, en in changed:
+            seconds, verdict, terms_used = check(em, en, table)
+            if verdict is not True:
+                raise RuntimeError(f"{name} got {verdict} for an exact equation")
+            times.append(seconds)
+            counts.append(terms_used)
+
+        line = f"{name:<18} first {cold * 1000:8.1f} ms   per edit {median(times) * 1000:8.2f} ms median, {max(times) * 1000:8.2f} ms worst"
+        if counts[0] is not None:
+            reused = sum(c[0] for c in counts) / len(counts)
+            recomputed = sum(c[1] for c in counts) / len(counts)
+            compared = sum(c[2] for c in counts) / len(counts)
+            line += f"   terms {reused:.1f} reused / {recomputed:.1f} differentiated / {compared:.1f} compared per edit"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
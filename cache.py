@@ -0,0 +1,120 @@
+import os
+import sqlite3
+from collections import OrderedDict
+
+from sympy import srepr, sympify
+
+
+# memoizes exactness results keyed by the canonical (srepr) form of the parsed M and N,
+# so "2*x*y" and "y*x*2" share an entry. LRU in memory, optionally backed by sqlite on disk.
+# only certain verdicts go to disk, a probabilistic one is good for this process but shouldn't outlive it
+
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# bump the version when the row layout or what a stored verdict means changes, old tables are just ignored
+TABLE = "results_v2"
+
+
+class CacheEntry:
+
+    def __init__(self, M, N, dm_dy, dn_dx, exact, tier, certain):
+        self.M = M
+        self.N = N
+        self.dm_dy = dm_dy
+        self.dn_dx = dn_dx
+        self.exact = exact
+        self.tier = tier  # the zero_test tier that decided it
+        self.certain = certain
+
+
+class ExactCache:
+
+    def __init__(self, path: str = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db = None
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self.db = sqlite3.connect(path, timeout=30)
+                self.db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TABLE} (key TEXT PRIMARY KEY, m TEXT, n TEXT, dm_dy TEXT, dn_dx TEXT, exact INTEGER, tier TEXT)"
+                )
+                self.db.commit()
+            except (OSError, sqlite3.Error) as e:
+                # a read-only or broken location just means no persistence
+                print(f"Cache: disk store disabled ({e})")
+                self.db = None
+
+    @staticmethod
+    def key(M, N):
+        return srepr(M) + "|" + srepr(N)
+
+    def get(self, M, N):
+        key = self.key(M, N)
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        if self.db is not None:
+            row = self.db.execute(f"SELECT m, n, dm_dy, dn_dx, exact, tier FROM {TABLE} WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                m, n, dm_dy, dn_dx, exact, tier = row
+                entry = CacheEntry(sympify(m), sympify(n), sympify(dm_dy), sympify(dn_dx), bool(exact), tier, True)
+                self._remember(key, entry)
+                self.disk_hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, M, N, dm_dy, dn_dx, exact, tier, certain):
+        key = self.key(M, N)
+        entry = CacheEntry(M, N, dm_dy, dn_dx, exact, tier, certain)
+        self._remember(key, entry)
+
+        if self.db is not None and certain:
+            try:
+                self.db.execute(
+                    f"INSERT OR REPLACE INTO {TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, srepr(M), srepr(N), srepr(dm_dy), srepr(dn_dx), int(exact), tier),
+                )
+                self.db.commit()
+            except sqlite3.Error as e:
+                print(f"Cache: write failed ({e})")
+
+        return entry
+
+    def _remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
@@ -0,0 +1,191 @@
+# hash-consed expressions: every subtree goes through one table, so equal subtrees from different
+# equations end up as the same object. sympify already puts "2*x*y" and "y*x*2" (and any spacing) in the same
+# canonical order, this makes them share one node, and everything memoized per node is then shared too:
+#
+#   derivatives    d/dvar of a node is worked out once, sums and products reuse their children's
+#   zero tests     the verdict for a (dM/dy, dN/dx) pair is kept, so it's decided once per batch / session
+#
+# M and N are taken apart into their top level terms (diff_terms / equal_terms): after editing one term of a
+# long M only that term is differentiated again, and terms that turn up on both sides of dM/dy = dN/dx cancel
+# before the zero test, so it only sees (and the verdict is only keyed on) the terms that differ
+#
+# one table per process (the window's worker, each batch / service pool worker), dropped when it gets too big.
+# sympy is only imported inside the methods, the batch and service parents import this just for merge_stats
+
+
+DEFAULT_MAX_NODES = 200_000
+
+
+class CanonTable:
+
+    def __init__(self, max_nodes: int = DEFAULT_MAX_NODES):
+        self.max_nodes = max_nodes
+        self.nodes = {}  # expr -> the shared instance
+        self.derivatives = {}  # (node, var) -> derivative
+        self.verdicts = {}  # (lhs, rhs) -> ZeroTestResult
+
+        self.seen = 0  # subtrees looked up
+        self.diff_hits = 0
+        self.diff_misses = 0
+        self.verdict_hits = 0
+        self.verdict_misses = 0
+        self.term_hits = 0  # top level terms whose derivative was already known
+        self.term_misses = 0
+        self.terms_cancelled = 0  # on both sides of a comparison, never reached the zero test
+        self.terms_compared = 0
+        self.resets = 0
+
+    def intern(self, expr):
+        if len(self.nodes) > self.max_nodes:
+            self.reset()
+        return self._intern(expr)
+
+    def _intern(self, expr):
+        self.seen += 1
+        node = self.nodes.get(expr)
+        if node is not None:
+            return node
+
+        if expr.args:
+            args = tuple(self._intern(arg) for arg in expr.args)
+            # only rebuild when a child was swapped for an existing node, func(*args) == expr either way
+            if any(new is not old for new, old in zip(args, expr.args)):
+                expr = expr.func(*args)
+
+        self.nodes[expr] = expr
+        return expr
+
+    def diff(self, expr, var):
+        node = self.intern(expr)
+        return self._diff(node, var)
+
+    def _diff(self, node, var):
+        from sympy import Add, Mul, S, diff
+
+        key = (node, var)
+        derivative = self.derivatives.get(key)
+        if derivative is not None:
+            self.diff_hits += 1
+            return derivative
+
+        self.diff_misses += 1
+        if not node.has(var):
+            derivative = S.Zero
+        elif isinstance(node, Add):
+            # sum rule, every term is its own memoized node
+            derivative = Add(*(self._diff(arg, var) for arg in node.args))
+        elif isinstance(node, Mul):
+            # product rule over the factors that depend on var, same as Mul._eval_derivative
+            factors = node.args
+            terms = []
+            for i, factor in enumerate(factors):
+                if factor.has(var):
+                    terms.append(Mul(*factors[:i], self._diff(factor, var), *factors[i + 1:]))
+            derivative = Add(*terms)
+        else:
+            derivative = diff(node, var)
+
+        derivative = self.intern(derivative)
+        self.derivatives[key] = derivative
+        return derivative
+
+    def diff_terms(self, expr, var):
+        # (derivative, terms reused, terms recomputed), d/dvar of a sum is the sum of its terms' derivatives
+        from sympy import Add
+
+        node = self.intern(expr)
+        terms = Add.make_args(node)
+        reused = sum((term, var) in self.derivatives for term in terms)
+
+        derivative = self._diff(node, var)
+
+        self.term_hits += reused
+        self.term_misses += len(terms) - reused
+        return derivative, reused, len(terms) - reused
+
+    def equal_terms(self, lhs, rhs, budget: float):
+        # (ZeroTestResult, reused, terms compared). terms on both sides cancel, the rest goes through equal()
+        from collections import Counter
+        from sympy import Add
+
+        left = Counter(Add.make_args(self.intern(lhs)))
+        right = Counter(Add.make_args(self.intern(rhs)))
+        common = left & right
+        left -= common
+        right -= common
+
+        compared = sum(left.values()) + sum(right.values())
+        self.terms_cancelled += 2 * sum(common.values())
+        self.terms_compared += compared
+
+        verdict, reused = self.equal(Add(*left.elements()), Add(*right.elements()), budget)
+        return verdict, reused, compared
+
+    def equal(self, lhs, rhs, budget: float):
+        # (ZeroTestResult, reused). undecided (timed out) ones aren't kept since a bigger budget could still decide them
+        key = (self.intern(lhs), self.intern(rhs))
+        verdict = self.verdicts.get(key)
+        if verdict is not None:
+            self.verdict_hits += 1
+            return verdict, True
+
+        from zero_test import equal_within_budget
+
+        self.verdict_misses += 1
+        verdict = equal_within_budget(lhs, rhs, budget)
+        if verdict.is_zero is not None:
+            self.verdicts[key] = verdict
+        return verdict, False
+
+    def reset(self):
+        self.nodes.clear()
+        self.derivatives.clear()
+        self.verdicts.clear()
+        self.resets += 1
+
+    def stats(self):
+        unique = len(self.nodes)
+        diffs = self.diff_hits + self.diff_misses
+        verdicts = self.verdict_hits + self.verdict_misses
+        terms = self.term_hits + self.term_misses
+        return {
+            "subtrees": self.seen,
+            "unique": unique,
+            "dedup_ratio": self.seen / unique if unique else None,  # subtrees looked up per distinct one
+            "diff_hits": self.diff_hits,
+            "diff_misses": self.diff_misses,
+            "diff_reuse": self.diff_hits / diffs if diffs else None,
+            "verdict_hits": self.verdict_hits,
+            "verdict_misses": self.verdict_misses,
+            "verdict_reuse": self.verdict_hits / verdicts if verdicts else None,
+            "term_hits": self.term_hits,
+            "term_misses": self.term_misses,
+            "term_reuse": self.term_hits / terms if terms else None,
+            "terms_cancelled": self.terms_cancelled,
+            "terms_compared": self.terms_compared,
+            "resets": self.resets,
+        }
+
+
+def merge_stats(stats):
+    # adds up stats() from several processes, the ratios are worked out again from the totals
+    total = {}
+    for item in stats:
+        for name, value in item.items():
+            if not name.endswith(("_ratio", "_reuse")):
+                total[name] = total.get(name, 0) + value
+
+    if not total:
+        return {}
+
+    diffs = total["diff_hits"] + total["diff_misses"]
+    verdicts = total["verdict_hits"] + total["verdict_misses"]
+    terms = total["term_hits"] + total["term_misses"]
+    total["dedup_ratio"] = total["subtrees"] / total["unique"] if total["unique"] else None
+    total["diff_reuse"] = total["diff_hits"] / diffs if diffs else None
+    total["verdict_reuse"] = total["verdict_hits"] / verdicts if verdicts else None
+    total["term_reuse"] = total["term_hits"] / terms if terms else None
+    return total
+
+
+canon = CanonTable()
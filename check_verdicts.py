@@ -0,0 +1,82 @@
+import sys
+
+import numpy as np
+
+import engine
+from input_parser import parse_text, to_sympy
+from slope_field import compile_expr
+
+
+# fails (exit 1) when a known equation gets the wrong verdict, or a wrong one marked certain.
+# mostly equations whose coefficients are constants sympy can't simplify on its own (log(6) - log(2) - log(3),
+# sin(1)**2 + cos(1)**2 - 1), which the algebraic tier used to call certainly not exact.
+# also that the plot code sent to the window runs with numpy alone (F of exp(-x**2) dx is erf, numpy has none)
+#
+#   python check_verdicts.py
+
+
+# (M, N, exact)
+EQUATIONS = [
+    ("y*log(6)", "x*(log(2)+log(3))", True),
+    ("y*(sin(1)**2+cos(1)**2)", "x", True),
+    ("y*exp(log(2))", "2*x", True),
+    ("2*x*y + sin(x)", "x**2 + cos(y)", True),
+    ("x*y", "x", False),
+    ("y*log(6)", "x*log(5)", False),
+]
+
+# typed the way the calculator buttons do it, ln is the natural log there
+INPUTS = [
+    ("y ln(6) DX x (ln(2) + ln(3)) DY", True),
+    ("y (sin(1)**2 + cos(1)**2) DX x DY", True),
+    ("y ln(6) DX x ln(5) DY", False),
+]
+
+
+# (M, N, which of the plot's m, n, F should be there)
+PLOTS = [
+    ("2*x*y + sin(x)", "x**2 + cos(y)", {"m", "n", "F"}),
+    ("exp(-x**2)", "0", {"m", "n"}),
+    ("y*gamma(x)", "1", set()),
+]
+
+
+def check_plot(m, n, expected):
+    result = engine.check_exact(m, n, solve=True, plot=True)
+    plot = result.plot or {}
+    shipped = {part for part, code in plot.items() if code is not None}
+    ok = result.error is None and shipped == expected
+    X, Y = np.meshgrid([-1.0, 0.5], [-0.5, 1.0])
+    for part in shipped:
+        try:
+            compile_expr(plot[part])(X, Y)
+        except Exception as e:
+            print(f"     {part} = {plot[part]}: {e}")
+            ok = False
+    print(f"{'ok  ' if ok else 'FAIL'} plot {m}, {n}".ljust(50) + f" shipped={sorted(shipped)}")
+    return ok
+
+
+def check(label, m, n, expected):
+    result = engine.check_exact(m, n)
+    ok = result.error is None and result.exact == expected
+    print(f"{'ok  ' if ok else 'FAIL'} {label:<45} exact={result.exact} tier={result.tier} certain={result.certain}")
+    return ok
+
+
+def main():
+    failed = 0
+    for m, n, expected in EQUATIONS:
+        failed += not check(f"{m}, {n}", m, n, expected)
+    for text, expected in INPUTS:
+        m, n = (to_sympy(tree) for tree in parse_text(text))
+        failed += not check(text, m, n, expected)
+    for m, n, expected in PLOTS:
+        failed += not check_plot(m, n, expected)
+
+    print(f"{failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pyray import Image, PixelFormat, Rectangle, Vector2, WHITE
+from raylib import ffi
+
+from backend import gfx
+from slope_field import compile_expr, compile_field
+
+
+# solution curves drawn over the slope field.
+#
+#   exact       level sets F(x, y) = C of the potential, marching squares over a numpy grid, every cell
+#               and a chunk of levels at once
+#   not exact   (or no closed form F) trajectories of the direction field from a grid of starting points,
+#               one rk4 step moves all of them together
+#
+# the work and the rasterizing run on a background thread (numpy lets go of the gil for most of it), the
+# render thread only uploads a finished pixel buffer. results are kept per (equation, window), and until
+# the one for the current window is ready the last one for the same equation is stretched into place
+
+
+DEFAULT_LEVELS = 120  # level curves for an exact equation
+DEFAULT_CONTOUR_GRID = 200  # marching squares cells per side
+DEFAULT_SEEDS = 16  # starting points per side for trajectories, each one is followed both ways
+DEFAULT_STEPS = 300
+STEP_PIXELS = 2.0
+
+LEVEL_CHUNK = 16  # levels per vectorized marching squares pass, bounds the temporaries
+CACHE_SIZE = 8
+
+CURVE_COLOR = (0, 121, 241, 200)
+
+
+# crossed edge pairs for each corner case, corners a b c d = top left, top right, bottom right, bottom left
+# (bit set when above the level, a is 8) and edges 0 top, 1 right, 2 bottom, 3 left. -1 is no segment
+SEGMENT_TABLE = np.array([
+    [[-1, -1], [-1, -1]],  # 0
+    [[3, 2], [-1, -1]],    # 1   d
+    [[2, 1], [-1, -1]],    # 2   c
+    [[3, 1], [-1, -1]],    # 3   c d
+    [[0, 1], [-1, -1]],    # 4   b
+    [[0, 3], [1, 2]],      # 5   b d, saddle
+    [[0, 2], [-1, -1]],    # 6   b c
+    [[0, 3], [-1, -1]],    # 7   b c d
+    [[0, 3], [-1, -1]],    # 8   a
+    [[0, 2], [-1, -1]],    # 9   a d
+    [[0, 1], [2, 3]],      # 10  a c, saddle
+    [[0, 1], [-1, -1]],    # 11  a c d
+    [[3, 1], [-1, -1]],    # 12  a b
+    [[1, 2], [-1, -1]],    # 13  a b d
+    [[3, 2], [-1, -1]],    # 14  a b c
+    [[-1, -1], [-1, -1]],  # 15
+])
+
+
+def pixel_grid(window, width: int, height: int, cols: int, rows: int):
+    # pixel positions of a cols x rows lattice over the plot, and the points they are in the window
+    xmin, xmax, ymin, ymax = window
+    PX, PY = np.meshgrid(np.linspace(0, width - 1, cols), np.linspace(0, height - 1, rows))
+    X = xmin + PX / width * (xmax - xmin)
+    Y = ymax - PY / height * (ymax - ymin)
+    return PX, PY, X, Y
+
+
+def level_values(F, count: int):
+    # spread by quantile instead of evenly, so steep corners of F don't take all the curves
+    values = F[np.isfinite(F)]
+    if values.size == 0:
+        return np.empty(0)
+    return np.unique(np.quantile(values, np.linspace(0.02, 0.98, count)))
+
+
+def marching_squares(F, levels):
+    # segments (x0, y0, x1, y1) in grid units (column, row) of every level in one array
+    cols = F.shape[1] - 1
+    a, b = F[:-1, :-1].ravel(), F[:-1, 1:].ravel()
+    d, c = F[1:, :-1].ravel(), F[1:, 1:].ravel()
+
+    out = []
+    for start in range(0, len(levels), LEVEL_CHUNK):
+        chunk = levels[start:start + LEVEL_CHUNK, None]
+
+        # only the cells some level goes through get any further work, usually a few percent of them
+        case = ((a > chunk) * 8 + (b > chunk) * 4 + (c > chunk) * 2 + (d > chunk)).ravel()
+        crossed = np.nonzero((case != 0) & (case != 15))[0]
+        level, cell = np.divmod(crossed, a.size)
+        L = chunk[level, 0]
+        ca, cb, cc, cd = a[cell], b[cell], c[cell], d[cell]
+        row, col = np.divmod(cell, cols)
+
+        # where the level crosses each edge, only the crossed edges are ever read
+        with np.errstate(all="ignore"):
+            ex = np.stack([col + (L - ca) / (cb - ca), col + 1.0, col + (L - cd) / (cc - cd), col + 0.0])
+            ey = np.stack([row + 0.0, row + (L - cb) / (cc - cb), row + 1.0, row + (L - ca) / (cd - ca)])
+
+        pairs = SEGMENT_TABLE[case[crossed]]
+        index = np.arange(len(crossed))
+        for slot in range(2):
+            first, second = pairs[:, slot, 0], pairs[:, slot, 1]
+            keep = first >= 0
+            first, second, i = first[keep], second[keep], index[keep]
+            out.append(np.stack([ex[first, i], ey[first, i], ex[second, i], ey[second, i]], axis=1))
+
+    segments = np.concatenate(out) if out else np.empty((0, 4))
+    return segments[np.isfinite(segments).all(axis=1)]
+
+
+def integrate_rk4(direction, x0, y0, step: float, steps: int, width: int, height: int):
+    # tracks[i, k] = (x, y) of starting point k after i steps, nan once it's left the plot or hit a
+    # singular point (nan stays nan through the arithmetic, so dead tracks cost nothing to carry along)
+    tracks = np.full((steps + 1, len(x0), 2), np.nan)
+    px, py = np.asarray(x0, dtype=float).copy(), np.asarray(y0, dtype=float).copy()
+    tracks[0, :, 0], tracks[0, :, 1] = px, py
+
+    for i in range(1, steps + 1):
+        k1x, k1y = direction(px, py)
+        k2x, k2y = direction(px + 0.5 * step * k1x, py + 0.5 * step * k1y)
+        k3x, k3y = direction(px + 0.5 * step * k2x, py + 0.5 * step * k2y)
+        k4x, k4y = direction(px + step * k3x, py + step * k3y)
+        px = px + step / 6 * (k1x + 2 * k2x + 2 * k3x + k4x)
+        py = py + step / 6 * (k1y + 2 * k2y + 2 * k3y + k4y)
+
+        outside = ~((px >= 0) & (px < width) & (py >= 0) & (py < height))
+        px[outside] = np.nan
+        py[outside] = np.nan
+        tracks[i, :, 0], tracks[i, :, 1] = px, py
+
+        if np.isnan(px).all():
+            return tracks[:i + 1]
+    return tracks
+
+
+def track_segments(tracks):
+    # consecutive points of every track as (x0, y0, x1, y1)
+    segments = np.concatenate([tracks[:-1], tracks[1:]], axis=2).reshape(-1, 4)
+    return segments[np.isfinite(segments).all(axis=1)]
+
+
+def rasterize_segments(pixels, segments, color):
+    # every segment sampled at the same number of steps, enough for the longest one to leave no gaps
+    if len(segments) == 0:
+        return
+    height, width = pixels.shape[:2]
+    x0, y0, x1, y1 = segments.T
+    samples = max(2, int(np.ceil(np.hypot(x1 - x0, y1 - y0).max())) + 1)
+    t = np.linspace(0.0, 1.0, samples)
+    xs = np.rint(x0[:, None] + (x1 - x0)[:, None] * t).astype(np.intp).ravel()
+    ys = np.rint(y0[:, None] + (y1 - y0)[:, None] * t).astype(np.intp).ravel()
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    pixels[ys[inside], xs[inside]] = color
+
+
+class CurveJob:
+
+    # everything the background thread needs, nothing it shares with the render thread
+
+    def __init__(self, key, field, potential, window, width: int, height: int, levels: int, contour_grid: int, seeds: int, steps: int):
+        self.key = key
+        self.field = field
+        self.potential = potential
+        self.window = window
+        self.width = width
+        self.height = height
+        self.levels = levels
+        self.contour_grid = contour_grid
+        self.seeds = seeds
+        self.steps = steps
+
+    def run(self):
+        start = time.perf_counter()
+        if self.potential is not None:
+            kind, (curves, segments) = "level sets", self.contour()
+        else:
+            kind, (curves, segments) = "trajectories", self.trajectories()
+
+        pixels = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        rasterize_segments(pixels, segments, CURVE_COLOR)
+        return CurveResult(self.key, self.window, pixels, kind, curves, time.perf_counter() - start)
+
+    def contour(self):
+        grid = self.contour_grid
+        PX, PY, X, Y = pixel_grid(self.window, self.width, self.height, grid + 1, grid + 1)
+        F = self.potential(X, Y)
+        levels = level_values(F, self.levels)
+
+        segments = marching_squares(F, levels)
+        # grid units to pixels
+        segments[:, 0::2] *= (self.width - 1) / grid
+        segments[:, 1::2] *= (self.height - 1) / grid
+        return len(levels), segments
+
+    def trajectories(self):
+        xmin, xmax, ymin, ymax = self.window
+        scale_x, scale_y = self.width / (xmax - xmin), self.height / (ymax - ymin)
+
+        def direction(px, py):
+            # unit step along (N, -M) in pixels, screen y points down
+            M, N = self.field(xmin + px / scale_x, ymax - py / scale_y)
+            with np.errstate(all="ignore"):
+                sx, sy = N * scale_x, M * scale_y
+                length = np.hypot(sx, sy)
+                return sx / length, sy / length
+
+        # each starting point in the middle of its cell, followed forwards and backwards
+        PX, PY, _, _ = pixel_grid(self.window, self.width, self.height, self.seeds + 2, self.seeds + 2)
+        x0, y0 = PX[1:-1, 1:-1].ravel(), PY[1:-1, 1:-1].ravel()
+        x0, y0 = np.concatenate([x0, x0]), np.concatenate([y0, y0])
+        step = np.repeat([STEP_PIXELS, -STEP_PIXELS], len(x0) // 2)
+
+        tracks = integrate_rk4(lambda px, py: tuple(v * step for v in direction(px, py)), x0, y0, 1.0, self.steps, self.width, self.height)
+        return len(x0), track_segments(tracks)
+
+
+class CurveResult:
+
+    def __init__(self, key, window, pixels, kind: str, curves: int, elapsed: float):
+        self.key = key
+        self.window = window
+        self.pixels = pixels
+        self.kind = kind
+        self.curves = curves
+        self.elapsed = elapsed
+
+
+class Curves:
+
+    def __init__(self, rect: Rectangle, levels: int = DEFAULT_LEVELS, contour_grid: int = DEFAULT_CONTOUR_GRID, seeds: int = DEFAULT_SEEDS, steps: int = DEFAULT_STEPS):
+        self.rect = rect
+        self.width, self.height = int(rect.width), int(rect.height)
+        self.levels = levels
+        self.contour_grid = contour_grid
+        self.seeds = seeds
+        self.steps = steps
+
+        self.equation = None
+        self.field = None
+        self.potential = None
+
+        # one job at a time, windows asked for while it runs are skipped and the latest one goes next
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="curves")
+        self.future = None
+        self.future_key = None  # what the running job is for
+
+        self.results = OrderedDict()  # (equation, window) -> CurveResult
+        self.shown = None  # CurveResult currently in the texture
+        self.texture = None
+
+    def set_equation(self, plot):
+        equation = (plot["m"], plot["n"], plot["F"])
+        if equation == self.equation:
+            return
+        try:
+            self.field = compile_field(plot["m"], plot["n"])
+            self.potential = None if plot["F"] is None else compile_expr(plot["F"])
+            # a few points to catch anything that only fails when it runs on arrays, the job would die on it later
+            X, Y = np.meshgrid([-1.0, 0.5], [-0.5, 1.0])
+            self.field(X, Y)
+            if self.potential is not None:
+                self.potential(X, Y)
+        except Exception as e:
+            print(f"Curves: {e}")
+            self.clear_equation()
+            return
+        self.equation = equation
+
+    def clear_equation(self):
+        self.equation, self.field, self.potential = None, None, None
+
+    def request(self, window):
+        key = (self.equation, tuple(window))
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        if self.future is not None and self.future.done():
+            failed_key, future = self.future_key, self.future
+            self.future, self.future_key = None, None
+            try:
+                result = future.result()
+            except Exception as e:
+                # never let it out into the frame, the curves are just left off for this equation
+                print(f"Curves: {e}")
+                if failed_key[0] == self.equation:
+                    self.clear_equation()
+                return None
+            self.results[result.key] = result
+            if len(self.results) > CACHE_SIZE:
+                self.results.popitem(last=False)
+            if result.key == key:
+                return result
+
+        if self.future is None:
+            job = CurveJob(key, self.field, self.potential, tuple(window), self.width, self.height, self.levels, self.contour_grid, self.seeds, self.steps)
+            self.future, self.future_key = self.executor.submit(job.run), key
+        return None
+
+    def fallback(self):
+        # the newest finished result for this equation, whatever window it was for
+        for key in reversed(self.results):
+            if key[0] == self.equation:
+                return self.results[key]
+        return None
+
+    def upload(self, result):
+        if self.texture is None:
+            image = Image(ffi.from_buffer(result.pixels), self.width, self.height, 1, PixelFormat.PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
+            self.texture = gfx.load_texture_from_image(image)
+        else:
+            gfx.update_texture(self.texture, ffi.from_buffer(result.pixels))
+        self.shown = result
+
+    def draw(self, window):
+        if self.equation is None:
+            return
+
+        result = self.request(window) or self.fallback()
+        if result is None:
+            return
+        if result is not self.shown:
+            self.upload(result)
+
+        # the texture is for result.window, stretch it to where that window sits in the current one
+        xmin, xmax, ymin, ymax = window
+        bxmin, bxmax, bymin, bymax = result.window
+        rect = self.rect
+        dest = Rectangle(
+            rect.x + (bxmin - xmin) / (xmax - xmin) * rect.width,
+            rect.y + (ymax - bymax) / (ymax - ymin) * rect.height,
+            (bxmax - bxmin) / (xmax - xmin) * rect.width,
+            (bymax - bymin) / (ymax - ymin) * rect.height,
+        )
+
+        gfx.begin_scissor_mode(int(rect.x), int(rect.y), int(rect.width), int(rect.height))
+        gfx.draw_texture_pro(self.texture, Rectangle(0, 0, self.width, self.height), dest, Vector2(0, 0), 0, WHITE)
+        gfx.end_scissor_mode()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.texture is not None:
+            gfx.unload_texture(self.texture)
+            self.texture = None
@@ -0,0 +1,227 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sympy import Basic, sympify, symbols
+
+from cache import ExactCache
+from canon import CanonTable, canon
+from integrating_factor import find_integrating_factor
+from potential import solve_potential
+from zero_test import DEFAULT_BUDGET
+
+
+# headless exactness math, no pyray and no fonts in here so it can run anywhere
+
+
+x, y = symbols("x y")
+
+
+class ExactResult:
+
+    def __init__(self, m: str, n: str, index: int = 0):
+
+        self.index = index  # position in the input batch
+        self.m = m
+        self.n = n
+
+        self.dm_dy = None
+        self.dn_dx = None
+        self.exact = None  # None means we couldn't decide (error or out of budget)
+        self.error = None
+        self.cached = False  # answered from an ExactCache
+        self.shared = False  # same derivatives as an earlier equation, verdict reused from the canon table
+        self.terms = None  # top level terms of M and N differentiated again / reused, and compared, see canon.py
+
+        # how the verdict was reached, see zero_test.py
+        self.tier = None
+        self.certain = False
+        self.tier_timings = {}
+
+        self.potential = None  # PotentialResult, only when asked for and exact
+        self.factor = None  # FactorResult, only when asked for and not exact
+        self.plot = None  # M, N and F as numpy code for slope_field.py / curves.py, only when asked for
+
+        self.elapsed = 0.0  # seconds spent on this item
+
+    def to_dict(self):
+        return {
+            "index": self.index,
+            "m": str(self.m),
+            "n": str(self.n),
+            "dm_dy": None if self.dm_dy is None else str(self.dm_dy),
+            "dn_dx": None if self.dn_dx is None else str(self.dn_dx),
+            "exact": self.exact,
+            "error": self.error,
+            "cached": self.cached,
+            "shared": self.shared,
+            "terms": self.terms,
+            "tier": self.tier,
+            "certain": self.certain,
+            "tier_timings": dict(self.tier_timings),
+            "potential": None if self.potential is None else self.potential.to_dict(),
+            "factor": None if self.factor is None else self.factor.to_dict(),
+            "plot": self.plot,
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self):
+        return f"ExactResult(index={self.index}, exact={self.exact}, error={self.error!r})"
+
+
+
+def split_input(text: str):
+    # Separate the expression for M and N, M is terminated by DX and N by DY
+    dx_end = text.index("DX")
+    dy_end = text.index("DY", dx_end + 2)
+
+    m = text[:dx_end].strip()
+    n = text[dx_end + 2:dy_end].strip()
+
+    return m, n
+
+
+def numpy_source(expr):
+    # what lambdify would generate for expr, the window compiles it with numpy alone (see slope_field.py).
+    # None for functions numpy has no version of (the printer falls back to math.erf, scipy.special, ...),
+    # or symbols other than x and y
+    from sympy.printing.numpy import NumPyPrinter
+
+    if not expr.free_symbols <= {x, y}:
+        return None
+    printer = NumPyPrinter()
+    try:
+        code = printer.doprint(expr)
+    except Exception:
+        return None
+    if set(printer.module_imports) - {"numpy"}:
+        return None
+    return code
+
+
+def _plot_potential(result):
+    # the solution curves of an exact equation are the level sets of F
+    if result.plot is not None and result.potential.status == "solved":
+        result.plot["F"] = numpy_source(result.potential.F)
+
+
+def check_exact(m, n, index: int = 0, cache=None, budget: float = DEFAULT_BUDGET, solve: bool = False, plot: bool = False, factor: bool = False,
+                table: CanonTable = None) -> ExactResult:
+    # table defaults to the process wide canon table
+    table = canon if table is None else table
+    result = ExactResult(m, n, index)
+    start = time.perf_counter()
+
+    try:
+        # Convert them into symbolic expressions, already parsed ones (input_parser) go straight through
+        M = m if isinstance(m, Basic) else sympify(m)
+        N = n if isinstance(n, Basic) else sympify(n)
+
+        if plot:
+            M_code, N_code = numpy_source(M), numpy_source(N)
+            if M_code is not None and N_code is not None:
+                result.plot = {"m": M_code, "n": N_code, "F": None}
+
+        entry = cache.get(M, N) if cache is not None else None
+        if entry is not None:
+            result.dm_dy = entry.dm_dy
+            result.dn_dx = entry.dn_dx
+            result.exact = entry.exact
+            result.tier = entry.tier
+            result.certain = entry.certain
+            result.cached = True
+            if solve and result.exact:
+                result.potential = solve_potential(entry.M, entry.N, budget)
+                _plot_potential(result)
+            if factor and result.exact is False:
+                result.factor = find_integrating_factor(entry.M, entry.N, entry.dm_dy, entry.dn_dx, budget - (time.perf_counter() - start))
+            result.elapsed = time.perf_counter() - start
+            return result
+
+        #! Y COMES FIRST
+        # term by term through the canon table, after an edit only the changed terms are differentiated again
+        result.dm_dy, m_reused, m_recomputed = table.diff_terms(M, y)
+        result.dn_dx, n_reused, n_recomputed = table.diff_terms(N, x)
+
+        # Compare the partial derivatives, terms on both sides cancel first
+        verdict, result.shared, compared = table.equal_terms(result.dm_dy, result.dn_dx, budget)
+        result.terms = {"reused": m_reused + n_reused, "recomputed": m_recomputed + n_recomputed, "compared": compared}
+        result.exact = verdict.is_zero
+        result.tier = verdict.tier
+        result.certain = verdict.certain
+        result.tier_timings = verdict.timings
+
+        # an undecided (timed out) verdict isn't worth remembering
+        if cache is not None and result.exact is not None:
+            cache.put(M, N, result.dm_dy, result.dn_dx, result.exact, result.tier, result.certain)
+
+        if solve and result.exact:
+            # whatever is left of the budget goes to the integration
+            result.potential = solve_potential(M, N, budget - (time.perf_counter() - start))
+            _plot_potential(result)
+
+        if factor and result.exact is False:
+            # the first mu(x), mu(y), mu(xy), mu(x + y) or x^a y^b that makes it exact, in what's left of the budget
+            result.factor = find_integrating_factor(M, N, result.dm_dy, result.dn_dx, budget - (time.perf_counter() - start))
+
+    except Exception as e:
+        result.error = str(e)
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+# per process cache for pool workers, set up by _init_worker
+_worker_cache = None
+
+
+def _init_worker(cache_path):
+    global _worker_cache
+    _worker_cache = ExactCache(cache_path)
+
+
+def _reset_worker():
+    global _worker_cache
+    if _worker_cache is not None:
+        _worker_cache.close()
+        _worker_cache = None
+
+
+def _check_pair(item):
+    index, (m, n) = item
+    return check_exact(m, n, index, _worker_cache)
+
+
+def check_many(pairs, workers: int = None, chunksize: int = None, cache_path: str = None, use_cache: bool = False):
+    # results always come back in input order
+    items = list(enumerate(pairs))
+    if not items:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(items))
+
+    initializer, initargs = None, ()
+    if use_cache or cache_path is not None:
+        initializer, initargs = _init_worker, (cache_path,)
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        try:
+            return [_check_pair(item) for item in items]
+        finally:
+            _reset_worker()
+
+    if chunksize is None:
+        # a few chunks per worker keeps the load balanced without too much ipc
+        chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(_check_pair, items, chunksize=chunksize))
+
+
+def warm_up():
+    # throwaway check so sympify, diff and equals have their caches filled before the first real one.
+    # its own canon table, so the first real check of this equation isn't "reused" and the stats only count real work
+    return check_exact("2*x*y + sin(x)", "x**2 + cos(y)", table=CanonTable())
@@ -0,0 +1,171 @@
+import atexit
+import multiprocessing
+import os
+import queue
+import time
+
+from input_parser import ParseError, from_postfix, to_postfix
+
+
+# runs the exactness check in a separate process so the render loop never blocks on sympy.
+# a process (not a thread) because a stuck simplify can only be stopped by killing it
+
+
+DEFAULT_TIMEOUT = 10.0
+
+# results survive restarts here, pass cache_path=None to keep them in memory only
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "homo-exact-identifier", "exact.sqlite")
+
+
+def _worker(requests, replies, cache_path):
+    start = time.perf_counter()
+
+    import engine
+    engine.warm_up()
+
+    cache = engine.ExactCache(cache_path)
+
+    replies.put(("ready", None, time.perf_counter() - start))
+
+    while True:
+        item = requests.get()
+        if item is None:
+            break
+
+        request_id, text, postfix = item
+        try:
+            if postfix is not None:
+                # already parsed by the window's InputParser, no string handling or sympify needed
+                m, n = (from_postfix(p) for p in postfix)
+            else:
+                m, n = engine.split_input(text)
+        except (ValueError, ParseError) as e:
+            replies.put(("result", request_id, {"m": None, "n": None, "exact": None, "error": str(e)}))
+            continue
+
+        result = engine.check_exact(m, n, cache=cache, solve=True, plot=True, factor=True).to_dict()
+        result["cache"] = cache.stats()
+        result["canon"] = engine.canon.stats()
+        replies.put(("result", request_id, result))
+
+    from integrating_factor import shutdown_pool
+    shutdown_pool()
+
+
+class Evaluator:
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, cache_path: str = DEFAULT_CACHE_PATH):
+
+        self.timeout = timeout
+        self.cache_path = cache_path
+
+        # spawn so the child doesn't inherit the window / gl context
+        self.context = multiprocessing.get_context("spawn")
+
+        self.process = None
+        self.requests = None
+        self.replies = None
+
+        self.ready = False
+        self.ready_at = 0.0
+        self.warmup_time = None
+
+        self.next_id = 0
+        self.current_id = None  # request we're waiting on
+        self.current_text = None
+        self.submitted_at = 0.0
+
+        self._start_worker()
+        # not a daemon (the integrating factor pool runs inside it), so it has to be closed before exit
+        atexit.register(self.close)
+
+    def _start_worker(self):
+        self.requests = self.context.Queue()
+        self.replies = self.context.Queue()
+        self.process = self.context.Process(target=_worker, args=(self.requests, self.replies, self.cache_path))
+        self.process.start()
+        self.ready = False
+
+    def _restart_worker(self):
+        self.process.kill()
+        self.process.join()
+        self._start_worker()
+
+    def is_busy(self):
+        return self.current_id is not None
+
+    def submit(self, text: str, trees=None):
+        # trees is the (M, N) pair from InputParser.finish(), without it the worker splits and sympifies text
+        if self.is_busy():
+            if text == self.current_text:
+                # = pressed again on the same input, the answer is already on its way. cancelling would kill
+                # the warm worker (and the factor pool inside it) for nothing
+                return self.current_id
+            self.cancel()
+
+        self.next_id += 1
+        self.current_id = self.next_id
+        self.current_text = text
+        self.submitted_at = time.perf_counter()
+
+        # if the worker is still warming up this just waits in its queue
+        postfix = None if trees is None else tuple(to_postfix(tree) for tree in trees)
+        self.requests.put((self.current_id, text, postfix))
+        return self.current_id
+
+    def cancel(self):
+        if not self.is_busy():
+            return
+
+        # the only way to stop sympy mid-call is to kill the worker, a fresh one warms up in the background
+        self.current_id = None
+        self.current_text = None
+        self._restart_worker()
+
+    def elapsed(self):
+        return time.perf_counter() - self.submitted_at if self.is_busy() else 0.0
+
+    def poll(self):
+        # called once per frame, never blocks. returns the finished result dict or None
+        while True:
+            try:
+                kind, request_id, payload = self.replies.get_nowait()
+            except queue.Empty:
+                break
+
+            match kind:
+                case "ready":
+                    self.ready = True
+                    self.ready_at = time.perf_counter()
+                    self.warmup_time = payload
+
+                case "result":
+                    # anything else is a leftover from a request that was replaced
+                    if request_id == self.current_id:
+                        self.current_id = None
+                        self.current_text = None
+                        return payload
+
+        if not self.is_busy():
+            return None
+
+        # time spent queued behind the warm-up doesn't count against the request
+        if self.ready and time.perf_counter() - max(self.submitted_at, self.ready_at) > self.timeout:
+            self.cancel()
+            return {"m": None, "n": None, "exact": None, "error": f"Timed out after {self.timeout:.0f}s"}
+
+        if not self.process.is_alive():
+            self.current_id = None
+            self.current_text = None
+            self._start_worker()
+            return {"m": None, "n": None, "exact": None, "error": "Worker died"}
+
+        return None
+
+    def close(self):
+        if self.process is not None and self.process.is_alive():
+            self.requests.put(None)
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process = None
@@ -0,0 +1,35 @@
+import mmap
+import os
+import sys
+
+
+# fonts ship as raw .ttf files next to the app (or inside the pyinstaller bundle)
+# and get memory mapped straight into load_font_from_memory, no python copies
+
+
+ASSETS_DIR = os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))), "assets")
+
+FONT_PATH = os.path.join(ASSETS_DIR, "font.ttf")
+FONT_ITALIC_PATH = os.path.join(ASSETS_DIR, "font_italic.ttf")
+
+
+def map_asset(path: str) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_font_asset(path: str, font_size: int, codepoints=None, codepoint_count: int = 0):
+    # imported here so scripts that only need the paths don't load raylib
+    from pyray import load_font_from_memory
+    from raylib import ffi
+
+    data = map_asset(path)
+    try:
+        # zero copy view of the mapping, raylib only reads it while rasterizing
+        buffer = ffi.from_buffer("unsigned char[]", data)
+        font = load_font_from_memory(".ttf", buffer, len(data), font_size, codepoints, codepoint_count)
+        del buffer
+    finally:
+        data.close()
+
+    return font
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+
+from pyray import *
+from raylib import ffi
+
+from font_assets import ASSETS_DIR, FONT_PATH, FONT_ITALIC_PATH, load_font_asset, map_asset
+from input_parser import KEYS
+
+
+# rasterizing a .ttf at 320 px on every launch is most of the font startup cost, so the atlas image and
+# glyph metrics get baked once (only for the glyphs the ui can show) and loaded as a plain texture after that.
+#
+# file names carry a hash of the font bytes, size and glyph set, so changing any of them misses the cache
+# and the atlas is rebaked instead of showing the wrong glyphs.
+#
+# usage: python font_atlas.py   (bakes into assets/atlas/, needs a display for the gl context)
+
+
+ATLAS_DIR = os.path.join(ASSETS_DIR, "atlas")  # baked at build time, may be read-only
+USER_ATLAS_DIR = os.path.join(os.path.expanduser("~"), ".cache", "homo-exact-identifier", "atlas")
+
+FONT_SIZE = 320
+
+# the main font only ever draws input keys and button labels, keep in sync with Window.buttons / next_buttons / button_modes
+BUTTON_LABELS = ("x", "sqrt", "Del", "C", "...", "=", "B", "A", "H", "E")
+FONT_GLYPHS = "".join(sorted(set("".join(KEYS)) | set("".join(BUTTON_LABELS)) | {" ", "?"}))
+
+# the italic font draws the status line: messages and whatever sympy prints for the solution
+FONT_ITALIC_GLYPHS = "".join(chr(c) for c in range(32, 127))
+
+
+def atlas_name(font_path: str, font_size: int, glyphs: str):
+    digest = hashlib.sha1()
+    data = map_asset(font_path)
+    try:
+        digest.update(data)
+    finally:
+        data.close()
+    digest.update(f"{font_size}:{glyphs}".encode())
+
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    return f"{stem}-{font_size}-{digest.hexdigest()[:12]}"
+
+
+def save_atlas(font, base: str):
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+
+    image = load_image_from_texture(font.texture)
+    try:
+        if not export_image(image, base + ".png"):
+            raise OSError(f"couldn't write {base}.png")
+    finally:
+        unload_image(image)
+
+    metrics = {
+        "base_size": font.baseSize,
+        "padding": font.glyphPadding,
+        "glyphs": [
+            {
+                "value": font.glyphs[i].value,
+                "offset_x": font.glyphs[i].offsetX,
+                "offset_y": font.glyphs[i].offsetY,
+                "advance_x": font.glyphs[i].advanceX,
+                "rec": [font.recs[i].x, font.recs[i].y, font.recs[i].width, font.recs[i].height],
+            }
+            for i in range(font.glyphCount)
+        ],
+    }
+    with open(base + ".json", "w") as f:
+        json.dump(metrics, f)
+
+
+def load_atlas(base: str):
+    if not (os.path.exists(base + ".png") and os.path.exists(base + ".json")):
+        return None
+
+    with open(base + ".json") as f:
+        metrics = json.load(f)
+
+    texture = load_texture(base + ".png")
+    if texture.id == 0:
+        return None
+
+    count = len(metrics["glyphs"])
+
+    # unload_font frees these with raylib's allocator, so they can't come from ffi.new
+    recs = ffi.cast("Rectangle *", mem_alloc(count * ffi.sizeof("Rectangle")))
+    glyphs = ffi.cast("GlyphInfo *", mem_alloc(count * ffi.sizeof("GlyphInfo")))
+
+    for i, glyph in enumerate(metrics["glyphs"]):
+        recs[i].x, recs[i].y, recs[i].width, recs[i].height = glyph["rec"]
+        glyphs[i].value = glyph["value"]
+        glyphs[i].offsetX = glyph["offset_x"]
+        glyphs[i].offsetY = glyph["offset_y"]
+        glyphs[i].advanceX = glyph["advance_x"]
+
+    return Font(metrics["base_size"], count, metrics["padding"], texture, recs, glyphs)
+
+
+def bake_font(font_path: str, font_size: int, glyphs: str):
+    codepoints = ffi.new("int[]", [ord(c) for c in glyphs])
+    return load_font_asset(font_path, font_size, codepoints, len(glyphs))
+
+
+def load_font_atlas(font_path: str, font_size: int, glyphs: str):
+    # needs init_window first, textures go straight to the gpu
+    name = atlas_name(font_path, font_size, glyphs)
+
+    for directory in (ATLAS_DIR, USER_ATLAS_DIR):
+        font = load_atlas(os.path.join(directory, name))
+        if font is not None:
+            return font
+
+    # not baked yet, or the glyph set / font changed since: rasterize now and keep it for next time
+    font = bake_font(font_path, font_size, glyphs)
+    try:
+        save_atlas(font, os.path.join(USER_ATLAS_DIR, name))
+    except OSError as e:
+        print(f"Font atlas: not cached ({e})")
+
+    return font
+
+
+def main():
+    set_config_flags(ConfigFlags.FLAG_WINDOW_HIDDEN)
+    init_window(1, 1, b"font atlas")
+
+    for font_path, glyphs in ((FONT_PATH, FONT_GLYPHS), (FONT_ITALIC_PATH, FONT_ITALIC_GLYPHS)):
+        base = os.path.join(ATLAS_DIR, atlas_name(font_path, FONT_SIZE, glyphs))
+        font = bake_font(font_path, FONT_SIZE, glyphs)
+        save_atlas(font, base)
+        print(f"{base}.png: {font.glyphCount} glyphs, {font.texture.width}x{font.texture.height}")
+        unload_font(font)
+
+    close_window()
+
+
+if __name__ == "__main__":
+    main()
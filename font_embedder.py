@@ -1,9 +1,48 @@
-with open("Poppins-SemiBoldItalic.ttf", "rb") as font_file:
-    font_data = font_file.read()
+import os
+import sys
 
-hex_array = ", ".join(f"0x{byte:02x}" for byte in font_data)
 
-with open("font_hex_italic.py", "w") as output_file:
-    output_file.write(f"font_hex_italic = [{hex_array}]")
+# usage: python font_embedder.py <font.ttf> <asset name> [--legacy]
+#
+# copies the font into assets/<asset name>.ttf, which font_assets.py memory maps at startup.
+# --legacy writes the old <asset name>.py list literal instead (only used by bench_fonts.py)
 
-print("Hexadecimal array saved to font_hex.py")
+
+def write_asset(font_data: bytes, dest: str):
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    with open(dest, "wb") as output_file:
+        output_file.write(font_data)
+
+
+def write_legacy_module(font_data: bytes, dest: str, name: str):
+    hex_array = ", ".join(f"0x{byte:02x}" for byte in font_data)
+
+    with open(dest, "w") as output_file:
+        output_file.write(f"{name} = [{hex_array}]")
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--legacy"]
+    legacy = "--legacy" in sys.argv[1:]
+
+    if len(args) != 2:
+        print("usage: python font_embedder.py <font.ttf> <asset name> [--legacy]")
+        sys.exit(1)
+
+    source, name = args
+
+    with open(source, "rb") as font_file:
+        font_data = font_file.read()
+
+    if legacy:
+        dest = f"{name}.py"
+        write_legacy_module(font_data, dest, name)
+    else:
+        dest = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", f"{name}.ttf")
+        write_asset(font_data, dest)
+
+    print(f"Font saved to {dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +0,0 @@
-font_hex = [0x00, 0x01, 0x00, 0x00, 0x00, 0x0d, 0x00, 0x80, 0x00, 0x03, 0x00, 0x50, 0x47, 0x44, 0x45, 0x46, 0x09, 0x16, 0x09, 0x19, 0x00, 0x00, 0x01, 0x58, 0x00, 0x00, 0x00, 0x40, 0x47, 0x50, 0x4f, 0x53, 0x2d, 0x1f, 0x0f, 0x8d, 0x00, 0x00, 0x23, 0x58, 0x00, 0x00, 0x13, 0xd6, 0x47, 0x53, 0x55, 0x42, 0x3d, 0x8a, 0xda, 0x81, 0x00, 0x00, 0x59, 0xc8, 0x00, 0x00, 0x26, 0x76, 0x4f, 0x53, 0x2f, 0x32, 0xda, 0xba, 0x7a, 0x02, 0x00, 0x00, 0x01, 0x98, 0x00, 0x00, 0x00, 0x60, 0x63, 0x6d, 0x61, 0x70, 0x35, 0x09, 0x3b, 0x14, 0x00, 0x00, 0x01, 0xf8, 0x00, 0x00, 0x02, 0xd2, 0x67, 0x6c, 0x79, 0x66, 0x81, 0x71, 0x3e, 0x53, 0x00, 0x00, 0x80, 0x40, 0x00, 0x01, 0xde, 0x1e, 0x68, 0x65, 0x61, 0x64, 0x1a, 0x84, 0x24, 0x6e, 0x00, 0x00, 0x01, 0x20, 0x00, 0x00, 0x00, 0x36, 0x68, 0x68, 0x65, 0x61, 0x0c, 0x30, 0x05, 0xb9, 0x00, 0x00, 0x00, 0xfc, 0x00, 0x00, 0x00, 0x24, 0x68, 0x6d, 0x74, 0x78, 0xa0, 0x42, 0xf0, 0x24, 0x00, 0x00, 0x12, 0xcc, 0x00, 0x00, 0x10, 0x8a, 0x6c, 0x6f, 0x63, 0x61, 0xe5, 0x71, 0x58, 0xd2, 0x00, 0x00, 0x0a, 0x84, 0x00, 0x00, 0x08, 0x48, 0x6d, 0x61, 0x78, 0x70, 0x04, 0xa5, 0x01, 0x25, 0x00, 0x00, 0x00, 0xdc, 0x00, 0x00, 0x00, 0x20, 0x6e, 0x61, 0x6d, 0x65, 0xbf, 0xb2, 0x20, 0x8c, 0x00, 0x00, 0x04, 0xcc, 0x00, 0x00, 0x05, 0xb6, 0x70, 0x6f, 0x73, 0x74, 0x3a, 0xbf, 0x68, 0x9b, 0x00, 0x00, 0x37, 0x30, 0x00, 0x00, 0x22, 0x95, 0x00, 0x01, 0x00, 0x00, 0x04, 0x23, 0x00, 0x90, 0x00, 0x0c, 0x00, 0x74, 0x00, 0x06, 0x00, 0x01, 0x00, 0x02, 0x00, 0x1e, 0x00, 0x06, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x03, 0x00, 0x02, 0x00, 0x01, 0x00, 0x00, 0x04, 0x1a, 0xfe, 0xa2, 0x00, 0x64, 0x09, 0xbc, 0xfd, 0xe1, 0xf9, 0x38, 0x09, 0xce, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x22, 0x00, 0x01, 0x00, 0x00, 0x00, 0x04, 0x01, 0x06, 0x6e, 0xc2, 0x3f, 0x2f, 0x5f, 0x0f, 0x3c, 0xf5, 0x00, 0x03, 0x03, 0xe8, 0x00, 0x00, 0x00, 0x00, 0xd8, 0xa4, 0xa9, 0xc5, 0x00, 0x00, 0x00, 0x00, 0xdb, 0x16, 0x36, 0xcd, 0xfd, 0xe1, 0xfd, 0xaf, 0x09, 0xce, 0x04, 0x43, 0x00, 0x00, 0x00, 0x07, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x08, 0x00, 0x18, 0x00, 0x1f, 0x00, 0x03, 0x00, 0x22, 0x00, 0x22, 0x00, 0x03, 0x00, 0x79, 0x00, 0x7a, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x7d, 0x00, 0x03, 0x00, 0x92, 0x00, 0x92, 0x00, 0x03, 0x02, 0x5c, 0x02, 0x5f, 0x00, 0x03, 0x02, 0x67, 0x02, 0x6c, 0x00, 0x03, 0x02, 0x73, 0x02, 0x73, 0x00, 0x03, 0x00, 0x04, 0x03, 0x62, 0x02, 0x58, 0x00, 0x05, 0x00, 0x00, 0x02, 0x8a, 0x02, 0x58, 0x00, 0x00, 0x00, 0x4b, 0x02, 0x8a, 0x02, 0x58, 0x00, 0x00, 0x01, 0x5e, 0x00, 0x32, 0x01, 0x4c, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x49, 0x54, 0x46, 0x4f, 0x00, 0xc0, 0x00, 0x00, 0xfb, 0x02, 0x04, 0x1a, 0xfe, 0xa2, 0x00, 0x64, 0x04, 0x6f, 0x02, 0x73, 0x20, 0x00, 0x00, 0x93, 0x00, 0x00, 0x00, 0x00, 0x02, 0x2a, 0x02, 0xbd, 0x00, 0x00, 0x00, 0x20, 0x00, 0x04, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x14, 0x00, 0x03, 0x00, 0x01, 0x00, 0x00, 0x00, 0x14, 0x00, 0x04, 0x02, 0xbe, 0x00, 0x00, 0x00, 0x9a, 0x00, 0x80, 0x00, 0x06, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x0d, 0x00, 0x20, 0x00, 0x7e, 0x01, 0x07, 0x01, 0x1b, 0x01, 0x23, 0x01, 0x31, 0x01, 0x37, 0x01, 0x48, 0x01, 0x5b, 0x01, 0x65, 0x01, 0x7e, 0x01, 0x8f, 0x01, 0x92, 0x01, 0xfd, 0x02, 0x1b, 0x02, 0x59, 0x02, 0xbc, 0x02, 0xc7, 0x02, 0xc9, 0x02, 0xdd, 0x03, 0xc0, 0x09, 0x03, 0x09, 0x0b, 0x09, 0x0d, 0x09, 0x11, 0x09, 0x14, 0x09, 0x28, 0x09, 0x30, 0x09, 0x33, 0x09, 0x39, 0x09, 0x45, 0x09, 0x49, 0x09, 0x4d, 0x09, 0x50, 0x09, 0x5e, 0x09, 0x65, 0x09, 0x6f, 0x09, 0x70, 0x09, 0x72, 0x1e, 0x85, 0x1e, 0xbd, 0x1e, 0xf3, 0x1e, 0xf9, 0x20, 0x0d, 0x20, 0x14, 0x20, 0x1a, 0x20, 0x1e, 0x20, 0x22, 0x20, 0x26, 0x20, 0x30, 0x20, 0x3a, 0x20, 0x44, 0x20, 0xa8, 0x20, 0xac, 0x20, 0xba, 0x20, 0xbd, 0x21, 0x13, 0x21, 0x22, 0x21, 0x26, 0x21, 0x2e, 0x22, 0x02, 0x22, 0x06, 0x22, 0x0f, 0x22, 0x12, 0x22, 0x15, 0x22, 0x1a, 0x22, 0x1e, 0x22, 0x2b, 0x22, 0x48, 0x22, 0x60, 0x22, 0x65, 0x25, 0xca, 0x25, 0xcc, 0xfb, 0x02, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0d, 0x00, 0x20, 0x00, 0x21, 0x00, 0xa0, 0x01, 0x0a, 0x01, 0x1e, 0x01, 0x28, 0x01, 0x36, 0x01, 0x39, 0x01, 0x4c, 0x01, 0x5e, 0x01, 0x68, 0x01, 0x8f, 0x01, 0x92, 0x01, 0xfc, 0x02, 0x18, 0x02, 0x59, 0x02, 0xbc, 0x02, 0xc6, 0x02, 0xc9, 0x02, 0xd8, 0x03, 0xc0, 0x09, 0x01, 0x09, 0x05, 0x09, 0x0c, 0x09, 0x0f, 0x09, 0x13, 0x09, 0x15, 0x09, 0x2a, 0x09, 0x31, 0x09, 0x35, 0x09, 0x3c, 0x09, 0x47, 0x09, 0x4b, 0x09, 0x50, 0x09, 0x58, 0x09, 0x60, 0x09, 0x66, 0x09, 0x70, 0x09, 0x72, 0x1e, 0x80, 0x1e, 0xbc, 0x1e, 0xf2, 0x1e, 0xf8, 0x20, 0x0c, 0x20, 0x13, 0x20, 0x18, 0x20, 0x1c, 0x20, 0x20, 0x20, 0x26, 0x20, 0x30, 0x20, 0x39, 0x20, 0x44, 0x20, 0xa8, 0x20, 0xac, 0x20, 0xb9, 0x20, 0xbd, 0x21, 0x13, 0x21, 0x22, 0x21, 0x26, 0x21, 0x2e, 0x22, 0x02, 0x22, 0x06, 0x22, 0x0f, 0x22, 0x11, 0x22, 0x15, 0x22, 0x19, 0x22, 0x1e, 0x22, 0x2b, 0x22, 0x48, 0x22, 0x60, 0x22, 0x64, 0x25, 0xca, 0x25, 0xcc, 0xfb, 0x01, 0xff, 0xff, 0x00, 0x01, 0xff, 0xf5, 0xff, 0xe3, 0x02, 0x73, 0x02, 0x52, 0x02, 0x50, 0x02, 0x4e, 0x02, 0x4a, 0x02, 0x46, 0x02, 0x45, 0x02, 0x42, 0x02, 0x40, 0x02, 0x3e, 0x02, 0x2e, 0x02, 0x2c, 0x01, 0xc3, 0x01, 0xa9, 0x01, 0x6c, 0x01, 0x0a, 0x01, 0x01, 0x01, 0x00, 0x00, 0xf2, 0x00, 0x10, 0x00, 0x00, 0xf6, 0xff, 0x00, 0x00, 0x00, 0x00, 0xf6, 0xfd, 0xf7, 0x0f, 0xf7, 0x0e, 0x00, 0x00, 0xf7, 0x0b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xf7, 0x39, 0xf6, 0xf0, 0x00, 0x00, 0xf7, 0x19, 0xf7, 0x1a, 0xf6, 0xa1, 0xe5, 0x51, 0xe5, 0x1b, 0xe4, 0xe7, 0xe4, 0xe3, 0xe0, 0x83, 0xe3, 0xca, 0xe3, 0xc7, 0xe3, 0xc6, 0xe3, 0xc5, 0xe3, 0xc2, 0xe3, 0xb9, 0xe3, 0xb1, 0xe3, 0xa8, 0xdf, 0xe5, 0xe3, 0x41, 0x00, 0x00, 0xe3, 0x32, 0xe2, 0xdd, 0xe2, 0xcf, 0xe2, 0xcc, 0xe2, 0xc5, 0xe1, 0xf2, 0xe1, 0xef, 0xe1, 0xe7, 0xe1, 0xe6, 0xe1, 0xe4, 0xe1, 0xe1, 0xe1, 0xde, 0xe1, 0xd2, 0xe1, 0xb6, 0xe1, 0x9f, 0xe1, 0x9c, 0xde, 0x38, 0xda, 0xc5, 0x09, 0x02, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x6c, 0x00, 0x00, 0x00, 0x6e, 0x00, 0x70, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x6e, 0x00, 0x00, 0x00, 0x70, 0x00, 0x82, 0x00, 0x86, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x6c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7a, 0x00, 0x79, 0x00, 0x7b, 0x00, 0x0c, 0x00, 0x12, 0x00, 0x0e, 0x00, 0x0f, 0x00, 0x14, 0x00, 0x4f, 0x00, 0x3f, 0x00, 0x45, 0x00, 0x7e, 0x00, 0x7c, 0x00, 0x15, 0x00, 0x16, 0x00, 0x17, 0x00, 0x18, 0x00, 0x19, 0x00, 0x1a, 0x00, 0x1b, 0x00, 0x22, 0x00, 0x1e, 0x00, 0x1f, 0x00, 0x23, 0x00, 0x20, 0x00, 0x21, 0x00, 0x7d, 0x00, 0x0b, 0x00, 0x0d, 0x00, 0x1c, 0x00, 0x1d, 0x00, 0x8b, 0x00, 0x8c, 0x00, 0x8e, 0x03, 0xee, 0x00, 0x00, 0x00, 0x00, 0x00, 0x13, 0x00, 0xea, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x00, 0x00, 0xa2, 0x04, 0x2a, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x01, 0x00, 0x20, 0x04, 0x0a, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x02, 0x00, 0x0e, 0x03, 0xfc, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x03, 0x00, 0x3e, 0x03, 0xbe, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x04, 0x00, 0x20, 0x04, 0x0a, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x05, 0x00, 0x0a, 0x03, 0xb4, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x06, 0x00, 0x20, 0x03, 0x94, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x08, 0x00, 0x26, 0x03, 0x6e, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x09, 0x00, 0x5c, 0x03, 0x12, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x0b, 0x00, 0x3a, 0x02, 0xd8, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x0d, 0x01, 0x22, 0x01, 0xb6, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x0e, 0x00, 0x36, 0x01, 0x80, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x10, 0x00, 0x0e, 0x01, 0x72, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x11, 0x00, 0x10, 0x01, 0x62, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x00, 0x13, 0x00, 0xae, 0x00, 0xb4, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x01, 0x00, 0x00, 0x40, 0x00, 0x74, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x01, 0x01, 0x00, 0x1e, 0x00, 0x56, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x01, 0x02, 0x00, 0x2a, 0x00, 0x2c, 0x00, 0x03, 0x00, 0x01, 0x04, 0x09, 0x01, 0x03, 0x00, 0x2c, 0x00, 0x00, 0x00, 0x41, 0x00, 0x6c, 0x00, 0x74, 0x00, 0x65, 0x00, 0x72, 0x00, 0x6e, 0x00, 0x61, 0x00, 0x74, 0x00, 0x69, 0x00, 0x76, 0x00, 0x65, 0x00, 0x20, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x20, 0x00, 0x33, 0x00, 0x2c, 0x00, 0x20, 0x00, 0x36, 0x00, 0x2c, 0x00, 0x20, 0x00, 0x39, 0x00, 0x41, 0x00, 0x6c, 0x00, 0x74, 0x00, 0x65, 0x00, 0x72, 0x00, 0x6e, 0x00, 0x61, 0x00, 0x74, 0x00, 0x69, 0x00, 0x76, 0x00, 0x65, 0x00, 0x20, 0x00, 0x61, 0x00, 0x6d, 0x00, 0x70, 0x00, 0x65, 0x00, 0x72, 0x00, 0x73, 0x00, 0x61, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x44, 0x00, 0x6f, 0x00, 0x75, 0x00, 0x62, 0x00, 0x6c, 0x00, 0x65, 0x00, 0x2d, 0x00, 0x73, 0x00, 0x74, 0x00, 0x6f, 0x00, 0x72, 0x00, 0x65, 0x00, 0x79, 0x00, 0x20, 0x00, 0x61, 0x00, 0x53, 0x00, 0x71, 0x00, 0x75, 0x00, 0x61, 0x00, 0x72, 0x00, 0x65, 0x00, 0x20, 0x00, 0x64, 0x00, 0x6f, 0x00, 0x74, 0x00, 0x73, 0x00, 0x20, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x70, 0x00, 0x75, 0x00, 0x6e, 0x00, 0x63, 0x00, 0x74, 0x00, 0x75, 0x00, 0x61, 0x00, 0x74, 0x00, 0x69, 0x00, 0x6f, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x6d, 0x00, 0x61, 0x00, 0x72, 0x00, 0x6b, 0x00, 0x73, 0x09, 0x38, 0x09, 0x2d, 0x09, 0x40, 0x00, 0x20, 0x09, 0x2e, 0x09, 0x28, 0x09, 0x41, 0x09, 0x37, 0x09, 0x4d, 0x09, 0x2f, 0x09, 0x4b, 0x09, 0x02, 0x00, 0x20, 0x09, 0x15, 0x09, 0x4b, 0x00, 0x20, 0x09, 0x17, 0x09, 0x4c, 0x09, 0x30, 0x09, 0x35, 0x00, 0x20, 0x09, 0x14, 0x09, 0x30, 0x00, 0x20, 0x09, 0x05, 0x09, 0x27, 0x09, 0x3f, 0x09, 0x15, 0x09, 0x3e, 0x09, 0x30, 0x09, 0x4b, 0x09, 0x02, 0x00, 0x20, 0x09, 0x15, 0x09, 0x47, 0x00, 0x20, 0x09, 0x2e, 0x09, 0x3e, 0x09, 0x2e, 0x09, 0x32, 0x09, 0x47, 0x00, 0x20, 0x09, 0x2e, 0x09, 0x47, 0x09, 0x02, 0x00, 0x20, 0x09, 0x1c, 0x09, 0x28, 0x09, 0x4d, 0x09, 0x2e, 0x09, 0x1c, 0x09, 0x3e, 0x09, 0x24, 0x00, 0x20, 0x09, 0x38, 0x09, 0x4d, 0x09, 0x35, 0x09, 0x24, 0x09, 0x28, 0x09, 0x4d, 0x09, 0x24, 0x09, 0x4d, 0x09, 0x30, 0x09, 0x24, 0x09, 0x3e, 0x00, 0x20, 0x09, 0x14, 0x09, 0x30, 0x00, 0x20, 0x09, 0x38, 0x09, 0x2e, 0x09, 0x3e, 0x09, 0x28, 0x09, 0x24, 0x09, 0x3e, 0x00, 0x20, 0x09, 0x2a, 0x09, 0x4d, 0x09, 0x30, 0x09, 0x3e, 0x09, 0x2a, 0x09, 0x4d, 0x09, 0x24, 0x00, 0x20, 0x09, 0x39, 0x09, 0x48, 0x09, 0x64, 0x00, 0x53, 0x00, 0x65, 0x00, 0x6d, 0x00, 0x69, 0x00, 0x42, 0x00, 0x6f, 0x00, 0x6c, 0x00, 0x64, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x68, 0x00, 0x74, 0x00, 0x74, 0x00, 0x70, 0x00, 0x73, 0x00, 0x3a, 0x00, 0x2f, 0x00, 0x2f, 0x00, 0x73, 0x00, 0x63, 0x00, 0x72, 0x00, 0x69, 0x00, 0x70, 0x00, 0x74, 0x00, 0x73, 0x00, 0x2e, 0x00, 0x73, 0x00, 0x69, 0x00, 0x6c, 0x00, 0x2e, 0x00, 0x6f, 0x00, 0x72, 0x00, 0x67, 0x00, 0x2f, 0x00, 0x4f, 0x00, 0x46, 0x00, 0x4c, 0x00, 0x54, 0x00, 0x68, 0x00, 0x69, 0x00, 0x73, 0x00, 0x20, 0x00, 0x46, 0x00, 0x6f, 0x00, 0x6e, 0x00, 0x74, 0x00, 0x20, 0x00, 0x53, 0x00, 0x6f, 0x00, 0x66, 0x00, 0x74, 0x00, 0x77, 0x00, 0x61, 0x00, 0x72, 0x00, 0x65, 0x00, 0x20, 0x00, 0x69, 0x00, 0x73, 0x00, 0x20, 0x00, 0x6c, 0x00, 0x69, 0x00, 0x63, 0x00, 0x65, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x65, 0x00, 0x64, 0x00, 0x20, 0x00, 0x75, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x65, 0x00, 0x72, 0x00, 0x20, 0x00, 0x74, 0x00, 0x68, 0x00, 0x65, 0x00, 0x20, 0x00, 0x53, 0x00, 0x49, 0x00, 0x4c, 0x00, 0x20, 0x00, 0x4f, 0x00, 0x70, 0x00, 0x65, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x46, 0x00, 0x6f, 0x00, 0x6e, 0x00, 0x74, 0x00, 0x20, 0x00, 0x4c, 0x00, 0x69, 0x00, 0x63, 0x00, 0x65, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x65, 0x00, 0x2c, 0x00, 0x20, 0x00, 0x56, 0x00, 0x65, 0x00, 0x72, 0x00, 0x73, 0x00, 0x69, 0x00, 0x6f, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x31, 0x00, 0x2e, 0x00, 0x31, 0x00, 0x2e, 0x00, 0x20, 0x00, 0x54, 0x00, 0x68, 0x00, 0x69, 0x00, 0x73, 0x00, 0x20, 0x00, 0x6c, 0x00, 0x69, 0x00, 0x63, 0x00, 0x65, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x65, 0x00, 0x20, 0x00, 0x69, 0x00, 0x73, 0x00, 0x20, 0x00, 0x61, 0x00, 0x76, 0x00, 0x61, 0x00, 0x69, 0x00, 0x6c, 0x00, 0x61, 0x00, 0x62, 0x00, 0x6c, 0x00, 0x65, 0x00, 0x20, 0x00, 0x77, 0x00, 0x69, 0x00, 0x74, 0x00, 0x68, 0x00, 0x20, 0x00, 0x61, 0x00, 0x20, 0x00, 0x46, 0x00, 0x41, 0x00, 0x51, 0x00, 0x20, 0x00, 0x61, 0x00, 0x74, 0x00, 0x3a, 0x00, 0x20, 0x00, 0x68, 0x00, 0x74, 0x00, 0x74, 0x00, 0x70, 0x00, 0x73, 0x00, 0x3a, 0x00, 0x2f, 0x00, 0x2f, 0x00, 0x73, 0x00, 0x63, 0x00, 0x72, 0x00, 0x69, 0x00, 0x70, 0x00, 0x74, 0x00, 0x73, 0x00, 0x2e, 0x00, 0x73, 0x00, 0x69, 0x00, 0x6c, 0x00, 0x2e, 0x00, 0x6f, 0x00, 0x72, 0x00, 0x67, 0x00, 0x2f, 0x00, 0x4f, 0x00, 0x46, 0x00, 0x4c, 0x00, 0x68, 0x00, 0x74, 0x00, 0x74, 0x00, 0x70, 0x00, 0x73, 0x00, 0x3a, 0x00, 0x2f, 0x00, 0x2f, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x69, 0x00, 0x61, 0x00, 0x6e, 0x00, 0x74, 0x00, 0x79, 0x00, 0x70, 0x00, 0x65, 0x00, 0x66, 0x00, 0x6f, 0x00, 0x75, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x72, 0x00, 0x79, 0x00, 0x2e, 0x00, 0x63, 0x00, 0x6f, 0x00, 0x6d, 0x00, 0x4e, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x61, 0x00, 0x64, 0x00, 0x20, 0x00, 0x4b, 0x00, 0x61, 0x00, 0x6c, 0x00, 0x65, 0x00, 0x20, 0x00, 0x28, 0x00, 0x44, 0x00, 0x65, 0x00, 0x76, 0x00, 0x61, 0x00, 0x6e, 0x00, 0x61, 0x00, 0x67, 0x00, 0x61, 0x00, 0x72, 0x00, 0x69, 0x00, 0x29, 0x00, 0x2c, 0x00, 0x20, 0x00, 0x4a, 0x00, 0x6f, 0x00, 0x6e, 0x00, 0x6e, 0x00, 0x79, 0x00, 0x20, 0x00, 0x50, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x6f, 0x00, 0x72, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x28, 0x00, 0x4c, 0x00, 0x61, 0x00, 0x74, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x29, 0x00, 0x49, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x69, 0x00, 0x61, 0x00, 0x6e, 0x00, 0x20, 0x00, 0x54, 0x00, 0x79, 0x00, 0x70, 0x00, 0x65, 0x00, 0x20, 0x00, 0x46, 0x00, 0x6f, 0x00, 0x75, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x72, 0x00, 0x79, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x2d, 0x00, 0x53, 0x00, 0x65, 0x00, 0x6d, 0x00, 0x69, 0x00, 0x42, 0x00, 0x6f, 0x00, 0x6c, 0x00, 0x64, 0x00, 0x34, 0x00, 0x2e, 0x00, 0x30, 0x00, 0x30, 0x00, 0x34, 0x00, 0x49, 0x00, 0x54, 0x00, 0x46, 0x00, 0x4f, 0x00, 0x3b, 0x00, 0x20, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x20, 0x00, 0x53, 0x00, 0x65, 0x00, 0x6d, 0x00, 0x69, 0x00, 0x42, 0x00, 0x6f, 0x00, 0x6c, 0x00, 0x64, 0x00, 0x3b, 0x00, 0x20, 0x00, 0x34, 0x00, 0x2e, 0x00, 0x30, 0x00, 0x30, 0x00, 0x34, 0x00, 0x62, 0x00, 0x38, 0x00, 0x52, 0x00, 0x65, 0x00, 0x67, 0x00, 0x75, 0x00, 0x6c, 0x00, 0x61, 0x00, 0x72, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x20, 0x00, 0x53, 0x00, 0x65, 0x00, 0x6d, 0x00, 0x69, 0x00, 0x42, 0x00, 0x6f, 0x00, 0x6c, 0x00, 0x64, 0x00, 0x43, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x79, 0x00, 0x72, 0x00, 0x69, 0x00, 0x67, 0x00, 0x68, 0x00, 0x74, 0x00, 0x20, 0x00, 0x32, 0x00, 0x30, 0x00, 0x32, 0x00, 0x30, 0x00, 0x20, 0x00, 0x54, 0x00, 0x68, 0x00, 0x65, 0x00, 0x20, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x20, 0x00, 0x50, 0x00, 0x72, 0x00, 0x6f, 0x00, 0x6a, 0x00, 0x65, 0x00, 0x63, 0x00, 0x74, 0x00, 0x20, 0x00, 0x41, 0x00, 0x75, 0x00, 0x74, 0x00, 0x68, 0x00, 0x6f, 0x00, 0x72, 0x00, 0x73, 0x00, 0x20, 0x00, 0x28, 0x00, 0x68, 0x00, 0x74, 0x00, 0x74, 0x00, 0x70, 0x00, 0x73, 0x00, 0x3a, 0x00, 0x2f, 0x00, 0x2f, 0x00, 0x67, 0x00, 0x69, 0x00, 0x74, 0x00, 0x68, 0x00, 0x75, 0x00, 0x62, 0x00, 0x2e, 0x00, 0x63, 0x00, 0x6f, 0x00, 0x6d, 0x00, 0x2f, 0x00, 0x69, 0x00, 0x74, 0x00, 0x66, 0x00, 0x6f, 0x00, 0x75, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x72, 0x00, 0x79, 0x00, 0x2f, 0x00, 0x50, 0x00, 0x6f, 0x00, 0x70, 0x00, 0x70, 0x00, 0x69, 0x00, 0x6e, 0x00, 0x73, 0x00, 0x29, 0x00, 0x00, 0x00, 0x00, 0x00, 0x26, 0x00, 0x26, 0x00, 0x26, 0x00, 0x26, 0x00, 0x6f, 0x00, 0xbe, 0x00, 0xfb, 0x01, 0x4c, 0x01, 0x82, 0x01, 0xcd, 0x02, 0x18, 0x02, 0x74, 0x02, 0xcf, 0x03, 0x3d, 0x03, 0x6e, 0x03, 0xad, 0x04, 0x0a, 0x04, 0x75, 0x04, 0x81, 0x04, 0x8d, 0x04, 0x99, 0x04, 0xaa, 0x04, 0xd3, 0x04, 0xf7, 0x05, 0x19, 0x05, 0x40, 0x05, 0x60, 0x05, 0x92, 0x05, 0xe4, 0x06, 0x48, 0x06, 0x5f, 0x06, 0x84, 0x06, 0xa4, 0x06, 0xd2, 0x06, 0xea, 0x06, 0xf6, 0x07, 0x4d, 0x07, 0x9e, 0x07, 0xc4, 0x07, 0xff, 0x08, 0x49, 0x08, 0x7a, 0x08, 0xc5, 0x08, 0xf0, 0x09, 0x35, 0x09, 0x6c, 0x09, 0x99, 0x09, 0xcc, 0x0a, 0x05, 0x0a, 0x44, 0x0a, 0x6e, 0x0a, 0x95, 0x0a, 0xda, 0x0b, 0x0a, 0x0b, 0x4f, 0x0b, 0x87, 0x0b, 0xab, 0x0b, 0xef, 0x0c, 0x2f, 0x0c, 0x75, 0x0c, 0xaa, 0x0c, 0xdb, 0x0d, 0x07, 0x0d, 0x56, 0x0d, 0x8e, 0x0d, 0xd0, 0x0d, 0xfa, 0x0e, 0x30, 0x0e, 0x76, 0x0e, 0xcb, 0x0f, 0x1b, 0x0f, 0x4e, 0x0f, 0x5a, 0x0f, 0x66, 0x0f, 0x72, 0x0f, 0x7e, 0x0f, 0x8a, 0x0f, 0x96, 0x0f, 0xa2, 0x0f, 0xae, 0x0f, 0xf7, 0x10, 0x42, 0x10, 0x64, 0x10, 0x97, 0x10, 0xa3, 0x10, 0xd1, 0x11, 0x16, 0x11, 0x3e, 0x11, 0x7c, 0x11, 0xaf, 0x11, 0xbb, 0x11, 0xc7, 0x11, 0xd3, 0x11, 0xdf, 0x12, 0x03, 0x12, 0x25, 0x12, 0x61, 0x12, 0x6d, 0x12, 0xac, 0x12, 0xe0, 0x13, 0x00, 0x13, 0x35, 0x13, 0x72, 0x13, 0xb0, 0x13, 0xdf, 0x14, 0x0f, 0x14, 0x1b, 0x14, 0x5d, 0x14, 0x91, 0x14, 0xca, 0x14, 0xf1, 0x15, 0x21, 0x15, 0x2d, 0x15, 0x82, 0x15, 0xca, 0x15, 0xfa, 0x16, 0x06, 0x16, 0x12, 0x16, 0x1e, 0x16, 0x2a, 0x16, 0x36, 0x16, 0x4c, 0x16, 0x74, 0x16, 0x9a, 0x16, 0xc8, 0x16, 0xd5, 0x16, 0xeb, 0x16, 0xf3, 0x16, 0xfb, 0x17, 0x03, 0x17, 0x0b, 0x17, 0x13, 0x17, 0x1b, 0x17, 0x23, 0x17, 0x2b, 0x17, 0x33, 0x17, 0x3b, 0x17, 0xc2, 0x17, 0xea, 0x17, 0xf8, 0x18, 0x0c, 0x18, 0x6c, 0x18, 0x9f, 0x18, 0xac, 0x18, 0xca, 0x19, 0x8f, 0x19, 0xaa, 0x19, 0xc9, 0x19, 0xda, 0x1a, 0x33, 0x1a, 0x89, 0x1a, 0xb5, 0x1a, 0xf1, 0x1b, 0x44, 0x1b, 0x77, 0x1b, 0xca, 0x1b, 0xf8, 0x1c, 0x44, 0x1c, 0x82, 0x1c, 0xb7, 0x1c, 0xf0, 0x1d, 0x32, 0x1d, 0x78, 0x1d, 0xa6, 0x1d, 0xd1, 0x1e, 0x1a, 0x1e, 0x4b, 0x1e, 0x93, 0x1e, 0xd1, 0x1e, 0xf9, 0x1f, 0x42, 0x1f, 0x85, 0x1f, 0xce, 0x20, 0x0a, 0x20, 0x3f, 0x20, 0x4b, 0x20, 0x85, 0x20, 0xca, 0x20, 0xfa, 0x21, 0x36, 0x21, 0x80, 0x21, 0xdb, 0x22, 0x43, 0x22, 0xa9, 0x22, 0xe5, 0x23, 0x24, 0x23, 0x7b, 0x23, 0xc7, 0x24, 0x17, 0x24, 0x40, 0x24, 0x77, 0x24, 0x83, 0x24, 0xb4, 0x25, 0x00, 0x25, 0x2c, 0x25, 0x72, 0x25, 0xac, 0x25, 0xb8, 0x25, 0xc4, 0x25, 0xd0, 0x25, 0xdc, 0x26, 0x07, 0x26, 0x2f, 0x26, 0x70, 0x26, 0x7c, 0x26, 0xc1, 0x26, 0xfe, 0x27, 0x22, 0x27, 0x5c, 0x27, 0x9d, 0x27, 0xe1, 0x28, 0x1b, 0x28, 0x4e, 0x28, 0x5a, 0x28, 0x93, 0x28, 0xcd, 0x28, 0xf9, 0x29, 0x31, 0x29, 0x3d, 0x29, 0x98, 0x29, 0xf2, 0x2a, 0x52, 0x2a, 0x8b, 0x2a, 0xc7, 0x2b, 0x0f, 0x2b, 0xa2, 0x2c, 0x51, 0x2c, 0xdc, 0x2d, 0x3c, 0x2d, 0xa4, 0x2e, 0x0b, 0x2e, 0x6f, 0x2e, 0xb8, 0x2f, 0x2a, 0x2f, 0xad, 0x30, 0x12, 0x30, 0x9b, 0x31, 0x14, 0x31, 0x7e, 0x31, 0xf0, 0x32, 0x50, 0x32, 0xb3, 0x33, 0x32, 0x33, 0x3e, 0x33, 0xdd, 0x34, 0x68, 0x34, 0xdc, 0x35, 0x60, 0x35, 0xcb, 0x36, 0x56, 0x36, 0xc9, 0x37, 0x59, 0x37, 0xd3, 0x38, 0x46, 0x38, 0xd4, 0x39, 0x43, 0x39, 0xbb, 0x3a, 0x2d, 0x3a, 0xba, 0x3b, 0x51, 0x3b, 0xda, 0x3c, 0x63, 0x3d, 0x20, 0x3d, 0xad, 0x3e, 0x11, 0x3e, 0x1d, 0x3e, 0x8f, 0x3f, 0x02, 0x3f, 0x0e, 0x3f, 0x7d, 0x3f, 0x89, 0x3f, 0xfa, 0x40, 0x06, 0x40, 0x83, 0x40, 0x8f, 0x41, 0x13, 0x41, 0x4e, 0x41, 0x9d, 0x41, 0xdc, 0x42, 0x1a, 0x42, 0x5f, 0x42, 0xbe, 0x43, 0x3d, 0x43, 0xc1, 0x44, 0x0e, 0x44, 0x75, 0x44, 0xca, 0x45, 0x21, 0x45, 0x9e, 0x45, 0xe8, 0x46, 0x2e, 0x46, 0x7c, 0x46, 0xe0, 0x47, 0x2d, 0x47, 0x78, 0x47, 0xd6, 0x48, 0x36, 0x48, 0x93, 0x48, 0xdb, 0x49, 0x44, 0x49, 0xcc, 0x4a, 0x20, 0x4a, 0x71, 0x4a, 0xbe, 0x4b, 0x28, 0x4b, 0x9b, 0x4c, 0x09, 0x4c, 0x4a, 0x4c, 0x5a, 0x4c, 0xa1, 0x4c, 0xff, 0x4d, 0x64, 0x4d, 0xc1, 0x4e, 0x16, 0x4e, 0x5a, 0x4e, 0xac, 0x4e, 0xe9, 0x4f, 0x30, 0x4f, 0x7b, 0x4f, 0xd4, 0x50, 0x20, 0x50, 0x68, 0x50, 0x74, 0x50, 0xc3, 0x51, 0x2b, 0x51, 0x94, 0x51, 0xfb, 0x52, 0x4d, 0x52, 0xbc, 0x53, 0x0a, 0x53, 0x75, 0x53, 0xb9, 0x54, 0x06, 0x54, 0x5d, 0x54, 0xa7, 0x54, 0xf9, 0x55, 0x55, 0x55, 0xa4, 0x55, 0xfe, 0x56, 0x60, 0x56, 0xc2, 0x57, 0x19, 0x57, 0x82, 0x57, 0xe8, 0x58, 0x46, 0x58, 0x8b, 0x58, 0xd5, 0x59, 0x26, 0x59, 0x7c, 0x59, 0xbe, 0x5a, 0x0c, 0x5a, 0x56, 0x5a, 0xa5, 0x5b, 0x0f, 0x5b, 0x8d, 0x5b, 0xf9, 0x5c, 0x7f, 0x5c, 0xed, 0x5d, 0x59, 0x5d, 0xc9, 0x5d, 0xf3, 0x5e, 0x40, 0x5e, 0x8e, 0x5e, 0xe6, 0x5f, 0x2e, 0x5f, 0x90, 0x5f, 0xc8, 0x60, 0x04, 0x60, 0x77, 0x60, 0xcf, 0x61, 0x16, 0x61, 0x79, 0x61, 0xbf, 0x62, 0x08, 0x62, 0x6a, 0x62, 0xb5, 0x63, 0x07, 0x63, 0x7f, 0x63, 0xec, 0x64, 0x63, 0x64, 0xcb, 0x65, 0x2b, 0x65, 0x93, 0x65, 0xd6, 0x66, 0x1d, 0x66, 0x82, 0x66, 0xc4, 0x67, 0x22, 0x67, 0x84, 0x67, 0xd6, 0x68, 0x29, 0x68, 0x35, 0x68, 0x7f, 0x68, 0xc3, 0x69, 0x0a, 0x69, 0x75, 0x69, 0xf8, 0x6a, 0x64, 0x6a, 0xca, 0x6b, 0x34, 0x6b, 0xaf, 0x6c, 0x45, 0x6c, 0x95, 0x6d, 0x0d, 0x6d, 0x5e, 0x6d, 0xbd, 0x6e, 0x06, 0x6e, 0x6f, 0x6e, 0xbd, 0x6f, 0x31, 0x6f, 0x97, 0x70, 0x1c, 0x70, 0xa9, 0x70, 0xfd, 0x71, 0x52, 0x71, 0xbe, 0x72, 0x34, 0x72, 0xca, 0x73, 0x43, 0x73, 0xdd, 0x74, 0x35, 0x74, 0xa7, 0x74, 0xf0, 0x75, 0x3d, 0x75, 0xa6, 0x76, 0x14, 0x76, 0x82, 0x77, 0x0a, 0x77, 0x9f, 0x77, 0xf8, 0x78, 0x6b, 0x78, 0xbe, 0x79, 0x1a, 0x79, 0x7b, 0x79, 0xf7, 0x7a, 0x98, 0x7b, 0x14, 0x7b, 0x7d, 0x7b, 0xba, 0x7b, 0xff, 0x7c, 0x39, 0x7c, 0x94, 0x7c, 0xdc, 0x7d, 0x15, 0x7d, 0x6e, 0x7d, 0xb8, 0x7d, 0xfd, 0x7e, 0x5c, 0x7e, 0xa5, 0x7e, 0xf0, 0x7f, 0x47, 0x7f, 0x57, 0x7f, 0xac, 0x80, 0x01, 0x80, 0x0d, 0x80, 0x70, 0x80, 0xbe, 0x81, 0x2c, 0x81, 0x3c, 0x81, 0x93, 0x82, 0x0b, 0x82, 0x73, 0x82, 0xe2, 0x83, 0x37, 0x83, 0x43, 0x83, 0xb3, 0x84, 0x21, 0x84, 0x73, 0x84, 0xce, 0x85, 0x45, 0x85, 0xe1, 0x86, 0x45, 0x86, 0xb1, 0x87, 0x20, 0x87, 0x92, 0x87, 0xee, 0x88, 0x68, 0x88, 0xf1, 0x89, 0x55, 0x89, 0xc1, 0x8a, 0x21, 0x8a, 0x8e, 0x8a, 0xef, 0x8b, 0x53, 0x8b, 0xd8, 0x8c, 0x46, 0x8c, 0x90, 0x8c, 0xe3, 0x8d, 0x3d, 0x8d, 0x85, 0x8d, 0xd0, 0x8e, 0x34, 0x8e, 0xb5, 0x8f, 0x1c, 0x8f, 0x7f, 0x90, 0x06, 0x90, 0x6c, 0x91, 0x00, 0x91, 0x57, 0x91, 0xa8, 0x92, 0x1b, 0x92, 0x78, 0x92, 0xe1, 0x93, 0x3a, 0x93, 0xa1, 0x93, 0xf6, 0x94, 0x4a, 0x94, 0x82, 0x94, 0xd7, 0x95, 0x5d, 0x95, 0xf7, 0x96, 0x78, 0x96, 0xcc, 0x97, 0x27, 0x97, 0x33, 0x97, 0x91, 0x97, 0xf4, 0x98, 0x5d, 0x98, 0xcf, 0x99, 0x28, 0x99, 0x97, 0x9a, 0x22, 0x9a, 0x82, 0x9a, 0xe3, 0x9b, 0x38, 0x9b, 0xab, 0x9c, 0x1b, 0x9c, 0x8b, 0x9c, 0xf3, 0x9d, 0x51, 0x9d, 0xd0, 0x9e, 0x5e, 0x9e, 0xc7, 0x9f, 0x59, 0x9f, 0xbf, 0xa0, 0x33, 0xa0, 0x8f, 0xa0, 0xe4, 0xa1, 0x58, 0xa1, 0xb3, 0xa2, 0x13, 0xa2, 0x9c, 0xa2, 0xa8, 0xa3, 0x04, 0xa3, 0x10, 0xa3, 0x6f, 0xa3, 0xc8, 0xa4, 0x2a, 0xa4, 0x92, 0xa4, 0xf5, 0xa5, 0x77, 0xa5, 0xd3, 0xa5, 0xdf, 0xa6, 0x4c, 0xa6, 0xbd, 0xa7, 0x00, 0xa7, 0x6e, 0xa7, 0xba, 0xa8, 0x1c, 0xa8, 0x65, 0xa8, 0xd8, 0xa9, 0x29, 0xa9, 0x6b, 0xa9, 0xcd, 0xaa, 0x09, 0xaa, 0x49, 0xaa, 0xa6, 0xaa, 0xf5, 0xab, 0x5f, 0xab, 0xa9, 0xab, 0xf6, 0xac, 0x39, 0xac, 0xb3, 0xad, 0x2f, 0xad, 0xc6, 0xae, 0x3c, 0xae, 0x8a, 0xae, 0xdb, 0xaf, 0x28, 0xaf, 0x95, 0xaf, 0xe1, 0xb0, 0x53, 0xb0, 0xb8, 0xb1, 0x3c, 0xb1, 0x8f, 0xb1, 0xec, 0xb2, 0x36, 0xb2, 0x84, 0xb2, 0xec, 0xb3, 0x50, 0xb3, 0xaa, 0xb4, 0x20, 0xb4, 0x72, 0xb4, 0xe6, 0xb5, 0x42, 0xb5, 0x9b, 0xb5, 0xf6, 0xb6, 0x61, 0xb6, 0xcd, 0xb7, 0x2d, 0xb7, 0xa7, 0xb8, 0x0a, 0xb8, 0x7b, 0xb8, 0xa0, 0xb8, 0xcf, 0xb8, 0xd9, 0xb8, 0xf4, 0xb9, 0x22, 0xb9, 0x84, 0xb9, 0x90, 0xb9, 0xc5, 0xba, 0x0c, 0xba, 0x18, 0xba, 0x4d, 0xba, 0x94, 0xba, 0xa0, 0xba, 0xcc, 0xbb, 0x06, 0xbb, 0x12, 0xbb, 0x4d, 0xbb, 0x96, 0xbb, 0xc6, 0xbb, 0xfb, 0xbc, 0x3d, 0xbc, 0x7a, 0xbc, 0xbd, 0xbd, 0x0e, 0xbd, 0x16, 0xbd, 0x22, 0xbd, 0x65, 0xbd, 0x9e, 0xbd, 0xf3, 0xbe, 0x4d, 0xbe, 0x87, 0xbe, 0xd8, 0xbf, 0x30, 0xbf, 0x59, 0xbf, 0x7f, 0xbf, 0xa4, 0xbf, 0xc9, 0xbf, 0xec, 0xc0, 0x11, 0xc0, 0x38, 0xc0, 0x5f, 0xc0, 0x89, 0xc0, 0xb3, 0xc0, 0xdf, 0xc1, 0x0b, 0xc1, 0x37, 0xc1, 0x64, 0xc1, 0x91, 0xc1, 0xbe, 0xc1, 0xec, 0xc2, 0x1b, 0xc2, 0x4a, 0xc2, 0x79, 0xc2, 0xa7, 0xc2, 0xd6, 0xc3, 0x05, 0xc3, 0x34, 0xc3, 0x52, 0xc3, 0x66, 0xc3, 0x96, 0xc3, 0xe2, 0xc4, 0x27, 0xc4, 0x72, 0xc4, 0x7f, 0xc4, 0x9c, 0xc4, 0xba, 0xc4, 0xdc, 0xc4, 0xf1, 0xc4, 0xff, 0xc5, 0x07, 0xc5, 0x1d, 0xc5, 0x2d, 0xc5, 0x59, 0xc5, 0x68, 0xc5, 0x90, 0xc5, 0xcc, 0xc5, 0xe7, 0xc6, 0x18, 0xc6, 0x53, 0xc6, 0x67, 0xc6, 0xb1, 0xc6, 0xeb, 0xc6, 0xf7, 0xc7, 0x03, 0xc7, 0x13, 0xc7, 0x27, 0xc7, 0x37, 0xc7, 0x6d, 0xc7, 0xd2, 0xc7, 0xec, 0xc8, 0x23, 0xc8, 0x51, 0xc8, 0x74, 0xc8, 0x8a, 0xc8, 0x9e, 0xc8, 0xd1, 0xc8, 0xea, 0xc8, 0xf7, 0xc9, 0x13, 0xc9, 0x2c, 0xc9, 0x3b, 0xc9, 0x57, 0xc9, 0x6d, 0xc9, 0x9e, 0xc9, 0xc1, 0xc9, 0xf9, 0xca, 0x22, 0xca, 0x63, 0xca, 0x75, 0xca, 0x96, 0xca, 0xab, 0xca, 0xc9, 0xca, 0xe3, 0xca, 0xf9, 0xcb, 0x0e, 0xcb, 0x20, 0xcb, 0x2f, 0xcb, 0x40, 0xcb, 0x52, 0xcb, 0x5f, 0xcb, 0x6c, 0xcb, 0xa2, 0xcb, 0xd8, 0xcc, 0x02, 0xcc, 0x38, 0xcc, 0x6a, 0xcc, 0x88, 0xcc, 0xce, 0xcc, 0xf1, 0xcd, 0x0e, 0xcd, 0x34, 0xcd, 0x4b, 0xcd, 0x58, 0xcd, 0x8c, 0xcd, 0xad, 0xcd, 0xd9, 0xce, 0x0f, 0xce, 0x45, 0xce, 0x5c, 0xce, 0x9b, 0xce, 0xb8, 0xce, 0xdb, 0xce, 0xed, 0xcf, 0x0b, 0xcf, 0x25, 0xcf, 0x3b, 0xcf, 0x4f, 0xcf, 0x93, 0xcf, 0x9f, 0xcf, 0xe3, 0xd0, 0x0d, 0xd0, 0x0d, 0xd0, 0x2a, 0xd0, 0x59, 0xd0, 0x91, 0xd0, 0xcf, 0xd0, 0xf6, 0xd1, 0x09, 0xd1, 0x60, 0xd1, 0x85, 0xd1, 0xdb, 0xd2, 0x09, 0xd2, 0x22, 0xd2, 0x31, 0xd2, 0x39, 0xd2, 0x82, 0xd2, 0x8f, 0xd2, 0xb5, 0xd2, 0xce, 0xd2, 0xf5, 0xd3, 0x2b, 0xd3, 0x38, 0xd3, 0x5b, 0xd3, 0x76, 0xd3, 0x80, 0xd3, 0x9d, 0xd3, 0xac, 0xd3, 0xd8, 0xd3, 0xf1, 0xd4, 0x1c, 0xd4, 0x55, 0xd4, 0xa7, 0xd4, 0xdd, 0xd4, 0xe9, 0xd4, 0xf5, 0xd5, 0x01, 0xd5, 0x0d, 0xd5, 0x19, 0xd5, 0x25, 0xd5, 0x48, 0xd5, 0x8b, 0xd5, 0x97, 0xd5, 0xa3, 0xd5, 0xaf, 0xd5, 0xbb, 0xd5, 0xc7, 0xd5, 0xd3, 0xd5, 0xdf, 0xd5, 0xeb, 0xd6, 0x16, 0xd6, 0x22, 0xd6, 0x2e, 0xd6, 0x3a, 0xd6, 0x46, 0xd6, 0x52, 0xd6, 0x5e, 0xd6, 0x78, 0xd6, 0xc0, 0xd6, 0xcc, 0xd6, 0xd8, 0xd6, 0xe4, 0xd6, 0xf0, 0xd6, 0xfc, 0xd7, 0x22, 0xd7, 0x6f, 0xd7, 0x7b, 0xd7, 0x87, 0xd7, 0x93, 0xd7, 0x9f, 0xd7, 0xab, 0xd7, 0xb7, 0xd8, 0x14, 0xd8, 0x52, 0xd8, 0x5e, 0xd8, 0x6a, 0xd8, 0x76, 0xd8, 0x82, 0xd8, 0x8e, 0xd8, 0x9a, 0xd8, 0xa6, 0xd8, 0xb2, 0xd8, 0xf6, 0xd9, 0x02, 0xd9, 0x0e, 0xd9, 0x1a, 0xd9, 0x26, 0xd9, 0x32, 0xd9, 0x3e, 0xd9, 0x6b, 0xd9, 0xac, 0xd9, 0xb8, 0xd9, 0xc4, 0xd9, 0xd0, 0xd9, 0xdc, 0xd9, 0xe8, 0xda, 0x1e, 0xda, 0x2a, 0xda, 0x36, 0xda, 0x42, 0xda, 0x4e, 0xda, 0x5a, 0xda, 0x8a, 0xda, 0xd6, 0xda, 0xe2, 0xda, 0xee, 0xda, 0xfa, 0xdb, 0x06, 0xdb, 0x12, 0xdb, 0x1e, 0xdb, 0x2a, 0xdb, 0x70, 0xdb, 0x78, 0xdb, 0xb7, 0xdb, 0xc3, 0xdb, 0xcf, 0xdb, 0xdb, 0xdb, 0xe7, 0xdb, 0xf3, 0xdb, 0xff, 0xdc, 0x2a, 0xdc, 0x70, 0xdc, 0x7c, 0xdc, 0x88, 0xdc, 0x94, 0xdc, 0xa0, 0xdc, 0xac, 0xdc, 0xb8, 0xdc, 0xfa, 0xdd, 0x4e, 0xdd, 0x5a, 0xdd, 0x66, 0xdd, 0x72, 0xdd, 0x7e, 0xdd, 0x8a, 0xdd, 0x96, 0xdd, 0xb9, 0xdd, 0xed, 0xdd, 0xf9, 0xde, 0x06, 0xde, 0x2d, 0xde, 0x52, 0xde, 0x5e, 0xde, 0x6a, 0xde, 0x89, 0xde, 0xa5, 0xde, 0xc2, 0xde, 0xde, 0xde, 0xfe, 0xdf, 0x1b, 0xdf, 0x35, 0xdf, 0x4e, 0xdf, 0x5a, 0xdf, 0x66, 0xdf, 0x8b, 0xdf, 0xbb, 0xdf, 0xc7, 0xdf, 0xd3, 0xdf, 0xdf, 0xdf, 0xeb, 0xdf, 0xf7, 0xe0, 0x03, 0xe0, 0x0f, 0xe0, 0x1b, 0xe0, 0x5a, 0xe0, 0xb0, 0xe0, 0xbc, 0xe0, 0xc8, 0xe0, 0xfe, 0xe1, 0x24, 0xe1, 0x30, 0xe1, 0x3c, 0xe1, 0x48, 0xe1, 0x54, 0xe1, 0xa9, 0xe1, 0xfa, 0xe2, 0x06, 0xe2, 0x12, 0xe2, 0x38, 0xe2, 0x6c, 0xe2, 0x78, 0xe2, 0xa5, 0xe2, 0xb1, 0xe2, 0xbd, 0xe2, 0xc9, 0xe2, 0xd5, 0xe2, 0xe1, 0xe2, 0xed, 0xe2, 0xf9, 0xe3, 0x05, 0xe3, 0x11, 0xe3, 0x1d, 0xe3, 0x53, 0xe3, 0x89, 0xe3, 0x95, 0xe3, 0xa1, 0xe3, 0xad, 0xe3, 0xb9, 0xe3, 0xc5, 0xe3, 0xd1, 0xe3, 0xdd, 0xe3, 0xe9, 0xe3, 0xf5, 0xe4, 0x01, 0xe4, 0x0d, 0xe4, 0x41, 0xe4, 0x6d, 0xe4, 0x79, 0xe4, 0x85, 0xe4, 0xd4, 0xe5, 0x21, 0xe5, 0x42, 0xe5, 0x6e, 0xe5, 0xa1, 0xe5, 0xa9, 0xe5, 0xb9, 0xe5, 0xca, 0xe5, 0xd2, 0xe5, 0xed, 0xe6, 0x03, 0xe6, 0x29, 0xe6, 0x49, 0xe6, 0x6d, 0xe6, 0x80, 0xe6, 0x97, 0xe6, 0xa3, 0xe6, 0xaf, 0xe6, 0xbb, 0xe6, 0xc7, 0xe6, 0xd3, 0xe6, 0xdf, 0xe6, 0xeb, 0xe6, 0xf7, 0xe7, 0x03, 0xe7, 0x0f, 0xe7, 0x1b, 0xe7, 0x27, 0xe7, 0x34, 0xe7, 0x41, 0xe7, 0x4e, 0xe7, 0x5b, 0xe7, 0x67, 0xe7, 0x7a, 0xe7, 0x8d, 0xe7, 0xa0, 0xe7, 0xba, 0xe7, 0xdd, 0xe7, 0xf9, 0xe8, 0x09, 0xe8, 0x74, 0xe8, 0x84, 0xe8, 0x94, 0xe8, 0xa4, 0xe8, 0xe4, 0xe9, 0x12, 0xe9, 0x42, 0xe9, 0x4a, 0xe9, 0x6f, 0xe9, 0xa5, 0xe9, 0xd6, 0xea, 0x12, 0xea, 0x2b, 0xea, 0x42, 0xea, 0x5c, 0xea, 0x69, 0xea, 0x71, 0xea, 0x79, 0xea, 0x90, 0xea, 0xdb, 0xea, 0xfe, 0xeb, 0x0a, 0xeb, 0x2b, 0xeb, 0x42, 0xeb, 0x58, 0xeb, 0x6e, 0xeb, 0x9e, 0xeb, 0xaa, 0xeb, 0xbe, 0xeb, 0xd4, 0xeb, 0xe0, 0xeb, 0xf2, 0xec, 0x0e, 0xec, 0x39, 0xec, 0x4c, 0xec, 0x56, 0xec, 0x81, 0xec, 0x9a, 0xec, 0xaf, 0xec, 0xc4, 0xec, 0xe7, 0xed, 0x0a, 0xed, 0x1a, 0xed, 0x55, 0xed, 0x61, 0xed, 0x6d, 0xed, 0x79, 0xed, 0x85, 0xed, 0x91, 0xed, 0x9d, 0xed, 0xee, 0xed, 0xfa, 0xee, 0x06, 0xee, 0x54, 0xee, 0x7e, 0xee, 0xa9, 0xee, 0xdc, 0xef, 0x0f, 0x01, 0xf4, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xee, 0x00, 0x00, 0x00, 0xee, 0x00, 0x00, 0x03, 0x43, 0x00, 0x41, 0x04, 0x73, 0x00, 0x41, 0x02, 0x43, 0xff, 0xe5, 0x02, 0x43, 0xff, 0xe5, 0x02, 0x39, 0xff, 0xeb, 0x03, 0x59, 0xff, 0xeb, 0x04, 0x10, 0xff, 0xeb, 0x03, 0xf6, 0xff, 0xeb, 0x03, 0x88, 0xff, 0xeb, 0x03, 0x91, 0xff, 0xeb, 0x02, 0x8c, 0xff, 0xeb, 0x02, 0x8c, 0xff, 0xeb, 0x04, 0x78, 0x00, 0x41, 0x04, 0x78, 0x00, 0x41, 0x02, 0x8c, 0xff, 0xeb, 0x03, 0x46, 0x00, 0x41, 0x04, 0x78, 0x00, 0x41, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0x25, 0x00, 0x00, 0xfe, 0x39, 0x00, 0x00, 0xfe, 0x92, 0x00, 0x00, 0xfe, 0xa6, 0x00, 0x00, 0xfe, 0xc0, 0x00, 0x00, 0xfe, 0x41, 0x00, 0x00, 0xfe, 0x41, 0x00, 0x00, 0xfe, 0x2b, 0x00, 0x00, 0xfe, 0x21, 0x01, 0x36, 0xff, 0x61, 0x01, 0x35, 0xff, 0x53, 0x00, 0x00, 0xfe, 0x7d, 0x01, 0x37, 0xff, 0xba, 0x03, 0xd0, 0xff, 0xeb, 0x03, 0xb6, 0xff, 0xeb, 0x03, 0x15, 0xff, 0xeb, 0x02, 0xbf, 0xff, 0xeb, 0x02, 0xae, 0xff, 0xeb, 0x02, 0xea, 0xff, 0xeb, 0x03, 0x35, 0xff, 0xeb, 0x03, 0x54, 0xff, 0xeb, 0x03, 0x5e, 0xff, 0xeb, 0x03, 0x39, 0xff, 0xeb, 0x02, 0x88, 0xff, 0xeb, 0x02, 0xa1, 0xff, 0xeb, 0x02, 0x39, 0xff, 0xeb, 0x02, 0x8a, 0xff, 0xeb, 0x03, 0x70, 0xff, 0xeb, 0x02, 0xbf, 0xff, 0xeb, 0x03, 0x0f, 0x00, 0x40, 0x02, 0x63, 0xff, 0xeb, 0x02, 0xd4, 0x00, 0x46, 0x03, 0x2a, 0xff, 0xeb, 0x02, 0x9c, 0xff, 0xeb, 0x03, 0xd9, 0xff, 0xeb, 0x02, 0xb1, 0xff, 0xeb, 0x03, 0x3f, 0x00, 0x3f, 0x03, 0x36, 0xff, 0xeb, 0x02, 0xed, 0xff, 0xeb, 0x02, 0x15, 0xff, 0xeb, 0x03, 0x8e, 0xff, 0xeb, 0x02, 0x9e, 0xff, 0xeb, 0x03, 0x48, 0x00, 0x4b, 0x02, 0xa8, 0xff, 0xeb, 0x03, 0x39, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x03, 0xcf, 0xff, 0xeb, 0x03, 0x46, 0x00, 0x3f, 0x03, 0x3d, 0xff, 0xeb, 0x03, 0xd0, 0xff, 0xeb, 0x03, 0xb6, 0xff, 0xeb, 0x03, 0x14, 0xff, 0xeb, 0x03, 0x54, 0xff, 0xeb, 0x02, 0x39, 0xff, 0xeb, 0x02, 0x8a, 0xff, 0xeb, 0x03, 0xd9, 0xff, 0xeb, 0x02, 0x15, 0xff, 0xeb, 0x02, 0xcb, 0xff, 0xeb, 0x02, 0xa0, 0xff, 0xeb, 0x02, 0x09, 0xff, 0xeb, 0x01, 0x8e, 0xff, 0xeb, 0x02, 0xae, 0xff, 0xeb, 0x01, 0xbf, 0xff, 0xeb, 0x03, 0x35, 0xff, 0xeb, 0x02, 0x24, 0xff, 0xeb, 0x02, 0x34, 0xff, 0xeb, 0x02, 0x19, 0xff, 0xeb, 0x02, 0x88, 0xff, 0xeb, 0x02, 0xa1, 0xff, 0xeb, 0x02, 0x39, 0xff, 0xeb, 0x02, 0x8a, 0xff, 0xeb, 0x02, 0x41, 0xff, 0xeb, 0x01, 0x83, 0xff, 0xeb, 0x01, 0xda, 0x00, 0x40, 0x02, 0x62, 0xff, 0xeb, 0x01, 0xac, 0x00, 0x46, 0x02, 0x00, 0xff, 0xeb, 0x01, 0x66, 0xff, 0xeb, 0x02, 0xca, 0xff, 0xeb, 0x01, 0x8d, 0xff, 0xeb, 0x02, 0x11, 0x00, 0x3f, 0x02, 0x0a, 0xff, 0xeb, 0x01, 0xb4, 0xff, 0xeb, 0x02, 0x15, 0xff, 0xeb, 0x02, 0x88, 0xff, 0xeb, 0x01, 0x74, 0xff, 0xeb, 0x02, 0x23, 0x00, 0x4b, 0x01, 0x81, 0xff, 0xeb, 0x02, 0x04, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x03, 0xcf, 0xff, 0xeb, 0x02, 0x24, 0x00, 0x3f, 0x02, 0x1d, 0xff, 0xeb, 0x02, 0xcb, 0xff, 0xeb, 0x02, 0xa0, 0xff, 0xeb, 0x02, 0x09, 0xff, 0xeb, 0x02, 0x24, 0xff, 0xeb, 0x02, 0xca, 0xff, 0xeb, 0x00, 0x00, 0xff, 0x16, 0x00, 0x00, 0xfe, 0x7d, 0x01, 0x06, 0x00, 0x34, 0x02, 0x4d, 0x00, 0x40, 0x00, 0x00, 0xff, 0x28, 0x00, 0x00, 0xfe, 0x7a, 0x02, 0x86, 0x00, 0x35, 0x01, 0x6a, 0x00, 0x24, 0x02, 0x3e, 0x00, 0x2c, 0x02, 0x57, 0x00, 0x2d, 0x02, 0x95, 0x00, 0x2f, 0x02, 0x84, 0x00, 0x4f, 0x02, 0x80, 0x00, 0x45, 0x02, 0x24, 0x00, 0x23, 0x02, 0x83, 0x00, 0x3a, 0x02, 0x72, 0x00, 0x41, 0x04, 0x2a, 0x00, 0x48, 0x01, 0xe2, 0x00, 0x48, 0x01, 0x40, 0x00, 0x97, 0x02, 0x3a, 0x00, 0x97, 0x04, 0x8f, 0x00, 0x45, 0x02, 0x63, 0x00, 0x2a, 0x00, 0x00, 0xff, 0xe9, 0x00, 0x00, 0xff, 0x80, 0x02, 0x8b, 0x00, 0x32, 0x00, 0x00, 0xff, 0x2e, 0x01, 0x4b, 0xff, 0xeb, 0x00, 0x00, 0xfd, 0xf4, 0x03, 0xd0, 0xff, 0xeb, 0x03, 0xb6, 0xff, 0xeb, 0x03, 0x14, 0xff, 0xeb, 0x02, 0xbf, 0xff, 0xeb, 0x02, 0xae, 0xff, 0xeb, 0x02, 0xea, 0xff, 0xeb, 0x03, 0x35, 0xff, 0xeb, 0x03, 0x54, 0xff, 0xeb, 0x03, 0xa8, 0xff, 0xeb, 0x03, 0x39, 0xff, 0xeb, 0x02, 0x88, 0xff, 0xeb, 0x02, 0xa3, 0xff, 0xeb, 0x02, 0x39, 0xff, 0xeb, 0x02, 0x8a, 0xff, 0xeb, 0x03, 0x6e, 0xff, 0xeb, 0x02, 0xc0, 0xff, 0xeb, 0x03, 0x0f, 0x00, 0x40, 0x02, 0x62, 0xff, 0xeb, 0x02, 0xd4, 0x00, 0x46, 0x03, 0x52, 0xff, 0xeb, 0x02, 0x9c, 0xff, 0xeb, 0x03, 0xd9, 0xff, 0xeb, 0x02, 0xb0, 0xff, 0xeb, 0x03, 0x3f, 0x00, 0x3f, 0x03, 0x36, 0xff, 0xeb, 0x02, 0xed, 0xff, 0xeb, 0x03, 0x8e, 0xff, 0xeb, 0x02, 0x9e, 0xff, 0xeb, 0x03, 0x48, 0x00, 0x1d, 0x02, 0xa8, 0xff, 0xeb, 0x03, 0x85, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x03, 0xcf, 0xff, 0xeb, 0x04, 0x12, 0xff, 0xeb, 0x03, 0xb6, 0xff, 0xeb, 0x03, 0x14, 0xff, 0xeb, 0x03, 0x54, 0xff, 0xeb, 0x04, 0x23, 0xff, 0xeb, 0x02, 0xcb, 0xff, 0xeb, 0x02, 0xa0, 0xff, 0xeb, 0x02, 0x09, 0xff, 0xeb, 0x01, 0x8e, 0xff, 0xeb, 0x02, 0xae, 0xff, 0xeb, 0x01, 0xbf, 0xff, 0xeb, 0x03, 0x35, 0xff, 0xeb, 0x02, 0x24, 0xff, 0xeb, 0x02, 0x34, 0xff, 0xeb, 0x02, 0x19, 0xff, 0xeb, 0x02, 0x88, 0xff, 0xeb, 0x02, 0xa3, 0xff, 0xeb, 0x02, 0x39, 0xff, 0xeb, 0x02, 0x8a, 0xff, 0xeb, 0x02, 0x41, 0xff, 0xeb, 0x01, 0xa1, 0xff, 0xeb, 0x01, 0xda, 0x00, 0x40, 0x02, 0x62, 0xff, 0xeb, 0x01, 0xac, 0x00, 0x46, 0x02, 0x00, 0xff, 0xeb, 0x01, 0x66, 0xff, 0xeb, 0x02, 0xca, 0xff, 0xeb, 0x01, 0x8d, 0xff, 0xeb, 0x02, 0x11, 0x00, 0x3f, 0x02, 0x0a, 0xff, 0xeb, 0x01, 0xb4, 0xff, 0xeb, 0x03, 0x8e, 0xff, 0xeb, 0x01, 0x74, 0xff, 0xeb, 0x02, 0x01, 0x00, 0x1d, 0x01, 0x81, 0xff, 0xeb, 0x02, 0x04, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x03, 0xcf, 0xff, 0xeb, 0x03, 0x0d, 0xff, 0xeb, 0x02, 0xa0, 0xff, 0xeb, 0x02, 0x09, 0xff, 0xeb, 0x02, 0x24, 0xff, 0xeb, 0x03, 0x15, 0xff, 0xeb, 0x06, 0x9f, 0xff, 0xeb, 0x06, 0x9f, 0xff, 0xeb, 0x06, 0x77, 0xff, 0xeb, 0x05, 0x45, 0xff, 0xeb, 0x06, 0x1f, 0xff, 0xeb, 0x05, 0x54, 0xff, 0xeb, 0x06, 0x1f, 0xff, 0xeb, 0x04, 0x42, 0xff, 0xeb, 0x05, 0x7b, 0xff, 0xeb, 0x07, 0x29, 0xff, 0xeb, 0x05, 0x92, 0xff, 0xeb, 0x06, 0xdf, 0xff, 0xeb, 0x05, 0xd4, 0xff, 0xeb, 0x05, 0x30, 0xff, 0xeb, 0x05, 0xfc, 0xff, 0xeb, 0x05, 0x41, 0xff, 0xeb, 0x05, 0x41, 0xff, 0xeb, 0x06, 0x8b, 0xff, 0xeb, 0x06, 0x8b, 0xff, 0xeb, 0x06, 0x8c, 0xff, 0xeb, 0x05, 0x7e, 0xff, 0xeb, 0x06, 0x0d, 0xff, 0xeb, 0x06, 0x04, 0xff, 0xeb, 0x05, 0xb3, 0xff, 0xeb, 0x06, 0x5c, 0xff, 0xeb, 0x05, 0x6c, 0xff, 0xeb, 0x07, 0x41, 0xff, 0xeb, 0x06, 0x06, 0xff, 0xeb, 0x05, 0x5c, 0x00, 0x3f, 0x07, 0x21, 0x00, 0x3f, 0x05, 0x04, 0x00, 0x3f, 0x04, 0xb8, 0x00, 0x3f, 0x05, 0xfc, 0xff, 0xeb, 0x07, 0x56, 0xff, 0xeb, 0x07, 0x14, 0xff, 0xeb, 0x07, 0x8d, 0xff, 0xeb, 0x07, 0x63, 0xff, 0xeb, 0x09, 0xbc, 0xff, 0xeb, 0x06, 0x53, 0xff, 0xeb, 0x05, 0x56, 0xff, 0xeb, 0x05, 0x56, 0xff, 0xeb, 0x05, 0xd9, 0xff, 0xeb, 0x05, 0xea, 0xff, 0xeb, 0x05, 0xea, 0xff, 0xeb, 0x05, 0x8f, 0xff, 0xeb, 0x05, 0x8f, 0xff, 0xeb, 0x05, 0x3d, 0xff, 0xeb, 0x05, 0x3d, 0xff, 0xeb, 0x05, 0xd5, 0xff, 0xeb, 0x05, 0xd5, 0xff, 0xeb, 0x05, 0xda, 0xff, 0xeb, 0x04, 0xf5, 0xff, 0xeb, 0x04, 0x95, 0xff, 0xeb, 0x05, 0x30, 0xff, 0xeb, 0x05, 0x49, 0xff, 0xeb, 0x04, 0x40, 0xff, 0xeb, 0x04, 0xab, 0xff, 0xeb, 0x06, 0x7f, 0xff, 0xeb, 0x06, 0x38, 0xff, 0xeb, 0x05, 0x0b, 0xff, 0xeb, 0x06, 0xd2, 0xff, 0xeb, 0x04, 0x8d, 0xff, 0xeb, 0x05, 0x18, 0xff, 0xeb, 0x06, 0xcb, 0xff, 0xeb, 0x05, 0x1d, 0xff, 0xeb, 0x04, 0xca, 0xff, 0xeb, 0x04, 0xca, 0xff, 0xeb, 0x05, 0x6b, 0xff, 0xeb, 0x04, 0x7a, 0xff, 0xeb, 0x05, 0x11, 0xff, 0xeb, 0x04, 0xc1, 0xff, 0xeb, 0x04, 0xd5, 0xff, 0xeb, 0x04, 0x94, 0xff, 0xeb, 0x04, 0x63, 0xff, 0xeb, 0x04, 0xf1, 0xff, 0xeb, 0x04, 0xf1, 0xff, 0xeb, 0x04, 0xfc, 0xff, 0xeb, 0x05, 0x03, 0xff, 0xeb, 0x04, 0xc0, 0xff, 0xeb, 0x05, 0x48, 0xff, 0xeb, 0x05, 0x48, 0xff, 0xeb, 0x05, 0xfb, 0xff, 0xeb, 0x05, 0x8b, 0xff, 0xeb, 0x05, 0x8b, 0xff, 0xeb, 0x05, 0x57, 0xff, 0xeb, 0x07, 0x52, 0xff, 0xeb, 0x06, 0xfe, 0xff, 0xeb, 0x05, 0x81, 0xff, 0xeb, 0x05, 0x25, 0xff, 0xeb, 0x04, 0xaf, 0xff, 0xeb, 0x04, 0x4a, 0xff, 0xeb, 0x04, 0xe9, 0xff, 0xeb, 0x04, 0x8c, 0xff, 0xeb, 0x05, 0x59, 0xff, 0xeb, 0x04, 0xd4, 0xff, 0xeb, 0x05, 0x66, 0xff, 0xeb, 0x05, 0x1c, 0xff, 0xeb, 0x05, 0x1c, 0xff, 0xeb, 0x04, 0xc7, 0xff, 0xeb, 0x05, 0x4c, 0xff, 0xeb, 0x05, 0x67, 0xff, 0xeb, 0x05, 0x0c, 0xff, 0xeb, 0x04, 0xf1, 0xff, 0xeb, 0x05, 0x4d, 0xff, 0xeb, 0x05, 0x74, 0xff, 0xeb, 0x05, 0x5f, 0xff, 0xeb, 0x02, 0xa2, 0xff, 0xeb, 0x02, 0xa4, 0xff, 0xeb, 0x05, 0x0a, 0xff, 0xeb, 0x02, 0x92, 0xff, 0xeb, 0x02, 0x9f, 0xff, 0xeb, 0x05, 0x14, 0xff, 0xeb, 0x02, 0x9d, 0xff, 0xeb, 0x02, 0x46, 0xff, 0xeb, 0x02, 0x51, 0xff, 0xf2, 0x04, 0xac, 0xff, 0xeb, 0x02, 0x52, 0xff, 0xeb, 0x02, 0xa2, 0xff, 0xeb, 0x05, 0x16, 0xff, 0xeb, 0x02, 0x8c, 0xff, 0xeb, 0x04, 0xad, 0xff, 0xeb, 0x04, 0xd4, 0xff, 0xeb, 0x04, 0x67, 0xff, 0xeb, 0x04, 0xbe, 0xff, 0xeb, 0x05, 0x9a, 0xff, 0xeb, 0x05, 0x5e, 0xff, 0xeb, 0x05, 0x0b, 0xff, 0xeb, 0x04, 0xcf, 0xff, 0xeb, 0x05, 0x50, 0xff, 0xeb, 0x07, 0x33, 0xff, 0xeb, 0x05, 0x50, 0xff, 0xeb, 0x06, 0xec, 0xff, 0xeb, 0x04, 0xd8, 0xff, 0xeb, 0x05, 0x47, 0xff, 0xeb, 0x05, 0x47, 0xff, 0xeb, 0x02, 0xf1, 0xff, 0xeb, 0x04, 0x94, 0xff, 0xe1, 0x04, 0x51, 0xff, 0xeb, 0x04, 0x97, 0xff, 0xeb, 0x04, 0xa1, 0xff, 0xeb, 0x06, 0x69, 0xff, 0xeb, 0x04, 0x03, 0xff, 0xeb, 0x04, 0x03, 0xff, 0xeb, 0x06, 0x5b, 0xff, 0xeb, 0x05, 0x3f, 0xff, 0xeb, 0x04, 0xb8, 0xff, 0xeb, 0x06, 0x7f, 0xff, 0xeb, 0x04, 0x6b, 0xff, 0xeb, 0x04, 0x90, 0xff, 0xeb, 0x05, 0x0a, 0xff, 0xeb, 0x04, 0x20, 0xff, 0xeb, 0x04, 0xd1, 0xff, 0xeb, 0x06, 0xcc, 0xff, 0xeb, 0x06, 0x88, 0xff, 0xeb, 0x06, 0x36, 0xff, 0xeb, 0x05, 0x1f, 0x00, 0x40, 0x04, 0xe3, 0x00, 0x40, 0x04, 0x8f, 0x00, 0x40, 0x02, 0x96, 0xff, 0xeb, 0x02, 0x96, 0xff, 0xeb, 0x03, 0x91, 0xff, 0xeb, 0x02, 0x32, 0xff, 0xe5, 0x03, 0x91, 0xff, 0xeb, 0x05, 0x75, 0xff, 0xeb, 0x02, 0x69, 0xff, 0xeb, 0x02, 0x69, 0xff, 0xeb, 0x05, 0x89, 0xff, 0xeb, 0x03, 0x50, 0xff, 0xeb, 0x02, 0xc4, 0xff, 0xf8, 0x02, 0x60, 0xff, 0xeb, 0x04, 0xee, 0x00, 0x46, 0x06, 0xb9, 0x00, 0x46, 0x05, 0x06, 0x00, 0x46, 0x04, 0xae, 0x00, 0x46, 0x04, 0x4f, 0x00, 0x46, 0x05, 0xcf, 0xff, 0xeb, 0x07, 0xfb, 0xff, 0xeb, 0x04, 0xab, 0xff, 0xeb, 0x05, 0x42, 0xff, 0xeb, 0x04, 0x7f, 0xff, 0xeb, 0x04, 0x29, 0xff, 0xeb, 0x04, 0xbd, 0xff, 0xeb, 0x06, 0x6b, 0xff, 0xeb, 0x04, 0x9b, 0xff, 0xeb, 0x06, 0xd0, 0xff, 0xeb, 0x05, 0x0c, 0xff, 0xeb, 0x06, 0xdf, 0xff, 0xeb, 0x06, 0x8b, 0xff, 0xeb, 0x04, 0x5b, 0xff, 0xeb, 0x04, 0x5a, 0xff, 0xeb, 0x04, 0x51, 0xff, 0xeb, 0x04, 0xd3, 0xff, 0xeb, 0x06, 0xa7, 0xff, 0xeb, 0x04, 0xd3, 0xff, 0xeb, 0x06, 0x2b, 0xff, 0xeb, 0x05, 0x2f, 0xff, 0xeb, 0x06, 0xf7, 0xff, 0xeb, 0x04, 0x8e, 0xff, 0xeb, 0x04, 0x8e, 0xff, 0xeb, 0x05, 0xca, 0xff, 0xeb, 0x05, 0xca, 0xff, 0xeb, 0x05, 0x30, 0xff, 0xeb, 0x06, 0xf6, 0xff, 0xeb, 0x06, 0xb0, 0xff, 0xeb, 0x05, 0x4c, 0xff, 0xeb, 0x07, 0x13, 0xff, 0xeb, 0x04, 0xf2, 0xff, 0xeb, 0x04, 0x98, 0xff, 0xeb, 0x05, 0x3d, 0xff, 0xeb, 0x06, 0x98, 0xff, 0xeb, 0x09, 0x10, 0xff, 0xeb, 0x06, 0xf5, 0xff, 0xeb, 0x04, 0x39, 0xff, 0xeb, 0x03, 0xfb, 0xff, 0xeb, 0x04, 0x16, 0xff, 0xeb, 0x04, 0x1f, 0xff, 0xeb, 0x05, 0xcc, 0xff, 0xeb, 0x04, 0x9e, 0xff, 0xeb, 0x04, 0x13, 0xff, 0xeb, 0x05, 0x50, 0xff, 0xeb, 0x04, 0x91, 0xff, 0xeb, 0x04, 0x61, 0xff, 0xeb, 0x04, 0xf5, 0xff, 0xeb, 0x04, 0x09, 0xff, 0xeb, 0x04, 0xa1, 0xff, 0xeb, 0x06, 0x23, 0xff, 0xeb, 0x06, 0x23, 0xff, 0xeb, 0x05, 0x68, 0xff, 0xeb, 0x05, 0x9d, 0xff, 0xeb, 0x05, 0x9d, 0xff, 0xeb, 0x06, 0x06, 0xff, 0xeb, 0x05, 0x59, 0xff, 0xeb, 0x06, 0x95, 0xff, 0xeb, 0x06, 0x95, 0xff, 0xeb, 0x05, 0xbe, 0xff, 0xeb, 0x06, 0x5e, 0xff, 0xeb, 0x06, 0x10, 0xff, 0xeb, 0x06, 0x06, 0xff, 0xeb, 0x04, 0xde, 0xff, 0xeb, 0x04, 0xe3, 0xff, 0xeb, 0x06, 0xa5, 0xff, 0xeb, 0x05, 0x37, 0xff, 0xeb, 0x04, 0x5b, 0xff, 0xeb, 0x04, 0x04, 0xff, 0xeb, 0x04, 0x5c, 0xff, 0xeb, 0x05, 0xf4, 0xff, 0xeb, 0x04, 0xcf, 0xff, 0xeb, 0x04, 0x51, 0xff, 0xeb, 0x04, 0xd9, 0xff, 0xeb, 0x04, 0xee, 0xff, 0xeb, 0x04, 0x7b, 0xff, 0xeb, 0x05, 0x1f, 0xff, 0xeb, 0x07, 0x0a, 0xff, 0xeb, 0x04, 0x3f, 0xff, 0xeb, 0x04, 0xd9, 0xff, 0xeb, 0x04, 0xcf, 0xff, 0xeb, 0x05, 0x41, 0x00, 0x3f, 0x04, 0xf3, 0x00, 0x3f, 0x04, 0xf3, 0x00, 0x3f, 0x05, 0xa0, 0x00, 0x3f, 0x04, 0xad, 0x00, 0x3f, 0x04, 0xbd, 0xff, 0xeb, 0x04, 0x6d, 0xff, 0xeb, 0x05, 0x33, 0xff, 0xeb, 0x04, 0xa8, 0xff, 0xeb, 0x04, 0xa8, 0xff, 0xeb, 0x04, 0xbd, 0xff, 0xeb, 0x06, 0x97, 0xff, 0xeb, 0x04, 0xbc, 0xff, 0xeb, 0x05, 0x44, 0xff, 0xeb, 0x06, 0xf6, 0xff, 0xeb, 0x05, 0x5a, 0xff, 0xeb, 0x06, 0xb2, 0xff, 0xeb, 0x05, 0x48, 0xff, 0xeb, 0x04, 0xfb, 0xff, 0xeb, 0x05, 0x97, 0xff, 0xeb, 0x04, 0xab, 0xff, 0xeb, 0x05, 0x4f, 0xff, 0xeb, 0x05, 0x43, 0xff, 0xeb, 0x04, 0x41, 0xff, 0xeb, 0x04, 0xe7, 0xff, 0xeb, 0x04, 0xb5, 0xff, 0xeb, 0x03, 0xc9, 0xff, 0xeb, 0x03, 0x1c, 0xff, 0xeb, 0x06, 0x65, 0xff, 0xeb, 0x08, 0x48, 0xff, 0xeb, 0x06, 0x3c, 0xff, 0xeb, 0x05, 0xab, 0xff, 0xeb, 0x05, 0xdc, 0xff, 0xeb, 0x05, 0xdc, 0xff, 0xeb, 0x05, 0x1c, 0xff, 0xeb, 0x05, 0x2c, 0xff, 0xeb, 0x04, 0xae, 0xff, 0xeb, 0x05, 0x09, 0xff, 0xeb, 0x05, 0x4e, 0xff, 0xeb, 0x05, 0x96, 0xff, 0xeb, 0x07, 0x69, 0xff, 0xeb, 0x04, 0xf4, 0xff, 0xeb, 0x04, 0xf3, 0xff, 0xeb, 0x05, 0x0e, 0xff, 0xeb, 0x06, 0x4c, 0xff, 0xeb, 0x05, 0x43, 0xff, 0xeb, 0x05, 0xcf, 0xff, 0xeb, 0x05, 0xd9, 0xff, 0xeb, 0x05, 0x79, 0xff, 0xeb, 0x06, 0x0c, 0xff, 0xeb, 0x08, 0x0e, 0xff, 0xeb, 0x05, 0x31, 0xff, 0xeb, 0x07, 0x10, 0xff, 0xeb, 0x05, 0xc3, 0xff, 0xeb, 0x04, 0xa2, 0xff, 0xeb, 0x04, 0xb9, 0xff, 0xeb, 0x04, 0x73, 0xff, 0xeb, 0x05, 0x19, 0xff, 0xeb, 0x04, 0x28, 0xff, 0xeb, 0x03, 0x99, 0xff, 0xeb, 0x05, 0xea, 0x00, 0x4b, 0x05, 0xea, 0x00, 0x4b, 0x03, 0x39, 0x00, 0x1d, 0x05, 0x71, 0x00, 0x4b, 0x04, 0xac, 0x00, 0x4b, 0x04, 0xde, 0x00, 0x4b, 0x05, 0x23, 0x00, 0x1d, 0x05, 0x58, 0x00, 0x4b, 0x05, 0x0a, 0x00, 0x4b, 0x05, 0xa7, 0x00, 0x4b, 0x03, 0x39, 0x00, 0x1d, 0x05, 0x5c, 0x00, 0x4b, 0x05, 0x50, 0xff, 0xeb, 0x05, 0x50, 0xff, 0xeb, 0x04, 0x03, 0xff, 0xeb, 0x06, 0x86, 0xff, 0xeb, 0x04, 0x03, 0xff, 0xeb, 0x04, 0x04, 0xff, 0xeb, 0x04, 0x1e, 0xff, 0xeb, 0x06, 0x91, 0xff, 0xeb, 0x04, 0x1e, 0xff, 0xeb, 0x04, 0xd5, 0xff, 0xeb, 0x06, 0x70, 0xff, 0xeb, 0x04, 0x09, 0xff, 0xeb, 0x04, 0x09, 0xff, 0xeb, 0x05, 0x45, 0xff, 0xeb, 0x04, 0xb2, 0xff, 0xeb, 0x06, 0x75, 0xff, 0xeb, 0x04, 0x67, 0xff, 0xeb, 0x04, 0x16, 0xff, 0xeb, 0x04, 0x14, 0xff, 0xeb, 0x05, 0xd9, 0xff, 0xeb, 0x05, 0xd9, 0xff, 0xeb, 0x07, 0x74, 0xff, 0xeb, 0x05, 0xb2, 0xff, 0xeb, 0x05, 0x5f, 0xff, 0xeb, 0x04, 0x92, 0xff, 0xeb, 0x04, 0xc9, 0xff, 0xeb, 0x06, 0x76, 0xff, 0xeb, 0x04, 0xae, 0xff, 0xeb, 0x06, 0x2b, 0xff, 0xeb, 0x05, 0x0c, 0xff, 0xeb, 0x06, 0xdf, 0xff, 0xeb, 0x04, 0x6b, 0xff, 0xeb, 0x05, 0x34, 0xff, 0xeb, 0x04, 0x9f, 0xff, 0xeb, 0x04, 0x9f, 0xff, 0xeb, 0x05, 0xed, 0xff, 0xeb, 0x04, 0xb7, 0xff, 0xeb, 0x05, 0x45, 0xff, 0xeb, 0x07, 0x0e, 0xff, 0xeb, 0x04, 0xf1, 0xff, 0xeb, 0x05, 0x91, 0xff, 0xeb, 0x04, 0x9f, 0xff, 0xeb, 0x05, 0x37, 0xff, 0xeb, 0x02, 0xb3, 0xff, 0xeb, 0x05, 0x09, 0xff, 0xeb, 0x05, 0x17, 0xff, 0xeb, 0x03, 0x7d, 0xff, 0xeb, 0x02, 0xc1, 0xff, 0xeb, 0x02, 0x8e, 0xff, 0xeb, 0x05, 0xc1, 0xff, 0xeb, 0x01, 0x35, 0xfd, 0xe1, 0x00, 0x00, 0xff, 0x2a, 0x00, 0x00, 0x00, 0x33, 0x00, 0x00, 0xff, 0xa6, 0x00, 0x00, 0xff, 0xa6, 0x02, 0x43, 0xff, 0xe5, 0x01, 0x35, 0xff, 0x25, 0x01, 0x35, 0xff, 0x25, 0x01, 0x35, 0xff, 0x25, 0x01, 0x35, 0xfd, 0xe1, 0x01, 0x35, 0xfd, 0xe1, 0x01, 0x35, 0xfd, 0xe1, 0x00, 0x00, 0xfe, 0x2b, 0x00, 0x00, 0xfe, 0x2b, 0x00, 0x00, 0xfe, 0x2b, 0x00, 0x00, 0xfe, 0x21, 0x00, 0x00, 0xfe, 0x21, 0x00, 0x00, 0xfe, 0x21, 0x01, 0x35, 0xff, 0x61, 0x01, 0x35, 0xff, 0x61, 0x01, 0x35, 0xff, 0x61, 0x01, 0x35, 0xff, 0x53, 0x01, 0x35, 0xff, 0x53, 0x01, 0x35, 0xff, 0x53, 0x00, 0x00, 0xfe, 0x84, 0x01, 0x35, 0xff, 0xba, 0x03, 0x3a, 0xff, 0xeb, 0x02, 0xfa, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x02, 0x4a, 0xff, 0xeb, 0x02, 0x53, 0xff, 0xeb, 0x03, 0x48, 0x00, 0x1d, 0x02, 0xa1, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x35, 0xff, 0xeb, 0x01, 0x62, 0x00, 0x5b, 0x01, 0x6c, 0x00, 0x25, 0x03, 0x77, 0x00, 0x1a, 0x02, 0x8e, 0x00, 0x35, 0x03, 0x3d, 0x00, 0x25, 0x03, 0x0a, 0x00, 0x23, 0x00, 0xc3, 0x00, 0x25, 0x01, 0xe5, 0x00, 0x6b, 0x01, 0xe5, 0x00, 0x12, 0x02, 0x06, 0x00, 0x44, 0x02, 0xa2, 0x00, 0x52, 0x00, 0xfe, 0x00, 0x0f, 0x02, 0x47, 0x00, 0x47, 0x01, 0x04, 0x00, 0x2c, 0x01, 0xe6, 0x00, 0x25, 0x02, 0x86, 0x00, 0x35, 0x01, 0x6a, 0x00, 0x24, 0x02, 0x3e, 0x00, 0x2c, 0x02, 0x57, 0x00, 0x2d, 0x02, 0x95, 0x00, 0x2f, 0x02, 0x84, 0x00, 0x4f, 0x02, 0x80, 0x00, 0x45, 0x02, 0x24, 0x00, 0x23, 0x02, 0x83, 0x00, 0x3a, 0x02, 0x72, 0x00, 0x41, 0x01, 0x07, 0x00, 0x2c, 0x01, 0x44, 0x00, 0x29, 0x02, 0x48, 0x00, 0x4f, 0x02, 0xe2, 0x00, 0x60, 0x02, 0x37, 0x00, 0x59, 0x02, 0x1a, 0x00, 0x22, 0x04, 0x1b, 0x00, 0x47, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0x83, 0x00, 0x45, 0x03, 0x00, 0x00, 0x23, 0x02, 0xcd, 0x00, 0x45, 0x02, 0x14, 0x00, 0x45, 0x02, 0x12, 0x00, 0x45, 0x03, 0x00, 0x00, 0x23, 0x02, 0xcd, 0x00, 0x45, 0x01, 0x16, 0x00, 0x45, 0x02, 0x3a, 0x00, 0x24, 0x02, 0x97, 0x00, 0x45, 0x01, 0xcb, 0x00, 0x45, 0x03, 0x83, 0x00, 0x45, 0x02, 0xdf, 0x00, 0x45, 0x03, 0x11, 0x00, 0x23, 0x02, 0x60, 0x00, 0x45, 0x03, 0x13, 0x00, 0x23, 0x02, 0x81, 0x00, 0x45, 0x02, 0x61, 0x00, 0x33, 0x02, 0x41, 0x00, 0x20, 0x02, 0xb9, 0x00, 0x43, 0x02, 0xc7, 0x00, 0x0e, 0x04, 0x00, 0x00, 0x16, 0x02, 0xae, 0x00, 0x26, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x40, 0x00, 0x32, 0x01, 0xf1, 0x00, 0x87, 0x02, 0xf4, 0x00, 0xad, 0x01, 0xf0, 0x00, 0x6e, 0x02, 0xa8, 0x00, 0x21, 0x03, 0x16, 0x00, 0x6b, 0x01, 0x0f, 0x00, 0x0a, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x45, 0x02, 0x5a, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x02, 0x69, 0x00, 0x21, 0x01, 0x59, 0x00, 0x15, 0x02, 0xa6, 0x00, 0x21, 0x02, 0x95, 0x00, 0x45, 0x01, 0x16, 0x00, 0x36, 0x01, 0x16, 0xff, 0xe3, 0x02, 0x48, 0x00, 0x45, 0x01, 0x16, 0x00, 0x45, 0x04, 0x18, 0x00, 0x45, 0x02, 0x95, 0x00, 0x45, 0x02, 0x7e, 0x00, 0x22, 0x02, 0xa6, 0x00, 0x45, 0x02, 0xa6, 0x00, 0x21, 0x01, 0x94, 0x00, 0x45, 0x02, 0x21, 0x00, 0x27, 0x01, 0x84, 0x00, 0x19, 0x02, 0x95, 0x00, 0x40, 0x02, 0x57, 0x00, 0x0a, 0x03, 0x4c, 0x00, 0x07, 0x02, 0x1c, 0x00, 0x08, 0x02, 0x5d, 0x00, 0x05, 0x01, 0xe3, 0x00, 0x26, 0x01, 0xfc, 0x00, 0x6e, 0x01, 0x35, 0x00, 0x54, 0x01, 0xfc, 0x00, 0x51, 0x02, 0x50, 0x00, 0x20, 0x00, 0xee, 0x00, 0x00, 0x01, 0x62, 0x00, 0x5b, 0x02, 0x97, 0x00, 0x37, 0x02, 0x8e, 0x00, 0x27, 0x02, 0x31, 0x00, 0x3c, 0x02, 0x7c, 0x00, 0x0b, 0x01, 0x5e, 0x00, 0x69, 0x02, 0x46, 0x00, 0x24, 0x01, 0x52, 0x00, 0x0a, 0x03, 0x11, 0x00, 0x2a, 0x01, 0xce, 0x00, 0x1c, 0x02, 0x09, 0x00, 0x2d, 0x02, 0xa9, 0x00, 0x29, 0x02, 0x47, 0x00, 0x47, 0x02, 0x04, 0x00, 0x2d, 0x01, 0x92, 0x00, 0x0a, 0x01, 0xbc, 0x00, 0x1b, 0x02, 0xa4, 0x00, 0x53, 0x01, 0x68, 0x00, 0x1e, 0x01, 0x65, 0x00, 0x11, 0x00, 0xfa, 0x00, 0x0a, 0x02, 0xa6, 0x00, 0x4b, 0x02, 0x9a, 0x00, 0x20, 0x01, 0x0e, 0x00, 0x33, 0x01, 0x27, 0x00, 0x0a, 0x00, 0xe4, 0x00, 0x14, 0x01, 0xc2, 0x00, 0x1c, 0x02, 0x09, 0x00, 0x32, 0x02, 0xda, 0x00, 0x25, 0x02, 0xf5, 0x00, 0x25, 0x03, 0x2b, 0x00, 0x29, 0x02, 0x1a, 0x00, 0x2b, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xcc, 0x00, 0x1a, 0x03, 0xa9, 0x00, 0x09, 0x03, 0x00, 0x00, 0x23, 0x02, 0x14, 0x00, 0x45, 0x02, 0x14, 0x00, 0x45, 0x02, 0x14, 0x00, 0x45, 0x02, 0x14, 0x00, 0x45, 0x01, 0x16, 0x00, 0x12, 0x01, 0x16, 0x00, 0x12, 0x01, 0x16, 0xff, 0xf7, 0x01, 0x16, 0xff, 0xec, 0x02, 0xd6, 0x00, 0x07, 0x02, 0xdf, 0x00, 0x45, 0x03, 0x11, 0x00, 0x23, 0x03, 0x11, 0x00, 0x23, 0x03, 0x11, 0x00, 0x23, 0x03, 0x11, 0x00, 0x23, 0x03, 0x11, 0x00, 0x23, 0x02, 0x9e, 0x00, 0x62, 0x03, 0x11, 0x00, 0x18, 0x02, 0xb9, 0x00, 0x43, 0x02, 0xb9, 0x00, 0x43, 0x02, 0xb9, 0x00, 0x43, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x60, 0x00, 0x45, 0x02, 0xd7, 0x00, 0x34, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xa6, 0x00, 0x21, 0x04, 0x35, 0x00, 0x21, 0x02, 0x5a, 0x00, 0x21, 0x02, 0x69, 0x00, 0x21, 0x02, 0x69, 0x00, 0x21, 0x02, 0x69, 0x00, 0x21, 0x02, 0x69, 0x00, 0x21, 0x01, 0x22, 0x00, 0x18, 0x01, 0x22, 0x00, 0x18, 0x01, 0x22, 0xff, 0xfd, 0x01, 0x22, 0xff, 0xf2, 0x02, 0x7e, 0x00, 0x21, 0x02, 0x95, 0x00, 0x45, 0x02, 0x7e, 0x00, 0x22, 0x02, 0x7e, 0x00, 0x22, 0x02, 0x7e, 0x00, 0x22, 0x02, 0x7e, 0x00, 0x22, 0x02, 0x7e, 0x00, 0x22, 0x02, 0x88, 0x00, 0x49, 0x02, 0x7a, 0x00, 0x15, 0x02, 0x95, 0x00, 0x40, 0x02, 0x95, 0x00, 0x40, 0x02, 0x95, 0x00, 0x40, 0x02, 0x95, 0x00, 0x40, 0x02, 0x5d, 0x00, 0x05, 0x02, 0xa6, 0x00, 0x45, 0x02, 0x5d, 0x00, 0x05, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xa6, 0x00, 0x21, 0x02, 0xcc, 0x00, 0x1a, 0x02, 0xa6, 0x00, 0x21, 0x03, 0x00, 0x00, 0x23, 0x02, 0x5a, 0x00, 0x21, 0x03, 0x00, 0x00, 0x23, 0x02, 0x5a, 0x00, 0x21, 0x03, 0x00, 0x00, 0x23, 0x02, 0x5a, 0x00, 0x21, 0x02, 0xcd, 0x00, 0x45, 0x03, 0x26, 0x00, 0x21, 0x02, 0xd6, 0x00, 0x07, 0x02, 0xac, 0x00, 0x21, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x03, 0x00, 0x00, 0x23, 0x02, 0xa6, 0x00, 0x21, 0x03, 0x00, 0x00, 0x23, 0x02, 0xa6, 0x00, 0x21, 0x03, 0x01, 0x00, 0x23, 0x02, 0xa6, 0x00, 0x21, 0x01, 0x16, 0xff, 0xd7, 0x01, 0x22, 0xff, 0xde, 0x01, 0x16, 0xff, 0xcd, 0x01, 0x22, 0xff, 0xd3, 0x01, 0x16, 0xff, 0xec, 0x01, 0x22, 0xff, 0xf2, 0x01, 0x16, 0xff, 0xf8, 0x01, 0x16, 0xff, 0xf8, 0x01, 0x16, 0x00, 0x45, 0x01, 0x22, 0x00, 0x4b, 0x02, 0xa1, 0x00, 0x45, 0x02, 0x48, 0x00, 0x45, 0x01, 0xcb, 0x00, 0x45, 0x01, 0x16, 0x00, 0x12, 0x01, 0xcc, 0x00, 0x45, 0x01, 0x16, 0x00, 0x45, 0x01, 0xeb, 0x00, 0x45, 0x01, 0xc1, 0x00, 0x45, 0x01, 0xcb, 0x00, 0x45, 0x01, 0x59, 0x00, 0x45, 0x01, 0xcf, 0x00, 0x09, 0x01, 0x22, 0x00, 0x09, 0x02, 0xdf, 0x00, 0x45, 0x02, 0x95, 0x00, 0x45, 0x02, 0xeb, 0x00, 0x45, 0x02, 0x95, 0x00, 0x45, 0x02, 0xdf, 0x00, 0x45, 0x02, 0x95, 0x00, 0x45, 0x03, 0x11, 0x00, 0x23, 0x02, 0x7e, 0x00, 0x22, 0x03, 0x11, 0x00, 0x23, 0x02, 0x7e, 0x00, 0x22, 0x03, 0x11, 0x00, 0x23, 0x02, 0x7e, 0x00, 0x22, 0x04, 0x30, 0x00, 0x23, 0x04, 0x1c, 0x00, 0x21, 0x02, 0x81, 0x00, 0x45, 0x01, 0x94, 0x00, 0x45, 0x02, 0x89, 0x00, 0x45, 0x01, 0x94, 0x00, 0x45, 0x02, 0x81, 0x00, 0x45, 0x01, 0x94, 0x00, 0x45, 0x02, 0x61, 0x00, 0x33, 0x02, 0x21, 0x00, 0x27, 0x02, 0x61, 0x00, 0x33, 0x02, 0x21, 0x00, 0x27, 0x02, 0x61, 0x00, 0x33, 0x02, 0x21, 0x00, 0x27, 0x02, 0x41, 0x00, 0x20, 0x01, 0x84, 0x00, 0x19, 0x02, 0x41, 0x00, 0x20, 0x01, 0x87, 0x00, 0x19, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x02, 0xb9, 0x00, 0x43, 0x02, 0x95, 0x00, 0x40, 0x04, 0x00, 0x00, 0x16, 0x03, 0x4c, 0x00, 0x07, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x5d, 0x00, 0x05, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x40, 0x00, 0x32, 0x01, 0xe3, 0x00, 0x26, 0x02, 0x40, 0x00, 0x32, 0x01, 0xe3, 0x00, 0x26, 0x02, 0x40, 0x00, 0x32, 0x01, 0xe3, 0x00, 0x26, 0x03, 0x0d, 0x00, 0x36, 0x01, 0x4e, 0xff, 0xc5, 0x03, 0xa9, 0x00, 0x09, 0x04, 0x38, 0x00, 0x21, 0x02, 0x70, 0x00, 0x33, 0x02, 0x21, 0x00, 0x27, 0x02, 0x41, 0x00, 0x20, 0x01, 0x84, 0x00, 0x19, 0x02, 0x69, 0x00, 0x21, 0x01, 0x13, 0x00, 0x28, 0x01, 0x3d, 0x00, 0x0a, 0x01, 0x3d, 0x00, 0x0a, 0x01, 0x92, 0x00, 0x0a, 0x01, 0x53, 0x00, 0x0a, 0x00, 0x99, 0x00, 0x0a, 0x00, 0xf9, 0x00, 0x08, 0x00, 0xfb, 0x00, 0x0c, 0x01, 0x7d, 0x00, 0x08, 0x01, 0x91, 0x00, 0x0a, 0x02, 0xc2, 0x00, 0x1a, 0x04, 0x00, 0x00, 0x16, 0x03, 0x4c, 0x00, 0x07, 0x04, 0x00, 0x00, 0x16, 0x03, 0x4c, 0x00, 0x07, 0x04, 0x00, 0x00, 0x16, 0x03, 0x4c, 0x00, 0x07, 0x02, 0x14, 0x00, 0x45, 0x02, 0x69, 0x00, 0x21, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x5d, 0x00, 0x05, 0x02, 0x7c, 0x00, 0x0b, 0x02, 0x5d, 0x00, 0x05, 0x02, 0xbe, 0x00, 0x4f, 0x03, 0x9f, 0x00, 0x4f, 0x01, 0x13, 0x00, 0x1f, 0x01, 0x13, 0x00, 0x28, 0x00, 0xfb, 0x00, 0x0e, 0x01, 0xdd, 0x00, 0x1f, 0x01, 0xdd, 0x00, 0x28, 0x01, 0xc6, 0x00, 0x0f, 0x02, 0x69, 0x00, 0x31, 0x02, 0x69, 0x00, 0x32, 0x01, 0xe0, 0x00, 0x64, 0x02, 0xb7, 0x00, 0x2c, 0x04, 0x5c, 0x00, 0x24, 0x01, 0x3c, 0x00, 0x2d, 0x01, 0x3c, 0x00, 0x32, 0x02, 0x43, 0x00, 0x20, 0x03, 0x1f, 0x00, 0x17, 0x03, 0x4a, 0x00, 0x0b, 0x02, 0x8d, 0x00, 0x16, 0x01, 0x16, 0x00, 0x45, 0x03, 0x4c, 0x00, 0x19, 0x03, 0x12, 0x00, 0x25, 0x02, 0xf1, 0x00, 0x27, 0x02, 0x57, 0x00, 0x24, 0x02, 0xca, 0x00, 0x14, 0x02, 0xe8, 0x00, 0x1a, 0x01, 0xfa, 0x00, 0x28, 0x02, 0x36, 0x00, 0x47, 0x01, 0xe6, 0x00, 0x25, 0x01, 0x0e, 0x00, 0x33, 0x03, 0x6c, 0x00, 0x15, 0x02, 0xe1, 0x00, 0x1c, 0x01, 0x18, 0xff, 0xd2, 0x02, 0x50, 0x00, 0x20, 0x02, 0xd1, 0x00, 0x60, 0x02, 0x17, 0x00, 0x45, 0x02, 0x17, 0x00, 0x45, 0x02, 0x31, 0x00, 0x1a, 0x02, 0x70, 0x00, 0x15, 0x02, 0x6f, 0x00, 0x15, 0x01, 0x47, 0x00, 0x58, 0x00, 0xe1, 0x00, 0x1e, 0x00, 0xf5, 0x00, 0x2f, 0x01, 0x24, 0x00, 0x44, 0x01, 0x0a, 0x00, 0x34, 0x02, 0x1a, 0x00, 0x22, 0x01, 0x47, 0x00, 0x58, 0x01, 0x00, 0x00, 0x34, 0x02, 0x1a, 0x00, 0x2b, 0x02, 0x88, 0x00, 0x49, 0x00, 0xc9, 0x00, 0x22, 0x00, 0xc9, 0x00, 0x22, 0x01, 0x72, 0x00, 0x22, 0x01, 0x72, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x32, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0x67, 0x00, 0x21, 0x02, 0xab, 0x00, 0x21, 0x02, 0x53, 0x00, 0x32, 0x02, 0x63, 0x00, 0x31, 0x02, 0x52, 0x00, 0x31, 0x00, 0x24, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x48, 0x00, 0x7e, 0x00, 0x03, 0x44, 0x46, 0x4c, 0x54, 0x00, 0x30, 0x64, 0x65, 0x76, 0x32, 0x00, 0x22, 0x64, 0x65, 0x76, 0x61, 0x00, 0x14, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x02, 0x00, 0x02, 0x00, 0x05, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x02, 0x00, 0x01, 0x00, 0x04, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x00, 0x06, 0x61, 0x62, 0x76, 0x6d, 0x00, 0x2e, 0x61, 0x62, 0x76, 0x6d, 0x00, 0x2e, 0x61, 0x62, 0x76, 0x6d, 0x00, 0x2e, 0x62, 0x6c, 0x77, 0x6d, 0x00, 0x26, 0x62, 0x6c, 0x77, 0x6d, 0x00, 0x26, 0x62, 0x6c, 0x77, 0x6d, 0x00, 0x26, 0x00, 0x00, 0x00, 0x02, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x04, 0x0d, 0x52, 0x08, 0xd4, 0x03, 0x1e, 0x00, 0x0a, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x03, 0x06, 0x07, 0x76, 0x00, 0x01, 0x03, 0x00, 0x00, 0x0c, 0x00, 0x8f, 0x07, 0x64, 0x02, 0xee, 0x02, 0xe8, 0x02, 0xe2, 0x02, 0xdc, 0x02, 0xee, 0x02, 0xd6, 0x07, 0x3a, 0x07, 0x34, 0x02, 0xd0, 0x02, 0xca, 0x02, 0xc4, 0x07, 0x64, 0x02, 0xbe, 0x02, 0xb8, 0x07, 0x34, 0x07, 0x64, 0x02, 0xb2, 0x02, 0xac, 0x02, 0xa6, 0x02, 0xa0, 0x02, 0x9a, 0x02, 0x94, 0x07, 0x3a, 0x07, 0x34, 0x02, 0x8e, 0x02, 0x88, 0x02, 0x82, 0x06, 0xc2, 0x06, 0xbc, 0x06, 0xb6, 0x06, 0xb6, 0x02, 0x7c, 0x06, 0xa4, 0x06, 0x9e, 0x06, 0x98, 0x06, 0x98, 0x02, 0x76, 0x02, 0x70, 0x02, 0x6a, 0x02, 0x64, 0x02, 0x5e, 0x06, 0x74, 0x02, 0x58, 0x02, 0x52, 0x06, 0x62, 0x06, 0x5c, 0x02, 0x4c, 0x02, 0x46, 0x06, 0x4a, 0x02, 0x40, 0x02, 0x3a, 0x02, 0x34, 0x06, 0x32, 0x02, 0x2e, 0x06, 0x26, 0x02, 0x28, 0x02, 0x22, 0x06, 0x14, 0x02, 0x1c, 0x06, 0x08, 0x02, 0x16, 0x02, 0x10, 0x02, 0x0a, 0x02, 0x04, 0x05, 0xea, 0x05, 0xea, 0x02, 0x70, 0x05, 0xde, 0x01, 0xfe, 0x05, 0xd2, 0x05, 0xd2, 0x05, 0xc6, 0x05, 0xc0, 0x05, 0xc6, 0x05, 0xba, 0x05, 0xba, 0x05, 0xae, 0x05, 0xa8, 0x05, 0xa2, 0x01, 0xf8, 0x01, 0xf2, 0x01, 0xec, 0x05, 0x8a, 0x05, 0x8a, 0x05, 0x7e, 0x05, 0x78, 0x05, 0x78, 0x01, 0xe6, 0x01, 0xe0, 0x01, 0xda, 0x01, 0xd4, 0x05, 0x5a, 0x01, 0xce, 0x01, 0xc8, 0x05, 0x48, 0x05, 0x48, 0x01, 0xc2, 0x05, 0x36, 0x01, 0xbc, 0x01, 0xb6, 0x05, 0x24, 0x01, 0xb0, 0x01, 0xaa, 0x01, 0xa4, 0x05, 0x0c, 0x01, 0x9e, 0x01, 0x98, 0x01, 0x92, 0x01, 0x8c, 0x04, 0xee, 0x04, 0xee, 0x04, 0xe2, 0x01, 0x86, 0x01, 0x80, 0x01, 0x7a, 0x01, 0x74, 0x01, 0x6e, 0x04, 0xbe, 0x04, 0xbe, 0x01, 0x68, 0x01, 0x62, 0x01, 0x5c, 0x01, 0x56, 0x01, 0x68, 0x04, 0x9a, 0x04, 0x9a, 0x01, 0x50, 0x01, 0x4a, 0x04, 0x82, 0x01, 0x44, 0x01, 0x3e, 0x04, 0x70, 0x04, 0x6a, 0x04, 0x6a, 0x01, 0x38, 0x04, 0x58, 0x04, 0x52, 0x01, 0x32, 0x01, 0x2c, 0x04, 0x40, 0x01, 0x26, 0x01, 0x20, 0x00, 0x01, 0x01, 0xa2, 0xff, 0x27, 0x00, 0x01, 0x01, 0xc5, 0xff, 0x28, 0x00, 0x01, 0x01, 0xaf, 0xff, 0x28, 0x00, 0x01, 0x04, 0xc8, 0x00, 0x2c, 0x00, 0x01, 0x03, 0xa1, 0x00, 0x1c, 0x00, 0x01, 0x03, 0x0e, 0xff, 0xbc, 0x00, 0x01, 0x03, 0x0e, 0x00, 0x24, 0x00, 0x01, 0x03, 0x12, 0xff, 0xc4, 0x00, 0x01, 0x03, 0x12, 0x00, 0x1c, 0x00, 0x01, 0x04, 0xdd, 0x00, 0x2c, 0x00, 0x01, 0x03, 0xbc, 0x00, 0x1c, 0x00, 0x01, 0x04, 0x13, 0x00, 0x17, 0x00, 0x01, 0x02, 0xdf, 0xff, 0xf9, 0x00, 0x01, 0x02, 0xc7, 0xff, 0x93, 0x00, 0x01, 0x04, 0x4e, 0x00, 0x2c, 0x00, 0x01, 0x03, 0xd0, 0xff, 0x93, 0x00, 0x01, 0x06, 0x51, 0xff, 0xee, 0x00, 0x01, 0x05, 0x58, 0x00, 0x2c, 0x00, 0x01, 0x04, 0x48, 0xff, 0xfe, 0x00, 0x01, 0x03, 0xef, 0xff, 0xee, 0x00, 0x01, 0x04, 0x26, 0x00, 0x24, 0x00, 0x01, 0x04, 0x2a, 0x00, 0x1c, 0x00, 0x01, 0x02, 0x4a, 0xff, 0x93, 0x00, 0x01, 0x03, 0x6f, 0xff, 0x93, 0x00, 0x01, 0x04, 0xcd, 0x00, 0x2c, 0x00, 0x01, 0x04, 0xd6, 0x00, 0x2c, 0x00, 0x01, 0x04, 0x54, 0x00, 0x2c, 0x00, 0x01, 0x05, 0x93, 0x00, 0x2c, 0x00, 0x01, 0x04, 0x76, 0x00, 0x1c, 0x00, 0x01, 0x04, 0x2b, 0x00, 0x2c, 0x00, 0x01, 0x03, 0x06, 0x00, 0x24, 0x00, 0x01, 0x03, 0x09, 0x00, 0x1c, 0x00, 0x01, 0x03, 0x67, 0xff, 0x93, 0x00, 0x01, 0x05, 0xa6, 0x00, 0x1c, 0x00, 0x01, 0x03, 0x6a, 0xff, 0xee, 0x00, 0x01, 0x03, 0x8e, 0x00, 0x1c, 0x00, 0x01, 0x03, 0xe5, 0x00, 0x17, 0x00, 0x01, 0x04, 0x40, 0x00, 0x2c, 0x00, 0x01, 0x03, 0xe8, 0xff, 0xfe, 0x00, 0x01, 0x03, 0xa7, 0xff, 0xee, 0x00, 0x01, 0x03, 0xc4, 0x00, 0x24, 0x00, 0x01, 0x03, 0xbb, 0x00, 0x1c, 0x00, 0x01, 0x01, 0xad, 0xfe, 0xca, 0x00, 0x01, 0x01, 0x79, 0xfe, 0xc9, 0x00, 0x01, 0x01, 0x79, 0xfe, 0xc1, 0x00, 0x01, 0x01, 0x92, 0xff, 0x14, 0x00, 0x01, 0x01, 0x9b, 0xff, 0x14, 0x00, 0x01, 0x01, 0x9a, 0xff, 0x13, 0x00, 0x01, 0x03, 0xef, 0x00, 0x17, 0x00, 0x01, 0x03, 0x8a, 0xff, 0xee, 0x00, 0x01, 0x03, 0xbd, 0x00, 0x1c, 0x00, 0x01, 0x03, 0x93, 0x00, 0x17, 0x00, 0x01, 0x04, 0xa1, 0x00, 0x2c, 0x00, 0x01, 0x08, 0xf1, 0x00, 0x2c, 0x00, 0x01, 0x06, 0x55, 0xff, 0xee, 0x00, 0x01, 0x06, 0x64, 0x00, 0x1c, 0x00, 0x01, 0x05, 0x91, 0x00, 0x2c, 0x00, 0x01, 0x04, 0xe4, 0x00, 0x00, 0x00, 0x01, 0x04, 0x62, 0x00, 0x1c, 0x00, 0x01, 0x02, 0xf2, 0xff, 0xe5, 0x00, 0x01, 0x01, 0x78, 0xff, 0x77, 0x00, 0x01, 0x02, 0xc4, 0xff, 0x6e, 0x00, 0x01, 0x01, 0xb5, 0xff, 0x9d, 0x00, 0x01, 0x01, 0x79, 0xff, 0x8e, 0x00, 0x01, 0x01, 0x92, 0xff, 0xbf, 0x00, 0x01, 0x01, 0x97, 0xff, 0xc4, 0x00, 0x01, 0x01, 0xd8, 0xff, 0xb7, 0x00, 0x01, 0x01, 0x79, 0xff, 0x8d, 0x00, 0x01, 0x01, 0xb5, 0xff, 0x36, 0x00, 0x01, 0x01, 0x79, 0xff, 0x26, 0x00, 0x01, 0x02, 0xf2, 0x00, 0x45, 0x00, 0x01, 0x01, 0x78, 0xff, 0x93, 0x00, 0x01, 0x02, 0xc4, 0x00, 0x2c, 0x00, 0x01, 0x01, 0xb5, 0xff, 0xfe, 0x00, 0x01, 0x01, 0x92, 0x00, 0x24, 0x00, 0x01, 0x01, 0x97, 0x00, 0x1c, 0x00, 0x01, 0x01, 0xd8, 0x00, 0x17, 0x00, 0x01, 0x01, 0x79, 0xff, 0xee, 0x00, 0x01, 0x00, 0x00, 0x05, 0xb2, 0x00, 0x01, 0x00, 0x01, 0x00, 0x7d, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x05, 0xa4, 0x04, 0x62, 0x00, 0x01, 0x05, 0x84, 0x00, 0x0c, 0x00, 0x8f, 0x04, 0x50, 0x04, 0x4a, 0x04, 0x44, 0x04, 0x3e, 0x04, 0x38, 0x04, 0x32, 0x04, 0x2c, 0x04, 0x26, 0x04, 0x20, 0x04, 0x1a, 0x04, 0x14, 0x04, 0x0e, 0x04, 0x08, 0x04, 0x02, 0x03, 0xfc, 0x03, 0xf6, 0x03, 0xf0, 0x03, 0xea, 0x03, 0xe4, 0x03, 0xde, 0x03, 0xd8, 0x03, 0xd2, 0x03, 0xcc, 0x03, 0xc6, 0x04, 0x20, 0x03, 0xc0, 0x03, 0xba, 0x03, 0xb4, 0x03, 0xae, 0x03, 0xa8, 0x03, 0xa2, 0x03, 0x9c, 0x03, 0x96, 0x03, 0x90, 0x03, 0x8a, 0x03, 0x84, 0x03, 0x84, 0x03, 0x7e, 0x03, 0x78, 0x03, 0x72, 0x03, 0x6c, 0x03, 0x66, 0x03, 0x60, 0x03, 0x5a, 0x03, 0x54, 0x03, 0x4e, 0x03, 0x48, 0x03, 0x42, 0x03, 0x3c, 0x03, 0x36, 0x03, 0x30, 0x03, 0x2a, 0x03, 0x24, 0x03, 0x1e, 0x03, 0x18, 0x03, 0x12, 0x03, 0x0c, 0x03, 0x06, 0x03, 0x00, 0x02, 0xfa, 0x02, 0xf4, 0x02, 0xee, 0x02, 0xe8, 0x02, 0xe2, 0x02, 0xdc, 0x02, 0xd6, 0x02, 0xd0, 0x03, 0x78, 0x02, 0xca, 0x02, 0xc4, 0x02, 0xbe, 0x02, 0xb8, 0x02, 0xb2, 0x02, 0xac, 0x02, 0xb2, 0x02, 0xa6, 0x02, 0xa0, 0x02, 0x9a, 0x02, 0x94, 0x02, 0x8e, 0x02, 0x88, 0x02, 0x82, 0x02, 0x7c, 0x02, 0x76, 0x02, 0x70, 0x02, 0x6a, 0x02, 0x64, 0x02, 0x64, 0x02, 0x5e, 0x02, 0x58, 0x02, 0x52, 0x02, 0x4c, 0x02, 0x46, 0x02, 0x40, 0x02, 0x3a, 0x02, 0x34, 0x02, 0x2e, 0x02, 0x28, 0x02, 0x22, 0x02, 0x1c, 0x02, 0x16, 0x02, 0x10, 0x02, 0x0a, 0x02, 0x04, 0x01, 0xfe, 0x01, 0xf8, 0x01, 0xf2, 0x01, 0xec, 0x01, 0xe6, 0x01, 0xe0, 0x01, 0xda, 0x01, 0xd4, 0x01, 0xce, 0x01, 0xc8, 0x01, 0xc2, 0x01, 0xbc, 0x01, 0xb6, 0x01, 0xb0, 0x01, 0xaa, 0x01, 0xa4, 0x01, 0x9e, 0x01, 0x98, 0x01, 0x92, 0x01, 0x8c, 0x01, 0x9e, 0x01, 0x86, 0x01, 0x80, 0x01, 0x7a, 0x01, 0x74, 0x01, 0x6e, 0x01, 0x68, 0x01, 0x62, 0x01, 0x5c, 0x01, 0x56, 0x01, 0x50, 0x01, 0x4a, 0x01, 0x44, 0x01, 0x3e, 0x01, 0x38, 0x01, 0x32, 0x01, 0x2c, 0x01, 0x26, 0x01, 0x20, 0x00, 0x01, 0x01, 0xac, 0xfe, 0xcc, 0x00, 0x01, 0x01, 0xcf, 0xfe, 0xcc, 0x00, 0x01, 0x03, 0x21, 0xff, 0x67, 0x00, 0x01, 0x01, 0xb9, 0xfe, 0xcc, 0x00, 0x01, 0x04, 0xd2, 0xff, 0xd1, 0x00, 0x01, 0x04, 0x45, 0x00, 0x00, 0x00, 0x01, 0x04, 0x25, 0xff, 0xe5, 0x00, 0x01, 0x03, 0xa9, 0xff, 0xbd, 0x00, 0x01, 0x04, 0x35, 0xff, 0xd8, 0x00, 0x01, 0x04, 0x35, 0x00, 0x00, 0x00, 0x01, 0x03, 0x9e, 0x00, 0x00, 0x00, 0x01, 0x03, 0x17, 0xff, 0x5b, 0x00, 0x01, 0x03, 0x17, 0xff, 0xc5, 0x00, 0x01, 0x03, 0x9f, 0xfe, 0xe9, 0x00, 0x01, 0x03, 0x1b, 0xff, 0x64, 0x00, 0x01, 0x03, 0x1b, 0xff, 0xbd, 0x00, 0x01, 0x03, 0xad, 0xff, 0xd8, 0x00, 0x01, 0x03, 0xad, 0x00, 0x00, 0x00, 0x01, 0x04, 0xe7, 0xff, 0xd1, 0x00, 0x01, 0x03, 0xc5, 0xff, 0xbd, 0x00, 0x01, 0x04, 0x1c, 0xff, 0xb6, 0x00, 0x01, 0x02, 0xdf, 0xff, 0xab, 0x00, 0x01, 0x04, 0x47, 0xff, 0x7b, 0x00, 0x01, 0x04, 0x47, 0x00, 0x00, 0x00, 0x01, 0x02, 0xd2, 0xff, 0x37, 0x00, 0x01, 0x04, 0x58, 0xff, 0xd1, 0x00, 0x01, 0x03, 0xda, 0xff, 0x37, 0x00, 0x01, 0x06, 0x59, 0xff, 0x8e, 0x00, 0x01, 0x05, 0x63, 0xff, 0xd1, 0x00, 0x01, 0x04, 0xa5, 0x00, 0x00, 0x00, 0x01, 0x04, 0xae, 0xff, 0xce, 0x00, 0x01, 0x04, 0xae, 0xff, 0xe5, 0x00, 0x01, 0x04, 0x50, 0xff, 0x9e, 0x00, 0x01, 0x03, 0xf7, 0xff, 0x8e, 0x00, 0x01, 0x04, 0x2e, 0xff, 0xc5, 0x00, 0x01, 0x04, 0x32, 0xff, 0xbd, 0x00, 0x01, 0x04, 0xc2, 0x00, 0x00, 0x00, 0x01, 0x02, 0x54, 0xff, 0x37, 0x00, 0x01, 0x03, 0x79, 0xff, 0x37, 0x00, 0x01, 0x04, 0xd7, 0xff, 0xd1, 0x00, 0x01, 0x04, 0x28, 0xff, 0xe5, 0x00, 0x01, 0x04, 0xe0, 0xff, 0xd1, 0x00, 0x01, 0x04, 0x5e, 0xff, 0xd1, 0x00, 0x01, 0x03, 0xbe, 0xff, 0xe5, 0x00, 0x01, 0x05, 0x9e, 0xff, 0xd1, 0x00, 0x01, 0x04, 0xee, 0xff, 0xcd, 0x00, 0x01, 0x04, 0xee, 0x00, 0x00, 0x00, 0x01, 0x04, 0x7e, 0xff, 0xbd, 0x00, 0x01, 0x04, 0x36, 0xff, 0xd1, 0x00, 0x01, 0x03, 0xa8, 0x00, 0x00, 0x00, 0x01, 0x03, 0x0f, 0xff, 0xc5, 0x00, 0x01, 0x03, 0x12, 0xff, 0xbd, 0x00, 0x01, 0x03, 0x72, 0xff, 0x37, 0x00, 0x01, 0x05, 0xae, 0xff, 0xbd, 0x00, 0x01, 0x04, 0x22, 0x00, 0x00, 0x00, 0x01, 0x03, 0xfe, 0xff, 0x0f, 0x00, 0x01, 0x04, 0x16, 0xff, 0xce, 0x00, 0x01, 0x04, 0x16, 0xff, 0xe5, 0x00, 0x01, 0x03, 0x73, 0xff, 0x8e, 0x00, 0x01, 0x03, 0x97, 0xff, 0xbd, 0x00, 0x01, 0x03, 0xee, 0xff, 0xb6, 0x00, 0x01, 0x04, 0x2d, 0x00, 0x00, 0x00, 0x01, 0x02, 0x0e, 0xff, 0x0f, 0x00, 0x01, 0x02, 0xf2, 0xfe, 0xd5, 0x00, 0x01, 0x02, 0x16, 0xfe, 0xe7, 0x00, 0x01, 0x02, 0x16, 0xff, 0x03, 0x00, 0x01, 0x01, 0xff, 0xff, 0xb4, 0x00, 0x01, 0x03, 0x47, 0xff, 0xe5, 0x00, 0x01, 0x02, 0x47, 0xfe, 0xe9, 0x00, 0x01, 0x02, 0x47, 0xff, 0x17, 0x00, 0x01, 0x04, 0x4a, 0xff, 0xd1, 0x00, 0x01, 0x03, 0x97, 0x00, 0x00, 0x00, 0x01, 0x03, 0xac, 0xff, 0xd8, 0x00, 0x01, 0x03, 0xac, 0x00, 0x00, 0x00, 0x01, 0x03, 0xf1, 0xff, 0x9e, 0x00, 0x01, 0x03, 0xb0, 0xff, 0x8e, 0x00, 0x01, 0x03, 0xcd, 0xff, 0xc5, 0x00, 0x01, 0x03, 0xc4, 0xff, 0xbd, 0x00, 0x01, 0x02, 0x21, 0xfe, 0xc7, 0x00, 0x01, 0x01, 0xb6, 0xfe, 0x6a, 0x00, 0x01, 0x01, 0xf1, 0xfe, 0xc7, 0x00, 0x01, 0x01, 0x81, 0xfe, 0x69, 0x00, 0x01, 0x01, 0x81, 0xfe, 0x61, 0x00, 0x01, 0x02, 0x29, 0xfe, 0xf2, 0x00, 0x01, 0x01, 0x9a, 0xfe, 0xb5, 0x00, 0x01, 0x02, 0x2d, 0xfe, 0xe9, 0x00, 0x01, 0x01, 0xa4, 0xfe, 0xb5, 0x00, 0x01, 0x01, 0xa3, 0xfe, 0xb4, 0x00, 0x01, 0x03, 0xf7, 0xff, 0xb6, 0x00, 0x01, 0x04, 0x47, 0xff, 0xe5, 0x00, 0x01, 0x03, 0x93, 0xff, 0x8e, 0x00, 0x01, 0x03, 0xc6, 0xff, 0xbd, 0x00, 0x01, 0x04, 0x58, 0x00, 0x00, 0x00, 0x01, 0x04, 0x30, 0xfe, 0x99, 0x00, 0x01, 0x03, 0x9b, 0xff, 0xb6, 0x00, 0x01, 0x04, 0xac, 0xff, 0xd1, 0x00, 0x01, 0x03, 0xfb, 0xff, 0xe5, 0x00, 0x01, 0x08, 0xfb, 0xff, 0xd1, 0x00, 0x01, 0x06, 0x5d, 0xff, 0x8e, 0x00, 0x01, 0x06, 0x6c, 0xff, 0xbd, 0x00, 0x01, 0x05, 0x9b, 0xff, 0xd1, 0x00, 0x01, 0x04, 0xe4, 0xff, 0xc6, 0x00, 0x01, 0x04, 0xe3, 0x00, 0x00, 0x00, 0x01, 0x04, 0xec, 0xff, 0xe5, 0x00, 0x01, 0x02, 0x91, 0x00, 0x00, 0x00, 0x01, 0x04, 0x6b, 0xff, 0xbd, 0x00, 0x01, 0x04, 0xfc, 0xff, 0x7b, 0x00, 0x01, 0x04, 0xfc, 0x00, 0x00, 0x00, 0x01, 0x02, 0x7c, 0x00, 0x00, 0x00, 0x01, 0x02, 0x6f, 0x00, 0x00, 0x00, 0x01, 0x02, 0xfc, 0xff, 0x88, 0x00, 0x01, 0x01, 0x82, 0xff, 0x1a, 0x00, 0x01, 0x02, 0xce, 0xff, 0x11, 0x00, 0x01, 0x02, 0x1d, 0xff, 0xce, 0x00, 0x01, 0x01, 0xbd, 0xff, 0x3d, 0x00, 0x01, 0x01, 0x81, 0xff, 0x2e, 0x00, 0x01, 0x01, 0x9a, 0xff, 0x60, 0x00, 0x01, 0x01, 0x9f, 0xff, 0x64, 0x00, 0x01, 0x01, 0xe0, 0xff, 0x57, 0x00, 0x01, 0x01, 0x82, 0xff, 0x2e, 0x00, 0x01, 0x02, 0x2d, 0xff, 0xd8, 0x00, 0x01, 0x02, 0x31, 0xff, 0xc6, 0x00, 0x01, 0x01, 0xbd, 0xfe, 0xd7, 0x00, 0x01, 0x01, 0x81, 0xfe, 0xc6, 0x00, 0x01, 0x02, 0x2d, 0xff, 0x7b, 0x00, 0x01, 0x02, 0xfc, 0xff, 0xe9, 0x00, 0x01, 0x01, 0x82, 0xff, 0x37, 0x00, 0x01, 0x02, 0xce, 0xff, 0xd1, 0x00, 0x01, 0x02, 0x31, 0x00, 0x00, 0x00, 0x01, 0x02, 0x1d, 0xff, 0xe5, 0x00, 0x01, 0x01, 0xbd, 0xff, 0x9e, 0x00, 0x01, 0x01, 0x81, 0xff, 0x8e, 0x00, 0x01, 0x01, 0x9a, 0xff, 0xc5, 0x00, 0x01, 0x01, 0x9f, 0xff, 0xbd, 0x00, 0x01, 0x01, 0xe0, 0xff, 0xb6, 0x00, 0x01, 0x01, 0x82, 0xff, 0x8f, 0x00, 0x01, 0x02, 0x2d, 0x00, 0x00, 0x00, 0x01, 0x00, 0x8f, 0x00, 0x24, 0x00, 0x28, 0x00, 0x2a, 0x00, 0x2e, 0x00, 0x2f, 0x00, 0x30, 0x00, 0x31, 0x00, 0x35, 0x00, 0x39, 0x00, 0x3f, 0x00, 0x44, 0x00, 0x45, 0x00, 0x48, 0x00, 0x4c, 0x00, 0x4d, 0x00, 0x4e, 0x00, 0x95, 0x00, 0x99, 0x00, 0x9b, 0x00, 0x9f, 0x00, 0xa0, 0x00, 0xa1, 0x00, 0xa2, 0x00, 0xa6, 0x00, 0xaa, 0x00, 0xaf, 0x00, 0xb4, 0x00, 0xb5, 0x00, 0xb6, 0x00, 0xba, 0x00, 0xe1, 0x00, 0xe2, 0x00, 0xe6, 0x00, 0xe8, 0x00, 0xee, 0x00, 0xf2, 0x00, 0xf3, 0x00, 0xf4, 0x00, 0xf9, 0x01, 0x02, 0x01, 0x03, 0x01, 0x06, 0x01, 0x18, 0x01, 0x24, 0x01, 0x2b, 0x01, 0x2c, 0x01, 0x32, 0x01, 0x3a, 0x01, 0x3b, 0x01, 0x3d, 0x01, 0x48, 0x01, 0x4b, 0x01, 0x4c, 0x01, 0x4e, 0x01, 0x4f, 0x01, 0x51, 0x01, 0x52, 0x01, 0x53, 0x01, 0x55, 0x01, 0x56, 0x01, 0x58, 0x01, 0x59, 0x01, 0x5a, 0x01, 0x5b, 0x01, 0x5c, 0x01, 0x61, 0x01, 0x63, 0x01, 0x70, 0x01, 0x71, 0x01, 0x76, 0x01, 0x7f, 0x01, 0x80, 0x01, 0x81, 0x01, 0x82, 0x01, 0x83, 0x01, 0x85, 0x01, 0x86, 0x01, 0x88, 0x01, 0x8a, 0x01, 0x90, 0x01, 0x93, 0x01, 0x94, 0x01, 0x95, 0x01, 0x9d, 0x01, 0x9e, 0x01, 0x9f, 0x01, 0xa8, 0x01, 0xa9, 0x01, 0xb2, 0x01, 0xb5, 0x01, 0xb6, 0x01, 0xb7, 0x01, 0xbc, 0x01, 0xbf, 0x01, 0xc4, 0x01, 0xc9, 0x01, 0xca, 0x01, 0xcc, 0x01, 0xd4, 0x01, 0xdc, 0x01, 0xe4, 0x01, 0xe7, 0x01, 0xf4, 0x01, 0xf8, 0x01, 0xfc, 0x01, 0xfd, 0x02, 0x03, 0x02, 0x04, 0x02, 0x05, 0x02, 0x06, 0x02, 0x0a, 0x02, 0x0b, 0x02, 0x0d, 0x02, 0x12, 0x02, 0x15, 0x02, 0x17, 0x02, 0x1a, 0x02, 0x1c, 0x02, 0x1d, 0x02, 0x1e, 0x02, 0x1f, 0x02, 0x20, 0x02, 0x21, 0x02, 0x26, 0x02, 0x27, 0x02, 0x29, 0x02, 0x2a, 0x02, 0x2b, 0x02, 0x2d, 0x02, 0x2e, 0x02, 0x2f, 0x02, 0x31, 0x02, 0x36, 0x02, 0x3c, 0x02, 0x3d, 0x02, 0x41, 0x02, 0x48, 0x02, 0x4c, 0x02, 0x51, 0x02, 0x54, 0x02, 0x57, 0x02, 0x58, 0x02, 0x59, 0x00, 0x06, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x01, 0xff, 0xa6, 0x00, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x18, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x04, 0x6c, 0x04, 0x30, 0x00, 0x01, 0x04, 0x58, 0x00, 0x0c, 0x01, 0xc9, 0x04, 0x1e, 0x04, 0x18, 0x04, 0x12, 0x04, 0x0c, 0x04, 0x06, 0x04, 0x0c, 0x04, 0x0c, 0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04, 0x06, 0x04, 0x06, 0x04, 0x06, 0x04, 0x06, 0x03, 0xfa, 0x04, 0x0c, 0x04, 0x12, 0x03, 0xf4, 0x04, 0x0c, 0x04, 0x12, 0x04, 0x1e, 0x04, 0x1e, 0x04, 0x1e, 0x04, 0x00, 0x04, 0x00, 0x04, 0x0c, 0x04, 0x06, 0x04, 0x12, 0x04, 0x1e, 0x04, 0x00, 0x04, 0x1e, 0x04, 0x00, 0x04, 0x06, 0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04, 0x1e, 0x04, 0x18, 0x04, 0x12, 0x04, 0x00, 0x04, 0x06, 0x04, 0x06, 0x04, 0x1e, 0x04, 0x06, 0x04, 0x1e, 0x04, 0x18, 0x04, 0x12, 0x04, 0x0c, 0x04, 0x06, 0x04, 0x0c, 0x04, 0x0c, 0x04, 0x00, 0x04, 0x18, 0x04, 0x00, 0x04, 0x06, 0x04, 0x06, 0x04, 0x06, 0x04, 0x06, 0x03, 0xfa, 0x04, 0x0c, 0x04, 0x12, 0x03, 0xf4, 0x04, 0x0c, 0x04, 0x00, 0x04, 0x1e, 0x04, 0x1e, 0x04, 0x1e, 0x04, 0x00, 0x04, 0x00, 0x04, 0x0c, 0x04, 0x12, 0x04, 0x1e, 0x04, 0x00, 0x04, 0x1e, 0x03, 0xfa, 0x04, 0x06, 0x04, 0x00, 0x04, 0x0c, 0x04, 0x18, 0x04, 0x12, 0x04, 0x00, 0x04, 0x0c, 0x03, 0xee, 0x03, 0xee, 0x03, 0xe8, 0x03, 0xee, 0x03, 0xe2, 0x03, 0xdc, 0x03, 0xe2, 0x04, 0x0c, 0x03, 0xd6, 0x03, 0xd0, 0x03, 0xca, 0x03, 0xc4, 0x03, 0xbe, 0x03, 0xee, 0x03, 0xbe, 0x03, 0xee, 0x03, 0xee, 0x03, 0xee, 0x03, 0xee, 0x03, 0xee, 0x03, 0xd6, 0x03, 0xe2, 0x03, 0xe2, 0x03, 0xca, 0x03, 0xbe, 0x03, 0xd6, 0x03, 0xd0, 0x03, 0xe2, 0x03, 0xd6, 0x03, 0xd0, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xbe, 0x03, 0xc4, 0x03, 0xc4, 0x03, 0xd0, 0x03, 0xd0, 0x03, 0xb2, 0x03, 0xee, 0x03, 0xee, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xd6, 0x03, 0xd6, 0x03, 0xee, 0x03, 0xee, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xdc, 0x03, 0xac, 0x03, 0xee, 0x03, 0xee, 0x03, 0xa6, 0x03, 0xac, 0x03, 0xe8, 0x03, 0xb2, 0x03, 0xdc, 0x03, 0xa0, 0x03, 0xac, 0x03, 0xdc, 0x03, 0xa0, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xb8, 0x03, 0xdc, 0x03, 0xac, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xb8, 0x03, 0xac, 0x03, 0x9a, 0x03, 0xac, 0x03, 0xac, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xee, 0x03, 0xb8, 0x03, 0xd6, 0x03, 0xd6, 0x03, 0xee, 0x03, 0xd0, 0x03, 0xc4, 0x03, 0xd6, 0x03, 0xee, 0x03, 0x9a, 0x03, 0xa6, 0x03, 0xdc, 0x03, 0xac, 0x03, 0xd6, 0x03, 0xb8, 0x03, 0xd6, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xd6, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xd6, 0x03, 0xd6, 0x04, 0x06, 0x04, 0x06, 0x03, 0xdc, 0x04, 0x06, 0x04, 0x06, 0x03, 0xdc, 0x04, 0x06, 0x04, 0x06, 0x04, 0x06, 0x03, 0xac, 0x04, 0x06, 0x04, 0x06, 0x03, 0xdc, 0x04, 0x06, 0x03, 0x9a, 0x03, 0xa6, 0x03, 0x9a, 0x03, 0xac, 0x03, 0xca, 0x03, 0xd6, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0x94, 0x03, 0xd0, 0x03, 0x94, 0x03, 0xc4, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xee, 0x04, 0x0c, 0x03, 0xac, 0x03, 0x9a, 0x03, 0xac, 0x03, 0xac, 0x03, 0xb2, 0x03, 0x94, 0x03, 0x94, 0x03, 0xbe, 0x03, 0x94, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0x9a, 0x03, 0xac, 0x03, 0xac, 0x03, 0xa6, 0x03, 0xb8, 0x03, 0xa0, 0x03, 0xe8, 0x03, 0xe2, 0x03, 0xdc, 0x03, 0xb8, 0x03, 0xac, 0x04, 0x1e, 0x04, 0x1e, 0x03, 0xfa, 0x04, 0x06, 0x03, 0xfa, 0x03, 0xd6, 0x03, 0xf4, 0x03, 0xf4, 0x03, 0xd6, 0x04, 0x00, 0x04, 0x0c, 0x03, 0xf4, 0x03, 0xdc, 0x03, 0xa0, 0x03, 0xdc, 0x03, 0xac, 0x03, 0x9a, 0x03, 0xac, 0x03, 0xd0, 0x03, 0xac, 0x03, 0xdc, 0x03, 0xa6, 0x03, 0xa6, 0x03, 0xb8, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa0, 0x03, 0xdc, 0x03, 0xc4, 0x03, 0xe8, 0x03, 0x9a, 0x03, 0x9a, 0x03, 0x9a, 0x03, 0xb8, 0x03, 0xa0, 0x03, 0xb8, 0x03, 0xe2, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xac, 0x03, 0xac, 0x03, 0xac, 0x03, 0xac, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xa0, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xdc, 0x03, 0xac, 0x03, 0xee, 0x03, 0xb2, 0x03, 0xc4, 0x03, 0xa6, 0x04, 0x18, 0x04, 0x00, 0x03, 0xa6, 0x03, 0xbe, 0x03, 0xac, 0x03, 0xa6, 0x03, 0x94, 0x03, 0xac, 0x03, 0x9a, 0x03, 0xac, 0x03, 0x94, 0x03, 0xac, 0x03, 0xe2, 0x03, 0xe2, 0x03, 0xdc, 0x03, 0xca, 0x03, 0xca, 0x03, 0xe2, 0x03, 0xd6, 0x03, 0xee, 0x03, 0xee, 0x03, 0xca, 0x03, 0xbe, 0x03, 0xe2, 0x03, 0xe2, 0x03, 0xb8, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0xee, 0x03, 0x9a, 0x03, 0x94, 0x03, 0x9a, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0x9a, 0x03, 0xb8, 0x03, 0xdc, 0x03, 0xac, 0x03, 0xb8, 0x03, 0xc4, 0x03, 0xa6, 0x03, 0xb8, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xee, 0x03, 0xac, 0x03, 0xb8, 0x03, 0x9a, 0x03, 0xee, 0x03, 0xac, 0x03, 0xac, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xd6, 0x03, 0xa0, 0x03, 0xee, 0x03, 0xdc, 0x03, 0xee, 0x03, 0xac, 0x03, 0xee, 0x03, 0xee, 0x03, 0xa6, 0x03, 0xb8, 0x03, 0xb8, 0x04, 0x18, 0x04, 0x12, 0x03, 0xdc, 0x03, 0xb2, 0x03, 0xca, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0xac, 0x03, 0xac, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xca, 0x03, 0xd0, 0x03, 0xb8, 0x03, 0xb8, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xee, 0x03, 0xbe, 0x03, 0xbe, 0x03, 0xd6, 0x03, 0xca, 0x03, 0xd0, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xca, 0x03, 0xac, 0x03, 0xb8, 0x03, 0x9a, 0x03, 0xb8, 0x03, 0xa6, 0x03, 0xfa, 0x03, 0xac, 0x03, 0xac, 0x04, 0x00, 0x03, 0xdc, 0x03, 0x9a, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xee, 0x03, 0xdc, 0x03, 0xee, 0x04, 0x00, 0x03, 0xd6, 0x03, 0x94, 0x03, 0x94, 0x04, 0x18, 0x03, 0xe8, 0x04, 0x18, 0x04, 0x18, 0x03, 0xfa, 0x03, 0xe8, 0x03, 0xfa, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0x94, 0x03, 0x94, 0x03, 0x94, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0x9a, 0x03, 0xa6, 0x03, 0xa6, 0x03, 0xac, 0x03, 0xac, 0x03, 0xd0, 0x03, 0xca, 0x03, 0xd6, 0x03, 0x9a, 0x03, 0xb8, 0x03, 0xe8, 0x03, 0xac, 0x03, 0xe2, 0x03, 0xdc, 0x03, 0xc4, 0x03, 0x9a, 0x03, 0xee, 0x03, 0xac, 0x03, 0xac, 0x03, 0xac, 0x03, 0xb8, 0x03, 0xee, 0x03, 0xc4, 0x03, 0xdc, 0x03, 0xee, 0x03, 0xac, 0x03, 0xee, 0x04, 0x1e, 0x03, 0xdc, 0x03, 0xdc, 0x03, 0xfa, 0x04, 0x1e, 0x04, 0x1e, 0x03, 0xca, 0x00, 0x01, 0x03, 0x85, 0x02, 0xbe, 0x00, 0x01, 0x03, 0xf4, 0x02, 0xbc, 0x00, 0x01, 0x06, 0x58, 0x02, 0xb1, 0x00, 0x01, 0x03, 0xbc, 0x02, 0xbd, 0x00, 0x01, 0x04, 0x2c, 0x02, 0xbc, 0x00, 0x01, 0x05, 0xe9, 0x02, 0xb4, 0x00, 0x01, 0x04, 0x63, 0x02, 0xba, 0x00, 0x01, 0x05, 0x79, 0x02, 0xb5, 0x00, 0x01, 0x06, 0x91, 0x02, 0xb0, 0x00, 0x01, 0x05, 0x42, 0x02, 0xb7, 0x00, 0x01, 0x06, 0xc8, 0x02, 0xaf, 0x00, 0x01, 0x05, 0x0b, 0x02, 0xb8, 0x00, 0x01, 0x04, 0x9b, 0x02, 0xb9, 0x00, 0x01, 0x05, 0xb2, 0x02, 0xb4, 0x00, 0x01, 0x06, 0x21, 0x02, 0xb3, 0x00, 0x01, 0x04, 0xd3, 0x02, 0xb8, 0x00, 0x01, 0x01, 0xff, 0x02, 0xc6, 0x00, 0x01, 0x03, 0x16, 0x02, 0xc0, 0x00, 0x01, 0x02, 0xde, 0x02, 0xc1, 0x00, 0x01, 0x01, 0xc8, 0x02, 0xc7, 0x00, 0x01, 0x02, 0x6f, 0x02, 0xc4, 0x00, 0x01, 0x02, 0xa7, 0x02, 0xc2, 0x00, 0x01, 0x03, 0x4d, 0x02, 0xc0, 0x00, 0x01, 0x02, 0x38, 0x02, 0xc5, 0x00, 0x02, 0x00, 0x06, 0x00, 0x24, 0x00, 0x4f, 0x00, 0x00, 0x00, 0x95, 0x00, 0xba, 0x00, 0x2c, 0x00, 0xe1, 0x01, 0x05, 0x00, 0x52, 0x01, 0x07, 0x01, 0xb2, 0x00, 0x77, 0x01, 0xb4, 0x01, 0xfd, 0x01, 0x23, 0x01, 0xff, 0x02, 0x5a, 0x01, 0x6d, 0x00, 0x03, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x01, 0x00, 0x00, 0x02, 0xe4, 0x00, 0x01, 0x00, 0x03, 0x02, 0x5d, 0x02, 0x5e, 0x02, 0x5f, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x05, 0xde, 0x04, 0x2a, 0x00, 0x01, 0x05, 0x92, 0x00, 0x0c, 0x00, 0xb2, 0x04, 0x18, 0x04, 0x12, 0x04, 0x0c, 0x04, 0x06, 0x04, 0x06, 0x04, 0x00, 0x04, 0x00, 0x03, 0xfa, 0x03, 0xf4, 0x03, 0xee, 0x03, 0xe8, 0x03, 0xe2, 0x03, 0xdc, 0x03, 0xd6, 0x03, 0xd0, 0x03, 0xca, 0x03, 0xc4, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa6, 0x03, 0xa0, 0x03, 0x9a, 0x03, 0x94, 0x03, 0x8e, 0x03, 0x88, 0x03, 0xd0, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa0, 0x03, 0x9a, 0x03, 0xca, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa6, 0x03, 0x9a, 0x03, 0x8e, 0x03, 0xd0, 0x03, 0xca, 0x03, 0xc4, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa6, 0x03, 0xa0, 0x03, 0x94, 0x03, 0x8e, 0x03, 0x88, 0x03, 0x82, 0x03, 0x7c, 0x03, 0xca, 0x03, 0xbe, 0x03, 0xb8, 0x03, 0xb2, 0x03, 0xac, 0x03, 0xa6, 0x03, 0x94, 0x03, 0x8e, 0x03, 0x76, 0x03, 0x76, 0x03, 0xe8, 0x03, 0x70, 0x03, 0x6a, 0x03, 0x64, 0x03, 0x64, 0x03, 0x5e, 0x03, 0x58, 0x03, 0x52, 0x03, 0x4c, 0x03, 0x46, 0x03, 0x40, 0x03, 0x3a, 0x03, 0x34, 0x03, 0x34, 0x03, 0x2e, 0x03, 0x28, 0x03, 0x22, 0x03, 0x1c, 0x03, 0x16, 0x03, 0x10, 0x03, 0x0a, 0x03, 0x04, 0x03, 0xb8, 0x02, 0xfe, 0x03, 0xca, 0x02, 0xf8, 0x02, 0xf8, 0x03, 0x04, 0x02, 0xf2, 0x02, 0xec, 0x02, 0xe6, 0x02, 0xe0, 0x02, 0xda, 0x02, 0xd4, 0x02, 0xd4, 0x02, 0xce, 0x02, 0xc8, 0x02, 0xc2, 0x02, 0xbc, 0x02, 0xbc, 0x02, 0xb6, 0x02, 0xb0, 0x02, 0xb6, 0x02, 0xaa, 0x02, 0xa4, 0x02, 0x9e, 0x03, 0xa6, 0x02, 0x98, 0x02, 0x92, 0x02, 0x8c, 0x02, 0x86, 0x02, 0x80, 0x02, 0x80, 0x02, 0x7a, 0x02, 0x74, 0x02, 0x74, 0x02, 0x6e, 0x02, 0x68, 0x02, 0x62, 0x02, 0x5c, 0x02, 0x56, 0x02, 0x50, 0x02, 0x4a, 0x02, 0x44, 0x02, 0x44, 0x02, 0x3e, 0x02, 0x38, 0x02, 0x32, 0x02, 0x2c, 0x02, 0x26, 0x02, 0x20, 0x02, 0x1a, 0x02, 0x14, 0x02, 0x0e, 0x02, 0x08, 0x02, 0xda, 0x02, 0xc2, 0x02, 0x02, 0x01, 0xfc, 0x01, 0xfc, 0x01, 0xf6, 0x01, 0xf0, 0x01, 0xea, 0x01, 0xe4, 0x01, 0xde, 0x01, 0xd8, 0x01, 0xd2, 0x01, 0xd2, 0x01, 0xcc, 0x02, 0xec, 0x01, 0xc6, 0x01, 0xc0, 0x01, 0xc0, 0x01, 0xba, 0x01, 0xba, 0x01, 0xb4, 0x01, 0xae, 0x01, 0xae, 0x01, 0xa8, 0x01, 0xa2, 0x01, 0xa2, 0x01, 0x9c, 0x01, 0x96, 0x01, 0x90, 0x01, 0x8a, 0x01, 0x84, 0x01, 0x7e, 0x01, 0x78, 0x01, 0x72, 0x01, 0x72, 0x03, 0x8e, 0x03, 0x8e, 0x01, 0x6c, 0x01, 0x66, 0x00, 0x01, 0x02, 0x55, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xee, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xc9, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x2a, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x59, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x5a, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xd2, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x45, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x01, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xea, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x35, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x9e, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x0e, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x5e, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x5b, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xad, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xe6, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xbe, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x47, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x28, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x57, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x31, 0x02, 0xe4, 0x00, 0x01, 0x06, 0xab, 0x02, 0xe4, 0x00, 0x01, 0x05, 0x62, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xa5, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x8b, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x86, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x74, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xc2, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xab, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xd0, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xd7, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x04, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xdf, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x5f, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x9b, 0x02, 0xe4, 0x00, 0x01, 0x05, 0x9d, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xee, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xc0, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x34, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xa8, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x06, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x53, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xc8, 0x02, 0xe4, 0x00, 0x01, 0x05, 0xef, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x22, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xe9, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xf2, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xc5, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xd8, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x8f, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x2d, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xf2, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x02, 0x02, 0xbc, 0x00, 0x01, 0x02, 0x02, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xb8, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x23, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x32, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x49, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x97, 0x02, 0xe4, 0x00, 0x01, 0x05, 0x9c, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xac, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x26, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x02, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xc4, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x05, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xe7, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xd4, 0x02, 0xe4, 0x00, 0x01, 0x01, 0x99, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xeb, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xe5, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xe4, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x9a, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x23, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xe4, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x07, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x58, 0x02, 0xe4, 0x00, 0x01, 0x04, 0x3e, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xab, 0x02, 0xe4, 0x00, 0x01, 0x03, 0xd7, 0x02, 0xe4, 0x00, 0x01, 0x08, 0xfb, 0x02, 0xe4, 0x00, 0x01, 0x06, 0xaf, 0x02, 0xe4, 0x00, 0x01, 0x06, 0xae, 0x02, 0xe4, 0x00, 0x01, 0x05, 0x9b, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xe4, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xe3, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xc8, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x91, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xfc, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x7c, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x6f, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xff, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xd9, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xcd, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xc7, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x31, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xfa, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xf1, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xd3, 0x02, 0xe4, 0x00, 0x01, 0x01, 0x92, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xdf, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x82, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xd7, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x2d, 0x02, 0xe4, 0x00, 0x01, 0x03, 0x89, 0x03, 0xb0, 0x00, 0x01, 0x02, 0xf1, 0x03, 0xb0, 0x00, 0x01, 0x01, 0x8a, 0x03, 0xb0, 0x00, 0x01, 0x04, 0xac, 0x02, 0xe4, 0x00, 0x01, 0x04, 0xa6, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xc3, 0x02, 0xe4, 0x00, 0x01, 0x01, 0x98, 0x02, 0xe4, 0x00, 0x01, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x01, 0x02, 0x5c, 0x02, 0xe4, 0x00, 0x01, 0x01, 0xe9, 0x02, 0xe4, 0x00, 0x01, 0x01, 0x67, 0x02, 0xe4, 0x00, 0x01, 0x01, 0x5f, 0x02, 0xe4, 0x00, 0x01, 0x00, 0xb2, 0x00, 0x06, 0x00, 0x08, 0x00, 0x09, 0x00, 0x0a, 0x00, 0x0b, 0x00, 0x0c, 0x00, 0x0d, 0x00, 0x0e, 0x00, 0x0f, 0x00, 0x10, 0x00, 0x11, 0x00, 0x12, 0x00, 0x13, 0x00, 0x14, 0x00, 0x24, 0x00, 0x28, 0x00, 0x2a, 0x00, 0x2e, 0x00, 0x2f, 0x00, 0x30, 0x00, 0x31, 0x00, 0x35, 0x00, 0x39, 0x00, 0x3e, 0x00, 0x3f, 0x00, 0x44, 0x00, 0x45, 0x00, 0x48, 0x00, 0x4c, 0x00, 0x4d, 0x00, 0x4e, 0x00, 0x4f, 0x00, 0x54, 0x00, 0x5a, 0x00, 0x5b, 0x00, 0x5c, 0x00, 0x5d, 0x00, 0x61, 0x00, 0x6a, 0x00, 0x70, 0x00, 0x95, 0x00, 0x99, 0x00, 0x9b, 0x00, 0x9f, 0x00, 0xa0, 0x00, 0xa1, 0x00, 0xa2, 0x00, 0xa6, 0x00, 0xaa, 0x00, 0xaf, 0x00, 0xb4, 0x00, 0xb5, 0x00, 0xb6, 0x00, 0xba, 0x00, 0xbf, 0x00, 0xc5, 0x00, 0xc6, 0x00, 0xc7, 0x00, 0xc8, 0x00, 0xcc, 0x00, 0xd5, 0x00, 0xda, 0x00, 0xe1, 0x00, 0xe2, 0x00, 0xe6, 0x00, 0xe8, 0x00, 0xee, 0x00, 0xf2, 0x00, 0xf3, 0x00, 0xf4, 0x00, 0xf9, 0x01, 0x02, 0x01, 0x03, 0x01, 0x06, 0x01, 0x18, 0x01, 0x24, 0x01, 0x2b, 0x01, 0x2c, 0x01, 0x32, 0x01, 0x3a, 0x01, 0x3b, 0x01, 0x3d, 0x01, 0x48, 0x01, 0x4b, 0x01, 0x4c, 0x01, 0x4e, 0x01, 0x4f, 0x01, 0x51, 0x01, 0x52, 0x01, 0x53, 0x01, 0x55, 0x01, 0x56, 0x01, 0x58, 0x01, 0x59, 0x01, 0x5a, 0x01, 0x5b, 0x01, 0x5c, 0x01, 0x61, 0x01, 0x63, 0x01, 0x70, 0x01, 0x71, 0x01, 0x76, 0x01, 0x7f, 0x01, 0x80, 0x01, 0x81, 0x01, 0x82, 0x01, 0x83, 0x01, 0x85, 0x01, 0x86, 0x01, 0x88, 0x01, 0x8a, 0x01, 0x90, 0x01, 0x93, 0x01, 0x94, 0x01, 0x95, 0x01, 0x9d, 0x01, 0x9e, 0x01, 0x9f, 0x01, 0xa8, 0x01, 0xa9, 0x01, 0xb2, 0x01, 0xb5, 0x01, 0xb6, 0x01, 0xb7, 0x01, 0xbc, 0x01, 0xbf, 0x01, 0xc4, 0x01, 0xc9, 0x01, 0xca, 0x01, 0xcc, 0x01, 0xd4, 0x01, 0xdc, 0x01, 0xe4, 0x01, 0xe7, 0x01, 0xf4, 0x01, 0xf8, 0x01, 0xfc, 0x01, 0xfd, 0x02, 0x03, 0x02, 0x04, 0x02, 0x05, 0x02, 0x06, 0x02, 0x0a, 0x02, 0x0b, 0x02, 0x0d, 0x02, 0x12, 0x02, 0x15, 0x02, 0x17, 0x02, 0x1a, 0x02, 0x1c, 0x02, 0x1d, 0x02, 0x1e, 0x02, 0x20, 0x02, 0x21, 0x02, 0x26, 0x02, 0x29, 0x02, 0x2a, 0x02, 0x2b, 0x02, 0x2d, 0x02, 0x2e, 0x02, 0x2f, 0x02, 0x31, 0x02, 0x36, 0x02, 0x3c, 0x02, 0x3d, 0x02, 0x41, 0x02, 0x48, 0x02, 0x4c, 0x02, 0x51, 0x02, 0x54, 0x02, 0x58, 0x02, 0x59, 0x02, 0x75, 0x02, 0x76, 0x02, 0x77, 0x02, 0x78, 0x02, 0x79, 0x02, 0x7b, 0x00, 0x0e, 0x00, 0x00, 0x00, 0x46, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x3a, 0x00, 0x00, 0x00, 0x46, 0x00, 0x00, 0x00, 0x46, 0x00, 0x00, 0x00, 0x46, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x01, 0xff, 0xa1, 0x02, 0xe4, 0x00, 0x01, 0xff, 0xa6, 0x02, 0xe4, 0x00, 0x01, 0xff, 0xa5, 0x02, 0xe4, 0x00, 0x01, 0x00, 0x0e, 0x00, 0x1e, 0x00, 0x1f, 0x00, 0x22, 0x00, 0x79, 0x00, 0x7a, 0x00, 0x92, 0x02, 0x5c, 0x02, 0x67, 0x02, 0x68, 0x02, 0x69, 0x02, 0x6a, 0x02, 0x6b, 0x02, 0x6c, 0x02, 0x73, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff, 0xb5, 0x00, 0x32, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x23, 0x00, 0x00, 0x01, 0x02, 0x01, 0x03, 0x00, 0x03, 0x01, 0x04, 0x01, 0x05, 0x01, 0x06, 0x01, 0x07, 0x01, 0x08, 0x01, 0x09, 0x01, 0x0a, 0x01, 0x0b, 0x01, 0x0c, 0x01, 0x0d, 0x01, 0x0e, 0x01, 0x0f, 0x01, 0x10, 0x01, 0x11, 0x01, 0x12, 0x01, 0x13, 0x01, 0x14, 0x01, 0x15, 0x01, 0x16, 0x01, 0x17, 0x01, 0x18, 0x01, 0x19, 0x01, 0x1a, 0x01, 0x1b, 0x01, 0x1c, 0x01, 0x1d, 0x01, 0x1e, 0x01, 0x1f, 0x01, 0x20, 0x01, 0x21, 0x01, 0x22, 0x01, 0x23, 0x01, 0x24, 0x01, 0x25, 0x01, 0x26, 0x01, 0x27, 0x01, 0x28, 0x01, 0x29, 0x01, 0x2a, 0x01, 0x2b, 0x01, 0x2c, 0x01, 0x2d, 0x01, 0x2e, 0x01, 0x2f, 0x01, 0x30, 0x01, 0x31, 0x01, 0x32, 0x01, 0x33, 0x01, 0x34, 0x01, 0x35, 0x01, 0x36, 0x01, 0x37, 0x01, 0x38, 0x01, 0x39, 0x01, 0x3a, 0x01, 0x3b, 0x01, 0x3c, 0x01, 0x3d, 0x01, 0x3e, 0x01, 0x3f, 0x01, 0x40, 0x01, 0x41, 0x01, 0x42, 0x01, 0x43, 0x01, 0x44, 0x01, 0x45, 0x01, 0x46, 0x01, 0x47, 0x01, 0x48, 0x01, 0x49, 0x01, 0x4a, 0x01, 0x4b, 0x01, 0x4c, 0x01, 0x4d, 0x01, 0x4e, 0x01, 0x4f, 0x01, 0x50, 0x01, 0x51, 0x01, 0x52, 0x01, 0x53, 0x01, 0x54, 0x01, 0x55, 0x01, 0x56, 0x01, 0x57, 0x01, 0x58, 0x01, 0x59, 0x01, 0x5a, 0x01, 0x5b, 0x01, 0x5c, 0x01, 0x5d, 0x01, 0x5e, 0x01, 0x5f, 0x01, 0x60, 0x01, 0x61, 0x01, 0x62, 0x01, 0x63, 0x01, 0x64, 0x01, 0x65, 0x01, 0x66, 0x01, 0x67, 0x01, 0x68, 0x01, 0x69, 0x01, 0x6a, 0x01, 0x6b, 0x01, 0x6c, 0x01, 0x6d, 0x01, 0x6e, 0x01, 0x6f, 0x01, 0x70, 0x01, 0x71, 0x01, 0x72, 0x01, 0x73, 0x01, 0x74, 0x01, 0x75, 0x01, 0x76, 0x01, 0x77, 0x01, 0x78, 0x01, 0x79, 0x01, 0x7a, 0x01, 0x7b, 0x01, 0x7c, 0x01, 0x7d, 0x01, 0x7e, 0x01, 0x7f, 0x01, 0x80, 0x01, 0x81, 0x01, 0x82, 0x01, 0x83, 0x01, 0x84, 0x01, 0x85, 0x01, 0x86, 0x01, 0x87, 0x01, 0x88, 0x01, 0x89, 0x01, 0x8a, 0x01, 0x8b, 0x01, 0x8c, 0x01, 0x8d, 0x01, 0x8e, 0x01, 0x8f, 0x01, 0x90, 0x01, 0x91, 0x01, 0x92, 0x01, 0x93, 0x01, 0x94, 0x01, 0x95, 0x01, 0x96, 0x01, 0x97, 0x01, 0x98, 0x01, 0x99, 0x01, 0x9a, 0x01, 0x9b, 0x01, 0x9c, 0x01, 0x9d, 0x01, 0x9e, 0x01, 0x9f, 0x01, 0xa0, 0x01, 0xa1, 0x01, 0xa2, 0x01, 0xa3, 0x01, 0xa4, 0x01, 0xa5, 0x01, 0xa6, 0x01, 0xa7, 0x01, 0xa8, 0x01, 0xa9, 0x01, 0xaa, 0x01, 0xab, 0x01, 0xac, 0x01, 0xad, 0x01, 0xae, 0x01, 0xaf, 0x01, 0xb0, 0x01, 0xb1, 0x01, 0xb2, 0x01, 0xb3, 0x01, 0xb4, 0x01, 0xb5, 0x01, 0xb6, 0x01, 0xb7, 0x01, 0xb8, 0x01, 0xb9, 0x01, 0xba, 0x01, 0xbb, 0x01, 0xbc, 0x01, 0xbd, 0x01, 0xbe, 0x01, 0xbf, 0x01, 0xc0, 0x01, 0xc1, 0x01, 0xc2, 0x01, 0xc3, 0x01, 0xc4, 0x01, 0xc5, 0x01, 0xc6, 0x01, 0xc7, 0x01, 0xc8, 0x01, 0xc9, 0x01, 0xca, 0x01, 0xcb, 0x01, 0xcc, 0x01, 0xcd, 0x01, 0xce, 0x01, 0xcf, 0x01, 0xd0, 0x01, 0xd1, 0x01, 0xd2, 0x01, 0xd3, 0x01, 0xd4, 0x01, 0xd5, 0x01, 0xd6, 0x01, 0xd7, 0x01, 0xd8, 0x01, 0xd9, 0x01, 0xda, 0x01, 0xdb, 0x01, 0xdc, 0x01, 0xdd, 0x01, 0xde, 0x01, 0xdf, 0x01, 0xe0, 0x01, 0xe1, 0x01, 0xe2, 0x01, 0xe3, 0x01, 0xe4, 0x01, 0xe5, 0x01, 0xe6, 0x01, 0xe7, 0x01, 0xe8, 0x01, 0xe9, 0x01, 0xea, 0x01, 0xeb, 0x01, 0xec, 0x01, 0xed, 0x01, 0xee, 0x01, 0xef, 0x01, 0xf0, 0x01, 0xf1, 0x01, 0xf2, 0x01, 0xf3, 0x01, 0xf4, 0x01, 0xf5, 0x01, 0xf6, 0x01, 0xf7, 0x01, 0xf8, 0x01, 0xf9, 0x01, 0xfa, 0x01, 0xfb, 0x01, 0xfc, 0x01, 0xfd, 0x01, 0xfe, 0x01, 0xff, 0x02, 0x00, 0x02, 0x01, 0x02, 0x02, 0x02, 0x03, 0x02, 0x04, 0x02, 0x05, 0x02, 0x06, 0x02, 0x07, 0x02, 0x08, 0x02, 0x09, 0x02, 0x0a, 0x02, 0x0b, 0x02, 0x0c, 0x02, 0x0d, 0x02, 0x0e, 0x02, 0x0f, 0x02, 0x10, 0x02, 0x11, 0x02, 0x12, 0x02, 0x13, 0x02, 0x14, 0x02, 0x15, 0x02, 0x16, 0x02, 0x17, 0x02, 0x18, 0x02, 0x19, 0x02, 0x1a, 0x02, 0x1b, 0x02, 0x1c, 0x02, 0x1d, 0x02, 0x1e, 0x02, 0x1f, 0x02, 0x20, 0x02, 0x21, 0x02, 0x22, 0x02, 0x23, 0x02, 0x24, 0x02, 0x25, 0x02, 0x26, 0x02, 0x27, 0x02, 0x28, 0x02, 0x29, 0x02, 0x2a, 0x02, 0x2b, 0x02, 0x2c, 0x02, 0x2d, 0x02, 0x2e, 0x02, 0x2f, 0x02, 0x30, 0x02, 0x31, 0x02, 0x32, 0x02, 0x33, 0x02, 0x34, 0x02, 0x35, 0x02, 0x36, 0x02, 0x37, 0x02, 0x38, 0x02, 0x39, 0x02, 0x3a, 0x02, 0x3b, 0x02, 0x3c, 0x02, 0x3d, 0x02, 0x3e, 0x02, 0x3f, 0x02, 0x40, 0x02, 0x41, 0x02, 0x42, 0x02, 0x43, 0x02, 0x44, 0x02, 0x45, 0x02, 0x46, 0x02, 0x47, 0x02, 0x48, 0x02, 0x49, 0x02, 0x4a, 0x02, 0x4b, 0x02, 0x4c, 0x02, 0x4d, 0x02, 0x4e, 0x02, 0x4f, 0x02, 0x50, 0x02, 0x51, 0x02, 0x52, 0x02, 0x53, 0x02, 0x54, 0x02, 0x55, 0x02, 0x56, 0x02, 0x57, 0x02, 0x58, 0x02, 0x59, 0x02, 0x5a, 0x02, 0x5b, 0x02, 0x5c, 0x02, 0x5d, 0x02, 0x5e, 0x02, 0x5f, 0x02, 0x60, 0x02, 0x61, 0x02, 0x62, 0x02, 0x63, 0x02, 0x64, 0x02, 0x65, 0x02, 0x66, 0x02, 0x67, 0x02, 0x68, 0x02, 0x69, 0x02, 0x6a, 0x02, 0x6b, 0x02, 0x6c, 0x02, 0x6d, 0x02, 0x6e, 0x02, 0x6f, 0x02, 0x70, 0x02, 0x71, 0x02, 0x72, 0x02, 0x73, 0x02, 0x74, 0x02, 0x75, 0x02, 0x76, 0x02, 0x77, 0x02, 0x78, 0x02, 0x79, 0x02, 0x7a, 0x02, 0x7b, 0x02, 0x7c, 0x02, 0x7d, 0x02, 0x7e, 0x02, 0x7f, 0x02, 0x80, 0x02, 0x81, 0x02, 0x82, 0x02, 0x83, 0x02, 0x84, 0x02, 0x85, 0x02, 0x86, 0x02, 0x87, 0x02, 0x88, 0x02, 0x89, 0x02, 0x8a, 0x02, 0x8b, 0x02, 0x8c, 0x02, 0x8d, 0x02, 0x8e, 0x02, 0x8f, 0x02, 0x90, 0x02, 0x91, 0x02, 0x92, 0x02, 0x93, 0x02, 0x94, 0x02, 0x95, 0x02, 0x96, 0x02, 0x97, 0x02, 0x98, 0x02, 0x99, 0x02, 0x9a, 0x02, 0x9b, 0x02, 0x9c, 0x02, 0x9d, 0x02, 0x9e, 0x02, 0x9f, 0x02, 0xa0, 0x02, 0xa1, 0x02, 0xa2, 0x02, 0xa3, 0x02, 0xa4, 0x02, 0xa5, 0x02, 0xa6, 0x02, 0xa7, 0x02, 0xa8, 0x02, 0xa9, 0x02, 0xaa, 0x02, 0xab, 0x02, 0xac, 0x02, 0xad, 0x02, 0xae, 0x02, 0xaf, 0x02, 0xb0, 0x02, 0xb1, 0x02, 0xb2, 0x02, 0xb3, 0x02, 0xb4, 0x02, 0xb5, 0x02, 0xb6, 0x02, 0xb7, 0x02, 0xb8, 0x02, 0xb9, 0x02, 0xba, 0x02, 0xbb, 0x02, 0xbc, 0x02, 0xbd, 0x02, 0xbe, 0x02, 0xbf, 0x02, 0xc0, 0x02, 0xc1, 0x02, 0xc2, 0x02, 0xc3, 0x02, 0xc4, 0x02, 0xc5, 0x02, 0xc6, 0x02, 0xc7, 0x02, 0xc8, 0x02, 0xc9, 0x02, 0xca, 0x02, 0xcb, 0x02, 0xcc, 0x02, 0xcd, 0x02, 0xce, 0x02, 0xcf, 0x02, 0xd0, 0x02, 0xd1, 0x02, 0xd2, 0x02, 0xd3, 0x02, 0xd4, 0x02, 0xd5, 0x02, 0xd6, 0x02, 0xd7, 0x02, 0xd8, 0x02, 0xd9, 0x02, 0xda, 0x02, 0xdb, 0x02, 0xdc, 0x02, 0xdd, 0x02, 0xde, 0x02, 0xdf, 0x02, 0xe0, 0x02, 0xe1, 0x02, 0xe2, 0x02, 0xe3, 0x02, 0xe4, 0x02, 0xe5, 0x02, 0xe6, 0x02, 0xe7, 0x02, 0xe8, 0x02, 0xe9, 0x02, 0xea, 0x02, 0xeb, 0x02, 0xec, 0x02, 0xed, 0x02, 0xee, 0x02, 0xef, 0x02, 0xf0, 0x02, 0xf1, 0x02, 0xf2, 0x02, 0xf3, 0x02, 0xf4, 0x02, 0xf5, 0x02, 0xf6, 0x02, 0xf7, 0x02, 0xf8, 0x02, 0xf9, 0x02, 0xfa, 0x02, 0xfb, 0x02, 0xfc, 0x02, 0xfd, 0x02, 0xfe, 0x02, 0xff, 0x03, 0x00, 0x03, 0x01, 0x03, 0x02, 0x03, 0x03, 0x03, 0x04, 0x03, 0x05, 0x03, 0x06, 0x03, 0x07, 0x03, 0x08, 0x03, 0x09, 0x03, 0x0a, 0x03, 0x0b, 0x03, 0x0c, 0x03, 0x0d, 0x03, 0x0e, 0x03, 0x0f, 0x03, 0x10, 0x03, 0x11, 0x03, 0x12, 0x03, 0x13, 0x03, 0x14, 0x03, 0x15, 0x03, 0x16, 0x03, 0x17, 0x03, 0x18, 0x03, 0x19, 0x03, 0x1a, 0x03, 0x1b, 0x03, 0x1c, 0x03, 0x1d, 0x03, 0x1e, 0x03, 0x1f, 0x03, 0x20, 0x03, 0x21, 0x03, 0x22, 0x03, 0x23, 0x03, 0x24, 0x03, 0x25, 0x03, 0x26, 0x03, 0x27, 0x03, 0x28, 0x03, 0x29, 0x03, 0x2a, 0x03, 0x2b, 0x03, 0x2c, 0x03, 0x2d, 0x03, 0x2e, 0x03, 0x2f, 0x03, 0x30, 0x03, 0x31, 0x03, 0x32, 0x03, 0x33, 0x03, 0x34, 0x03, 0x35, 0x03, 0x36, 0x03, 0x37, 0x03, 0x38, 0x03, 0x39, 0x03, 0x3a, 0x03, 0x3b, 0x03, 0x3c, 0x03, 0x3d, 0x03, 0x3e, 0x03, 0x3f, 0x03, 0x40, 0x03, 0x41, 0x03, 0x42, 0x03, 0x43, 0x03, 0x44, 0x03, 0x45, 0x03, 0x46, 0x03, 0x47, 0x03, 0x48, 0x03, 0x49, 0x03, 0x4a, 0x03, 0x4b, 0x03, 0x4c, 0x03, 0x4d, 0x03, 0x4e, 0x03, 0x4f, 0x03, 0x50, 0x03, 0x51, 0x03, 0x52, 0x03, 0x53, 0x03, 0x54, 0x03, 0x55, 0x03, 0x56, 0x03, 0x57, 0x03, 0x58, 0x03, 0x59, 0x03, 0x5a, 0x03, 0x5b, 0x03, 0x5c, 0x03, 0x5d, 0x03, 0x5e, 0x03, 0x5f, 0x03, 0x60, 0x03, 0x61, 0x03, 0x62, 0x03, 0x63, 0x03, 0x64, 0x03, 0x65, 0x03, 0x66, 0x03, 0x67, 0x03, 0x68, 0x03, 0x69, 0x03, 0x6a, 0x03, 0x6b, 0x03, 0x6c, 0x03, 0x6d, 0x03, 0x6e, 0x03, 0x6f, 0x03, 0x70, 0x03, 0x71, 0x03, 0x72, 0x03, 0x73, 0x03, 0x74, 0x03, 0x75, 0x03, 0x76, 0x03, 0x77, 0x03, 0x78, 0x03, 0x79, 0x03, 0x7a, 0x03, 0x7b, 0x03, 0x7c, 0x03, 0x7d, 0x03, 0x7e, 0x03, 0x7f, 0x03, 0x80, 0x03, 0x81, 0x03, 0x82, 0x03, 0x83, 0x03, 0x84, 0x03, 0x85, 0x03, 0x86, 0x03, 0x87, 0x03, 0x88, 0x03, 0x89, 0x03, 0x8a, 0x03, 0x8b, 0x03, 0x8c, 0x03, 0x8d, 0x03, 0x8e, 0x03, 0x8f, 0x03, 0x90, 0x03, 0x91, 0x03, 0x92, 0x03, 0x93, 0x00, 0x04, 0x00, 0x05, 0x00, 0x06, 0x00, 0x07, 0x00, 0x08, 0x00, 0x09, 0x00, 0x0a, 0x00, 0x0b, 0x00, 0x0c, 0x00, 0x0d, 0x00, 0x0e, 0x00, 0x0f, 0x00, 0x10, 0x00, 0x11, 0x00, 0x12, 0x00, 0x13, 0x00, 0x14, 0x00, 0x15, 0x00, 0x16, 0x00, 0x17, 0x00, 0x18, 0x00, 0x19, 0x00, 0x1a, 0x00, 0x1b, 0x00, 0x1c, 0x00, 0x1d, 0x00, 0x1e, 0x00, 0x1f, 0x00, 0x20, 0x00, 0x21, 0x00, 0x22, 0x00, 0x23, 0x00, 0x24, 0x00, 0x25, 0x00, 0x26, 0x00, 0x27, 0x00, 0x28, 0x00, 0x29, 0x00, 0x2a, 0x00, 0x2b, 0x00, 0x2c, 0x00, 0x2d, 0x00, 0x2e, 0x00, 0x2f, 0x00, 0x30, 0x00, 0x31, 0x00, 0x32, 0x00, 0x33, 0x00, 0x34, 0x00, 0x35, 0x00, 0x36, 0x00, 0x37, 0x00, 0x38, 0x00, 0x39, 0x00, 0x3a, 0x00, 0x3b, 0x00, 0x3c, 0x00, 0x3d, 0x00, 0x3e, 0x00, 0x3f, 0x00, 0x40, 0x00, 0x41, 0x00, 0x42, 0x00, 0x43, 0x00, 0x44, 0x00, 0x45, 0x00, 0x46, 0x00, 0x47, 0x00, 0x48, 0x00, 0x49, 0x00, 0x4a, 0x00, 0x4b, 0x00, 0x4c, 0x00, 0x4d, 0x00, 0x4e, 0x00, 0x4f, 0x00, 0x50, 0x00, 0x51, 0x00, 0x52, 0x00, 0x53, 0x00, 0x54, 0x00, 0x55, 0x00, 0x56, 0x00, 0x57, 0x00, 0x58, 0x00, 0x59, 0x00, 0x5a, 0x00, 0x5b, 0x00, 0x5c, 0x00, 0x5d, 0x00, 0x5e, 0x00, 0x5f, 0x00, 0x60, 0x00, 0x61, 0x03, 0x94, 0x00, 0xa3, 0x00, 0x84, 0x00, 0x85, 0x00, 0xbd, 0x00, 0x96, 0x00, 0xe8, 0x00, 0x86, 0x00, 0x8e, 0x00, 0x8b, 0x00, 0x9d, 0x00, 0xa9, 0x00, 0xa4, 0x03, 0x95, 0x00, 0x8a, 0x00, 0xda, 0x00, 0x83, 0x00, 0x93, 0x00, 0xf2, 0x00, 0xf3, 0x00, 0x8d, 0x03, 0x96, 0x00, 0x88, 0x00, 0xc3, 0x00, 0xde, 0x00, 0xf1, 0x00, 0x9e, 0x00, 0xaa, 0x00, 0xf5, 0x00, 0xf4, 0x00, 0xf6, 0x00, 0xa2, 0x00, 0xad, 0x00, 0xc9, 0x00, 0xc7, 0x00, 0xae, 0x00, 0x62, 0x00, 0x63, 0x00, 0x90, 0x00, 0x64, 0x00, 0xcb, 0x00, 0x65, 0x00, 0xc8, 0x00, 0xca, 0x00, 0xcf, 0x00, 0xcc, 0x00, 0xcd, 0x00, 0xce, 0x00, 0xe9, 0x00, 0x66, 0x00, 0xd3, 0x00, 0xd0, 0x00, 0xd1, 0x00, 0xaf, 0x00, 0x67, 0x00, 0xf0, 0x00, 0x91, 0x00, 0xd6, 0x00, 0xd4, 0x00, 0xd5, 0x00, 0x68, 0x00, 0xeb, 0x00, 0xed, 0x00, 0x89, 0x00, 0x6a, 0x00, 0x69, 0x00, 0x6b, 0x00, 0x6d, 0x00, 0x6c, 0x00, 0x6e, 0x00, 0xa0, 0x00, 0x6f, 0x00, 0x71, 0x00, 0x70, 0x00, 0x72, 0x00, 0x73, 0x00, 0x75, 0x00, 0x74, 0x00, 0x76, 0x00, 0x77, 0x00, 0xea, 0x00, 0x78, 0x00, 0x7a, 0x00, 0x79, 0x00, 0x7b, 0x00, 0x7d, 0x00, 0x7c, 0x00, 0xb8, 0x00, 0xa1, 0x00, 0x7f, 0x00, 0x7e, 0x00, 0x80, 0x00, 0x81, 0x00, 0xec, 0x00, 0xee, 0x00, 0xba, 0x03, 0x97, 0x03, 0x98, 0x03, 0x99, 0x03, 0x9a, 0x03, 0x9b, 0x03, 0x9c, 0x00, 0xfd, 0x00, 0xfe, 0x03, 0x9d, 0x03, 0x9e, 0x00, 0xff, 0x01, 0x00, 0x03, 0x9f, 0x03, 0xa0, 0x03, 0xa1, 0x01, 0x01, 0x03, 0xa2, 0x03, 0xa3, 0x03, 0xa4, 0x03, 0xa5, 0x03, 0xa6, 0x03, 0xa7, 0x03, 0xa8, 0x03, 0xa9, 0x03, 0xaa, 0x03, 0xab, 0x00, 0xf8, 0x00, 0xf9, 0x03, 0xac, 0x03, 0xad, 0x03, 0xae, 0x03, 0xaf, 0x03, 0xb0, 0x03, 0xb1, 0x03, 0xb2, 0x03, 0xb3, 0x03, 0xb4, 0x03, 0xb5, 0x03, 0xb6, 0x03, 0xb7, 0x00, 0xfa, 0x00, 0xd7, 0x03, 0xb8, 0x03, 0xb9, 0x03, 0xba, 0x03, 0xbb, 0x03, 0xbc, 0x03, 0xbd, 0x03, 0xbe, 0x03, 0xbf, 0x03, 0xc0, 0x03, 0xc1, 0x00, 0xe2, 0x00, 0xe3, 0x03, 0xc2, 0x03, 0xc3, 0x03, 0xc4, 0x03, 0xc5, 0x03, 0xc6, 0x03, 0xc7, 0x03, 0xc8, 0x03, 0xc9, 0x03, 0xca, 0x03, 0xcb, 0x03, 0xcc, 0x03, 0xcd, 0x00, 0xb0, 0x00, 0xb1, 0x03, 0xce, 0x03, 0xcf, 0x03, 0xd0, 0x03, 0xd1, 0x03, 0xd2, 0x03, 0xd3, 0x03, 0xd4, 0x03, 0xd5, 0x03, 0xd6, 0x03, 0xd7, 0x00, 0xe4, 0x00, 0xe5, 0x03, 0xd8, 0x03, 0xd9, 0x03, 0xda, 0x03, 0xdb, 0x03, 0xdc, 0x03, 0xdd, 0x03, 0xde, 0x03, 0xdf, 0x03, 0xe0, 0x03, 0xe1, 0x03, 0xe2, 0x03, 0xe3, 0x03, 0xe4, 0x03, 0xe5, 0x03, 0xe6, 0x03, 0xe7, 0x03, 0xe8, 0x03, 0xe9, 0x03, 0xea, 0x03, 0xeb, 0x00, 0xbb, 0x03, 0xec, 0x03, 0xed, 0x03, 0xee, 0x03, 0xef, 0x00, 0xe6, 0x00, 0xe7, 0x03, 0xf0, 0x00, 0xa6, 0x03, 0xf1, 0x03, 0xf2, 0x03, 0xf3, 0x03, 0xf4, 0x03, 0xf5, 0x03, 0xf6, 0x03, 0xf7, 0x03, 0xf8, 0x00, 0xd8, 0x00, 0xe1, 0x03, 0xf9, 0x00, 0xdb, 0x00, 0xdc, 0x00, 0xdd, 0x00, 0xe0, 0x00, 0xd9, 0x00, 0xdf, 0x00, 0x9b, 0x03, 0xfa, 0x03, 0xfb, 0x03, 0xfc, 0x03, 0xfd, 0x03, 0xfe, 0x03, 0xff, 0x04, 0x00, 0x04, 0x01, 0x04, 0x02, 0x04, 0x03, 0x04, 0x04, 0x04, 0x05, 0x00, 0xb2, 0x00, 0xb3, 0x00, 0xb6, 0x00, 0xb7, 0x00, 0xc4, 0x00, 0xb4, 0x00, 0xb5, 0x00, 0xc5, 0x00, 0x82, 0x00, 0xc2, 0x00, 0x87, 0x00, 0xab, 0x00, 0xc6, 0x00, 0xbe, 0x00, 0xbf, 0x00, 0xbc, 0x04, 0x06, 0x04, 0x07, 0x04, 0x08, 0x04, 0x09, 0x00, 0x8c, 0x04, 0x0a, 0x04, 0x0b, 0x00, 0x98, 0x04, 0x0c, 0x00, 0x9a, 0x00, 0x99, 0x00, 0xef, 0x04, 0x0d, 0x04, 0x0e, 0x00, 0xa5, 0x00, 0x92, 0x00, 0x9c, 0x00, 0xa7, 0x00, 0x8f, 0x00, 0x94, 0x00, 0x95, 0x00, 0xb9, 0x00, 0xc0, 0x00, 0xc1, 0x04, 0x0f, 0x04, 0x10, 0x04, 0x11, 0x04, 0x12, 0x04, 0x13, 0x04, 0x14, 0x04, 0x15, 0x04, 0x16, 0x04, 0x17, 0x04, 0x18, 0x04, 0x19, 0x04, 0x1a, 0x04, 0x1b, 0x04, 0x1c, 0x04, 0x1d, 0x04, 0x1e, 0x04, 0x1f, 0x04, 0x20, 0x04, 0x21, 0x04, 0x22, 0x04, 0x23, 0x04, 0x24, 0x04, 0x25, 0x04, 0x26, 0x04, 0x27, 0x04, 0x28, 0x04, 0x29, 0x04, 0x2a, 0x04, 0x2b, 0x04, 0x2c, 0x04, 0x4e, 0x55, 0x4c, 0x4c, 0x02, 0x43, 0x52, 0x03, 0x64, 0x76, 0x41, 0x04, 0x64, 0x76, 0x41, 0x41, 0x03, 0x64, 0x76, 0x49, 0x04, 0x64, 0x76, 0x49, 0x49, 0x03, 0x64, 0x76, 0x55, 0x04, 0x64, 0x76, 0x55, 0x55, 0x04, 0x64, 0x76, 0x76, 0x52, 0x05, 0x64, 0x76, 0x76, 0x52, 0x52, 0x04, 0x64, 0x76, 0x76, 0x4c, 0x05, 0x64, 0x76, 0x76, 0x4c, 0x4c, 0x03, 0x64, 0x76, 0x45, 0x04, 0x64, 0x76, 0x41, 0x49, 0x03, 0x64, 0x76, 0x4f, 0x04, 0x64, 0x76, 0x41, 0x55, 0x09, 0x64, 0x76, 0x45, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x09, 0x64, 0x76, 0x41, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x09, 0x64, 0x76, 0x4f, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x05, 0x64, 0x76, 0x6d, 0x41, 0x41, 0x04, 0x64, 0x76, 0x6d, 0x49, 0x05, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x04, 0x64, 0x76, 0x6d, 0x55, 0x05, 0x64, 0x76, 0x6d, 0x55, 0x55, 0x05, 0x64, 0x76, 0x6d, 0x76, 0x52, 0x06, 0x64, 0x76, 0x6d, 0x76, 0x52, 0x52, 0x05, 0x64, 0x76, 0x6d, 0x76, 0x4c, 0x06, 0x64, 0x76, 0x6d, 0x76, 0x4c, 0x4c, 0x04, 0x64, 0x76, 0x6d, 0x45, 0x05, 0x64, 0x76, 0x6d, 0x41, 0x49, 0x04, 0x64, 0x76, 0x6d, 0x4f, 0x05, 0x64, 0x76, 0x6d, 0x41, 0x55, 0x0a, 0x64, 0x76, 0x6d, 0x45, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x0a, 0x64, 0x76, 0x6d, 0x4f, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x04, 0x64, 0x76, 0x4b, 0x41, 0x05, 0x64, 0x76, 0x4b, 0x48, 0x41, 0x04, 0x64, 0x76, 0x47, 0x41, 0x05, 0x64, 0x76, 0x47, 0x48, 0x41, 0x05, 0x64, 0x76, 0x4e, 0x47, 0x41, 0x04, 0x64, 0x76, 0x43, 0x41, 0x05, 0x64, 0x76, 0x43, 0x48, 0x41, 0x04, 0x64, 0x76, 0x4a, 0x41, 0x05, 0x64, 0x76, 0x4a, 0x48, 0x41, 0x05, 0x64, 0x76, 0x4e, 0x59, 0x41, 0x05, 0x64, 0x76, 0x54, 0x54, 0x41, 0x06, 0x64, 0x76, 0x54, 0x54, 0x48, 0x41, 0x05, 0x64, 0x76, 0x44, 0x44, 0x41, 0x06, 0x64, 0x76, 0x44, 0x44, 0x48, 0x41, 0x05, 0x64, 0x76, 0x4e, 0x4e, 0x41, 0x04, 0x64, 0x76, 0x54, 0x41, 0x05, 0x64, 0x76, 0x54, 0x48, 0x41, 0x04, 0x64, 0x76, 0x44, 0x41, 0x05, 0x64, 0x76, 0x44, 0x48, 0x41, 0x04, 0x64, 0x76, 0x4e, 0x41, 0x04, 0x64, 0x76, 0x50, 0x41, 0x05, 0x64, 0x76, 0x50, 0x48, 0x41, 0x04, 0x64, 0x76, 0x42, 0x41, 0x05, 0x64, 0x76, 0x42, 0x48, 0x41, 0x04, 0x64, 0x76, 0x4d, 0x41, 0x04, 0x64, 0x76, 0x59, 0x41, 0x04, 0x64, 0x76, 0x52, 0x41, 0x04, 0x64, 0x76, 0x4c, 0x41, 0x04, 0x64, 0x76, 0x56, 0x41, 0x05, 0x64, 0x76, 0x53, 0x48, 0x41, 0x05, 0x64, 0x76, 0x53, 0x53, 0x41, 0x04, 0x64, 0x76, 0x53, 0x41, 0x04, 0x64, 0x76, 0x48, 0x41, 0x05, 0x64, 0x76, 0x4c, 0x4c, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x5f, 0x4e, 0x59, 0x41, 0x05, 0x64, 0x76, 0x4b, 0x78, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x41, 0x05, 0x64, 0x76, 0x47, 0x78, 0x41, 0x05, 0x64, 0x76, 0x4a, 0x78, 0x41, 0x06, 0x64, 0x76, 0x44, 0x44, 0x78, 0x41, 0x07, 0x64, 0x76, 0x44, 0x44, 0x48, 0x78, 0x41, 0x06, 0x64, 0x76, 0x50, 0x48, 0x78, 0x41, 0x05, 0x64, 0x76, 0x52, 0x78, 0x41, 0x03, 0x64, 0x76, 0x4b, 0x04, 0x64, 0x76, 0x4b, 0x48, 0x03, 0x64, 0x76, 0x47, 0x04, 0x64, 0x76, 0x47, 0x48, 0x04, 0x64, 0x76, 0x4e, 0x47, 0x03, 0x64, 0x76, 0x43, 0x04, 0x64, 0x76, 0x43, 0x48, 0x03, 0x64, 0x76, 0x4a, 0x04, 0x64, 0x76, 0x4a, 0x48, 0x04, 0x64, 0x76, 0x4e, 0x59, 0x04, 0x64, 0x76, 0x54, 0x54, 0x05, 0x64, 0x76, 0x54, 0x54, 0x48, 0x04, 0x64, 0x76, 0x44, 0x44, 0x05, 0x64, 0x76, 0x44, 0x44, 0x48, 0x04, 0x64, 0x76, 0x4e, 0x4e, 0x03, 0x64, 0x76, 0x54, 0x04, 0x64, 0x76, 0x54, 0x48, 0x03, 0x64, 0x76, 0x44, 0x04, 0x64, 0x76, 0x44, 0x48, 0x03, 0x64, 0x76, 0x4e, 0x03, 0x64, 0x76, 0x50, 0x04, 0x64, 0x76, 0x50, 0x48, 0x03, 0x64, 0x76, 0x42, 0x04, 0x64, 0x76, 0x42, 0x48, 0x03, 0x64, 0x76, 0x4d, 0x03, 0x64, 0x76, 0x59, 0x03, 0x64, 0x76, 0x52, 0x03, 0x64, 0x76, 0x4c, 0x03, 0x64, 0x76, 0x56, 0x04, 0x64, 0x76, 0x53, 0x48, 0x04, 0x64, 0x76, 0x53, 0x53, 0x03, 0x64, 0x76, 0x53, 0x03, 0x64, 0x76, 0x48, 0x04, 0x64, 0x76, 0x4c, 0x4c, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x4e, 0x59, 0x04, 0x64, 0x76, 0x4b, 0x78, 0x05, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x04, 0x64, 0x76, 0x47, 0x78, 0x04, 0x64, 0x76, 0x4a, 0x78, 0x05, 0x64, 0x76, 0x50, 0x48, 0x78, 0x0a, 0x64, 0x76, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0d, 0x64, 0x76, 0x43, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x62, 0x69, 0x6e, 0x64, 0x75, 0x09, 0x64, 0x76, 0x56, 0x69, 0x73, 0x61, 0x72, 0x67, 0x61, 0x0a, 0x64, 0x76, 0x41, 0x76, 0x61, 0x67, 0x72, 0x61, 0x68, 0x61, 0x08, 0x64, 0x76, 0x56, 0x69, 0x72, 0x61, 0x6d, 0x61, 0x07, 0x64, 0x76, 0x4e, 0x75, 0x6b, 0x74, 0x61, 0x06, 0x64, 0x76, 0x5a, 0x65, 0x72, 0x6f, 0x05, 0x64, 0x76, 0x4f, 0x6e, 0x65, 0x05, 0x64, 0x76, 0x54, 0x77, 0x6f, 0x07, 0x64, 0x76, 0x54, 0x68, 0x72, 0x65, 0x65, 0x06, 0x64, 0x76, 0x46, 0x6f, 0x75, 0x72, 0x06, 0x64, 0x76, 0x46, 0x69, 0x76, 0x65, 0x05, 0x64, 0x76, 0x53, 0x69, 0x78, 0x07, 0x64, 0x76, 0x53, 0x65, 0x76, 0x65, 0x6e, 0x07, 0x64, 0x76, 0x45, 0x69, 0x67, 0x68, 0x74, 0x06, 0x64, 0x76, 0x4e, 0x69, 0x6e, 0x65, 0x04, 0x64, 0x76, 0x4f, 0x6d, 0x12, 0x64, 0x76, 0x41, 0x62, 0x62, 0x72, 0x65, 0x76, 0x69, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x69, 0x67, 0x6e, 0x05, 0x64, 0x61, 0x6e, 0x64, 0x61, 0x0b, 0x64, 0x6f, 0x75, 0x62, 0x6c, 0x65, 0x64, 0x61, 0x6e, 0x64, 0x61, 0x05, 0x72, 0x75, 0x70, 0x65, 0x65, 0x0b, 0x69, 0x6e, 0x64, 0x69, 0x61, 0x6e, 0x72, 0x75, 0x70, 0x65, 0x65, 0x12, 0x7a, 0x65, 0x72, 0x6f, 0x77, 0x69, 0x64, 0x74, 0x68, 0x6e, 0x6f, 0x6e, 0x6a, 0x6f, 0x69, 0x6e, 0x65, 0x72, 0x0f, 0x7a, 0x65, 0x72, 0x6f, 0x77, 0x69, 0x64, 0x74, 0x68, 0x6a, 0x6f, 0x69, 0x6e, 0x65, 0x72, 0x0c, 0x64, 0x6f, 0x74, 0x74, 0x65, 0x64, 0x63, 0x69, 0x72, 0x63, 0x6c, 0x65, 0x06, 0x64, 0x76, 0x52, 0x65, 0x70, 0x68, 0x09, 0x64, 0x76, 0x45, 0x79, 0x65, 0x6c, 0x61, 0x73, 0x68, 0x0d, 0x64, 0x76, 0x52, 0x61, 0x73, 0x68, 0x74, 0x72, 0x61, 0x73, 0x69, 0x67, 0x6e, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x47, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x47, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x43, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x43, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x54, 0x54, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x44, 0x44, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x54, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x59, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x4c, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x47, 0x78, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x78, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x52, 0x41, 0x05, 0x64, 0x76, 0x4b, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x47, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x47, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4e, 0x47, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x43, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x43, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x4a, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4a, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x52, 0x07, 0x64, 0x76, 0x54, 0x54, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x52, 0x07, 0x64, 0x76, 0x44, 0x44, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x54, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x54, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x44, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x4e, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x50, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x42, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x4d, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x59, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x4c, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x56, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x53, 0x5f, 0x52, 0x05, 0x64, 0x76, 0x48, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4c, 0x4c, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x52, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x47, 0x78, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4a, 0x78, 0x5f, 0x52, 0x07, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x52, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x4b, 0x78, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x4b, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x43, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x4a, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x4e, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x54, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x50, 0x48, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x50, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x50, 0x48, 0x78, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x42, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x78, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x56, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x5f, 0x4d, 0x41, 0x0b, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x53, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x5f, 0x54, 0x54, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x5f, 0x44, 0x44, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x5f, 0x54, 0x41, 0x0a, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x0a, 0x64, 0x76, 0x4b, 0x5f, 0x53, 0x5f, 0x50, 0x5f, 0x4c, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x4b, 0x48, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x4d, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x5f, 0x53, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x53, 0x48, 0x41, 0x08, 0x64, 0x76, 0x4b, 0x48, 0x78, 0x5f, 0x53, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x47, 0x41, 0x07, 0x64, 0x76, 0x47, 0x5f, 0x47, 0x48, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x4a, 0x41, 0x07, 0x64, 0x76, 0x47, 0x5f, 0x4e, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x44, 0x41, 0x07, 0x64, 0x76, 0x47, 0x5f, 0x44, 0x48, 0x41, 0x09, 0x64, 0x76, 0x47, 0x5f, 0x44, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x47, 0x5f, 0x44, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x4e, 0x41, 0x08, 0x64, 0x76, 0x47, 0x5f, 0x4e, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x42, 0x41, 0x07, 0x64, 0x76, 0x47, 0x5f, 0x42, 0x48, 0x41, 0x09, 0x64, 0x76, 0x47, 0x5f, 0x42, 0x48, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x47, 0x5f, 0x52, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x47, 0x5f, 0x53, 0x41, 0x07, 0x64, 0x76, 0x47, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x47, 0x48, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x47, 0x48, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x43, 0x5f, 0x43, 0x41, 0x07, 0x64, 0x76, 0x43, 0x5f, 0x43, 0x48, 0x41, 0x09, 0x64, 0x76, 0x43, 0x5f, 0x43, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x43, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x43, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x43, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x43, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x43, 0x48, 0x5f, 0x52, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x4b, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x4a, 0x41, 0x08, 0x64, 0x76, 0x4a, 0x78, 0x5f, 0x4a, 0x78, 0x41, 0x09, 0x64, 0x76, 0x4a, 0x5f, 0x4a, 0x5f, 0x4e, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4a, 0x5f, 0x4a, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4a, 0x5f, 0x4a, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x5f, 0x4a, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4a, 0x5f, 0x4e, 0x59, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x5f, 0x54, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x5f, 0x44, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x54, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x42, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x78, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4a, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x48, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x4a, 0x48, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x43, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x43, 0x48, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x4a, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x59, 0x5f, 0x53, 0x48, 0x41, 0x08, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x54, 0x54, 0x41, 0x09, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x07, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x54, 0x54, 0x5f, 0x56, 0x41, 0x0a, 0x64, 0x76, 0x54, 0x54, 0x48, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x08, 0x64, 0x76, 0x54, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x54, 0x54, 0x48, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x44, 0x44, 0x41, 0x09, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x44, 0x44, 0x48, 0x41, 0x07, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x44, 0x44, 0x5f, 0x56, 0x41, 0x0a, 0x64, 0x76, 0x44, 0x44, 0x48, 0x5f, 0x44, 0x44, 0x48, 0x41, 0x08, 0x64, 0x76, 0x44, 0x44, 0x48, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x44, 0x44, 0x48, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x54, 0x54, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x44, 0x44, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x44, 0x44, 0x48, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x4e, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x4e, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x5f, 0x56, 0x41, 0x09, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x5f, 0x53, 0x53, 0x41, 0x07, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x48, 0x41, 0x09, 0x64, 0x76, 0x54, 0x5f, 0x4b, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x54, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x54, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x54, 0x5f, 0x54, 0x48, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x4e, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x4e, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x50, 0x5f, 0x4c, 0x41, 0x07, 0x64, 0x76, 0x54, 0x5f, 0x50, 0x48, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x4d, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x52, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x54, 0x5f, 0x53, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x53, 0x5f, 0x4e, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x53, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x54, 0x5f, 0x53, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x54, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x54, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x47, 0x41, 0x08, 0x64, 0x76, 0x44, 0x5f, 0x47, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x44, 0x5f, 0x47, 0x48, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x44, 0x41, 0x07, 0x64, 0x76, 0x44, 0x5f, 0x44, 0x48, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x42, 0x41, 0x08, 0x64, 0x76, 0x44, 0x5f, 0x42, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x44, 0x5f, 0x42, 0x48, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x44, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x4e, 0x41, 0x09, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x4e, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x44, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x4b, 0x5f, 0x53, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x43, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x43, 0x48, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x5f, 0x53, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x54, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x48, 0x5f, 0x52, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x44, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x4e, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x4e, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x50, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x50, 0x48, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4e, 0x5f, 0x42, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x42, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x42, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x4d, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x53, 0x41, 0x09, 0x64, 0x76, 0x4e, 0x5f, 0x53, 0x5f, 0x54, 0x54, 0x41, 0x0a, 0x64, 0x76, 0x4e, 0x5f, 0x53, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4e, 0x5f, 0x53, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4e, 0x5f, 0x48, 0x41, 0x07, 0x64, 0x76, 0x50, 0x5f, 0x54, 0x54, 0x41, 0x08, 0x64, 0x76, 0x50, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x50, 0x5f, 0x54, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x50, 0x41, 0x07, 0x64, 0x76, 0x50, 0x5f, 0x50, 0x48, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x50, 0x5f, 0x53, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x4a, 0x41, 0x09, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x4a, 0x78, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x54, 0x54, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x54, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x50, 0x48, 0x41, 0x0a, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x50, 0x48, 0x78, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x4c, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x5f, 0x53, 0x48, 0x41, 0x08, 0x64, 0x76, 0x50, 0x48, 0x78, 0x5f, 0x53, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x4a, 0x41, 0x07, 0x64, 0x76, 0x42, 0x5f, 0x4a, 0x78, 0x41, 0x08, 0x64, 0x76, 0x42, 0x5f, 0x4a, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x42, 0x5f, 0x4a, 0x48, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x54, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x44, 0x41, 0x07, 0x64, 0x76, 0x42, 0x5f, 0x44, 0x48, 0x41, 0x09, 0x64, 0x76, 0x42, 0x5f, 0x44, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x42, 0x41, 0x07, 0x64, 0x76, 0x42, 0x5f, 0x42, 0x48, 0x41, 0x09, 0x64, 0x76, 0x42, 0x5f, 0x42, 0x48, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x4c, 0x41, 0x08, 0x64, 0x76, 0x42, 0x5f, 0x4c, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x42, 0x5f, 0x53, 0x48, 0x41, 0x06, 0x64, 0x76, 0x42, 0x5f, 0x53, 0x41, 0x07, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x52, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x4c, 0x41, 0x07, 0x64, 0x76, 0x42, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x54, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x4d, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x41, 0x08, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x48, 0x5f, 0x59, 0x41, 0x09, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x48, 0x5f, 0x52, 0x41, 0x09, 0x64, 0x76, 0x4d, 0x5f, 0x42, 0x48, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4d, 0x5f, 0x53, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x53, 0x41, 0x06, 0x64, 0x76, 0x4d, 0x5f, 0x48, 0x41, 0x06, 0x64, 0x76, 0x59, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x59, 0x5f, 0x59, 0x41, 0x0c, 0x64, 0x76, 0x45, 0x79, 0x65, 0x6c, 0x61, 0x73, 0x68, 0x5f, 0x59, 0x41, 0x0c, 0x64, 0x76, 0x45, 0x79, 0x65, 0x6c, 0x61, 0x73, 0x68, 0x5f, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x4c, 0x5f, 0x4b, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x4b, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x47, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x4a, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x4a, 0x78, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x54, 0x54, 0x41, 0x08, 0x64, 0x76, 0x4c, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x44, 0x44, 0x41, 0x08, 0x64, 0x76, 0x4c, 0x5f, 0x44, 0x44, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x54, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x54, 0x48, 0x41, 0x09, 0x64, 0x76, 0x4c, 0x5f, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x44, 0x41, 0x08, 0x64, 0x76, 0x4c, 0x5f, 0x44, 0x5f, 0x52, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x50, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x50, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x42, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x5f, 0x42, 0x48, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x4c, 0x41, 0x08, 0x64, 0x76, 0x4c, 0x5f, 0x4c, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x56, 0x41, 0x09, 0x64, 0x76, 0x4c, 0x5f, 0x56, 0x5f, 0x44, 0x44, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x53, 0x41, 0x06, 0x64, 0x76, 0x4c, 0x5f, 0x48, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x56, 0x5f, 0x48, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x4b, 0x78, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x43, 0x41, 0x08, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x43, 0x48, 0x41, 0x08, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x54, 0x54, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x54, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x4e, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x4d, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x4c, 0x41, 0x07, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x53, 0x48, 0x5f, 0x53, 0x48, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4b, 0x41, 0x09, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4b, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x41, 0x0a, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x5f, 0x59, 0x41, 0x0a, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x5f, 0x52, 0x41, 0x0a, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x5f, 0x56, 0x41, 0x09, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x48, 0x41, 0x0b, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x0b, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x54, 0x54, 0x48, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4e, 0x4e, 0x41, 0x0a, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4e, 0x4e, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x50, 0x41, 0x09, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x50, 0x48, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4d, 0x41, 0x09, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x59, 0x41, 0x07, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x56, 0x41, 0x08, 0x64, 0x76, 0x53, 0x53, 0x5f, 0x53, 0x53, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x4b, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x4b, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x4b, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x53, 0x5f, 0x4b, 0x48, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x4a, 0x41, 0x07, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x54, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x5f, 0x59, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x5f, 0x52, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x48, 0x41, 0x09, 0x64, 0x76, 0x53, 0x5f, 0x54, 0x48, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x44, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x50, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x50, 0x5f, 0x52, 0x41, 0x07, 0x64, 0x76, 0x53, 0x5f, 0x50, 0x48, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x42, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x4d, 0x41, 0x08, 0x64, 0x76, 0x53, 0x5f, 0x4d, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x56, 0x41, 0x06, 0x64, 0x76, 0x53, 0x5f, 0x53, 0x41, 0x07, 0x64, 0x76, 0x48, 0x5f, 0x4e, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x4e, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x4d, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x59, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x4c, 0x41, 0x06, 0x64, 0x76, 0x48, 0x5f, 0x56, 0x41, 0x07, 0x64, 0x76, 0x4c, 0x4c, 0x5f, 0x59, 0x41, 0x0b, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x2e, 0x61, 0x4c, 0x6f, 0x6e, 0x67, 0x0f, 0x64, 0x76, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0e, 0x64, 0x76, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x2e, 0x61, 0x6d, 0x49, 0x0a, 0x64, 0x76, 0x52, 0x65, 0x70, 0x68, 0x2e, 0x61, 0x6d, 0x49, 0x13, 0x64, 0x76, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x2e, 0x61, 0x6d, 0x49, 0x0d, 0x64, 0x76, 0x49, 0x49, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0e, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0a, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x13, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x14, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x2e, 0x61, 0x4c, 0x6f, 0x6e, 0x67, 0x10, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x2e, 0x61, 0x4c, 0x6f, 0x6e, 0x67, 0x19, 0x64, 0x76, 0x6d, 0x49, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x2e, 0x61, 0x4c, 0x6f, 0x6e, 0x67, 0x0d, 0x64, 0x76, 0x6d, 0x45, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x09, 0x64, 0x76, 0x6d, 0x45, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x12, 0x64, 0x76, 0x6d, 0x45, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0e, 0x64, 0x76, 0x6d, 0x41, 0x49, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0a, 0x64, 0x76, 0x6d, 0x41, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x13, 0x64, 0x76, 0x6d, 0x41, 0x49, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0d, 0x64, 0x76, 0x6d, 0x4f, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x09, 0x64, 0x76, 0x6d, 0x4f, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x12, 0x64, 0x76, 0x6d, 0x4f, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0e, 0x64, 0x76, 0x6d, 0x41, 0x55, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x0a, 0x64, 0x76, 0x6d, 0x41, 0x55, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x13, 0x64, 0x76, 0x6d, 0x41, 0x55, 0x5f, 0x52, 0x65, 0x70, 0x68, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x13, 0x64, 0x76, 0x6d, 0x45, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x13, 0x64, 0x76, 0x6d, 0x4f, 0x63, 0x61, 0x6e, 0x64, 0x72, 0x61, 0x5f, 0x41, 0x6e, 0x75, 0x73, 0x76, 0x61, 0x72, 0x61, 0x07, 0x64, 0x76, 0x52, 0x41, 0x5f, 0x6d, 0x55, 0x08, 0x64, 0x76, 0x52, 0x41, 0x5f, 0x6d, 0x55, 0x55, 0x07, 0x64, 0x76, 0x48, 0x41, 0x5f, 0x6d, 0x55, 0x08, 0x64, 0x76, 0x48, 0x41, 0x5f, 0x6d, 0x55, 0x55, 0x08, 0x64, 0x76, 0x44, 0x41, 0x5f, 0x6d, 0x76, 0x52, 0x09, 0x64, 0x76, 0x53, 0x48, 0x41, 0x5f, 0x6d, 0x76, 0x52, 0x08, 0x64, 0x76, 0x48, 0x41, 0x5f, 0x6d, 0x76, 0x52, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x31, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x32, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x33, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x34, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x35, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x36, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x37, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x38, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x30, 0x39, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x30, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x31, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x32, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x33, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x34, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x35, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x36, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x37, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x38, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x31, 0x39, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x32, 0x30, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x32, 0x31, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x32, 0x32, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x32, 0x33, 0x08, 0x64, 0x76, 0x6d, 0x49, 0x2e, 0x61, 0x32, 0x34, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x30, 0x41, 0x30, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x30, 0x41, 0x44, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x30, 0x42, 0x35, 0x07, 0x41, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x61, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x06, 0x41, 0x62, 0x72, 0x65, 0x76, 0x65, 0x06, 0x61, 0x62, 0x72, 0x65, 0x76, 0x65, 0x07, 0x41, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x07, 0x61, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x0a, 0x43, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x0a, 0x63, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x06, 0x44, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x64, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x44, 0x63, 0x72, 0x6f, 0x61, 0x74, 0x07, 0x45, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x65, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x06, 0x45, 0x62, 0x72, 0x65, 0x76, 0x65, 0x06, 0x65, 0x62, 0x72, 0x65, 0x76, 0x65, 0x0a, 0x45, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x0a, 0x65, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x07, 0x45, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x07, 0x65, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x06, 0x45, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x65, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x0a, 0x47, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x0a, 0x67, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x32, 0x32, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x32, 0x33, 0x06, 0x49, 0x74, 0x69, 0x6c, 0x64, 0x65, 0x06, 0x69, 0x74, 0x69, 0x6c, 0x64, 0x65, 0x07, 0x49, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x69, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x32, 0x43, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x32, 0x44, 0x07, 0x49, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x07, 0x69, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x33, 0x36, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x33, 0x37, 0x06, 0x4c, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x6c, 0x61, 0x63, 0x75, 0x74, 0x65, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x33, 0x42, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x33, 0x43, 0x06, 0x4c, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x6c, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x04, 0x4c, 0x64, 0x6f, 0x74, 0x04, 0x6c, 0x64, 0x6f, 0x74, 0x06, 0x4e, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x6e, 0x61, 0x63, 0x75, 0x74, 0x65, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x34, 0x35, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x34, 0x36, 0x06, 0x4e, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x6e, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x07, 0x4f, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x6f, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x34, 0x45, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x34, 0x46, 0x0d, 0x4f, 0x68, 0x75, 0x6e, 0x67, 0x61, 0x72, 0x75, 0x6d, 0x6c, 0x61, 0x75, 0x74, 0x0d, 0x6f, 0x68, 0x75, 0x6e, 0x67, 0x61, 0x72, 0x75, 0x6d, 0x6c, 0x61, 0x75, 0x74, 0x06, 0x52, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x72, 0x61, 0x63, 0x75, 0x74, 0x65, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x35, 0x36, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x35, 0x37, 0x06, 0x52, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x72, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x53, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x73, 0x61, 0x63, 0x75, 0x74, 0x65, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x35, 0x45, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x35, 0x46, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x36, 0x32, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x36, 0x33, 0x06, 0x54, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x74, 0x63, 0x61, 0x72, 0x6f, 0x6e, 0x06, 0x55, 0x74, 0x69, 0x6c, 0x64, 0x65, 0x06, 0x75, 0x74, 0x69, 0x6c, 0x64, 0x65, 0x07, 0x55, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x07, 0x75, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x06, 0x55, 0x62, 0x72, 0x65, 0x76, 0x65, 0x06, 0x75, 0x62, 0x72, 0x65, 0x76, 0x65, 0x05, 0x55, 0x72, 0x69, 0x6e, 0x67, 0x05, 0x75, 0x72, 0x69, 0x6e, 0x67, 0x0d, 0x55, 0x68, 0x75, 0x6e, 0x67, 0x61, 0x72, 0x75, 0x6d, 0x6c, 0x61, 0x75, 0x74, 0x0d, 0x75, 0x68, 0x75, 0x6e, 0x67, 0x61, 0x72, 0x75, 0x6d, 0x6c, 0x61, 0x75, 0x74, 0x07, 0x55, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x07, 0x75, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x0b, 0x57, 0x63, 0x69, 0x72, 0x63, 0x75, 0x6d, 0x66, 0x6c, 0x65, 0x78, 0x0b, 0x77, 0x63, 0x69, 0x72, 0x63, 0x75, 0x6d, 0x66, 0x6c, 0x65, 0x78, 0x0b, 0x59, 0x63, 0x69, 0x72, 0x63, 0x75, 0x6d, 0x66, 0x6c, 0x65, 0x78, 0x0b, 0x79, 0x63, 0x69, 0x72, 0x63, 0x75, 0x6d, 0x66, 0x6c, 0x65, 0x78, 0x06, 0x5a, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x7a, 0x61, 0x63, 0x75, 0x74, 0x65, 0x0a, 0x5a, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x0a, 0x7a, 0x64, 0x6f, 0x74, 0x61, 0x63, 0x63, 0x65, 0x6e, 0x74, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x38, 0x46, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x46, 0x43, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x31, 0x46, 0x44, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x31, 0x38, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x31, 0x39, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x31, 0x41, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x31, 0x42, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x35, 0x39, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x42, 0x43, 0x07, 0x75, 0x6e, 0x69, 0x30, 0x32, 0x43, 0x39, 0x06, 0x57, 0x67, 0x72, 0x61, 0x76, 0x65, 0x06, 0x77, 0x67, 0x72, 0x61, 0x76, 0x65, 0x06, 0x57, 0x61, 0x63, 0x75, 0x74, 0x65, 0x06, 0x77, 0x61, 0x63, 0x75, 0x74, 0x65, 0x09, 0x57, 0x64, 0x69, 0x65, 0x72, 0x65, 0x73, 0x69, 0x73, 0x09, 0x77, 0x64, 0x69, 0x65, 0x72, 0x65, 0x73, 0x69, 0x73, 0x07, 0x75, 0x6e, 0x69, 0x31, 0x45, 0x42, 0x43, 0x07, 0x75, 0x6e, 0x69, 0x31, 0x45, 0x42, 0x44, 0x06, 0x59, 0x67, 0x72, 0x61, 0x76, 0x65, 0x06, 0x79, 0x67, 0x72, 0x61, 0x76, 0x65, 0x07, 0x75, 0x6e, 0x69, 0x31, 0x45, 0x46, 0x38, 0x07, 0x75, 0x6e, 0x69, 0x31, 0x45, 0x46, 0x39, 0x04, 0x45, 0x75, 0x72, 0x6f, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x30, 0x42, 0x41, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x30, 0x42, 0x44, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x31, 0x31, 0x33, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x31, 0x32, 0x36, 0x09, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x64, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x32, 0x30, 0x36, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x32, 0x31, 0x35, 0x07, 0x75, 0x6e, 0x69, 0x32, 0x32, 0x31, 0x39, 0x0b, 0x65, 0x78, 0x63, 0x6c, 0x61, 0x6d, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0a, 0x63, 0x6f, 0x6d, 0x6d, 0x61, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0b, 0x70, 0x65, 0x72, 0x69, 0x6f, 0x64, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0a, 0x63, 0x6f, 0x6c, 0x6f, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0e, 0x73, 0x65, 0x6d, 0x69, 0x63, 0x6f, 0x6c, 0x6f, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0d, 0x71, 0x75, 0x65, 0x73, 0x74, 0x69, 0x6f, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0f, 0x65, 0x78, 0x63, 0x6c, 0x61, 0x6d, 0x64, 0x6f, 0x77, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x13, 0x70, 0x65, 0x72, 0x69, 0x6f, 0x64, 0x63, 0x65, 0x6e, 0x74, 0x65, 0x72, 0x65, 0x64, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x11, 0x71, 0x75, 0x65, 0x73, 0x74, 0x69, 0x6f, 0x6e, 0x64, 0x6f, 0x77, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0b, 0x64, 0x69, 0x76, 0x69, 0x64, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0e, 0x71, 0x75, 0x6f, 0x74, 0x65, 0x6c, 0x65, 0x66, 0x74, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0f, 0x71, 0x75, 0x6f, 0x74, 0x65, 0x72, 0x69, 0x67, 0x68, 0x74, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x11, 0x71, 0x75, 0x6f, 0x74, 0x65, 0x64, 0x62, 0x6c, 0x6c, 0x65, 0x66, 0x74, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x12, 0x71, 0x75, 0x6f, 0x74, 0x65, 0x64, 0x62, 0x6c, 0x72, 0x69, 0x67, 0x68, 0x74, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x0d, 0x65, 0x6c, 0x6c, 0x69, 0x70, 0x73, 0x69, 0x73, 0x2e, 0x73, 0x73, 0x30, 0x31, 0x06, 0x61, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0b, 0x61, 0x61, 0x63, 0x75, 0x74, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0b, 0x61, 0x62, 0x72, 0x65, 0x76, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x10, 0x61, 0x63, 0x69, 0x72, 0x63, 0x75, 0x6d, 0x66, 0x6c, 0x65, 0x78, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0e, 0x61, 0x64, 0x69, 0x65, 0x72, 0x65, 0x73, 0x69, 0x73, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0b, 0x61, 0x67, 0x72, 0x61, 0x76, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0c, 0x61, 0x6d, 0x61, 0x63, 0x72, 0x6f, 0x6e, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0c, 0x61, 0x6f, 0x67, 0x6f, 0x6e, 0x65, 0x6b, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0a, 0x61, 0x72, 0x69, 0x6e, 0x67, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0b, 0x61, 0x74, 0x69, 0x6c, 0x64, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x32, 0x0e, 0x61, 0x6d, 0x70, 0x65, 0x72, 0x73, 0x61, 0x6e, 0x64, 0x2e, 0x73, 0x73, 0x30, 0x33, 0x08, 0x74, 0x77, 0x6f, 0x2e, 0x73, 0x73, 0x30, 0x34, 0x0a, 0x74, 0x68, 0x72, 0x65, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x34, 0x08, 0x73, 0x69, 0x78, 0x2e, 0x73, 0x73, 0x30, 0x34, 0x09, 0x6e, 0x69, 0x6e, 0x65, 0x2e, 0x73, 0x73, 0x30, 0x34, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x96, 0x02, 0x32, 0x00, 0x03, 0x44, 0x46, 0x4c, 0x54, 0x00, 0x64, 0x64, 0x65, 0x76, 0x32, 0x00, 0x3c, 0x64, 0x65, 0x76, 0x61, 0x00, 0x14, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0f, 0x00, 0x02, 0x00, 0x05, 0x00, 0x08, 0x00, 0x0b, 0x00, 0x0e, 0x00, 0x11, 0x00, 0x14, 0x00, 0x17, 0x00, 0x1a, 0x00, 0x1f, 0x00, 0x22, 0x00, 0x25, 0x00, 0x28, 0x00, 0x2b, 0x00, 0x2c, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0f, 0x00, 0x01, 0x00, 0x04, 0x00, 0x07, 0x00, 0x0a, 0x00, 0x0d, 0x00, 0x10, 0x00, 0x13, 0x00, 0x16, 0x00, 0x19, 0x00, 0x1c, 0x00, 0x1e, 0x00, 0x21, 0x00, 0x24, 0x00, 0x27, 0x00, 0x2a, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x03, 0x00, 0x06, 0x00, 0x09, 0x00, 0x0c, 0x00, 0x0f, 0x00, 0x12, 0x00, 0x15, 0x00, 0x18, 0x00, 0x1b, 0x00, 0x1d, 0x00, 0x20, 0x00, 0x23, 0x00, 0x26, 0x00, 0x29, 0x00, 0x2d, 0x61, 0x62, 0x76, 0x73, 0x01, 0x92, 0x61, 0x62, 0x76, 0x73, 0x01, 0x92, 0x61, 0x62, 0x76, 0x73, 0x01, 0x92, 0x61, 0x6b, 0x68, 0x6e, 0x01, 0x8a, 0x61, 0x6b, 0x68, 0x6e, 0x01, 0x8a, 0x61, 0x6b, 0x68, 0x6e, 0x01, 0x84, 0x62, 0x6c, 0x77, 0x66, 0x01, 0x7e, 0x62, 0x6c, 0x77, 0x66, 0x01, 0x7e, 0x62, 0x6c, 0x77, 0x66, 0x01, 0x78, 0x62, 0x6c, 0x77, 0x73, 0x01, 0x72, 0x62, 0x6c, 0x77, 0x73, 0x01, 0x72, 0x62, 0x6c, 0x77, 0x73, 0x01, 0x72, 0x68, 0x61, 0x6c, 0x66, 0x01, 0x6a, 0x68, 0x61, 0x6c, 0x66, 0x01, 0x6a, 0x68, 0x61, 0x6c, 0x66, 0x01, 0x64, 0x68, 0x61, 0x6c, 0x6e, 0x01, 0x5e, 0x68, 0x61, 0x6c, 0x6e, 0x01, 0x5e, 0x68, 0x61, 0x6c, 0x6e, 0x01, 0x5e, 0x6e, 0x75, 0x6b, 0x74, 0x01, 0x58, 0x6e, 0x75, 0x6b, 0x74, 0x01, 0x58, 0x6e, 0x75, 0x6b, 0x74, 0x01, 0x58, 0x70, 0x72, 0x65, 0x73, 0x01, 0x50, 0x70, 0x72, 0x65, 0x73, 0x01, 0x50, 0x70, 0x72, 0x65, 0x73, 0x01, 0x50, 0x70, 0x73, 0x74, 0x73, 0x01, 0x4a, 0x70, 0x73, 0x74, 0x73, 0x01, 0x4a, 0x70, 0x73, 0x74, 0x73, 0x01, 0x4a, 0x72, 0x6b, 0x72, 0x66, 0x01, 0x44, 0x72, 0x6b, 0x72, 0x66, 0x01, 0x44, 0x72, 0x70, 0x68, 0x66, 0x01, 0x3e, 0x72, 0x70, 0x68, 0x66, 0x01, 0x3e, 0x72, 0x70, 0x68, 0x66, 0x01, 0x3e, 0x73, 0x73, 0x30, 0x31, 0x01, 0x34, 0x73, 0x73, 0x30, 0x31, 0x01, 0x34, 0x73, 0x73, 0x30, 0x31, 0x01, 0x34, 0x73, 0x73, 0x30, 0x32, 0x01, 0x2a, 0x73, 0x73, 0x30, 0x32, 0x01, 0x2a, 0x73, 0x73, 0x30, 0x32, 0x01, 0x2a, 0x73, 0x73, 0x30, 0x33, 0x01, 0x20, 0x73, 0x73, 0x30, 0x33, 0x01, 0x20, 0x73, 0x73, 0x30, 0x33, 0x01, 0x20, 0x73, 0x73, 0x30, 0x34, 0x01, 0x16, 0x73, 0x73, 0x30, 0x34, 0x01, 0x16, 0x73, 0x73, 0x30, 0x34, 0x01, 0x16, 0x76, 0x61, 0x74, 0x75, 0x01, 0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x09, 0x00, 0x06, 0x00, 0x01, 0x00, 0x17, 0x00, 0x00, 0x01, 0x03, 0x00, 0x06, 0x00, 0x01, 0x00, 0x16, 0x00, 0x00, 0x01, 0x02, 0x00, 0x06, 0x00, 0x01, 0x00, 0x15, 0x00, 0x00, 0x01, 0x01, 0x00, 0x06, 0x00, 0x01, 0x00, 0x14, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x12, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0a, 0x00, 0x0b, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x13, 0x00, 0x00, 0x00, 0x01, 0x00, 0x07, 0x00, 0x00, 0x00, 0x02, 0x00, 0x07, 0x00, 0x08, 0x00, 0x00, 0x00, 0x01, 0x00, 0x11, 0x00, 0x00, 0x00, 0x01, 0x00, 0x06, 0x00, 0x00, 0x00, 0x01, 0x00, 0x05, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x00, 0x0e, 0x00, 0x0f, 0x00, 0x10, 0x00, 0x34, 0x23, 0xc2, 0x23, 0x90, 0x23, 0x62, 0x23, 0x48, 0x21, 0x0a, 0x20, 0xf0, 0x20, 0xd6, 0x1e, 0xca, 0x1c, 0xea, 0x19, 0x1e, 0x0b, 0xc4, 0x05, 0xe6, 0x05, 0x78, 0x05, 0x58, 0x05, 0x3a, 0x04, 0x50, 0x04, 0x0a, 0x03, 0xa8, 0x03, 0x3a, 0x02, 0xe2, 0x02, 0x94, 0x02, 0x5a, 0x02, 0x46, 0x02, 0x24, 0x02, 0x14, 0x02, 0x06, 0x01, 0xf8, 0x01, 0xea, 0x01, 0xdc, 0x01, 0xce, 0x01, 0xc0, 0x01, 0xb2, 0x01, 0xa4, 0x01, 0x96, 0x01, 0x88, 0x01, 0x7a, 0x01, 0x6c, 0x01, 0x5e, 0x01, 0x50, 0x01, 0x42, 0x01, 0x34, 0x01, 0x26, 0x01, 0x18, 0x01, 0x0a, 0x00, 0xfc, 0x00, 0xee, 0x00, 0xe0, 0x00, 0xd2, 0x00, 0xb8, 0x00, 0xaa, 0x00, 0x9c, 0x00, 0x6a, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x16, 0x00, 0x08, 0x02, 0x5b, 0x00, 0x0d, 0x02, 0x5d, 0x02, 0x5e, 0x02, 0x5f, 0x02, 0x64, 0x02, 0x65, 0x02, 0x66, 0x00, 0x01, 0x00, 0x08, 0x00, 0x17, 0x00, 0x3e, 0x00, 0x79, 0x00, 0x92, 0x02, 0x5c, 0x02, 0x61, 0x02, 0x62, 0x02, 0x63, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x22, 0xe6, 0xff, 0xce, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x22, 0xd8, 0xff, 0xcd, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x0a, 0x00, 0x02, 0x02, 0x93, 0x00, 0x0a, 0x00, 0x01, 0x00, 0x02, 0x00, 0x16, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0xe4, 0x02, 0x7c, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0xd6, 0x02, 0x7b, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0xc8, 0x02, 0x7a, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0xba, 0x02, 0x79, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0xac, 0x02, 0x78, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x9e, 0x02, 0x77, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x90, 0x02, 0x76, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x82, 0x02, 0x75, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x74, 0x02, 0x74, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x66, 0x02, 0x73, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x58, 0x02, 0x72, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x4a, 0x02, 0x71, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x3c, 0x02, 0x70, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x2e, 0x02, 0x6f, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x20, 0x02, 0x6e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x12, 0x02, 0x6d, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0a, 0x04, 0x02, 0x6c, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xf6, 0x02, 0x6b, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xe8, 0x02, 0x6a, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xda, 0x02, 0x69, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xcc, 0x02, 0x68, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xbe, 0x02, 0x67, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x09, 0xb0, 0x02, 0x66, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x21, 0x6e, 0x00, 0x01, 0x1d, 0x9c, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x0e, 0x00, 0x04, 0x04, 0x1f, 0x04, 0x20, 0x04, 0x21, 0x04, 0x22, 0x00, 0x01, 0x00, 0x04, 0x02, 0xa5, 0x02, 0xa6, 0x02, 0xa9, 0x02, 0xac, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x06, 0x01, 0x85, 0x00, 0x01, 0x00, 0x01, 0x02, 0x99, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x0a, 0x04, 0x14, 0x04, 0x19, 0x04, 0x15, 0x04, 0x17, 0x04, 0x1d, 0x04, 0x18, 0x04, 0x1c, 0x04, 0x1a, 0x04, 0x16, 0x04, 0x1b, 0x00, 0x01, 0x00, 0x0a, 0x02, 0xd4, 0x03, 0x32, 0x03, 0x33, 0x03, 0x34, 0x03, 0x35, 0x03, 0x36, 0x03, 0x37, 0x03, 0x53, 0x03, 0x55, 0x03, 0x57, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x24, 0x00, 0x0f, 0x04, 0x05, 0x04, 0x06, 0x04, 0x07, 0x04, 0x08, 0x04, 0x09, 0x04, 0x0a, 0x04, 0x0b, 0x04, 0x0c, 0x04, 0x0d, 0x04, 0x0e, 0x04, 0x0f, 0x04, 0x10, 0x04, 0x11, 0x04, 0x12, 0x04, 0x13, 0x00, 0x01, 0x00, 0x0f, 0x02, 0x94, 0x02, 0x9f, 0x02, 0xa1, 0x02, 0xad, 0x02, 0xae, 0x02, 0xb2, 0x02, 0xf3, 0x03, 0x09, 0x03, 0x11, 0x03, 0x49, 0x03, 0xdf, 0x03, 0xe0, 0x03, 0xe2, 0x03, 0xe3, 0x03, 0xe8, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x2e, 0x00, 0x0f, 0x1d, 0xaa, 0x1d, 0x6e, 0x1d, 0x64, 0x1d, 0x5a, 0x1d, 0x50, 0x1d, 0x28, 0x00, 0x24, 0x1c, 0x92, 0x1b, 0xa4, 0x1b, 0x68, 0x1b, 0x5e, 0x1b, 0x54, 0x1b, 0x4a, 0x1b, 0x22, 0x1a, 0x96, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6a, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x0f, 0x00, 0x28, 0x00, 0x2e, 0x00, 0x2f, 0x00, 0x30, 0x00, 0x31, 0x00, 0x35, 0x00, 0x3e, 0x00, 0x44, 0x00, 0x99, 0x00, 0x9f, 0x00, 0xa0, 0x00, 0xa1, 0x00, 0xa2, 0x00, 0xa6, 0x00, 0xb4, 0x00, 0x06, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x03, 0x00, 0x01, 0x00, 0x1e, 0x00, 0x01, 0x00, 0x12, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x33, 0x00, 0x01, 0x00, 0x04, 0x00, 0x17, 0x02, 0x61, 0x02, 0x62, 0x02, 0x63, 0x00, 0x01, 0x00, 0x22, 0x00, 0x24, 0x00, 0x39, 0x00, 0x48, 0x00, 0x4e, 0x00, 0x95, 0x00, 0xaa, 0x00, 0xb6, 0x00, 0xba, 0x00, 0xe1, 0x00, 0xe2, 0x00, 0xe8, 0x00, 0xf2, 0x00, 0xf3, 0x00, 0xf4, 0x01, 0x32, 0x01, 0x61, 0x01, 0x63, 0x01, 0x71, 0x01, 0x90, 0x01, 0xa8, 0x01, 0xa9, 0x01, 0xbc, 0x01, 0xc9, 0x01, 0xca, 0x01, 0xfd, 0x02, 0x0d, 0x02, 0x1d, 0x02, 0x1e, 0x02, 0x29, 0x02, 0x2a, 0x02, 0x36, 0x02, 0x3c, 0x02, 0x3d, 0x02, 0x4c, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x4e, 0x00, 0x04, 0x00, 0x44, 0x00, 0x32, 0x00, 0x28, 0x00, 0x0e, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x7b, 0x00, 0x02, 0x00, 0x1a, 0x02, 0x78, 0x00, 0x02, 0x00, 0x19, 0x02, 0x77, 0x00, 0x02, 0x00, 0x18, 0x00, 0x01, 0x00, 0x04, 0x02, 0x7a, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x02, 0x00, 0x0c, 0x00, 0x06, 0x02, 0x76, 0x00, 0x02, 0x00, 0x19, 0x02, 0x75, 0x00, 0x02, 0x00, 0x18, 0x00, 0x01, 0x00, 0x04, 0x02, 0x79, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x01, 0x00, 0x04, 0x00, 0x35, 0x00, 0x3e, 0x00, 0x41, 0x00, 0x44, 0x00, 0x06, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x03, 0x00, 0x02, 0x00, 0x28, 0x00, 0x1e, 0x00, 0x01, 0x00, 0x14, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x33, 0x00, 0x01, 0x00, 0x03, 0x00, 0x79, 0x00, 0x92, 0x02, 0x5c, 0x00, 0x02, 0x00, 0x01, 0x02, 0x7c, 0x02, 0x93, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x24, 0x00, 0x4f, 0x00, 0x00, 0x00, 0x95, 0x00, 0xba, 0x00, 0x2c, 0x00, 0xe1, 0x02, 0x5a, 0x00, 0x52, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0xcc, 0x00, 0x09, 0x00, 0xc2, 0x00, 0xa6, 0x00, 0x8a, 0x00, 0x6e, 0x00, 0x52, 0x00, 0x36, 0x00, 0x2c, 0x00, 0x22, 0x00, 0x18, 0x00, 0x01, 0x00, 0x04, 0x02, 0x5c, 0x00, 0x02, 0x00, 0x79, 0x00, 0x01, 0x00, 0x04, 0x02, 0x74, 0x00, 0x02, 0x00, 0x79, 0x00, 0x01, 0x00, 0x04, 0x02, 0x73, 0x00, 0x02, 0x00, 0x79, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x71, 0x00, 0x02, 0x00, 0x92, 0x02, 0x70, 0x00, 0x02, 0x00, 0x79, 0x02, 0x72, 0x00, 0x03, 0x00, 0x92, 0x00, 0x79, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x6e, 0x00, 0x02, 0x00, 0x92, 0x02, 0x6d, 0x00, 0x02, 0x00, 0x79, 0x02, 0x6f, 0x00, 0x03, 0x00, 0x92, 0x00, 0x79, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x6b, 0x00, 0x02, 0x00, 0x92, 0x02, 0x6a, 0x00, 0x02, 0x00, 0x79, 0x02, 0x6c, 0x00, 0x03, 0x00, 0x92, 0x00, 0x79, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x68, 0x00, 0x02, 0x00, 0x92, 0x02, 0x67, 0x00, 0x02, 0x00, 0x79, 0x02, 0x69, 0x00, 0x03, 0x00, 0x92, 0x00, 0x79, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x02, 0x62, 0x00, 0x02, 0x00, 0x92, 0x02, 0x61, 0x00, 0x02, 0x00, 0x79, 0x02, 0x63, 0x00, 0x03, 0x00, 0x92, 0x00, 0x79, 0x00, 0x01, 0x00, 0x04, 0x02, 0x60, 0x00, 0x02, 0x00, 0x79, 0x00, 0x01, 0x00, 0x09, 0x00, 0x07, 0x00, 0x17, 0x00, 0x1e, 0x00, 0x1f, 0x00, 0x20, 0x00, 0x21, 0x00, 0x22, 0x00, 0x23, 0x00, 0x92, 0x00, 0x06, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x03, 0x00, 0x00, 0x00, 0x02, 0x1e, 0x48, 0x00, 0x2c, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x01, 0x00, 0x0d, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x02, 0x00, 0x0e, 0x00, 0x04, 0x00, 0x92, 0x00, 0x92, 0x00, 0x92, 0x00, 0x92, 0x00, 0x02, 0x00, 0x01, 0x00, 0x1a, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x04, 0x00, 0x56, 0x00, 0x3e, 0x00, 0x26, 0x00, 0x0e, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x1e, 0x04, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x33, 0x00, 0x01, 0x00, 0x01, 0x00, 0x1d, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x1d, 0xec, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x32, 0x00, 0x01, 0x00, 0x01, 0x00, 0x1c, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x1d, 0xd4, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x31, 0x00, 0x01, 0x00, 0x01, 0x00, 0x1b, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x1d, 0xbc, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x30, 0x00, 0x01, 0x00, 0x01, 0x00, 0x1a, 0x00, 0x06, 0x00, 0x00, 0x00, 0x18, 0x05, 0x8c, 0x05, 0x6c, 0x05, 0x30, 0x04, 0xf8, 0x04, 0xce, 0x04, 0x8a, 0x04, 0x62, 0x04, 0x38, 0x04, 0x08, 0x03, 0xd6, 0x03, 0x98, 0x03, 0x26, 0x02, 0xc0, 0x02, 0x5a, 0x01, 0xe6, 0x01, 0xa4, 0x01, 0x76, 0x01, 0x3c, 0x01, 0x0c, 0x00, 0xea, 0x00, 0xbc, 0x00, 0x96, 0x00, 0x62, 0x00, 0x36, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x05, 0xa2, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x30, 0x00, 0x01, 0x00, 0x0b, 0x00, 0xea, 0x00, 0xfb, 0x00, 0xfe, 0x01, 0x04, 0x01, 0x05, 0x01, 0x36, 0x01, 0x62, 0x01, 0x91, 0x02, 0x09, 0x02, 0x13, 0x02, 0x3e, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x05, 0x76, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2f, 0x00, 0x01, 0x00, 0x0f, 0x00, 0xec, 0x01, 0x02, 0x01, 0x03, 0x01, 0x37, 0x01, 0x64, 0x01, 0x9b, 0x01, 0xa5, 0x01, 0xab, 0x01, 0xae, 0x01, 0xb4, 0x01, 0xdd, 0x01, 0xef, 0x02, 0x15, 0x02, 0x47, 0x02, 0x4f, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x05, 0x42, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2e, 0x00, 0x01, 0x00, 0x08, 0x01, 0x1d, 0x01, 0x20, 0x01, 0x79, 0x01, 0x8c, 0x01, 0x99, 0x01, 0xa1, 0x01, 0xac, 0x01, 0xf1, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x05, 0x1c, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2d, 0x00, 0x01, 0x00, 0x0c, 0x00, 0xe3, 0x01, 0x1a, 0x01, 0x73, 0x01, 0x7a, 0x01, 0x9c, 0x01, 0xd1, 0x01, 0xec, 0x02, 0x2c, 0x02, 0x30, 0x02, 0x33, 0x02, 0x38, 0x02, 0x43, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x04, 0xee, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x01, 0x00, 0x06, 0x01, 0x07, 0x01, 0x1b, 0x01, 0x6d, 0x01, 0x97, 0x01, 0xb2, 0x01, 0xff, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x04, 0xcc, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2b, 0x00, 0x01, 0x00, 0x0d, 0x00, 0xe5, 0x00, 0xe7, 0x00, 0xf6, 0x00, 0xf7, 0x00, 0xfc, 0x01, 0x7b, 0x01, 0xa3, 0x01, 0xc2, 0x01, 0xc3, 0x01, 0xc7, 0x01, 0xcd, 0x01, 0xce, 0x02, 0x45, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x04, 0x9c, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x2a, 0x00, 0x01, 0x00, 0x12, 0x00, 0xed, 0x00, 0xef, 0x00, 0xf9, 0x01, 0x01, 0x01, 0x0a, 0x01, 0x0b, 0x01, 0x0c, 0x01, 0x11, 0x01, 0x12, 0x01, 0x13, 0x01, 0x70, 0x01, 0xb9, 0x01, 0xcc, 0x01, 0xd6, 0x02, 0x01, 0x02, 0x02, 0x02, 0x0f, 0x02, 0x10, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x04, 0x62, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x29, 0x00, 0x01, 0x00, 0x0c, 0x00, 0xeb, 0x00, 0xf8, 0x01, 0x5d, 0x01, 0xc5, 0x01, 0xc6, 0x01, 0xcb, 0x02, 0x00, 0x02, 0x08, 0x02, 0x12, 0x02, 0x16, 0x02, 0x3f, 0x02, 0x5a, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x04, 0x34, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x28, 0x00, 0x01, 0x00, 0x16, 0x00, 0xe9, 0x00, 0xf5, 0x00, 0xfa, 0x00, 0xfd, 0x01, 0x0d, 0x01, 0x0e, 0x01, 0x33, 0x01, 0x34, 0x01, 0x38, 0x01, 0x3e, 0x01, 0x40, 0x01, 0x45, 0x01, 0x49, 0x01, 0x4a, 0x01, 0x5e, 0x01, 0x84, 0x01, 0x87, 0x01, 0xc8, 0x01, 0xf0, 0x02, 0x11, 0x02, 0x28, 0x02, 0x40, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x03, 0xf2, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x27, 0x00, 0x01, 0x00, 0x2f, 0x00, 0xe1, 0x00, 0xe2, 0x00, 0xe4, 0x00, 0xee, 0x00, 0xf0, 0x00, 0xf1, 0x00, 0xf2, 0x00, 0xf3, 0x00, 0xf4, 0x01, 0x08, 0x01, 0x09, 0x01, 0x0f, 0x01, 0x10, 0x01, 0x16, 0x01, 0x17, 0x01, 0x30, 0x01, 0x31, 0x01, 0x35, 0x01, 0x39, 0x01, 0x44, 0x01, 0x66, 0x01, 0x67, 0x01, 0xa4, 0x01, 0xaa, 0x01, 0xad, 0x01, 0xb1, 0x01, 0xc9, 0x01, 0xca, 0x01, 0xd2, 0x01, 0xe1, 0x01, 0xe4, 0x01, 0xe8, 0x01, 0xee, 0x01, 0xf2, 0x01, 0xf4, 0x01, 0xf6, 0x01, 0xf7, 0x02, 0x07, 0x02, 0x0e, 0x02, 0x14, 0x02, 0x23, 0x02, 0x24, 0x02, 0x26, 0x02, 0x49, 0x02, 0x4e, 0x02, 0x51, 0x02, 0x53, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x03, 0x7e, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x26, 0x00, 0x01, 0x00, 0x28, 0x00, 0xe6, 0x00, 0xff, 0x01, 0x14, 0x01, 0x1c, 0x01, 0x1f, 0x01, 0x21, 0x01, 0x24, 0x01, 0x26, 0x01, 0x2d, 0x01, 0x2e, 0x01, 0x3c, 0x01, 0x41, 0x01, 0x42, 0x01, 0x46, 0x01, 0x47, 0x01, 0x48, 0x01, 0x4d, 0x01, 0x50, 0x01, 0x57, 0x01, 0x5f, 0x01, 0x7c, 0x01, 0x8b, 0x01, 0x8d, 0x01, 0x93, 0x01, 0x9a, 0x01, 0xaf, 0x01, 0xc4, 0x01, 0xda, 0x01, 0xe2, 0x01, 0xe3, 0x01, 0xf3, 0x01, 0xfd, 0x02, 0x0c, 0x02, 0x0d, 0x02, 0x20, 0x02, 0x25, 0x02, 0x46, 0x02, 0x50, 0x02, 0x55, 0x02, 0x56, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x03, 0x18, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x25, 0x00, 0x01, 0x00, 0x28, 0x01, 0x00, 0x01, 0x22, 0x01, 0x23, 0x01, 0x27, 0x01, 0x28, 0x01, 0x2f, 0x01, 0x32, 0x01, 0x3f, 0x01, 0x43, 0x01, 0x60, 0x01, 0x65, 0x01, 0x72, 0x01, 0x78, 0x01, 0x7d, 0x01, 0x96, 0x01, 0xa0, 0x01, 0xa2, 0x01, 0xcf, 0x01, 0xd0, 0x01, 0xd7, 0x01, 0xd9, 0x01, 0xdc, 0x01, 0xdf, 0x01, 0xe0, 0x01, 0xe6, 0x01, 0xeb, 0x01, 0xed, 0x01, 0xf9, 0x01, 0xfa, 0x02, 0x03, 0x02, 0x06, 0x02, 0x0a, 0x02, 0x0b, 0x02, 0x18, 0x02, 0x1a, 0x02, 0x22, 0x02, 0x32, 0x02, 0x37, 0x02, 0x42, 0x02, 0x4d, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x02, 0xb2, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x24, 0x00, 0x01, 0x00, 0x2e, 0x01, 0x15, 0x01, 0x19, 0x01, 0x1e, 0x01, 0x25, 0x01, 0x29, 0x01, 0x2b, 0x01, 0x2c, 0x01, 0x3d, 0x01, 0x54, 0x01, 0x5c, 0x01, 0x69, 0x01, 0x6b, 0x01, 0x6c, 0x01, 0x75, 0x01, 0x76, 0x01, 0x7e, 0x01, 0x8e, 0x01, 0x90, 0x01, 0x92, 0x01, 0x98, 0x01, 0xa6, 0x01, 0xa7, 0x01, 0xa8, 0x01, 0xa9, 0x01, 0xb0, 0x01, 0xba, 0x01, 0xbd, 0x01, 0xbf, 0x01, 0xc1, 0x01, 0xdb, 0x01, 0xe5, 0x01, 0xe9, 0x01, 0xea, 0x01, 0xf5, 0x02, 0x04, 0x02, 0x05, 0x02, 0x17, 0x02, 0x1d, 0x02, 0x1e, 0x02, 0x3c, 0x02, 0x3d, 0x02, 0x44, 0x02, 0x4a, 0x02, 0x4b, 0x02, 0x4c, 0x02, 0x52, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x02, 0x40, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x23, 0x00, 0x01, 0x00, 0x14, 0x01, 0x2a, 0x01, 0x3a, 0x01, 0x59, 0x01, 0x5b, 0x01, 0x6a, 0x01, 0x74, 0x01, 0x8f, 0x01, 0x9d, 0x01, 0x9e, 0x01, 0x9f, 0x01, 0xbe, 0x01, 0xd3, 0x01, 0xd5, 0x01, 0xd8, 0x01, 0xe7, 0x02, 0x19, 0x02, 0x21, 0x02, 0x39, 0x02, 0x41, 0x02, 0x48, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x02, 0x02, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x22, 0x00, 0x01, 0x00, 0x0e, 0x01, 0x18, 0x01, 0x3b, 0x01, 0x5a, 0x01, 0x77, 0x01, 0x94, 0x01, 0x95, 0x01, 0xb5, 0x01, 0xb8, 0x01, 0xbb, 0x01, 0xde, 0x01, 0xf8, 0x02, 0x1b, 0x02, 0x3a, 0x02, 0x3b, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x01, 0xd0, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x21, 0x00, 0x01, 0x00, 0x0d, 0x01, 0x61, 0x01, 0x63, 0x01, 0x6e, 0x01, 0x6f, 0x01, 0x71, 0x01, 0xbc, 0x01, 0xc0, 0x01, 0xd4, 0x02, 0x29, 0x02, 0x2a, 0x02, 0x34, 0x02, 0x35, 0x02, 0x36, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x01, 0xa0, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x01, 0x00, 0x0a, 0x00, 0x25, 0x00, 0x49, 0x00, 0x96, 0x00, 0x9d, 0x00, 0xb7, 0x01, 0xb6, 0x01, 0xfb, 0x02, 0x2b, 0x02, 0x2d, 0x02, 0x2e, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x01, 0x76, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1f, 0x00, 0x01, 0x00, 0x09, 0x00, 0x32, 0x00, 0xa3, 0x00, 0xb3, 0x01, 0x81, 0x01, 0x83, 0x02, 0x1c, 0x02, 0x2f, 0x02, 0x31, 0x02, 0x57, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x01, 0x4e, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1e, 0x00, 0x01, 0x00, 0x17, 0x00, 0x2b, 0x00, 0x2c, 0x00, 0x2d, 0x00, 0x3b, 0x00, 0x3c, 0x00, 0x41, 0x00, 0x43, 0x00, 0x45, 0x00, 0x46, 0x00, 0x47, 0x00, 0x4b, 0x00, 0x9c, 0x00, 0x9e, 0x00, 0xa8, 0x00, 0xac, 0x00, 0xad, 0x00, 0xb1, 0x00, 0xb5, 0x00, 0xb9, 0x01, 0x88, 0x01, 0xb7, 0x02, 0x1f, 0x02, 0x27, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x01, 0x0a, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1d, 0x00, 0x01, 0x00, 0x0a, 0x00, 0x26, 0x00, 0x34, 0x00, 0x37, 0x00, 0x3f, 0x00, 0x4a, 0x00, 0x97, 0x00, 0xa5, 0x00, 0xaf, 0x00, 0xb8, 0x01, 0xfc, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0xe0, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x01, 0x00, 0x11, 0x00, 0x27, 0x00, 0x29, 0x00, 0x2a, 0x00, 0x33, 0x00, 0x36, 0x00, 0x3d, 0x00, 0x98, 0x00, 0x9a, 0x00, 0x9b, 0x00, 0xa4, 0x00, 0xa7, 0x00, 0xae, 0x00, 0xb6, 0x00, 0xba, 0x00, 0xe8, 0x01, 0x68, 0x01, 0x89, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0xa8, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1b, 0x00, 0x01, 0x00, 0x13, 0x00, 0x24, 0x00, 0x38, 0x00, 0x39, 0x00, 0x3a, 0x00, 0x40, 0x00, 0x42, 0x00, 0x48, 0x00, 0x4e, 0x00, 0x95, 0x00, 0xa9, 0x00, 0xaa, 0x00, 0xab, 0x00, 0xb0, 0x00, 0xb2, 0x01, 0x7f, 0x01, 0x80, 0x02, 0x54, 0x02, 0x58, 0x02, 0x59, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x6c, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x01, 0x00, 0x05, 0x00, 0x35, 0x00, 0xa6, 0x01, 0x85, 0x01, 0x86, 0x01, 0x8a, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x4c, 0x00, 0x01, 0x00, 0x12, 0x00, 0x01, 0x00, 0x00, 0x00, 0x19, 0x00, 0x01, 0x00, 0x1b, 0x00, 0x28, 0x00, 0x2e, 0x00, 0x2f, 0x00, 0x30, 0x00, 0x31, 0x00, 0x3e, 0x00, 0x44, 0x00, 0x4c, 0x00, 0x4d, 0x00, 0x4f, 0x00, 0x99, 0x00, 0x9f, 0x00, 0xa0, 0x00, 0xa1, 0x00, 0xa2, 0x00, 0xb4, 0x01, 0x4b, 0x01, 0x4c, 0x01, 0x4e, 0x01, 0x4f, 0x01, 0x51, 0x01, 0x52, 0x01, 0x53, 0x01, 0x55, 0x01, 0x56, 0x01, 0x58, 0x01, 0x82, 0x00, 0x01, 0x00, 0x01, 0x00, 0x16, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x0d, 0x18, 0x00, 0x2b, 0x0c, 0x24, 0x0b, 0xea, 0x0b, 0x50, 0x0b, 0x36, 0x0b, 0x02, 0x0a, 0xf8, 0x0a, 0x7a, 0x0a, 0x60, 0x0a, 0x3e, 0x0a, 0x1c, 0x0a, 0x02, 0x09, 0xe0, 0x09, 0xc6, 0x09, 0x84, 0x08, 0x9e, 0x08, 0x84, 0x08, 0x22, 0x07, 0xf6, 0x06, 0xa4, 0x06, 0x40, 0x05, 0xf6, 0x05, 0x5e, 0x05, 0x3c, 0x04, 0x9c, 0x04, 0x8a, 0x03, 0xa8, 0x03, 0x7e, 0x03, 0x1c, 0x02, 0x78, 0x01, 0xac, 0x01, 0x7a, 0x01, 0x70, 0x01, 0x4c, 0x01, 0x42, 0x01, 0x10, 0x00, 0xde, 0x00, 0xcc, 0x00, 0xaa, 0x00, 0x84, 0x00, 0x7a, 0x00, 0x70, 0x00, 0x66, 0x00, 0x5c, 0x00, 0x01, 0x00, 0x04, 0x01, 0xe3, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x01, 0x00, 0x04, 0x01, 0x75, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x01, 0x00, 0x04, 0x01, 0x31, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x01, 0x00, 0x04, 0x01, 0x23, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x04, 0x00, 0x1e, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0xfc, 0x00, 0x02, 0x00, 0x44, 0x01, 0xfb, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xfc, 0x00, 0x03, 0x00, 0x90, 0x00, 0x44, 0x01, 0xfb, 0x00, 0x03, 0x00, 0x90, 0x00, 0x3d, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0xca, 0x00, 0x02, 0x00, 0x4e, 0x01, 0xc3, 0x00, 0x02, 0x00, 0x4b, 0x01, 0xce, 0x00, 0x02, 0x00, 0x43, 0x01, 0xc6, 0x00, 0x02, 0x00, 0x33, 0x00, 0x02, 0x00, 0x0c, 0x00, 0x06, 0x01, 0x34, 0x00, 0x02, 0x00, 0x4b, 0x01, 0x42, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x06, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x14, 0x00, 0x0e, 0x01, 0x13, 0x00, 0x02, 0x00, 0x43, 0x01, 0x12, 0x00, 0x02, 0x00, 0x41, 0x01, 0x10, 0x00, 0x02, 0x00, 0x40, 0x01, 0x0e, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x0c, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x09, 0x00, 0x02, 0x00, 0x33, 0x00, 0x06, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x14, 0x00, 0x0e, 0x00, 0xf4, 0x00, 0x02, 0x00, 0x4e, 0x00, 0xe2, 0x00, 0x02, 0x00, 0x48, 0x00, 0xf7, 0x00, 0x02, 0x00, 0x3c, 0x00, 0xf5, 0x00, 0x02, 0x00, 0x3a, 0x00, 0xf3, 0x00, 0x02, 0x00, 0x39, 0x00, 0xe9, 0x00, 0x02, 0x00, 0x33, 0x00, 0x01, 0x00, 0x04, 0x01, 0x39, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0x00, 0x00, 0x02, 0x00, 0x40, 0x00, 0xff, 0x00, 0x02, 0x00, 0x3d, 0x00, 0xfd, 0x00, 0x02, 0x00, 0x3c, 0x00, 0xfe, 0x00, 0x03, 0x00, 0x68, 0x00, 0x3d, 0x00, 0x01, 0x00, 0x04, 0x02, 0x5a, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x06, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x14, 0x00, 0x0e, 0x02, 0x59, 0x00, 0x02, 0x00, 0x40, 0x02, 0x58, 0x00, 0x02, 0x00, 0x3f, 0x02, 0x57, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x56, 0x00, 0x02, 0x00, 0x3c, 0x02, 0x55, 0x00, 0x02, 0x00, 0x37, 0x02, 0x54, 0x00, 0x02, 0x00, 0x32, 0x00, 0x18, 0x00, 0xc4, 0x00, 0xbc, 0x00, 0xb4, 0x00, 0xac, 0x00, 0xa4, 0x00, 0x9e, 0x00, 0x98, 0x00, 0x92, 0x00, 0x8c, 0x00, 0x86, 0x00, 0x80, 0x00, 0x7a, 0x00, 0x74, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x62, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x02, 0x4b, 0x00, 0x02, 0x00, 0xa9, 0x02, 0x44, 0x00, 0x02, 0x00, 0xa4, 0x02, 0x3d, 0x00, 0x02, 0x00, 0x95, 0x02, 0x53, 0x00, 0x02, 0x00, 0x43, 0x02, 0x52, 0x00, 0x02, 0x00, 0x40, 0x02, 0x51, 0x00, 0x02, 0x00, 0x3f, 0x02, 0x50, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x4e, 0x00, 0x02, 0x00, 0x3c, 0x02, 0x4d, 0x00, 0x02, 0x00, 0x3a, 0x02, 0x4c, 0x00, 0x02, 0x00, 0x39, 0x02, 0x4a, 0x00, 0x02, 0x00, 0x38, 0x02, 0x49, 0x00, 0x02, 0x00, 0x37, 0x02, 0x48, 0x00, 0x02, 0x00, 0x35, 0x02, 0x46, 0x00, 0x02, 0x00, 0x34, 0x02, 0x42, 0x00, 0x02, 0x00, 0x33, 0x02, 0x41, 0x00, 0x02, 0x00, 0x2e, 0x02, 0x40, 0x00, 0x02, 0x00, 0x2b, 0x02, 0x3f, 0x00, 0x02, 0x00, 0x25, 0x02, 0x3c, 0x00, 0x02, 0x00, 0x24, 0x02, 0x4f, 0x00, 0x03, 0x00, 0x68, 0x00, 0x3d, 0x02, 0x47, 0x00, 0x03, 0x00, 0x60, 0x00, 0x3d, 0x02, 0x45, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x40, 0x02, 0x43, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x3d, 0x02, 0x3e, 0x00, 0x03, 0x00, 0x50, 0x00, 0x40, 0x00, 0x13, 0x00, 0x9c, 0x00, 0x94, 0x00, 0x8c, 0x00, 0x84, 0x00, 0x7c, 0x00, 0x76, 0x00, 0x70, 0x00, 0x6a, 0x00, 0x64, 0x00, 0x5e, 0x00, 0x58, 0x00, 0x52, 0x00, 0x4c, 0x00, 0x46, 0x00, 0x40, 0x00, 0x3a, 0x00, 0x34, 0x00, 0x2e, 0x00, 0x28, 0x02, 0x35, 0x00, 0x02, 0x00, 0xa9, 0x02, 0x31, 0x00, 0x02, 0x00, 0xa0, 0x02, 0x2d, 0x00, 0x02, 0x00, 0x9f, 0x02, 0x2a, 0x00, 0x02, 0x00, 0x95, 0x02, 0x3b, 0x00, 0x02, 0x00, 0x42, 0x02, 0x3a, 0x00, 0x02, 0x00, 0x40, 0x02, 0x39, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x37, 0x00, 0x02, 0x00, 0x3c, 0x02, 0x36, 0x00, 0x02, 0x00, 0x39, 0x02, 0x34, 0x00, 0x02, 0x00, 0x38, 0x02, 0x32, 0x00, 0x02, 0x00, 0x32, 0x02, 0x2f, 0x00, 0x02, 0x00, 0x2f, 0x02, 0x2b, 0x00, 0x02, 0x00, 0x2e, 0x02, 0x29, 0x00, 0x02, 0x00, 0x24, 0x02, 0x38, 0x00, 0x03, 0x00, 0x68, 0x00, 0x3d, 0x02, 0x33, 0x00, 0x03, 0x00, 0x5e, 0x00, 0x3d, 0x02, 0x30, 0x00, 0x03, 0x00, 0x5b, 0x00, 0x3d, 0x02, 0x2e, 0x00, 0x03, 0x00, 0x5a, 0x00, 0x40, 0x02, 0x2c, 0x00, 0x03, 0x00, 0x5a, 0x00, 0x3d, 0x00, 0x0c, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x02, 0x1e, 0x00, 0x02, 0x00, 0x48, 0x02, 0x28, 0x00, 0x02, 0x00, 0x41, 0x02, 0x27, 0x00, 0x02, 0x00, 0x40, 0x02, 0x26, 0x00, 0x02, 0x00, 0x3f, 0x02, 0x25, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x24, 0x00, 0x02, 0x00, 0x3c, 0x02, 0x23, 0x00, 0x02, 0x00, 0x37, 0x02, 0x22, 0x00, 0x02, 0x00, 0x33, 0x02, 0x21, 0x00, 0x02, 0x00, 0x2e, 0x02, 0x20, 0x00, 0x02, 0x00, 0x2a, 0x02, 0x1f, 0x00, 0x02, 0x00, 0x29, 0x02, 0x1d, 0x00, 0x02, 0x00, 0x24, 0x00, 0x05, 0x00, 0x24, 0x00, 0x1e, 0x00, 0x18, 0x00, 0x12, 0x00, 0x0c, 0x02, 0x1c, 0x00, 0x02, 0x00, 0x44, 0x02, 0x1b, 0x00, 0x02, 0x00, 0x40, 0x02, 0x1a, 0x00, 0x02, 0x00, 0x3f, 0x02, 0x19, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x18, 0x00, 0x02, 0x00, 0x37, 0x00, 0x1b, 0x00, 0xda, 0x00, 0xd2, 0x00, 0xca, 0x00, 0xc2, 0x00, 0xbc, 0x00, 0xb6, 0x00, 0xb0, 0x00, 0xaa, 0x00, 0xa4, 0x00, 0x9e, 0x00, 0x98, 0x00, 0x92, 0x00, 0x8c, 0x00, 0x86, 0x00, 0x80, 0x00, 0x7a, 0x00, 0x74, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x62, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x02, 0x0b, 0x00, 0x02, 0x00, 0xa6, 0x02, 0x02, 0x00, 0x02, 0x00, 0x4b, 0x02, 0x17, 0x00, 0x02, 0x00, 0x44, 0x02, 0x16, 0x00, 0x02, 0x00, 0x43, 0x02, 0x14, 0x00, 0x02, 0x00, 0x40, 0x02, 0x12, 0x00, 0x02, 0x00, 0x3f, 0x02, 0x11, 0x00, 0x02, 0x00, 0x3d, 0x02, 0x10, 0x00, 0x02, 0x00, 0x3c, 0x02, 0x0f, 0x00, 0x02, 0x00, 0x3b, 0x02, 0x0e, 0x00, 0x02, 0x00, 0x3a, 0x02, 0x0d, 0x00, 0x02, 0x00, 0x39, 0x02, 0x0c, 0x00, 0x02, 0x00, 0x38, 0x02, 0x0a, 0x00, 0x02, 0x00, 0x35, 0x02, 0x08, 0x00, 0x02, 0x00, 0x34, 0x02, 0x07, 0x00, 0x02, 0x00, 0x33, 0x02, 0x06, 0x00, 0x02, 0x00, 0x31, 0x02, 0x05, 0x00, 0x02, 0x00, 0x30, 0x02, 0x04, 0x00, 0x02, 0x00, 0x2f, 0x02, 0x03, 0x00, 0x02, 0x00, 0x2e, 0x02, 0x01, 0x00, 0x02, 0x00, 0x2b, 0x02, 0x00, 0x00, 0x02, 0x00, 0x26, 0x01, 0xff, 0x00, 0x02, 0x00, 0x25, 0x01, 0xfd, 0x00, 0x02, 0x00, 0x24, 0x02, 0x15, 0x00, 0x03, 0x00, 0x6c, 0x00, 0x30, 0x02, 0x13, 0x00, 0x03, 0x00, 0x6b, 0x00, 0x3d, 0x02, 0x09, 0x00, 0x03, 0x00, 0x60, 0x00, 0x3d, 0x01, 0xfe, 0x00, 0x03, 0x00, 0x50, 0x00, 0x3d, 0x00, 0x02, 0x00, 0x0c, 0x00, 0x06, 0x01, 0xfa, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xf9, 0x00, 0x02, 0x00, 0x37, 0x00, 0x13, 0x00, 0x98, 0x00, 0x90, 0x00, 0x88, 0x00, 0x82, 0x00, 0x7c, 0x00, 0x76, 0x00, 0x70, 0x00, 0x6a, 0x00, 0x64, 0x00, 0x5e, 0x00, 0x58, 0x00, 0x52, 0x00, 0x4c, 0x00, 0x46, 0x00, 0x40, 0x00, 0x3a, 0x00, 0x34, 0x00, 0x2e, 0x00, 0x28, 0x01, 0xf0, 0x00, 0x02, 0x00, 0xac, 0x01, 0xed, 0x00, 0x02, 0x00, 0xab, 0x01, 0xea, 0x00, 0x02, 0x00, 0xa9, 0x01, 0xf8, 0x00, 0x02, 0x00, 0x44, 0x01, 0xf7, 0x00, 0x02, 0x00, 0x43, 0x01, 0xf6, 0x00, 0x02, 0x00, 0x41, 0x01, 0xf5, 0x00, 0x02, 0x00, 0x40, 0x01, 0xf4, 0x00, 0x02, 0x00, 0x3f, 0x01, 0xf3, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xf2, 0x00, 0x02, 0x00, 0x3c, 0x01, 0xee, 0x00, 0x02, 0x00, 0x3b, 0x01, 0xeb, 0x00, 0x02, 0x00, 0x3a, 0x01, 0xe9, 0x00, 0x02, 0x00, 0x38, 0x01, 0xe8, 0x00, 0x02, 0x00, 0x37, 0x01, 0xe7, 0x00, 0x02, 0x00, 0x35, 0x01, 0xe6, 0x00, 0x02, 0x00, 0x33, 0x01, 0xf1, 0x00, 0x03, 0x00, 0x67, 0x00, 0x40, 0x01, 0xef, 0x00, 0x03, 0x00, 0x67, 0x00, 0x3d, 0x01, 0xec, 0x00, 0x03, 0x00, 0x66, 0x00, 0x3d, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0xe5, 0x00, 0x02, 0x00, 0x40, 0x01, 0xe4, 0x00, 0x02, 0x00, 0x3f, 0x01, 0xe2, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xe1, 0x00, 0x02, 0x00, 0x37, 0x00, 0x12, 0x00, 0x90, 0x00, 0x88, 0x00, 0x80, 0x00, 0x7a, 0x00, 0x74, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x62, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x01, 0xda, 0x00, 0x02, 0x00, 0xac, 0x01, 0xd0, 0x00, 0x02, 0x00, 0x4b, 0x01, 0xe0, 0x00, 0x02, 0x00, 0x43, 0x01, 0xdf, 0x00, 0x02, 0x00, 0x41, 0x01, 0xde, 0x00, 0x02, 0x00, 0x40, 0x01, 0xdc, 0x00, 0x02, 0x00, 0x3f, 0x01, 0xdb, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xd9, 0x00, 0x02, 0x00, 0x3b, 0x01, 0xd8, 0x00, 0x02, 0x00, 0x3a, 0x01, 0xd7, 0x00, 0x02, 0x00, 0x37, 0x01, 0xd5, 0x00, 0x02, 0x00, 0x36, 0x01, 0xd4, 0x00, 0x02, 0x00, 0x35, 0x01, 0xd3, 0x00, 0x02, 0x00, 0x33, 0x01, 0xd2, 0x00, 0x02, 0x00, 0x2c, 0x01, 0xcf, 0x00, 0x02, 0x00, 0x2b, 0x01, 0xdd, 0x00, 0x03, 0x00, 0x6b, 0x00, 0x3d, 0x01, 0xd6, 0x00, 0x03, 0x00, 0x62, 0x00, 0x40, 0x01, 0xd1, 0x00, 0x03, 0x00, 0x57, 0x00, 0x3d, 0x00, 0x09, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x14, 0x01, 0xcd, 0x00, 0x02, 0x00, 0x41, 0x01, 0xcc, 0x00, 0x02, 0x00, 0x3f, 0x01, 0xcb, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xc9, 0x00, 0x02, 0x00, 0x39, 0x01, 0xc8, 0x00, 0x02, 0x00, 0x38, 0x01, 0xc7, 0x00, 0x02, 0x00, 0x37, 0x01, 0xc5, 0x00, 0x02, 0x00, 0x33, 0x01, 0xc4, 0x00, 0x02, 0x00, 0x2e, 0x01, 0xc2, 0x00, 0x02, 0x00, 0x2b, 0x00, 0x0c, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x01, 0xc1, 0x00, 0x02, 0x00, 0x43, 0x01, 0xc0, 0x00, 0x02, 0x00, 0x40, 0x01, 0xbf, 0x00, 0x02, 0x00, 0x3f, 0x01, 0xbe, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xbd, 0x00, 0x02, 0x00, 0x3c, 0x01, 0xbc, 0x00, 0x02, 0x00, 0x39, 0x01, 0xbb, 0x00, 0x02, 0x00, 0x38, 0x01, 0xba, 0x00, 0x02, 0x00, 0x37, 0x01, 0xb8, 0x00, 0x02, 0x00, 0x33, 0x01, 0xb7, 0x00, 0x02, 0x00, 0x2f, 0x01, 0xb6, 0x00, 0x02, 0x00, 0x2e, 0x01, 0xb9, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x3d, 0x00, 0x26, 0x01, 0x48, 0x01, 0x40, 0x01, 0x38, 0x01, 0x30, 0x01, 0x28, 0x01, 0x20, 0x01, 0x18, 0x01, 0x10, 0x01, 0x08, 0x01, 0x00, 0x00, 0xf8, 0x00, 0xf0, 0x00, 0xe8, 0x00, 0xe0, 0x00, 0xd8, 0x00, 0xd2, 0x00, 0xcc, 0x00, 0xc6, 0x00, 0xc0, 0x00, 0xba, 0x00, 0xb4, 0x00, 0xae, 0x00, 0xa8, 0x00, 0xa2, 0x00, 0x9c, 0x00, 0x96, 0x00, 0x90, 0x00, 0x8a, 0x00, 0x84, 0x00, 0x7e, 0x00, 0x78, 0x00, 0x72, 0x00, 0x6c, 0x00, 0x66, 0x00, 0x60, 0x00, 0x5a, 0x00, 0x54, 0x00, 0x4e, 0x01, 0xa9, 0x00, 0x02, 0x00, 0xaa, 0x01, 0xa7, 0x00, 0x02, 0x00, 0xa9, 0x01, 0xa2, 0x00, 0x02, 0x00, 0xa7, 0x01, 0x9e, 0x00, 0x02, 0x00, 0xa6, 0x01, 0x98, 0x00, 0x02, 0x00, 0xa4, 0x01, 0xb5, 0x00, 0x02, 0x00, 0x44, 0x01, 0xb1, 0x00, 0x02, 0x00, 0x43, 0x01, 0xb0, 0x00, 0x02, 0x00, 0x40, 0x01, 0xaf, 0x00, 0x02, 0x00, 0x3d, 0x01, 0xad, 0x00, 0x02, 0x00, 0x3c, 0x01, 0xaa, 0x00, 0x02, 0x00, 0x3b, 0x01, 0xa8, 0x00, 0x02, 0x00, 0x39, 0x01, 0xa6, 0x00, 0x02, 0x00, 0x38, 0x01, 0xa4, 0x00, 0x02, 0x00, 0x37, 0x01, 0xa0, 0x00, 0x02, 0x00, 0x36, 0x01, 0x9d, 0x00, 0x02, 0x00, 0x35, 0x01, 0x9a, 0x00, 0x02, 0x00, 0x34, 0x01, 0x96, 0x00, 0x02, 0x00, 0x33, 0x01, 0x95, 0x00, 0x02, 0x00, 0x30, 0x01, 0x94, 0x00, 0x02, 0x00, 0x2e, 0x01, 0x93, 0x00, 0x02, 0x00, 0x2a, 0x01, 0x92, 0x00, 0x02, 0x00, 0x29, 0x01, 0x90, 0x00, 0x02, 0x00, 0x24, 0x01, 0xb4, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x3d, 0x01, 0xb2, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x2e, 0x01, 0xae, 0x00, 0x03, 0x00, 0x68, 0x00, 0x3d, 0x01, 0xac, 0x00, 0x03, 0x00, 0x67, 0x00, 0x40, 0x01, 0xab, 0x00, 0x03, 0x00, 0x67, 0x00, 0x3d, 0x01, 0xa5, 0x00, 0x03, 0x00, 0x63, 0x00, 0x3d, 0x01, 0xa3, 0x00, 0x03, 0x00, 0x62, 0x00, 0x40, 0x01, 0xa1, 0x00, 0x03, 0x00, 0x62, 0x00, 0x3d, 0x01, 0x9f, 0x00, 0x03, 0x00, 0x61, 0x00, 0x40, 0x01, 0x9c, 0x00, 0x03, 0x00, 0x60, 0x00, 0x40, 0x01, 0x9b, 0x00, 0x03, 0x00, 0x60, 0x00, 0x3d, 0x01, 0x99, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x43, 0x01, 0x97, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x3d, 0x01, 0x91, 0x00, 0x03, 0x00, 0x50, 0x00, 0x43, 0x01, 0xb3, 0x00, 0x04, 0x00, 0x6f, 0x00, 0x68, 0x00, 0x3d, 0x00, 0x05, 0x00, 0x24, 0x00, 0x1e, 0x00, 0x18, 0x00, 0x12, 0x00, 0x0c, 0x01, 0x8f, 0x00, 0x02, 0x00, 0x40, 0x01, 0x8e, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x8d, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x8b, 0x00, 0x02, 0x00, 0x37, 0x01, 0x8c, 0x00, 0x03, 0x00, 0x63, 0x00, 0x3d, 0x00, 0x0c, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x01, 0x86, 0x00, 0x02, 0x00, 0xab, 0x01, 0x80, 0x00, 0x02, 0x00, 0x97, 0x01, 0x8a, 0x00, 0x02, 0x00, 0x40, 0x01, 0x89, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x88, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x87, 0x00, 0x02, 0x00, 0x3b, 0x01, 0x85, 0x00, 0x02, 0x00, 0x3a, 0x01, 0x84, 0x00, 0x02, 0x00, 0x37, 0x01, 0x83, 0x00, 0x02, 0x00, 0x36, 0x01, 0x82, 0x00, 0x02, 0x00, 0x35, 0x01, 0x81, 0x00, 0x02, 0x00, 0x27, 0x01, 0x7f, 0x00, 0x02, 0x00, 0x26, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x01, 0x7e, 0x00, 0x02, 0x00, 0x40, 0x01, 0x7d, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x7c, 0x00, 0x02, 0x00, 0x37, 0x00, 0x1a, 0x00, 0xde, 0x00, 0xd6, 0x00, 0xce, 0x00, 0xc6, 0x00, 0xbe, 0x00, 0xb6, 0x00, 0xae, 0x00, 0xa6, 0x00, 0x9e, 0x00, 0x96, 0x00, 0x90, 0x00, 0x8a, 0x00, 0x84, 0x00, 0x7e, 0x00, 0x78, 0x00, 0x72, 0x00, 0x6c, 0x00, 0x66, 0x00, 0x60, 0x00, 0x5a, 0x00, 0x54, 0x00, 0x4e, 0x00, 0x48, 0x00, 0x42, 0x00, 0x3c, 0x00, 0x36, 0x01, 0x6f, 0x00, 0x02, 0x00, 0xa9, 0x01, 0x67, 0x00, 0x02, 0x00, 0x96, 0x01, 0x63, 0x00, 0x02, 0x00, 0x95, 0x01, 0x65, 0x00, 0x02, 0x00, 0x46, 0x01, 0x78, 0x00, 0x02, 0x00, 0x43, 0x01, 0x77, 0x00, 0x02, 0x00, 0x40, 0x01, 0x76, 0x00, 0x02, 0x00, 0x3f, 0x01, 0x74, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x72, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x71, 0x00, 0x02, 0x00, 0x39, 0x01, 0x6e, 0x00, 0x02, 0x00, 0x38, 0x01, 0x6c, 0x00, 0x02, 0x00, 0x37, 0x01, 0x6b, 0x00, 0x02, 0x00, 0x34, 0x01, 0x68, 0x00, 0x02, 0x00, 0x33, 0x01, 0x66, 0x00, 0x02, 0x00, 0x25, 0x01, 0x61, 0x00, 0x02, 0x00, 0x24, 0x01, 0x7b, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x40, 0x01, 0x7a, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x3d, 0x01, 0x79, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x37, 0x01, 0x73, 0x00, 0x03, 0x00, 0x68, 0x00, 0x3d, 0x01, 0x70, 0x00, 0x03, 0x00, 0x64, 0x00, 0x3f, 0x01, 0x6d, 0x00, 0x03, 0x00, 0x63, 0x00, 0x3d, 0x01, 0x6a, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x40, 0x01, 0x69, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x3d, 0x01, 0x64, 0x00, 0x03, 0x00, 0x50, 0x00, 0x40, 0x01, 0x62, 0x00, 0x03, 0x00, 0x50, 0x00, 0x3d, 0x00, 0x08, 0x00, 0x3c, 0x00, 0x36, 0x00, 0x30, 0x00, 0x2a, 0x00, 0x24, 0x00, 0x1e, 0x00, 0x18, 0x00, 0x12, 0x01, 0x60, 0x00, 0x02, 0x00, 0x40, 0x01, 0x5f, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x5e, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x5d, 0x00, 0x02, 0x00, 0x32, 0x01, 0x5c, 0x00, 0x02, 0x00, 0x31, 0x01, 0x5b, 0x00, 0x02, 0x00, 0x30, 0x01, 0x5a, 0x00, 0x02, 0x00, 0x2f, 0x01, 0x59, 0x00, 0x02, 0x00, 0x2e, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x01, 0x58, 0x00, 0x02, 0x00, 0x40, 0x01, 0x57, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x56, 0x00, 0x02, 0x00, 0x31, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0x55, 0x00, 0x02, 0x00, 0x40, 0x01, 0x54, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x53, 0x00, 0x02, 0x00, 0x31, 0x01, 0x52, 0x00, 0x02, 0x00, 0x30, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x01, 0x51, 0x00, 0x02, 0x00, 0x40, 0x01, 0x50, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x4f, 0x00, 0x02, 0x00, 0x2f, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0x4e, 0x00, 0x02, 0x00, 0x40, 0x01, 0x4d, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x4c, 0x00, 0x02, 0x00, 0x2f, 0x01, 0x4b, 0x00, 0x02, 0x00, 0x2e, 0x00, 0x04, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x00, 0x0a, 0x01, 0x4a, 0x00, 0x02, 0x00, 0x41, 0x01, 0x49, 0x00, 0x02, 0x00, 0x2b, 0x01, 0x48, 0x00, 0x02, 0x00, 0x2a, 0x01, 0x47, 0x00, 0x02, 0x00, 0x29, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x01, 0x46, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x45, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x44, 0x00, 0x02, 0x00, 0x37, 0x00, 0x0f, 0x00, 0x76, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x62, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x01, 0x35, 0x00, 0x02, 0x00, 0x47, 0x01, 0x43, 0x00, 0x02, 0x00, 0x40, 0x01, 0x41, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x40, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x3f, 0x00, 0x02, 0x00, 0x3a, 0x01, 0x3e, 0x00, 0x02, 0x00, 0x37, 0x01, 0x3d, 0x00, 0x02, 0x00, 0x35, 0x01, 0x3c, 0x00, 0x02, 0x00, 0x33, 0x01, 0x3b, 0x00, 0x02, 0x00, 0x30, 0x01, 0x3a, 0x00, 0x02, 0x00, 0x2e, 0x01, 0x38, 0x00, 0x02, 0x00, 0x2c, 0x01, 0x33, 0x00, 0x02, 0x00, 0x2b, 0x01, 0x32, 0x00, 0x02, 0x00, 0x24, 0x01, 0x37, 0x00, 0x03, 0x00, 0x57, 0x00, 0x40, 0x01, 0x36, 0x00, 0x03, 0x00, 0x57, 0x00, 0x3d, 0x00, 0x01, 0x00, 0x04, 0x01, 0x30, 0x00, 0x02, 0x00, 0x3d, 0x00, 0x06, 0x00, 0x2c, 0x00, 0x26, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x14, 0x00, 0x0e, 0x01, 0x2f, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x2e, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x2d, 0x00, 0x02, 0x00, 0x37, 0x01, 0x2b, 0x00, 0x02, 0x00, 0x2a, 0x01, 0x2a, 0x00, 0x02, 0x00, 0x29, 0x01, 0x2c, 0x00, 0x03, 0x00, 0x56, 0x00, 0x40, 0x00, 0x03, 0x00, 0x14, 0x00, 0x0e, 0x00, 0x08, 0x01, 0x29, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x28, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x27, 0x00, 0x02, 0x00, 0x37, 0x00, 0x12, 0x00, 0x92, 0x00, 0x8a, 0x00, 0x82, 0x00, 0x7a, 0x00, 0x74, 0x00, 0x6e, 0x00, 0x68, 0x00, 0x62, 0x00, 0x5c, 0x00, 0x56, 0x00, 0x50, 0x00, 0x4a, 0x00, 0x44, 0x00, 0x3e, 0x00, 0x38, 0x00, 0x32, 0x00, 0x2c, 0x00, 0x26, 0x01, 0x26, 0x00, 0x02, 0x00, 0x43, 0x01, 0x25, 0x00, 0x02, 0x00, 0x40, 0x01, 0x24, 0x00, 0x02, 0x00, 0x3f, 0x01, 0x22, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x21, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x1f, 0x00, 0x02, 0x00, 0x3b, 0x01, 0x1e, 0x00, 0x02, 0x00, 0x3a, 0x01, 0x1c, 0x00, 0x02, 0x00, 0x37, 0x01, 0x19, 0x00, 0x02, 0x00, 0x36, 0x01, 0x18, 0x00, 0x02, 0x00, 0x35, 0x01, 0x17, 0x00, 0x02, 0x00, 0x32, 0x01, 0x16, 0x00, 0x02, 0x00, 0x2b, 0x01, 0x15, 0x00, 0x02, 0x00, 0x27, 0x01, 0x14, 0x00, 0x02, 0x00, 0x26, 0x01, 0x20, 0x00, 0x03, 0x00, 0x67, 0x00, 0x3d, 0x01, 0x1d, 0x00, 0x03, 0x00, 0x63, 0x00, 0x3d, 0x01, 0x1b, 0x00, 0x03, 0x00, 0x62, 0x00, 0x40, 0x01, 0x1a, 0x00, 0x03, 0x00, 0x62, 0x00, 0x3d, 0x00, 0x07, 0x00, 0x34, 0x00, 0x2e, 0x00, 0x28, 0x00, 0x22, 0x00, 0x1c, 0x00, 0x16, 0x00, 0x10, 0x01, 0x11, 0x00, 0x02, 0x00, 0x41, 0x01, 0x0f, 0x00, 0x02, 0x00, 0x40, 0x01, 0x0d, 0x00, 0x02, 0x00, 0x3d, 0x01, 0x0b, 0x00, 0x02, 0x00, 0x3c, 0x01, 0x0a, 0x00, 0x02, 0x00, 0x37, 0x01, 0x08, 0x00, 0x02, 0x00, 0x33, 0x01, 0x07, 0x00, 0x02, 0x00, 0x25, 0x00, 0x1c, 0x00, 0xea, 0x00, 0xe2, 0x00, 0xda, 0x00, 0xd2, 0x00, 0xca, 0x00, 0xc2, 0x00, 0xba, 0x00, 0xb2, 0x00, 0xac, 0x00, 0xa6, 0x00, 0xa0, 0x00, 0x9a, 0x00, 0x94, 0x00, 0x8e, 0x00, 0x88, 0x00, 0x82, 0x00, 0x7c, 0x00, 0x76, 0x00, 0x70, 0x00, 0x6a, 0x00, 0x64, 0x00, 0x5e, 0x00, 0x58, 0x00, 0x52, 0x00, 0x4c, 0x00, 0x46, 0x00, 0x40, 0x00, 0x3a, 0x00, 0xf1, 0x00, 0x02, 0x00, 0xa9, 0x00, 0xeb, 0x00, 0x02, 0x00, 0xa4, 0x01, 0x01, 0x00, 0x02, 0x00, 0x43, 0x00, 0xfc, 0x00, 0x02, 0x00, 0x41, 0x00, 0xfa, 0x00, 0x02, 0x00, 0x40, 0x00, 0xf9, 0x00, 0x02, 0x00, 0x3f, 0x00, 0xf8, 0x00, 0x02, 0x00, 0x3d, 0x00, 0xf6, 0x00, 0x02, 0x00, 0x3c, 0x00, 0xf2, 0x00, 0x02, 0x00, 0x39, 0x00, 0xf0, 0x00, 0x02, 0x00, 0x38, 0x00, 0xef, 0x00, 0x02, 0x00, 0x37, 0x00, 0xee, 0x00, 0x02, 0x00, 0x35, 0x00, 0xed, 0x00, 0x02, 0x00, 0x34, 0x00, 0xe8, 0x00, 0x02, 0x00, 0x33, 0x00, 0xe7, 0x00, 0x02, 0x00, 0x32, 0x00, 0xe6, 0x00, 0x02, 0x00, 0x2e, 0x00, 0xe5, 0x00, 0x02, 0x00, 0x2b, 0x00, 0xe4, 0x00, 0x02, 0x00, 0x29, 0x00, 0xe3, 0x00, 0x02, 0x00, 0x25, 0x00, 0xe1, 0x00, 0x02, 0x00, 0x24, 0x01, 0x05, 0x00, 0x03, 0x00, 0x6f, 0x00, 0xa9, 0x01, 0x04, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x33, 0x01, 0x03, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x30, 0x01, 0x02, 0x00, 0x03, 0x00, 0x6f, 0x00, 0x2e, 0x00, 0xfb, 0x00, 0x03, 0x00, 0x6c, 0x00, 0x3d, 0x00, 0xec, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x40, 0x00, 0xea, 0x00, 0x03, 0x00, 0x5f, 0x00, 0x3d, 0x01, 0x06, 0x00, 0x04, 0x00, 0x6f, 0x00, 0x64, 0x00, 0x3f, 0x00, 0x02, 0x00, 0x09, 0x00, 0x50, 0x00, 0x53, 0x00, 0x00, 0x00, 0x55, 0x00, 0x69, 0x00, 0x04, 0x00, 0x6b, 0x00, 0x75, 0x00, 0x19, 0x00, 0x77, 0x00, 0x78, 0x00, 0x24, 0x00, 0x93, 0x00, 0x93, 0x00, 0x26, 0x00, 0xbd, 0x00, 0xbd, 0x00, 0x27, 0x00, 0xc1, 0x00, 0xc1, 0x00, 0x28, 0x00, 0xca, 0x00, 0xca, 0x00, 0x29, 0x00, 0xd2, 0x00, 0xd2, 0x00, 0x2a, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x03, 0x96, 0x00, 0x4c, 0x03, 0x8c, 0x03, 0x82, 0x03, 0x78, 0x03, 0x6e, 0x03, 0x64, 0x03, 0x5a, 0x03, 0x50, 0x03, 0x46, 0x03, 0x3c, 0x03, 0x32, 0x03, 0x28, 0x03, 0x1e, 0x03, 0x14, 0x03, 0x0a, 0x03, 0x00, 0x02, 0xf6, 0x02, 0xec, 0x02, 0xe2, 0x02, 0xd8, 0x02, 0xce, 0x02, 0xc4, 0x02, 0xba, 0x02, 0xb0, 0x02, 0xa6, 0x02, 0x9c, 0x02, 0x92, 0x02, 0x88, 0x02, 0x7e, 0x02, 0x74, 0x02, 0x6a, 0x02, 0x60, 0x02, 0x56, 0x02, 0x4c, 0x02, 0x42, 0x02, 0x38, 0x02, 0x2e, 0x02, 0x24, 0x02, 0x1a, 0x02, 0x10, 0x02, 0x06, 0x01, 0xfc, 0x01, 0xf2, 0x01, 0xe8, 0x01, 0xde, 0x01, 0xd4, 0x01, 0xca, 0x01, 0xc0, 0x01, 0xb6, 0x01, 0xac, 0x01, 0xa2, 0x01, 0x98, 0x01, 0x8e, 0x01, 0x84, 0x01, 0x7a, 0x01, 0x70, 0x01, 0x66, 0x01, 0x5c, 0x01, 0x52, 0x01, 0x48, 0x01, 0x3e, 0x01, 0x34, 0x01, 0x2a, 0x01, 0x20, 0x01, 0x16, 0x01, 0x0c, 0x01, 0x02, 0x00, 0xf8, 0x00, 0xee, 0x00, 0xe4, 0x00, 0xda, 0x00, 0xd0, 0x00, 0xc6, 0x00, 0xbc, 0x00, 0xb2, 0x00, 0xa8, 0x00, 0x9e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xe0, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdf, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xde, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdd, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdc, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdb, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xda, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd9, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd8, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd7, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd6, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd5, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd4, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd3, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd2, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd1, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd0, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcf, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xce, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcd, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcc, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcb, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xca, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc9, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc8, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc7, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc6, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc5, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc4, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc3, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc2, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc1, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc0, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbf, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbe, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbd, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbc, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbb, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xba, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb9, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb8, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb7, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb6, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb5, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb4, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb3, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb2, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb1, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb0, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xaf, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xae, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xad, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xac, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xab, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xaa, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa9, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa8, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa7, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa6, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa5, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa4, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa3, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa2, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa1, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa0, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9f, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9e, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9d, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9c, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9b, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9a, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x99, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x98, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x97, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x96, 0x00, 0x02, 0x00, 0x94, 0x00, 0x01, 0x00, 0x04, 0x00, 0x95, 0x00, 0x02, 0x00, 0x94, 0x00, 0x02, 0x00, 0x07, 0x00, 0x24, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x3f, 0x00, 0x45, 0x00, 0x1a, 0x00, 0x48, 0x00, 0x4b, 0x00, 0x21, 0x00, 0x4e, 0x00, 0x4e, 0x00, 0x25, 0x00, 0x50, 0x00, 0x69, 0x00, 0x26, 0x00, 0x6b, 0x00, 0x71, 0x00, 0x40, 0x00, 0x74, 0x00, 0x78, 0x00, 0x47, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x01, 0xce, 0x00, 0x26, 0x01, 0xc4, 0x01, 0xba, 0x01, 0xb0, 0x01, 0xa6, 0x01, 0x9c, 0x01, 0x92, 0x01, 0x88, 0x01, 0x7e, 0x01, 0x74, 0x01, 0x6a, 0x01, 0x60, 0x01, 0x56, 0x01, 0x4c, 0x01, 0x42, 0x01, 0x38, 0x01, 0x2e, 0x01, 0x24, 0x01, 0x1a, 0x01, 0x10, 0x01, 0x06, 0x00, 0xfc, 0x00, 0xf2, 0x00, 0xe8, 0x00, 0xde, 0x00, 0xd4, 0x00, 0xca, 0x00, 0xc0, 0x00, 0xb6, 0x00, 0xac, 0x00, 0xa2, 0x00, 0x98, 0x00, 0x8e, 0x00, 0x84, 0x00, 0x7a, 0x00, 0x70, 0x00, 0x66, 0x00, 0x5c, 0x00, 0x52, 0x00, 0x01, 0x00, 0x04, 0x00, 0xe0, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdf, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xde, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdd, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdc, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xdb, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xda, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd9, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd8, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd7, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd6, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd5, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd4, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd3, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd2, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd1, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xd0, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcf, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xce, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcd, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcc, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xcb, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xca, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc9, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc8, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc7, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc6, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc5, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc4, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc3, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc2, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc1, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xc0, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbf, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbe, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbd, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbc, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0xbb, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x02, 0x00, 0x01, 0x00, 0x95, 0x00, 0xba, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x01, 0xf4, 0x00, 0x2a, 0x01, 0xea, 0x01, 0xe0, 0x01, 0xd6, 0x01, 0xcc, 0x01, 0xc2, 0x01, 0xb8, 0x01, 0xae, 0x01, 0xa4, 0x01, 0x9a, 0x01, 0x90, 0x01, 0x86, 0x01, 0x7c, 0x01, 0x72, 0x01, 0x68, 0x01, 0x5e, 0x01, 0x54, 0x01, 0x4a, 0x01, 0x40, 0x01, 0x36, 0x01, 0x2c, 0x01, 0x22, 0x01, 0x18, 0x01, 0x0e, 0x01, 0x04, 0x00, 0xfa, 0x00, 0xf0, 0x00, 0xe6, 0x00, 0xdc, 0x00, 0xd2, 0x00, 0xc8, 0x00, 0xbe, 0x00, 0xb4, 0x00, 0xaa, 0x00, 0xa0, 0x00, 0x96, 0x00, 0x8c, 0x00, 0x82, 0x00, 0x78, 0x00, 0x6e, 0x00, 0x64, 0x00, 0x5a, 0x00, 0xe6, 0x00, 0x01, 0x00, 0x04, 0x00, 0x78, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x77, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x76, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x75, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x74, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x73, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x72, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x71, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x70, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6f, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6e, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6d, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6c, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x6b, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x93, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x69, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x68, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x67, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x66, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x65, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x64, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x63, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x62, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x61, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x60, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5f, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5e, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5d, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5c, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5b, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x5a, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x59, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x58, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x57, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x56, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x55, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x54, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x53, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x52, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x51, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x50, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x02, 0x00, 0x02, 0x00, 0x24, 0x00, 0x4b, 0x00, 0x00, 0x00, 0x4e, 0x00, 0x4f, 0x00, 0x28, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x02, 0xac, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x04, 0x00, 0x94, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x02, 0x8c, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x04, 0x00, 0x94, 0x00, 0x02, 0x00, 0x3e, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x02, 0x1a, 0x00, 0x26, 0x02, 0x0e, 0x02, 0x02, 0x01, 0xf6, 0x01, 0xea, 0x01, 0xde, 0x01, 0xd2, 0x01, 0xc6, 0x01, 0xba, 0x01, 0xae, 0x01, 0xa2, 0x01, 0x96, 0x01, 0x8a, 0x01, 0x7e, 0x01, 0x72, 0x01, 0x66, 0x01, 0x5a, 0x01, 0x4e, 0x01, 0x42, 0x01, 0x36, 0x01, 0x2a, 0x01, 0x1e, 0x01, 0x12, 0x01, 0x06, 0x00, 0xfa, 0x00, 0xee, 0x00, 0xe2, 0x00, 0xd6, 0x00, 0xca, 0x00, 0xbe, 0x00, 0xb2, 0x00, 0xa6, 0x00, 0x9a, 0x00, 0x8e, 0x00, 0x82, 0x00, 0x76, 0x00, 0x6a, 0x00, 0x5e, 0x00, 0x52, 0x00, 0x01, 0x00, 0x04, 0x00, 0xba, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb9, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb8, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb7, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb6, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb5, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb4, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb3, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb2, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb1, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xb0, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xaf, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xae, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xad, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xac, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xab, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xaa, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa9, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa8, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa7, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa6, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa5, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa4, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa3, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa2, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa1, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0xa0, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9f, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9e, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9d, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9c, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9b, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x9a, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x99, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x98, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x97, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x96, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x95, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x3e, 0x00, 0x02, 0x00, 0x04, 0x00, 0x24, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x3f, 0x00, 0x45, 0x00, 0x1a, 0x00, 0x48, 0x00, 0x4b, 0x00, 0x21, 0x00, 0x4e, 0x00, 0x4e, 0x00, 0x25, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x3a, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x04, 0x00, 0x92, 0x00, 0x02, 0x00, 0x7d, 0x00, 0x06, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x03, 0x00, 0x00, 0x00, 0x02, 0x00, 0x20, 0x00, 0x1a, 0x00, 0x01, 0x00, 0x14, 0x00, 0x01, 0x00, 0x00, 0x00, 0x18, 0x00, 0x01, 0x00, 0x01, 0x00, 0x90, 0x00, 0x01, 0x00, 0x01, 0x00, 0x7d, 0x00, 0x01, 0x00, 0x01, 0x00, 0x3e, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x22, 0x00, 0x02, 0x00, 0x16, 0x00, 0x0a, 0x00, 0x01, 0x00, 0x04, 0x00, 0x47, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x2d, 0x00, 0x01, 0x00, 0x04, 0x00, 0x46, 0x00, 0x03, 0x00, 0x7d, 0x00, 0x42, 0x00, 0x01, 0x00, 0x02, 0x00, 0x24, 0x00, 0x2b, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x01, 0x00, 0x66, 0x00, 0x08, 0x00, 0x5c, 0x00, 0x52, 0x00, 0x48, 0x00, 0x3e, 0x00, 0x34, 0x00, 0x2a, 0x00, 0x20, 0x00, 0x16, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4f, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4e, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4d, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4c, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4b, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x4a, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x49, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x04, 0x00, 0x48, 0x00, 0x02, 0x00, 0x7e, 0x00, 0x01, 0x00, 0x08, 0x00, 0x24, 0x00, 0x25, 0x00, 0x26, 0x00, 0x2b, 0x00, 0x30, 0x00, 0x31, 0x00, 0x39, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x01, 0xf4, 0x02, 0xbc, 0x00, 0x03, 0x00, 0x06, 0x00, 0x09, 0x00, 0x0c, 0x00, 0x0f, 0x00, 0x00, 0x11, 0x21, 0x11, 0x21, 0x01, 0x21, 0x17, 0x03, 0x37, 0x27, 0x01, 0x11, 0x07, 0x13, 0x27, 0x07, 0x01, 0xf4, 0xfe, 0x0c, 0x01, 0xa4, 0xfe, 0xac, 0xaa, 0xc8, 0xaa, 0xaa, 0x01, 0x90, 0xaa, 0x8c, 0xaa, 0xaa, 0x02, 0xbc, 0xfd, 0x44, 0x02, 0x8a, 0xff, 0xfe, 0xd4, 0xff, 0xff, 0xfe, 0x02, 0x01, 0xfe, 0xff, 0xfe, 0xd4, 0xff, 0xff, 0x00, 0x01, 0x00, 0x41, 0x00, 0x00, 0x03, 0x57, 0x02, 0xed, 0x00, 0x35, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x27, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x17, 0x33, 0x11, 0x03, 0x57, 0x6f, 0x81, 0x75, 0x03, 0x70, 0x5d, 0x44, 0x69, 0x3a, 0x79, 0x38, 0x2d, 0x2d, 0x34, 0x38, 0x37, 0x2b, 0x2b, 0x30, 0x36, 0x33, 0x26, 0x29, 0x36, 0x77, 0x36, 0x61, 0x3f, 0x5c, 0x70, 0x3a, 0x35, 0x1a, 0x18, 0xba, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x1f, 0x01, 0x13, 0x12, 0x58, 0x6a, 0x34, 0x5f, 0x3d, 0x2a, 0x37, 0x35, 0x2a, 0x29, 0x39, 0x68, 0x32, 0x24, 0x28, 0x31, 0x30, 0x26, 0x3a, 0x59, 0x30, 0x62, 0x52, 0x37, 0x51, 0x10, 0x02, 0x05, 0x10, 0x01, 0x5a, 0x00, 0x01, 0x00, 0x41, 0x00, 0x00, 0x04, 0x8d, 0x02, 0xed, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x27, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x17, 0x33, 0x11, 0x21, 0x04, 0x8d, 0x6f, 0x81, 0xb5, 0x81, 0x75, 0x03, 0x70, 0x5d, 0x44, 0x69, 0x3a, 0x79, 0x38, 0x2d, 0x2d, 0x34, 0x38, 0x37, 0x2b, 0x2b, 0x30, 0x36, 0x33, 0x26, 0x29, 0x36, 0x77, 0x36, 0x61, 0x3f, 0x5c, 0x70, 0x3a, 0x35, 0x1a, 0x18, 0xba, 0x02, 0x26, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x1f, 0x01, 0x13, 0x12, 0x58, 0x6a, 0x34, 0x5f, 0x3d, 0x2a, 0x37, 0x35, 0x2a, 0x29, 0x39, 0x68, 0x32, 0x24, 0x28, 0x31, 0x30, 0x26, 0x3a, 0x59, 0x30, 0x62, 0x52, 0x37, 0x51, 0x10, 0x02, 0x05, 0x10, 0x01, 0x5a, 0x00, 0x00, 0x01, 0xff, 0xe5, 0xff, 0xaf, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xf9, 0x33, 0x2b, 0x24, 0x2c, 0x58, 0x76, 0x5d, 0x53, 0x36, 0x47, 0x12, 0x7a, 0x74, 0x04, 0x3b, 0x31, 0x2c, 0x2f, 0x3c, 0x30, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x8e, 0x02, 0x79, 0x8b, 0xb5, 0x01, 0xc1, 0x1c, 0x21, 0x1e, 0x1d, 0x53, 0x5d, 0x4a, 0x5f, 0x2a, 0x19, 0x84, 0x01, 0x00, 0x2c, 0x33, 0x2b, 0x21, 0x2b, 0x27, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x6c, 0xb7, 0x00, 0x01, 0xff, 0xe5, 0xff, 0xaf, 0x02, 0xcc, 0x03, 0xf8, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x07, 0x02, 0x57, 0x01, 0x23, 0x1f, 0x23, 0x22, 0x8d, 0x8b, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x58, 0x76, 0x5d, 0x53, 0x36, 0x47, 0x12, 0x7a, 0x74, 0x04, 0x3b, 0x31, 0x2c, 0x2f, 0x3c, 0x30, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x8e, 0x01, 0x74, 0x58, 0x62, 0x59, 0x60, 0x04, 0x03, 0x39, 0x26, 0x2d, 0x32, 0x31, 0x45, 0x6c, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x53, 0x5d, 0x4a, 0x5f, 0x2a, 0x19, 0x84, 0x01, 0x00, 0x2c, 0x33, 0x2b, 0x21, 0x2b, 0x27, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x44, 0x5a, 0x76, 0x67, 0x58, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x03, 0x02, 0x4e, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x00, 0x00, 0x06, 0x07, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x01, 0xe9, 0x37, 0x2c, 0x39, 0x45, 0x36, 0x65, 0x46, 0x48, 0x70, 0x3f, 0x7b, 0x43, 0x33, 0x32, 0x3b, 0x3a, 0x3a, 0x37, 0x25, 0x32, 0x37, 0xfe, 0x7e, 0x02, 0x63, 0x65, 0x01, 0xef, 0x50, 0x09, 0x02, 0x0f, 0x65, 0x44, 0x40, 0x62, 0x37, 0x39, 0x69, 0x45, 0x32, 0x41, 0x3e, 0x31, 0x2f, 0x44, 0x71, 0x37, 0x31, 0x46, 0x6c, 0x6c, 0x4d, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x03, 0x03, 0x6d, 0x02, 0xe4, 0x00, 0x37, 0x00, 0x00, 0x00, 0x06, 0x07, 0x15, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x01, 0xe9, 0x37, 0x2c, 0xbd, 0x6b, 0x7e, 0x67, 0x59, 0x16, 0x20, 0x0b, 0x15, 0x29, 0x31, 0x3b, 0x30, 0x54, 0x12, 0x36, 0x65, 0x45, 0x48, 0x70, 0x3f, 0x7b, 0x43, 0x33, 0x32, 0x3b, 0x3a, 0x3a, 0x37, 0x25, 0x32, 0x37, 0xfe, 0x7e, 0x03, 0x82, 0xfe, 0x7c, 0x01, 0xef, 0x50, 0x09, 0x02, 0x62, 0x63, 0x57, 0x62, 0x05, 0x62, 0x01, 0x2b, 0x2d, 0x2d, 0x2c, 0x27, 0x31, 0x3c, 0x60, 0x36, 0x39, 0x69, 0x45, 0x32, 0x41, 0x3e, 0x31, 0x2f, 0x44, 0x71, 0x37, 0x31, 0x46, 0x6c, 0x6c, 0x4d, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xbd, 0x04, 0x25, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x00, 0x01, 0x15, 0x33, 0x32, 0x35, 0x35, 0x33, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x06, 0x23, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x5c, 0x9e, 0x47, 0x6f, 0x17, 0x2f, 0x31, 0x37, 0x2e, 0x19, 0x20, 0x28, 0x23, 0x5b, 0x74, 0x47, 0x3d, 0x26, 0x34, 0x8b, 0x77, 0xdc, 0xa3, 0x01, 0x7e, 0x0c, 0x48, 0x33, 0x46, 0x54, 0x81, 0x3c, 0x6f, 0x4a, 0x72, 0x3c, 0xfe, 0x06, 0x04, 0x3a, 0x02, 0x78, 0xba, 0x3e, 0x2d, 0xfe, 0xa1, 0x2f, 0x25, 0x2a, 0x28, 0x08, 0x67, 0x08, 0x5b, 0x52, 0x40, 0x56, 0x10, 0x59, 0x11, 0xfe, 0xa8, 0xd1, 0xd1, 0x06, 0x01, 0x4b, 0x2d, 0x36, 0x57, 0x48, 0x4f, 0x7a, 0x43, 0x50, 0xa7, 0x6c, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x16, 0x04, 0x26, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x00, 0x01, 0x15, 0x33, 0x32, 0x35, 0x35, 0x33, 0x11, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x06, 0x23, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x5c, 0x9e, 0x47, 0x6f, 0x25, 0x50, 0x2f, 0x24, 0x35, 0x31, 0x58, 0x34, 0x28, 0x31, 0x33, 0x16, 0x42, 0x20, 0x52, 0x71, 0x36, 0x2a, 0x2b, 0x35, 0x4c, 0x36, 0x26, 0x34, 0x8b, 0x77, 0xdc, 0xa3, 0x01, 0x7e, 0x0c, 0x48, 0x33, 0x46, 0x54, 0x81, 0x3c, 0x6f, 0x4a, 0x72, 0x3c, 0xfe, 0x06, 0x04, 0x3b, 0x02, 0x78, 0xba, 0x3e, 0x2d, 0xfe, 0x9e, 0x3b, 0x1d, 0x1c, 0x60, 0x3d, 0x20, 0x1b, 0x0f, 0x60, 0x09, 0x0b, 0x49, 0x4a, 0x2d, 0x40, 0x09, 0x04, 0x0a, 0x37, 0x2f, 0x39, 0x3c, 0x05, 0x5c, 0x11, 0xfe, 0xa8, 0xd1, 0xd1, 0x06, 0x01, 0x4b, 0x2d, 0x36, 0x57, 0x48, 0x4f, 0x7a, 0x43, 0x50, 0xa7, 0x6c, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xbb, 0x03, 0x9c, 0x02, 0xe4, 0x00, 0x43, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0xbd, 0x41, 0x4f, 0x10, 0x07, 0x39, 0x37, 0x39, 0x2e, 0x22, 0x18, 0x28, 0x22, 0x5e, 0x75, 0x48, 0x38, 0x02, 0x35, 0x30, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x43, 0x3c, 0x1b, 0x0d, 0x15, 0x78, 0x83, 0x3a, 0x65, 0x3e, 0x44, 0x55, 0x13, 0x03, 0x0f, 0x3c, 0x2e, 0xfd, 0xab, 0x03, 0xb1, 0x02, 0x78, 0x6a, 0x14, 0x76, 0x59, 0x34, 0x30, 0x2f, 0x26, 0x29, 0x27, 0x07, 0x67, 0x07, 0x5b, 0x56, 0x3a, 0x56, 0x0e, 0x0b, 0x17, 0x36, 0x44, 0x4f, 0x40, 0x19, 0x19, 0x3f, 0x50, 0x45, 0x38, 0x41, 0x47, 0x02, 0x71, 0x01, 0x88, 0x72, 0x4c, 0x6b, 0x36, 0x48, 0x37, 0x2a, 0x40, 0x0d, 0x68, 0x6c, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x16, 0x03, 0xa3, 0x02, 0xe4, 0x00, 0x53, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x15, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0xbd, 0x41, 0x4f, 0x10, 0x21, 0x50, 0x2f, 0x24, 0x36, 0x31, 0x59, 0x34, 0x28, 0x1b, 0x38, 0x11, 0x16, 0x42, 0x1f, 0x53, 0x71, 0x36, 0x2a, 0x2b, 0x35, 0x46, 0x34, 0x02, 0x35, 0x30, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x43, 0x3c, 0x1b, 0x0d, 0x15, 0x78, 0x83, 0x3a, 0x65, 0x3e, 0x44, 0x55, 0x13, 0x03, 0x0f, 0x3c, 0x2e, 0xfd, 0xab, 0x03, 0xb8, 0x02, 0x78, 0x6a, 0x14, 0x76, 0x59, 0x34, 0x30, 0x3b, 0x1d, 0x1c, 0x60, 0x3d, 0x20, 0x1b, 0x0a, 0x05, 0x60, 0x09, 0x0b, 0x49, 0x4b, 0x2c, 0x40, 0x09, 0x04, 0x0a, 0x37, 0x2f, 0x37, 0x3a, 0x08, 0x14, 0x0c, 0x36, 0x44, 0x4f, 0x40, 0x19, 0x19, 0x3f, 0x50, 0x45, 0x38, 0x41, 0x47, 0x02, 0x71, 0x01, 0x88, 0x72, 0x4c, 0x6b, 0x36, 0x48, 0x37, 0x2a, 0x40, 0x0d, 0x68, 0x6c, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x13, 0x02, 0xa1, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x00, 0x01, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x03, 0x23, 0x35, 0x21, 0x02, 0xa1, 0x61, 0x52, 0x5e, 0x17, 0x1a, 0x07, 0x0e, 0x29, 0x26, 0xe8, 0x3e, 0x38, 0x35, 0x3c, 0x7e, 0x7f, 0x6d, 0x7b, 0x7f, 0x01, 0x6e, 0x02, 0xb6, 0x02, 0x78, 0x5d, 0x68, 0x6a, 0x03, 0x74, 0x01, 0x2f, 0x31, 0x59, 0xfe, 0x92, 0x42, 0x47, 0x3e, 0x37, 0x6b, 0x78, 0x88, 0x74, 0x01, 0x69, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x13, 0x02, 0xa1, 0x03, 0xe1, 0x00, 0x2d, 0x00, 0x00, 0x01, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x03, 0x23, 0x35, 0x21, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x33, 0x02, 0xa1, 0x61, 0x52, 0x5e, 0x17, 0x1a, 0x07, 0x0e, 0x29, 0x26, 0xe8, 0x3e, 0x38, 0x35, 0x3c, 0x7e, 0x7f, 0x6d, 0x7b, 0x7f, 0x01, 0x6e, 0x01, 0xd4, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x50, 0x5d, 0x5b, 0x42, 0x67, 0x02, 0x78, 0x5d, 0x68, 0x6a, 0x03, 0x74, 0x01, 0x2f, 0x31, 0x59, 0xfe, 0x92, 0x42, 0x47, 0x3e, 0x37, 0x6b, 0x78, 0x88, 0x74, 0x01, 0x69, 0x6c, 0x44, 0x3d, 0x13, 0x69, 0x01, 0x20, 0x69, 0x73, 0x00, 0x01, 0x00, 0x41, 0x00, 0x00, 0x04, 0x8d, 0x03, 0xe1, 0x00, 0x45, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x27, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x17, 0x33, 0x11, 0x21, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x04, 0x8d, 0x6f, 0x81, 0xb5, 0x81, 0x75, 0x03, 0x70, 0x5d, 0x44, 0x69, 0x3a, 0x79, 0x38, 0x2d, 0x2d, 0x34, 0x38, 0x37, 0x2b, 0x2b, 0x30, 0x36, 0x33, 0x26, 0x29, 0x36, 0x77, 0x36, 0x61, 0x3f, 0x5c, 0x70, 0x3a, 0x35, 0x1a, 0x18, 0xba, 0x01, 0x36, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x50, 0x5d, 0x5b, 0x42, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x1f, 0x01, 0x13, 0x12, 0x58, 0x6a, 0x34, 0x5f, 0x3d, 0x2a, 0x37, 0x35, 0x2a, 0x29, 0x39, 0x68, 0x32, 0x24, 0x28, 0x31, 0x30, 0x26, 0x3a, 0x59, 0x30, 0x62, 0x52, 0x37, 0x51, 0x10, 0x02, 0x05, 0x10, 0x01, 0x5a, 0x44, 0x3d, 0x13, 0x69, 0x01, 0x20, 0x69, 0x73, 0x00, 0x01, 0x00, 0x41, 0x00, 0x00, 0x04, 0x8d, 0x04, 0x24, 0x00, 0x50, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x27, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x17, 0x33, 0x11, 0x21, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x04, 0x8d, 0x6f, 0x81, 0xb5, 0x81, 0x75, 0x03, 0x70, 0x5d, 0x44, 0x69, 0x3a, 0x79, 0x38, 0x2d, 0x2d, 0x34, 0x38, 0x37, 0x2b, 0x2b, 0x30, 0x36, 0x33, 0x26, 0x29, 0x36, 0x77, 0x36, 0x61, 0x3f, 0x5c, 0x70, 0x3a, 0x35, 0x1a, 0x18, 0xba, 0x01, 0x3e, 0x3c, 0x35, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x50, 0x53, 0x5c, 0x50, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x1f, 0x01, 0x13, 0x12, 0x58, 0x6a, 0x34, 0x5f, 0x3d, 0x2a, 0x37, 0x35, 0x2a, 0x29, 0x39, 0x68, 0x32, 0x24, 0x28, 0x31, 0x30, 0x26, 0x3a, 0x59, 0x30, 0x62, 0x52, 0x37, 0x51, 0x10, 0x02, 0x05, 0x10, 0x01, 0x5a, 0x29, 0x1d, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x23, 0x81, 0x9c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0x00, 0x13, 0x02, 0xa1, 0x03, 0xff, 0x00, 0x22, 0x00, 0x0e, 0x00, 0x00, 0x00, 0x07, 0x00, 0x22, 0x01, 0xe9, 0x00, 0x0c, 0xff, 0xff, 0x00, 0x41, 0x00, 0x00, 0x03, 0x91, 0x04, 0x03, 0x00, 0x22, 0x00, 0x04, 0x00, 0x00, 0x00, 0x07, 0x00, 0x22, 0x03, 0x51, 0x00, 0x10, 0xff, 0xff, 0x00, 0x41, 0x00, 0x00, 0x04, 0x8d, 0x03, 0xff, 0x00, 0x22, 0x00, 0x05, 0x00, 0x00, 0x00, 0x07, 0x00, 0x22, 0x03, 0xe7, 0x00, 0x0c, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x01, 0x4a, 0x02, 0xe4, 0x00, 0x07, 0x00, 0x00, 0x33, 0x11, 0x23, 0x35, 0x21, 0x15, 0x23, 0x11, 0x5a, 0x6f, 0x01, 0x5f, 0x6f, 0x02, 0x78, 0x6c, 0x6c, 0xfd, 0x88, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x84, 0x03, 0xfa, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x3e, 0x02, 0x33, 0x02, 0x64, 0xb8, 0x68, 0x81, 0x4f, 0x7e, 0x47, 0x71, 0x9f, 0x05, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x03, 0x69, 0xb5, 0x74, 0x03, 0xfa, 0x46, 0x84, 0x58, 0x11, 0x0f, 0x3f, 0x53, 0x28, 0x52, 0x5a, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x58, 0x7d, 0x41, 0x00, 0x00, 0x01, 0xff, 0x25, 0x00, 0x00, 0x01, 0x4a, 0x03, 0xfa, 0x00, 0x18, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x32, 0x15, 0x15, 0x01, 0x4a, 0x6f, 0x81, 0x6f, 0x73, 0x28, 0x35, 0x36, 0x29, 0x7d, 0x69, 0x73, 0xda, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x28, 0x36, 0x4b, 0x4b, 0x36, 0x45, 0x3e, 0x71, 0x84, 0xf5, 0x21, 0x00, 0x01, 0xfe, 0x39, 0xfe, 0xbc, 0x00, 0x06, 0x00, 0x26, 0x00, 0x15, 0x00, 0x00, 0x16, 0x06, 0x23, 0x22, 0x26, 0x37, 0x33, 0x06, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x15, 0x06, 0x72, 0x62, 0x6b, 0x8e, 0x02, 0x72, 0x02, 0x48, 0x3c, 0x31, 0x38, 0x2c, 0x29, 0x1e, 0x1e, 0x5f, 0x64, 0xe2, 0x62, 0x6e, 0x71, 0x3e, 0x3d, 0x2c, 0x28, 0x21, 0x2c, 0x65, 0x61, 0x52, 0x00, 0x00, 0x01, 0xfe, 0x92, 0xfe, 0xc8, 0x00, 0x63, 0x00, 0x22, 0x00, 0x1a, 0x00, 0x00, 0x02, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0xa0, 0x19, 0x4e, 0x67, 0x73, 0x5c, 0x86, 0x7c, 0x02, 0x69, 0x4f, 0x49, 0x2d, 0x3a, 0x32, 0x24, 0x13, 0x0b, 0xfe, 0xc8, 0x58, 0x51, 0x52, 0x5f, 0xa4, 0x81, 0x11, 0x1e, 0x36, 0x5b, 0x62, 0x2b, 0x26, 0x23, 0x28, 0x01, 0x5d, 0x00, 0x01, 0xfe, 0xa6, 0xfe, 0xba, 0xff, 0xdb, 0x00, 0x23, 0x00, 0x14, 0x00, 0x00, 0x02, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x52, 0x37, 0x57, 0x7a, 0x6e, 0x61, 0x28, 0x09, 0x27, 0x2c, 0x30, 0x3b, 0x2e, 0x26, 0x29, 0xfe, 0xba, 0x59, 0x5d, 0x50, 0x63, 0x01, 0x58, 0x30, 0x25, 0x2c, 0x28, 0x0c, 0x64, 0x00, 0x01, 0xfe, 0xc0, 0xfe, 0x2c, 0xff, 0xfb, 0x00, 0x23, 0x00, 0x23, 0x00, 0x00, 0x02, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x15, 0x1a, 0x42, 0x20, 0x52, 0x72, 0x36, 0x2b, 0x2b, 0x35, 0x5d, 0x3d, 0x4b, 0x19, 0x50, 0x2e, 0x24, 0x36, 0x30, 0x59, 0x34, 0x28, 0x1c, 0x39, 0x0e, 0xfe, 0x36, 0x0a, 0x47, 0x4a, 0x2f, 0x3f, 0x09, 0x04, 0x0a, 0x37, 0x2f, 0x40, 0x3b, 0x47, 0x3b, 0x1e, 0x1b, 0x60, 0x3d, 0x20, 0x1b, 0x0a, 0x05, 0x61, 0x00, 0x00, 0x01, 0xfe, 0x41, 0xfe, 0x28, 0x00, 0x9e, 0xff, 0xeb, 0x00, 0x3d, 0x00, 0x00, 0x12, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x8f, 0x0f, 0x1c, 0x1b, 0x48, 0x59, 0x35, 0x2a, 0x01, 0x25, 0x23, 0x26, 0x26, 0x54, 0x25, 0x25, 0x25, 0x29, 0x31, 0x2a, 0x0f, 0x06, 0x0a, 0x0f, 0x5a, 0x62, 0x5e, 0x46, 0x33, 0x3f, 0x0e, 0x03, 0x0e, 0x44, 0x34, 0x2c, 0x48, 0x2b, 0x0c, 0x06, 0x2b, 0x29, 0x2b, 0x20, 0xfe, 0x79, 0x05, 0x51, 0x05, 0x45, 0x40, 0x2c, 0x40, 0x0b, 0x07, 0x0e, 0x28, 0x31, 0x39, 0x2e, 0x12, 0x12, 0x2e, 0x39, 0x31, 0x29, 0x2e, 0x33, 0x02, 0x58, 0x01, 0x65, 0x54, 0x55, 0x5d, 0x34, 0x29, 0x28, 0x35, 0x29, 0x51, 0x38, 0x22, 0x27, 0x22, 0x1b, 0x1c, 0x1e, 0x00, 0x01, 0xfe, 0x41, 0xfd, 0xaf, 0x00, 0xb8, 0xff, 0xeb, 0x00, 0x4c, 0x00, 0x00, 0x12, 0x36, 0x37, 0x15, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x22, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x33, 0x83, 0x29, 0x0c, 0x10, 0x31, 0x18, 0x3e, 0x54, 0x28, 0x1f, 0x20, 0x27, 0x32, 0x26, 0x01, 0x25, 0x23, 0x26, 0x26, 0x54, 0x25, 0x25, 0x25, 0x29, 0x31, 0x2a, 0x0f, 0x06, 0x0a, 0x0f, 0x5a, 0x62, 0x5e, 0x46, 0x33, 0x3f, 0x0e, 0x03, 0x0e, 0x44, 0x34, 0x2c, 0x48, 0x2b, 0x0c, 0x1a, 0x3a, 0x21, 0x1c, 0x26, 0x23, 0x41, 0x42, 0xfd, 0xfc, 0x07, 0x04, 0x4b, 0x06, 0x07, 0x34, 0x38, 0x23, 0x2f, 0x07, 0x02, 0x07, 0x2b, 0x23, 0x29, 0x2c, 0x06, 0x06, 0x0d, 0x28, 0x31, 0x39, 0x2e, 0x12, 0x12, 0x2e, 0x39, 0x31, 0x29, 0x2e, 0x33, 0x02, 0x58, 0x01, 0x65, 0x54, 0x55, 0x5d, 0x34, 0x29, 0x28, 0x35, 0x29, 0x51, 0x38, 0x22, 0x27, 0x2a, 0x15, 0x14, 0x4b, 0x2c, 0x2a, 0x00, 0x00, 0x01, 0xfe, 0x2b, 0x02, 0xe0, 0xff, 0xa5, 0x03, 0xe1, 0x00, 0x0b, 0x00, 0x00, 0x03, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0xd5, 0x2d, 0x38, 0x39, 0x31, 0x31, 0x2e, 0x50, 0x5e, 0x5c, 0x42, 0x02, 0xe0, 0x46, 0x3e, 0x14, 0x69, 0x01, 0x20, 0x6b, 0x75, 0x00, 0x00, 0x01, 0xfe, 0x21, 0x02, 0xe1, 0xff, 0xa4, 0x04, 0x24, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16, 0x16, 0x17, 0x23, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0xfe, 0xa3, 0x53, 0x5d, 0x51, 0x6e, 0x3f, 0x36, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x04, 0x24, 0x23, 0x82, 0x9e, 0x2b, 0x1e, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x00, 0x00, 0x01, 0xff, 0x61, 0x00, 0x00, 0x01, 0x4a, 0x03, 0xe1, 0x00, 0x13, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x01, 0x4a, 0x6f, 0x81, 0x6f, 0x73, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x50, 0x5d, 0x5b, 0x42, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x44, 0x3d, 0x13, 0x69, 0x01, 0x20, 0x69, 0x73, 0x00, 0x01, 0xff, 0x53, 0x00, 0x00, 0x01, 0x4a, 0x04, 0x24, 0x00, 0x1e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x01, 0x4a, 0x6f, 0x81, 0x6f, 0x79, 0x3c, 0x35, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x50, 0x53, 0x5c, 0x50, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x29, 0x1d, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x23, 0x81, 0x9c, 0x00, 0x00, 0x01, 0xfe, 0x7d, 0x03, 0x2e, 0x00, 0x40, 0x03, 0xf3, 0x00, 0x0d, 0x00, 0x00, 0x12, 0x06, 0x23, 0x22, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x40, 0x71, 0x70, 0x70, 0x72, 0x6f, 0x39, 0x3a, 0x39, 0x3a, 0x6e, 0x03, 0x9b, 0x6d, 0x6d, 0x58, 0x2b, 0x3a, 0x3a, 0x2b, 0xff, 0xff, 0xff, 0xba, 0x00, 0x00, 0x01, 0x7d, 0x03, 0xf3, 0x00, 0x22, 0x00, 0x15, 0x00, 0x00, 0x00, 0x03, 0x00, 0x22, 0x01, 0x3d, 0x00, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0xe4, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x2d, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xf9, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xfb, 0x03, 0xcb, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xcb, 0x6f, 0x80, 0x2b, 0x58, 0x0b, 0x16, 0x22, 0x73, 0x4d, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x01, 0xc1, 0x29, 0x1e, 0x20, 0x32, 0x59, 0x37, 0x56, 0x2d, 0xfe, 0x95, 0x5c, 0x4d, 0x4d, 0x44, 0x01, 0x4d, 0x36, 0x35, 0x32, 0x2e, 0x3d, 0x3d, 0x2e, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xb5, 0x3c, 0x02, 0x3a, 0x46, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3c, 0xa0, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x29, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x03, 0x29, 0x6f, 0x81, 0x91, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xd4, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x28, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x02, 0xd4, 0x6e, 0x82, 0x1f, 0x64, 0x3e, 0x60, 0x7b, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x02, 0xe9, 0xf0, 0xfe, 0xf3, 0x33, 0x39, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x2d, 0x4a, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xbd, 0x2c, 0x2f, 0x60, 0x57, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0x6c, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x26, 0x47, 0x2d, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xee, 0x02, 0xc3, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0xc3, 0xec, 0xb6, 0x25, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x5b, 0xfe, 0x91, 0x02, 0x8c, 0x29, 0x29, 0x1e, 0x1e, 0x29, 0x29, 0x1e, 0x02, 0xe4, 0x6c, 0xb7, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0xfe, 0xdd, 0x29, 0x1e, 0x1d, 0x29, 0x29, 0x1d, 0x1e, 0x29, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xff, 0x02, 0xe4, 0x00, 0x20, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x11, 0x21, 0x35, 0x21, 0x02, 0xff, 0x6f, 0x81, 0x1d, 0x5e, 0x3a, 0x3b, 0x5e, 0x37, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0xfd, 0xdc, 0x03, 0x14, 0x02, 0x78, 0xfd, 0x88, 0xb0, 0x29, 0x2e, 0x2e, 0x58, 0x3c, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x01, 0x0f, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x17, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x36, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x02, 0x82, 0x3e, 0x49, 0x5b, 0xaa, 0x74, 0x98, 0xb6, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x03, 0x5f, 0xfe, 0xc1, 0xfe, 0xca, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x46, 0x3a, 0x02, 0x78, 0x61, 0x11, 0x69, 0x51, 0x5e, 0x8c, 0x4b, 0x71, 0x6c, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x46, 0x53, 0x0e, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x69, 0x02, 0xe4, 0x00, 0x1c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x03, 0x69, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0d, 0xfd, 0x72, 0x03, 0x7e, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x8c, 0x6c, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xaf, 0x03, 0x72, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x03, 0x11, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x03, 0x72, 0x6f, 0x7e, 0x94, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x03, 0x87, 0xed, 0xb2, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0xe8, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0xfe, 0x65, 0x01, 0x2f, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x4e, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x11, 0x21, 0x35, 0x21, 0x03, 0x4e, 0x6f, 0x81, 0x5a, 0x0e, 0x79, 0x5d, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x5b, 0x77, 0x10, 0x5c, 0xfd, 0x8d, 0x03, 0x63, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x00, 0x57, 0x66, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0x61, 0x52, 0x01, 0x0b, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x1c, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x1b, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x47, 0x83, 0x58, 0x05, 0xfe, 0x89, 0x02, 0xb1, 0xbc, 0x7b, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x50, 0x74, 0x3e, 0x5b, 0x6c, 0x6c, 0xc8, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x24, 0x02, 0xb5, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x20, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x8f, 0x5e, 0x79, 0x49, 0x7e, 0x4f, 0x4e, 0x7e, 0x49, 0x77, 0x5d, 0xfe, 0xdc, 0x02, 0xca, 0xcf, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x4c, 0x74, 0x3e, 0x3e, 0x74, 0x4c, 0x65, 0x81, 0x12, 0x5e, 0x6c, 0x6c, 0xfe, 0xea, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xee, 0x02, 0x4d, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xfc, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x58, 0xfe, 0x94, 0x02, 0x62, 0x7a, 0xb2, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0x6c, 0xb7, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xfe, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x2c, 0x74, 0x66, 0x5a, 0x3e, 0x51, 0x29, 0x1f, 0x1c, 0x26, 0x03, 0x5d, 0x04, 0x5c, 0x49, 0x52, 0x5f, 0x87, 0x79, 0x59, 0x8f, 0x52, 0x4c, 0x84, 0x54, 0x1b, 0xfe, 0x71, 0x02, 0xb3, 0xaa, 0x6c, 0x01, 0xca, 0x60, 0x5a, 0x50, 0x65, 0x3a, 0x31, 0x20, 0x2a, 0x23, 0x1c, 0x0a, 0x08, 0x18, 0x0c, 0x41, 0x49, 0x5c, 0x4b, 0x5d, 0x6b, 0x43, 0x7e, 0x55, 0x57, 0x7a, 0x3e, 0x55, 0x6c, 0x6c, 0xae, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x85, 0x02, 0xe4, 0x00, 0x10, 0x00, 0x19, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x85, 0x6f, 0x81, 0x9d, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x03, 0x9a, 0xfd, 0xf4, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xd3, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x02, 0xd3, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x8b, 0xfe, 0x08, 0x02, 0xe8, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x00, 0x00, 0x01, 0x00, 0x40, 0x00, 0x00, 0x03, 0x24, 0x02, 0xed, 0x00, 0x31, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x03, 0x24, 0x6f, 0x81, 0x17, 0x74, 0x52, 0x54, 0x7e, 0x45, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x57, 0x53, 0x38, 0x5c, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x30, 0x43, 0x44, 0x7e, 0x56, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x30, 0x5e, 0x41, 0x01, 0x51, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xe5, 0x02, 0x78, 0x02, 0xe4, 0x00, 0x20, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x01, 0x11, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x45, 0x79, 0x4d, 0x32, 0xfe, 0x73, 0x02, 0x8d, 0x01, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x4b, 0x6b, 0x36, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x01, 0x00, 0x46, 0x00, 0x00, 0x02, 0xef, 0x02, 0xed, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x02, 0xef, 0x6d, 0x81, 0x20, 0x6d, 0x48, 0x60, 0x7e, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x43, 0x38, 0x51, 0x64, 0xee, 0x02, 0x78, 0xfd, 0x88, 0xb9, 0x30, 0x34, 0x5e, 0x55, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x3f, 0x02, 0xe4, 0x00, 0x18, 0x00, 0x24, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x3f, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x35, 0xfd, 0x9c, 0x03, 0x54, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xb1, 0x02, 0xe4, 0x00, 0x0d, 0x00, 0x16, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xb1, 0x6f, 0x80, 0x35, 0x67, 0x6a, 0x72, 0x5f, 0x02, 0xc6, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0xee, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x30, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x31, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x04, 0x03, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xc5, 0x02, 0xe4, 0x00, 0x16, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0xc5, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0x3f, 0x6e, 0x45, 0x39, 0x57, 0x1d, 0xfe, 0x11, 0x01, 0x22, 0x2a, 0xed, 0x11, 0x24, 0x45, 0x30, 0x9c, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x46, 0x6c, 0x3c, 0x2a, 0x24, 0x9e, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x24, 0x25, 0x28, 0x46, 0x2a, 0xc7, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x00, 0x02, 0x00, 0x3f, 0x00, 0x00, 0x03, 0x54, 0x02, 0xed, 0x00, 0x27, 0x00, 0x32, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x54, 0x70, 0x81, 0x8b, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0x8b, 0xfe, 0xfc, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0x7f, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x18, 0x00, 0x23, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x4a, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x03, 0x5f, 0xf1, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x02, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x20, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x02, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x80, 0x8d, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x03, 0x17, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf7, 0x02, 0x29, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x14, 0x23, 0xc6, 0x29, 0x28, 0x25, 0x2b, 0x7c, 0x01, 0x6c, 0x5f, 0x66, 0x6d, 0x67, 0x50, 0x49, 0xfe, 0xa5, 0x02, 0x3e, 0x62, 0xeb, 0x01, 0x3a, 0x71, 0x2d, 0x37, 0x33, 0x2a, 0x19, 0x09, 0x0c, 0x5f, 0x70, 0x78, 0x60, 0xd4, 0x49, 0x47, 0x45, 0x6c, 0x6c, 0x45, 0xf9, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x2c, 0x03, 0xa2, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0xcd, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x11, 0x41, 0x34, 0xfd, 0x9d, 0x03, 0xb7, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xb2, 0x02, 0xe4, 0x00, 0x16, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xb2, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x38, 0x67, 0x43, 0x39, 0x56, 0x1a, 0xfe, 0x25, 0x01, 0x7f, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0x00, 0x4b, 0xff, 0xf8, 0x03, 0x5d, 0x02, 0xed, 0x00, 0x29, 0x00, 0x2f, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x02, 0x55, 0x6f, 0x83, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0xb9, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x0d, 0x00, 0x10, 0x00, 0x18, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x05, 0x06, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x02, 0xbd, 0x6f, 0x7f, 0x34, 0x6d, 0x6e, 0x76, 0x5f, 0x02, 0xd2, 0xee, 0xfe, 0xfa, 0x01, 0x06, 0x58, 0x40, 0x0e, 0xfe, 0x41, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xeb, 0x46, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc0, 0xa6, 0x2c, 0x25, 0xb8, 0x73, 0x45, 0x51, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x03, 0x4e, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x25, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x03, 0x4e, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x03, 0x63, 0xf0, 0xad, 0x23, 0xd0, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x93, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x05, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x23, 0x26, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x02, 0x73, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x3a, 0x67, 0x43, 0x3b, 0x5d, 0x1d, 0x13, 0x3b, 0x27, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x45, 0x03, 0xe3, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xff, 0x43, 0x52, 0x3c, 0x68, 0x40, 0x46, 0x69, 0x18, 0x04, 0x17, 0x69, 0x46, 0x40, 0x68, 0x3c, 0x3c, 0x68, 0x3f, 0x43, 0x66, 0x1f, 0x03, 0x31, 0x68, 0xfd, 0x69, 0x03, 0xf8, 0xfd, 0x83, 0x42, 0x42, 0x35, 0x35, 0x43, 0x44, 0x34, 0x01, 0xa1, 0x43, 0x42, 0x35, 0x35, 0x42, 0x42, 0x34, 0x02, 0x78, 0x73, 0x16, 0x74, 0x51, 0x44, 0x68, 0x39, 0x43, 0x3a, 0x3a, 0x43, 0x39, 0x68, 0x44, 0x45, 0x6a, 0x39, 0x3f, 0x3c, 0x63, 0x14, 0x6a, 0x6c, 0x6c, 0xfe, 0x3b, 0x43, 0x34, 0x36, 0x44, 0x44, 0x37, 0x35, 0x41, 0x41, 0x35, 0x37, 0x44, 0x44, 0x36, 0x35, 0x42, 0x00, 0x00, 0x02, 0x00, 0x3f, 0xff, 0xc4, 0x03, 0x5b, 0x02, 0xee, 0x00, 0x2b, 0x00, 0x37, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x33, 0x11, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x03, 0x5b, 0x6f, 0x7c, 0xfe, 0xd2, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x37, 0xb2, 0xfe, 0x5e, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x64, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x49, 0x35, 0x01, 0x22, 0xe8, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x51, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x21, 0x35, 0x21, 0x35, 0x03, 0x51, 0x6f, 0x7f, 0xa4, 0x49, 0x30, 0x53, 0x34, 0x31, 0x50, 0x18, 0x7d, 0x78, 0x05, 0x42, 0x2f, 0x31, 0x38, 0x48, 0x36, 0x21, 0x01, 0x70, 0xfd, 0x88, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x98, 0x30, 0x5f, 0x36, 0x51, 0x2c, 0x24, 0x1e, 0x8a, 0x01, 0x1a, 0x30, 0x38, 0x3a, 0x2d, 0x36, 0x3b, 0x67, 0x79, 0x6c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x6f, 0x03, 0xe4, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x24, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x31, 0x00, 0x4a, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x20, 0x03, 0xcb, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x25, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x79, 0xff, 0xfb, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xde, 0x03, 0x29, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x26, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x24, 0x00, 0xb9, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x03, 0x69, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x4e, 0x00, 0x6e, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x11, 0x02, 0x4d, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x30, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x6c, 0xff, 0xec, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x22, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x31, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x98, 0xff, 0xfd, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xd5, 0x03, 0xee, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x39, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x27, 0x00, 0xb0, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x3f, 0x02, 0x29, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x01, 0xa7, 0x00, 0x1a, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x95, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x32, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x2d, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x83, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xaa, 0xfd, 0xc9, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x6a, 0x42, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xfb, 0x03, 0x56, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x00, 0x00, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x16, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x01, 0x71, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x2a, 0x40, 0x39, 0x66, 0x41, 0x63, 0x7b, 0x3a, 0x65, 0x3f, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x03, 0x6b, 0xfe, 0x1b, 0xd5, 0x3c, 0x3c, 0x32, 0x32, 0x3b, 0x3b, 0x32, 0x01, 0xa6, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x44, 0x38, 0x5f, 0x3f, 0x5c, 0x31, 0x6e, 0x5e, 0x40, 0x5d, 0x31, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x6c, 0x6e, 0x59, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x00, 0x01, 0xff, 0xeb, 0x00, 0xbe, 0x02, 0x1e, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x00, 0x01, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x02, 0x1e, 0x76, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0x33, 0x02, 0x78, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x62, 0x02, 0x51, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xd7, 0x33, 0x39, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x4b, 0x57, 0x6d, 0x41, 0x7b, 0x53, 0x75, 0x85, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x02, 0x66, 0x02, 0x78, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x56, 0x44, 0x48, 0x77, 0x45, 0x5e, 0x59, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0x6c, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xd6, 0x02, 0xc3, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x28, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xd5, 0xff, 0xe5, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x58, 0x02, 0x7f, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x1c, 0x00, 0x00, 0x01, 0x21, 0x35, 0x21, 0x12, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x33, 0x02, 0x7e, 0xfd, 0x6d, 0x02, 0x93, 0x01, 0x3f, 0x7a, 0x53, 0x68, 0x81, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0x6f, 0x02, 0x78, 0x6c, 0xfe, 0x35, 0x7c, 0x45, 0x65, 0x5e, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x17, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x00, 0x13, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xd5, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x6c, 0x50, 0x56, 0x6c, 0x5b, 0xaa, 0x74, 0x98, 0xb6, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x03, 0x5f, 0x02, 0x78, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x57, 0x57, 0x6f, 0x64, 0x5e, 0x8c, 0x4b, 0x71, 0x6c, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x70, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x18, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x01, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x02, 0xbd, 0xfd, 0x2e, 0x02, 0xd2, 0xd3, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x51, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x9a, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xaf, 0x02, 0xb1, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x21, 0x15, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xf9, 0x33, 0x2b, 0x24, 0x2c, 0x01, 0x70, 0xc0, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x02, 0xc6, 0xde, 0xb5, 0x01, 0xc1, 0x1c, 0x21, 0x1e, 0x1d, 0x61, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x6c, 0xb7, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x43, 0x02, 0xa3, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x20, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x17, 0x33, 0x15, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x02, 0xa3, 0xfd, 0x48, 0x01, 0x90, 0x77, 0x10, 0xa1, 0x9f, 0x0e, 0x79, 0x5d, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x02, 0xe4, 0x6c, 0x6c, 0xc4, 0x61, 0x52, 0x6d, 0x57, 0x66, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x05, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2e, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xef, 0x00, 0x14, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x0d, 0x02, 0xb5, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2f, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xee, 0x00, 0x1c, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xd6, 0x02, 0x4d, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x30, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xca, 0xff, 0xe5, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xe6, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x31, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xf6, 0xff, 0xf5, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x9f, 0x02, 0x55, 0x02, 0xe4, 0x00, 0x0c, 0x00, 0x15, 0x00, 0x00, 0x01, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x07, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x55, 0x5d, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x02, 0x6a, 0xdc, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x02, 0x02, 0x25, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x15, 0x00, 0x00, 0x03, 0x35, 0x21, 0x15, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x15, 0x02, 0x3a, 0xc7, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xcd, 0x02, 0x78, 0x6c, 0x6c, 0xf9, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x00, 0x00, 0x01, 0x00, 0x40, 0x00, 0x58, 0x02, 0xa3, 0x02, 0xed, 0x00, 0x2a, 0x00, 0x00, 0x01, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xa3, 0x53, 0x8e, 0x55, 0x8c, 0xa1, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x57, 0x53, 0x59, 0x71, 0x01, 0x65, 0x52, 0x7a, 0x41, 0x95, 0x84, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x56, 0x4b, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xce, 0x02, 0xa1, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x35, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x02, 0x76, 0xff, 0xdd, 0x00, 0x01, 0x00, 0x46, 0x00, 0x54, 0x02, 0x72, 0x02, 0xed, 0x00, 0x2d, 0x00, 0x00, 0x00, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x02, 0x72, 0x49, 0x88, 0x5a, 0x6f, 0x8a, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x53, 0x5b, 0x71, 0x01, 0x00, 0x6f, 0x3d, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x4b, 0x3e, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x57, 0x02, 0xa3, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x14, 0x00, 0x20, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x12, 0x36, 0x36, 0x33, 0x21, 0x15, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xa3, 0xfd, 0x48, 0x4c, 0x3c, 0x67, 0x40, 0x01, 0x89, 0xeb, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x01, 0x3d, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x2b, 0x38, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x83, 0x5d, 0x2f, 0x6c, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x2b, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x00, 0x01, 0xff, 0xeb, 0x00, 0xae, 0x02, 0x2d, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xcc, 0x3e, 0x3f, 0x39, 0x40, 0x6b, 0x38, 0x6b, 0x4b, 0x76, 0x7f, 0x5f, 0x02, 0x42, 0x02, 0x78, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x45, 0x6d, 0x3e, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x9f, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x31, 0x18, 0x52, 0x38, 0x61, 0x6b, 0x83, 0x3b, 0x37, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x03, 0xb4, 0xfe, 0x11, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x80, 0x68, 0x37, 0x42, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x46, 0x02, 0x44, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x13, 0x00, 0x1c, 0x00, 0x25, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x06, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0x44, 0xfd, 0xa7, 0x01, 0xa8, 0x75, 0x39, 0x3b, 0x74, 0x52, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x36, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0xe4, 0x6c, 0x6c, 0xbb, 0x43, 0x6d, 0x3e, 0x43, 0x70, 0x42, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x59, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x02, 0x00, 0x3f, 0x00, 0x4c, 0x02, 0xa0, 0x02, 0xed, 0x00, 0x21, 0x00, 0x2c, 0x00, 0x00, 0x01, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xa0, 0xc8, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0xc8, 0xfe, 0xbf, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x4c, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x1f, 0x00, 0x00, 0x01, 0x15, 0x33, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0xc4, 0xd8, 0xd8, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x02, 0xb1, 0xfe, 0xb0, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xac, 0x69, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xfe, 0xeb, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x5c, 0x02, 0x89, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x33, 0x02, 0x89, 0x47, 0x86, 0x59, 0x5b, 0x85, 0x47, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x02, 0x9d, 0xfe, 0xe3, 0x57, 0x58, 0x5f, 0x4d, 0x32, 0x4d, 0x2b, 0x76, 0x01, 0x19, 0x78, 0x45, 0x44, 0x7f, 0x58, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x4c, 0x55, 0x28, 0x46, 0x2c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xde, 0x02, 0x29, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xa7, 0xff, 0xed, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x2c, 0x03, 0x53, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x2d, 0x00, 0x00, 0x03, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x07, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x15, 0x03, 0x68, 0xfe, 0x75, 0x14, 0x57, 0x48, 0x3d, 0x62, 0x39, 0x83, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x02, 0x78, 0x6c, 0x6c, 0xe2, 0x37, 0x46, 0x37, 0x6a, 0x4b, 0x02, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x4b, 0x02, 0x44, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x13, 0x00, 0x20, 0x00, 0x00, 0x03, 0x35, 0x21, 0x15, 0x10, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x04, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x02, 0x59, 0x3b, 0x77, 0x54, 0x4f, 0x75, 0x3f, 0x3f, 0x76, 0x4e, 0x56, 0x76, 0x3a, 0xfe, 0x74, 0x4c, 0x3d, 0x2b, 0x3d, 0x1f, 0x47, 0x40, 0x3b, 0x4e, 0x02, 0x78, 0x6c, 0x6c, 0xfe, 0x80, 0x6b, 0x42, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x43, 0x6c, 0x3e, 0x3b, 0x49, 0x26, 0x3d, 0x22, 0x37, 0x4e, 0x49, 0x3b, 0x00, 0x00, 0x01, 0x00, 0x4b, 0xff, 0xf8, 0x02, 0x10, 0x02, 0xed, 0x00, 0x29, 0x00, 0x00, 0x25, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x88, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x3a, 0x2e, 0x32, 0x2a, 0x30, 0xdb, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0xa5, 0x02, 0x3a, 0x02, 0xe4, 0x00, 0x0d, 0x00, 0x15, 0x00, 0x00, 0x01, 0x21, 0x01, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x02, 0x36, 0x37, 0x25, 0x15, 0x14, 0x16, 0x33, 0x02, 0x3a, 0xfe, 0x8e, 0x01, 0x72, 0x38, 0x6f, 0x4d, 0x7a, 0x82, 0x5f, 0x02, 0x4f, 0xbe, 0x40, 0x0b, 0xff, 0x00, 0x41, 0x43, 0x02, 0x78, 0xfe, 0xf7, 0x32, 0x5d, 0x3b, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0x2e, 0x2d, 0x22, 0xbb, 0x74, 0x48, 0x4e, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf7, 0x02, 0x76, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x00, 0x01, 0x14, 0x07, 0x33, 0x15, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x01, 0xb1, 0x23, 0xe8, 0xfe, 0x50, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x02, 0x8b, 0xc5, 0x02, 0x2c, 0x4c, 0x38, 0x69, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x7c, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x44, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xc7, 0xff, 0x8b, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x45, 0x03, 0xe3, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x00, 0x03, 0x35, 0x21, 0x15, 0x00, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x24, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x04, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x03, 0xf8, 0xfd, 0xeb, 0x69, 0x46, 0x40, 0x68, 0x3c, 0x3c, 0x68, 0x3f, 0x43, 0x66, 0x1f, 0x03, 0x1e, 0x66, 0x43, 0x3f, 0x68, 0x3d, 0x3c, 0x68, 0x40, 0x46, 0x69, 0x18, 0x04, 0xfe, 0xd4, 0x44, 0x34, 0x35, 0x42, 0x42, 0x35, 0x35, 0x43, 0x01, 0x6e, 0x42, 0x34, 0x35, 0x43, 0x42, 0x35, 0x35, 0x42, 0x02, 0x78, 0x6c, 0x6c, 0xfe, 0x10, 0x43, 0x39, 0x68, 0x44, 0x45, 0x6a, 0x39, 0x3f, 0x3c, 0x3c, 0x3f, 0x39, 0x6a, 0x45, 0x44, 0x68, 0x39, 0x43, 0x3a, 0x32, 0x41, 0x43, 0x34, 0x36, 0x44, 0x44, 0x37, 0x34, 0x42, 0x41, 0x35, 0x37, 0x44, 0x44, 0x36, 0x00, 0x00, 0x02, 0x00, 0x3f, 0xff, 0xc4, 0x02, 0xa0, 0x02, 0xee, 0x00, 0x25, 0x00, 0x31, 0x00, 0x00, 0x00, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x33, 0x15, 0x21, 0x26, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x01, 0x17, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x37, 0xe2, 0xfe, 0xa2, 0x74, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x01, 0x50, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x49, 0x35, 0x5e, 0x98, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x0e, 0x02, 0xc6, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x1e, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x05, 0x21, 0x15, 0x21, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x02, 0xc6, 0xfd, 0x25, 0x01, 0x08, 0x01, 0xd3, 0xfe, 0xf9, 0x49, 0x30, 0x53, 0x34, 0x31, 0x50, 0x18, 0x7d, 0x78, 0x05, 0x42, 0x2f, 0x31, 0x38, 0x48, 0x36, 0x21, 0x02, 0xe4, 0x6c, 0x6c, 0xe5, 0x67, 0x30, 0x5f, 0x36, 0x51, 0x2c, 0x24, 0x1e, 0x8a, 0x01, 0x1a, 0x30, 0x38, 0x3a, 0x2d, 0x36, 0x3b, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x6f, 0x03, 0x95, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x50, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x31, 0x00, 0x4a, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x20, 0x03, 0x56, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x51, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x79, 0xff, 0xfb, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xde, 0x02, 0x1e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x52, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x24, 0x00, 0xb9, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x57, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x4e, 0x00, 0x6e, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xd5, 0x03, 0x9f, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x65, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x27, 0x00, 0xb0, 0x00, 0x01, 0xff, 0x16, 0x03, 0x36, 0xff, 0xb2, 0x03, 0xd1, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x4e, 0x2d, 0x21, 0x21, 0x2d, 0x2d, 0x21, 0x21, 0x2d, 0x03, 0x63, 0x2d, 0x2d, 0x20, 0x21, 0x2d, 0x2d, 0x21, 0x00, 0x02, 0xfe, 0x7d, 0x03, 0x2e, 0x00, 0x40, 0x04, 0x43, 0x00, 0x0b, 0x00, 0x19, 0x00, 0x00, 0x02, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x16, 0x06, 0x23, 0x22, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x6c, 0x1f, 0x17, 0x16, 0x1f, 0x1f, 0x16, 0x17, 0x1f, 0xac, 0x75, 0x6c, 0x6d, 0x75, 0x67, 0x41, 0x3a, 0x39, 0x40, 0x68, 0x03, 0xf7, 0x1f, 0x20, 0x16, 0x16, 0x1f, 0x1f, 0x16, 0x75, 0x6b, 0x6b, 0x5a, 0x2b, 0x3e, 0x3e, 0x2b, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00, 0x68, 0x00, 0xd1, 0x02, 0x2b, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x10, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0xd1, 0x2e, 0x20, 0x21, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x21, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x01, 0xbd, 0x2d, 0x2d, 0x20, 0x21, 0x2d, 0x2d, 0x21, 0xfe, 0xb8, 0x2d, 0x2d, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x00, 0x00, 0x01, 0x00, 0x40, 0x00, 0x34, 0x01, 0xf9, 0x02, 0xa0, 0x00, 0x1f, 0x00, 0x00, 0x37, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x1e, 0x02, 0x15, 0x14, 0x06, 0x23, 0x40, 0xeb, 0x1f, 0x22, 0x2c, 0x2f, 0x2e, 0x3c, 0x2a, 0x59, 0x49, 0xda, 0xba, 0x1c, 0x22, 0x2c, 0x2f, 0x2e, 0x3b, 0x2a, 0x59, 0x4b, 0x34, 0x6d, 0x1a, 0x16, 0x1a, 0x30, 0x25, 0x25, 0x39, 0x4e, 0x2e, 0x43, 0x43, 0x6d, 0x13, 0x1a, 0x1a, 0x30, 0x25, 0x25, 0x39, 0x4e, 0x2d, 0x3f, 0x4b, 0x00, 0x00, 0x01, 0xff, 0x28, 0xfe, 0xf1, 0x00, 0x2b, 0xff, 0xc7, 0x00, 0x03, 0x00, 0x00, 0x03, 0x27, 0x33, 0x17, 0x5a, 0x7e, 0x81, 0x82, 0xfe, 0xf1, 0xd6, 0xd6, 0x00, 0x01, 0xfe, 0x7a, 0xff, 0x25, 0xff, 0x17, 0xff, 0xc1, 0x00, 0x0b, 0x00, 0x00, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0xe9, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x21, 0x2e, 0xae, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x2e, 0x21, 0x00, 0xff, 0xff, 0x00, 0x35, 0x00, 0x02, 0x02, 0x51, 0x02, 0xe7, 0x00, 0x02, 0x02, 0xa3, 0x00, 0x00, 0xff, 0xff, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x02, 0xd9, 0x00, 0x02, 0x02, 0xa4, 0x00, 0x00, 0xff, 0xff, 0x00, 0x2c, 0x00, 0x0a, 0x02, 0x1b, 0x02, 0xe9, 0x00, 0x02, 0x02, 0xa5, 0x00, 0x00, 0xff, 0xff, 0x00, 0x2d, 0xff, 0xfb, 0x02, 0x1d, 0x02, 0xea, 0x00, 0x02, 0x02, 0xa6, 0x00, 0x00, 0xff, 0xff, 0x00, 0x2f, 0x00, 0x00, 0x02, 0x71, 0x02, 0xd0, 0x00, 0x02, 0x02, 0xa7, 0x00, 0x00, 0xff, 0xff, 0x00, 0x4f, 0x00, 0x00, 0x02, 0x4e, 0x02, 0xdb, 0x00, 0x02, 0x02, 0xa8, 0x00, 0x00, 0xff, 0xff, 0x00, 0x45, 0xff, 0xfe, 0x02, 0x46, 0x02, 0xea, 0x00, 0x02, 0x02, 0xa9, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0x00, 0x00, 0x02, 0x05, 0x02, 0xd7, 0x00, 0x02, 0x02, 0xaa, 0x00, 0x00, 0xff, 0xff, 0x00, 0x3a, 0xff, 0xf0, 0x02, 0x49, 0x02, 0xe7, 0x00, 0x02, 0x02, 0xab, 0x00, 0x00, 0xff, 0xff, 0x00, 0x41, 0xff, 0xff, 0x02, 0x3a, 0x02, 0xea, 0x00, 0x02, 0x02, 0xac, 0x00, 0x00, 0x00, 0x03, 0x00, 0x48, 0x00, 0x0b, 0x03, 0xdd, 0x03, 0xf3, 0x00, 0x0b, 0x00, 0x19, 0x00, 0x67, 0x00, 0x00, 0x00, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x06, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x23, 0x04, 0x16, 0x15, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x15, 0x14, 0x06, 0x06, 0x07, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x36, 0x33, 0x02, 0x20, 0x1e, 0x1f, 0x16, 0x17, 0x1e, 0x1e, 0x17, 0x6d, 0x74, 0x66, 0x41, 0x3a, 0x39, 0x41, 0x68, 0x75, 0x6d, 0x01, 0x43, 0x63, 0x84, 0x84, 0x28, 0x3c, 0x2d, 0x20, 0x5a, 0x48, 0x27, 0x2e, 0x52, 0x26, 0x55, 0x48, 0x09, 0x35, 0x5f, 0x3e, 0x44, 0x68, 0x39, 0x7a, 0x37, 0x2d, 0x2d, 0x35, 0x38, 0x38, 0x2b, 0x2b, 0x30, 0x37, 0x34, 0x27, 0x29, 0x34, 0x78, 0x36, 0x61, 0x3f, 0x5e, 0x71, 0x3a, 0x36, 0x09, 0x10, 0x3b, 0x37, 0x32, 0x5e, 0x6c, 0x03, 0x88, 0x1e, 0x17, 0x17, 0x1f, 0x1f, 0x17, 0x17, 0x1e, 0xab, 0x6b, 0x5a, 0x2b, 0x3d, 0x3d, 0x2b, 0x5a, 0x6b, 0x31, 0x7d, 0x7a, 0x7f, 0x8f, 0x94, 0x0a, 0x6c, 0x08, 0x5d, 0x5c, 0x8b, 0x3b, 0x3e, 0x65, 0x49, 0x58, 0x29, 0x02, 0x1c, 0x20, 0x3c, 0x59, 0x31, 0x34, 0x5e, 0x3e, 0x2a, 0x37, 0x37, 0x2c, 0x2a, 0x3b, 0x6d, 0x33, 0x27, 0x2a, 0x32, 0x2f, 0x27, 0x3a, 0x59, 0x30, 0x64, 0x54, 0x3a, 0x52, 0x10, 0x04, 0x02, 0x06, 0x2d, 0x3b, 0x66, 0x6c, 0x00, 0x00, 0x02, 0x00, 0x48, 0x00, 0xb0, 0x01, 0x9b, 0x01, 0xfa, 0x00, 0x0c, 0x00, 0x18, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x01, 0x3d, 0x5e, 0x5e, 0x4a, 0x31, 0x4e, 0x2c, 0x60, 0x4b, 0x28, 0x34, 0x34, 0x28, 0x26, 0x32, 0x32, 0x26, 0x01, 0xfa, 0x5d, 0x49, 0x48, 0x5c, 0x2a, 0x4c, 0x2f, 0x49, 0x5c, 0x4d, 0x32, 0x26, 0x27, 0x31, 0x31, 0x26, 0x26, 0x33, 0x00, 0x00, 0x01, 0x00, 0x97, 0x00, 0x00, 0x01, 0x17, 0x02, 0xe5, 0x00, 0x03, 0x00, 0x00, 0x01, 0x11, 0x23, 0x11, 0x01, 0x17, 0x80, 0x02, 0xe5, 0xfd, 0x1b, 0x02, 0xe5, 0x00, 0x00, 0x02, 0x00, 0x97, 0x00, 0x00, 0x02, 0x0f, 0x02, 0xe5, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x01, 0x11, 0x23, 0x11, 0x21, 0x11, 0x23, 0x11, 0x01, 0x17, 0x80, 0x01, 0x78, 0x80, 0x02, 0xe5, 0xfd, 0x1b, 0x02, 0xe5, 0xfd, 0x1b, 0x02, 0xe5, 0x00, 0x03, 0x00, 0x45, 0xff, 0xf7, 0x04, 0x47, 0x02, 0xba, 0x00, 0x0e, 0x00, 0x17, 0x00, 0x41, 0x00, 0x00, 0x00, 0x06, 0x07, 0x13, 0x23, 0x03, 0x23, 0x11, 0x23, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x05, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x04, 0x16, 0x17, 0x1e, 0x02, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x02, 0x47, 0x54, 0x54, 0xb0, 0xa5, 0xa3, 0x36, 0x8c, 0x01, 0x06, 0x51, 0x72, 0x39, 0xfe, 0x8a, 0x75, 0x39, 0x38, 0x38, 0x39, 0x75, 0x02, 0x30, 0x3e, 0x40, 0x3f, 0x50, 0x39, 0x37, 0x64, 0x41, 0x67, 0x7f, 0x08, 0x8e, 0x03, 0x33, 0x29, 0x2a, 0x2d, 0x3f, 0x41, 0x3e, 0x4f, 0x38, 0x35, 0x66, 0x45, 0x64, 0x78, 0x08, 0x8d, 0x04, 0x31, 0x28, 0x28, 0x2d, 0x01, 0x9e, 0x6f, 0x13, 0xfe, 0xe4, 0x01, 0x13, 0xfe, 0xed, 0x02, 0xba, 0x38, 0x61, 0x3c, 0x6a, 0x36, 0x31, 0x31, 0x36, 0xdf, 0x1d, 0x0d, 0x0e, 0x1d, 0x40, 0x37, 0x30, 0x4c, 0x2b, 0x60, 0x58, 0x24, 0x28, 0x22, 0x1c, 0x20, 0x1e, 0x0d, 0x0d, 0x1c, 0x3e, 0x36, 0x2e, 0x4e, 0x2e, 0x63, 0x54, 0x23, 0x28, 0x22, 0x1b, 0x00, 0x01, 0x00, 0x2a, 0xff, 0xf6, 0x02, 0x43, 0x02, 0xbb, 0x00, 0x22, 0x00, 0x00, 0x01, 0x15, 0x33, 0x15, 0x23, 0x06, 0x06, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x32, 0x36, 0x36, 0x37, 0x21, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x15, 0x01, 0xde, 0x65, 0x6b, 0x10, 0x7d, 0x7e, 0x27, 0x2f, 0x2d, 0x28, 0x82, 0x02, 0x6e, 0x66, 0x6a, 0x70, 0x6b, 0x66, 0x32, 0x08, 0xfe, 0xd5, 0x01, 0x30, 0xfe, 0xd0, 0x02, 0x19, 0x02, 0x59, 0x4c, 0x5c, 0x5f, 0x56, 0x35, 0x2f, 0x36, 0x33, 0x31, 0x65, 0x6b, 0x72, 0x6d, 0x85, 0x0b, 0x24, 0x28, 0x5c, 0x4c, 0x62, 0x62, 0x00, 0x00, 0x01, 0xff, 0xe9, 0xff, 0x1a, 0x00, 0x18, 0x03, 0x2b, 0x00, 0x03, 0x00, 0x00, 0x07, 0x11, 0x33, 0x11, 0x17, 0x2f, 0xe6, 0x04, 0x11, 0xfb, 0xef, 0x00, 0x00, 0x01, 0xff, 0x80, 0xff, 0x1a, 0x00, 0x80, 0x03, 0x30, 0x00, 0x0e, 0x00, 0x00, 0x13, 0x27, 0x11, 0x23, 0x11, 0x07, 0x27, 0x37, 0x27, 0x37, 0x17, 0x37, 0x17, 0x07, 0x17, 0x5f, 0x48, 0x2f, 0x45, 0x21, 0x5d, 0x5f, 0x21, 0x5f, 0x60, 0x20, 0x60, 0x60, 0x02, 0x30, 0x4b, 0xfc, 0x9f, 0x03, 0x61, 0x49, 0x21, 0x5d, 0x5f, 0x21, 0x5f, 0x5f, 0x20, 0x60, 0x5f, 0x00, 0x00, 0x0c, 0x00, 0x32, 0xff, 0xf7, 0x02, 0x59, 0x02, 0x1c, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x23, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x47, 0x00, 0x53, 0x00, 0x5f, 0x00, 0x6b, 0x00, 0x77, 0x00, 0x83, 0x00, 0x8f, 0x00, 0x00, 0x00, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x16, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x04, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x16, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x01, 0x58, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x79, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0xee, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x01, 0x4a, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0xfe, 0x6a, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x01, 0xc2, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0xfe, 0x2f, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x01, 0xc7, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0xfe, 0x66, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x01, 0x51, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0xef, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x7c, 0x18, 0x13, 0x13, 0x18, 0x18, 0x13, 0x13, 0x18, 0x01, 0xdf, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x22, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x2e, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x42, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x47, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x51, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x4e, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x50, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x47, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x3f, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x33, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x21, 0x17, 0x17, 0x13, 0x13, 0x17, 0x17, 0x13, 0x00, 0x00, 0x01, 0xff, 0x2e, 0x02, 0xcf, 0x00, 0xa1, 0x03, 0xf8, 0x00, 0x0f, 0x00, 0x00, 0x03, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0xd2, 0x58, 0x62, 0x59, 0x60, 0x04, 0x71, 0x01, 0x23, 0x1f, 0x23, 0x22, 0x02, 0xcf, 0x59, 0x5a, 0x76, 0x67, 0x58, 0x26, 0x2d, 0x32, 0x31, 0x5a, 0x00, 0x02, 0xff, 0xeb, 0x01, 0x42, 0x01, 0xa8, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x10, 0x00, 0x00, 0x03, 0x35, 0x21, 0x15, 0x13, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x37, 0x15, 0x01, 0xb2, 0x0b, 0x1b, 0x50, 0x2b, 0x65, 0x8c, 0x03, 0x7b, 0x02, 0x4f, 0x3a, 0x29, 0x2a, 0x02, 0x78, 0x6c, 0x6c, 0xfe, 0xf1, 0x11, 0x16, 0x66, 0x6c, 0x3c, 0x38, 0x11, 0x00, 0x01, 0xfd, 0xf4, 0xff, 0x9f, 0xff, 0xd4, 0x00, 0x52, 0x00, 0x06, 0x00, 0x00, 0x07, 0x27, 0x07, 0x23, 0x37, 0x33, 0x17, 0xb1, 0x6c, 0x6c, 0x83, 0x99, 0xac, 0x9b, 0x61, 0x82, 0x82, 0xb3, 0xb3, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd2, 0x03, 0xe4, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x2d, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x39, 0x02, 0x7c, 0x08, 0x0a, 0xaf, 0x8b, 0x82, 0x4d, 0x5f, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xf9, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa9, 0x0e, 0x0a, 0xbf, 0x89, 0x0c, 0x77, 0x58, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x76, 0x03, 0xcb, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xcb, 0x6f, 0x80, 0x2b, 0x58, 0x11, 0x11, 0x08, 0x12, 0xc5, 0x8a, 0x79, 0x76, 0x89, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x01, 0xc1, 0x29, 0x1e, 0x20, 0x32, 0x59, 0x37, 0x56, 0x2d, 0xfe, 0x95, 0x5c, 0x4d, 0x4d, 0x44, 0x01, 0x4d, 0x36, 0x35, 0x32, 0x2e, 0x3d, 0x3d, 0x2e, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xb5, 0x3c, 0x03, 0x0d, 0x18, 0xe1, 0x07, 0x83, 0x05, 0x8a, 0x79, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3c, 0xa0, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xec, 0x03, 0x29, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x03, 0x29, 0x6f, 0x7e, 0xe4, 0x95, 0x01, 0x76, 0x91, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xd1, 0xe5, 0x01, 0x68, 0x01, 0x24, 0xb3, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2e, 0x53, 0xb9, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xcd, 0x02, 0xd4, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x29, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x33, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x02, 0xd4, 0x6e, 0x82, 0x0b, 0x01, 0xcc, 0x8c, 0x96, 0x5c, 0x74, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x02, 0xe9, 0xf0, 0xfe, 0xf3, 0x6c, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x2d, 0x4a, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xc0, 0x0e, 0xe5, 0x9c, 0x03, 0x5b, 0x52, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0x6c, 0x31, 0x64, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x26, 0x47, 0x2d, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x68, 0x02, 0xc3, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0xc3, 0xec, 0xb6, 0x25, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x3a, 0x37, 0x82, 0x85, 0x6c, 0x6c, 0x83, 0x81, 0x3f, 0x48, 0x03, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x5b, 0xfe, 0x91, 0x02, 0x8c, 0x29, 0x29, 0x1e, 0x1e, 0x29, 0x29, 0x1e, 0x02, 0xe4, 0x6c, 0xb7, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x38, 0x52, 0x14, 0x96, 0x82, 0x82, 0x97, 0x16, 0x5b, 0x3f, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0xfe, 0xdd, 0x29, 0x1e, 0x1d, 0x29, 0x29, 0x1d, 0x1e, 0x29, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xd2, 0x02, 0xff, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x11, 0x21, 0x35, 0x21, 0x02, 0xff, 0x6f, 0x81, 0x0e, 0x13, 0xaa, 0x8c, 0x87, 0x50, 0x65, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0xfd, 0xdc, 0x03, 0x14, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x15, 0x0e, 0xbf, 0x8e, 0x08, 0x62, 0x51, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x01, 0x0f, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x90, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x1c, 0x00, 0x3b, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x02, 0x82, 0x3e, 0x49, 0x81, 0x76, 0x81, 0x85, 0x6c, 0x6c, 0x83, 0x79, 0x6d, 0x7d, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x03, 0x5f, 0xfe, 0xc1, 0xfe, 0xca, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x46, 0x3a, 0x02, 0x78, 0x61, 0x11, 0x69, 0x51, 0x72, 0x99, 0x1c, 0x95, 0x82, 0x82, 0x8e, 0x11, 0x6d, 0x58, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x46, 0x53, 0x0e, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xd5, 0x03, 0x69, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x03, 0x69, 0x6f, 0x78, 0xd6, 0x8e, 0x01, 0x61, 0x9b, 0x02, 0x6e, 0x60, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x29, 0x2f, 0x01, 0x13, 0xfd, 0x6c, 0x03, 0x7e, 0x02, 0x78, 0xfd, 0x88, 0xc0, 0xeb, 0x01, 0x6e, 0x45, 0x5e, 0x75, 0x77, 0x61, 0x63, 0x60, 0x31, 0x38, 0x38, 0x31, 0x60, 0x88, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x91, 0x03, 0xbc, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x21, 0x11, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xbc, 0x6e, 0x7b, 0x8c, 0x82, 0x01, 0x0e, 0xe2, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x03, 0xd1, 0xfd, 0x85, 0x01, 0x8e, 0xfc, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x02, 0x78, 0xfd, 0x88, 0x3e, 0xad, 0x01, 0x3a, 0x1d, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0xfe, 0x65, 0x01, 0x2f, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xab, 0x03, 0x7b, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x35, 0x21, 0x35, 0x21, 0x03, 0x7b, 0x6f, 0x7e, 0xa5, 0x83, 0x01, 0x28, 0x89, 0x0b, 0x7a, 0x60, 0x41, 0x65, 0x3b, 0x04, 0x7a, 0x07, 0x3b, 0x2a, 0x37, 0x3c, 0x3c, 0x37, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x57, 0x75, 0x13, 0x8c, 0xfd, 0x60, 0x03, 0x90, 0x02, 0x78, 0xfd, 0x88, 0x64, 0xb9, 0x01, 0x3c, 0x2d, 0x57, 0x67, 0x30, 0x55, 0x36, 0x21, 0x2d, 0x45, 0x34, 0x32, 0x44, 0x2d, 0x21, 0x54, 0x68, 0x56, 0x49, 0xf7, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x9e, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x23, 0x23, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x1b, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x54, 0x4b, 0x7e, 0x85, 0x68, 0x02, 0x06, 0x68, 0x83, 0x7c, 0x4c, 0x58, 0x47, 0x83, 0x58, 0x05, 0xfe, 0x89, 0x02, 0xb1, 0xbc, 0x7b, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x57, 0x80, 0x1c, 0x91, 0x7e, 0x7e, 0x92, 0x1b, 0x7c, 0x54, 0x50, 0x74, 0x3e, 0x5b, 0x6c, 0x6c, 0xc8, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x9b, 0x02, 0xb5, 0x02, 0xe4, 0x00, 0x18, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x8f, 0x5e, 0x79, 0x5b, 0x4d, 0x86, 0x85, 0x6c, 0x6c, 0x83, 0x83, 0x4f, 0x5d, 0x77, 0x5d, 0xfe, 0xdc, 0x02, 0xca, 0xcf, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x56, 0x7b, 0x1b, 0x9b, 0x82, 0x82, 0x99, 0x1a, 0x7d, 0x57, 0x65, 0x81, 0x12, 0x5e, 0x6c, 0x6c, 0xfe, 0xea, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x68, 0x02, 0x4d, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xfc, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x3c, 0x39, 0x81, 0x85, 0x6c, 0x6c, 0x83, 0x83, 0x3e, 0x46, 0x03, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x58, 0xfe, 0x94, 0x02, 0x62, 0x7a, 0xb2, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x39, 0x53, 0x13, 0x95, 0x82, 0x82, 0x99, 0x16, 0x59, 0x3f, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0x6c, 0xb7, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x77, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x2c, 0x74, 0x66, 0x5a, 0x3e, 0x51, 0x29, 0x1f, 0x1c, 0x26, 0x03, 0x5d, 0x04, 0x5c, 0x49, 0x52, 0x5f, 0x55, 0x4e, 0x7d, 0x85, 0x6c, 0x6c, 0x83, 0x85, 0x55, 0x64, 0x4c, 0x84, 0x54, 0x1b, 0xfe, 0x71, 0x02, 0xb3, 0xaa, 0x6c, 0x01, 0xca, 0x60, 0x5a, 0x50, 0x65, 0x3a, 0x31, 0x20, 0x2a, 0x23, 0x1c, 0x0a, 0x08, 0x18, 0x0c, 0x41, 0x49, 0x5c, 0x4b, 0x49, 0x63, 0x12, 0x91, 0x82, 0x82, 0x9c, 0x1d, 0x86, 0x5e, 0x57, 0x7a, 0x3e, 0x55, 0x6c, 0x6c, 0xae, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd7, 0x03, 0x82, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x1d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x82, 0x6f, 0x79, 0xe7, 0x93, 0x01, 0x75, 0x9d, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x03, 0x97, 0xfd, 0xf7, 0xa6, 0x2e, 0x26, 0x27, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xd3, 0xfc, 0x01, 0x86, 0x01, 0x1b, 0xb4, 0x5f, 0x76, 0x78, 0x5d, 0xb4, 0x6c, 0x6c, 0xbf, 0x29, 0x34, 0x33, 0x2a, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xd5, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x26, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x02, 0xd5, 0x6f, 0x7c, 0xda, 0xa8, 0x01, 0x79, 0x15, 0x4a, 0x2d, 0x42, 0x55, 0x81, 0x01, 0x3c, 0x71, 0x4b, 0x3b, 0x5a, 0x1e, 0xfe, 0x04, 0x02, 0xea, 0x02, 0x78, 0xfd, 0x88, 0xd7, 0xd7, 0x06, 0x01, 0x55, 0x21, 0x29, 0x4e, 0x46, 0x4b, 0x71, 0x3e, 0x2c, 0x23, 0xbc, 0x6c, 0x00, 0x01, 0x00, 0x40, 0xff, 0xba, 0x03, 0x24, 0x02, 0xed, 0x00, 0x34, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x33, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x03, 0x24, 0x6f, 0x81, 0x11, 0x1d, 0x03, 0xfd, 0x9f, 0xc0, 0x6e, 0x7f, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x57, 0x53, 0x38, 0x5c, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x21, 0x17, 0xda, 0x07, 0x9d, 0x0d, 0x92, 0x74, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x30, 0x5e, 0x41, 0x01, 0x51, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xbd, 0x02, 0x77, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x07, 0x33, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x11, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x0f, 0x01, 0xaf, 0x8c, 0x93, 0x4e, 0x60, 0x45, 0x79, 0x4d, 0x32, 0xfe, 0x73, 0x02, 0x8c, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa7, 0x10, 0xbf, 0x99, 0x0d, 0x72, 0x5c, 0x4b, 0x6b, 0x36, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x01, 0x00, 0x46, 0xff, 0xbc, 0x02, 0xef, 0x02, 0xed, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x02, 0xef, 0x6d, 0x81, 0x0a, 0x0b, 0xcb, 0x8d, 0x97, 0x60, 0x7d, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x43, 0x38, 0x51, 0x64, 0xee, 0x02, 0x78, 0xfd, 0x88, 0xba, 0x0f, 0x0b, 0xe4, 0x9c, 0x5c, 0x54, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xad, 0x03, 0x66, 0x02, 0xe4, 0x00, 0x1c, 0x00, 0x28, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x66, 0x6e, 0x75, 0xc9, 0x8d, 0x01, 0x4f, 0xc4, 0x23, 0x35, 0x5d, 0x3a, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x62, 0xfd, 0x6f, 0x03, 0x7b, 0xfd, 0xd6, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x92, 0xe5, 0x01, 0x62, 0x78, 0x30, 0x43, 0x37, 0x56, 0x30, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xeb, 0x02, 0xb1, 0x02, 0xe4, 0x00, 0x0f, 0x00, 0x18, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xb1, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x5e, 0x63, 0x5f, 0x02, 0xc6, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x09, 0x85, 0x69, 0xcc, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xeb, 0x03, 0xee, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x33, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x31, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x0a, 0x06, 0xcd, 0x8c, 0xb6, 0x57, 0x5c, 0x5f, 0x04, 0x03, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xf3, 0x0c, 0x05, 0xf7, 0xcb, 0x0a, 0x81, 0x65, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xc5, 0x02, 0xc4, 0x02, 0xe4, 0x00, 0x18, 0x00, 0x21, 0x00, 0x2a, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0xc4, 0x6d, 0x7d, 0x0f, 0x01, 0xaf, 0x89, 0x88, 0x40, 0x65, 0x3a, 0x3f, 0x6e, 0x45, 0x39, 0x57, 0x1d, 0xfe, 0x11, 0x01, 0x22, 0x2a, 0xed, 0x11, 0x24, 0x45, 0x30, 0x9c, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x98, 0x12, 0x01, 0xc0, 0x8a, 0x05, 0x3c, 0x67, 0x43, 0x46, 0x6c, 0x3c, 0x2a, 0x24, 0x9e, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x24, 0x25, 0x28, 0x46, 0x2a, 0xc7, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x00, 0x02, 0x00, 0x3f, 0xff, 0xad, 0x03, 0x68, 0x02, 0xed, 0x00, 0x29, 0x00, 0x34, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x68, 0x70, 0x75, 0xe6, 0x8e, 0x01, 0x6e, 0xa8, 0x69, 0x5f, 0x5c, 0x72, 0x78, 0x5e, 0x4c, 0x49, 0x1f, 0x26, 0x03, 0x7e, 0x04, 0x65, 0x5d, 0x64, 0x5b, 0xa8, 0xfe, 0xe4, 0x4b, 0x2a, 0x36, 0x30, 0x26, 0x2a, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x94, 0xe7, 0x01, 0x5b, 0x62, 0x2e, 0x64, 0x77, 0x65, 0x53, 0x59, 0x5f, 0x4e, 0x60, 0x2b, 0x24, 0x0d, 0x14, 0x1a, 0x0e, 0x51, 0x65, 0x7c, 0x69, 0x37, 0x01, 0x13, 0xfe, 0x86, 0x2c, 0x25, 0x23, 0x2a, 0x37, 0x31, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xad, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x1d, 0x00, 0x28, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x4a, 0x6f, 0x75, 0xe7, 0x8e, 0x01, 0x6f, 0x9e, 0x69, 0x60, 0x3d, 0x5d, 0x34, 0x77, 0x5e, 0x4d, 0xfe, 0x9e, 0x03, 0x5f, 0xea, 0x9e, 0x9e, 0xfe, 0xed, 0x4c, 0x2a, 0x35, 0x30, 0x25, 0x2a, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0x95, 0xe8, 0x01, 0x5c, 0x6e, 0x38, 0x64, 0x75, 0x2f, 0x55, 0x37, 0x5b, 0x62, 0x9a, 0x6c, 0x6c, 0x9a, 0x67, 0x2e, 0x27, 0x25, 0x2d, 0x38, 0x31, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xc2, 0x03, 0x02, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x23, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x33, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x02, 0x6f, 0x81, 0x16, 0x02, 0xfd, 0x9d, 0xbb, 0x6c, 0x77, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x03, 0x17, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb5, 0x18, 0xdb, 0x07, 0x99, 0x0d, 0x93, 0x75, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x4a, 0x03, 0xa2, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x3f, 0x00, 0x00, 0x00, 0x07, 0x00, 0x94, 0x03, 0xa8, 0xff, 0xab, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd4, 0x02, 0xb2, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x25, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xb2, 0x6e, 0x7e, 0x0f, 0x10, 0xa2, 0x8b, 0x80, 0x59, 0x66, 0x38, 0x67, 0x43, 0x39, 0x56, 0x1a, 0xfe, 0x25, 0x01, 0x7f, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xa4, 0x16, 0x0d, 0xad, 0x81, 0x0b, 0x7c, 0x5e, 0x43, 0x6a, 0x3b, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0x00, 0x1d, 0xff, 0xf7, 0x03, 0x5d, 0x02, 0xed, 0x00, 0x20, 0x00, 0x2c, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x27, 0x07, 0x23, 0x35, 0x25, 0x27, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x33, 0x11, 0x00, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x27, 0x22, 0x06, 0x15, 0x03, 0x5d, 0x6f, 0x7f, 0x41, 0xcb, 0x98, 0x01, 0x04, 0x85, 0x9a, 0x93, 0xcb, 0x42, 0x45, 0x33, 0x5f, 0x3f, 0x41, 0x60, 0x34, 0x2f, 0x37, 0xcd, 0x01, 0xfe, 0x6b, 0x55, 0x11, 0x27, 0x2a, 0x31, 0x2a, 0x29, 0x33, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x98, 0x21, 0xc2, 0x0b, 0xe9, 0x45, 0x78, 0x0f, 0x9d, 0x29, 0x61, 0x3f, 0x37, 0x57, 0x32, 0x30, 0x54, 0x35, 0x3a, 0x57, 0x2e, 0x6b, 0x01, 0xda, 0xfe, 0xfa, 0x2e, 0x09, 0x1e, 0x3b, 0x27, 0x25, 0x35, 0x01, 0x35, 0x26, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x10, 0x00, 0x13, 0x00, 0x1b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x05, 0x04, 0x16, 0x33, 0x32, 0x36, 0x37, 0x27, 0x15, 0x02, 0xbd, 0x6f, 0x7f, 0x0a, 0x0f, 0xdb, 0x8c, 0xc1, 0x60, 0x66, 0x5f, 0x02, 0xd2, 0xee, 0xfe, 0xf9, 0x01, 0x07, 0xfe, 0xf8, 0x41, 0x41, 0x2e, 0x40, 0x0e, 0xfe, 0x02, 0x78, 0xfd, 0x88, 0xee, 0x0e, 0x0c, 0xe9, 0xbf, 0x0a, 0x8b, 0x6d, 0xcc, 0x6c, 0x6c, 0xc0, 0x55, 0x51, 0x2b, 0x25, 0xb8, 0x72, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xc3, 0x03, 0x9a, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x29, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x21, 0x03, 0x9a, 0x6f, 0x71, 0xab, 0x7c, 0x01, 0x1c, 0xfe, 0x11, 0x27, 0x25, 0x21, 0x25, 0x70, 0x01, 0x60, 0x56, 0x5f, 0x68, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x03, 0xaf, 0xeb, 0xfe, 0x23, 0x01, 0x21, 0x02, 0x78, 0xfd, 0x88, 0xa9, 0xe6, 0x01, 0x63, 0x1f, 0x88, 0x27, 0x31, 0x32, 0x27, 0x0d, 0x09, 0x0b, 0x59, 0x67, 0x72, 0x5b, 0xd7, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x76, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x34, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x07, 0x23, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x0e, 0x02, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x05, 0x2c, 0x17, 0x14, 0x14, 0x1b, 0x55, 0x78, 0x0d, 0x5e, 0x73, 0x5e, 0x0e, 0x32, 0x23, 0x39, 0x44, 0x45, 0x39, 0x2c, 0x3a, 0x0a, 0x71, 0x06, 0x3c, 0x64, 0x41, 0x4a, 0x6d, 0x3a, 0x35, 0x2f, 0x24, 0x28, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x02, 0x73, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x09, 0x04, 0x53, 0x3f, 0x66, 0x67, 0x14, 0x1b, 0x4f, 0x3d, 0x3d, 0x4b, 0x2b, 0x1e, 0x32, 0x4f, 0x2d, 0x3d, 0x6e, 0x47, 0x3f, 0x64, 0x1f, 0x12, 0x3d, 0x28, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xbf, 0x03, 0xe3, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xff, 0x43, 0x52, 0x41, 0x37, 0x89, 0x85, 0x6c, 0x6c, 0x83, 0x85, 0x44, 0x1d, 0x04, 0x17, 0x69, 0x46, 0x40, 0x68, 0x3c, 0x3c, 0x68, 0x3f, 0x43, 0x66, 0x1f, 0x03, 0x31, 0x68, 0xfd, 0x69, 0x03, 0xf8, 0xfd, 0x83, 0x42, 0x42, 0x35, 0x35, 0x43, 0x44, 0x34, 0x01, 0xa1, 0x43, 0x42, 0x35, 0x35, 0x42, 0x42, 0x34, 0x02, 0x78, 0x73, 0x16, 0x74, 0x51, 0x46, 0x6b, 0x1c, 0x9e, 0x82, 0x82, 0x9c, 0x20, 0x47, 0x3a, 0x43, 0x39, 0x68, 0x44, 0x45, 0x6a, 0x39, 0x3f, 0x3c, 0x63, 0x14, 0x6a, 0x6c, 0x6c, 0xfe, 0x3b, 0x43, 0x34, 0x36, 0x44, 0x44, 0x37, 0x35, 0x41, 0x41, 0x35, 0x37, 0x44, 0x44, 0x36, 0x35, 0x42, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xd2, 0x04, 0x27, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x49, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x6f, 0x17, 0x4f, 0x35, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x14, 0x30, 0x3e, 0x3f, 0x33, 0x38, 0x39, 0x02, 0x7c, 0x06, 0x0e, 0xad, 0x8b, 0x82, 0x4d, 0x5f, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfd, 0xf8, 0x04, 0x3c, 0xfd, 0x8c, 0x40, 0x3f, 0x3a, 0x35, 0x45, 0x44, 0x36, 0xfe, 0xf6, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa8, 0x09, 0x10, 0xbd, 0x89, 0x0c, 0x77, 0x58, 0x45, 0x69, 0x3a, 0x2b, 0x25, 0xaa, 0x6c, 0x6c, 0xfe, 0x41, 0x4b, 0x31, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x36, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0x73, 0x03, 0xcb, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x47, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x03, 0xcb, 0x6f, 0x80, 0x2b, 0x58, 0x11, 0x11, 0x08, 0x12, 0xc5, 0x8a, 0x79, 0x76, 0x89, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x01, 0xc1, 0x29, 0x1e, 0x20, 0x32, 0x59, 0x37, 0x56, 0x2d, 0xfe, 0x95, 0x5c, 0x4d, 0x4d, 0x44, 0x01, 0x4d, 0x36, 0x35, 0x32, 0x2e, 0x3d, 0x3d, 0x2e, 0xfe, 0x08, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xb5, 0x3c, 0x03, 0x0d, 0x18, 0xe1, 0x07, 0x83, 0x05, 0x8a, 0x79, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3c, 0xa0, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0xdd, 0x29, 0x1e, 0x1d, 0x28, 0x28, 0x1d, 0x1e, 0x29, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xec, 0x03, 0x29, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x29, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x12, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x03, 0x29, 0x6f, 0x7e, 0xe4, 0x95, 0x01, 0x76, 0x91, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x99, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xd1, 0xe5, 0x01, 0x68, 0x01, 0x24, 0xb3, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2e, 0x53, 0xb9, 0x6c, 0xfd, 0xc5, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd5, 0x03, 0x69, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x2a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x03, 0x69, 0x6f, 0x78, 0xd6, 0x8e, 0x01, 0x61, 0x9b, 0x02, 0x6e, 0x60, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x29, 0x2f, 0x01, 0x13, 0xfd, 0x6c, 0x03, 0x7e, 0xfd, 0x47, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0x78, 0xfd, 0x88, 0xc0, 0xeb, 0x01, 0x6e, 0x45, 0x5e, 0x75, 0x77, 0x61, 0x63, 0x60, 0x31, 0x38, 0x38, 0x31, 0x60, 0x88, 0x6c, 0xfd, 0x88, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0x38, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x7c, 0x18, 0x51, 0x38, 0x3d, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x25, 0x22, 0x16, 0x10, 0x31, 0x3c, 0x3f, 0x32, 0x3c, 0x3d, 0x82, 0x0d, 0xcf, 0x8c, 0xb6, 0x57, 0x5c, 0xaa, 0x04, 0x4d, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x37, 0x3b, 0xfe, 0x7c, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0x78, 0xab, 0x26, 0x2b, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xf2, 0x0e, 0xf9, 0xcb, 0x0a, 0x81, 0x65, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xcf, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd2, 0x03, 0x95, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x33, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x2d, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x83, 0x40, 0x32, 0x38, 0x39, 0x02, 0x7c, 0x08, 0x0a, 0xaf, 0x8b, 0x82, 0x4d, 0x5f, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xaa, 0xfd, 0xc9, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x6a, 0x42, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa9, 0x0e, 0x0a, 0xbf, 0x89, 0x0c, 0x77, 0x58, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x76, 0x03, 0x56, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x00, 0x00, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x16, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x01, 0x71, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x2a, 0x40, 0x39, 0x66, 0x41, 0x63, 0x7b, 0x3a, 0x65, 0x3f, 0x24, 0x1c, 0x0c, 0x0f, 0xc5, 0x8a, 0x79, 0x76, 0x89, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x03, 0x6b, 0xfe, 0x1b, 0xd5, 0x3c, 0x3c, 0x32, 0x32, 0x3b, 0x3b, 0x32, 0x01, 0xa6, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x44, 0x38, 0x5f, 0x3f, 0x5c, 0x31, 0x6e, 0x5e, 0x40, 0x5d, 0x31, 0x07, 0x15, 0x12, 0xe1, 0x07, 0x83, 0x05, 0x8a, 0x79, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x6c, 0x6e, 0x59, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xec, 0x02, 0x54, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x19, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x13, 0x01, 0x15, 0x07, 0x02, 0x54, 0xac, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0xd8, 0x01, 0x91, 0xfc, 0x02, 0xe4, 0x6c, 0xb3, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2e, 0x53, 0xb9, 0x6c, 0xfd, 0x08, 0x01, 0x82, 0x85, 0xfd, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xcd, 0x02, 0x51, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x07, 0x23, 0x37, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xd7, 0x33, 0x39, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x4b, 0x57, 0x6d, 0x2a, 0x27, 0xc0, 0x8b, 0x8f, 0x02, 0x75, 0x85, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x02, 0x66, 0x02, 0x78, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x56, 0x44, 0x39, 0x64, 0x23, 0xd9, 0x95, 0x5e, 0x59, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0x6c, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x7b, 0x02, 0xc3, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x99, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xcc, 0xff, 0x8a, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd2, 0x02, 0x7f, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x1e, 0x00, 0x00, 0x01, 0x21, 0x35, 0x21, 0x12, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x33, 0x02, 0x7e, 0xfd, 0x6d, 0x02, 0x93, 0x01, 0x2c, 0x2b, 0xab, 0x8b, 0x7f, 0x67, 0x80, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0x6f, 0x02, 0x78, 0x6c, 0xfe, 0x42, 0x6d, 0x24, 0xc3, 0x86, 0x01, 0x65, 0x5d, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x90, 0x03, 0x4a, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x00, 0x13, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xd5, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x6c, 0x50, 0x56, 0x6c, 0x81, 0x76, 0x81, 0x85, 0x6c, 0x6c, 0x83, 0x79, 0x6d, 0x7d, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x03, 0x5f, 0x02, 0x78, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x57, 0x57, 0x6f, 0x64, 0x72, 0x99, 0x1c, 0x95, 0x82, 0x82, 0x8e, 0x11, 0x6d, 0x58, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd5, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x19, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x01, 0x01, 0x23, 0x01, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x02, 0xbd, 0xfd, 0x2e, 0x02, 0xd2, 0xfe, 0xef, 0x8e, 0x01, 0x9e, 0xd8, 0x03, 0x6e, 0x5f, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x29, 0x2f, 0x01, 0x51, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x1d, 0xfe, 0xd4, 0x01, 0xad, 0x5c, 0x71, 0x77, 0x61, 0x63, 0x60, 0x31, 0x38, 0x38, 0x31, 0x60, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x91, 0x02, 0xdf, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x31, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x21, 0x15, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x23, 0x13, 0x01, 0x15, 0x07, 0xf9, 0x33, 0x2b, 0x24, 0x2c, 0x01, 0x9e, 0xee, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x02, 0xf4, 0xfe, 0xf4, 0xb5, 0xa7, 0x01, 0x1a, 0x98, 0x01, 0xc1, 0x1c, 0x21, 0x1e, 0x1d, 0x61, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x6c, 0xb7, 0xfd, 0xd0, 0x01, 0x42, 0x81, 0xc1, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xab, 0x02, 0xb4, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x17, 0x33, 0x15, 0x07, 0x23, 0x01, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x02, 0xb4, 0xfd, 0x37, 0x01, 0x8c, 0x75, 0x13, 0xb5, 0xcb, 0x83, 0x01, 0x4d, 0xae, 0x0b, 0x7a, 0x60, 0x41, 0x65, 0x3b, 0x04, 0x7a, 0x07, 0x3b, 0x2a, 0x37, 0x3c, 0x3c, 0x37, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x02, 0xe4, 0x6c, 0x6c, 0xc4, 0x56, 0x49, 0xf2, 0xe4, 0x01, 0x69, 0x57, 0x67, 0x30, 0x55, 0x36, 0x21, 0x2d, 0x45, 0x34, 0x32, 0x44, 0x2d, 0x21, 0x54, 0x68, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xb1, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x9f, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xef, 0xff, 0xc0, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xad, 0x02, 0xb5, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xa0, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xed, 0xff, 0xbc, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x7b, 0x02, 0x4d, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xa1, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xc6, 0xff, 0x8a, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x8a, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xa2, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xfd, 0xff, 0x99, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xd7, 0x02, 0x9f, 0x02, 0xe4, 0x00, 0x0c, 0x00, 0x15, 0x00, 0x19, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x05, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x01, 0x15, 0x03, 0x02, 0x9f, 0xa7, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x01, 0x8e, 0xa6, 0x2e, 0x26, 0x27, 0x2b, 0x59, 0x01, 0x7f, 0xec, 0x02, 0xe4, 0x6c, 0xb4, 0x5f, 0x76, 0x78, 0x5d, 0xb4, 0x6c, 0x6c, 0xbf, 0x29, 0x34, 0x33, 0x2a, 0xfe, 0x1e, 0x01, 0x91, 0x90, 0xfe, 0xff, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x02, 0x61, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x15, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x17, 0x01, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x02, 0x61, 0xfd, 0x8a, 0x01, 0xc7, 0x96, 0x19, 0xfe, 0xaf, 0xa8, 0x01, 0x79, 0x14, 0x49, 0x2e, 0x42, 0x56, 0x81, 0x43, 0x7c, 0x52, 0x02, 0xe4, 0x6c, 0x6c, 0xd8, 0x69, 0x5a, 0xfe, 0xb7, 0x06, 0x01, 0x55, 0x21, 0x29, 0x4e, 0x46, 0x49, 0x72, 0x40, 0x00, 0x00, 0x01, 0x00, 0x40, 0xff, 0xb0, 0x02, 0xa3, 0x02, 0xed, 0x00, 0x2d, 0x00, 0x00, 0x00, 0x06, 0x07, 0x05, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x02, 0xa3, 0x34, 0x2f, 0xfe, 0xf6, 0xa0, 0xc7, 0x85, 0x98, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x57, 0x53, 0x59, 0x71, 0x6f, 0x01, 0x24, 0x67, 0x24, 0xe9, 0x07, 0xa1, 0x05, 0x94, 0x80, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x56, 0x4b, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xce, 0x02, 0xa1, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xa6, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x02, 0x76, 0xff, 0xdd, 0x00, 0x01, 0x00, 0x46, 0xff, 0xbc, 0x02, 0x72, 0x02, 0xed, 0x00, 0x31, 0x00, 0x00, 0x00, 0x06, 0x07, 0x07, 0x23, 0x37, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x02, 0x72, 0x26, 0x24, 0xc5, 0x8c, 0x93, 0x0c, 0x17, 0x6f, 0x8a, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x53, 0x5b, 0x71, 0x01, 0x15, 0x57, 0x21, 0xe1, 0x99, 0x01, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x4b, 0x3e, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xad, 0x02, 0xa3, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x14, 0x00, 0x20, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x12, 0x36, 0x36, 0x33, 0x21, 0x15, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x01, 0x15, 0x03, 0x02, 0xa3, 0xfd, 0x48, 0x4c, 0x3c, 0x67, 0x40, 0x01, 0x89, 0xeb, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x01, 0x3d, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x2b, 0x38, 0x47, 0x01, 0x76, 0xe9, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x83, 0x5d, 0x2f, 0x6c, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x2b, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0xfe, 0x87, 0x01, 0x8d, 0x87, 0xfe, 0xfa, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xeb, 0x02, 0x2d, 0x02, 0xe4, 0x00, 0x16, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0xcc, 0x3e, 0x3f, 0x39, 0x40, 0x6b, 0x29, 0x27, 0xd0, 0x8c, 0xb6, 0x72, 0x7b, 0x5f, 0x02, 0x42, 0x02, 0x78, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x3b, 0x61, 0x21, 0xf6, 0xc3, 0x03, 0x8a, 0x71, 0xcc, 0x6c, 0x6c, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xeb, 0x03, 0x9f, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x27, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x31, 0x18, 0x52, 0x38, 0x61, 0x6b, 0x83, 0x3b, 0x37, 0x3c, 0x3d, 0x81, 0x0a, 0x06, 0xcd, 0x8c, 0xb6, 0x57, 0x5c, 0x5f, 0x03, 0xb4, 0xfe, 0x11, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x80, 0x68, 0x37, 0x42, 0x52, 0x3e, 0xfe, 0xe1, 0xf3, 0x0c, 0x05, 0xf7, 0xcb, 0x0a, 0x81, 0x65, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xc5, 0x02, 0x44, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x16, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x07, 0x23, 0x37, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x06, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0x44, 0xfd, 0xa7, 0x01, 0xa8, 0x75, 0x39, 0x24, 0x22, 0xb0, 0x83, 0x7f, 0x07, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x36, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0xe4, 0x6c, 0x6c, 0xbb, 0x43, 0x6d, 0x3e, 0x34, 0x5c, 0x21, 0xc5, 0x81, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x59, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x03, 0x00, 0x3f, 0xff, 0xad, 0x02, 0xa1, 0x02, 0xed, 0x00, 0x1f, 0x00, 0x2a, 0x00, 0x2e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x07, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x01, 0x15, 0x01, 0x02, 0xa1, 0xcc, 0x69, 0x5f, 0x5c, 0x72, 0x78, 0x5e, 0x4c, 0x49, 0x1f, 0x26, 0x03, 0x7e, 0x04, 0x65, 0x5d, 0x64, 0x5b, 0x74, 0x4b, 0x2a, 0x36, 0x30, 0x26, 0x2a, 0x2b, 0x52, 0x01, 0x92, 0xfe, 0xfc, 0x01, 0xd1, 0x67, 0x2e, 0x64, 0x77, 0x65, 0x53, 0x59, 0x5f, 0x4e, 0x60, 0x2b, 0x24, 0x0d, 0x14, 0x1a, 0x0e, 0x51, 0x65, 0x7c, 0x69, 0x37, 0x67, 0x2c, 0x25, 0x23, 0x2a, 0x37, 0x31, 0xfe, 0x79, 0x01, 0x7b, 0x75, 0xfe, 0xfa, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xad, 0x02, 0x9c, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x20, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x33, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x01, 0x15, 0x01, 0x01, 0xc2, 0xd9, 0xd9, 0x69, 0x60, 0x3d, 0x5d, 0x34, 0x77, 0x5e, 0x4d, 0xfe, 0x9e, 0x02, 0xb1, 0xfe, 0xb1, 0x4c, 0x2a, 0x35, 0x30, 0x25, 0x2a, 0x2c, 0x5c, 0x01, 0xa9, 0xfe, 0xe5, 0x02, 0x78, 0x9a, 0x67, 0x38, 0x64, 0x75, 0x2f, 0x55, 0x37, 0x5b, 0x62, 0x9a, 0x6c, 0x6c, 0xfe, 0xff, 0x2e, 0x27, 0x25, 0x2d, 0x38, 0x31, 0xfe, 0x74, 0x01, 0x91, 0x75, 0xfe, 0xe4, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xc2, 0x02, 0x89, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x00, 0x00, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x33, 0x02, 0x89, 0x34, 0x30, 0xf4, 0x9e, 0xb6, 0x7e, 0x8f, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x02, 0x9d, 0xfe, 0xe3, 0x57, 0x58, 0x5f, 0x4d, 0x32, 0x4d, 0x2b, 0x76, 0x01, 0x24, 0x6a, 0x24, 0xd4, 0x07, 0x94, 0x07, 0x95, 0x7e, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x4c, 0x55, 0x28, 0x46, 0x2c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x5d, 0x03, 0xa2, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xaf, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x03, 0x22, 0xff, 0x6c, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xc6, 0x02, 0x44, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x16, 0x00, 0x23, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x04, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x07, 0x23, 0x37, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x02, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x02, 0x44, 0xfd, 0xa7, 0x01, 0xa9, 0x76, 0x3a, 0x22, 0x22, 0xb4, 0x88, 0x82, 0x08, 0x4f, 0x75, 0x3f, 0x3f, 0x76, 0x4e, 0x84, 0x4c, 0x3b, 0x2b, 0x3c, 0x1e, 0x45, 0x40, 0x3b, 0x4c, 0x02, 0xe4, 0x6c, 0x6c, 0xc2, 0x43, 0x6c, 0x3e, 0x2e, 0x56, 0x20, 0xcb, 0x85, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0xfe, 0xd9, 0x49, 0x26, 0x3d, 0x21, 0x36, 0x4e, 0x48, 0x3b, 0x00, 0x00, 0x02, 0x00, 0x1d, 0xff, 0xf7, 0x02, 0x30, 0x02, 0xed, 0x00, 0x18, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x07, 0x23, 0x35, 0x25, 0x27, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x26, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x27, 0x22, 0x06, 0x15, 0x02, 0x30, 0xcd, 0x9b, 0x01, 0x08, 0x86, 0x9a, 0x93, 0xcc, 0x43, 0x45, 0x33, 0x5f, 0x3f, 0x41, 0x60, 0x34, 0x2f, 0x36, 0xc8, 0x55, 0x11, 0x27, 0x2a, 0x31, 0x2a, 0x29, 0x33, 0x01, 0x2c, 0x72, 0xc3, 0x08, 0xec, 0x45, 0x78, 0x0f, 0x9e, 0x29, 0x61, 0x3e, 0x37, 0x57, 0x32, 0x30, 0x54, 0x35, 0x39, 0x58, 0x2e, 0x69, 0x2e, 0x08, 0x1f, 0x39, 0x27, 0x25, 0x35, 0x01, 0x35, 0x26, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xeb, 0x02, 0x3a, 0x02, 0xe4, 0x00, 0x0f, 0x00, 0x17, 0x00, 0x00, 0x01, 0x21, 0x01, 0x14, 0x06, 0x07, 0x03, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x16, 0x33, 0x32, 0x36, 0x37, 0x25, 0x15, 0x02, 0x3a, 0xfe, 0x8e, 0x01, 0x72, 0x1c, 0x1a, 0xf2, 0x8c, 0xbc, 0x78, 0x80, 0x5f, 0x02, 0x4f, 0xfe, 0x8d, 0x41, 0x43, 0x31, 0x40, 0x0b, 0xff, 0x00, 0x02, 0x78, 0xfe, 0xf7, 0x23, 0x44, 0x1b, 0xfe, 0xfe, 0xba, 0x01, 0x90, 0x76, 0xcc, 0x6c, 0xfe, 0x7c, 0x4e, 0x2d, 0x22, 0xbb, 0x74, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xc3, 0x02, 0x8d, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x25, 0x00, 0x00, 0x01, 0x14, 0x07, 0x21, 0x15, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x03, 0x13, 0x15, 0x07, 0x01, 0xb1, 0x23, 0x00, 0xff, 0xfe, 0x33, 0x27, 0x25, 0x21, 0x25, 0x70, 0x01, 0x60, 0x56, 0x5f, 0x68, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x02, 0xa2, 0xdc, 0x1e, 0xfa, 0x7e, 0x02, 0x2c, 0x4c, 0x38, 0x63, 0x88, 0x27, 0x31, 0x32, 0x27, 0x0d, 0x09, 0x0b, 0x59, 0x67, 0x72, 0x5b, 0xd7, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xfd, 0x4b, 0x01, 0x36, 0x8c, 0xaa, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0x5e, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7d, 0x01, 0xc6, 0xff, 0x6d, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xbf, 0x03, 0xe3, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x25, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x00, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x03, 0xe3, 0xfc, 0x08, 0x03, 0xa9, 0x41, 0x37, 0x89, 0x85, 0x6c, 0x6c, 0x83, 0x85, 0x44, 0x1d, 0x04, 0x17, 0x69, 0x46, 0x40, 0x68, 0x3c, 0x3c, 0x68, 0x3f, 0x43, 0x66, 0x1f, 0x03, 0x1e, 0x66, 0x43, 0x3f, 0x68, 0x3d, 0xfd, 0xd2, 0x42, 0x42, 0x35, 0x35, 0x43, 0x44, 0x34, 0xf6, 0x42, 0x34, 0x35, 0x43, 0x42, 0x35, 0x35, 0x42, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x00, 0x6b, 0x1c, 0x9e, 0x82, 0x82, 0x9c, 0x20, 0x47, 0x3a, 0x43, 0x39, 0x68, 0x44, 0x45, 0x6a, 0x39, 0x3f, 0x3c, 0x3c, 0x3f, 0x39, 0x6a, 0x45, 0x77, 0x43, 0x34, 0x36, 0x44, 0x44, 0x37, 0x35, 0x41, 0x42, 0x42, 0x41, 0x35, 0x37, 0x44, 0x44, 0x36, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xd2, 0x03, 0xd7, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x6f, 0x17, 0x4f, 0x35, 0x3e, 0x5d, 0x32, 0x83, 0x3f, 0x33, 0x38, 0x39, 0x02, 0x7c, 0x06, 0x0e, 0xad, 0x8b, 0x82, 0x4d, 0x5f, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfd, 0xf8, 0x03, 0xec, 0xfd, 0xdc, 0x40, 0x3f, 0x3a, 0x35, 0x45, 0x44, 0x36, 0xfe, 0xf6, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3c, 0x6a, 0x42, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa8, 0x09, 0x10, 0xbd, 0x89, 0x0c, 0x77, 0x58, 0x45, 0x69, 0x3a, 0x2b, 0x25, 0xaa, 0x6c, 0x6c, 0xfe, 0x41, 0x4b, 0x31, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x36, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x73, 0x03, 0x56, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x44, 0x00, 0x00, 0x00, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x15, 0x16, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x01, 0x71, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x2a, 0x40, 0x39, 0x66, 0x41, 0x63, 0x7b, 0x3a, 0x65, 0x3f, 0x24, 0x1c, 0x0c, 0x0f, 0xc5, 0x8a, 0x79, 0x76, 0x89, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x03, 0x6b, 0xfe, 0x1b, 0xd5, 0x3c, 0x3c, 0x32, 0x32, 0x3b, 0x3b, 0x32, 0xfe, 0x05, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x01, 0xa6, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x44, 0x38, 0x5f, 0x3f, 0x5c, 0x31, 0x6e, 0x5e, 0x40, 0x5d, 0x31, 0x07, 0x15, 0x12, 0xe1, 0x07, 0x83, 0x05, 0x8a, 0x79, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x6c, 0x6e, 0x59, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0xfe, 0x4e, 0x29, 0x1e, 0x1d, 0x28, 0x28, 0x1d, 0x1e, 0x29, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xec, 0x02, 0x54, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x19, 0x00, 0x25, 0x00, 0x00, 0x01, 0x15, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x13, 0x01, 0x15, 0x07, 0x26, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x54, 0xac, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0xd8, 0x01, 0x91, 0xfc, 0xd4, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0xe4, 0x6c, 0xb3, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2e, 0x53, 0xb9, 0x6c, 0xfd, 0x08, 0x01, 0x82, 0x85, 0xfd, 0xbd, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xd5, 0x02, 0xbd, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x19, 0x00, 0x25, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x01, 0x01, 0x23, 0x01, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0xbd, 0xfd, 0x2e, 0x02, 0xd2, 0xfe, 0xef, 0x8e, 0x01, 0x9e, 0xd8, 0x03, 0x6e, 0x5f, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x29, 0x2f, 0x01, 0x51, 0xfd, 0xf3, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0xe4, 0x6c, 0x6c, 0xfe, 0x1d, 0xfe, 0xd4, 0x01, 0xad, 0x5c, 0x71, 0x77, 0x61, 0x63, 0x60, 0x31, 0x38, 0x38, 0x31, 0x60, 0xfe, 0x7c, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x03, 0xe9, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x7c, 0x18, 0x51, 0x38, 0x61, 0x6b, 0x83, 0x3a, 0x37, 0x3c, 0x3d, 0x82, 0x0d, 0xcf, 0x8c, 0xb6, 0x57, 0x5c, 0xaa, 0x03, 0xfe, 0xfe, 0x11, 0xe4, 0x39, 0x39, 0x37, 0x3b, 0xfe, 0x7c, 0x29, 0x29, 0x1e, 0x1c, 0x29, 0x28, 0x1d, 0x02, 0x78, 0xab, 0x26, 0x2b, 0x80, 0x68, 0x37, 0x42, 0x52, 0x3e, 0xfe, 0xe1, 0xf2, 0x0e, 0xf9, 0xcb, 0x0a, 0x81, 0x65, 0xd2, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xcf, 0x29, 0x1e, 0x1d, 0x28, 0x29, 0x1c, 0x1e, 0x29, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xb2, 0x02, 0xe4, 0x00, 0x41, 0x00, 0x4e, 0x00, 0x5b, 0x00, 0x6b, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x15, 0x23, 0x15, 0x14, 0x16, 0x33, 0x04, 0xfb, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x04, 0x3b, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0xc7, 0xfc, 0x65, 0x36, 0x39, 0x59, 0x38, 0x50, 0x18, 0xfd, 0xae, 0x15, 0x4d, 0x35, 0xfe, 0x9a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xf5, 0x37, 0x1c, 0x3f, 0x3a, 0x30, 0x45, 0x04, 0x01, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x0f, 0x30, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0x5a, 0x36, 0x36, 0x2b, 0x26, 0xab, 0xab, 0x26, 0x2b, 0xfe, 0x9b, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x3b, 0x31, 0x0e, 0x01, 0x38, 0x44, 0x00, 0x00, 0x06, 0xff, 0xeb, 0xff, 0x6f, 0x06, 0xb2, 0x02, 0xe4, 0x00, 0x41, 0x00, 0x4e, 0x00, 0x5b, 0x00, 0x68, 0x00, 0x74, 0x00, 0x80, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x20, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x04, 0xfb, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x04, 0x3b, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0xc7, 0xfc, 0x64, 0x31, 0x3a, 0x5e, 0x38, 0x50, 0x18, 0xfd, 0xae, 0x15, 0x4d, 0x35, 0xfe, 0x9a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xf5, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0xfd, 0x15, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0xf0, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x0f, 0x30, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0x5a, 0x3c, 0x3c, 0x2b, 0x26, 0xab, 0xab, 0x26, 0x2b, 0xfe, 0x9b, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0xae, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xfb, 0x06, 0x8c, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x4a, 0x00, 0x56, 0x00, 0x63, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x8c, 0x6f, 0x80, 0x2d, 0x56, 0x0c, 0x14, 0x23, 0x72, 0x4e, 0x7c, 0x91, 0x3c, 0x32, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0xa1, 0xfc, 0x79, 0x57, 0x14, 0x40, 0xfe, 0x7d, 0x15, 0x4d, 0x35, 0x01, 0xaa, 0x29, 0x1e, 0x21, 0x32, 0x59, 0x37, 0x57, 0x2c, 0xfe, 0x94, 0x5b, 0x4c, 0x4c, 0x44, 0x01, 0x4d, 0x36, 0x35, 0x32, 0x2d, 0x3d, 0x3c, 0x2e, 0xfc, 0x28, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb5, 0x3c, 0x02, 0x3a, 0x46, 0x89, 0x77, 0x3b, 0x36, 0x43, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x40, 0x39, 0x1e, 0x5f, 0x5d, 0xaf, 0x24, 0x2a, 0xfe, 0x53, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3d, 0xa1, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x23, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x5a, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x37, 0x00, 0x44, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x36, 0x33, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x5a, 0x6f, 0x81, 0x1d, 0x5e, 0x3a, 0x5b, 0x75, 0x28, 0x25, 0x85, 0x41, 0x3f, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x6f, 0xf0, 0xfd, 0xc3, 0x30, 0x77, 0x01, 0x29, 0x28, 0x35, 0x41, 0x46, 0x35, 0x42, 0x4e, 0xfc, 0xf4, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb0, 0x29, 0x2e, 0x61, 0x59, 0x30, 0x4c, 0x17, 0x48, 0x37, 0xfe, 0xd9, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xb9, 0x4d, 0x66, 0x3e, 0x34, 0x35, 0x3b, 0x01, 0x5c, 0x48, 0xb0, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x34, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x3d, 0x00, 0x4a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x34, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x44, 0x60, 0x31, 0x3c, 0x32, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x49, 0xf0, 0xfc, 0xe9, 0x15, 0x4d, 0x35, 0x3d, 0x5a, 0x2f, 0x2d, 0x28, 0x29, 0x2e, 0x01, 0x0e, 0xfc, 0x1a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x34, 0x58, 0x36, 0x08, 0x35, 0x40, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xab, 0x26, 0x2b, 0x36, 0x5c, 0x36, 0x0c, 0x30, 0x39, 0x39, 0x30, 0xa2, 0xfe, 0xcd, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x69, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x3d, 0x00, 0x4a, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x33, 0x33, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xe8, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x02, 0x02, 0x3c, 0x30, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x7e, 0xbc, 0x7b, 0x8c, 0x84, 0x05, 0xfd, 0xfe, 0x15, 0x4d, 0x35, 0x5e, 0x35, 0xfe, 0x07, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x0b, 0x18, 0x33, 0x3e, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xc8, 0x6d, 0x5b, 0xab, 0x26, 0x2b, 0x45, 0xfe, 0xe0, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x33, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x2f, 0x00, 0x38, 0x00, 0x45, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x33, 0x6f, 0x81, 0x9d, 0x6d, 0x65, 0x60, 0x6c, 0x05, 0x0b, 0x36, 0x26, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x48, 0xfc, 0xb2, 0x1e, 0xd6, 0x15, 0x4b, 0x34, 0x01, 0x66, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0xfd, 0x37, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x6f, 0x58, 0x21, 0x28, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xd2, 0x0c, 0x72, 0xb1, 0x23, 0x28, 0x66, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0xaf, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x57, 0x02, 0xe4, 0x00, 0x35, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x91, 0x18, 0x53, 0x39, 0x3f, 0x60, 0x34, 0x37, 0x63, 0x3f, 0x26, 0x20, 0x12, 0x13, 0x35, 0x41, 0x42, 0x32, 0x3f, 0x40, 0x7d, 0x76, 0x4b, 0x56, 0x4d, 0x49, 0x12, 0x27, 0x4a, 0x75, 0x43, 0x3a, 0x8f, 0x01, 0xed, 0xfd, 0xd7, 0x04, 0x6c, 0x02, 0x78, 0xdf, 0x26, 0x2d, 0x3c, 0x69, 0x42, 0x48, 0x6a, 0x38, 0x07, 0x66, 0x04, 0x44, 0x3a, 0x36, 0x46, 0x4b, 0x35, 0xfe, 0x01, 0x77, 0x46, 0x42, 0x40, 0x48, 0x65, 0x35, 0x66, 0x47, 0x5e, 0x37, 0x6c, 0x93, 0x6c, 0x6c, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0x6f, 0x05, 0x8f, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x39, 0x00, 0x46, 0x00, 0x52, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x05, 0x8f, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x04, 0x01, 0x37, 0x2d, 0x36, 0x35, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0xa4, 0xf0, 0xfd, 0x8e, 0x2c, 0x64, 0x35, 0x50, 0x16, 0x49, 0x73, 0x8b, 0xfc, 0xbf, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x1d, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x1d, 0x17, 0x40, 0x42, 0x49, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xad, 0x4a, 0x2d, 0x2a, 0x30, 0xfe, 0xcb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0xae, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x3e, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x45, 0x00, 0x52, 0x00, 0x5f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x3e, 0x6f, 0x80, 0x1e, 0x67, 0x45, 0x77, 0x8c, 0x09, 0x18, 0x59, 0x43, 0x48, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x01, 0x01, 0x04, 0x36, 0x30, 0x36, 0x35, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x53, 0xfd, 0x43, 0x3f, 0x36, 0x32, 0xfd, 0x05, 0x2a, 0x5a, 0x31, 0x4a, 0x13, 0x45, 0x7d, 0x02, 0x4e, 0xa8, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x61, 0xfb, 0x0f, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x81, 0x71, 0x3d, 0x48, 0x44, 0x42, 0x4a, 0x66, 0x7c, 0x7a, 0x0d, 0x06, 0x4a, 0x4c, 0x49, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xea, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0xa9, 0x46, 0x2f, 0x2d, 0x41, 0x7e, 0x4d, 0x56, 0x68, 0x08, 0x03, 0x45, 0x54, 0x60, 0x4b, 0xbb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xa6, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x39, 0x00, 0x46, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xa6, 0x6f, 0x7c, 0xda, 0xa8, 0x01, 0x79, 0x15, 0x4a, 0x2d, 0x42, 0x55, 0x81, 0x01, 0x3e, 0x32, 0x37, 0x39, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0xbb, 0xee, 0xfd, 0x75, 0x16, 0x4b, 0x34, 0x2f, 0x4b, 0x19, 0x44, 0x6c, 0x3b, 0x5a, 0x1e, 0xfc, 0xa6, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xd7, 0xd7, 0x06, 0x01, 0x55, 0x21, 0x29, 0x4e, 0x46, 0x09, 0x49, 0x4c, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xac, 0x26, 0x2c, 0x2a, 0x28, 0x3f, 0x2c, 0x23, 0xfe, 0xfd, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xf3, 0x02, 0xe4, 0x00, 0x37, 0x00, 0x49, 0x00, 0x57, 0x00, 0x64, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x35, 0x31, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x05, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xf3, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x67, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x04, 0x33, 0x33, 0x36, 0x35, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x08, 0xfd, 0xd5, 0x3c, 0x5a, 0x39, 0x56, 0x1a, 0xfc, 0x26, 0x14, 0x46, 0x30, 0x31, 0x48, 0x12, 0x26, 0x6d, 0x42, 0x01, 0x94, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfb, 0xde, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x23, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x0e, 0x54, 0x54, 0x49, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xf6, 0x34, 0x2c, 0x27, 0xa9, 0xab, 0x22, 0x26, 0x37, 0x34, 0x22, 0x22, 0xfe, 0xc4, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x07, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xe9, 0x02, 0xed, 0x00, 0x38, 0x00, 0x49, 0x00, 0x56, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x15, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xe9, 0x6e, 0x82, 0x18, 0x73, 0x52, 0x7b, 0x96, 0x06, 0x09, 0x39, 0x27, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xaf, 0x1d, 0x21, 0x3b, 0x5a, 0x32, 0x8b, 0x7e, 0x15, 0x04, 0x57, 0x53, 0x38, 0x5c, 0x36, 0xfe, 0x06, 0x55, 0x15, 0x56, 0x66, 0x2a, 0x24, 0x10, 0x12, 0xfe, 0x78, 0x15, 0x4d, 0x35, 0xfe, 0x9a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xe4, 0x6e, 0xfd, 0x8a, 0xcc, 0x30, 0x43, 0x8d, 0x7a, 0x24, 0x2b, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x30, 0x5e, 0x41, 0x01, 0x51, 0xcd, 0x36, 0x30, 0x01, 0x37, 0x43, 0x24, 0x2f, 0x06, 0x01, 0xaf, 0x24, 0x2a, 0xfe, 0xa2, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xe5, 0x05, 0x45, 0x02, 0xe4, 0x00, 0x34, 0x00, 0x40, 0x00, 0x4d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x31, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xdf, 0x51, 0x41, 0x37, 0x2d, 0x41, 0x78, 0x7f, 0x15, 0x48, 0x2e, 0x3d, 0x62, 0x39, 0x3c, 0x32, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x5a, 0x7d, 0xa7, 0xa9, 0x63, 0x39, 0x32, 0xfd, 0xe7, 0x15, 0x4d, 0x35, 0x59, 0x38, 0xfe, 0x09, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x05, 0x36, 0x43, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xca, 0x50, 0x1f, 0x5b, 0xab, 0x26, 0x2b, 0x3e, 0xfe, 0xd9, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x10, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x37, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x33, 0x21, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x10, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x02, 0x04, 0x3b, 0x2f, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x25, 0xf0, 0xfd, 0x0d, 0x15, 0x4d, 0x35, 0x69, 0x2e, 0x3b, 0x55, 0x01, 0x35, 0xfc, 0x3e, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xd6, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x0b, 0x12, 0x31, 0x3c, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xab, 0x26, 0x2b, 0x52, 0x27, 0xfe, 0xc6, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x0b, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x56, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x2c, 0x00, 0x35, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x56, 0x6f, 0x80, 0x35, 0x67, 0x5a, 0x6c, 0x10, 0x0b, 0x31, 0x21, 0x36, 0x35, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x6b, 0xfd, 0x80, 0x19, 0xc2, 0x15, 0x4a, 0x33, 0x01, 0xa8, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfc, 0xf7, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x64, 0x56, 0x21, 0x26, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x05, 0x66, 0xac, 0x23, 0x28, 0x61, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0xe5, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xeb, 0x05, 0x56, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x2e, 0x00, 0x37, 0x00, 0x44, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x56, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x4e, 0x60, 0x0e, 0x0b, 0x30, 0x21, 0x36, 0x35, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x6b, 0xfd, 0x80, 0x19, 0xc2, 0x15, 0x4a, 0x33, 0x01, 0xa8, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfc, 0xf7, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x07, 0x61, 0x4e, 0x20, 0x24, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x05, 0x66, 0xac, 0x23, 0x28, 0x61, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0xe5, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xa0, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x46, 0x00, 0x4f, 0x00, 0x5c, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xe3, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x58, 0x6a, 0x0e, 0x0b, 0x35, 0x24, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0xb5, 0xfc, 0x44, 0x18, 0xcf, 0x15, 0x4c, 0x36, 0x01, 0x9e, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0xfc, 0xfc, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x66, 0x57, 0x20, 0x24, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0x61, 0x07, 0x68, 0xad, 0x24, 0x28, 0x61, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xdf, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x6f, 0x06, 0xa0, 0x02, 0xe4, 0x00, 0x22, 0x00, 0xf2, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x31, 0x00, 0x4a, 0x00, 0x06, 0xff, 0xeb, 0xff, 0x6f, 0x06, 0xa1, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x46, 0x00, 0x4f, 0x00, 0x5c, 0x00, 0x68, 0x00, 0x74, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x04, 0xe4, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x56, 0x6a, 0x0f, 0x0b, 0x36, 0x25, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0xb6, 0xfc, 0x3d, 0x1f, 0xd0, 0x15, 0x4c, 0x36, 0x01, 0x9f, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0xfc, 0xfb, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x8c, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0xfd, 0x78, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x63, 0x55, 0x21, 0x28, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0x61, 0x07, 0x68, 0xad, 0x24, 0x28, 0x61, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xdf, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x48, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x66, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x06, 0xff, 0xeb, 0xff, 0x6f, 0x05, 0x93, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x35, 0x00, 0x3e, 0x00, 0x4b, 0x00, 0x54, 0x00, 0x60, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x07, 0x17, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x05, 0x93, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0xa8, 0xfd, 0x85, 0x30, 0x21, 0x5c, 0x36, 0x39, 0x57, 0x1d, 0xfd, 0x85, 0x15, 0x4d, 0x35, 0x01, 0xeb, 0x24, 0x45, 0x30, 0x3b, 0x2a, 0xed, 0xfc, 0xc0, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x43, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0xfd, 0xa0, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x0c, 0x2f, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xc6, 0x3e, 0x23, 0x25, 0x2a, 0x24, 0x9e, 0xab, 0x26, 0x2b, 0xfe, 0xf8, 0x25, 0x28, 0x46, 0x2a, 0x22, 0xbf, 0x39, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x53, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0xfe, 0xd1, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x21, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x39, 0x00, 0x46, 0x00, 0x51, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x21, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x07, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x36, 0xfc, 0xdd, 0x53, 0x16, 0x31, 0x3f, 0x4c, 0xfe, 0x0a, 0x15, 0x4d, 0x35, 0x02, 0x6c, 0x95, 0x95, 0xfc, 0x2e, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xec, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x1b, 0x1e, 0x30, 0x39, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x34, 0x2e, 0x17, 0xac, 0xae, 0x24, 0x29, 0x61, 0xac, 0xfe, 0xed, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0xaa, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x06, 0xff, 0xeb, 0xff, 0x6f, 0x06, 0x21, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x39, 0x00, 0x46, 0x00, 0x51, 0x00, 0x5d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x06, 0x21, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x07, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x36, 0xfc, 0xdd, 0x53, 0x16, 0x31, 0x3f, 0x4c, 0xfe, 0x0a, 0x15, 0x4d, 0x35, 0x02, 0x6c, 0x95, 0x95, 0xfc, 0x2e, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0xec, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0xfc, 0xf7, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x1b, 0x1e, 0x30, 0x39, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x34, 0x2e, 0x17, 0xac, 0xae, 0x24, 0x29, 0x61, 0xac, 0xfe, 0xed, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0xaa, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0xfe, 0xea, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xc8, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x32, 0x00, 0x3d, 0x00, 0x4a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xc8, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x51, 0x77, 0x41, 0x03, 0x08, 0x32, 0x2a, 0x38, 0x39, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0xdd, 0xfd, 0x38, 0x51, 0x15, 0x27, 0x25, 0xfe, 0x7b, 0x16, 0x4e, 0x36, 0x02, 0x11, 0xa7, 0xaf, 0x5a, 0x4e, 0x4e, 0x60, 0xfc, 0x86, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x41, 0x74, 0x4d, 0x22, 0x2e, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x36, 0x2e, 0x10, 0x42, 0x34, 0x3f, 0xb1, 0x26, 0x2a, 0x61, 0x56, 0xb2, 0x0e, 0x43, 0x56, 0x60, 0x4b, 0xbb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x6f, 0x02, 0xe4, 0x00, 0x47, 0x00, 0x59, 0x00, 0x66, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x36, 0x37, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x9a, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x01, 0x04, 0x3b, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x84, 0xfe, 0x37, 0x41, 0x34, 0xfd, 0x12, 0x15, 0x4d, 0x35, 0x54, 0x31, 0x1e, 0x50, 0x2e, 0x45, 0x55, 0x13, 0x03, 0xfc, 0xc9, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x15, 0x09, 0x30, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xb4, 0x40, 0x0b, 0x69, 0xae, 0x24, 0x29, 0x3f, 0x1d, 0x1e, 0x46, 0x37, 0xdd, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x80, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x35, 0x00, 0x43, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x80, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x05, 0x95, 0xfd, 0x93, 0x32, 0x1f, 0x54, 0x33, 0x39, 0x56, 0x1a, 0xfd, 0x99, 0x15, 0x4c, 0x35, 0x01, 0x75, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0x51, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x0c, 0x2f, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x38, 0x20, 0x23, 0x2c, 0x27, 0xa9, 0xae, 0x24, 0x29, 0xfe, 0x9b, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x07, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x55, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x3e, 0x00, 0x4a, 0x00, 0x58, 0x00, 0x65, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x27, 0x35, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x55, 0x6e, 0x82, 0x1f, 0x66, 0x44, 0x43, 0x68, 0x22, 0x1d, 0x62, 0x44, 0x4f, 0x75, 0x3f, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x6a, 0xfb, 0xc2, 0x31, 0x22, 0x61, 0x3c, 0x4e, 0x6c, 0x1b, 0x33, 0x30, 0xfc, 0xee, 0x15, 0x4c, 0x35, 0x03, 0xa2, 0xa6, 0x57, 0x59, 0x02, 0x59, 0x4d, 0x4e, 0x60, 0xfd, 0xe9, 0x45, 0x01, 0x02, 0x07, 0x44, 0x36, 0x3b, 0x4c, 0x4c, 0x3b, 0xfd, 0x4f, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb2, 0x28, 0x2d, 0x2a, 0x27, 0x2e, 0x35, 0x3d, 0x6c, 0x46, 0x0c, 0x2f, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x3b, 0x22, 0x24, 0x42, 0x38, 0x0c, 0x45, 0x3c, 0x43, 0xae, 0x24, 0x29, 0x61, 0x5a, 0x58, 0x69, 0x0a, 0x3f, 0x4b, 0x5f, 0x4c, 0xc2, 0x4e, 0x38, 0x0a, 0x15, 0x2a, 0x39, 0x48, 0x3b, 0x3c, 0x49, 0x07, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf8, 0x06, 0x1b, 0x02, 0xed, 0x00, 0x34, 0x00, 0x3a, 0x00, 0x4b, 0x00, 0x58, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x04, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x8b, 0x30, 0x31, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x79, 0x3c, 0x32, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x03, 0xc2, 0x1e, 0x27, 0x64, 0x78, 0x94, 0x74, 0x02, 0x55, 0x6f, 0x83, 0xfd, 0xdd, 0x59, 0x13, 0x25, 0x4f, 0x66, 0x32, 0x2b, 0x13, 0x0f, 0xfe, 0x60, 0x15, 0x4d, 0x35, 0xfe, 0x9a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x01, 0x2b, 0x55, 0x31, 0x3d, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0x57, 0x36, 0x43, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x09, 0x73, 0x68, 0x71, 0x76, 0x01, 0xb9, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0xcd, 0x44, 0x3b, 0x3f, 0x43, 0x2d, 0x36, 0x05, 0xaf, 0x24, 0x2a, 0xfe, 0xa2, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0x00, 0x3f, 0xff, 0xc4, 0x05, 0x71, 0x02, 0xee, 0x00, 0x37, 0x00, 0x43, 0x00, 0x47, 0x00, 0x52, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x21, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x25, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x71, 0x6f, 0x81, 0x96, 0x69, 0x62, 0x5d, 0x71, 0x18, 0xfe, 0xd8, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x37, 0x01, 0xb4, 0xfe, 0xe0, 0x03, 0x1f, 0xfb, 0x5d, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x03, 0xb3, 0x96, 0x96, 0xfe, 0xf1, 0x47, 0x2c, 0x35, 0x2f, 0x25, 0x29, 0x2b, 0x02, 0x78, 0xfd, 0x87, 0x01, 0x59, 0x3b, 0x68, 0x74, 0x6a, 0x58, 0x39, 0x28, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x49, 0x35, 0xb6, 0x6b, 0xe7, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x50, 0xb6, 0x6a, 0x2d, 0x28, 0x27, 0x2d, 0x37, 0x31, 0x00, 0x00, 0x05, 0x00, 0x3f, 0xff, 0xc4, 0x07, 0x36, 0x02, 0xee, 0x00, 0x3e, 0x00, 0x4a, 0x00, 0x50, 0x00, 0x5c, 0x00, 0x67, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x21, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x05, 0x33, 0x32, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x07, 0x36, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x78, 0x8b, 0x08, 0x88, 0x68, 0x62, 0x3d, 0x5e, 0x34, 0x1b, 0xfe, 0xd7, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x3d, 0x01, 0xb9, 0xfe, 0xdf, 0x04, 0xe6, 0xf9, 0x98, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x03, 0x1b, 0xb3, 0x83, 0xfe, 0xca, 0x02, 0x5d, 0xa8, 0x5c, 0x52, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0x2b, 0x47, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0xaa, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x73, 0x30, 0x58, 0x39, 0x3b, 0x2c, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x4e, 0x36, 0xbc, 0x6c, 0xe8, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x6c, 0x79, 0x43, 0x57, 0x53, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x19, 0x2d, 0x27, 0x28, 0x2d, 0x38, 0x30, 0x00, 0x00, 0x03, 0x00, 0x3f, 0xff, 0xc4, 0x05, 0x19, 0x02, 0xee, 0x00, 0x37, 0x00, 0x43, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x19, 0x6f, 0x81, 0x1f, 0x62, 0x42, 0x53, 0x7b, 0x44, 0x01, 0xfe, 0xef, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x3d, 0xbc, 0x42, 0x4c, 0xb1, 0x02, 0xc8, 0xfb, 0xb5, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x03, 0x5b, 0xa7, 0x57, 0x58, 0x01, 0x59, 0x4e, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb2, 0x28, 0x2d, 0x41, 0x76, 0x50, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x4e, 0x36, 0x3b, 0x3e, 0x43, 0x6c, 0xe8, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x50, 0x43, 0x57, 0x6b, 0x0c, 0x47, 0x57, 0x5f, 0x4c, 0x00, 0x00, 0x03, 0x00, 0x3f, 0xff, 0xc4, 0x04, 0xcd, 0x02, 0xee, 0x00, 0x3c, 0x00, 0x48, 0x00, 0x56, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xcd, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x44, 0x66, 0x38, 0x03, 0xfe, 0xe9, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x52, 0x49, 0x38, 0x48, 0x38, 0x61, 0x3c, 0x55, 0x71, 0x37, 0xbd, 0x1e, 0x61, 0x3e, 0x38, 0x56, 0x1a, 0xfe, 0x6e, 0xfe, 0x80, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x02, 0xb8, 0x3c, 0x1e, 0x45, 0x40, 0x3a, 0x4b, 0x4a, 0x3b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x28, 0x2b, 0x3d, 0x6c, 0x46, 0x15, 0x15, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x47, 0x56, 0x25, 0x11, 0x54, 0x41, 0x38, 0x56, 0x2f, 0x5c, 0x52, 0x49, 0x35, 0x2d, 0x33, 0x2b, 0x26, 0xa7, 0x6c, 0xe8, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0xfe, 0x8a, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x11, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x44, 0x00, 0x51, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x11, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x05, 0x3b, 0x2d, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x06, 0x26, 0xfd, 0xa2, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xb3, 0xad, 0x23, 0xd0, 0xfc, 0x3d, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x7e, 0x2a, 0x36, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xfe, 0xbd, 0x4b, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0xdc, 0x4c, 0x4c, 0x38, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x07, 0x6a, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x51, 0x00, 0x5b, 0x00, 0x68, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x24, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xe9, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x02, 0xfe, 0x7e, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x05, 0x3b, 0x2d, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x7f, 0xbc, 0x7b, 0xfd, 0x80, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xe4, 0x82, 0x57, 0x05, 0xfe, 0x44, 0x23, 0xde, 0xfc, 0x2f, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x0c, 0x18, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x7e, 0x2a, 0x36, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xc8, 0x0f, 0x4b, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0x44, 0x3d, 0x5b, 0x4c, 0x4c, 0x38, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xee, 0x07, 0x29, 0x02, 0xe4, 0x00, 0x4e, 0x00, 0x5a, 0x00, 0x64, 0x00, 0x71, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x24, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xd8, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x37, 0x61, 0x17, 0xfe, 0x55, 0x2a, 0x29, 0x28, 0x2c, 0x7c, 0x6d, 0x61, 0x66, 0x6f, 0x3d, 0x31, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x3e, 0x7a, 0xb2, 0xfd, 0xb6, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xc5, 0x63, 0x45, 0x58, 0xfe, 0x43, 0x24, 0xd6, 0xfc, 0x36, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x25, 0x2c, 0x74, 0x2e, 0x38, 0x33, 0x2a, 0x0d, 0x13, 0x5b, 0x6a, 0x79, 0x61, 0x6e, 0x30, 0x40, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xb7, 0x21, 0x4c, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0x46, 0x3a, 0x5c, 0x4c, 0x4d, 0x37, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x07, 0xa1, 0x02, 0xe4, 0x00, 0x41, 0x00, 0x4d, 0x00, 0x57, 0x00, 0x64, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0xa1, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x08, 0xfe, 0x78, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x05, 0x3b, 0x2d, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0xb6, 0xfc, 0x12, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x03, 0x43, 0xfd, 0xc3, 0x23, 0xfd, 0x26, 0x6f, 0x43, 0x8b, 0xfa, 0xad, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x25, 0x23, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x7e, 0x2a, 0x36, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xfe, 0xbd, 0x4b, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0xdc, 0x4c, 0x4c, 0x38, 0x23, 0x23, 0xfe, 0xcb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xeb, 0x07, 0x76, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x45, 0x00, 0x4c, 0x00, 0x55, 0x00, 0x62, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x35, 0x35, 0x23, 0x15, 0x14, 0x07, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x76, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x43, 0x58, 0x15, 0xfe, 0x69, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x05, 0x3b, 0x2d, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x07, 0x8b, 0xfc, 0x3d, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xa1, 0x9b, 0x23, 0x02, 0x36, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfa, 0xd7, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x07, 0x48, 0x3b, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x7e, 0x2a, 0x36, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0xfe, 0xbd, 0x4b, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0x0c, 0x04, 0xcc, 0x4c, 0x4c, 0x38, 0xd0, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0xe5, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xf7, 0x09, 0xce, 0x02, 0xe4, 0x00, 0x5b, 0x00, 0x67, 0x00, 0x6e, 0x00, 0x81, 0x00, 0x8e, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x35, 0x35, 0x23, 0x15, 0x14, 0x07, 0x24, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x08, 0xf9, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x5e, 0x7b, 0x16, 0x35, 0x48, 0x52, 0x6d, 0x17, 0xfe, 0x6a, 0x2a, 0x29, 0x28, 0x2c, 0x7c, 0x6d, 0x61, 0x66, 0x6f, 0x3d, 0x31, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x50, 0x18, 0xfe, 0x3a, 0x09, 0xe3, 0xf9, 0xe5, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xa1, 0x99, 0x24, 0x03, 0xb3, 0x41, 0x34, 0xfd, 0x17, 0x39, 0x3b, 0x26, 0x34, 0x0d, 0x0f, 0x76, 0x53, 0x45, 0x55, 0x13, 0x03, 0xf9, 0x6a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x59, 0x4c, 0x23, 0x4d, 0x44, 0x74, 0x2e, 0x38, 0x33, 0x2a, 0x0d, 0x13, 0x5b, 0x6a, 0x79, 0x61, 0x6e, 0x30, 0x40, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xd8, 0x4c, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0x0c, 0x04, 0xcc, 0x4c, 0x4d, 0x37, 0x1c, 0x40, 0x0b, 0x69, 0xcc, 0x44, 0x4d, 0x25, 0x20, 0x56, 0x5d, 0x46, 0x37, 0xdd, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xfb, 0x06, 0x68, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x38, 0x00, 0x4d, 0x00, 0x59, 0x00, 0x65, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x20, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x68, 0x6f, 0x80, 0x2d, 0x56, 0x0c, 0x14, 0x23, 0x72, 0x4e, 0x5e, 0x82, 0x1c, 0x33, 0x4c, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x06, 0x7d, 0xfb, 0x46, 0x2a, 0x40, 0x39, 0x66, 0x41, 0x4c, 0x6a, 0x14, 0x4a, 0xfd, 0xe5, 0x5c, 0x4d, 0x4d, 0x44, 0x02, 0xf1, 0x28, 0x1e, 0x20, 0x32, 0x59, 0x37, 0x57, 0x2c, 0xfe, 0x94, 0x5b, 0x4d, 0x4d, 0x44, 0xfe, 0xb4, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x02, 0xcb, 0x36, 0x35, 0x32, 0x2d, 0x3d, 0x3c, 0x2e, 0x02, 0x78, 0xfd, 0x88, 0xb5, 0x3c, 0x02, 0x3a, 0x46, 0x51, 0x4c, 0x21, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x44, 0x38, 0x5f, 0x3f, 0x5c, 0x31, 0x47, 0x3d, 0x19, 0x67, 0x6b, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3d, 0xa1, 0x6e, 0x65, 0x69, 0x06, 0x3d, 0x40, 0x4f, 0x6f, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x03, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0x6b, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x3c, 0x00, 0x48, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x6b, 0x6f, 0x81, 0x85, 0x4b, 0x56, 0x4d, 0x49, 0x13, 0x24, 0x59, 0x7a, 0x17, 0x36, 0x46, 0x1e, 0x1d, 0x22, 0x73, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x05, 0x80, 0xf0, 0xfc, 0xf6, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x29, 0x1e, 0x21, 0x77, 0x63, 0x40, 0x62, 0x1b, 0x45, 0x7f, 0x88, 0xfe, 0x2f, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x4a, 0x4a, 0x1f, 0x06, 0x3b, 0x47, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x6c, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x43, 0x1b, 0x4d, 0x30, 0x5f, 0x6d, 0x31, 0x2d, 0x3b, 0xfe, 0xeb, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x1b, 0x05, 0x6b, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x8f, 0xff, 0xf6, 0x00, 0x02, 0x01, 0x08, 0x00, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0xed, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x39, 0x00, 0x45, 0x00, 0x51, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xed, 0x6f, 0x81, 0x97, 0x23, 0x34, 0x5b, 0x38, 0x39, 0x5c, 0x1c, 0x1b, 0x4e, 0x30, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x06, 0x02, 0xf0, 0xfc, 0x74, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x2a, 0x40, 0x77, 0x63, 0x3e, 0x5e, 0x1b, 0x3a, 0x65, 0x01, 0x35, 0xfd, 0xad, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x01, 0x72, 0x38, 0x38, 0x2b, 0x2d, 0x38, 0x38, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x2e, 0x2a, 0x1b, 0x1d, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x6c, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x44, 0x38, 0x5f, 0x5f, 0x6d, 0x2d, 0x29, 0x38, 0xfe, 0xe6, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x15, 0x37, 0x2b, 0x2a, 0x37, 0x36, 0x2c, 0x2b, 0x36, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0xff, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x36, 0x00, 0x3a, 0x00, 0x46, 0x00, 0x51, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xff, 0x70, 0x82, 0x95, 0x65, 0x61, 0x3c, 0x59, 0x18, 0x38, 0x55, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x06, 0x14, 0xfb, 0xaf, 0x2a, 0x40, 0x77, 0x63, 0x44, 0x64, 0x19, 0x34, 0x4d, 0x4b, 0xfd, 0x72, 0x5c, 0x4d, 0x4d, 0x44, 0x03, 0xb4, 0x95, 0x95, 0xfd, 0x9d, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x01, 0x87, 0x47, 0x2c, 0x35, 0x2f, 0x25, 0x29, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x69, 0x73, 0x2e, 0x2a, 0x2d, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x44, 0x38, 0x5f, 0x5f, 0x6d, 0x36, 0x32, 0x23, 0xac, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x02, 0x0e, 0xac, 0xf3, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x8a, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x20, 0x05, 0xff, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x79, 0xff, 0xfb, 0x00, 0x02, 0x01, 0x0b, 0x00, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0xa3, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x35, 0x00, 0x41, 0x00, 0x4d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xa3, 0x6e, 0x81, 0x1f, 0x66, 0x45, 0x8a, 0x3f, 0x1c, 0x57, 0x36, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x05, 0xb8, 0xfc, 0x0b, 0x2a, 0x40, 0x39, 0x66, 0x41, 0x44, 0x64, 0x19, 0x2b, 0x20, 0xfd, 0xed, 0x5c, 0x4d, 0x4d, 0x44, 0x03, 0x5b, 0xb1, 0x4a, 0x59, 0x02, 0x57, 0x4c, 0x4e, 0x61, 0xfd, 0xf6, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x61, 0x22, 0x25, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x44, 0x38, 0x5f, 0x3f, 0x5c, 0x31, 0x39, 0x33, 0x0c, 0x47, 0x41, 0x3f, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x02, 0x0e, 0x56, 0x5a, 0x66, 0x09, 0x45, 0x4b, 0x60, 0x4b, 0x9b, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x1b, 0x05, 0xa3, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x8f, 0xff, 0xf6, 0x00, 0x02, 0x01, 0x0d, 0x00, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0x51, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x36, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x51, 0x6e, 0x7e, 0x1a, 0x56, 0x38, 0x3d, 0x5b, 0x1b, 0x37, 0x5b, 0x23, 0x1c, 0x21, 0x74, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x05, 0x66, 0xfc, 0x5d, 0x2a, 0x40, 0x77, 0x63, 0x6a, 0x38, 0x1c, 0x55, 0x38, 0x38, 0x56, 0x1a, 0xfd, 0x0c, 0x5c, 0x4d, 0x4d, 0x44, 0x02, 0xb1, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4b, 0x4a, 0x3b, 0xfe, 0xcb, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x28, 0x2b, 0x31, 0x2d, 0x32, 0x07, 0x3b, 0x48, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfd, 0x86, 0x44, 0x38, 0x5f, 0x5f, 0x6d, 0x3d, 0x26, 0x28, 0x2b, 0x27, 0xa8, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x48, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x27, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x1b, 0x05, 0x51, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x8f, 0xff, 0xf6, 0x00, 0x02, 0x01, 0x0f, 0x00, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf8, 0x05, 0xe9, 0x02, 0xed, 0x00, 0x2b, 0x00, 0x31, 0x00, 0x4e, 0x00, 0x5a, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x17, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x5a, 0x2f, 0x32, 0x2a, 0x30, 0x7d, 0x01, 0x72, 0x63, 0x56, 0x72, 0x13, 0x30, 0x3f, 0x1e, 0x1d, 0x22, 0x73, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x03, 0x92, 0x1e, 0x25, 0x64, 0x79, 0x94, 0x74, 0x02, 0x54, 0x6e, 0x83, 0xfc, 0xb6, 0x29, 0x1e, 0x21, 0x77, 0x63, 0x4a, 0x6b, 0x16, 0x29, 0x4e, 0x66, 0x31, 0x2c, 0x13, 0x0f, 0xfd, 0xd6, 0x5c, 0x4d, 0x4d, 0x44, 0x01, 0x51, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0x01, 0x2b, 0x55, 0x31, 0x3d, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x4e, 0x49, 0x18, 0x06, 0x3b, 0x47, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0x09, 0x73, 0x68, 0x71, 0x76, 0x01, 0xb9, 0x6e, 0xfd, 0x8a, 0x02, 0xe4, 0xfd, 0x86, 0x43, 0x1b, 0x4d, 0x30, 0x5f, 0x6d, 0x3f, 0x3a, 0x3f, 0x43, 0x2e, 0x35, 0x05, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x6f, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x1b, 0x05, 0xe9, 0x02, 0xed, 0x00, 0x22, 0x01, 0x11, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x8f, 0xff, 0xf6, 0x00, 0x05, 0xff, 0xeb, 0xff, 0x1b, 0x05, 0xef, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x41, 0x00, 0x47, 0x00, 0x53, 0x00, 0x5f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x05, 0xef, 0x6e, 0x82, 0xfe, 0x6a, 0x29, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6d, 0x61, 0x55, 0x6b, 0x10, 0x33, 0x47, 0x1e, 0x1d, 0x22, 0x73, 0x4e, 0x7d, 0x91, 0x1e, 0x43, 0x46, 0xfe, 0xfc, 0x06, 0x04, 0xfd, 0x9b, 0x49, 0xfd, 0x9e, 0x5c, 0x4d, 0x4d, 0x44, 0x55, 0x29, 0x1e, 0x21, 0x77, 0x63, 0x49, 0x6a, 0x16, 0x01, 0xc4, 0xab, 0x24, 0xcf, 0xfd, 0xab, 0x3b, 0x3b, 0x32, 0x32, 0x3c, 0x3c, 0x32, 0xff, 0x00, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x56, 0x48, 0x1e, 0x06, 0x3b, 0x47, 0x8e, 0x7f, 0x89, 0x40, 0x4a, 0x5d, 0x6c, 0xfe, 0xb7, 0x4d, 0x44, 0x4c, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x43, 0x1b, 0x4d, 0x30, 0x5f, 0x6d, 0x3e, 0x38, 0xdd, 0x4c, 0x4d, 0x37, 0xcf, 0x3b, 0x31, 0x31, 0x3b, 0x3b, 0x31, 0x31, 0x3b, 0xfe, 0xde, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x0b, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x0b, 0x6f, 0x81, 0x91, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xa0, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xaa, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x04, 0xaa, 0x6e, 0x82, 0x1f, 0x64, 0x3e, 0x60, 0x7b, 0x44, 0x31, 0x2f, 0x38, 0x84, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0xbf, 0xf0, 0xfe, 0xf3, 0x33, 0x39, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x2d, 0x4a, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xbd, 0x2c, 0x2f, 0x60, 0x57, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x26, 0x47, 0x2d, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x45, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x45, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0d, 0xfd, 0x53, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x5a, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x8c, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x5e, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x5e, 0x6f, 0x81, 0x9d, 0x6d, 0x65, 0x64, 0x6d, 0x86, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x73, 0xfd, 0xf4, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0x55, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x02, 0xee, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x45, 0x79, 0x4d, 0x32, 0xfe, 0x53, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0x6a, 0x01, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x4b, 0x6b, 0x36, 0x5b, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0xca, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xc0, 0x02, 0xed, 0x00, 0x48, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x04, 0xc0, 0x6d, 0x81, 0x20, 0x6d, 0x48, 0x60, 0x7e, 0x46, 0x2f, 0x35, 0x48, 0x08, 0x77, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xa2, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x43, 0x38, 0x51, 0x64, 0xee, 0x02, 0x78, 0xfd, 0x88, 0xb9, 0x30, 0x34, 0x5e, 0x55, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x94, 0x02, 0xed, 0x00, 0x57, 0x00, 0x62, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x27, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x94, 0x6f, 0x82, 0x1f, 0x65, 0x45, 0x4c, 0x71, 0x21, 0x22, 0x75, 0x4d, 0x6f, 0x8a, 0x46, 0x2f, 0x35, 0x48, 0x08, 0x77, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xa2, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x53, 0x58, 0x01, 0x03, 0x0c, 0x54, 0x4c, 0x9c, 0x02, 0xb3, 0xf1, 0xa6, 0xb0, 0x5a, 0x4f, 0x4d, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x37, 0x34, 0x38, 0x3c, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x63, 0x52, 0x02, 0x1c, 0x1c, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x4c, 0x02, 0xed, 0x00, 0x56, 0x00, 0x64, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x4c, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x48, 0x68, 0x1a, 0x3f, 0xa0, 0x6c, 0x83, 0x46, 0x2f, 0x35, 0x48, 0x08, 0x77, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xa2, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x48, 0x5c, 0x0c, 0x04, 0x3a, 0x63, 0x40, 0x38, 0x57, 0x19, 0xfe, 0x82, 0x01, 0x24, 0x3c, 0x1e, 0x45, 0x40, 0x3b, 0x4c, 0x4c, 0x3b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x41, 0x3a, 0x72, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x48, 0x48, 0x3d, 0x60, 0x35, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x21, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x21, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x35, 0xfd, 0x77, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x36, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xe8, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xe8, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x73, 0x8a, 0x0c, 0x8d, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x36, 0x55, 0x4b, 0xfc, 0xd6, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x06, 0xfd, 0xf0, 0xa7, 0x5b, 0x56, 0x08, 0x59, 0x49, 0x4e, 0x60, 0xfd, 0x26, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x37, 0x3d, 0x36, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0x4d, 0x4f, 0x63, 0x0a, 0x4b, 0x5b, 0x5f, 0x4c, 0xd5, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa2, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x31, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xa2, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0x3f, 0x6e, 0x45, 0x39, 0x57, 0x1d, 0xfd, 0xf1, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0xb7, 0xfe, 0x48, 0x2a, 0xed, 0x11, 0x24, 0x45, 0x30, 0x9c, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x46, 0x6c, 0x3c, 0x2a, 0x24, 0x9e, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x24, 0x25, 0x28, 0x46, 0x2a, 0xc7, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x2d, 0x02, 0xed, 0x00, 0x35, 0x00, 0x40, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x2d, 0x70, 0x81, 0x8b, 0x68, 0x62, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4b, 0x23, 0x23, 0x0e, 0x10, 0xfe, 0xd3, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xc0, 0x1e, 0x26, 0x66, 0x5c, 0x8b, 0xfe, 0xfd, 0x48, 0x2b, 0x35, 0x2f, 0x25, 0x28, 0x2c, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x69, 0x73, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x07, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0x7f, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xe1, 0x02, 0xed, 0x00, 0x4a, 0x00, 0x55, 0x00, 0x60, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x06, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0xe1, 0x70, 0x81, 0x1f, 0x66, 0x45, 0x79, 0x8d, 0x06, 0x69, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x12, 0x0d, 0x12, 0x14, 0x04, 0x82, 0x04, 0x0a, 0x8f, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x02, 0xbf, 0x20, 0x25, 0x66, 0x5c, 0x95, 0x44, 0x40, 0xb0, 0x02, 0xc7, 0xf1, 0xa7, 0xaf, 0x59, 0x50, 0x4d, 0x60, 0xfd, 0x48, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x07, 0x09, 0x26, 0x1a, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x33, 0x43, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x11, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x32, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x32, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x74, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x47, 0xf1, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xdf, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xdf, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x80, 0x8d, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xe0, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0xf4, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xec, 0x04, 0xdf, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x37, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x07, 0x23, 0x01, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xdf, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x50, 0x75, 0x21, 0xe8, 0x95, 0x01, 0x5b, 0x05, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xe0, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0xf4, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3e, 0x39, 0xe8, 0x01, 0x4c, 0x21, 0x1e, 0x12, 0x26, 0x48, 0x4b, 0x36, 0xb3, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2e, 0x53, 0xb9, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x2c, 0x05, 0x7f, 0x02, 0xe4, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0xaa, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x11, 0x41, 0x34, 0xfd, 0x7d, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x94, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x8f, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x8f, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x38, 0x67, 0x43, 0x39, 0x56, 0x1a, 0xfe, 0x05, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x04, 0xa4, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x2c, 0x27, 0xa9, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x26, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x37, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x05, 0x26, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0x9f, 0x5e, 0x60, 0x5d, 0x65, 0x01, 0x7d, 0x1f, 0x22, 0x3f, 0xfe, 0xc5, 0x05, 0x3b, 0xf0, 0xad, 0x23, 0xd0, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0xf2, 0x59, 0x6f, 0x66, 0x5b, 0x15, 0x0a, 0x1f, 0x24, 0x2f, 0x54, 0xf8, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xd6, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x36, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x37, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xd6, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3e, 0x66, 0x1b, 0x1d, 0x69, 0x43, 0x62, 0x74, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x04, 0xeb, 0xf0, 0xfc, 0xf1, 0x33, 0x39, 0x26, 0x30, 0x37, 0x37, 0x3e, 0x30, 0x3b, 0x47, 0x14, 0x03, 0x0f, 0x7a, 0x56, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x36, 0x31, 0x2f, 0x2d, 0x5e, 0x59, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0x6c, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x37, 0x45, 0x0c, 0x4d, 0x52, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xea, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x34, 0x00, 0x38, 0x00, 0x43, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x37, 0x37, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xea, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x40, 0x60, 0x19, 0x1e, 0x63, 0x3e, 0x63, 0x76, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x04, 0xff, 0xfc, 0x88, 0x49, 0x12, 0x04, 0x10, 0x70, 0x4f, 0x4c, 0xfd, 0xeb, 0x33, 0x39, 0x2e, 0x38, 0x37, 0x37, 0x3e, 0x30, 0x02, 0xc0, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x34, 0x2f, 0x27, 0x26, 0x5e, 0x59, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0xfd, 0xe8, 0x30, 0x39, 0x0c, 0x44, 0x47, 0xac, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x01, 0xac, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa8, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x35, 0x00, 0x41, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x37, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xa8, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x49, 0x6d, 0x22, 0x24, 0x6c, 0x45, 0x75, 0x85, 0x44, 0x31, 0x2f, 0x38, 0x6b, 0x04, 0xbd, 0xfc, 0xe0, 0x56, 0x05, 0x01, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0x46, 0x33, 0x39, 0x2a, 0x34, 0x37, 0x37, 0x42, 0x35, 0x02, 0x76, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x32, 0x2f, 0x2b, 0x31, 0x5e, 0x59, 0x3a, 0x4e, 0x0b, 0x03, 0x0b, 0x45, 0x3f, 0x3a, 0x6c, 0xfd, 0xe8, 0x4c, 0x3e, 0x0a, 0x17, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x34, 0x2f, 0x32, 0x68, 0x2f, 0x26, 0x2c, 0x2e, 0x01, 0xac, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x78, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x30, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x11, 0x21, 0x35, 0x21, 0x00, 0x36, 0x37, 0x36, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x78, 0x6f, 0x81, 0x1d, 0x5e, 0x3a, 0x3e, 0x61, 0x19, 0x41, 0x77, 0x61, 0x78, 0x20, 0x1e, 0x96, 0x02, 0xe8, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0xfc, 0x63, 0x04, 0x8d, 0xfd, 0x38, 0x46, 0x0f, 0x0b, 0x31, 0xc7, 0x35, 0x41, 0x44, 0x33, 0x02, 0x78, 0xfd, 0x88, 0xb0, 0x29, 0x2e, 0x32, 0x2f, 0x62, 0x65, 0x5e, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x01, 0x0f, 0x6c, 0xfd, 0xe0, 0x41, 0x34, 0x42, 0x25, 0x3e, 0x31, 0x33, 0x3a, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x17, 0x05, 0x06, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x4d, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x37, 0x36, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x04, 0x3e, 0x3e, 0x49, 0x5b, 0xaa, 0x74, 0x74, 0xa4, 0x22, 0x41, 0x69, 0x3d, 0x65, 0x3c, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x2f, 0x47, 0x0d, 0x0a, 0x3d, 0x2d, 0x2e, 0x39, 0xfd, 0xdb, 0x05, 0x1b, 0xfe, 0xc1, 0xfe, 0xca, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x46, 0x3a, 0x02, 0x78, 0x61, 0x11, 0x69, 0x51, 0x5e, 0x8c, 0x4b, 0x43, 0x41, 0x43, 0x2d, 0x59, 0x3d, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x34, 0x28, 0x2b, 0x3a, 0x0c, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x46, 0x53, 0x0e, 0x00, 0x03, 0xff, 0xeb, 0xfe, 0x99, 0x05, 0x06, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x58, 0x00, 0x64, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x37, 0x36, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x03, 0x06, 0x23, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x3e, 0x3e, 0x49, 0x4d, 0x48, 0x74, 0x18, 0x4a, 0x31, 0x3d, 0x5c, 0x32, 0x27, 0x24, 0x6f, 0x28, 0x41, 0x69, 0x3d, 0x65, 0x3c, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x2f, 0x47, 0x0d, 0x0a, 0x3d, 0x2d, 0x2e, 0x39, 0xfd, 0xdb, 0x05, 0x1b, 0xfe, 0xc1, 0xfe, 0xca, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x46, 0x3a, 0x0b, 0x37, 0x34, 0x39, 0x41, 0x3f, 0x33, 0x36, 0x3d, 0x02, 0x78, 0x61, 0x11, 0x69, 0x51, 0x56, 0x85, 0x27, 0xfe, 0x4f, 0x7c, 0x21, 0x24, 0x32, 0x58, 0x37, 0x30, 0x51, 0x1a, 0x21, 0x4e, 0x43, 0x2d, 0x59, 0x3d, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x34, 0x28, 0x2b, 0x3a, 0x0c, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x46, 0x53, 0x0e, 0xfe, 0x09, 0x0a, 0x01, 0x3f, 0x33, 0x33, 0x3e, 0x42, 0x2d, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x03, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x37, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x03, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x38, 0x5f, 0x1d, 0x1e, 0x5a, 0x39, 0x41, 0x67, 0x3c, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x44, 0x33, 0x34, 0x43, 0x09, 0x05, 0x7f, 0x5f, 0x01, 0x35, 0xfb, 0xd8, 0x05, 0x18, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x2d, 0x29, 0x28, 0x2c, 0x2d, 0x57, 0x3e, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x38, 0x01, 0x3b, 0x30, 0x5c, 0x65, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x18, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x2e, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x18, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x3c, 0x5c, 0x1a, 0x3e, 0x71, 0x61, 0x7b, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x41, 0x32, 0x37, 0x44, 0x0b, 0x0e, 0x72, 0x51, 0x4c, 0xfc, 0xd1, 0x05, 0x2d, 0xf1, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x2e, 0x2a, 0x4c, 0x67, 0x5c, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x40, 0x35, 0x47, 0x4c, 0xac, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xd5, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x37, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xd5, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x4b, 0x71, 0x22, 0x20, 0x69, 0x44, 0x68, 0x7f, 0x20, 0x1e, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x44, 0x35, 0x42, 0x4f, 0x01, 0x04, 0x0c, 0x54, 0x4b, 0xfd, 0x2d, 0x04, 0xea, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x37, 0x33, 0x37, 0x38, 0x65, 0x5e, 0x29, 0x45, 0x17, 0x66, 0x66, 0x3e, 0x31, 0x34, 0x39, 0x01, 0x60, 0x62, 0x28, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x5c, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x40, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x05, 0x5c, 0x6e, 0x82, 0x1d, 0x5e, 0x3d, 0x46, 0x6a, 0x23, 0x2a, 0xad, 0x7a, 0x98, 0xb6, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x05, 0x71, 0xfc, 0xb0, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x6c, 0x50, 0x32, 0x50, 0x19, 0x35, 0x31, 0xfd, 0x8d, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x02, 0xdb, 0xa7, 0x65, 0x5a, 0x22, 0x96, 0x32, 0x4f, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xae, 0x26, 0x2b, 0x30, 0x2e, 0x4f, 0x55, 0x71, 0x6c, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0xfd, 0xa1, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x57, 0x57, 0x2a, 0x27, 0x05, 0x36, 0x35, 0x3a, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x01, 0xf3, 0x4d, 0x56, 0x67, 0x04, 0xa1, 0x2b, 0x4e, 0x32, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x90, 0x05, 0x5c, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x46, 0x00, 0x52, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x05, 0x5c, 0x6e, 0x82, 0x1d, 0x5e, 0x3d, 0x46, 0x6a, 0x23, 0x1d, 0x6a, 0x48, 0x81, 0x85, 0x6c, 0x6c, 0x83, 0x79, 0x6d, 0x7d, 0x41, 0x38, 0x2e, 0x39, 0x69, 0x05, 0x71, 0xfc, 0xb0, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x6c, 0x50, 0x32, 0x50, 0x19, 0x35, 0x31, 0xfd, 0x8d, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x02, 0xdb, 0xa7, 0x65, 0x5a, 0x22, 0x96, 0x32, 0x4f, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xae, 0x26, 0x2b, 0x30, 0x2e, 0x38, 0x4c, 0x11, 0x96, 0x82, 0x82, 0x8e, 0x11, 0x6d, 0x58, 0x3e, 0x50, 0x10, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0xfd, 0xa1, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x57, 0x57, 0x2a, 0x27, 0x05, 0x36, 0x35, 0x3a, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x01, 0xf3, 0x4d, 0x56, 0x67, 0x04, 0xa1, 0x2b, 0x4e, 0x32, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x0f, 0x02, 0xe4, 0x00, 0x44, 0x00, 0x51, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x58, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x08, 0x84, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x42, 0x3a, 0x54, 0x38, 0x50, 0x18, 0xfc, 0x0f, 0x06, 0x24, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x25, 0x23, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x32, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xa0, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x05, 0xa0, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x67, 0x71, 0x89, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x8a, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0d, 0xfb, 0x3b, 0x05, 0xb5, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x37, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x8c, 0x6c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x05, 0xa0, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x4e, 0x00, 0x6e, 0x00, 0x27, 0x00, 0x7e, 0x04, 0x85, 0x00, 0x6e, 0x00, 0x02, 0x01, 0x33, 0x00, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf8, 0x05, 0x6b, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x21, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x05, 0x6b, 0x6f, 0x7f, 0xa4, 0x49, 0x30, 0x53, 0x33, 0x32, 0x50, 0x18, 0x7e, 0x79, 0x05, 0x42, 0x30, 0x31, 0x38, 0x4a, 0x35, 0xfe, 0xbc, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x03, 0x11, 0xfb, 0x6e, 0x05, 0x80, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x84, 0x32, 0x60, 0x35, 0x52, 0x2c, 0x24, 0x1e, 0x89, 0x01, 0x18, 0x30, 0x37, 0x3c, 0x2e, 0x36, 0x3b, 0x3d, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa4, 0xa1, 0x30, 0x39, 0x38, 0x31, 0xa1, 0x8d, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x67, 0x02, 0xe4, 0x00, 0x3a, 0x00, 0x46, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x07, 0x67, 0x6e, 0x82, 0x1f, 0x66, 0x45, 0x73, 0x8b, 0x0c, 0x10, 0x29, 0x49, 0x34, 0x61, 0x41, 0x67, 0x70, 0x8a, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x89, 0x2e, 0x28, 0x29, 0x2e, 0x01, 0x0f, 0x54, 0x4c, 0xfa, 0x9a, 0x07, 0x7c, 0xf0, 0xa7, 0x5b, 0x54, 0x02, 0x58, 0x4e, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x77, 0x01, 0x14, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x12, 0x12, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x80, 0x7d, 0x30, 0x39, 0x38, 0x31, 0x7d, 0x7d, 0x30, 0x39, 0x38, 0x31, 0x7d, 0x3c, 0x3f, 0x36, 0x6c, 0x6c, 0x4d, 0x50, 0x62, 0x0a, 0x4c, 0x5a, 0x60, 0x4b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x12, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x12, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x82, 0x34, 0x61, 0x41, 0x67, 0x71, 0x89, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x8a, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x41, 0x3e, 0x5b, 0x39, 0x56, 0x1a, 0xf9, 0xc5, 0x07, 0x27, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x22, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x37, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x36, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xaf, 0x05, 0x96, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x45, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x03, 0x11, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x05, 0x96, 0x6f, 0x7e, 0x94, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x45, 0x61, 0x03, 0x7f, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x23, 0x19, 0x4b, 0x2d, 0x5b, 0xfc, 0x70, 0x05, 0xab, 0xed, 0xb2, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0xe8, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x47, 0x46, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x19, 0x19, 0x5a, 0x6c, 0xfe, 0x65, 0x01, 0x2f, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x3a, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x21, 0x32, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x3a, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x75, 0x84, 0x0f, 0x0b, 0x35, 0x27, 0x52, 0x49, 0x30, 0x53, 0x34, 0x31, 0x50, 0x18, 0x7d, 0x78, 0x05, 0x42, 0x2f, 0x31, 0x38, 0x48, 0x36, 0x21, 0x01, 0x20, 0x7f, 0x36, 0x2f, 0x2c, 0xfc, 0xc8, 0x05, 0x4f, 0xf0, 0xa7, 0x58, 0x55, 0x09, 0x53, 0x4a, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x84, 0x76, 0x1f, 0x22, 0x30, 0x5f, 0x36, 0x51, 0x2c, 0x24, 0x1e, 0x8a, 0x01, 0x1a, 0x30, 0x38, 0x3a, 0x2d, 0x36, 0x3b, 0x67, 0x48, 0x0d, 0x44, 0x3a, 0x36, 0x6c, 0x6c, 0x4d, 0x55, 0x6c, 0x0d, 0x45, 0x4f, 0x60, 0x4b, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x1c, 0x04, 0xc3, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0x42, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x11, 0x89, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x5f, 0x4a, 0x6f, 0x05, 0xfc, 0x62, 0x04, 0xd8, 0xbc, 0x7b, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x36, 0x2d, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x31, 0x5b, 0x6c, 0x6c, 0xc8, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xee, 0x04, 0x5d, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0x0c, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4a, 0x71, 0x04, 0x6f, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x13, 0x19, 0x4b, 0x2c, 0x58, 0xfc, 0x84, 0x04, 0x72, 0x7a, 0xb2, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x40, 0x50, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x18, 0x18, 0x5c, 0x6c, 0x6c, 0xb7, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xfe, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x04, 0xfe, 0x6f, 0x80, 0x86, 0x49, 0x57, 0x4d, 0x49, 0x13, 0x27, 0x4b, 0x75, 0x43, 0x32, 0xb0, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x02, 0xa3, 0xfb, 0xdc, 0x05, 0x13, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x35, 0x69, 0x4b, 0x5c, 0x38, 0x38, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa7, 0xa4, 0x30, 0x39, 0x38, 0x31, 0xa4, 0x8a, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0xa1, 0x02, 0xe4, 0x00, 0x34, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x03, 0x3a, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x0b, 0x85, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x53, 0x48, 0x68, 0x32, 0xfc, 0x4a, 0x04, 0xb6, 0x01, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x2a, 0x24, 0x38, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x31, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x66, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x66, 0x6f, 0x81, 0x98, 0x24, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x15, 0x89, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x03, 0x0a, 0xfb, 0x75, 0x05, 0x7b, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2c, 0x39, 0x38, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x81, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x34, 0x2c, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x8c, 0x6c, 0xfd, 0xd9, 0x37, 0x2b, 0x2b, 0x37, 0x37, 0x2c, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xe9, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x34, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xe9, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0x09, 0x7e, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x3e, 0x21, 0x55, 0x31, 0x39, 0x57, 0x1d, 0xfb, 0xed, 0x04, 0xfe, 0xfe, 0x48, 0x2a, 0xed, 0x11, 0x24, 0x45, 0x30, 0x9c, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x25, 0x1f, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x1d, 0x1f, 0x2a, 0x24, 0x9e, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x24, 0x25, 0x28, 0x46, 0x2a, 0xc7, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x7b, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x2b, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x7b, 0x6f, 0x82, 0x96, 0x69, 0x61, 0x3d, 0x5d, 0x33, 0x18, 0x8b, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x02, 0x10, 0xfc, 0x6f, 0x05, 0x90, 0xf1, 0x96, 0x96, 0xfe, 0xf2, 0x47, 0x2b, 0x36, 0x2f, 0x24, 0x29, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x75, 0x42, 0x65, 0x6f, 0x2e, 0x54, 0x37, 0x36, 0x2a, 0x31, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x98, 0x95, 0x30, 0x39, 0x38, 0x31, 0x95, 0x99, 0x6c, 0x6c, 0x99, 0x6a, 0x2e, 0x27, 0x26, 0x2e, 0x33, 0x2c, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x30, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x33, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x30, 0x6e, 0x83, 0x1f, 0x65, 0x44, 0x74, 0x8a, 0x0c, 0x10, 0x2a, 0x49, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0e, 0x54, 0x4c, 0xfc, 0xd1, 0x05, 0x45, 0xf1, 0xa5, 0x5b, 0x55, 0x02, 0x58, 0x4e, 0x4e, 0x5f, 0x02, 0x78, 0xfd, 0x88, 0xb1, 0x27, 0x2d, 0x88, 0x77, 0x01, 0x14, 0x3f, 0x61, 0x37, 0x76, 0x61, 0x80, 0x7d, 0x30, 0x39, 0x38, 0x31, 0x7d, 0x3c, 0x3f, 0x36, 0x6c, 0x6c, 0x4d, 0x50, 0x62, 0x0a, 0x4c, 0x5a, 0x60, 0x4b, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x05, 0x30, 0x02, 0xe4, 0x00, 0x22, 0x01, 0x41, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x4e, 0x00, 0x6e, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xdb, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x38, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xdb, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x82, 0x34, 0x61, 0x41, 0x67, 0x71, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x41, 0x3e, 0x5b, 0x39, 0x56, 0x1a, 0xfb, 0xfc, 0x04, 0xf0, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x22, 0x37, 0x3f, 0x61, 0x37, 0x76, 0x61, 0xa5, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x36, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xaf, 0x05, 0x61, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x21, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x61, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x4b, 0x72, 0x13, 0x70, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x05, 0x76, 0xf0, 0xfd, 0x62, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x01, 0x1b, 0x0c, 0x7b, 0x59, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x4d, 0x44, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x6c, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x51, 0x59, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xaf, 0x05, 0x7b, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x3d, 0x00, 0x41, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x21, 0x01, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x7b, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x52, 0x6d, 0x0c, 0x6e, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x05, 0x90, 0xfc, 0xfb, 0x6e, 0x4d, 0x4c, 0xfe, 0x56, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x01, 0x23, 0x02, 0x26, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x54, 0x48, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0xfe, 0xa5, 0x43, 0xac, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x01, 0x2f, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xaf, 0x05, 0x21, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x21, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x57, 0x7b, 0x1f, 0x86, 0x1b, 0x58, 0x50, 0x5b, 0x35, 0x7a, 0x74, 0x04, 0x3a, 0x31, 0x2b, 0x2d, 0x37, 0x35, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x94, 0x05, 0x36, 0xfd, 0x3c, 0x02, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xc9, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x02, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x49, 0x42, 0x25, 0x37, 0x43, 0x55, 0x3e, 0x83, 0xfb, 0x26, 0x31, 0x2a, 0x1f, 0x27, 0x2b, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0xfe, 0x65, 0x1e, 0x10, 0x12, 0x26, 0x48, 0x4b, 0x36, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x01, 0x2f, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x06, 0x02, 0xe4, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x36, 0x35, 0x11, 0x21, 0x35, 0x21, 0x05, 0x06, 0x6f, 0x81, 0x1d, 0x5e, 0x3a, 0x4a, 0x6d, 0x12, 0x9a, 0x15, 0x74, 0x55, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x65, 0x7c, 0x06, 0x8f, 0x0e, 0x2b, 0x96, 0x01, 0x6f, 0x27, 0x35, 0x41, 0x47, 0x35, 0x41, 0x4e, 0xfb, 0xd5, 0x05, 0x1b, 0x02, 0x78, 0xfd, 0x88, 0xb0, 0x29, 0x2e, 0x49, 0x41, 0x4a, 0x56, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0x77, 0x62, 0x38, 0x21, 0x66, 0x66, 0x3e, 0x31, 0x33, 0x3a, 0x01, 0x5c, 0x48, 0x01, 0x0f, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x17, 0x05, 0x62, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x52, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x04, 0x9a, 0x3e, 0x49, 0x5b, 0xaa, 0x74, 0x98, 0xb6, 0x56, 0x0e, 0x79, 0x5d, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x5b, 0x77, 0x10, 0x8a, 0x1d, 0x2a, 0x2e, 0x39, 0xfd, 0x7f, 0x05, 0x77, 0xfe, 0xc1, 0xfe, 0xca, 0x64, 0x14, 0x12, 0x3a, 0x3c, 0x67, 0x65, 0x7b, 0x8c, 0x2f, 0x23, 0x21, 0x2e, 0x0f, 0x6b, 0x10, 0x46, 0x3a, 0x02, 0x78, 0x61, 0x11, 0x69, 0x51, 0x5e, 0x8c, 0x4b, 0x71, 0x6c, 0x0c, 0x57, 0x66, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0x61, 0x52, 0x19, 0x0c, 0x03, 0x0a, 0x46, 0x3f, 0x54, 0x6c, 0x6c, 0x4f, 0x60, 0x68, 0x36, 0x2b, 0x3c, 0x3f, 0x6b, 0x61, 0x33, 0x3c, 0x30, 0x2d, 0x24, 0x2f, 0x2b, 0x36, 0x46, 0x53, 0x0e, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x88, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x05, 0x88, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x53, 0x69, 0x13, 0x60, 0x0e, 0x79, 0x5d, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x5b, 0x77, 0x10, 0x59, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0d, 0xfb, 0x53, 0x05, 0x9d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x4d, 0x43, 0x57, 0x66, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0x61, 0x52, 0x7f, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x8c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf8, 0x05, 0x73, 0x02, 0xed, 0x00, 0x49, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x02, 0xe4, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x5d, 0x0e, 0x78, 0x5e, 0x61, 0x7c, 0x08, 0x7a, 0x09, 0x39, 0x2a, 0x37, 0x3c, 0x3d, 0x36, 0x2a, 0x39, 0x09, 0x7a, 0x08, 0x7b, 0x62, 0x5a, 0x77, 0x11, 0x5f, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x12, 0xfd, 0x6c, 0x03, 0x16, 0x21, 0x27, 0x64, 0x79, 0x93, 0x75, 0x02, 0x55, 0x6f, 0x83, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0x22, 0x57, 0x67, 0x68, 0x53, 0x22, 0x2c, 0x4a, 0x38, 0x36, 0x4a, 0x2d, 0x21, 0x54, 0x68, 0x60, 0x52, 0x2a, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x32, 0x28, 0x6c, 0x09, 0x73, 0x68, 0x71, 0x76, 0x01, 0xb9, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x08, 0x02, 0xb7, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x19, 0x50, 0x4c, 0x44, 0x49, 0x4a, 0x7b, 0x89, 0x82, 0x41, 0x52, 0x4c, 0x44, 0x49, 0x4a, 0x7b, 0x8b, 0x80, 0x54, 0x7e, 0x44, 0x38, 0x30, 0x32, 0x36, 0x41, 0x78, 0x50, 0x1a, 0xfe, 0x82, 0x02, 0xcc, 0xcf, 0x91, 0x01, 0xb8, 0x3b, 0x38, 0x34, 0x41, 0x46, 0x3b, 0x6f, 0x7f, 0x02, 0x02, 0x37, 0x3c, 0x34, 0x41, 0x47, 0x3b, 0x6f, 0x82, 0x38, 0x66, 0x44, 0x3c, 0x58, 0x19, 0x1c, 0x5c, 0x3b, 0x43, 0x63, 0x35, 0x53, 0x6c, 0x6c, 0xc0, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x09, 0x02, 0xb9, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x19, 0x50, 0x4c, 0x45, 0x47, 0x4c, 0x7b, 0x34, 0x32, 0x31, 0x37, 0x46, 0x7c, 0x4f, 0x4f, 0x7c, 0x46, 0x37, 0x31, 0x34, 0x34, 0x40, 0x78, 0x50, 0x1a, 0xfe, 0x81, 0x02, 0xce, 0xd0, 0x91, 0x45, 0x4d, 0x4d, 0x44, 0x44, 0x4d, 0x4d, 0x44, 0x01, 0xb8, 0x3b, 0x38, 0x34, 0x41, 0x46, 0x3b, 0x3e, 0x5f, 0x1c, 0x1a, 0x5a, 0x3d, 0x45, 0x65, 0x34, 0x34, 0x65, 0x45, 0x3d, 0x59, 0x1b, 0x1c, 0x5c, 0x3a, 0x43, 0x63, 0x35, 0x53, 0x6c, 0x6c, 0xc0, 0xfd, 0xbe, 0x3f, 0x37, 0x38, 0x3f, 0x3f, 0x38, 0x37, 0x3f, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x1f, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x21, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x21, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x05, 0x1f, 0x6f, 0x7f, 0x35, 0x71, 0x64, 0x7b, 0x01, 0x2f, 0x2e, 0x30, 0x36, 0x2a, 0xfe, 0x8b, 0x4a, 0x5e, 0x4f, 0x40, 0x40, 0x4e, 0x7a, 0x40, 0x76, 0x4f, 0x50, 0x7d, 0x47, 0x47, 0x83, 0x58, 0x05, 0xfe, 0x89, 0x05, 0x34, 0xfe, 0xc6, 0x4c, 0xfd, 0xaf, 0x00, 0xff, 0x66, 0x71, 0x4b, 0x45, 0x04, 0x40, 0x3b, 0x02, 0x78, 0xfd, 0x88, 0x86, 0x53, 0x7b, 0x74, 0x1a, 0x19, 0x1e, 0x24, 0x19, 0x4d, 0x48, 0x3f, 0x50, 0x4e, 0x3e, 0x4b, 0x72, 0x3f, 0x40, 0x74, 0x4b, 0x50, 0x74, 0x3e, 0x5b, 0x6c, 0xfd, 0xb1, 0x5b, 0x4f, 0x01, 0x39, 0x61, 0x4b, 0x4b, 0x34, 0x41, 0x06, 0x33, 0x3e, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xfe, 0xe9, 0x02, 0xa7, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x34, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x01, 0x18, 0x52, 0x4e, 0x47, 0x49, 0x50, 0x7b, 0x42, 0x76, 0x18, 0x4d, 0x33, 0x3d, 0x5a, 0x31, 0x30, 0x2a, 0x34, 0x37, 0x40, 0x77, 0x50, 0x1f, 0xfe, 0x7f, 0x02, 0xbc, 0xbc, 0x94, 0x31, 0x35, 0x3e, 0x43, 0x3f, 0x33, 0x36, 0x3d, 0x01, 0xb8, 0x3b, 0x38, 0x35, 0x40, 0x46, 0x3b, 0x6a, 0x3f, 0xfe, 0x41, 0x7f, 0x22, 0x26, 0x34, 0x5c, 0x39, 0x36, 0x58, 0x1a, 0x1c, 0x5f, 0x3d, 0x43, 0x63, 0x36, 0x53, 0x6c, 0x6c, 0xc0, 0xfe, 0xa9, 0x3d, 0x33, 0x31, 0x3c, 0x42, 0x2d, 0x79, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x09, 0x02, 0xb3, 0x02, 0xe4, 0x00, 0x20, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x06, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x92, 0x5d, 0x72, 0x31, 0x2d, 0x2c, 0x32, 0x45, 0x7a, 0x4e, 0x4e, 0x7a, 0x46, 0x32, 0x2c, 0x2d, 0x31, 0x71, 0x5c, 0xfe, 0xd8, 0x02, 0xc8, 0xd2, 0x4b, 0x42, 0x42, 0x4c, 0x4c, 0x42, 0x42, 0x4b, 0x4b, 0x4b, 0x4b, 0x42, 0x42, 0x4c, 0x4c, 0x42, 0x02, 0x78, 0x54, 0x0e, 0x71, 0x5e, 0x3c, 0x5b, 0x1d, 0x1b, 0x57, 0x3a, 0x45, 0x65, 0x34, 0x34, 0x65, 0x45, 0x3a, 0x57, 0x1b, 0x1d, 0x5b, 0x3c, 0x5d, 0x71, 0x0f, 0x54, 0x6c, 0x6c, 0xf9, 0x40, 0x40, 0x38, 0x38, 0x40, 0x40, 0x38, 0xfe, 0x2e, 0x3f, 0x38, 0x38, 0x40, 0x40, 0x38, 0x37, 0x40, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x28, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x34, 0x00, 0x40, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x23, 0x23, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x21, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x28, 0x6f, 0x7e, 0x35, 0x72, 0x64, 0x7a, 0x01, 0x2e, 0x2e, 0x30, 0x5d, 0xbc, 0x1b, 0x1c, 0x46, 0x7c, 0x4f, 0x4e, 0x7e, 0x49, 0x77, 0x5d, 0xfe, 0xdc, 0x05, 0x3d, 0xfe, 0xc6, 0x4d, 0xfd, 0x54, 0x01, 0x5a, 0x66, 0x71, 0x4b, 0x45, 0x04, 0x3f, 0x3b, 0xfd, 0xe5, 0x53, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x02, 0x78, 0xfd, 0x88, 0x91, 0x53, 0x77, 0x71, 0x11, 0x09, 0x19, 0x1e, 0x3d, 0x1e, 0x4e, 0x2d, 0x48, 0x70, 0x3f, 0x3e, 0x74, 0x4c, 0x65, 0x81, 0x12, 0x5e, 0x6c, 0xfd, 0xbb, 0x5a, 0x4f, 0x01, 0x30, 0x60, 0x4a, 0x49, 0x34, 0x41, 0x06, 0x30, 0x3b, 0x0f, 0x52, 0x40, 0x40, 0x51, 0x51, 0x40, 0x40, 0x52, 0x00, 0x03, 0xff, 0xeb, 0xfe, 0xf2, 0x02, 0xb1, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x06, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0x36, 0x35, 0x35, 0x06, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x96, 0x5c, 0x71, 0x3a, 0x78, 0x17, 0x4c, 0x32, 0x3c, 0x5a, 0x30, 0x2d, 0x28, 0x30, 0x35, 0x72, 0x5e, 0xfe, 0xd5, 0x02, 0xc6, 0xcd, 0x4b, 0x42, 0x44, 0x4d, 0x4d, 0x43, 0x42, 0x4c, 0x70, 0x3d, 0x2e, 0x31, 0x3d, 0x45, 0x3c, 0x31, 0x02, 0x78, 0x4f, 0x0f, 0x71, 0x5e, 0x5c, 0x3a, 0xfe, 0x3d, 0x7e, 0x22, 0x26, 0x34, 0x5d, 0x3b, 0x37, 0x54, 0x19, 0x1c, 0x5d, 0x3d, 0x5d, 0x6f, 0x0f, 0x4f, 0x6c, 0x6c, 0xf5, 0x40, 0x40, 0x38, 0x38, 0x40, 0x40, 0x38, 0xfe, 0x40, 0x43, 0x2d, 0x79, 0x0b, 0x3a, 0x36, 0x32, 0x3c, 0x00, 0x01, 0xff, 0xeb, 0xfe, 0xb4, 0x02, 0x5b, 0x02, 0xe4, 0x00, 0x44, 0x00, 0x00, 0x12, 0x15, 0x14, 0x16, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xd3, 0x33, 0x33, 0x6b, 0x71, 0x76, 0x6d, 0x34, 0x32, 0x34, 0x35, 0x6e, 0x72, 0x70, 0x67, 0x6c, 0x89, 0x04, 0x7b, 0x02, 0x41, 0x3a, 0x2f, 0x30, 0x3e, 0x38, 0x64, 0x6e, 0x46, 0x27, 0x2e, 0x7b, 0x02, 0x42, 0x39, 0x2f, 0x30, 0x40, 0x37, 0x63, 0x6e, 0x63, 0x4e, 0x59, 0xfe, 0x8d, 0x02, 0x70, 0x85, 0xb3, 0x01, 0xd4, 0x35, 0x1d, 0x13, 0x41, 0x52, 0x48, 0x50, 0x19, 0x1b, 0x1e, 0x12, 0x41, 0x53, 0x48, 0x50, 0x58, 0x51, 0x26, 0x2f, 0x23, 0x20, 0x29, 0x1b, 0x39, 0x45, 0x46, 0x1f, 0x13, 0x40, 0x28, 0x25, 0x2e, 0x23, 0x20, 0x27, 0x1b, 0x3c, 0x48, 0x43, 0x43, 0x4f, 0x6c, 0x6c, 0xa4, 0x00, 0x00, 0x01, 0xff, 0xf2, 0xfe, 0xbd, 0x02, 0x51, 0x02, 0xe4, 0x00, 0x4a, 0x00, 0x00, 0x12, 0x15, 0x14, 0x16, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xd1, 0x32, 0x33, 0x6b, 0x73, 0x68, 0x68, 0x4e, 0x63, 0x5a, 0x54, 0x3e, 0x4b, 0x23, 0x20, 0x1d, 0x22, 0x03, 0x55, 0x04, 0x53, 0x46, 0x4e, 0x59, 0x7c, 0x72, 0x52, 0x81, 0x4b, 0x42, 0x3b, 0x2c, 0x34, 0x7b, 0x02, 0x42, 0x39, 0x2e, 0x31, 0x3f, 0x37, 0x64, 0x6d, 0x62, 0x4e, 0x59, 0xfe, 0x96, 0x02, 0x5f, 0x7d, 0xb3, 0x01, 0xd4, 0x35, 0x1d, 0x13, 0x41, 0x52, 0x45, 0x4b, 0x09, 0x05, 0x50, 0x4a, 0x42, 0x50, 0x2e, 0x29, 0x1d, 0x24, 0x1d, 0x19, 0x09, 0x07, 0x16, 0x0b, 0x3a, 0x40, 0x52, 0x42, 0x51, 0x5d, 0x36, 0x6a, 0x4b, 0x48, 0x64, 0x19, 0x13, 0x42, 0x2b, 0x25, 0x2e, 0x24, 0x1f, 0x27, 0x1b, 0x3c, 0x48, 0x43, 0x43, 0x4f, 0x6c, 0x6c, 0xa4, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xee, 0x04, 0xc0, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x48, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x35, 0x34, 0x26, 0x23, 0x21, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x04, 0xc0, 0x6e, 0x7f, 0x35, 0x71, 0x64, 0x7a, 0x01, 0x29, 0x63, 0x3b, 0x29, 0xfe, 0xa9, 0x25, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x58, 0xfe, 0x94, 0x04, 0xd5, 0xfe, 0xc7, 0x4c, 0xfe, 0x00, 0xaf, 0x69, 0x6e, 0x4c, 0x45, 0x04, 0x3f, 0x3c, 0x02, 0x78, 0xfd, 0x88, 0x91, 0x53, 0x77, 0x73, 0x10, 0x09, 0x3d, 0x26, 0x1d, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0xfd, 0xbb, 0x5a, 0x4f, 0x01, 0x30, 0x5e, 0x49, 0x4a, 0x35, 0x41, 0x06, 0x30, 0x3c, 0x00, 0x02, 0xff, 0xeb, 0xfe, 0xc7, 0x02, 0x67, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x16, 0x16, 0x15, 0x14, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x36, 0x35, 0x35, 0x06, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x00, 0xff, 0x2e, 0x1e, 0x2a, 0x31, 0x61, 0x69, 0x23, 0x6c, 0x17, 0x45, 0x2b, 0x52, 0x66, 0x33, 0x2c, 0x2d, 0x35, 0x7b, 0x02, 0x43, 0x38, 0x2f, 0x30, 0x41, 0x3e, 0xc8, 0x62, 0x4e, 0x59, 0xfe, 0x8f, 0x02, 0x7c, 0x93, 0xb3, 0x2c, 0x38, 0x21, 0x27, 0x41, 0x48, 0x3b, 0x2d, 0x01, 0xd4, 0x18, 0x1f, 0x18, 0x15, 0x05, 0x01, 0x04, 0x46, 0x4e, 0x3a, 0x26, 0xfe, 0x55, 0x7b, 0x1b, 0x1d, 0x63, 0x50, 0x35, 0x51, 0x15, 0x15, 0x48, 0x2b, 0x23, 0x2f, 0x24, 0x21, 0x2a, 0x1c, 0x8a, 0x43, 0x43, 0x4f, 0x6c, 0x6c, 0xa4, 0xfd, 0x91, 0x39, 0x26, 0x7a, 0x06, 0x38, 0x36, 0x2e, 0x37, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xfe, 0xbe, 0x02, 0xb7, 0x02, 0xe4, 0x00, 0x51, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x31, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x31, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x26, 0x67, 0x5e, 0x57, 0x42, 0x50, 0x25, 0x22, 0x1f, 0x24, 0x03, 0x56, 0x03, 0x55, 0x49, 0x51, 0x59, 0x3c, 0x6e, 0x48, 0x52, 0x6b, 0x5e, 0x57, 0x42, 0x50, 0x25, 0x22, 0x1f, 0x24, 0x03, 0x56, 0x03, 0x55, 0x48, 0x4f, 0x5c, 0x83, 0x79, 0x55, 0x87, 0x4d, 0x42, 0x3b, 0x3b, 0x42, 0x44, 0x79, 0x4c, 0x2a, 0xfe, 0x6f, 0x02, 0xcc, 0xcc, 0x74, 0x01, 0xdb, 0x52, 0x4c, 0x46, 0x55, 0x2f, 0x29, 0x1d, 0x23, 0x1e, 0x18, 0x08, 0x08, 0x21, 0x3a, 0x40, 0x51, 0x43, 0x35, 0x4f, 0x2a, 0x53, 0x4d, 0x46, 0x53, 0x2e, 0x29, 0x1d, 0x23, 0x1e, 0x18, 0x0a, 0x07, 0x21, 0x3a, 0x41, 0x52, 0x42, 0x51, 0x5d, 0x38, 0x6c, 0x4b, 0x47, 0x65, 0x1c, 0x1f, 0x68, 0x46, 0x4a, 0x6b, 0x36, 0x4b, 0x6c, 0x6c, 0x9d, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xfe, 0x05, 0x2a, 0x02, 0xe4, 0x00, 0x3c, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x16, 0x36, 0x35, 0x34, 0x23, 0x21, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x33, 0x32, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x05, 0x2a, 0x6d, 0x7f, 0x35, 0x71, 0x64, 0x7b, 0x01, 0x26, 0x2f, 0x38, 0x65, 0xfe, 0xa6, 0x5c, 0x74, 0x66, 0x5a, 0x3e, 0x51, 0x29, 0x1f, 0x1c, 0x26, 0x03, 0x5d, 0x04, 0x5c, 0x49, 0x52, 0x5f, 0x87, 0x79, 0x59, 0x8f, 0x52, 0x4c, 0x84, 0x54, 0x1b, 0xfe, 0x71, 0x05, 0x3f, 0xfe, 0xc7, 0x4d, 0xfd, 0xb6, 0xfc, 0xd3, 0x4e, 0x42, 0x04, 0x3f, 0x3b, 0x02, 0x78, 0xfd, 0x88, 0x8f, 0x51, 0x7a, 0x74, 0x12, 0x08, 0x02, 0x1f, 0x21, 0x46, 0x60, 0x5a, 0x50, 0x65, 0x3a, 0x31, 0x20, 0x2a, 0x23, 0x1c, 0x0a, 0x08, 0x18, 0x0c, 0x41, 0x49, 0x5c, 0x4b, 0x5d, 0x6b, 0x43, 0x7e, 0x55, 0x57, 0x7a, 0x3e, 0x55, 0x6c, 0xfd, 0xbb, 0x56, 0x4b, 0x01, 0x38, 0x58, 0x94, 0x3a, 0x3e, 0x05, 0x32, 0x3e, 0x00, 0x02, 0xff, 0xeb, 0xfe, 0xc7, 0x02, 0xa0, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x45, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x31, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x01, 0x26, 0x67, 0x5e, 0x57, 0x3e, 0x4b, 0x22, 0x1e, 0x1e, 0x23, 0x03, 0x56, 0x03, 0x54, 0x48, 0x4d, 0x56, 0x23, 0x21, 0x6c, 0x16, 0x49, 0x30, 0x3b, 0x5a, 0x30, 0x33, 0x2d, 0x38, 0x40, 0x44, 0x79, 0x4c, 0x26, 0xfe, 0x73, 0x02, 0xb5, 0xb9, 0x70, 0x1b, 0x22, 0x47, 0x4f, 0x3c, 0x2f, 0x35, 0x3b, 0x01, 0xdb, 0x52, 0x4c, 0x46, 0x55, 0x30, 0x29, 0x1c, 0x23, 0x1e, 0x18, 0x08, 0x08, 0x21, 0x3a, 0x40, 0x50, 0x42, 0x29, 0x42, 0x17, 0xfe, 0x4c, 0x94, 0x22, 0x24, 0x30, 0x56, 0x36, 0x37, 0x53, 0x17, 0x1e, 0x6a, 0x48, 0x4a, 0x6b, 0x36, 0x4b, 0x6c, 0x6c, 0x9d, 0xfe, 0x72, 0x37, 0x37, 0x2f, 0x38, 0x44, 0x2d, 0x69, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x1c, 0x04, 0xc1, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x30, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x25, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x40, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x47, 0x83, 0x58, 0x05, 0xfe, 0x71, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x04, 0xd6, 0xbc, 0x7b, 0xfd, 0xef, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x50, 0x74, 0x3e, 0x5b, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xc8, 0xc8, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x24, 0x04, 0xe7, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x15, 0x21, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0xc1, 0x5e, 0x79, 0x49, 0x7e, 0x4f, 0x4e, 0x7e, 0x49, 0x77, 0x5d, 0xfe, 0xb7, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x04, 0xfc, 0xfc, 0x92, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x9f, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x4c, 0x74, 0x3e, 0x3e, 0x74, 0x4c, 0x65, 0x81, 0x12, 0x5e, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x06, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xee, 0x04, 0x7b, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x3b, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x25, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x2a, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x58, 0xfe, 0x73, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x04, 0x90, 0x7a, 0xb2, 0xfe, 0x2a, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xb7, 0xb7, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xfe, 0x04, 0xd2, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x3f, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x25, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x60, 0x74, 0x66, 0x5a, 0x3e, 0x51, 0x29, 0x1f, 0x1c, 0x26, 0x03, 0x5d, 0x04, 0x5c, 0x49, 0x52, 0x5f, 0x87, 0x79, 0x59, 0x8f, 0x52, 0x4c, 0x84, 0x54, 0x1b, 0xfe, 0x4a, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x04, 0xe7, 0xaa, 0x6c, 0xfd, 0xbd, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x01, 0xca, 0x60, 0x5a, 0x50, 0x65, 0x3a, 0x31, 0x20, 0x2a, 0x23, 0x1c, 0x0a, 0x08, 0x18, 0x0c, 0x41, 0x49, 0x5c, 0x4b, 0x5d, 0x6b, 0x43, 0x7e, 0x55, 0x57, 0x7a, 0x3e, 0x55, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xae, 0xae, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xae, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xae, 0x6f, 0x81, 0x9d, 0x6d, 0x65, 0x64, 0x6d, 0x86, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x05, 0xc3, 0xfb, 0xcb, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x29, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x01, 0x10, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x72, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x72, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x84, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x05, 0x87, 0xfc, 0x07, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x03, 0x08, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x01, 0x10, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x20, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x20, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x80, 0x8d, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xef, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x05, 0x35, 0xfc, 0x59, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0xb7, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x01, 0x10, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xe3, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x11, 0x23, 0x35, 0x21, 0x05, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xe3, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x38, 0x67, 0x43, 0x39, 0x56, 0x1a, 0xfe, 0x01, 0x6d, 0x65, 0x64, 0x6d, 0x6a, 0x04, 0xf8, 0xfc, 0x96, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0x22, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x2c, 0x27, 0xa9, 0xfe, 0xfc, 0x5f, 0x76, 0x78, 0x5d, 0x01, 0x04, 0x6c, 0x6c, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0xb6, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x64, 0x02, 0xe4, 0x00, 0x41, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xad, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x08, 0x65, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xab, 0x3a, 0x54, 0x38, 0x50, 0x18, 0xfc, 0xba, 0x05, 0x79, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x24, 0x23, 0x46, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7a, 0x7b, 0x32, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x48, 0x02, 0xe4, 0x00, 0x37, 0x00, 0x43, 0x00, 0x4e, 0x00, 0x5b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x48, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x51, 0x77, 0x41, 0x03, 0x08, 0x32, 0x2a, 0x38, 0x39, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x08, 0x65, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xab, 0x3a, 0x54, 0x38, 0x50, 0x18, 0xfc, 0xba, 0x07, 0x5d, 0xfd, 0x38, 0x51, 0x15, 0x27, 0x25, 0xfe, 0x7b, 0x16, 0x4e, 0x36, 0x02, 0x11, 0xa7, 0xaf, 0x5a, 0x4e, 0x4e, 0x60, 0xfc, 0x86, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x41, 0x74, 0x4d, 0x22, 0x2e, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x24, 0x23, 0x46, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7a, 0x7b, 0x32, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x36, 0x2e, 0x10, 0x42, 0x34, 0x3f, 0xb1, 0x26, 0x2a, 0x61, 0x56, 0xb2, 0x0e, 0x43, 0x56, 0x60, 0x4b, 0xbb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xd2, 0x05, 0x64, 0x02, 0xe4, 0x00, 0x42, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xad, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x39, 0x02, 0x7c, 0x07, 0x0b, 0xaf, 0x8b, 0x82, 0x4d, 0x5f, 0x08, 0x65, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xab, 0x3a, 0x54, 0x38, 0x50, 0x18, 0xfc, 0xba, 0x05, 0x79, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa9, 0x0d, 0x0b, 0xbf, 0x89, 0x0c, 0x77, 0x58, 0x24, 0x23, 0x46, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7a, 0x7b, 0x32, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x00, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x46, 0x00, 0x54, 0x00, 0x61, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x00, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x09, 0x66, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xae, 0x38, 0x53, 0x38, 0x50, 0x18, 0xfc, 0xba, 0x07, 0x15, 0xfd, 0x93, 0x32, 0x1f, 0x54, 0x33, 0x39, 0x56, 0x1a, 0xfd, 0x99, 0x15, 0x4c, 0x35, 0x01, 0x75, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0x51, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x0c, 0x2f, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x27, 0x22, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x30, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x38, 0x20, 0x23, 0x2c, 0x27, 0xa9, 0xae, 0x24, 0x29, 0xfe, 0x9b, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x07, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xc4, 0x04, 0xee, 0x02, 0xee, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x21, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x33, 0x11, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x04, 0xee, 0x6f, 0x7c, 0xfe, 0xd2, 0x2b, 0x33, 0x20, 0x34, 0x29, 0x2d, 0x35, 0x6b, 0x76, 0x11, 0x44, 0x2f, 0x50, 0x65, 0x47, 0x44, 0x3f, 0x4a, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x40, 0x6e, 0x46, 0x56, 0x6e, 0x18, 0x20, 0x42, 0x38, 0x48, 0x0d, 0xfd, 0xf1, 0x02, 0x8e, 0x1f, 0x2a, 0x55, 0x71, 0x37, 0xb2, 0xfe, 0x5e, 0x42, 0x37, 0x20, 0x23, 0x35, 0x2a, 0x27, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x64, 0x14, 0x1f, 0x2d, 0x20, 0x26, 0x34, 0x3c, 0x29, 0xfe, 0xd5, 0x9b, 0x1a, 0x26, 0x5e, 0x4c, 0x1b, 0x40, 0x5b, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x50, 0x6f, 0x38, 0x5a, 0x49, 0x1f, 0x21, 0x11, 0x54, 0x41, 0x25, 0x22, 0x6c, 0x0a, 0x5c, 0x52, 0x49, 0x35, 0x01, 0x22, 0xe8, 0x37, 0x02, 0x14, 0x30, 0x20, 0x26, 0x32, 0x2f, 0x28, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xfb, 0x05, 0x5b, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x41, 0x00, 0x4d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x5b, 0x6e, 0x81, 0x2c, 0x56, 0x0c, 0x14, 0x23, 0x72, 0x4e, 0x7d, 0x90, 0x09, 0x40, 0x3c, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x52, 0x6f, 0x1d, 0x2a, 0x2a, 0xfd, 0x6b, 0x05, 0x70, 0xfd, 0xe3, 0x29, 0x1e, 0x20, 0x32, 0x58, 0x37, 0x56, 0x2c, 0xfe, 0x96, 0x5b, 0x4d, 0x4d, 0x44, 0x01, 0x4c, 0x35, 0x33, 0x33, 0x2d, 0x3d, 0x3b, 0x2f, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x3a, 0x02, 0x3a, 0x46, 0x8d, 0x80, 0x23, 0x23, 0x31, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x34, 0x2e, 0x0b, 0x3f, 0x39, 0x66, 0x6c, 0xfd, 0x86, 0x41, 0x1c, 0x50, 0x31, 0x3b, 0x5d, 0x34, 0x3b, 0x9f, 0x77, 0x65, 0x69, 0x06, 0x34, 0x40, 0x4f, 0x72, 0x3f, 0x2c, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x76, 0x05, 0x5b, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x07, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x5b, 0x6e, 0x81, 0x2c, 0x56, 0x11, 0x11, 0x0e, 0x13, 0xbd, 0x8a, 0x78, 0x76, 0x88, 0x09, 0x40, 0x3c, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x52, 0x6f, 0x1d, 0x2a, 0x2a, 0xfd, 0x6b, 0x05, 0x70, 0xfd, 0xe3, 0x29, 0x1e, 0x20, 0x32, 0x58, 0x37, 0x56, 0x2c, 0xfe, 0x96, 0x5b, 0x4d, 0x4d, 0x44, 0x01, 0x4c, 0x35, 0x33, 0x33, 0x2d, 0x3d, 0x3b, 0x2f, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x3a, 0x03, 0x18, 0x15, 0xd9, 0x07, 0x83, 0x05, 0x8a, 0x79, 0x23, 0x23, 0x31, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x34, 0x2e, 0x0b, 0x3f, 0x39, 0x66, 0x6c, 0xfd, 0x86, 0x41, 0x1c, 0x50, 0x31, 0x3b, 0x5d, 0x34, 0x3b, 0x9f, 0x77, 0x65, 0x69, 0x06, 0x34, 0x40, 0x4f, 0x72, 0x3f, 0x2c, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x05, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x03, 0x05, 0x6f, 0x81, 0x85, 0x4a, 0x56, 0x4d, 0x49, 0x12, 0x27, 0x4a, 0x75, 0x43, 0x3d, 0x92, 0x01, 0xfb, 0xfd, 0xd6, 0x03, 0x1a, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x4a, 0x46, 0x40, 0x48, 0x65, 0x35, 0x66, 0x47, 0x64, 0x3a, 0x6c, 0x8a, 0x6c, 0x00, 0x00, 0x02, 0xff, 0xe1, 0x00, 0x00, 0x04, 0xa9, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x35, 0x21, 0x32, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x04, 0xa9, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x76, 0x8b, 0x0a, 0x0c, 0x32, 0x33, 0x42, 0x4b, 0x4d, 0x49, 0x12, 0x27, 0x4a, 0x75, 0x43, 0x34, 0x89, 0x01, 0x5c, 0x81, 0x3d, 0x36, 0x32, 0xfd, 0x4f, 0x04, 0xc8, 0xf0, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x33, 0x4f, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x81, 0x70, 0x1c, 0x22, 0x47, 0x44, 0x40, 0x49, 0x65, 0x35, 0x66, 0x47, 0x62, 0x37, 0x6c, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x56, 0x67, 0x08, 0x04, 0x45, 0x54, 0x2c, 0x4d, 0x32, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x65, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x37, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x65, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x66, 0x4a, 0x56, 0x4d, 0x49, 0x12, 0x27, 0x4a, 0x75, 0x43, 0x3d, 0x92, 0x02, 0x20, 0x3c, 0x5a, 0x39, 0x56, 0x1a, 0xfc, 0x72, 0x04, 0x7a, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x23, 0x4a, 0x46, 0x40, 0x48, 0x65, 0x35, 0x66, 0x47, 0x64, 0x3a, 0x6c, 0x34, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xab, 0x02, 0xed, 0x00, 0x41, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x04, 0xab, 0x6f, 0x81, 0x18, 0x73, 0x51, 0x76, 0x94, 0x0c, 0x76, 0x47, 0x4e, 0x49, 0x44, 0x1c, 0x2b, 0x73, 0x8e, 0x96, 0x7c, 0xdf, 0x56, 0x65, 0x29, 0x24, 0x26, 0x2d, 0x04, 0x74, 0x04, 0x0d, 0xfe, 0x0b, 0x02, 0x6d, 0x20, 0x23, 0x3a, 0x5b, 0x32, 0x87, 0x7d, 0x1a, 0x03, 0x57, 0x54, 0x38, 0x5b, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x30, 0x43, 0x84, 0x73, 0x3a, 0x38, 0x38, 0x3f, 0x65, 0x70, 0x6f, 0x6d, 0x6b, 0x36, 0x41, 0x22, 0x2d, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x28, 0x25, 0x6c, 0x09, 0x30, 0x58, 0x39, 0x62, 0x6d, 0x44, 0x55, 0x30, 0x5e, 0x41, 0x01, 0x51, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xb6, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xb6, 0x6f, 0x81, 0x98, 0x24, 0x36, 0x5d, 0x38, 0x3c, 0x63, 0x3a, 0x14, 0x64, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x02, 0x6e, 0xfc, 0x25, 0x04, 0xcb, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2c, 0x3a, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x83, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x35, 0x2a, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0xfd, 0xdb, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x7d, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x47, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x7d, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x73, 0x8a, 0x0c, 0x8d, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x15, 0x67, 0x4b, 0x53, 0x4b, 0x45, 0x19, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x02, 0x6f, 0x55, 0x4b, 0xfb, 0x84, 0x06, 0x92, 0xf0, 0xa7, 0x5b, 0x56, 0x08, 0x59, 0x49, 0x4e, 0x60, 0xfd, 0x26, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x38, 0x28, 0x3d, 0x3d, 0x3b, 0x44, 0x65, 0x75, 0x74, 0x72, 0x71, 0x37, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x4f, 0x63, 0x0a, 0x4b, 0x5b, 0x5f, 0x4c, 0xd5, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x17, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x27, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x17, 0x6f, 0x80, 0x35, 0x67, 0x5f, 0x70, 0x0b, 0x54, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x58, 0xfe, 0x3b, 0x04, 0x2c, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x71, 0x60, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0x17, 0x02, 0xe4, 0x00, 0x20, 0x00, 0x29, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x17, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x53, 0x61, 0x0a, 0x55, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x58, 0xfe, 0x3b, 0x04, 0x2c, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x08, 0x6b, 0x57, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x02, 0x06, 0x6f, 0x02, 0xe4, 0x00, 0x43, 0x00, 0x56, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x05, 0x9a, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x5e, 0x7b, 0x16, 0x34, 0x49, 0x64, 0x75, 0x0b, 0x55, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x58, 0xfe, 0x3b, 0x06, 0x84, 0xfe, 0x37, 0x41, 0x34, 0xfd, 0x17, 0x39, 0x3b, 0x26, 0x34, 0x0d, 0x0f, 0x76, 0x53, 0x45, 0x55, 0x13, 0x03, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x59, 0x4c, 0x23, 0x71, 0x60, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x6c, 0xb4, 0x40, 0x0b, 0x69, 0xcc, 0x44, 0x4d, 0x25, 0x20, 0x56, 0x5d, 0x46, 0x37, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x54, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x41, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x97, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x5d, 0x6c, 0x09, 0x54, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0x58, 0xfe, 0x3b, 0x05, 0x69, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x71, 0x60, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xcd, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x27, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xcd, 0x6f, 0x81, 0x96, 0x69, 0x62, 0x5d, 0x71, 0x0f, 0x5f, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x75, 0x8f, 0x9e, 0x7f, 0x01, 0x76, 0xfd, 0x1d, 0x04, 0xe2, 0xf0, 0x96, 0x96, 0xfe, 0xf1, 0x47, 0x2b, 0x36, 0x30, 0x24, 0x29, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x6b, 0x3a, 0x68, 0x74, 0x6a, 0x57, 0x2e, 0x22, 0x3f, 0x3d, 0x3d, 0x46, 0x65, 0x76, 0x74, 0x75, 0x74, 0xa3, 0x6c, 0x6c, 0xa3, 0x6a, 0x2e, 0x27, 0x26, 0x2e, 0x37, 0x31, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x94, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x30, 0x00, 0x3c, 0x00, 0x47, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x94, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x0f, 0x69, 0x46, 0x51, 0x49, 0x45, 0x1b, 0x28, 0x75, 0x8f, 0x9b, 0x7c, 0x01, 0x7e, 0xfd, 0x1b, 0x06, 0xa9, 0xfc, 0xb4, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0x2c, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x2f, 0x22, 0x3c, 0x3b, 0x39, 0x40, 0x65, 0x72, 0x71, 0x70, 0x71, 0xb2, 0x6c, 0xfe, 0xe2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x19, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x7f, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x7f, 0x6f, 0x80, 0x1e, 0x67, 0x45, 0x77, 0x8c, 0x09, 0x18, 0x59, 0x43, 0x48, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x90, 0x77, 0x80, 0x3f, 0x36, 0x32, 0xfd, 0x82, 0x04, 0x94, 0xef, 0xa8, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x61, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x81, 0x71, 0x3d, 0x48, 0x44, 0x42, 0x4a, 0x66, 0x7c, 0x7a, 0x7a, 0x7c, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x56, 0x68, 0x08, 0x03, 0x45, 0x54, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa4, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x07, 0x23, 0x35, 0x01, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xa4, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x5c, 0x7f, 0x1c, 0xe3, 0xa8, 0x01, 0x76, 0x14, 0x48, 0x2c, 0x42, 0x56, 0x81, 0x43, 0x7c, 0x52, 0x4b, 0x7d, 0x26, 0x2a, 0x27, 0xfd, 0x5e, 0x04, 0xb9, 0xf0, 0xa7, 0x55, 0x57, 0x03, 0x01, 0x58, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0x9b, 0x29, 0x2d, 0x50, 0x48, 0xdd, 0x06, 0x01, 0x52, 0x07, 0x20, 0x26, 0x4e, 0x46, 0x49, 0x72, 0x40, 0x3d, 0x37, 0x0e, 0x44, 0x37, 0x57, 0x6c, 0x6c, 0x6f, 0x55, 0x63, 0x08, 0x03, 0x44, 0x52, 0x5f, 0x4c, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x02, 0x05, 0x1e, 0x02, 0xe4, 0x00, 0x4a, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x49, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x0c, 0x65, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xbb, 0x35, 0x4c, 0x45, 0x55, 0x13, 0x03, 0x11, 0x41, 0x34, 0xfc, 0x21, 0x05, 0x33, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x31, 0x27, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x25, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x34, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x34, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x67, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x9e, 0x7f, 0xb1, 0x3c, 0x5a, 0x39, 0x56, 0x1a, 0xfc, 0xa3, 0x04, 0x49, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x23, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x34, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xe6, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0xe6, 0x6f, 0x82, 0xfe, 0x69, 0x2b, 0x29, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x1b, 0x3e, 0x30, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x50, 0x6e, 0x1f, 0x05, 0x4f, 0x4a, 0xfd, 0x22, 0x04, 0xfb, 0xf1, 0xab, 0x24, 0xcf, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x36, 0x6b, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x46, 0x18, 0x2f, 0x21, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x32, 0x2c, 0x4d, 0x44, 0x54, 0x6c, 0x6c, 0x54, 0x4d, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0xe2, 0x02, 0xe4, 0x00, 0x43, 0x00, 0x4d, 0x00, 0x59, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xe2, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x01, 0xfe, 0x83, 0x2b, 0x29, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x1b, 0x3e, 0x30, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x50, 0x6e, 0x1f, 0x05, 0x4f, 0x4a, 0xfd, 0x22, 0x06, 0xf7, 0xf0, 0xfd, 0x58, 0x24, 0xd9, 0x1e, 0x63, 0x3d, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x0b, 0x06, 0x6b, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x46, 0x18, 0x2f, 0x21, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x32, 0x2c, 0x4d, 0x44, 0x54, 0x6c, 0x6c, 0x54, 0x4d, 0x37, 0x29, 0x2a, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x9d, 0x02, 0xe4, 0x00, 0x3c, 0x00, 0x45, 0x00, 0x51, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x15, 0x14, 0x07, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x9d, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x76, 0x8b, 0x0a, 0xfe, 0x85, 0x2b, 0x29, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x1b, 0x3e, 0x30, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x50, 0x6e, 0x1f, 0x05, 0x4f, 0x4a, 0xfd, 0x22, 0x06, 0xb2, 0xfc, 0xad, 0x24, 0xc1, 0x55, 0x4b, 0x01, 0x26, 0xa7, 0x5a, 0x54, 0x58, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xa3, 0x28, 0x2d, 0x7b, 0x6d, 0x6b, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x46, 0x18, 0x2f, 0x21, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x32, 0x2c, 0x4d, 0x44, 0x54, 0x6c, 0x6c, 0x54, 0x4d, 0x37, 0x40, 0x46, 0x52, 0x69, 0x54, 0x65, 0x08, 0x43, 0x52, 0x60, 0x4b, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x4b, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x49, 0x00, 0x57, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x4b, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x65, 0x38, 0x01, 0xfe, 0x8a, 0x2b, 0x29, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x1b, 0x3e, 0x30, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x48, 0x7c, 0x4f, 0x50, 0x6e, 0x1f, 0x05, 0x4f, 0x4a, 0xfd, 0x22, 0x06, 0x60, 0xfc, 0xff, 0x24, 0xc2, 0x19, 0x6c, 0x49, 0x39, 0x56, 0x1a, 0xfd, 0xeb, 0x01, 0xb9, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3c, 0x6a, 0x45, 0x6b, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x46, 0x18, 0x2f, 0x21, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x52, 0x71, 0x37, 0x32, 0x2c, 0x4d, 0x44, 0x54, 0x6c, 0xc0, 0x4d, 0x37, 0x3c, 0x46, 0x2c, 0x27, 0xa9, 0xfe, 0x3a, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0x00, 0x40, 0x00, 0x00, 0x05, 0x33, 0x02, 0xed, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x33, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x38, 0x39, 0x5f, 0x1d, 0x25, 0x74, 0x48, 0x8c, 0xa2, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x5b, 0x58, 0x48, 0x65, 0x0c, 0x06, 0x7e, 0x5f, 0x01, 0x34, 0xfd, 0xf2, 0x02, 0xfe, 0xfd, 0xfe, 0x38, 0x38, 0x2b, 0x2d, 0x38, 0x38, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x2d, 0x2a, 0x2d, 0x2f, 0x98, 0x87, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x42, 0x54, 0x3f, 0x38, 0x5b, 0x63, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x36, 0x2c, 0x2b, 0x36, 0x00, 0x02, 0x00, 0x40, 0x00, 0x00, 0x04, 0xf7, 0x02, 0xed, 0x00, 0x3c, 0x00, 0x47, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xf7, 0x6e, 0x82, 0x1f, 0x65, 0x45, 0x50, 0x74, 0x21, 0x25, 0x7c, 0x4d, 0x8b, 0xa0, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x56, 0x53, 0x5b, 0x6e, 0x0f, 0x54, 0x4c, 0xac, 0x02, 0xc2, 0xf0, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3d, 0x39, 0x3b, 0x40, 0x95, 0x84, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x6a, 0x5d, 0x24, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x5f, 0x4c, 0x00, 0x00, 0x02, 0x00, 0x40, 0x00, 0x00, 0x04, 0xa4, 0x02, 0xed, 0x00, 0x3d, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xa4, 0x6f, 0x7e, 0x1a, 0x56, 0x38, 0x44, 0x65, 0x1c, 0x26, 0x71, 0x46, 0x8c, 0xa1, 0x05, 0x5b, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x35, 0x5b, 0x38, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x04, 0x5c, 0x59, 0x47, 0x5e, 0x13, 0x07, 0x79, 0x61, 0x38, 0x56, 0x1a, 0xfe, 0x76, 0x01, 0x2f, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x28, 0x2b, 0x3b, 0x35, 0x30, 0x33, 0x95, 0x84, 0x25, 0x1b, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x3d, 0x58, 0x2d, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x48, 0x43, 0x5e, 0x75, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x17, 0x02, 0xab, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x11, 0x06, 0x06, 0x07, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x44, 0x49, 0x3c, 0x32, 0x2c, 0x42, 0x70, 0x77, 0x12, 0x38, 0x23, 0x59, 0x59, 0x52, 0x5b, 0x01, 0x6e, 0x1e, 0x20, 0x23, 0x1c, 0x37, 0x3d, 0x8a, 0x73, 0x37, 0xfe, 0x3b, 0x02, 0xc0, 0x79, 0xad, 0x01, 0xb1, 0x37, 0x35, 0x2f, 0x39, 0x36, 0x2f, 0xfd, 0xd5, 0x01, 0x9d, 0x17, 0x1e, 0x04, 0x5b, 0x55, 0x67, 0x5b, 0x4e, 0x14, 0x0a, 0x1a, 0x1e, 0x2a, 0x2f, 0x23, 0x6e, 0x17, 0x64, 0x42, 0x67, 0x70, 0x5b, 0x6c, 0x6c, 0xc7, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xfe, 0xde, 0x02, 0xab, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x06, 0x06, 0x07, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x35, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x44, 0x49, 0x3c, 0x32, 0x2c, 0x42, 0x70, 0x70, 0xba, 0x7e, 0x01, 0x31, 0x12, 0x38, 0x23, 0x59, 0x59, 0x52, 0x5b, 0x01, 0x6e, 0x1e, 0x20, 0x3f, 0x37, 0x3d, 0x8a, 0x73, 0x37, 0xfe, 0x3b, 0x02, 0xc0, 0x79, 0xad, 0x01, 0xb1, 0x37, 0x35, 0x2f, 0x39, 0x36, 0x2f, 0xfd, 0xd5, 0x8a, 0xc3, 0x01, 0x30, 0xa6, 0x17, 0x1e, 0x04, 0x21, 0x54, 0x67, 0x5a, 0x4f, 0x14, 0x0a, 0x1a, 0x1e, 0x2a, 0x51, 0x34, 0x17, 0x64, 0x42, 0x67, 0x70, 0x5b, 0x6c, 0x6c, 0xc7, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x8e, 0x03, 0xa6, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x49, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x00, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x3b, 0x52, 0x42, 0x37, 0x2d, 0x40, 0x78, 0x7f, 0x15, 0x49, 0x2d, 0x1b, 0x14, 0x10, 0x86, 0x61, 0x5c, 0x79, 0x46, 0x2f, 0x33, 0x45, 0x67, 0x66, 0x2b, 0x57, 0x25, 0x24, 0x60, 0x38, 0x32, 0xfd, 0x4a, 0x03, 0xbb, 0x83, 0xa7, 0xfe, 0xe1, 0x4a, 0x0d, 0x25, 0x2a, 0x12, 0x2e, 0x29, 0x2e, 0x34, 0x37, 0x30, 0x0a, 0x09, 0x2e, 0x34, 0x38, 0x2d, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa4, 0x1c, 0x1f, 0x04, 0x5b, 0x69, 0x5d, 0x55, 0x3e, 0x4d, 0x08, 0x04, 0x0e, 0x4a, 0x3f, 0x49, 0x5c, 0x1a, 0x17, 0x1d, 0x1e, 0x5b, 0x6c, 0x6c, 0xca, 0xfe, 0x4a, 0x45, 0x3d, 0x1d, 0x5c, 0x3e, 0x33, 0x2f, 0x14, 0x2c, 0x22, 0x27, 0x2a, 0x66, 0x2d, 0x25, 0x2b, 0x2d, 0x00, 0x00, 0x01, 0xff, 0xe5, 0xff, 0xb4, 0x02, 0x47, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xf1, 0x3b, 0x31, 0x2e, 0x42, 0x45, 0x2c, 0x2b, 0x35, 0x30, 0x43, 0x1e, 0x13, 0x6b, 0x7e, 0x15, 0x49, 0x36, 0x4d, 0x6a, 0x3c, 0x32, 0x32, 0x3e, 0x6f, 0x5a, 0x28, 0x15, 0xfe, 0xab, 0x02, 0x62, 0x8f, 0x96, 0x01, 0xd3, 0x20, 0x24, 0x1e, 0x25, 0x5d, 0x25, 0x21, 0x25, 0x2a, 0x2a, 0x19, 0x29, 0xfe, 0xee, 0x86, 0x1d, 0x23, 0x51, 0x4b, 0x35, 0x46, 0x09, 0x03, 0x0a, 0x42, 0x33, 0x4a, 0x43, 0x01, 0x50, 0x6c, 0x6c, 0xa5, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x8e, 0x03, 0xa6, 0x02, 0xe4, 0x00, 0x46, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x15, 0x26, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x02, 0x3b, 0x52, 0x42, 0x37, 0x2d, 0x40, 0x78, 0x7f, 0x15, 0x49, 0x2d, 0x1b, 0x14, 0x10, 0x86, 0x61, 0x5c, 0x79, 0x46, 0x2f, 0x33, 0x45, 0x68, 0x67, 0x16, 0x0b, 0x37, 0x3a, 0x37, 0x30, 0x0a, 0x09, 0x2e, 0x34, 0x38, 0x2d, 0x34, 0x4a, 0x0d, 0x25, 0x2a, 0x45, 0x79, 0x4c, 0x32, 0xfd, 0x4a, 0x03, 0xbb, 0x83, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa4, 0x1c, 0x1f, 0x04, 0x5b, 0x69, 0x5d, 0x55, 0x3e, 0x4d, 0x08, 0x04, 0x0e, 0x4a, 0x3f, 0x48, 0x5c, 0x01, 0x6a, 0x03, 0x2c, 0x25, 0x27, 0x2a, 0x66, 0x2d, 0x25, 0x2b, 0x2d, 0x45, 0x3d, 0x1d, 0x5c, 0x3e, 0x4b, 0x6b, 0x36, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x03, 0xff, 0xeb, 0xfe, 0xce, 0x05, 0x89, 0x02, 0xe4, 0x00, 0x35, 0x00, 0x41, 0x00, 0x45, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x17, 0x23, 0x27, 0x05, 0x89, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x35, 0xfd, 0x61, 0xa7, 0x42, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x45, 0x79, 0x4d, 0x32, 0xfe, 0x73, 0x05, 0x9e, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0xfe, 0xc4, 0x82, 0x85, 0x7e, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0xca, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x4b, 0x6b, 0x36, 0x5b, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0xfe, 0xe0, 0xd6, 0xd6, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x03, 0x02, 0x7d, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x2e, 0x00, 0x37, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x06, 0x07, 0x06, 0x07, 0x17, 0x36, 0x35, 0x35, 0x02, 0x36, 0x37, 0x27, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x13, 0x48, 0x3f, 0x2e, 0x2d, 0x41, 0x70, 0x71, 0x17, 0x4e, 0x32, 0x3d, 0x5d, 0x32, 0x34, 0x2e, 0x28, 0x30, 0x89, 0x74, 0x37, 0xfe, 0x6b, 0x02, 0x92, 0x7b, 0xae, 0x3f, 0x40, 0x2b, 0x26, 0x1d, 0xb9, 0x07, 0x5c, 0x30, 0x10, 0xc6, 0x11, 0x43, 0x36, 0x01, 0xb1, 0x37, 0x35, 0x2e, 0x3a, 0x36, 0x2f, 0xfd, 0xc1, 0x8b, 0x27, 0x2a, 0x35, 0x5b, 0x39, 0x37, 0x57, 0x18, 0x19, 0x53, 0x38, 0x63, 0x6a, 0x5b, 0x6c, 0x6c, 0xc7, 0xfe, 0xec, 0x20, 0x04, 0x03, 0x10, 0x7b, 0x14, 0x17, 0xa2, 0xfe, 0xde, 0x18, 0x14, 0x84, 0x1a, 0x23, 0x34, 0x3f, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xfe, 0xcd, 0x02, 0x7d, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x2f, 0x00, 0x38, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x06, 0x07, 0x06, 0x07, 0x17, 0x36, 0x35, 0x35, 0x06, 0x16, 0x33, 0x32, 0x36, 0x37, 0x27, 0x06, 0x15, 0x01, 0x13, 0x48, 0x3f, 0x2e, 0x2d, 0x41, 0x70, 0x71, 0x0f, 0x17, 0x86, 0x85, 0x70, 0x4a, 0x58, 0x34, 0x2e, 0x28, 0x30, 0x89, 0x74, 0x37, 0xfe, 0x6b, 0x02, 0x92, 0x7b, 0xae, 0x3f, 0x40, 0x2b, 0x26, 0x1d, 0xb9, 0x07, 0xf3, 0x43, 0x36, 0x1e, 0x30, 0x10, 0xc6, 0x11, 0x01, 0xb1, 0x37, 0x35, 0x2e, 0x3a, 0x36, 0x2f, 0xfd, 0xc1, 0x8b, 0x1a, 0x12, 0x95, 0x73, 0x0d, 0x6d, 0x4c, 0x37, 0x57, 0x18, 0x19, 0x53, 0x38, 0x63, 0x6a, 0x5b, 0x6c, 0x6c, 0xc7, 0xfe, 0xec, 0x20, 0x04, 0x03, 0x10, 0x7b, 0x14, 0x17, 0xa2, 0xe3, 0x3f, 0x18, 0x14, 0x84, 0x1a, 0x23, 0xff, 0xff, 0xff, 0xeb, 0xfe, 0xce, 0x05, 0x9d, 0x02, 0xed, 0x00, 0x22, 0x00, 0x61, 0x00, 0x00, 0x00, 0x03, 0x00, 0x3b, 0x02, 0x49, 0x00, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xfe, 0xd5, 0x03, 0x64, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x07, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x64, 0x72, 0x81, 0x94, 0x62, 0x5f, 0x58, 0x69, 0x76, 0x5e, 0x39, 0x5b, 0x5a, 0x74, 0x6f, 0x5c, 0x42, 0xfe, 0x9f, 0x03, 0x79, 0xf3, 0xa7, 0xb1, 0x29, 0x31, 0x32, 0x29, 0xc3, 0x01, 0x95, 0xfe, 0xf5, 0x40, 0x26, 0x33, 0x2b, 0x23, 0x24, 0x27, 0x02, 0x78, 0xfc, 0x5d, 0x01, 0x2a, 0x2a, 0x67, 0x72, 0x64, 0x55, 0x5d, 0x57, 0x50, 0x5c, 0x54, 0x5d, 0x57, 0x5b, 0x6c, 0x6c, 0xc9, 0x24, 0x25, 0x21, 0x25, 0xb7, 0x6a, 0x28, 0x26, 0x21, 0x29, 0x34, 0x2e, 0x00, 0x00, 0x02, 0xff, 0xf8, 0x00, 0x00, 0x02, 0xd9, 0x02, 0xe4, 0x00, 0x18, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x22, 0x07, 0x07, 0x35, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xd9, 0x6f, 0x7f, 0x3b, 0x9d, 0x60, 0x78, 0x40, 0x2e, 0x2f, 0x41, 0x57, 0x3b, 0x1c, 0xef, 0x02, 0xe1, 0xee, 0x89, 0x46, 0x1c, 0x15, 0x04, 0x2b, 0x36, 0x2b, 0x3a, 0x3c, 0x2c, 0x33, 0x3e, 0x36, 0x53, 0x68, 0x02, 0x78, 0xfd, 0x88, 0x8a, 0x67, 0x55, 0x4c, 0x38, 0x3f, 0x09, 0x04, 0x08, 0x38, 0x32, 0x3d, 0x36, 0x4b, 0x6c, 0x6c, 0x7b, 0x07, 0x07, 0x06, 0x11, 0x29, 0x20, 0x22, 0x62, 0x22, 0x24, 0x26, 0x28, 0x5d, 0x60, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x0f, 0x02, 0x75, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x31, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x12, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x01, 0x0b, 0x48, 0x3b, 0x33, 0x2c, 0x41, 0x70, 0x77, 0x17, 0x49, 0x2e, 0x3a, 0x56, 0x2e, 0x2c, 0x27, 0x2a, 0x30, 0x89, 0x74, 0x37, 0xfe, 0x73, 0x02, 0x8a, 0x7b, 0xae, 0x24, 0x4f, 0x2d, 0x35, 0x3c, 0x2f, 0x33, 0x3a, 0x01, 0xb1, 0x37, 0x35, 0x2f, 0x39, 0x36, 0x2f, 0xfd, 0xcd, 0x7f, 0x20, 0x21, 0x32, 0x57, 0x36, 0x34, 0x52, 0x18, 0x18, 0x54, 0x3a, 0x63, 0x6a, 0x5b, 0x6c, 0x6c, 0xc7, 0xfe, 0xd0, 0x08, 0x04, 0x37, 0x2b, 0x2e, 0x38, 0x3f, 0x2a, 0x9b, 0x00, 0x00, 0x02, 0x00, 0x46, 0x00, 0x00, 0x05, 0x0a, 0x02, 0xed, 0x00, 0x42, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x0a, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3d, 0x65, 0x1c, 0x20, 0x72, 0x4d, 0x68, 0x87, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x4b, 0x59, 0x0a, 0x09, 0x7d, 0x5c, 0x01, 0x35, 0xfd, 0xf6, 0x02, 0xfa, 0xfd, 0xfd, 0x38, 0x38, 0x2b, 0x2c, 0x39, 0x38, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x36, 0x30, 0x33, 0x36, 0x5c, 0x58, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x3f, 0x3e, 0x57, 0x5f, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0x00, 0x46, 0x00, 0x00, 0x06, 0xce, 0x02, 0xed, 0x00, 0x49, 0x00, 0x55, 0x00, 0x61, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xce, 0x6f, 0x82, 0x1f, 0x66, 0x44, 0x73, 0x8a, 0x0c, 0x8d, 0x24, 0x36, 0x5d, 0x38, 0x43, 0x6b, 0x19, 0x42, 0x91, 0x68, 0x87, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x89, 0x22, 0x0b, 0x7c, 0x5a, 0x01, 0x36, 0x55, 0x4b, 0xfd, 0x4e, 0x04, 0xc9, 0xf1, 0xa7, 0x5b, 0x56, 0x08, 0x59, 0x4a, 0x4e, 0x5f, 0xfd, 0x26, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x3e, 0x37, 0x53, 0x5c, 0x58, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x61, 0x53, 0x5a, 0x37, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x4f, 0x63, 0x0a, 0x4c, 0x5a, 0x60, 0x4b, 0xd5, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x00, 0x03, 0x00, 0x46, 0x00, 0x00, 0x05, 0x1b, 0x02, 0xed, 0x00, 0x41, 0x00, 0x45, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x35, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x1b, 0x6f, 0x83, 0x95, 0x69, 0x61, 0x3a, 0x59, 0x1b, 0x24, 0x72, 0x4a, 0x6b, 0x83, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x49, 0x57, 0x09, 0x09, 0x75, 0x57, 0x4b, 0xfe, 0xf4, 0x03, 0x0b, 0xf2, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2b, 0x35, 0x2e, 0x25, 0x29, 0x2c, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x2a, 0x26, 0x23, 0x25, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x37, 0x2e, 0x01, 0x50, 0x56, 0xac, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x02, 0x00, 0x46, 0x00, 0x00, 0x04, 0xc3, 0x02, 0xed, 0x00, 0x41, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x27, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xc3, 0x6f, 0x82, 0x1f, 0x65, 0x45, 0x4c, 0x71, 0x21, 0x22, 0x75, 0x4d, 0x6f, 0x8a, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x53, 0x58, 0x01, 0x03, 0x0c, 0x54, 0x4c, 0x9c, 0x02, 0xb3, 0xf1, 0xa6, 0xb0, 0x5a, 0x4f, 0x4d, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x37, 0x34, 0x38, 0x3c, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x63, 0x52, 0x02, 0x1c, 0x1c, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x02, 0x00, 0x46, 0x00, 0x00, 0x04, 0x7b, 0x02, 0xed, 0x00, 0x40, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x7b, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x48, 0x68, 0x1a, 0x3f, 0xa0, 0x6c, 0x83, 0x46, 0x2f, 0x35, 0x48, 0x65, 0x50, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x48, 0x5c, 0x0c, 0x04, 0x3a, 0x63, 0x40, 0x38, 0x57, 0x19, 0xfe, 0x82, 0x01, 0x24, 0x3c, 0x1e, 0x45, 0x40, 0x3b, 0x4c, 0x4c, 0x3b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x41, 0x3a, 0x72, 0x5b, 0x59, 0x3c, 0x4b, 0x09, 0x04, 0x0e, 0x54, 0x43, 0x4d, 0x5f, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x48, 0x48, 0x3d, 0x60, 0x35, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xe3, 0x02, 0xe4, 0x00, 0x40, 0x00, 0x4d, 0x00, 0x59, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x2c, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x0b, 0x8d, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x71, 0x36, 0x4f, 0x38, 0x50, 0x18, 0xfc, 0x3b, 0x05, 0xf8, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0xfe, 0x06, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x2a, 0x27, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2b, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x0b, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xf7, 0x08, 0x10, 0x02, 0xe4, 0x00, 0x42, 0x00, 0x4e, 0x00, 0x54, 0x00, 0x61, 0x00, 0x6d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x08, 0x10, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x05, 0x3b, 0x2d, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x0b, 0x8d, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x71, 0x36, 0x4f, 0x38, 0x50, 0x18, 0xfc, 0x3b, 0x08, 0x25, 0xfd, 0xa2, 0x41, 0xfe, 0x39, 0x15, 0x4d, 0x35, 0x3f, 0x57, 0x14, 0x01, 0xb3, 0xad, 0x23, 0xd0, 0xfc, 0x3d, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0xfe, 0x06, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x7e, 0x2a, 0x36, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x2a, 0x27, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2b, 0x2b, 0x26, 0xab, 0x6c, 0xfe, 0xbd, 0x4b, 0x40, 0x4c, 0xb3, 0x24, 0x29, 0x40, 0x36, 0xdc, 0x4c, 0x4c, 0x38, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x0b, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xbf, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xbf, 0x6e, 0x82, 0x1d, 0x5e, 0x3a, 0x5d, 0x73, 0x20, 0x1d, 0xd4, 0x28, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x48, 0x27, 0x36, 0x41, 0x45, 0x34, 0x45, 0x4d, 0xfc, 0x1c, 0x04, 0xd4, 0xfc, 0x7d, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xaf, 0x29, 0x2d, 0x63, 0x57, 0x27, 0x40, 0x17, 0x32, 0x46, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x41, 0x5d, 0x30, 0x66, 0x3a, 0x2d, 0x30, 0x36, 0x5c, 0x49, 0x01, 0x0f, 0x6c, 0xfd, 0xe4, 0x38, 0x2a, 0x2b, 0x36, 0x36, 0x2c, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x17, 0x05, 0x57, 0x02, 0xe4, 0x00, 0x2b, 0x00, 0x4b, 0x00, 0x57, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x21, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x37, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x8f, 0x3e, 0x48, 0x5b, 0xaa, 0x74, 0x8f, 0xb3, 0x0a, 0x16, 0x4c, 0x31, 0x1e, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x35, 0x63, 0x96, 0x2a, 0x1e, 0x37, 0x2e, 0x38, 0xfd, 0x8a, 0x05, 0x6c, 0xfe, 0xc1, 0xfe, 0xca, 0x2f, 0x34, 0x15, 0x13, 0x3a, 0x3b, 0x67, 0x65, 0x7a, 0x8b, 0x2e, 0x23, 0x20, 0x2e, 0x0d, 0x6a, 0x0f, 0x46, 0x3a, 0xfd, 0x24, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0x61, 0x12, 0x69, 0x50, 0x5e, 0x8c, 0x4b, 0x65, 0x60, 0x3d, 0x58, 0x0f, 0x2f, 0x3d, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x49, 0x49, 0x27, 0x10, 0x04, 0x0a, 0x44, 0x3d, 0x51, 0x6c, 0x6c, 0x4a, 0x30, 0x31, 0x68, 0x39, 0x2c, 0x3c, 0x3f, 0x6b, 0x61, 0x34, 0x3b, 0x30, 0x2d, 0x25, 0x2e, 0x2d, 0x34, 0x46, 0x53, 0x0e, 0xfe, 0xac, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x1c, 0x04, 0x94, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x13, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x14, 0x8f, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x8d, 0x49, 0x65, 0x05, 0xfc, 0x91, 0x04, 0xa9, 0xbc, 0x7b, 0xfd, 0xdf, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x3b, 0x31, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2a, 0x5b, 0x6c, 0x6c, 0xc8, 0xec, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xee, 0x04, 0x3e, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x45, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xed, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4c, 0x72, 0x01, 0x82, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x4e, 0x19, 0x47, 0x28, 0x58, 0xfc, 0xa3, 0x04, 0x53, 0x7a, 0xb2, 0xfe, 0x2a, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x44, 0x55, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x14, 0x15, 0x5c, 0x6c, 0x6c, 0xb7, 0xfd, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xd2, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x33, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xd2, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x26, 0xa9, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0xc8, 0xfc, 0x09, 0x04, 0xe7, 0xfc, 0x6a, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x53, 0x39, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x41, 0x5d, 0x30, 0x8a, 0x6c, 0xfd, 0xdb, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x7f, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x40, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x7f, 0x6f, 0x80, 0x1e, 0x67, 0x45, 0x77, 0x8c, 0x09, 0x18, 0x59, 0x43, 0x48, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x23, 0xa6, 0x23, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x29, 0x7f, 0x3f, 0x36, 0x32, 0xfb, 0x82, 0x06, 0x94, 0xef, 0xa8, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x61, 0xfb, 0xad, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x81, 0x71, 0x3d, 0x48, 0x44, 0x42, 0x4a, 0x66, 0x7c, 0x7a, 0x54, 0x37, 0x33, 0x40, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x56, 0x68, 0x08, 0x03, 0x45, 0x54, 0x60, 0x4b, 0xa8, 0x37, 0x2b, 0x2a, 0x36, 0x36, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xb0, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xb0, 0x6e, 0x7d, 0xda, 0xa8, 0x01, 0x79, 0x14, 0x4b, 0x2d, 0x2e, 0x48, 0x12, 0xf1, 0x24, 0x36, 0x5f, 0x39, 0x3b, 0x62, 0x39, 0x3c, 0x67, 0x40, 0x01, 0x3c, 0x21, 0x5e, 0x3a, 0x3b, 0x5c, 0x1d, 0xfc, 0x28, 0x04, 0xc5, 0xfc, 0x8c, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xd7, 0xd7, 0x06, 0x01, 0x55, 0x21, 0x29, 0x2b, 0x2b, 0x32, 0x41, 0x38, 0x57, 0x2f, 0x31, 0x5b, 0x3d, 0x41, 0x5f, 0x31, 0x28, 0x2b, 0x2d, 0x22, 0xbc, 0x6c, 0xfd, 0xa7, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0xe5, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x4b, 0x00, 0x57, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xe5, 0x6f, 0x82, 0xfe, 0x69, 0x2b, 0x29, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x1b, 0x3e, 0x30, 0x48, 0x4f, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x27, 0xaa, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x2e, 0x05, 0x50, 0x6e, 0x1f, 0x05, 0x4f, 0x4a, 0xfb, 0x23, 0x06, 0xfa, 0xf1, 0xab, 0x24, 0xcf, 0xfb, 0x49, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x36, 0x6b, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x46, 0x18, 0x2f, 0x21, 0x47, 0x44, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x55, 0x3a, 0x32, 0x42, 0x3b, 0x55, 0x2c, 0x31, 0x5c, 0x3f, 0x42, 0x5d, 0x30, 0x32, 0x2c, 0x4d, 0x44, 0x54, 0x6c, 0x6c, 0x54, 0x4d, 0x37, 0xde, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2c, 0x2a, 0x36, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x20, 0x02, 0xed, 0x00, 0x3e, 0x00, 0x4a, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x20, 0x6e, 0x81, 0x18, 0x73, 0x52, 0x75, 0x95, 0x0c, 0x87, 0x24, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x82, 0xc1, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x74, 0x04, 0x0d, 0xfd, 0x95, 0x02, 0xe2, 0x20, 0x23, 0x59, 0x6e, 0x8b, 0x7e, 0x15, 0x03, 0x57, 0x54, 0x38, 0x5c, 0x36, 0xfd, 0x0b, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x30, 0x43, 0x83, 0x73, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0x78, 0x22, 0x2c, 0x2f, 0x28, 0x0e, 0x18, 0x11, 0x18, 0x28, 0x25, 0x6c, 0x09, 0x69, 0x57, 0x62, 0x6e, 0x44, 0x55, 0x30, 0x5e, 0x41, 0x01, 0x51, 0xfd, 0xa7, 0x37, 0x2b, 0x2b, 0x37, 0x37, 0x2c, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xf4, 0x02, 0xed, 0x00, 0x4c, 0x00, 0x57, 0x00, 0x63, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xf4, 0x6e, 0x82, 0x1f, 0x65, 0x45, 0x50, 0x74, 0x21, 0x25, 0x7c, 0x4d, 0x7f, 0x9d, 0x0d, 0x87, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x83, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x0d, 0xfd, 0x95, 0x02, 0xe3, 0x1f, 0x24, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x56, 0x53, 0x5b, 0x6e, 0x0f, 0x54, 0x4c, 0xac, 0x02, 0xc2, 0xf0, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0xfb, 0x39, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3d, 0x39, 0x3b, 0x40, 0x7d, 0x71, 0x31, 0x41, 0x3c, 0x56, 0x2c, 0x31, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x28, 0x25, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x6a, 0x5d, 0x24, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x5f, 0x4c, 0xf1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xa0, 0x02, 0xed, 0x00, 0x4d, 0x00, 0x5b, 0x00, 0x67, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xa0, 0x6f, 0x7e, 0x1a, 0x56, 0x38, 0x44, 0x65, 0x1c, 0x26, 0x71, 0x46, 0x80, 0x9e, 0x0d, 0x86, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x82, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x0d, 0xfd, 0x96, 0x02, 0xe2, 0x20, 0x23, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x04, 0x5c, 0x59, 0x47, 0x5e, 0x13, 0x07, 0x79, 0x61, 0x38, 0x56, 0x1a, 0xfe, 0x76, 0x01, 0x2f, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfc, 0x10, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x28, 0x2b, 0x3b, 0x35, 0x30, 0x33, 0x7d, 0x71, 0x31, 0x41, 0x3c, 0x56, 0x2c, 0x31, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x28, 0x25, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x48, 0x43, 0x5e, 0x75, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x2f, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0x71, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x0a, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x0e, 0x8a, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x80, 0x44, 0x61, 0x32, 0xfc, 0x7a, 0x04, 0x86, 0x01, 0x7d, 0xa7, 0xfd, 0xf0, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x2e, 0x28, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2a, 0x5b, 0x6c, 0x6c, 0xca, 0xea, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xbd, 0x04, 0x70, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x07, 0x33, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x0a, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x0f, 0x01, 0xaf, 0x8c, 0x93, 0x4e, 0x60, 0x0e, 0x8a, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x80, 0x44, 0x61, 0x32, 0xfc, 0x7a, 0x04, 0x85, 0x7d, 0xa7, 0xfd, 0xf0, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa7, 0x10, 0xbf, 0x99, 0x0d, 0x72, 0x5c, 0x2e, 0x28, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2a, 0x5b, 0x6c, 0x6c, 0xca, 0xea, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x0f, 0x04, 0x66, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x42, 0x00, 0x4e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x02, 0xfc, 0x48, 0x3b, 0x33, 0x2c, 0x41, 0x70, 0x77, 0x17, 0x49, 0x2e, 0x3a, 0x56, 0x2e, 0x2c, 0x27, 0x2a, 0x30, 0x06, 0x83, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x6f, 0x42, 0x67, 0x37, 0xfc, 0x82, 0x04, 0x7b, 0x7b, 0xae, 0xfd, 0xff, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x50, 0x4f, 0x2d, 0x35, 0x3c, 0x2f, 0x33, 0x3a, 0x01, 0xb1, 0x37, 0x35, 0x2f, 0x39, 0x36, 0x2f, 0xfd, 0xcd, 0x7f, 0x20, 0x21, 0x32, 0x57, 0x36, 0x34, 0x52, 0x18, 0x18, 0x54, 0x3a, 0x1e, 0x19, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2a, 0x5b, 0x6c, 0x6c, 0xc7, 0xed, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x43, 0x08, 0x04, 0x37, 0x2b, 0x2e, 0x38, 0x3f, 0x2a, 0x9b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xe8, 0x02, 0xed, 0x00, 0x4a, 0x00, 0x56, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xe8, 0x6d, 0x81, 0x1f, 0x6d, 0x49, 0x5f, 0x7e, 0x02, 0x0f, 0x47, 0x33, 0x1e, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x35, 0x67, 0x93, 0x27, 0x21, 0x2c, 0x35, 0x48, 0x08, 0xfd, 0xa3, 0x02, 0xca, 0x1e, 0x21, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x27, 0x22, 0x22, 0x29, 0x4c, 0x3b, 0x3b, 0x34, 0x36, 0x3c, 0x43, 0x38, 0x51, 0x64, 0xee, 0xfc, 0x54, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb9, 0x30, 0x34, 0x5b, 0x53, 0x30, 0x40, 0x0c, 0x2d, 0x3e, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x44, 0x3f, 0x20, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x31, 0x32, 0x68, 0x2b, 0x27, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xbc, 0x02, 0xed, 0x00, 0x59, 0x00, 0x64, 0x00, 0x70, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x27, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xbc, 0x6f, 0x82, 0x1f, 0x65, 0x45, 0x4c, 0x71, 0x21, 0x22, 0x75, 0x4d, 0x6d, 0x88, 0x04, 0x0f, 0x47, 0x34, 0x1e, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x35, 0x67, 0x95, 0x26, 0x20, 0x2b, 0x35, 0x48, 0x08, 0xfd, 0xa4, 0x02, 0xca, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x37, 0x53, 0x58, 0x01, 0x03, 0x0c, 0x54, 0x4c, 0x9c, 0x02, 0xb3, 0xf1, 0xa6, 0xb0, 0x5a, 0x4f, 0x4d, 0x60, 0xfb, 0x71, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x37, 0x34, 0x38, 0x3c, 0x57, 0x54, 0x32, 0x41, 0x0d, 0x2d, 0x3e, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x44, 0x3f, 0x20, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x63, 0x52, 0x02, 0x1c, 0x1c, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0xb0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xbc, 0x04, 0xe8, 0x02, 0xed, 0x00, 0x4c, 0x00, 0x58, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xe8, 0x6d, 0x81, 0x0a, 0x0b, 0xcb, 0x8d, 0x97, 0x5d, 0x7c, 0x04, 0x0e, 0x47, 0x35, 0x1e, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x35, 0x67, 0x95, 0x26, 0x20, 0x2b, 0x35, 0x48, 0x08, 0xfd, 0xa4, 0x02, 0xca, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x43, 0x38, 0x51, 0x64, 0xee, 0xfc, 0x54, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xba, 0x0f, 0x0b, 0xe4, 0x9c, 0x57, 0x50, 0x31, 0x42, 0x0d, 0x2d, 0x3e, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x44, 0x3f, 0x20, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x74, 0x02, 0xed, 0x00, 0x58, 0x00, 0x66, 0x00, 0x72, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x74, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x48, 0x68, 0x1a, 0x3f, 0xa0, 0x69, 0x82, 0x04, 0x0f, 0x47, 0x34, 0x1e, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x35, 0x67, 0x95, 0x26, 0x20, 0x2b, 0x35, 0x48, 0x08, 0xfd, 0xa4, 0x02, 0xca, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x48, 0x5c, 0x0c, 0x04, 0x3a, 0x63, 0x40, 0x38, 0x57, 0x19, 0xfe, 0x82, 0x01, 0x24, 0x3c, 0x1e, 0x45, 0x40, 0x3b, 0x4c, 0x4c, 0x3b, 0xfc, 0x3a, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x41, 0x3a, 0x72, 0x56, 0x55, 0x32, 0x41, 0x0d, 0x2d, 0x3e, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x44, 0x3f, 0x20, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x48, 0x48, 0x3d, 0x60, 0x35, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x12, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x44, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x44, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x16, 0x9a, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x03, 0x3a, 0xfb, 0x97, 0x05, 0x59, 0xfb, 0xf8, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x30, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x36, 0x2c, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x0b, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x46, 0x00, 0x52, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x0b, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x73, 0x8a, 0x0c, 0x8d, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x16, 0x9b, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x03, 0x3b, 0x55, 0x4b, 0xfa, 0xf6, 0x07, 0x20, 0xf0, 0xa7, 0x5b, 0x56, 0x08, 0x59, 0x49, 0x4e, 0x60, 0xfb, 0x21, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x30, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x37, 0x2c, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x37, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x4f, 0x63, 0x0a, 0x4b, 0x5b, 0x5f, 0x4c, 0xd5, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa1, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xa1, 0x6f, 0x80, 0x35, 0x67, 0x62, 0x6f, 0x09, 0x84, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x20, 0xfd, 0xb1, 0x04, 0xb6, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfd, 0x8a, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x76, 0x63, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0xda, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0xa1, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xa1, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x55, 0x61, 0x09, 0x84, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x20, 0xfd, 0xb1, 0x04, 0xb6, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfd, 0x8a, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x08, 0x70, 0x5a, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0xda, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xdf, 0x02, 0xe4, 0x00, 0x37, 0x00, 0x40, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x22, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x5f, 0x6c, 0x08, 0x84, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x21, 0xfd, 0xb0, 0x05, 0xf4, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0xfd, 0x9b, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x76, 0x63, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xd4, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x05, 0xdf, 0x02, 0xe4, 0x00, 0x3a, 0x00, 0x43, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x22, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x0a, 0x06, 0xcd, 0x8c, 0xb6, 0x50, 0x5b, 0x07, 0x84, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x21, 0xfd, 0xb0, 0x05, 0xf4, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0xfd, 0x9b, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xf3, 0x0c, 0x05, 0xf7, 0xcb, 0x0a, 0x6f, 0x58, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x85, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0xd4, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x57, 0x02, 0xed, 0x00, 0x39, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x57, 0x70, 0x81, 0x8b, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x11, 0x9c, 0x24, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x49, 0x23, 0x23, 0x1e, 0x26, 0x04, 0x81, 0x04, 0x0a, 0xfd, 0x89, 0x02, 0xe9, 0x20, 0x25, 0x66, 0x5c, 0x8b, 0xfe, 0xfd, 0x47, 0x2c, 0x35, 0x2f, 0x24, 0x29, 0x2c, 0xfd, 0xda, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x6b, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x2f, 0x25, 0x32, 0x41, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0x4b, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0x6c, 0x09, 0x7c, 0x69, 0x34, 0x01, 0x10, 0xfe, 0x87, 0x2e, 0x28, 0x26, 0x2e, 0x37, 0x31, 0x84, 0x38, 0x2b, 0x2a, 0x36, 0x36, 0x2b, 0x2b, 0x37, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x0b, 0x02, 0xed, 0x00, 0x44, 0x00, 0x4f, 0x00, 0x5a, 0x00, 0x66, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x0b, 0x70, 0x81, 0x1f, 0x66, 0x45, 0x79, 0x8d, 0x06, 0x69, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x11, 0x9b, 0x23, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x48, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x0a, 0xfd, 0x8a, 0x02, 0xe9, 0x20, 0x25, 0x66, 0x5c, 0x95, 0x44, 0x40, 0xb0, 0x02, 0xc7, 0xf1, 0xa7, 0xaf, 0x59, 0x50, 0x4d, 0x60, 0xfd, 0x48, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0xfd, 0xdb, 0x37, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x2f, 0x25, 0x33, 0x40, 0x3b, 0x55, 0x2d, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x33, 0x43, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x11, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x83, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xc5, 0x02, 0xed, 0x00, 0x4a, 0x00, 0x58, 0x00, 0x63, 0x00, 0x6f, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xc5, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x44, 0x67, 0x37, 0x03, 0x76, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x11, 0x9b, 0x23, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x48, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x0a, 0xfd, 0x8a, 0x02, 0xe9, 0x20, 0x25, 0x66, 0x5c, 0x9f, 0x1e, 0x5d, 0x3b, 0x38, 0x56, 0x1a, 0xfe, 0x6e, 0x01, 0x37, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4c, 0x4b, 0x3b, 0xfe, 0x10, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0xfd, 0xdb, 0x37, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x2f, 0x25, 0x33, 0x40, 0x3b, 0x55, 0x2d, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x29, 0x2d, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x49, 0x3a, 0x3c, 0x49, 0xb1, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x83, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x60, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x27, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x60, 0x6e, 0x82, 0x95, 0x69, 0x62, 0x3d, 0x5e, 0x34, 0x11, 0x9b, 0x24, 0x36, 0x5d, 0x39, 0x3b, 0x63, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x47, 0xfc, 0x8a, 0x05, 0x75, 0xf0, 0x95, 0x95, 0xfe, 0xf1, 0x47, 0x2b, 0x36, 0x30, 0x25, 0x29, 0x2a, 0xfd, 0xdc, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x6b, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x2f, 0x25, 0x32, 0x41, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3e, 0x42, 0x5d, 0x2f, 0xa4, 0x6c, 0x6c, 0xa4, 0x69, 0x2e, 0x28, 0x26, 0x2e, 0x37, 0x31, 0x84, 0x38, 0x2b, 0x2a, 0x36, 0x36, 0x2b, 0x2b, 0x37, 0x00, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x27, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x46, 0x00, 0x52, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x27, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x12, 0x9e, 0x25, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x02, 0x49, 0xfc, 0x88, 0x07, 0x3c, 0xfc, 0xb4, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0x2c, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0xfd, 0xda, 0x37, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x32, 0x24, 0x31, 0x45, 0x3b, 0x55, 0x2c, 0x31, 0x5d, 0x3f, 0x42, 0x5d, 0x30, 0xb2, 0x6c, 0xfe, 0xe2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x19, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x84, 0x36, 0x2b, 0x2b, 0x37, 0x37, 0x2c, 0x2a, 0x36, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x06, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x06, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x73, 0x8a, 0x0c, 0x8d, 0x24, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x36, 0x55, 0x4b, 0xfc, 0xfb, 0x05, 0x1b, 0xf0, 0xa7, 0x5b, 0x56, 0x08, 0x59, 0x49, 0x4e, 0x60, 0xfd, 0x26, 0x38, 0x37, 0x2c, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x32, 0x41, 0x3b, 0x56, 0x2d, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x37, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x4f, 0x63, 0x0a, 0x4b, 0x5b, 0x5f, 0x4c, 0xd5, 0x37, 0x2b, 0x2b, 0x36, 0x37, 0x2b, 0x2a, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xb6, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x34, 0x00, 0x40, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xb6, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x0b, 0x92, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x77, 0x3a, 0x56, 0x39, 0x56, 0x1a, 0xfc, 0x21, 0x04, 0xcb, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0xf9, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x27, 0x26, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2f, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x12, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x52, 0x02, 0xe4, 0x00, 0x34, 0x00, 0x3a, 0x00, 0x46, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x52, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x3a, 0x3d, 0x1b, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0xac, 0x4d, 0x71, 0x1d, 0x4d, 0x47, 0xfc, 0xb6, 0x05, 0x67, 0xf0, 0xad, 0x23, 0xd0, 0xfc, 0xda, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x5f, 0x26, 0x31, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2c, 0x2c, 0x01, 0x4d, 0x43, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0xe4, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0xab, 0x02, 0xe4, 0x00, 0x47, 0x00, 0x51, 0x00, 0x5d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x2a, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x02, 0xfe, 0x7e, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x3a, 0x3d, 0x1b, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0xac, 0x4d, 0x71, 0x1d, 0x4d, 0x47, 0xfc, 0xb6, 0x06, 0xc0, 0xbc, 0x7b, 0xe1, 0x82, 0x57, 0x05, 0xfe, 0x44, 0x23, 0xde, 0xfc, 0xcc, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x0c, 0x18, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x5f, 0x26, 0x31, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2c, 0x2c, 0x01, 0x4d, 0x43, 0x4c, 0x6c, 0x6c, 0xc8, 0x30, 0x3d, 0x5b, 0x4c, 0x4c, 0x38, 0xe4, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x06, 0xff, 0xeb, 0xff, 0xf7, 0x09, 0x24, 0x02, 0xe4, 0x00, 0x44, 0x00, 0x4d, 0x00, 0x54, 0x00, 0x60, 0x00, 0x6c, 0x00, 0x77, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x14, 0x07, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x09, 0x24, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x07, 0xfe, 0x85, 0x29, 0x2a, 0x28, 0x2c, 0x7b, 0x01, 0x6d, 0x61, 0x66, 0x70, 0x3a, 0x3d, 0x1b, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0xac, 0x4d, 0x71, 0x1d, 0x4c, 0x48, 0xfc, 0xb6, 0x09, 0x39, 0xfa, 0x93, 0x24, 0x01, 0x04, 0x35, 0x48, 0x4c, 0xfe, 0x57, 0x02, 0x21, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xf9, 0x08, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x04, 0x4f, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x21, 0x18, 0x74, 0x2e, 0x38, 0x33, 0x2a, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x5f, 0x26, 0x31, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2c, 0x2c, 0x01, 0x4d, 0x43, 0x4c, 0x6c, 0xb8, 0x4d, 0x37, 0x1e, 0xb2, 0xb2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0xb0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x97, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x07, 0x0a, 0x02, 0xe4, 0x00, 0x3a, 0x00, 0x43, 0x00, 0x4f, 0x00, 0x5b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x15, 0x14, 0x07, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x0a, 0x6f, 0x82, 0x1f, 0x66, 0x44, 0x75, 0x8b, 0x0a, 0xfe, 0x84, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x3a, 0x3d, 0x1b, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0xac, 0x4d, 0x71, 0x1d, 0x4d, 0x47, 0xfc, 0xb6, 0x07, 0x1f, 0xfc, 0xab, 0x23, 0xc1, 0x54, 0x4c, 0x01, 0x26, 0xa6, 0x5b, 0x55, 0x59, 0x50, 0x4e, 0x5f, 0xfb, 0x23, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xab, 0x28, 0x2d, 0x7d, 0x6c, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x5f, 0x26, 0x31, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2c, 0x2c, 0x01, 0x4d, 0x43, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x41, 0x45, 0x4a, 0x61, 0x54, 0x64, 0x08, 0x43, 0x52, 0x60, 0x4b, 0xa9, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x93, 0x04, 0x4e, 0x02, 0xe4, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x27, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xf5, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x3c, 0x0b, 0x93, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x3c, 0x67, 0x40, 0x01, 0x4d, 0x2b, 0x58, 0x64, 0xfc, 0x9d, 0x04, 0x63, 0x85, 0xb1, 0xfe, 0x24, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x3a, 0x67, 0x43, 0x3b, 0x5d, 0x1d, 0x20, 0x3b, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x42, 0x5d, 0x2f, 0x2e, 0x57, 0x6c, 0x6c, 0xb4, 0xff, 0x00, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x1c, 0x04, 0x0f, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x24, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x02, 0x8e, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x67, 0x93, 0x16, 0x38, 0x4c, 0x70, 0x79, 0x5f, 0x04, 0x24, 0xbc, 0x7b, 0xfe, 0xf4, 0x94, 0x70, 0x05, 0xfd, 0xf7, 0x3e, 0x3f, 0x28, 0x38, 0x0d, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x64, 0x56, 0x28, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xc8, 0x0a, 0x63, 0x5b, 0xcc, 0x44, 0x4d, 0x26, 0x20, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x24, 0x04, 0x29, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x00, 0x36, 0x37, 0x36, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x03, 0x5e, 0x79, 0x49, 0x7e, 0x4f, 0x62, 0x91, 0x18, 0x36, 0x50, 0x70, 0x79, 0x5f, 0x04, 0x3e, 0xfd, 0x47, 0x38, 0x0d, 0x11, 0x6f, 0x4e, 0xfe, 0x49, 0x3e, 0x3f, 0x02, 0x11, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x4c, 0x74, 0x3e, 0x61, 0x53, 0x2a, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xfe, 0xa3, 0x24, 0x1e, 0x4c, 0x62, 0x0f, 0x5e, 0xcc, 0x44, 0x4d, 0x47, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x33, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x27, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x33, 0x04, 0x33, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x69, 0x8a, 0x0e, 0x2d, 0x41, 0x6f, 0x77, 0x5f, 0x04, 0x48, 0xf0, 0xfd, 0x89, 0x3c, 0x3d, 0x24, 0x36, 0x0c, 0x1c, 0x8f, 0x62, 0x8b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x64, 0x63, 0x1b, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x21, 0x1c, 0x4b, 0x4b, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xe1, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x33, 0x00, 0x40, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xe1, 0x6f, 0x80, 0x1e, 0x67, 0x45, 0x77, 0x8c, 0x09, 0x18, 0x59, 0x43, 0x48, 0x4c, 0x49, 0x14, 0x28, 0x65, 0x89, 0x11, 0x2f, 0x43, 0x6f, 0x77, 0x5f, 0x05, 0xf6, 0xfd, 0x43, 0x3f, 0x36, 0x32, 0xfd, 0x01, 0x3c, 0x3c, 0x2a, 0x36, 0x0a, 0x01, 0x1c, 0x80, 0x59, 0x02, 0x4e, 0xa8, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x61, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x81, 0x71, 0x3d, 0x48, 0x44, 0x42, 0x4a, 0x66, 0x60, 0x5d, 0x1d, 0x8b, 0x73, 0xcc, 0x6c, 0xea, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0xd2, 0x41, 0x4a, 0x2d, 0x25, 0x47, 0x46, 0x7e, 0x4d, 0x56, 0x68, 0x08, 0x03, 0x45, 0x54, 0x60, 0x4b, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa7, 0x02, 0xe4, 0x00, 0x17, 0x00, 0x24, 0x00, 0x30, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xa7, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x44, 0x6c, 0x18, 0x37, 0x49, 0x6f, 0x76, 0x5f, 0x04, 0xbc, 0xf0, 0xfd, 0x15, 0x3b, 0x3b, 0x28, 0x36, 0x0a, 0x16, 0x74, 0x4e, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x41, 0x3a, 0x25, 0x89, 0x76, 0xcc, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x2d, 0x26, 0x40, 0x45, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x28, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x1c, 0x00, 0x25, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x28, 0x6f, 0x80, 0x35, 0x67, 0x41, 0x5d, 0x1b, 0x32, 0x89, 0x6c, 0x73, 0x5f, 0x04, 0x3d, 0xfd, 0x99, 0xf5, 0x3d, 0x3e, 0x3b, 0x3f, 0x01, 0x78, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x35, 0x30, 0x65, 0x8b, 0x73, 0xcc, 0x6c, 0xfe, 0xc8, 0xcc, 0xcc, 0x44, 0x4d, 0x4d, 0x43, 0xcd, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x65, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x36, 0x00, 0x3f, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0xa8, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x3e, 0x5a, 0x1a, 0x18, 0x5e, 0x44, 0x6c, 0x73, 0x5f, 0x05, 0x7a, 0xfc, 0x1d, 0x3f, 0xf5, 0x3d, 0x3e, 0x01, 0xe0, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x34, 0x2f, 0x30, 0x33, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xfe, 0xa3, 0x4d, 0x43, 0xcd, 0xcc, 0x44, 0x4d, 0x01, 0x5d, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xa6, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x22, 0x00, 0x26, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x37, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xa6, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x4d, 0x69, 0x11, 0x2d, 0x48, 0x64, 0x6b, 0x5f, 0x04, 0xbb, 0xfc, 0xb3, 0x31, 0x0c, 0x17, 0x69, 0x46, 0x4c, 0xfe, 0x24, 0x35, 0x36, 0x02, 0x7e, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x4a, 0x3f, 0x27, 0x87, 0x6f, 0xd4, 0x6c, 0xfe, 0x37, 0x24, 0x1f, 0x36, 0x38, 0xac, 0xd4, 0x40, 0x49, 0x01, 0x5d, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x76, 0x02, 0xe4, 0x00, 0x13, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x37, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x76, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x58, 0x7c, 0x1e, 0x3a, 0x60, 0x70, 0x77, 0x5f, 0x04, 0x8b, 0xfc, 0xfb, 0x39, 0x06, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0x6d, 0x39, 0x3b, 0x02, 0x46, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x4a, 0x44, 0x3d, 0x8b, 0x73, 0xcc, 0x6c, 0xfe, 0x37, 0x3b, 0x2f, 0x2a, 0x48, 0x4b, 0x36, 0xcc, 0x44, 0x4d, 0x01, 0x5d, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x2c, 0x05, 0x09, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x45, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x04, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x04, 0x34, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x5e, 0x7b, 0x16, 0x35, 0x48, 0x70, 0x77, 0x5f, 0x05, 0x1e, 0xfe, 0x37, 0x41, 0x34, 0xfd, 0x17, 0x39, 0x3b, 0x26, 0x34, 0x0d, 0x0f, 0x76, 0x53, 0x45, 0x55, 0x13, 0x03, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x59, 0x4c, 0x23, 0x8b, 0x73, 0xcc, 0x6c, 0x6c, 0xb4, 0x40, 0x0b, 0x69, 0xcc, 0x44, 0x4d, 0x25, 0x20, 0x56, 0x5d, 0x46, 0x37, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x1d, 0x02, 0xe4, 0x00, 0x13, 0x00, 0x22, 0x00, 0x30, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x1d, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x4d, 0x6d, 0x18, 0x35, 0x50, 0x70, 0x77, 0x5f, 0x04, 0x32, 0xfd, 0x4b, 0x36, 0x0c, 0x0e, 0x76, 0x5a, 0x39, 0x56, 0x1a, 0xfd, 0x9b, 0x39, 0x3b, 0x01, 0x95, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x4b, 0x42, 0x2a, 0x8b, 0x73, 0xcc, 0x6c, 0xfe, 0x37, 0x2a, 0x24, 0x54, 0x65, 0x2c, 0x27, 0xa9, 0xcc, 0x44, 0x4d, 0x69, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xb6, 0x02, 0xe4, 0x00, 0x20, 0x00, 0x2e, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x35, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x04, 0xb6, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x33, 0x49, 0x70, 0x78, 0x5f, 0x04, 0xcb, 0xfd, 0x99, 0x4a, 0xfe, 0x33, 0x39, 0x3b, 0x30, 0x39, 0x05, 0x51, 0x01, 0xc7, 0xad, 0x23, 0xd0, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x03, 0x26, 0x8b, 0x73, 0xcc, 0x6c, 0xfe, 0xb7, 0x4d, 0x44, 0x4c, 0xcc, 0x44, 0x4d, 0x3a, 0x2d, 0x19, 0xdd, 0x4c, 0x4c, 0x38, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x38, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x2a, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x01, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x06, 0x38, 0x6e, 0x81, 0x90, 0x34, 0x61, 0x41, 0x44, 0x60, 0x31, 0x3c, 0x32, 0x38, 0x37, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x06, 0x4d, 0xfb, 0x3c, 0x3c, 0xe4, 0x39, 0x39, 0x04, 0x0b, 0xfc, 0xe8, 0x15, 0x4d, 0x36, 0x3c, 0x59, 0x2f, 0x2e, 0x28, 0x29, 0x2e, 0x01, 0x0f, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x34, 0x58, 0x36, 0x08, 0x35, 0x40, 0x4b, 0x37, 0xfe, 0xd3, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0x01, 0x5d, 0xab, 0x26, 0x2b, 0x36, 0x5c, 0x36, 0x0c, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x06, 0x38, 0x02, 0xe4, 0x00, 0x22, 0x01, 0xc2, 0x00, 0x00, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x27, 0x00, 0xb0, 0x00, 0x07, 0x00, 0x7e, 0x05, 0x1d, 0x00, 0x6e, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x7c, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x31, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x04, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x03, 0xfb, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x3a, 0x37, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x05, 0x91, 0xbc, 0x7b, 0xfd, 0x2f, 0x3c, 0xe4, 0x39, 0x39, 0x02, 0x4c, 0x6f, 0x44, 0x05, 0xfd, 0xef, 0x17, 0x4f, 0x35, 0x63, 0x35, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x0b, 0x3f, 0x4a, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x6c, 0xc8, 0x95, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0xdc, 0x26, 0x5b, 0xaa, 0x25, 0x2b, 0x4b, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xb1, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x2e, 0x00, 0x3b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x01, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x05, 0xb1, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x02, 0x01, 0x3d, 0x35, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x05, 0xc6, 0xfb, 0xc3, 0x3c, 0xe4, 0x39, 0x39, 0x03, 0x83, 0xfd, 0x70, 0x17, 0x4e, 0x35, 0x37, 0x55, 0x19, 0x26, 0x65, 0x3b, 0x8b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x0c, 0x18, 0x48, 0x4c, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0x01, 0x5d, 0xab, 0x24, 0x2a, 0x34, 0x30, 0x1b, 0x1c, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xd5, 0x05, 0xb1, 0x02, 0xe4, 0x00, 0x22, 0x01, 0xc5, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x02, 0x27, 0x00, 0xb0, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x1b, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x45, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x31, 0x35, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x01, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x1b, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x01, 0x3c, 0x32, 0x3b, 0x3a, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x06, 0x30, 0xfb, 0x59, 0x3c, 0xe4, 0x39, 0x39, 0x03, 0xed, 0xfd, 0x06, 0x16, 0x4b, 0x34, 0x31, 0x51, 0x18, 0x3d, 0x59, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x02, 0x09, 0x3e, 0x41, 0x51, 0x3f, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0x01, 0x5d, 0xa7, 0x24, 0x29, 0x2d, 0x2a, 0x2c, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x6d, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x24, 0x00, 0x2c, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x6d, 0x6f, 0x80, 0x35, 0x67, 0x5b, 0x6d, 0x0f, 0x0b, 0x33, 0x27, 0x3a, 0x3b, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x05, 0x82, 0xfc, 0x07, 0x3c, 0xe4, 0x39, 0x39, 0x01, 0xaa, 0x1e, 0xd5, 0x16, 0x49, 0x32, 0x01, 0xbc, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x66, 0x58, 0x20, 0x23, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0xfa, 0x0c, 0x6f, 0xad, 0x23, 0x27, 0x63, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xaa, 0x02, 0xe4, 0x00, 0x35, 0x00, 0x3e, 0x00, 0x46, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x17, 0x35, 0x23, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xed, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x57, 0x6a, 0x0e, 0x0b, 0x34, 0x26, 0x3a, 0x3b, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x06, 0xbf, 0xfa, 0xca, 0x3c, 0xe4, 0x39, 0x39, 0x01, 0xaa, 0x1e, 0xd5, 0x16, 0x49, 0x32, 0x01, 0xaa, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x64, 0x56, 0x21, 0x26, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x6c, 0xfe, 0xa3, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0xfa, 0x0c, 0x6f, 0xad, 0x23, 0x27, 0x63, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0xff, 0xff, 0xff, 0xeb, 0xff, 0xd5, 0x06, 0xaa, 0x02, 0xe4, 0x00, 0x22, 0x01, 0xc9, 0x00, 0x00, 0x00, 0x27, 0x00, 0x7e, 0x02, 0x27, 0x00, 0xb0, 0x00, 0x07, 0x00, 0x7e, 0x04, 0xe3, 0x00, 0xb0, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xd2, 0x02, 0xe4, 0x00, 0x1c, 0x00, 0x25, 0x00, 0x30, 0x00, 0x3b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x16, 0x17, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xd2, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x7a, 0x8d, 0x05, 0x08, 0x34, 0x29, 0x3a, 0x3c, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x05, 0xe7, 0xfb, 0xa2, 0x3c, 0xe4, 0x39, 0x39, 0x01, 0xc9, 0x52, 0x17, 0x4c, 0xfe, 0x75, 0x17, 0x4f, 0x36, 0x02, 0x15, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8d, 0x76, 0x22, 0x2d, 0x51, 0x3f, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0xfc, 0x35, 0x2f, 0x1f, 0x67, 0x3f, 0xae, 0x24, 0x29, 0x61, 0x56, 0xb2, 0x0e, 0x43, 0x56, 0x60, 0x4b, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x72, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x47, 0x00, 0x59, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x31, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x37, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x05, 0x9d, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x01, 0x37, 0x35, 0x36, 0x39, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x06, 0x87, 0xfb, 0x02, 0x3c, 0xe4, 0x39, 0x39, 0x03, 0x6b, 0x41, 0x34, 0xfd, 0x13, 0x16, 0x4d, 0x33, 0x57, 0x2f, 0x1e, 0x4f, 0x2e, 0x45, 0x55, 0x13, 0x03, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x04, 0x3e, 0x46, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x6c, 0xfe, 0xa3, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0xa9, 0x40, 0x0b, 0x69, 0xad, 0x23, 0x29, 0x3e, 0x1d, 0x1d, 0x46, 0x37, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf8, 0x06, 0x24, 0x02, 0xed, 0x00, 0x2b, 0x00, 0x31, 0x00, 0x42, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x17, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x04, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x15, 0x36, 0x36, 0x33, 0x04, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x03, 0x95, 0x30, 0x31, 0x2a, 0x30, 0x7e, 0x01, 0x73, 0x63, 0x6c, 0x7a, 0x3b, 0x32, 0x3b, 0x3a, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x03, 0xcb, 0x1e, 0x27, 0x64, 0x79, 0x93, 0x75, 0x02, 0x54, 0x6d, 0x84, 0xfd, 0xcd, 0x5a, 0x17, 0x30, 0x4e, 0x66, 0x30, 0x2b, 0x11, 0x0d, 0xfe, 0x55, 0x15, 0x49, 0x33, 0xfe, 0xb2, 0x3c, 0xe4, 0x39, 0x39, 0x01, 0x2b, 0x55, 0x31, 0x3d, 0x37, 0x2e, 0x0e, 0x10, 0x62, 0x71, 0x7d, 0x6a, 0x4c, 0x36, 0x42, 0x51, 0x3e, 0xfe, 0xec, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0x09, 0x73, 0x68, 0x71, 0x76, 0x01, 0xb9, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0xd8, 0x3e, 0x36, 0x3f, 0x43, 0x2e, 0x35, 0x05, 0xb6, 0x23, 0x27, 0xf1, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xd5, 0x06, 0x1b, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x32, 0x00, 0x3d, 0x00, 0x43, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x23, 0x15, 0x14, 0x16, 0x33, 0x24, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x06, 0x1b, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x3c, 0x32, 0x3b, 0x39, 0x81, 0x31, 0x61, 0x66, 0x6e, 0x5f, 0x06, 0x30, 0xfb, 0x59, 0x3c, 0xe4, 0x39, 0x39, 0x02, 0xc0, 0xfe, 0x33, 0x17, 0x4e, 0x36, 0x3e, 0x5b, 0x16, 0x01, 0xb0, 0xad, 0x23, 0xd0, 0xfb, 0xe5, 0x2e, 0x2e, 0x21, 0x20, 0x2e, 0x2e, 0x20, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x6e, 0x30, 0x40, 0x51, 0x3f, 0xfe, 0xe1, 0xef, 0x41, 0x88, 0x70, 0xd2, 0x6c, 0xfe, 0x37, 0x47, 0x36, 0xe0, 0xd2, 0x41, 0x4a, 0x8c, 0x85, 0x4c, 0xad, 0x23, 0x28, 0x42, 0x38, 0xdc, 0x4c, 0x4c, 0x38, 0xfe, 0xc9, 0x2e, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2e, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xf3, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x30, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x17, 0x15, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xf3, 0x6f, 0x81, 0x90, 0x6c, 0x61, 0x5f, 0x31, 0x22, 0x6e, 0x46, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x52, 0x75, 0x3f, 0x03, 0x01, 0x2d, 0x28, 0x29, 0x2e, 0x01, 0x0e, 0xfb, 0xe8, 0x05, 0x08, 0xfc, 0x16, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x61, 0x76, 0x37, 0x2d, 0x34, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x3f, 0x67, 0x3c, 0x01, 0x2e, 0x37, 0x39, 0x30, 0xa2, 0x8c, 0x6c, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x04, 0xf3, 0x02, 0xe4, 0x00, 0x22, 0x01, 0xcf, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x03, 0xd7, 0x00, 0x6e, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xb9, 0x02, 0xe4, 0x00, 0x30, 0x00, 0x3c, 0x00, 0x45, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x17, 0x15, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x24, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x06, 0xb9, 0x6e, 0x82, 0x1f, 0x66, 0x43, 0x74, 0x8b, 0x0c, 0x83, 0x6c, 0x61, 0x5f, 0x31, 0x22, 0x6e, 0x46, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x52, 0x75, 0x3f, 0x03, 0x01, 0x2d, 0x28, 0x29, 0x2e, 0x01, 0x0f, 0x54, 0x4b, 0xfb, 0x48, 0x06, 0xce, 0xf0, 0xa7, 0x5a, 0x54, 0x02, 0x58, 0x4d, 0x4e, 0x60, 0xfb, 0x40, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0xb2, 0x28, 0x2d, 0x88, 0x77, 0x15, 0x61, 0x76, 0x37, 0x2d, 0x34, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x3f, 0x67, 0x3c, 0x01, 0x2e, 0x37, 0x39, 0x30, 0x7d, 0x3c, 0x3f, 0x36, 0x6c, 0x6c, 0x4d, 0x50, 0x62, 0x0a, 0x4c, 0x5a, 0x5f, 0x4c, 0x5c, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xaf, 0x05, 0x4b, 0x02, 0xe4, 0x00, 0x3b, 0x00, 0x47, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x15, 0x26, 0x23, 0x22, 0x07, 0x17, 0x36, 0x35, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x03, 0x11, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x04, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x05, 0x4b, 0x6e, 0x7f, 0x94, 0x1b, 0x57, 0x50, 0x38, 0x45, 0x13, 0x75, 0x6e, 0x05, 0x3a, 0x30, 0x2c, 0x2c, 0x36, 0x35, 0x70, 0x3a, 0x29, 0x14, 0x7a, 0x62, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x2a, 0x29, 0x27, 0x26, 0x3e, 0x2c, 0xf1, 0x1e, 0x68, 0x4f, 0x7e, 0xfc, 0xcc, 0x05, 0x60, 0xed, 0xc3, 0xdb, 0x25, 0x32, 0x2b, 0x24, 0x63, 0xfd, 0x8c, 0x2b, 0x47, 0x2a, 0x3d, 0x28, 0xf0, 0x11, 0x02, 0x78, 0xfd, 0x88, 0xe8, 0x25, 0x37, 0x43, 0x55, 0x27, 0x17, 0x83, 0xfb, 0x26, 0x31, 0x29, 0x20, 0x26, 0x2c, 0x02, 0x18, 0x57, 0x6b, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x0b, 0x58, 0x0c, 0x24, 0xc1, 0x33, 0x43, 0x22, 0x4d, 0x4c, 0x5a, 0x6c, 0xfe, 0x65, 0x01, 0x2f, 0xb7, 0x1b, 0x22, 0x1e, 0x1d, 0x40, 0x45, 0x24, 0x23, 0xc0, 0x22, 0x2a, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x70, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x2e, 0x00, 0x37, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x70, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x53, 0x7b, 0x1e, 0x44, 0x6c, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x54, 0x75, 0x1d, 0x4c, 0x84, 0x8b, 0xfc, 0x6b, 0x04, 0x85, 0xfc, 0x99, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x3f, 0x3f, 0x3a, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x42, 0x38, 0x3f, 0x8a, 0x6c, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0x19, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x35, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x24, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0xb2, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x34, 0x58, 0x1e, 0x21, 0x66, 0x43, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x49, 0x6a, 0x20, 0x25, 0x6e, 0x42, 0x32, 0xfc, 0xd2, 0x04, 0x2e, 0x01, 0x7d, 0xa7, 0xfe, 0x15, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x27, 0x26, 0x28, 0x2d, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x32, 0x2b, 0x27, 0x2a, 0x5b, 0x6c, 0x6c, 0xca, 0x22, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x7d, 0x02, 0xed, 0x00, 0x4d, 0x00, 0x56, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x15, 0x26, 0x23, 0x22, 0x06, 0x07, 0x17, 0x36, 0x37, 0x33, 0x36, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x00, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x7d, 0x6d, 0x81, 0x20, 0x6d, 0x48, 0x3b, 0x61, 0x1e, 0x20, 0x64, 0x3e, 0x46, 0x76, 0x46, 0x41, 0x73, 0x49, 0x29, 0x1f, 0x1e, 0x1e, 0x1e, 0x38, 0x15, 0xf0, 0x0e, 0x05, 0x01, 0x09, 0x42, 0x28, 0x35, 0x48, 0x08, 0xfe, 0x0f, 0x02, 0x5f, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x43, 0x38, 0x51, 0x64, 0xee, 0xfc, 0x2a, 0x2b, 0x49, 0x2c, 0x39, 0x27, 0xee, 0x12, 0x02, 0x78, 0xfd, 0x88, 0xb9, 0x30, 0x34, 0x25, 0x24, 0x2a, 0x2e, 0x39, 0x6d, 0x4b, 0x48, 0x6e, 0x3d, 0x09, 0x56, 0x08, 0x14, 0x12, 0xc2, 0x19, 0x21, 0x30, 0x3b, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2a, 0x2c, 0x66, 0x53, 0x01, 0x6b, 0xfe, 0x22, 0x43, 0x24, 0x22, 0xc0, 0x21, 0x2c, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x09, 0x02, 0xed, 0x00, 0x5b, 0x00, 0x69, 0x00, 0x72, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x15, 0x26, 0x23, 0x22, 0x06, 0x07, 0x17, 0x36, 0x37, 0x33, 0x36, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x23, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x06, 0x09, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x48, 0x68, 0x1a, 0x3f, 0xa0, 0x44, 0x69, 0x1e, 0x21, 0x63, 0x3e, 0x46, 0x76, 0x46, 0x41, 0x73, 0x49, 0x29, 0x1f, 0x1e, 0x1e, 0x1e, 0x38, 0x15, 0xf0, 0x0e, 0x05, 0x01, 0x09, 0x42, 0x28, 0x35, 0x48, 0x08, 0xfe, 0x0f, 0x02, 0x5f, 0x1d, 0x22, 0x52, 0x5d, 0x02, 0x60, 0x01, 0x28, 0x22, 0x22, 0x29, 0x4d, 0x3b, 0x3b, 0x35, 0x36, 0x3b, 0x4b, 0x39, 0x48, 0x5c, 0x0c, 0x04, 0x3a, 0x63, 0x40, 0x38, 0x57, 0x19, 0xfe, 0x82, 0x01, 0x24, 0x3c, 0x1e, 0x45, 0x40, 0x3b, 0x4c, 0x4c, 0x3b, 0xfc, 0x10, 0x2b, 0x49, 0x2c, 0x39, 0x27, 0xee, 0x12, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x41, 0x3a, 0x72, 0x25, 0x25, 0x2a, 0x2e, 0x39, 0x6d, 0x4b, 0x48, 0x6e, 0x3d, 0x09, 0x56, 0x08, 0x14, 0x12, 0xc2, 0x19, 0x21, 0x30, 0x3b, 0x08, 0x04, 0x0e, 0x54, 0x43, 0x1c, 0x1b, 0x6c, 0x09, 0x5b, 0x4a, 0x10, 0x16, 0x16, 0x20, 0x29, 0x2c, 0x22, 0x30, 0x33, 0x68, 0x2c, 0x26, 0x2c, 0x2a, 0x48, 0x48, 0x3d, 0x60, 0x35, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x54, 0x43, 0x24, 0x22, 0xc0, 0x21, 0x2c, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xe4, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xe4, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x32, 0x58, 0x1e, 0x21, 0x67, 0x44, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x4e, 0x70, 0x1f, 0x1e, 0x54, 0x31, 0x01, 0x35, 0xfb, 0xf7, 0x04, 0xf9, 0xfc, 0x25, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x01, 0x9e, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0xfd, 0xf1, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x24, 0x22, 0x29, 0x2e, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x3a, 0x32, 0x1b, 0x1b, 0x85, 0x6c, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xfe, 0xf4, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x45, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x65, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x34, 0x00, 0x3d, 0x00, 0x46, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x04, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x04, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x65, 0x6e, 0x7c, 0x19, 0x59, 0x3a, 0x3c, 0x64, 0x20, 0x22, 0x68, 0x45, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x47, 0x68, 0x20, 0x20, 0x64, 0x3c, 0x38, 0x59, 0x1c, 0xfc, 0x70, 0x04, 0x7a, 0xfe, 0x48, 0x2a, 0xed, 0x12, 0x24, 0x46, 0x30, 0xfe, 0x21, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x01, 0x0a, 0x2a, 0x48, 0x2b, 0x3c, 0x28, 0xef, 0x12, 0xfe, 0x5a, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x98, 0x25, 0x2c, 0x2f, 0x2b, 0x2b, 0x30, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x2f, 0x2a, 0x2a, 0x2e, 0x2b, 0x24, 0x9f, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x21, 0x28, 0x28, 0x46, 0x2a, 0x03, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc4, 0x44, 0x24, 0x23, 0xbe, 0x22, 0x29, 0x31, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xee, 0x02, 0xed, 0x00, 0x31, 0x00, 0x3a, 0x00, 0x43, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x27, 0x15, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xee, 0x6f, 0x82, 0x8b, 0x68, 0x62, 0x36, 0x54, 0x1b, 0x22, 0x62, 0x3f, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x56, 0x76, 0x1d, 0x36, 0x50, 0x4b, 0x21, 0x23, 0x0d, 0x10, 0x2e, 0xfd, 0x81, 0x02, 0x83, 0x1d, 0x25, 0x66, 0x5c, 0x8b, 0xfd, 0x0c, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x52, 0x47, 0x2b, 0x36, 0x30, 0x25, 0x28, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x69, 0x73, 0x24, 0x22, 0x24, 0x28, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x47, 0x3a, 0x24, 0x53, 0x2d, 0x33, 0x07, 0x01, 0x01, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x2c, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xad, 0x05, 0x03, 0x02, 0xed, 0x00, 0x33, 0x00, 0x3c, 0x00, 0x45, 0x00, 0x50, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x03, 0x6f, 0x74, 0xe8, 0x8d, 0x01, 0x6d, 0xa6, 0x6b, 0x5e, 0x32, 0x51, 0x1b, 0x22, 0x66, 0x43, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x55, 0x74, 0x1d, 0x37, 0x54, 0x4c, 0x23, 0x24, 0x12, 0x0d, 0xfd, 0x55, 0x02, 0x83, 0x1d, 0x26, 0x65, 0x5c, 0xa6, 0xfc, 0xf1, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x55, 0x4c, 0x2a, 0x34, 0x2f, 0x25, 0x2b, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x96, 0xe9, 0x01, 0x5b, 0x62, 0x2e, 0x64, 0x77, 0x1e, 0x1d, 0x29, 0x2d, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x44, 0x39, 0x25, 0x4e, 0x2d, 0x33, 0x07, 0x6c, 0x09, 0x7c, 0x69, 0x37, 0x01, 0x13, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x33, 0x2b, 0x26, 0x23, 0x2a, 0x37, 0x31, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x9f, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x2b, 0x00, 0x34, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x24, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x9f, 0x6e, 0x82, 0x1f, 0x66, 0x44, 0x42, 0x68, 0x22, 0x20, 0x6e, 0x4c, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x52, 0x73, 0x1e, 0x35, 0x32, 0xfd, 0x62, 0x04, 0xb4, 0xf0, 0xa6, 0x5a, 0x59, 0x09, 0x55, 0x4d, 0x4e, 0x60, 0xfd, 0x5a, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x2b, 0x28, 0x32, 0x38, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x40, 0x35, 0x0b, 0x46, 0x3d, 0x36, 0x6c, 0x6c, 0x4d, 0x54, 0x75, 0x09, 0x42, 0x4e, 0x60, 0x4b, 0x5c, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x2c, 0x05, 0x33, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x4e, 0x00, 0x57, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x5f, 0x3d, 0x48, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x33, 0x33, 0x34, 0x39, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x43, 0x64, 0x1d, 0x21, 0x63, 0x3f, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x47, 0x6a, 0x20, 0x1c, 0x4f, 0x2e, 0x45, 0x55, 0x13, 0x04, 0x10, 0x41, 0x34, 0xfc, 0x0c, 0x05, 0x48, 0xfb, 0xd6, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0x74, 0x17, 0x72, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x35, 0x31, 0x24, 0x28, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x30, 0x2b, 0x22, 0x23, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0xa8, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x1e, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x50, 0x00, 0x59, 0x00, 0x62, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x24, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x07, 0x1e, 0x6f, 0x81, 0x1f, 0x65, 0x45, 0x7c, 0x8c, 0x05, 0x09, 0x2e, 0x26, 0x37, 0x36, 0x6c, 0x33, 0x33, 0x34, 0x39, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x43, 0x64, 0x1d, 0x21, 0x63, 0x3f, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x47, 0x6a, 0x20, 0x1c, 0x4f, 0x2e, 0x45, 0x55, 0x13, 0x04, 0x13, 0x56, 0x48, 0x36, 0x57, 0x18, 0x2d, 0x2b, 0xfa, 0xe3, 0x07, 0x33, 0xf0, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0xfa, 0xdb, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8b, 0x77, 0x1c, 0x27, 0x4e, 0x41, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x35, 0x31, 0x24, 0x28, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x30, 0x2b, 0x22, 0x23, 0x46, 0x37, 0x37, 0x46, 0x35, 0x2f, 0x0d, 0x45, 0x38, 0x3f, 0x6c, 0x6c, 0x56, 0xb2, 0x0e, 0x45, 0x54, 0x60, 0x4b, 0x5c, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x53, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x39, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0x53, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x39, 0x5b, 0x1e, 0x21, 0x67, 0x44, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x45, 0x68, 0x21, 0x1f, 0x5a, 0x38, 0x39, 0x56, 0x1a, 0xfc, 0x84, 0x04, 0x68, 0xfc, 0xb6, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x01, 0xc8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0xc7, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x2b, 0x27, 0x29, 0x2e, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x2e, 0x29, 0x26, 0x2a, 0x2c, 0x27, 0xa9, 0x6c, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xfe, 0xe2, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x57, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf8, 0x04, 0xed, 0x02, 0xed, 0x00, 0x33, 0x00, 0x39, 0x00, 0x42, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x02, 0x5e, 0x2f, 0x32, 0x2a, 0x2f, 0x7f, 0x73, 0x62, 0x4e, 0x6b, 0x15, 0x21, 0x5b, 0x38, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x5d, 0x79, 0x1a, 0x3c, 0x4e, 0x66, 0x31, 0x2a, 0x13, 0x0d, 0xfd, 0x47, 0x02, 0x95, 0x1e, 0x26, 0x65, 0x79, 0x46, 0x77, 0x4c, 0x02, 0x54, 0x6e, 0x84, 0xfd, 0x0e, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x01, 0x2b, 0x55, 0x31, 0x3d, 0x37, 0x2e, 0x0e, 0x10, 0x62, 0x71, 0x4a, 0x42, 0x1d, 0x21, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x50, 0x41, 0x3f, 0x43, 0x2d, 0x36, 0x05, 0x6c, 0x09, 0x73, 0x68, 0x4c, 0x68, 0x33, 0x01, 0xb9, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0xfe, 0xec, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xe3, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x30, 0x00, 0x39, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x24, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xe3, 0x6f, 0x81, 0xfe, 0x69, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x4b, 0x62, 0x13, 0x46, 0x6c, 0x4f, 0x76, 0x40, 0x40, 0x76, 0x4e, 0x5b, 0x7a, 0x1a, 0x4f, 0x4a, 0xfd, 0x24, 0x04, 0xf8, 0xf0, 0xab, 0x24, 0xcf, 0xfd, 0x16, 0x2d, 0xee, 0x12, 0x24, 0x45, 0x30, 0x9c, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x4b, 0x40, 0x3c, 0x3f, 0x6f, 0x46, 0x45, 0x6d, 0x3d, 0x4e, 0x40, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4d, 0x37, 0x28, 0x23, 0xbf, 0x23, 0x26, 0x28, 0x46, 0x2b, 0xc7, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x00, 0x00, 0x03, 0x00, 0x3f, 0x00, 0x00, 0x05, 0x55, 0x02, 0xed, 0x00, 0x39, 0x00, 0x45, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x55, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5c, 0x39, 0x3c, 0x63, 0x3a, 0x08, 0x7d, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0xc9, 0x3b, 0x54, 0x01, 0x35, 0xfd, 0xe8, 0x03, 0x08, 0xfd, 0xfe, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x38, 0x2e, 0xfe, 0x37, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x20, 0x1e, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x27, 0x85, 0x6c, 0xfd, 0xe0, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x9f, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0x00, 0x3f, 0x00, 0x00, 0x05, 0x08, 0x02, 0xed, 0x00, 0x32, 0x00, 0x3d, 0x00, 0x48, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x08, 0x70, 0x81, 0x1f, 0x66, 0x45, 0x79, 0x8d, 0x06, 0x69, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0x95, 0x44, 0x40, 0xb0, 0x02, 0xc7, 0xf1, 0xa7, 0xaf, 0x59, 0x50, 0x4d, 0x60, 0xfd, 0x48, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x33, 0x43, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x11, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0x00, 0x3f, 0xff, 0xad, 0x05, 0x08, 0x02, 0xed, 0x00, 0x34, 0x00, 0x3f, 0x00, 0x4a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x07, 0x23, 0x01, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x08, 0x70, 0x81, 0x1f, 0x66, 0x45, 0x74, 0x47, 0xf5, 0x8e, 0x01, 0x4e, 0x19, 0x03, 0x6c, 0x69, 0x5f, 0x5c, 0x72, 0x78, 0x5e, 0x4c, 0x49, 0x1f, 0x26, 0x03, 0x7e, 0x04, 0x65, 0x5d, 0x64, 0x5b, 0x98, 0x44, 0x40, 0xb0, 0x02, 0xc7, 0xf1, 0xa7, 0xaf, 0x59, 0x50, 0x4d, 0x60, 0xfd, 0x4a, 0x4b, 0x2a, 0x36, 0x30, 0x26, 0x2a, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x42, 0xf2, 0x01, 0x3c, 0x36, 0x4b, 0x2e, 0x64, 0x77, 0x65, 0x53, 0x56, 0x5d, 0x53, 0x60, 0x2b, 0x24, 0x0d, 0x14, 0x1a, 0x0e, 0x51, 0x65, 0x7c, 0x69, 0x3c, 0x33, 0x43, 0x36, 0x6c, 0x6c, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x0a, 0x2c, 0x25, 0x23, 0x2a, 0x37, 0x31, 0x00, 0x02, 0x00, 0x3f, 0x00, 0x2c, 0x05, 0xb5, 0x02, 0xed, 0x00, 0x5a, 0x00, 0x65, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xdf, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x22, 0x1c, 0x3b, 0x43, 0x36, 0x32, 0x36, 0x35, 0x6b, 0x34, 0x33, 0x34, 0x38, 0x43, 0x3b, 0x1c, 0x1c, 0x06, 0x50, 0x72, 0x3a, 0x06, 0x7b, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0xac, 0x1e, 0x56, 0x32, 0x45, 0x56, 0x13, 0x04, 0x10, 0x41, 0x34, 0xfd, 0xde, 0x03, 0x76, 0xfb, 0xaa, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x40, 0x72, 0x49, 0x20, 0x1c, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x23, 0x24, 0x47, 0x36, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0xfe, 0xeb, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0x00, 0x3f, 0x00, 0x00, 0x04, 0xc2, 0x02, 0xed, 0x00, 0x38, 0x00, 0x46, 0x00, 0x51, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xc2, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x44, 0x67, 0x37, 0x03, 0x76, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x78, 0x5e, 0x4a, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x65, 0x5d, 0x66, 0x5c, 0x9f, 0x1e, 0x5d, 0x3b, 0x38, 0x56, 0x1a, 0xfe, 0x6e, 0x01, 0x37, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4c, 0x4b, 0x3b, 0xfe, 0x10, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x5c, 0x63, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x53, 0x66, 0x7c, 0x69, 0x3c, 0x29, 0x2d, 0x2b, 0x27, 0xa8, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x49, 0x3a, 0x3c, 0x49, 0xb1, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xd2, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x33, 0x36, 0x33, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xd2, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x15, 0x8b, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xe7, 0xf0, 0xfd, 0xe2, 0xf0, 0x44, 0x5f, 0x8b, 0xfd, 0x6a, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x3e, 0x2e, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xac, 0x22, 0x8b, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0x82, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x31, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x1b, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0x04, 0x85, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0x97, 0x01, 0x7d, 0xa7, 0xbd, 0x6d, 0x43, 0x32, 0xfe, 0x42, 0xb8, 0xfe, 0xd0, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x12, 0x20, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xca, 0x46, 0x29, 0x5b, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x47, 0x02, 0xe4, 0x00, 0x21, 0x00, 0x28, 0x00, 0x34, 0x00, 0x3f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x33, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x47, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x08, 0x83, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x05, 0x5c, 0xf0, 0xfd, 0x6d, 0xcf, 0x3b, 0x54, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0xfe, 0x33, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x20, 0x1e, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xac, 0x27, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x9f, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xbc, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x1d, 0x00, 0x26, 0x00, 0x31, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x35, 0x23, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xbc, 0x6f, 0x80, 0x35, 0x67, 0x58, 0x6d, 0x10, 0x98, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xd1, 0xfd, 0x08, 0x91, 0x91, 0x02, 0x09, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfd, 0x7f, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x61, 0x54, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0xac, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x3b, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0xbc, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x33, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x35, 0x23, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xbc, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x4c, 0x5f, 0x0f, 0x98, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xd1, 0xfd, 0x08, 0x91, 0x91, 0x02, 0x09, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfd, 0x7f, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x07, 0x5c, 0x4b, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0xac, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x3b, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xd1, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x27, 0x00, 0x30, 0x00, 0x39, 0x00, 0x44, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x04, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x07, 0x17, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xd1, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0x03, 0x86, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xe6, 0xfd, 0xa4, 0x20, 0x67, 0x3d, 0x39, 0x57, 0x1d, 0xfd, 0xde, 0x02, 0x29, 0x24, 0x45, 0x30, 0x3b, 0x2a, 0xed, 0xfe, 0xdc, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0xfe, 0x94, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0x2c, 0x30, 0x2a, 0x24, 0x9e, 0xac, 0xb6, 0x25, 0x28, 0x46, 0x2a, 0x22, 0xbf, 0x1a, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x29, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x06, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xab, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x30, 0x00, 0x3c, 0x00, 0x45, 0x00, 0x4e, 0x00, 0x59, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x07, 0x17, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0xab, 0x6e, 0x82, 0x1f, 0x66, 0x44, 0x42, 0x68, 0x22, 0x20, 0x6e, 0x4c, 0x4f, 0x76, 0x40, 0x03, 0x86, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x06, 0xc0, 0xfb, 0xcb, 0x22, 0x6d, 0x46, 0x52, 0x73, 0x1e, 0x35, 0x32, 0xfd, 0x2f, 0x03, 0xf7, 0xa6, 0x5a, 0x59, 0x09, 0x55, 0x4d, 0x4e, 0x60, 0xfe, 0x2d, 0x24, 0x45, 0x30, 0x3a, 0x2d, 0xee, 0xfe, 0xdd, 0x2b, 0x47, 0x2a, 0x3b, 0x2a, 0xef, 0x12, 0xfe, 0x99, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x2b, 0x28, 0x32, 0x38, 0x3f, 0x6f, 0x46, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0x2c, 0x31, 0x40, 0x35, 0x0b, 0x46, 0x3d, 0x36, 0xac, 0xac, 0x4d, 0x54, 0x75, 0x09, 0x42, 0x4e, 0x60, 0x4b, 0x63, 0x26, 0x28, 0x46, 0x2b, 0x23, 0xbf, 0x1b, 0x45, 0x24, 0x23, 0xbf, 0x22, 0x29, 0x2c, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xc5, 0x04, 0xd0, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x29, 0x00, 0x32, 0x00, 0x3b, 0x00, 0x46, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x2e, 0x02, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x05, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x07, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xd0, 0x6d, 0x7d, 0x0f, 0x01, 0xaf, 0x89, 0x88, 0x40, 0x65, 0x3a, 0x03, 0x86, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xe5, 0xfd, 0xa5, 0x20, 0x67, 0x3d, 0x39, 0x57, 0x1d, 0xfd, 0xde, 0x02, 0x18, 0x11, 0x24, 0x45, 0x30, 0x3b, 0x2a, 0x37, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0xfe, 0x94, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x98, 0x12, 0x01, 0xc0, 0x8a, 0x05, 0x3c, 0x67, 0x43, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0x2c, 0x30, 0x2a, 0x24, 0x9e, 0xac, 0xda, 0x24, 0x25, 0x28, 0x46, 0x2a, 0x22, 0xa5, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x29, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x58, 0x02, 0xed, 0x00, 0x28, 0x00, 0x31, 0x00, 0x3c, 0x00, 0x47, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x03, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x58, 0x6f, 0x82, 0x8a, 0x69, 0x62, 0x3d, 0x5d, 0x34, 0x15, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x02, 0xed, 0x1d, 0x25, 0x66, 0x5d, 0x8a, 0xfd, 0x5d, 0x01, 0xa0, 0x22, 0x23, 0x0f, 0x0c, 0xfe, 0xc0, 0x78, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x18, 0x48, 0x2b, 0x36, 0x30, 0x25, 0x28, 0x2c, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x32, 0x24, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0xe8, 0x53, 0x2d, 0x33, 0x07, 0xfe, 0xeb, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x42, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x0d, 0x02, 0xed, 0x00, 0x33, 0x00, 0x44, 0x00, 0x4f, 0x00, 0x5a, 0x00, 0x65, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x23, 0x21, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x07, 0x0d, 0x70, 0x81, 0x1f, 0x66, 0x45, 0x79, 0x8d, 0x06, 0x69, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x12, 0x92, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x02, 0xeb, 0x20, 0x25, 0x66, 0x5c, 0x95, 0x44, 0x40, 0xb0, 0x02, 0xc7, 0xfa, 0xb7, 0x01, 0xa0, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x0a, 0x9f, 0x04, 0x58, 0xa7, 0xaf, 0x59, 0x50, 0x4d, 0x60, 0xfb, 0x30, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x18, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8c, 0x7a, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x32, 0x24, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x33, 0x43, 0x36, 0x6c, 0xfe, 0xe8, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x60, 0x4b, 0x11, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x42, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xad, 0x05, 0x6f, 0x02, 0xed, 0x00, 0x2b, 0x00, 0x33, 0x00, 0x3e, 0x00, 0x49, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x01, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x21, 0x35, 0x34, 0x23, 0x22, 0x07, 0x21, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x6f, 0x70, 0x74, 0xe8, 0x8c, 0x01, 0x6d, 0xa7, 0x6a, 0x5f, 0x5d, 0x71, 0x10, 0x92, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x02, 0xf1, 0x1d, 0x24, 0x65, 0x5b, 0xa7, 0xfd, 0x40, 0x01, 0xa4, 0x48, 0x12, 0x0d, 0xfe, 0xc3, 0x01, 0xa4, 0x4b, 0x2b, 0x35, 0x30, 0x25, 0x2a, 0x2c, 0xfd, 0xe4, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x95, 0xe8, 0x01, 0x5b, 0x5d, 0x2e, 0x64, 0x76, 0x64, 0x54, 0x2b, 0x23, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0xe8, 0x53, 0x60, 0x07, 0xfe, 0xed, 0x2b, 0x25, 0x23, 0x2b, 0x38, 0x31, 0x33, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xc7, 0x02, 0xed, 0x00, 0x39, 0x00, 0x4a, 0x00, 0x58, 0x00, 0x63, 0x00, 0x6e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x01, 0x21, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x23, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0xc7, 0x6e, 0x7f, 0x1a, 0x56, 0x38, 0x44, 0x67, 0x37, 0x03, 0x76, 0x69, 0x61, 0x3d, 0x5e, 0x34, 0x12, 0x92, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x02, 0xeb, 0x20, 0x25, 0x66, 0x5c, 0x9f, 0x1e, 0x5d, 0x3b, 0x38, 0x56, 0x1a, 0xfe, 0x6e, 0xfd, 0x7c, 0x01, 0xa0, 0x21, 0x23, 0x1f, 0x26, 0x04, 0x82, 0x04, 0x0a, 0x9f, 0x03, 0xbb, 0x3d, 0x1e, 0x46, 0x40, 0x3a, 0x4c, 0x4b, 0x3b, 0xfb, 0xf8, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x18, 0x47, 0x2c, 0x35, 0x30, 0x25, 0x28, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x30, 0x58, 0x39, 0x32, 0x24, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x29, 0x2d, 0x2b, 0x27, 0xa8, 0x6c, 0xfe, 0xe8, 0x53, 0x2d, 0x33, 0x2c, 0x24, 0x12, 0x10, 0x16, 0x11, 0x26, 0x1e, 0xfe, 0x3a, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x49, 0x3a, 0x3c, 0x49, 0xb1, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x42, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x5c, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x22, 0x00, 0x26, 0x00, 0x31, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x21, 0x35, 0x21, 0x21, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x5c, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x12, 0x8b, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x05, 0x71, 0xfc, 0x68, 0x01, 0x9a, 0xfe, 0x66, 0x02, 0xa7, 0x95, 0x95, 0xfc, 0xe1, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x12, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x32, 0x24, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0xac, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x42, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x10, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x38, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x10, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x78, 0x5d, 0x4c, 0xfe, 0x9f, 0x05, 0x25, 0xfc, 0xb4, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0x2c, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x5c, 0x64, 0xb2, 0x6c, 0xfe, 0xe2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x19, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x2c, 0x05, 0xab, 0x02, 0xe4, 0x00, 0x3c, 0x00, 0x4a, 0x00, 0x55, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x36, 0x37, 0x35, 0x21, 0x15, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xd6, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x05, 0x85, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x05, 0xc0, 0xfe, 0x37, 0x41, 0x34, 0xfd, 0x6d, 0xb6, 0x1e, 0x56, 0x33, 0x45, 0x55, 0x13, 0x03, 0xfd, 0x7b, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x1c, 0x20, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xb4, 0x40, 0x0b, 0x69, 0xac, 0x23, 0x24, 0x46, 0x37, 0x33, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xc0, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x27, 0x00, 0x35, 0x00, 0x40, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xc0, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x03, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0xd5, 0xfd, 0xb5, 0x1e, 0x5e, 0x3a, 0x39, 0x56, 0x1a, 0xfd, 0xf0, 0x01, 0xb4, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0xff, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x16, 0x13, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0xfe, 0xe8, 0x29, 0x2d, 0x2c, 0x27, 0xa9, 0xac, 0xfe, 0xe6, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0xb1, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf8, 0x05, 0x63, 0x02, 0xed, 0x00, 0x29, 0x00, 0x2f, 0x00, 0x41, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x17, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x23, 0x15, 0x21, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xd4, 0x30, 0x32, 0x29, 0x30, 0x7e, 0x01, 0x74, 0x63, 0x6c, 0x79, 0x8e, 0x69, 0x62, 0x5d, 0x71, 0x78, 0x5d, 0x4c, 0xfe, 0x9f, 0x03, 0x08, 0x21, 0x27, 0x64, 0x78, 0x93, 0x75, 0x02, 0x54, 0x6d, 0x84, 0xfe, 0xbd, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x12, 0xac, 0x01, 0x1c, 0xfe, 0x6c, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x01, 0x39, 0x63, 0x31, 0x3d, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0x5c, 0x3b, 0x68, 0x74, 0x6a, 0x58, 0x5c, 0x63, 0xd3, 0x6c, 0x09, 0x6f, 0x63, 0x6f, 0x73, 0x01, 0xab, 0x6c, 0xfd, 0x88, 0x02, 0xe4, 0xfe, 0xc1, 0x3d, 0x41, 0x29, 0x31, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x32, 0x28, 0xd3, 0x6a, 0x2d, 0x28, 0x27, 0x2d, 0x38, 0x30, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x57, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x2e, 0x00, 0x34, 0x00, 0x3f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x57, 0x6f, 0x81, 0xfe, 0x69, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x5f, 0x67, 0x70, 0x8c, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x05, 0x6c, 0xfd, 0x9b, 0x49, 0xfe, 0x89, 0xde, 0x01, 0xc5, 0xab, 0x24, 0xcf, 0xfc, 0xe5, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x48, 0x7d, 0x2e, 0x38, 0x33, 0x2a, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x6b, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x5c, 0x61, 0xd4, 0x6c, 0xfe, 0xc0, 0x4d, 0x44, 0x43, 0xd4, 0xd4, 0x4c, 0x4a, 0x34, 0x72, 0x2d, 0x27, 0x28, 0x2d, 0x38, 0x30, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x93, 0x04, 0x55, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x40, 0x00, 0x4b, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xfc, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x23, 0x13, 0x9f, 0x69, 0x62, 0x5d, 0x71, 0x77, 0x5e, 0x4c, 0xfe, 0x9f, 0x04, 0x6a, 0x85, 0xb1, 0xbd, 0x51, 0x3e, 0x64, 0xfe, 0x6f, 0x91, 0xfe, 0xf7, 0x48, 0x2b, 0x36, 0x2f, 0x25, 0x28, 0x2d, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x3a, 0x67, 0x43, 0x3b, 0x5d, 0x1d, 0x12, 0x1e, 0x3b, 0x68, 0x73, 0x69, 0x57, 0x5c, 0x64, 0xb2, 0x6c, 0x6c, 0xb4, 0x2d, 0x30, 0x57, 0xb2, 0x6a, 0x2e, 0x27, 0x27, 0x2d, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xfc, 0x02, 0xe4, 0x00, 0x1e, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xfc, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x1c, 0x21, 0x6a, 0x44, 0x7c, 0x8b, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x05, 0x11, 0xf0, 0xfd, 0x5f, 0x57, 0x58, 0x56, 0x4c, 0x3a, 0x52, 0x0b, 0x08, 0x7e, 0x5c, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x2d, 0x2a, 0x2f, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x40, 0x34, 0x57, 0x5f, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xca, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x37, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xca, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x4e, 0x73, 0x21, 0x21, 0x6e, 0x48, 0x54, 0x81, 0x47, 0x04, 0x0c, 0x54, 0x4b, 0xff, 0x00, 0x04, 0xdf, 0xfc, 0xe5, 0x53, 0x02, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xb8, 0x57, 0x58, 0x5c, 0x4a, 0x02, 0x78, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3a, 0x36, 0x35, 0x3c, 0x44, 0x80, 0x57, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0xfd, 0xe5, 0x62, 0x4f, 0x11, 0x24, 0x48, 0x4b, 0x36, 0x4d, 0x57, 0x63, 0x07, 0x4c, 0x55, 0x01, 0xaf, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x03, 0xde, 0x02, 0xe4, 0x00, 0x18, 0x00, 0x24, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x27, 0x33, 0x14, 0x16, 0x17, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0xde, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x75, 0x8b, 0x0b, 0x66, 0x8c, 0x03, 0x7b, 0x52, 0x37, 0x53, 0x4b, 0xfe, 0x24, 0x03, 0xf3, 0xf0, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x7f, 0x6f, 0x04, 0x69, 0x69, 0x38, 0x38, 0x02, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x93, 0x03, 0x30, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x33, 0x14, 0x16, 0x33, 0x32, 0x37, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0xd7, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x06, 0x2e, 0x42, 0x37, 0x62, 0x3f, 0x01, 0x7b, 0x43, 0x31, 0x0a, 0x12, 0x05, 0x57, 0x4a, 0x64, 0xfd, 0xbb, 0x03, 0x45, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x3a, 0x67, 0x43, 0x3b, 0x5d, 0x1d, 0x03, 0x1a, 0x2f, 0x5e, 0x43, 0x34, 0x36, 0x02, 0x12, 0x12, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x79, 0x02, 0xe4, 0x00, 0x56, 0x00, 0x63, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xc2, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x5c, 0x71, 0x04, 0x01, 0x37, 0x31, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x57, 0x48, 0x28, 0x46, 0x19, 0x1c, 0x54, 0x34, 0x38, 0x50, 0x18, 0xfb, 0xa5, 0x06, 0x8e, 0xfd, 0x7a, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x79, 0x64, 0x36, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x20, 0x1f, 0x24, 0x26, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x08, 0x5d, 0x02, 0xe4, 0x00, 0x4c, 0x00, 0x58, 0x00, 0x63, 0x00, 0x70, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x04, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x08, 0x5d, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x51, 0x77, 0x41, 0x03, 0x08, 0x32, 0x2a, 0x38, 0x39, 0x7c, 0x17, 0x54, 0x3a, 0x5c, 0x71, 0x04, 0x01, 0x37, 0x31, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x57, 0x48, 0x28, 0x46, 0x19, 0x1c, 0x54, 0x34, 0x38, 0x50, 0x18, 0xfb, 0xa5, 0x08, 0x72, 0xfd, 0x38, 0x51, 0x15, 0x27, 0x25, 0xfe, 0x7b, 0x16, 0x4e, 0x36, 0x02, 0x11, 0xa7, 0xaf, 0x5a, 0x4e, 0x4e, 0x60, 0xfc, 0x86, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x41, 0x74, 0x4d, 0x22, 0x2e, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x79, 0x64, 0x36, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x20, 0x1f, 0x24, 0x26, 0x2b, 0x26, 0xab, 0x6c, 0xcd, 0x36, 0x2e, 0x10, 0x42, 0x34, 0x3f, 0xb1, 0x26, 0x2a, 0x61, 0x56, 0xb2, 0x0e, 0x43, 0x56, 0x60, 0x4b, 0xbb, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xfb, 0x06, 0x51, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x52, 0x00, 0x5e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x51, 0x6f, 0x80, 0x2b, 0x58, 0x0b, 0x16, 0x22, 0x73, 0x4d, 0x7d, 0x91, 0x05, 0x35, 0x2d, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x57, 0x48, 0x3d, 0x5f, 0x17, 0x47, 0xfc, 0x76, 0x06, 0x66, 0xfd, 0xe1, 0x29, 0x1e, 0x20, 0x32, 0x59, 0x37, 0x56, 0x2d, 0xfe, 0x95, 0x5c, 0x4d, 0x4d, 0x44, 0x01, 0x4d, 0x36, 0x35, 0x32, 0x2e, 0x3d, 0x3d, 0x2e, 0x02, 0x78, 0xfd, 0x88, 0xb5, 0x3c, 0x02, 0x3a, 0x46, 0x8e, 0x7f, 0x3b, 0x2a, 0x35, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x3e, 0x3a, 0x1b, 0x65, 0x5d, 0x6c, 0xfd, 0x86, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3c, 0xa0, 0x6e, 0x64, 0x6a, 0x06, 0x3d, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xbf, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x16, 0x16, 0x33, 0x32, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0xbf, 0x6f, 0x81, 0x92, 0x5d, 0x5e, 0x4c, 0x5a, 0x16, 0x0d, 0x2c, 0x2a, 0x34, 0x32, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x46, 0x4d, 0x5c, 0x1c, 0x09, 0x1d, 0x1c, 0x40, 0xfc, 0x2e, 0x05, 0xd4, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xf2, 0x59, 0x6f, 0x47, 0x42, 0x2b, 0x30, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x58, 0x55, 0x1b, 0x1f, 0x54, 0xf8, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xf1, 0x02, 0xe4, 0x00, 0x43, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x35, 0x21, 0x05, 0xf1, 0x6e, 0x81, 0x90, 0x34, 0x61, 0x41, 0x62, 0x6e, 0x05, 0x02, 0x31, 0x2f, 0x34, 0x34, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x57, 0x46, 0x38, 0x5e, 0x38, 0x2f, 0x26, 0x29, 0x2f, 0x01, 0x0e, 0xfa, 0xe9, 0x06, 0x06, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x64, 0x57, 0x38, 0x3f, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x2e, 0x58, 0x3d, 0x0c, 0x2e, 0x35, 0x37, 0x2e, 0xa6, 0x8c, 0x6c, 0xff, 0xff, 0xff, 0xeb, 0xff, 0x93, 0x05, 0xf1, 0x02, 0xe4, 0x00, 0x22, 0x02, 0x01, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x04, 0xd6, 0x00, 0x6e, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x1c, 0x05, 0x30, 0x02, 0xe4, 0x00, 0x47, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x31, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0xaf, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x35, 0x33, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x57, 0x48, 0x2e, 0x4e, 0x1b, 0x26, 0x72, 0x47, 0x05, 0xfb, 0xf5, 0x05, 0x45, 0xbc, 0x7b, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x02, 0x40, 0x45, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x23, 0x23, 0x27, 0x29, 0x5b, 0x6c, 0x6c, 0xc8, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x24, 0x05, 0x49, 0x02, 0xe4, 0x00, 0x3b, 0x00, 0x47, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x02, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x23, 0x5e, 0x79, 0x49, 0x7e, 0x4f, 0x4d, 0x7c, 0x4a, 0x02, 0x36, 0x34, 0x34, 0x34, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x52, 0x45, 0x2f, 0x50, 0x1b, 0x39, 0x5d, 0xfc, 0x48, 0x05, 0x5e, 0xcf, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x4c, 0x74, 0x3e, 0x3c, 0x6f, 0x49, 0x42, 0x48, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x25, 0x24, 0x3f, 0x11, 0x5e, 0x6c, 0x6c, 0xfe, 0xea, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xee, 0x04, 0xc3, 0x02, 0xe4, 0x00, 0x4f, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0x72, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x43, 0x6c, 0x0d, 0x19, 0x44, 0x34, 0x34, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x51, 0x44, 0x41, 0x2e, 0x18, 0x4e, 0x2f, 0x58, 0xfc, 0x1e, 0x04, 0xd8, 0x7a, 0xb2, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x35, 0x42, 0x3d, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x44, 0x2b, 0x1b, 0x1b, 0x5c, 0x6c, 0x6c, 0xb7, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xfe, 0x05, 0x32, 0x02, 0xe4, 0x00, 0x57, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x3d, 0x02, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0xc0, 0x74, 0x66, 0x5a, 0x3e, 0x51, 0x29, 0x1f, 0x1c, 0x26, 0x03, 0x5d, 0x04, 0x5c, 0x49, 0x52, 0x5f, 0x87, 0x79, 0x59, 0x8e, 0x52, 0x01, 0x01, 0x36, 0x33, 0x34, 0x34, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x52, 0x45, 0x2f, 0x4f, 0x1c, 0x27, 0x77, 0x48, 0x1b, 0xfb, 0xdd, 0x05, 0x47, 0xaa, 0x6c, 0x01, 0xca, 0x60, 0x5a, 0x50, 0x65, 0x3a, 0x31, 0x20, 0x2a, 0x23, 0x1c, 0x0a, 0x08, 0x18, 0x0c, 0x41, 0x49, 0x5c, 0x4b, 0x5d, 0x6b, 0x42, 0x7d, 0x54, 0x01, 0x02, 0x03, 0x42, 0x49, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x26, 0x25, 0x2c, 0x2f, 0x55, 0x6c, 0x6c, 0xae, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x62, 0x02, 0xe4, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x05, 0x62, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x03, 0x37, 0x2f, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x35, 0x58, 0x1a, 0x4b, 0x80, 0x8b, 0xfb, 0x79, 0x05, 0x77, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x16, 0x15, 0x3e, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x31, 0x30, 0x3c, 0x8a, 0x6c, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xab, 0x02, 0xed, 0x00, 0x52, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x05, 0xab, 0x6f, 0x81, 0x18, 0x73, 0x52, 0x52, 0x7c, 0x47, 0x03, 0x09, 0x2f, 0x24, 0x36, 0x37, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x55, 0x47, 0x39, 0x57, 0x18, 0x06, 0x59, 0x69, 0x2b, 0x23, 0x14, 0x0d, 0xfc, 0x72, 0x03, 0x70, 0x1e, 0x21, 0x3a, 0x5b, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x57, 0x53, 0x38, 0x5c, 0x36, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x30, 0x43, 0x40, 0x77, 0x52, 0x1e, 0x22, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x32, 0x30, 0x37, 0x44, 0x23, 0x30, 0x07, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x30, 0x5e, 0x41, 0x01, 0x51, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x7e, 0x02, 0xed, 0x00, 0x5d, 0x00, 0x69, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x07, 0x7e, 0x6e, 0x82, 0x1f, 0x66, 0x44, 0x4f, 0x75, 0x21, 0x26, 0x7c, 0x4d, 0x87, 0x9f, 0x05, 0x09, 0x2f, 0x24, 0x36, 0x37, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x55, 0x47, 0x39, 0x57, 0x18, 0x06, 0x59, 0x69, 0x2b, 0x23, 0x14, 0x0e, 0xfc, 0x73, 0x03, 0x70, 0x1e, 0x21, 0x3a, 0x5b, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x56, 0x53, 0x5b, 0x6d, 0x02, 0x0e, 0x54, 0x4c, 0xac, 0x02, 0xc2, 0xf0, 0xa6, 0x57, 0x59, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3d, 0x38, 0x3b, 0x3f, 0x8c, 0x7e, 0x1e, 0x22, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x32, 0x30, 0x37, 0x44, 0x23, 0x30, 0x07, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x6a, 0x5d, 0x24, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xe5, 0x05, 0x09, 0x02, 0xe4, 0x00, 0x47, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x03, 0xa2, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x61, 0x3a, 0x01, 0x34, 0x31, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x2c, 0x4b, 0x1a, 0x24, 0x6c, 0x41, 0x32, 0xfb, 0xe2, 0x05, 0x1e, 0x01, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x33, 0x64, 0x47, 0x34, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x22, 0x21, 0x26, 0x27, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xbd, 0x05, 0x08, 0x02, 0xe4, 0x00, 0x48, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x07, 0x33, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0xa2, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x0f, 0x01, 0xaf, 0x8c, 0x93, 0x4c, 0x61, 0x01, 0x34, 0x31, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x2c, 0x4b, 0x1a, 0x24, 0x6c, 0x41, 0x32, 0xfb, 0xe2, 0x05, 0x1d, 0x7d, 0xa7, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa7, 0x10, 0xbf, 0x99, 0x0d, 0x6f, 0x5a, 0x34, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x22, 0x21, 0x26, 0x27, 0x5b, 0x6c, 0x6c, 0xca, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x23, 0x02, 0xe4, 0x00, 0x34, 0x00, 0x3d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x6f, 0x80, 0x35, 0x67, 0x57, 0x6c, 0x11, 0x0c, 0x30, 0x21, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x12, 0x50, 0x42, 0x2c, 0x24, 0xfd, 0x2f, 0x05, 0x38, 0xef, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x5e, 0x52, 0x20, 0x24, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x36, 0x46, 0x12, 0x78, 0x6c, 0x6c, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x61, 0x02, 0xe4, 0x00, 0x4d, 0x00, 0x56, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xa4, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x55, 0x6a, 0x0f, 0x19, 0x43, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x12, 0x50, 0x42, 0x2d, 0x24, 0xfd, 0x2e, 0x06, 0x76, 0xfd, 0xc2, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x5f, 0x53, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x36, 0x46, 0x12, 0x78, 0x6c, 0x6c, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x57, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x46, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x07, 0x17, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x06, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x05, 0x57, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x44, 0x6f, 0x41, 0x06, 0x33, 0x2d, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x13, 0x53, 0x45, 0x29, 0x48, 0x1b, 0x21, 0x64, 0x3b, 0x39, 0x57, 0x1d, 0xfb, 0x7f, 0x05, 0x6c, 0xfe, 0x48, 0x2a, 0xed, 0x11, 0x24, 0x45, 0x30, 0x9c, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6d, 0x47, 0x30, 0x3a, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x36, 0x46, 0x21, 0x1f, 0x29, 0x2d, 0x2a, 0x24, 0x9e, 0x6c, 0xfe, 0xef, 0x22, 0xbf, 0x24, 0x25, 0x28, 0x46, 0x2a, 0xc7, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xe3, 0x02, 0xed, 0x00, 0x4a, 0x00, 0x55, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x31, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x34, 0x23, 0x22, 0x07, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x33, 0x11, 0x01, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xe3, 0x70, 0x81, 0x8b, 0x68, 0x63, 0x5d, 0x70, 0x35, 0x33, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x36, 0x56, 0x16, 0x38, 0x55, 0x4a, 0x45, 0x0c, 0x10, 0xfc, 0x5e, 0x03, 0x77, 0x1d, 0x25, 0x66, 0x5d, 0x8b, 0xfe, 0xfc, 0x47, 0x2c, 0x35, 0x2f, 0x25, 0x29, 0x2b, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x69, 0x73, 0x6a, 0x57, 0x03, 0x48, 0x4a, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x37, 0x38, 0x28, 0x53, 0x60, 0x07, 0x6c, 0x09, 0x7c, 0x69, 0x3c, 0x01, 0x18, 0xfe, 0x7f, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xed, 0x02, 0xe4, 0x00, 0x3d, 0x00, 0x41, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0xed, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x01, 0x03, 0x35, 0x30, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x36, 0x55, 0x17, 0x38, 0x54, 0x4c, 0xfb, 0xfc, 0x06, 0x02, 0xf1, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x0c, 0x06, 0x41, 0x42, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x37, 0x37, 0x27, 0xac, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x8d, 0x02, 0xe4, 0x00, 0x39, 0x00, 0x44, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x8d, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x7b, 0x8c, 0x05, 0x08, 0x30, 0x25, 0x37, 0x36, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x58, 0x49, 0x36, 0x55, 0x17, 0x2d, 0x2b, 0xfc, 0x74, 0x05, 0xa2, 0xf0, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8b, 0x78, 0x1c, 0x26, 0x4e, 0x41, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x35, 0x2f, 0x0e, 0x45, 0x37, 0x3f, 0x6c, 0x6c, 0x56, 0xb2, 0x0e, 0x45, 0x54, 0x60, 0x4b, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x2c, 0x06, 0x37, 0x02, 0xe4, 0x00, 0x60, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x05, 0x62, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x71, 0x3a, 0x01, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x2d, 0x4b, 0x1a, 0x1e, 0x56, 0x32, 0x45, 0x55, 0x13, 0x03, 0x11, 0x41, 0x34, 0xfb, 0x08, 0x06, 0x4c, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x40, 0x71, 0x48, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x24, 0x22, 0x22, 0x24, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x08, 0x22, 0x02, 0xe4, 0x00, 0x60, 0x00, 0x6b, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x08, 0x22, 0x6f, 0x81, 0x1f, 0x66, 0x45, 0x7b, 0x8c, 0x05, 0x08, 0x30, 0x25, 0x37, 0x36, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x71, 0x3a, 0x01, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x54, 0x45, 0x2d, 0x4b, 0x1a, 0x1e, 0x56, 0x32, 0x45, 0x55, 0x13, 0x03, 0x14, 0x58, 0x49, 0x36, 0x55, 0x17, 0x2d, 0x2b, 0xf9, 0xdf, 0x08, 0x37, 0xf0, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x8b, 0x78, 0x1c, 0x26, 0x4e, 0x41, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x40, 0x71, 0x48, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x24, 0x22, 0x22, 0x24, 0x46, 0x37, 0x37, 0x46, 0x35, 0x2f, 0x0e, 0x45, 0x37, 0x3f, 0x6c, 0x6c, 0x56, 0xb2, 0x0e, 0x45, 0x54, 0x60, 0x4b, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x46, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x46, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x05, 0x36, 0x2d, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x53, 0x45, 0x2a, 0x49, 0x1a, 0x1e, 0x5a, 0x38, 0x39, 0x56, 0x1a, 0xfb, 0x91, 0x05, 0x5b, 0xfe, 0xb8, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x01, 0x2e, 0x39, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x21, 0x1f, 0x26, 0x29, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xee, 0x07, 0x25, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x61, 0x00, 0x6e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x24, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x12, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xd4, 0x32, 0x2c, 0x22, 0x2d, 0x56, 0x77, 0x72, 0x69, 0x6f, 0x8a, 0x04, 0x81, 0x01, 0x41, 0x36, 0x30, 0x35, 0x3b, 0x30, 0x25, 0x4d, 0x72, 0x67, 0x4f, 0x58, 0xf9, 0xbc, 0x07, 0x3a, 0x7a, 0xb2, 0xfe, 0x2f, 0x76, 0x3a, 0x3b, 0x77, 0x54, 0x4f, 0x75, 0x3f, 0x05, 0x36, 0x2d, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x14, 0x53, 0x45, 0x2b, 0x4b, 0x1a, 0x22, 0x6a, 0x42, 0x2e, 0x3d, 0x1f, 0x47, 0x40, 0x3b, 0x4e, 0x4c, 0x3d, 0x01, 0xc1, 0x1b, 0x21, 0x1f, 0x1d, 0x53, 0x5a, 0x50, 0x5e, 0x67, 0x5a, 0x2c, 0x33, 0x2a, 0x23, 0x2a, 0x27, 0x45, 0x56, 0x4a, 0x49, 0x5c, 0x6c, 0x6c, 0xb7, 0x61, 0x43, 0x6c, 0x3e, 0x3d, 0x6b, 0x42, 0x3d, 0x6c, 0x46, 0x01, 0x2e, 0x39, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x23, 0x21, 0x28, 0x2b, 0xfe, 0x8f, 0x26, 0x3d, 0x22, 0x37, 0x4e, 0x49, 0x3b, 0x3d, 0x49, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0xcd, 0x02, 0xe4, 0x00, 0x46, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x33, 0x05, 0xcd, 0x70, 0x80, 0xfe, 0x68, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x33, 0x2d, 0x34, 0x34, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x13, 0x52, 0x43, 0x3c, 0x5c, 0x15, 0x4c, 0x47, 0xfc, 0x3b, 0x05, 0xe2, 0xf0, 0xad, 0x23, 0xd0, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x3f, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0x69, 0x2e, 0x3a, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x3d, 0x3b, 0x02, 0x4d, 0x42, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x93, 0x04, 0xb7, 0x02, 0xe4, 0x00, 0x56, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x03, 0x5e, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x39, 0x0d, 0x1b, 0x2e, 0x39, 0x36, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x55, 0x13, 0x03, 0x12, 0x4b, 0x3e, 0x3d, 0x2a, 0x14, 0x47, 0x2e, 0x64, 0xfc, 0x34, 0x04, 0xcc, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x3a, 0x67, 0x43, 0x3b, 0x5d, 0x1d, 0x1e, 0x39, 0x24, 0x51, 0x43, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x37, 0x46, 0x27, 0x1a, 0x1b, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xcd, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x32, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x37, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xcd, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x33, 0x58, 0x1e, 0x1f, 0x5c, 0x3b, 0x4f, 0x75, 0x3f, 0x3e, 0x73, 0x4d, 0x45, 0x66, 0x1e, 0x1e, 0x56, 0x32, 0x01, 0x35, 0xfc, 0x0e, 0x04, 0xe2, 0xfc, 0xae, 0x44, 0x06, 0x01, 0x02, 0x45, 0x3e, 0x3b, 0x4c, 0x4c, 0x3b, 0x01, 0x89, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x25, 0x22, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x38, 0x30, 0x1c, 0x1d, 0x85, 0x6c, 0xfd, 0xce, 0x43, 0x30, 0x0f, 0x07, 0x34, 0x4b, 0x48, 0x3b, 0x3c, 0x49, 0x12, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x87, 0x02, 0xe4, 0x00, 0x1f, 0x00, 0x2b, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x27, 0x35, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x87, 0x6e, 0x82, 0x1f, 0x66, 0x44, 0x43, 0x68, 0x22, 0x1d, 0x62, 0x44, 0x4f, 0x75, 0x3f, 0x3e, 0x73, 0x4d, 0x4e, 0x6c, 0x1b, 0x33, 0x30, 0xfd, 0x7a, 0x04, 0x9c, 0xf0, 0xa6, 0x57, 0x59, 0x02, 0x59, 0x4d, 0x4e, 0x60, 0xfd, 0xe9, 0x45, 0x01, 0x02, 0x07, 0x44, 0x36, 0x3b, 0x4c, 0x4c, 0x3b, 0x02, 0x78, 0xfd, 0x88, 0xb2, 0x28, 0x2d, 0x2a, 0x27, 0x2e, 0x35, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x42, 0x38, 0x0c, 0x45, 0x3c, 0x43, 0x6c, 0x6c, 0x5a, 0x58, 0x69, 0x0a, 0x3f, 0x4b, 0x5f, 0x4c, 0xc2, 0x4e, 0x38, 0x0a, 0x15, 0x2a, 0x39, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0xff, 0xeb, 0x00, 0x2c, 0x05, 0x2c, 0x02, 0xe4, 0x00, 0x45, 0x00, 0x54, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x37, 0x35, 0x34, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x57, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x49, 0x6b, 0x20, 0x1f, 0x57, 0x38, 0x4f, 0x75, 0x3f, 0x3e, 0x73, 0x4d, 0x3f, 0x61, 0x1f, 0x1e, 0x58, 0x34, 0x45, 0x55, 0x13, 0x03, 0x11, 0x41, 0x34, 0xfc, 0x13, 0x05, 0x41, 0xfc, 0x4f, 0x44, 0x06, 0x01, 0x03, 0x45, 0x3d, 0x3b, 0x4c, 0x4c, 0x3b, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x37, 0x31, 0x22, 0x27, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x30, 0x2a, 0x25, 0x26, 0x46, 0x37, 0x2e, 0x40, 0x0b, 0x69, 0x6c, 0x6c, 0xfe, 0x3a, 0x43, 0x30, 0x02, 0x10, 0x07, 0x33, 0x49, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x3c, 0x02, 0xe4, 0x00, 0x22, 0x00, 0x30, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x37, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x3c, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x3a, 0x5b, 0x1e, 0x1f, 0x5c, 0x3b, 0x4f, 0x75, 0x3f, 0x3e, 0x73, 0x4d, 0x3d, 0x5e, 0x1f, 0x1f, 0x5b, 0x3a, 0x39, 0x56, 0x1a, 0xfc, 0x9b, 0x04, 0x51, 0xfd, 0x40, 0x45, 0x04, 0x05, 0x44, 0x3b, 0x3b, 0x4c, 0x4c, 0x3b, 0x01, 0xb3, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x2b, 0x28, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x2c, 0x27, 0x28, 0x2b, 0x2c, 0x27, 0xa9, 0x6c, 0xfd, 0xce, 0x46, 0x31, 0x11, 0x0b, 0x31, 0x44, 0x48, 0x3b, 0x3c, 0x49, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x93, 0x03, 0xae, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x44, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x06, 0x37, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x02, 0x55, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x67, 0x74, 0x0a, 0x7c, 0x07, 0x38, 0x2c, 0x34, 0x3f, 0x3f, 0x34, 0x2a, 0x39, 0x08, 0x7c, 0x09, 0x7d, 0x61, 0x69, 0x80, 0x07, 0x2e, 0x38, 0x48, 0x6d, 0x3c, 0x3a, 0x6c, 0x48, 0x5c, 0x3b, 0x14, 0x47, 0x2f, 0x64, 0xfd, 0x3d, 0x03, 0xc3, 0x85, 0xb1, 0xb2, 0x2c, 0x36, 0x0e, 0x28, 0x49, 0x39, 0x4a, 0x4a, 0x3b, 0x46, 0x2a, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x64, 0x4e, 0x1e, 0x2d, 0x42, 0x35, 0x35, 0x41, 0x2b, 0x1e, 0x50, 0x64, 0x71, 0x5d, 0x16, 0x3d, 0x6c, 0x46, 0x43, 0x6a, 0x3b, 0x38, 0x1b, 0x1c, 0x57, 0x6c, 0x6c, 0xb4, 0xb5, 0x1d, 0x1c, 0x33, 0x3f, 0x48, 0x3b, 0x3c, 0x48, 0x35, 0x00, 0x00, 0x03, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0xff, 0x02, 0xed, 0x00, 0x29, 0x00, 0x5a, 0x00, 0x67, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x35, 0x21, 0x15, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x03, 0x3f, 0x17, 0x4e, 0x36, 0x3e, 0x5c, 0x32, 0x35, 0x5e, 0x3c, 0x24, 0x1d, 0x0c, 0x14, 0x30, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0x35, 0x61, 0x40, 0x38, 0x51, 0x17, 0xfe, 0x8a, 0x03, 0xaa, 0xfd, 0x79, 0x37, 0x1c, 0x3f, 0x3a, 0x35, 0x44, 0x42, 0x36, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0x4d, 0xac, 0x26, 0x2c, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa1, 0x27, 0x2d, 0x3a, 0x6a, 0x45, 0x45, 0x69, 0x3a, 0x2b, 0x26, 0xab, 0x6c, 0x6c, 0xfe, 0x41, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x39, 0x43, 0xff, 0xff, 0x00, 0x4b, 0xff, 0x6f, 0x05, 0xff, 0x02, 0xed, 0x00, 0x22, 0x02, 0x1d, 0x00, 0x00, 0x00, 0x07, 0x00, 0x7e, 0x04, 0x4b, 0x00, 0x4a, 0x00, 0x02, 0x00, 0x1d, 0xff, 0xcf, 0x03, 0x4d, 0x03, 0x03, 0x00, 0x32, 0x00, 0x3f, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x07, 0x23, 0x35, 0x25, 0x17, 0x15, 0x07, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x25, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x11, 0x04, 0x16, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x03, 0x4d, 0x6e, 0x77, 0x15, 0x4f, 0x38, 0x34, 0x45, 0x03, 0x7c, 0x8b, 0x01, 0x25, 0x53, 0x12, 0x15, 0x2a, 0x23, 0x38, 0x43, 0xfe, 0xdb, 0x98, 0x8e, 0xc6, 0x44, 0x46, 0x32, 0x5c, 0x3e, 0x40, 0x5e, 0x33, 0x2e, 0x35, 0xd0, 0xfe, 0x68, 0x2f, 0x33, 0x06, 0x28, 0x2c, 0x34, 0x2b, 0x28, 0x35, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x2d, 0x2b, 0x33, 0x41, 0x31, 0x11, 0x0f, 0x6a, 0x0c, 0xed, 0x27, 0x07, 0x0f, 0x16, 0x23, 0x20, 0x27, 0x56, 0x3e, 0x0e, 0x8b, 0x76, 0x11, 0x95, 0x26, 0x5e, 0x3d, 0x31, 0x52, 0x2f, 0x2e, 0x51, 0x33, 0x34, 0x51, 0x2d, 0x63, 0x01, 0xa8, 0xc1, 0x3c, 0x18, 0x03, 0x1e, 0x3a, 0x26, 0x24, 0x34, 0x34, 0x23, 0x00, 0xff, 0xff, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0x86, 0x02, 0xed, 0x00, 0x22, 0x00, 0x6d, 0x00, 0x00, 0x00, 0x03, 0x00, 0x2a, 0x02, 0x3c, 0x00, 0x00, 0x00, 0x02, 0x00, 0x4b, 0xff, 0xf8, 0x04, 0xc1, 0x02, 0xed, 0x00, 0x29, 0x00, 0x48, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x24, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x02, 0x38, 0x5f, 0x53, 0x43, 0x43, 0x53, 0x7c, 0x43, 0x7b, 0x52, 0x52, 0x80, 0x47, 0x47, 0x83, 0x58, 0x04, 0xfe, 0xd6, 0x02, 0x65, 0xbc, 0x7b, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x85, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x50, 0x74, 0x3e, 0x5b, 0x6c, 0x6c, 0xc8, 0x00, 0x02, 0x00, 0x4b, 0xff, 0xf8, 0x04, 0xf2, 0x02, 0xed, 0x00, 0x29, 0x00, 0x43, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x03, 0xea, 0x6f, 0x81, 0x85, 0x4a, 0x57, 0x4e, 0x49, 0x12, 0x27, 0x74, 0x90, 0x9e, 0x7f, 0x8b, 0xfe, 0x55, 0x02, 0x9b, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0x4d, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x7c, 0x7b, 0x8a, 0x6c, 0x00, 0x03, 0x00, 0x1d, 0x00, 0x00, 0x05, 0x2c, 0x02, 0xed, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x27, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x36, 0x36, 0x33, 0x21, 0x35, 0x21, 0x35, 0x21, 0x00, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x27, 0x22, 0x06, 0x15, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x2c, 0x6e, 0x82, 0x97, 0x23, 0x36, 0x5d, 0x38, 0x3c, 0x63, 0x1c, 0xf6, 0x9c, 0x93, 0xcd, 0x43, 0x46, 0x33, 0x5f, 0x3f, 0x41, 0x60, 0x34, 0x2e, 0x34, 0x81, 0x07, 0x7d, 0x5e, 0x01, 0x34, 0xfe, 0x0d, 0x02, 0xe3, 0xfb, 0xae, 0x59, 0x0f, 0x26, 0x29, 0x31, 0x2a, 0x29, 0x33, 0x02, 0x50, 0x38, 0x38, 0x2b, 0x2d, 0x38, 0x38, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x2e, 0x7b, 0x7a, 0x0f, 0x9e, 0x29, 0x61, 0x3e, 0x37, 0x57, 0x32, 0x30, 0x54, 0x35, 0x38, 0x56, 0x2e, 0x3f, 0x59, 0x61, 0x85, 0x6c, 0xfe, 0xf9, 0x2d, 0x07, 0x1d, 0x3b, 0x26, 0x25, 0x35, 0x01, 0x35, 0x26, 0xfe, 0x9d, 0x37, 0x2b, 0x2a, 0x37, 0x36, 0x2c, 0x2b, 0x36, 0x00, 0x04, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0x6c, 0x02, 0xed, 0x00, 0x29, 0x00, 0x3e, 0x00, 0x42, 0x00, 0x4d, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x04, 0x64, 0x6f, 0x82, 0x96, 0x68, 0x61, 0x5e, 0x71, 0x78, 0x5d, 0x4b, 0xfe, 0xe0, 0x03, 0x1f, 0xf1, 0x96, 0x96, 0xfe, 0xf2, 0x47, 0x2c, 0x35, 0x2f, 0x25, 0x29, 0x2b, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0x4d, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x5c, 0x63, 0xac, 0x6c, 0x6c, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x00, 0x03, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0x1f, 0x02, 0xed, 0x00, 0x29, 0x00, 0x3e, 0x00, 0x4a, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x04, 0x17, 0x6e, 0x81, 0x1f, 0x66, 0x45, 0x7f, 0x8e, 0x04, 0x0c, 0x54, 0x4c, 0xbe, 0x02, 0xd4, 0xef, 0xa7, 0x57, 0x59, 0x59, 0x4f, 0x4e, 0x61, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0x4d, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x00, 0x02, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0xbc, 0x02, 0xed, 0x00, 0x29, 0x00, 0x63, 0x00, 0x00, 0x13, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x17, 0x23, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x37, 0x35, 0x21, 0x35, 0x21, 0x15, 0xce, 0x2e, 0x32, 0x2a, 0x30, 0x7e, 0x72, 0x63, 0x6c, 0x7a, 0x8e, 0x4f, 0x66, 0x31, 0x2a, 0x2a, 0x30, 0x01, 0x80, 0x03, 0x36, 0x64, 0x42, 0x64, 0x79, 0x93, 0x75, 0x03, 0xde, 0x3e, 0x49, 0x3a, 0x72, 0x50, 0x06, 0x1c, 0x1b, 0x3b, 0x44, 0x36, 0x32, 0x36, 0x35, 0x6c, 0x33, 0x33, 0x34, 0x38, 0x43, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x3a, 0x65, 0x3e, 0x45, 0x54, 0x14, 0x03, 0x11, 0x42, 0x34, 0xfd, 0xec, 0x03, 0x68, 0x01, 0x2b, 0x55, 0x32, 0x3c, 0x37, 0x2e, 0x0e, 0x10, 0x63, 0x70, 0x7d, 0x6a, 0xb9, 0x3f, 0x43, 0x2d, 0x36, 0x36, 0x2d, 0x26, 0x15, 0x15, 0x3d, 0x5e, 0x34, 0x73, 0x68, 0x71, 0x76, 0x01, 0x4d, 0x73, 0x17, 0x72, 0x55, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x4c, 0x6a, 0x36, 0x46, 0x37, 0x2d, 0x41, 0x0b, 0x69, 0x6c, 0x6c, 0x00, 0x00, 0x03, 0x00, 0x1d, 0xff, 0xd7, 0x03, 0x4d, 0x03, 0x03, 0x00, 0x24, 0x00, 0x31, 0x00, 0x3e, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x27, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x11, 0x04, 0x16, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x00, 0x36, 0x35, 0x35, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0x4d, 0x6e, 0x77, 0x17, 0x4f, 0x37, 0x35, 0x52, 0x2e, 0x52, 0x40, 0x64, 0x99, 0x8e, 0xc7, 0x44, 0x47, 0x32, 0x5c, 0x3e, 0x40, 0x5e, 0x33, 0x2e, 0x36, 0xd1, 0xfe, 0x68, 0x2f, 0x33, 0x06, 0x28, 0x2c, 0x34, 0x2b, 0x28, 0x35, 0x01, 0x60, 0x3d, 0x2b, 0x21, 0x23, 0x30, 0x3c, 0x39, 0x2c, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x29, 0x26, 0x2c, 0x2c, 0x4e, 0x30, 0x42, 0x5d, 0x0f, 0x30, 0x7a, 0x10, 0x9a, 0x27, 0x5e, 0x3d, 0x31, 0x52, 0x2f, 0x2e, 0x51, 0x33, 0x34, 0x4f, 0x2f, 0x63, 0x01, 0xa8, 0xc1, 0x3c, 0x18, 0x03, 0x1e, 0x3a, 0x26, 0x24, 0x34, 0x34, 0x23, 0xfd, 0xf1, 0x50, 0x3b, 0x0d, 0x15, 0x0c, 0x34, 0x2a, 0x2a, 0x31, 0xff, 0xff, 0x00, 0x4b, 0xff, 0xf8, 0x05, 0x70, 0x02, 0xed, 0x00, 0x22, 0x00, 0x6d, 0x00, 0x00, 0x00, 0x03, 0x00, 0x41, 0x02, 0x13, 0x00, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x64, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x36, 0x00, 0x3f, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x12, 0x36, 0x37, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xad, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x47, 0x67, 0x15, 0x3d, 0x58, 0x70, 0x7a, 0x5f, 0x05, 0x79, 0xfc, 0x73, 0x1a, 0x60, 0x40, 0x38, 0x50, 0x18, 0xfd, 0x97, 0xaf, 0x3b, 0x0b, 0x01, 0xf7, 0x41, 0x43, 0x01, 0x93, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x4b, 0x42, 0x35, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc6, 0x33, 0x39, 0x2b, 0x26, 0xab, 0xfe, 0x9a, 0x29, 0x20, 0x07, 0xb9, 0x73, 0x48, 0x4e, 0x59, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xd2, 0x05, 0x64, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x38, 0x00, 0x41, 0x00, 0x4e, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x12, 0x36, 0x37, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xad, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x39, 0x02, 0x7c, 0x07, 0x0b, 0xaf, 0x8b, 0x82, 0x37, 0x51, 0x14, 0x3e, 0x59, 0x70, 0x7a, 0x5f, 0x05, 0x79, 0xfc, 0x73, 0x1a, 0x60, 0x40, 0x38, 0x50, 0x18, 0xfd, 0x97, 0xaf, 0x3b, 0x0b, 0x01, 0xf7, 0x41, 0x43, 0x01, 0x93, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa9, 0x0d, 0x0b, 0xbf, 0x89, 0x09, 0x41, 0x34, 0x34, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc6, 0x33, 0x39, 0x2b, 0x26, 0xab, 0xfe, 0x9a, 0x29, 0x20, 0x07, 0xb9, 0x73, 0x48, 0x4e, 0x59, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x03, 0xff, 0xeb, 0x00, 0x1c, 0x04, 0x18, 0x02, 0xe4, 0x00, 0x1d, 0x00, 0x24, 0x00, 0x2d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x06, 0x36, 0x37, 0x35, 0x27, 0x15, 0x14, 0x16, 0x33, 0x02, 0x97, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x66, 0x93, 0x17, 0x39, 0x53, 0x70, 0x7a, 0x5f, 0x04, 0x2d, 0xbc, 0x7b, 0xde, 0x81, 0x55, 0x05, 0xfd, 0xea, 0x01, 0x17, 0x67, 0x3c, 0x0b, 0xf8, 0x41, 0x43, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x63, 0x54, 0x2e, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc8, 0x32, 0x3b, 0x5b, 0xcc, 0x9a, 0x2c, 0x21, 0x02, 0xba, 0x73, 0x48, 0x4e, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x9b, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x33, 0x00, 0x43, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x21, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x00, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x21, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x24, 0x36, 0x37, 0x35, 0x27, 0x15, 0x14, 0x16, 0x33, 0x06, 0x9b, 0x6f, 0x7f, 0x35, 0x71, 0x64, 0x7b, 0x01, 0x2f, 0x2e, 0x30, 0x36, 0x2a, 0xfe, 0x8b, 0x4a, 0x5e, 0x4f, 0x40, 0x40, 0x4e, 0x7a, 0x40, 0x76, 0x4f, 0x64, 0x90, 0x17, 0x39, 0x53, 0x70, 0x7a, 0x5f, 0x06, 0xb0, 0xfb, 0x68, 0x81, 0x55, 0x05, 0xfd, 0xea, 0x01, 0x17, 0x03, 0x82, 0x4c, 0xfd, 0xaf, 0x00, 0xff, 0x66, 0x71, 0x4b, 0x45, 0x04, 0x40, 0x3b, 0xfc, 0x57, 0x3c, 0x0b, 0xf8, 0x41, 0x43, 0x02, 0x78, 0xfd, 0x88, 0x86, 0x53, 0x7b, 0x74, 0x1a, 0x19, 0x1e, 0x24, 0x19, 0x4d, 0x48, 0x3f, 0x50, 0x4e, 0x3e, 0x4b, 0x72, 0x3f, 0x63, 0x54, 0x2e, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xfe, 0x3b, 0x5b, 0xcc, 0xfe, 0xe9, 0x5b, 0x4f, 0x01, 0x39, 0x61, 0x4b, 0x4b, 0x34, 0x41, 0x06, 0x33, 0x3e, 0x7d, 0x2c, 0x21, 0x02, 0xba, 0x73, 0x48, 0x4e, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x9e, 0x04, 0x18, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x2b, 0x00, 0x34, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x23, 0x23, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x06, 0x36, 0x37, 0x35, 0x27, 0x15, 0x14, 0x16, 0x33, 0x02, 0x97, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x54, 0x4b, 0x7e, 0x85, 0x68, 0x02, 0x06, 0x68, 0x83, 0x7c, 0x3a, 0x51, 0x10, 0x39, 0x53, 0x70, 0x7a, 0x5f, 0x04, 0x2d, 0xbc, 0x7b, 0xde, 0x81, 0x55, 0x05, 0xfd, 0xea, 0x01, 0x17, 0x67, 0x3c, 0x0b, 0xf8, 0x41, 0x43, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x57, 0x80, 0x1c, 0x91, 0x7e, 0x7e, 0x92, 0x15, 0x54, 0x3a, 0x2e, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc8, 0x32, 0x3b, 0x5b, 0xcc, 0x9a, 0x2c, 0x21, 0x02, 0xba, 0x73, 0x48, 0x4e, 0x00, 0x04, 0xff, 0xeb, 0xfe, 0xe9, 0x04, 0x19, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x2f, 0x00, 0x39, 0x00, 0x45, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x07, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x06, 0x36, 0x37, 0x34, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x02, 0x8a, 0x52, 0x4e, 0x47, 0x49, 0x50, 0x7b, 0x42, 0x76, 0x18, 0x4d, 0x33, 0x3d, 0x5a, 0x31, 0x30, 0x2a, 0x36, 0x1c, 0x1d, 0x50, 0x30, 0x70, 0x7a, 0x5f, 0x04, 0x2e, 0xbc, 0x94, 0xd8, 0x7a, 0x54, 0x1f, 0xfd, 0xea, 0x01, 0x0b, 0x60, 0x37, 0x0e, 0x02, 0xf3, 0x41, 0x43, 0x01, 0xaf, 0x35, 0x3e, 0x43, 0x3f, 0x33, 0x36, 0x3d, 0x01, 0xb8, 0x3b, 0x38, 0x35, 0x40, 0x46, 0x3b, 0x6a, 0x3f, 0xfe, 0x41, 0x7f, 0x22, 0x26, 0x34, 0x5c, 0x39, 0x36, 0x58, 0x1a, 0x1c, 0x34, 0x1c, 0x20, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xc0, 0x32, 0x3b, 0x53, 0xc4, 0xa2, 0x22, 0x1b, 0x07, 0x10, 0xb5, 0x73, 0x48, 0x4e, 0xb1, 0x3d, 0x33, 0x31, 0x3c, 0x42, 0x2d, 0x79, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x24, 0x04, 0x33, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x1b, 0x00, 0x23, 0x00, 0x2f, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x37, 0x35, 0x21, 0x12, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x0d, 0x5e, 0x79, 0x49, 0x7e, 0x4f, 0x61, 0x90, 0x19, 0x3d, 0x53, 0x70, 0x7a, 0x5f, 0x04, 0x48, 0xfd, 0xac, 0x1d, 0x5a, 0x37, 0xfe, 0x3b, 0xb1, 0x3c, 0x0a, 0xf8, 0x41, 0x43, 0x02, 0x19, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x4c, 0x74, 0x3e, 0x5f, 0x52, 0x30, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xcc, 0x2b, 0x38, 0x0b, 0x5e, 0xfe, 0x9a, 0x2d, 0x22, 0xba, 0x73, 0x48, 0x4e, 0x50, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xa6, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x2b, 0x00, 0x3b, 0x00, 0x43, 0x00, 0x4f, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x23, 0x23, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x36, 0x36, 0x37, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x21, 0x15, 0x21, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x24, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0xa6, 0x6f, 0x7e, 0x35, 0x72, 0x64, 0x7a, 0x01, 0x2e, 0x2e, 0x30, 0x5d, 0xbc, 0x1b, 0x1c, 0x46, 0x7c, 0x4f, 0x61, 0x90, 0x19, 0x3d, 0x53, 0x70, 0x7a, 0x5f, 0x06, 0xbb, 0xfb, 0x39, 0x1d, 0x5a, 0x37, 0xfe, 0x3b, 0x04, 0xa4, 0x4d, 0xfd, 0x54, 0x01, 0x5a, 0x66, 0x71, 0x4b, 0x45, 0x04, 0x3f, 0x3b, 0xfc, 0x4d, 0x3c, 0x0a, 0xf8, 0x41, 0x43, 0x01, 0xc6, 0x53, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x02, 0x78, 0xfd, 0x88, 0x91, 0x53, 0x77, 0x71, 0x11, 0x09, 0x19, 0x1e, 0x3d, 0x1e, 0x4e, 0x2d, 0x48, 0x70, 0x3f, 0x5f, 0x52, 0x30, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xc8, 0x2b, 0x38, 0x0b, 0x5e, 0xfe, 0x27, 0x5a, 0x4f, 0x01, 0x30, 0x60, 0x4a, 0x49, 0x34, 0x41, 0x06, 0x30, 0x3b, 0x73, 0x2d, 0x22, 0xba, 0x73, 0x48, 0x4e, 0x82, 0x52, 0x40, 0x40, 0x51, 0x51, 0x40, 0x40, 0x52, 0x00, 0x04, 0xff, 0xeb, 0xff, 0x9b, 0x04, 0x33, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x20, 0x00, 0x28, 0x00, 0x34, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x23, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x37, 0x35, 0x21, 0x12, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x03, 0x0d, 0x5e, 0x79, 0x5c, 0x4d, 0x86, 0x85, 0x6c, 0x6c, 0x83, 0x83, 0x3b, 0x54, 0x11, 0x3d, 0x53, 0x70, 0x7a, 0x5f, 0x04, 0x48, 0xfd, 0xac, 0x1d, 0x5a, 0x37, 0xfe, 0x3b, 0xb1, 0x3c, 0x0a, 0xf8, 0x41, 0x43, 0x02, 0x19, 0x53, 0x43, 0x41, 0x53, 0x53, 0x41, 0x43, 0x53, 0x02, 0x78, 0x5e, 0x11, 0x82, 0x65, 0x56, 0x7c, 0x1a, 0x9b, 0x82, 0x82, 0x9a, 0x14, 0x52, 0x3a, 0x30, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xcc, 0x2b, 0x38, 0x0b, 0x5e, 0xfe, 0x9a, 0x2d, 0x22, 0xba, 0x73, 0x48, 0x4e, 0x50, 0x51, 0x51, 0x40, 0x40, 0x52, 0x52, 0x40, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xe9, 0x02, 0xe4, 0x00, 0x16, 0x00, 0x19, 0x00, 0x22, 0x00, 0x2a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x17, 0x35, 0x21, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0xe9, 0x6f, 0x81, 0x9d, 0x6d, 0x65, 0x3c, 0x58, 0x1b, 0x1c, 0x58, 0x37, 0x6f, 0x77, 0x5f, 0x04, 0xfe, 0xfb, 0xdf, 0xf1, 0x01, 0x24, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0xfe, 0x97, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0x02, 0x78, 0xfe, 0xfc, 0x5f, 0x76, 0x2d, 0x29, 0x25, 0x2b, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb5, 0xb5, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x56, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x84, 0x02, 0xe4, 0x00, 0x23, 0x00, 0x26, 0x00, 0x2f, 0x00, 0x3b, 0x00, 0x43, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x17, 0x35, 0x21, 0x23, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x01, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x06, 0x84, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x80, 0x8d, 0x04, 0x0c, 0x54, 0x4b, 0xfe, 0xef, 0x6d, 0x65, 0x3c, 0x58, 0x1b, 0x1c, 0x58, 0x37, 0x6f, 0x77, 0x5f, 0x06, 0x99, 0xfa, 0x44, 0xf1, 0x01, 0x24, 0xa6, 0x2d, 0x27, 0x27, 0x2b, 0x02, 0xb7, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0xfb, 0xe0, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x98, 0x82, 0x12, 0x26, 0x48, 0x4b, 0x36, 0xfe, 0xfc, 0x5f, 0x76, 0x2d, 0x29, 0x25, 0x2b, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb5, 0xb5, 0xfe, 0xf0, 0x29, 0x33, 0x32, 0x2a, 0x01, 0x10, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x62, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x1d, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x15, 0x00, 0x1e, 0x00, 0x26, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x17, 0x35, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x1d, 0x6f, 0x80, 0x35, 0x67, 0x73, 0x3b, 0x1c, 0x5c, 0x3c, 0x6f, 0x77, 0x5f, 0x04, 0x32, 0xfc, 0xab, 0xee, 0x01, 0x78, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfe, 0x46, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x54, 0x2a, 0x33, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb3, 0xb3, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x8c, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0x1d, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x17, 0x00, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x17, 0x35, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x1d, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x5d, 0x35, 0x1c, 0x5d, 0x3c, 0x6f, 0x77, 0x5f, 0x04, 0x32, 0xfc, 0xab, 0xee, 0x01, 0x78, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0xfe, 0x46, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x09, 0x46, 0x2b, 0x34, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb3, 0xb3, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x8c, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x5b, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x30, 0x00, 0x39, 0x00, 0x41, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x15, 0x21, 0x17, 0x35, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x03, 0x9e, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x38, 0x55, 0x1b, 0x1c, 0x5b, 0x3c, 0x6f, 0x77, 0x5f, 0x05, 0x70, 0xfb, 0x6d, 0xef, 0x01, 0x66, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0xfe, 0x57, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x2b, 0x27, 0x29, 0x32, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb3, 0xb3, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x86, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xc6, 0x02, 0xe4, 0x00, 0x15, 0x00, 0x1b, 0x00, 0x1f, 0x00, 0x29, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x36, 0x33, 0x33, 0x35, 0x21, 0x21, 0x23, 0x15, 0x33, 0x04, 0x36, 0x37, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xc6, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x4a, 0x67, 0x13, 0x37, 0x4a, 0x6f, 0x77, 0x5f, 0x04, 0xdb, 0xfd, 0x22, 0x3b, 0x59, 0x4c, 0xfe, 0x00, 0x03, 0x0d, 0x95, 0x95, 0xfd, 0x9a, 0x37, 0x0c, 0x02, 0x04, 0xf1, 0x3f, 0x41, 0x01, 0x81, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x44, 0x3c, 0x27, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xbb, 0x2d, 0xac, 0xac, 0xba, 0x24, 0x1c, 0x08, 0x07, 0xb9, 0x72, 0x48, 0x4e, 0x51, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x06, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x8a, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x21, 0x00, 0x28, 0x00, 0x34, 0x00, 0x3e, 0x00, 0x49, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x36, 0x35, 0x27, 0x15, 0x14, 0x16, 0x33, 0x25, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x8a, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x4c, 0x69, 0x11, 0x35, 0x48, 0x6f, 0x77, 0x5f, 0x06, 0x9f, 0xfb, 0x62, 0x38, 0x56, 0x4c, 0xfe, 0x02, 0x02, 0x76, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xfb, 0xd6, 0x37, 0x0c, 0x05, 0xf1, 0x3f, 0x41, 0x01, 0x7f, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x48, 0x3e, 0x25, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xb9, 0x29, 0xb2, 0xb2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x62, 0x26, 0x1d, 0x0b, 0x01, 0xb9, 0x72, 0x48, 0x4e, 0x49, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x7b, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x1a, 0x00, 0x26, 0x00, 0x30, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x36, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x37, 0x34, 0x27, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x7b, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x58, 0x7a, 0x1f, 0x1d, 0x52, 0x32, 0x6f, 0x77, 0x5f, 0x04, 0x90, 0xfd, 0x58, 0x4c, 0x45, 0xfe, 0x64, 0x02, 0xc3, 0xa7, 0x57, 0x58, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0xe8, 0x38, 0x0b, 0x01, 0xee, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x49, 0x43, 0x20, 0x24, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xcb, 0x03, 0x48, 0x48, 0x36, 0x4d, 0x57, 0x63, 0x07, 0x49, 0x58, 0x60, 0x4b, 0x62, 0x2b, 0x22, 0x03, 0x01, 0xb7, 0x72, 0x48, 0x4e, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x2b, 0x02, 0xe4, 0x00, 0x13, 0x00, 0x1c, 0x00, 0x24, 0x00, 0x32, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x12, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x2b, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x4d, 0x6e, 0x18, 0x3d, 0x56, 0x6f, 0x77, 0x5f, 0x04, 0x40, 0xfd, 0xa5, 0x1b, 0x68, 0x43, 0x39, 0x56, 0x1a, 0xfd, 0x89, 0xac, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x01, 0x9c, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x4d, 0x43, 0x36, 0x90, 0x77, 0xcc, 0x6c, 0xfe, 0xce, 0x34, 0x3c, 0x2c, 0x27, 0xa9, 0xfe, 0x9a, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x60, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x05, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x29, 0x02, 0xe4, 0x00, 0x13, 0x00, 0x16, 0x00, 0x19, 0x00, 0x21, 0x00, 0x29, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x17, 0x35, 0x21, 0x21, 0x05, 0x06, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x37, 0x27, 0x15, 0x14, 0x16, 0x33, 0x04, 0x29, 0x6f, 0x7f, 0x34, 0x6d, 0x3e, 0x5c, 0x1d, 0x1d, 0x5b, 0x3b, 0x6f, 0x77, 0x5f, 0x04, 0x3e, 0xfc, 0x9f, 0xee, 0x01, 0x85, 0xfe, 0xfa, 0x01, 0x06, 0x58, 0x40, 0x0e, 0xfe, 0x41, 0x41, 0xfe, 0xbf, 0x39, 0x0a, 0xf0, 0x3f, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xeb, 0x46, 0x2f, 0x2c, 0x29, 0x32, 0x90, 0x77, 0xcc, 0x6c, 0x6c, 0xb3, 0xb3, 0xc0, 0xa6, 0x2c, 0x25, 0xb8, 0x73, 0x45, 0x51, 0x2d, 0x23, 0xb8, 0x72, 0x48, 0x4e, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0xec, 0x02, 0xe4, 0x00, 0x41, 0x00, 0x4d, 0x00, 0x5a, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x35, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x3b, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0xfe, 0x83, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x06, 0x01, 0xfc, 0x6e, 0x19, 0x63, 0x43, 0x38, 0x50, 0x18, 0xfd, 0xf8, 0x23, 0x01, 0xd8, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x09, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xd0, 0x38, 0x3e, 0x2b, 0x26, 0xab, 0x4c, 0x4c, 0x38, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xd2, 0x05, 0xec, 0x02, 0xe4, 0x00, 0x42, 0x00, 0x4e, 0x00, 0x5b, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x11, 0x23, 0x35, 0x06, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x05, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x04, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0x35, 0x16, 0x4f, 0x36, 0x3e, 0x5d, 0x32, 0x35, 0x5e, 0x3c, 0x23, 0x1f, 0x0c, 0x13, 0x31, 0x3e, 0x40, 0x32, 0x38, 0x39, 0x02, 0x7c, 0x07, 0x0b, 0xaf, 0x8b, 0x82, 0x4d, 0x5f, 0xfe, 0x83, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x06, 0x01, 0xfc, 0x6e, 0x19, 0x63, 0x43, 0x38, 0x50, 0x18, 0xfd, 0xf8, 0x23, 0x01, 0xd8, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xad, 0x26, 0x2d, 0x3c, 0x68, 0x41, 0x47, 0x67, 0x36, 0x07, 0x66, 0x04, 0x40, 0x38, 0x35, 0x44, 0x4c, 0x36, 0xfe, 0xd3, 0xa9, 0x0d, 0x0b, 0xbf, 0x89, 0x0c, 0x77, 0x58, 0x09, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xd0, 0x38, 0x3e, 0x2b, 0x26, 0xab, 0x4c, 0x4c, 0x38, 0xef, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xf7, 0x07, 0x88, 0x02, 0xe4, 0x00, 0x38, 0x00, 0x44, 0x00, 0x52, 0x00, 0x60, 0x00, 0x6d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x24, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x07, 0x88, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x05, 0x3a, 0x2e, 0x38, 0x37, 0x7c, 0x17, 0x54, 0x3a, 0x3f, 0x5e, 0x34, 0xfe, 0x83, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x07, 0x9d, 0xfa, 0xd2, 0x19, 0x63, 0x43, 0x38, 0x50, 0x18, 0xfd, 0xf8, 0x23, 0x03, 0x8d, 0x32, 0x1f, 0x54, 0x33, 0x39, 0x56, 0x1a, 0xfd, 0x99, 0x15, 0x4c, 0x35, 0x01, 0x75, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0xfd, 0x51, 0x37, 0x1c, 0x3f, 0x3a, 0x34, 0x46, 0x44, 0x35, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x0c, 0x2f, 0x3a, 0x4b, 0x37, 0xfe, 0xd3, 0xa2, 0x28, 0x2d, 0x3a, 0x6a, 0x45, 0x09, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x38, 0x3e, 0x2b, 0x26, 0xab, 0x4c, 0x4c, 0x38, 0x6f, 0x38, 0x20, 0x23, 0x2c, 0x27, 0xa9, 0xae, 0x24, 0x29, 0xfe, 0x9b, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x07, 0x24, 0x39, 0x1f, 0x32, 0x49, 0x44, 0x37, 0x38, 0x44, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0xc7, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x34, 0x00, 0x49, 0x00, 0x55, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x07, 0x00, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x21, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xc7, 0x70, 0x7f, 0x2d, 0x56, 0x0c, 0x14, 0x22, 0x74, 0x4d, 0x7d, 0x91, 0xfe, 0x82, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0xdc, 0xfc, 0x7d, 0x1d, 0x44, 0x46, 0xfe, 0xc6, 0x24, 0x02, 0x1c, 0x29, 0x1e, 0x20, 0x32, 0x58, 0x37, 0x57, 0x2c, 0xfe, 0x94, 0x5b, 0x4c, 0x4d, 0x44, 0x01, 0x4c, 0x36, 0x35, 0x32, 0x2d, 0x3d, 0x3b, 0x2f, 0x02, 0x78, 0xfd, 0x88, 0xb5, 0x3c, 0x02, 0x3a, 0x46, 0x8d, 0x80, 0x33, 0x70, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xc4, 0x4d, 0x44, 0x52, 0x6c, 0xfe, 0xbc, 0x38, 0x43, 0x5d, 0x52, 0x4f, 0x37, 0xfe, 0xca, 0x40, 0x1c, 0x51, 0x31, 0x3b, 0x5d, 0x34, 0x3d, 0xa1, 0x6e, 0x5c, 0x64, 0x06, 0x4b, 0x40, 0x4f, 0x72, 0x40, 0x2b, 0x2b, 0x3f, 0x39, 0x30, 0x33, 0x39, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x73, 0x02, 0xe4, 0x00, 0x28, 0x00, 0x39, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x07, 0x33, 0x35, 0x33, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x05, 0x73, 0x6f, 0x81, 0x8f, 0x34, 0x61, 0x41, 0x65, 0x71, 0x02, 0xfe, 0x80, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0x88, 0xf0, 0xfd, 0x2e, 0x23, 0xb8, 0x83, 0x2d, 0x28, 0x2a, 0x2e, 0x01, 0x0d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7e, 0x37, 0x3f, 0x61, 0x37, 0x71, 0x5e, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x44, 0xa2, 0x30, 0x39, 0x38, 0x31, 0xa2, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xa7, 0x02, 0xe4, 0x00, 0x32, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x03, 0x26, 0x5e, 0x53, 0x42, 0x44, 0x53, 0x7b, 0x43, 0x7b, 0x52, 0x51, 0x80, 0x48, 0x02, 0xfe, 0x7e, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xbc, 0xbc, 0x7b, 0xe1, 0x82, 0x57, 0x05, 0xfe, 0x44, 0x23, 0xde, 0x01, 0xb0, 0x4d, 0x48, 0x3f, 0x50, 0x54, 0x42, 0x4e, 0x77, 0x41, 0x40, 0x74, 0x4b, 0x0c, 0x18, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xc8, 0x30, 0x3d, 0x5b, 0x4c, 0x4c, 0x38, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xde, 0x02, 0xe4, 0x00, 0x2e, 0x00, 0x38, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x33, 0x04, 0xde, 0x6e, 0x82, 0x85, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x08, 0xfe, 0x78, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xf3, 0xf0, 0xfd, 0xc3, 0x23, 0xfd, 0x26, 0x6f, 0x43, 0x8b, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x7f, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x25, 0x23, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x23, 0x23, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x8a, 0x02, 0xe4, 0x00, 0x35, 0x00, 0x43, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x04, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x25, 0x23, 0x15, 0x14, 0x06, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x8a, 0x6f, 0x80, 0x1e, 0x67, 0x45, 0x77, 0x8c, 0x09, 0x18, 0x59, 0x43, 0x48, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x05, 0xfe, 0x7b, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x06, 0x9f, 0xfd, 0x43, 0x3f, 0x36, 0x32, 0xfd, 0x3d, 0x23, 0xed, 0x23, 0x6b, 0x44, 0x02, 0x4e, 0xa8, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x61, 0x02, 0x78, 0xfd, 0x88, 0xb4, 0x29, 0x2e, 0x81, 0x71, 0x3d, 0x48, 0x44, 0x42, 0x4a, 0x66, 0x7c, 0x7a, 0x1d, 0x1e, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xea, 0x46, 0x0b, 0x46, 0x3d, 0x36, 0x4c, 0x4c, 0x38, 0x29, 0x29, 0x7e, 0x4d, 0x56, 0x68, 0x08, 0x03, 0x45, 0x54, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xc2, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x35, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x23, 0x35, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x04, 0xc2, 0x6f, 0x7c, 0xd9, 0xa9, 0x01, 0x79, 0x15, 0x4a, 0x2e, 0x35, 0x4e, 0x0c, 0xfe, 0x14, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xd7, 0xed, 0xfd, 0xdc, 0x23, 0xc6, 0x1f, 0x69, 0x45, 0x3b, 0x5a, 0x1f, 0x02, 0x78, 0xfd, 0x88, 0xd6, 0xd6, 0x06, 0x01, 0x55, 0x21, 0x29, 0x35, 0x31, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x2f, 0x34, 0x2c, 0x23, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x3f, 0x02, 0xe4, 0x00, 0x37, 0x00, 0x46, 0x00, 0x54, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x00, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x06, 0x3f, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0x08, 0x67, 0x4a, 0x56, 0x4c, 0x49, 0x14, 0x28, 0x74, 0x90, 0x08, 0xfe, 0x78, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x06, 0x54, 0xfd, 0xd5, 0x3c, 0x5a, 0x39, 0x56, 0x1a, 0xfc, 0x5e, 0x23, 0xfd, 0x26, 0x6f, 0x43, 0x01, 0x94, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x22, 0x23, 0x48, 0x43, 0x42, 0x4b, 0x65, 0x7c, 0x79, 0x25, 0x23, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xf6, 0x34, 0x2c, 0x27, 0xa9, 0x4c, 0x4c, 0x38, 0x23, 0x23, 0xfe, 0xc4, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x21, 0x02, 0xed, 0x00, 0x37, 0x00, 0x4b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x11, 0x05, 0x15, 0x14, 0x07, 0x21, 0x32, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x05, 0x21, 0x6f, 0x82, 0x17, 0x73, 0x52, 0x75, 0x94, 0x0d, 0xfe, 0x88, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x02, 0xe3, 0x1e, 0x24, 0x59, 0x6d, 0x8a, 0x7d, 0x15, 0x04, 0x56, 0x54, 0x37, 0x5c, 0x35, 0xfd, 0x81, 0x20, 0x01, 0x0c, 0xc1, 0x2b, 0x24, 0x26, 0x2d, 0x05, 0x75, 0x03, 0x0d, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0xcc, 0x30, 0x43, 0x7d, 0x6e, 0x79, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x09, 0x6c, 0x59, 0x66, 0x72, 0x3f, 0x4d, 0x30, 0x5e, 0x41, 0x01, 0x51, 0x6c, 0x4c, 0x4b, 0x34, 0x7f, 0x23, 0x30, 0x2f, 0x28, 0x12, 0x14, 0x14, 0x15, 0x28, 0x25, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0xf4, 0x02, 0xed, 0x00, 0x44, 0x00, 0x59, 0x00, 0x64, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x21, 0x05, 0x15, 0x14, 0x07, 0x21, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x26, 0x35, 0x34, 0x37, 0x21, 0x23, 0x15, 0x14, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0xf4, 0x6e, 0x82, 0x1f, 0x65, 0x45, 0x50, 0x74, 0x21, 0x25, 0x7c, 0x4d, 0x80, 0x9d, 0x0c, 0xfe, 0x87, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x02, 0xe3, 0x1f, 0x24, 0x3a, 0x5a, 0x32, 0x8b, 0x7d, 0x15, 0x03, 0x56, 0x53, 0x5b, 0x6e, 0x0f, 0x54, 0x4c, 0xac, 0x02, 0xc2, 0xfa, 0xbd, 0x20, 0x01, 0x0c, 0x58, 0x69, 0x2a, 0x24, 0x26, 0x2c, 0x04, 0x75, 0x04, 0x0d, 0x03, 0xae, 0xa7, 0xaf, 0x59, 0x4f, 0x4e, 0x60, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x3d, 0x39, 0x3b, 0x40, 0x80, 0x72, 0x7f, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xcf, 0x4c, 0x44, 0x48, 0x6c, 0x09, 0x31, 0x5a, 0x3a, 0x64, 0x70, 0x40, 0x50, 0x6a, 0x5d, 0x24, 0x48, 0x4b, 0x36, 0x6c, 0x6c, 0x48, 0x4b, 0x34, 0x37, 0x44, 0x24, 0x2f, 0x2f, 0x28, 0x0e, 0x18, 0x1a, 0x0f, 0x28, 0x25, 0x4d, 0xb3, 0x0e, 0x49, 0x58, 0x5f, 0x4c, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xe5, 0x04, 0x80, 0x02, 0xe4, 0x00, 0x33, 0x00, 0x3d, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x23, 0x26, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x03, 0x19, 0x52, 0x42, 0x37, 0x2d, 0x41, 0x77, 0x7e, 0x16, 0x48, 0x2e, 0x3c, 0x62, 0x3a, 0xfe, 0x83, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0x95, 0x01, 0x7d, 0xa7, 0xdb, 0x7d, 0x51, 0x32, 0xfe, 0x31, 0x23, 0xd2, 0x01, 0xae, 0x44, 0x3d, 0x37, 0x41, 0x38, 0x34, 0xfe, 0xc4, 0xa5, 0x1d, 0x1f, 0x34, 0x66, 0x49, 0x0e, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xca, 0x33, 0x3c, 0x5b, 0x4c, 0x4c, 0x38, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x49, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x36, 0x00, 0x42, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x49, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x3c, 0x62, 0x3a, 0x01, 0xfe, 0x84, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0x5e, 0xf0, 0xfd, 0x58, 0x23, 0xde, 0x1f, 0x5f, 0x3a, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x32, 0x5d, 0x3f, 0x12, 0x08, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0x25, 0x26, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xb3, 0x02, 0xe4, 0x00, 0x24, 0x00, 0x2b, 0x00, 0x34, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x35, 0x35, 0x23, 0x15, 0x14, 0x07, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xb3, 0x6f, 0x80, 0x35, 0x67, 0x4e, 0x68, 0x16, 0xfe, 0x6a, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xc8, 0xfd, 0x99, 0x9b, 0x23, 0x02, 0x36, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf1, 0x43, 0x4d, 0x44, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x04, 0xcc, 0x4c, 0x4c, 0x38, 0xd0, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xeb, 0x04, 0xb3, 0x02, 0xe4, 0x00, 0x26, 0x00, 0x2d, 0x00, 0x36, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x07, 0x07, 0x23, 0x37, 0x26, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x35, 0x35, 0x23, 0x15, 0x14, 0x07, 0x25, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0xb3, 0x6f, 0x80, 0x0b, 0xdc, 0x8c, 0xbc, 0x43, 0x58, 0x15, 0xfe, 0x69, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xc8, 0xfd, 0x99, 0x9b, 0x23, 0x02, 0x36, 0xf6, 0x3d, 0x3e, 0x3a, 0x41, 0x02, 0x78, 0xfd, 0x88, 0xf6, 0x0d, 0xfe, 0xca, 0x07, 0x48, 0x3b, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x04, 0xcc, 0x4c, 0x4c, 0x38, 0xd0, 0xcc, 0x44, 0x4d, 0x4b, 0x38, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x06, 0x02, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x44, 0x00, 0x4d, 0x00, 0x00, 0x01, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x05, 0x14, 0x07, 0x33, 0x35, 0x23, 0x21, 0x23, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x45, 0x18, 0x52, 0x38, 0x3d, 0x5c, 0x33, 0x35, 0x5f, 0x3c, 0x26, 0x20, 0x12, 0x13, 0x31, 0x3d, 0x40, 0x32, 0x3c, 0x3d, 0x81, 0x31, 0x61, 0x4c, 0x64, 0x16, 0xfe, 0x5a, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x06, 0x17, 0xfb, 0xaf, 0x23, 0xd0, 0xad, 0x02, 0x13, 0xe4, 0x39, 0x39, 0x36, 0x3c, 0x02, 0x78, 0xac, 0x26, 0x2c, 0x3b, 0x66, 0x40, 0x48, 0x69, 0x37, 0x09, 0x64, 0x05, 0x42, 0x37, 0x35, 0x44, 0x52, 0x3e, 0xfe, 0xe1, 0xef, 0x41, 0x4d, 0x44, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0x4c, 0x4c, 0x38, 0xd0, 0xd2, 0x41, 0x4a, 0x47, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xcc, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x33, 0x00, 0x3c, 0x00, 0x45, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x04, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x07, 0x17, 0x24, 0x16, 0x16, 0x33, 0x32, 0x37, 0x27, 0x06, 0x15, 0x04, 0xcc, 0x6e, 0x7d, 0x19, 0x58, 0x3a, 0x45, 0x6f, 0x40, 0xfe, 0x84, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xe1, 0xfd, 0x8e, 0x1d, 0x74, 0x49, 0x39, 0x57, 0x1d, 0xfd, 0xd0, 0x23, 0x02, 0x5a, 0x24, 0x45, 0x30, 0x3b, 0x2a, 0xed, 0xfe, 0xdc, 0x2a, 0x48, 0x2a, 0x3c, 0x2a, 0xef, 0x13, 0x02, 0x78, 0xfd, 0x88, 0x97, 0x25, 0x2b, 0x3d, 0x6f, 0x47, 0x05, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x3c, 0x44, 0x2a, 0x24, 0x9e, 0x4c, 0x4c, 0x38, 0x92, 0x25, 0x28, 0x46, 0x2a, 0x22, 0xbf, 0x1a, 0x44, 0x24, 0x23, 0xbf, 0x23, 0x29, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x5a, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x32, 0x00, 0x36, 0x00, 0x41, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x14, 0x07, 0x33, 0x36, 0x33, 0x33, 0x35, 0x21, 0x21, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x5a, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x5d, 0x71, 0x05, 0xfe, 0x86, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0x6f, 0xfc, 0x57, 0x23, 0xfa, 0x38, 0x50, 0x4c, 0xfe, 0x55, 0x02, 0xb8, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x6a, 0x57, 0x19, 0x19, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xb8, 0x4c, 0x38, 0x24, 0xac, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x05, 0xff, 0xeb, 0xff, 0xf7, 0x07, 0x23, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x38, 0x00, 0x3f, 0x00, 0x4b, 0x00, 0x56, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x14, 0x07, 0x21, 0x36, 0x33, 0x33, 0x35, 0x21, 0x05, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x07, 0x23, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x78, 0x8b, 0x08, 0x88, 0x69, 0x62, 0x5d, 0x71, 0x07, 0xfe, 0x81, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x07, 0x38, 0xfa, 0x8e, 0x23, 0x01, 0x08, 0x35, 0x48, 0x4c, 0xfe, 0x52, 0x02, 0x26, 0xb3, 0x42, 0x40, 0xfe, 0xcb, 0x02, 0x5c, 0xa7, 0x5c, 0x53, 0x59, 0x4f, 0x4e, 0x60, 0xfd, 0x2c, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x88, 0x76, 0x3a, 0x69, 0x74, 0x6a, 0x58, 0x21, 0x18, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xb8, 0x4c, 0x38, 0x1e, 0xb2, 0xb2, 0x3c, 0x40, 0x36, 0x4d, 0x54, 0x65, 0x08, 0x49, 0x58, 0x60, 0x4b, 0x19, 0x2d, 0x27, 0x27, 0x2e, 0x39, 0x30, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x06, 0x02, 0xe4, 0x00, 0x25, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x05, 0x14, 0x07, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x21, 0x23, 0x15, 0x14, 0x06, 0x07, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x06, 0x6f, 0x82, 0x1f, 0x66, 0x44, 0x75, 0x8b, 0x0a, 0xfe, 0x84, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0x1b, 0xfc, 0xab, 0x23, 0xc1, 0x54, 0x4c, 0xfe, 0xc2, 0x02, 0x64, 0xa6, 0x5b, 0x55, 0x59, 0x50, 0x4e, 0x5f, 0x02, 0x78, 0xfd, 0x88, 0xab, 0x28, 0x2d, 0x7d, 0x6c, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xb8, 0x4c, 0x38, 0x41, 0x45, 0x4a, 0x61, 0x54, 0x64, 0x08, 0x43, 0x52, 0x60, 0x4b, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0xa6, 0x02, 0xe4, 0x00, 0x47, 0x00, 0x57, 0x00, 0x00, 0x01, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x17, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x04, 0x36, 0x37, 0x35, 0x21, 0x15, 0x14, 0x07, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x04, 0xd1, 0x3d, 0x49, 0x3a, 0x71, 0x50, 0x08, 0x1a, 0x1b, 0x3b, 0x44, 0x37, 0x32, 0x35, 0x35, 0x6c, 0x34, 0x33, 0x34, 0x38, 0x44, 0x3b, 0x1b, 0x1a, 0x08, 0x4f, 0x72, 0x3a, 0x01, 0xfe, 0x86, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0xbb, 0xfe, 0x37, 0x41, 0x34, 0xfd, 0x5f, 0x23, 0xce, 0x1d, 0x64, 0x3f, 0x45, 0x55, 0x13, 0x03, 0x02, 0x78, 0x73, 0x17, 0x73, 0x54, 0x49, 0x72, 0x40, 0x02, 0x71, 0x02, 0x4a, 0x3e, 0x37, 0x46, 0x4f, 0x40, 0x15, 0x15, 0x3f, 0x50, 0x45, 0x38, 0x3e, 0x4a, 0x02, 0x71, 0x02, 0x41, 0x71, 0x49, 0x10, 0x08, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0x6c, 0xb4, 0x40, 0x0b, 0x69, 0x4c, 0x4c, 0x38, 0x34, 0x37, 0x46, 0x37, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x04, 0xb2, 0x02, 0xe4, 0x00, 0x27, 0x00, 0x33, 0x00, 0x41, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x01, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x14, 0x07, 0x04, 0x36, 0x36, 0x35, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x04, 0xb2, 0x6e, 0x7e, 0x1a, 0x57, 0x38, 0x44, 0x67, 0x37, 0xfe, 0x8b, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x04, 0xc7, 0xfd, 0xa0, 0x1b, 0x69, 0x47, 0x39, 0x56, 0x1a, 0xfd, 0xeb, 0x23, 0x01, 0xdc, 0x3d, 0x1f, 0x47, 0x40, 0x3a, 0x4b, 0x4b, 0x3a, 0x02, 0x78, 0xfd, 0x88, 0x9e, 0x27, 0x2c, 0x3d, 0x6c, 0x46, 0x05, 0x74, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x39, 0x41, 0x2c, 0x27, 0xa9, 0x4c, 0x4c, 0x38, 0xf6, 0x26, 0x3c, 0x21, 0x01, 0x36, 0x4e, 0x48, 0x3b, 0x3c, 0x49, 0x00, 0x00, 0x03, 0xff, 0xeb, 0xff, 0xf7, 0x05, 0x4c, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x3a, 0x00, 0x40, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x35, 0x21, 0x15, 0x14, 0x07, 0x21, 0x25, 0x23, 0x15, 0x14, 0x07, 0x33, 0x05, 0x4c, 0x6f, 0x81, 0xfe, 0x69, 0x2a, 0x2a, 0x26, 0x2d, 0x7c, 0x6d, 0x61, 0x66, 0x70, 0xfe, 0x82, 0x2a, 0x2a, 0x27, 0x2c, 0x7c, 0x01, 0x6e, 0x60, 0x66, 0x70, 0x51, 0x50, 0x4a, 0xfe, 0xba, 0x05, 0x61, 0xfd, 0x99, 0x4a, 0xfe, 0x82, 0x23, 0x01, 0x08, 0x01, 0xc6, 0xac, 0x23, 0xcf, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x4d, 0x82, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x13, 0x5b, 0x6a, 0x79, 0x61, 0x71, 0x77, 0x2e, 0x38, 0x34, 0x29, 0x0d, 0x08, 0x0b, 0x5b, 0x6a, 0x79, 0x61, 0xca, 0x4d, 0x44, 0x4c, 0x6c, 0xfe, 0xc4, 0x4d, 0x45, 0x3e, 0x4c, 0x4c, 0x38, 0xd0, 0x4c, 0x48, 0x31, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x1c, 0x02, 0xcb, 0x02, 0xe4, 0x00, 0x36, 0x00, 0x42, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x27, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x15, 0x06, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x21, 0x16, 0x07, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x26, 0x23, 0xfc, 0x2a, 0x1a, 0x17, 0x36, 0x39, 0x98, 0x8c, 0x5d, 0x20, 0x2b, 0x3f, 0x3b, 0x3b, 0x3f, 0x30, 0x23, 0x34, 0x58, 0x35, 0x54, 0x88, 0x4e, 0x39, 0x37, 0x28, 0x2d, 0x55, 0x48, 0xf6, 0xfd, 0xff, 0x02, 0xe0, 0x71, 0xfe, 0xc4, 0x3c, 0x16, 0x1a, 0x16, 0x17, 0x19, 0x15, 0x1a, 0x01, 0xc4, 0x1b, 0x1d, 0x15, 0x1e, 0x08, 0x0d, 0xa1, 0x85, 0x7b, 0x7b, 0x47, 0x5b, 0x18, 0xa0, 0x3a, 0x47, 0x48, 0x39, 0xa2, 0x16, 0x58, 0x43, 0x40, 0x5d, 0x30, 0x02, 0x57, 0x01, 0x4a, 0x88, 0x59, 0x4c, 0x75, 0x24, 0x12, 0x3d, 0x2a, 0x39, 0x40, 0x5a, 0x6c, 0x6c, 0xb4, 0xba, 0x03, 0xbc, 0x1a, 0x21, 0x21, 0x1a, 0xbc, 0x03, 0x00, 0x03, 0xff, 0xeb, 0xff, 0x93, 0x05, 0x16, 0x02, 0xe4, 0x00, 0x2f, 0x00, 0x40, 0x00, 0x4c, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x0e, 0x02, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x07, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x33, 0x36, 0x36, 0x33, 0x21, 0x00, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0x16, 0x6f, 0x81, 0x97, 0x23, 0x36, 0x5d, 0x39, 0x4c, 0x73, 0x12, 0xe0, 0x37, 0x3f, 0x3e, 0x35, 0x2b, 0x38, 0x08, 0x7c, 0x06, 0x3c, 0x64, 0x41, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x23, 0x26, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x05, 0x2b, 0xf0, 0xfd, 0xb3, 0xb1, 0x23, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0xde, 0x0f, 0x7a, 0x56, 0x01, 0x35, 0xfe, 0xed, 0x38, 0x38, 0x2b, 0x2d, 0x39, 0x39, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x87, 0x30, 0x43, 0x3b, 0x56, 0x2c, 0x4f, 0x45, 0x42, 0x35, 0x36, 0x40, 0x2b, 0x20, 0x35, 0x52, 0x2f, 0x3a, 0x66, 0x43, 0x3c, 0x5d, 0x1d, 0x13, 0x3b, 0x27, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x4d, 0x54, 0xfe, 0xd1, 0x37, 0x2b, 0x2a, 0x37, 0x37, 0x2b, 0x2b, 0x36, 0x00, 0x00, 0x04, 0xff, 0xeb, 0xff, 0x93, 0x05, 0x2c, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x3e, 0x00, 0x42, 0x00, 0x4d, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x0e, 0x02, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x33, 0x33, 0x36, 0x36, 0x33, 0x33, 0x35, 0x21, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x01, 0x23, 0x15, 0x33, 0x05, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x05, 0x2c, 0x6f, 0x82, 0x95, 0x69, 0x62, 0x53, 0x6e, 0x0b, 0xdb, 0x36, 0x3f, 0x3e, 0x35, 0x2b, 0x38, 0x08, 0x7c, 0x06, 0x3c, 0x64, 0x41, 0x4a, 0x6d, 0x3a, 0x33, 0x2e, 0x23, 0x26, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x05, 0x41, 0xfb, 0xeb, 0x1d, 0xe4, 0x14, 0x6c, 0x4a, 0x4c, 0xfe, 0xab, 0xb1, 0x23, 0x2c, 0x16, 0x13, 0x03, 0x39, 0x95, 0x95, 0xfe, 0xf3, 0x48, 0x2c, 0x35, 0x2f, 0x25, 0x28, 0x2d, 0x02, 0x78, 0xfd, 0x88, 0x01, 0x63, 0x3b, 0x68, 0x74, 0x56, 0x49, 0x42, 0x35, 0x36, 0x40, 0x2b, 0x20, 0x35, 0x52, 0x2f, 0x3a, 0x66, 0x43, 0x3c, 0x5d, 0x1d, 0x13, 0x3b, 0x27, 0x3c, 0x44, 0x57, 0x6c, 0xfe, 0x6e, 0x3c, 0x3e, 0xac, 0xb4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x01, 0x2a, 0xac, 0x69, 0x2d, 0x28, 0x27, 0x2e, 0x38, 0x30, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x21, 0x03, 0x91, 0x02, 0xe4, 0x00, 0x2d, 0x00, 0x44, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x15, 0x06, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x00, 0x36, 0x35, 0x11, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x33, 0x03, 0x91, 0x70, 0x71, 0x34, 0x68, 0x40, 0x5a, 0x2d, 0x02, 0x07, 0x38, 0x36, 0x3b, 0x2e, 0x52, 0x5e, 0x35, 0x5d, 0x39, 0x5a, 0x8f, 0x51, 0x38, 0x35, 0x27, 0x2c, 0x55, 0x49, 0xa8, 0xfe, 0x4f, 0x03, 0xa6, 0xfe, 0xdc, 0x3f, 0x9f, 0xf2, 0x20, 0x2a, 0x2b, 0x2c, 0x33, 0x62, 0x74, 0x43, 0x35, 0x07, 0x3b, 0x31, 0x02, 0x78, 0xfc, 0xef, 0x7c, 0x4f, 0x34, 0x59, 0x37, 0x0b, 0x12, 0x21, 0x23, 0x24, 0x23, 0x66, 0x52, 0x3e, 0x5b, 0x31, 0x02, 0x5a, 0x01, 0x4b, 0x88, 0x58, 0x4a, 0x73, 0x23, 0x13, 0x3e, 0x28, 0x39, 0x40, 0x5a, 0x6c, 0xfd, 0x08, 0x5b, 0x49, 0x01, 0xe8, 0xb4, 0x1b, 0x1d, 0x27, 0x13, 0x0c, 0x4f, 0x4c, 0x39, 0x40, 0x06, 0x27, 0x31, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x1b, 0x02, 0xd5, 0x02, 0xe4, 0x00, 0x5c, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x15, 0x06, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x21, 0xfc, 0x2a, 0x1a, 0x17, 0x34, 0x38, 0x66, 0x7e, 0x13, 0x26, 0x2f, 0x49, 0x44, 0x0b, 0x08, 0x05, 0x0a, 0x1f, 0x23, 0x1d, 0x18, 0x1a, 0x1d, 0x47, 0x1c, 0x19, 0x19, 0x1c, 0x22, 0x1f, 0x09, 0x06, 0x07, 0x0c, 0x43, 0x49, 0x44, 0x36, 0x26, 0x31, 0x0b, 0x02, 0x10, 0x24, 0x11, 0x50, 0x3e, 0x66, 0x6b, 0x3a, 0x61, 0x3a, 0x58, 0x8f, 0x52, 0x39, 0x37, 0x28, 0x2d, 0x55, 0x48, 0xf6, 0xfd, 0xff, 0x02, 0xea, 0x7c, 0xfe, 0xc5, 0x01, 0xc4, 0x1b, 0x1d, 0x14, 0x1f, 0x08, 0x0d, 0x59, 0x4a, 0x0a, 0x3f, 0x31, 0x3e, 0x4c, 0x01, 0x43, 0x01, 0x24, 0x20, 0x1b, 0x23, 0x27, 0x21, 0x0a, 0x0a, 0x20, 0x28, 0x22, 0x1b, 0x21, 0x24, 0x01, 0x43, 0x01, 0x4c, 0x3e, 0x3d, 0x42, 0x26, 0x1d, 0x29, 0x11, 0x27, 0x2f, 0x70, 0x5a, 0x40, 0x60, 0x33, 0x53, 0x02, 0x4a, 0x89, 0x59, 0x4b, 0x75, 0x25, 0x12, 0x3d, 0x2a, 0x39, 0x40, 0x5a, 0x6c, 0x6c, 0xb4, 0x00, 0x00, 0x02, 0xff, 0xeb, 0xff, 0x1c, 0x02, 0x99, 0x02, 0xe4, 0x00, 0x3a, 0x00, 0x47, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x17, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x15, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x17, 0x06, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x21, 0x12, 0x36, 0x35, 0x35, 0x34, 0x26, 0x27, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0xfc, 0x2a, 0x2f, 0x29, 0x2f, 0x57, 0x77, 0x3b, 0x5d, 0x0f, 0x34, 0x23, 0x3e, 0x4a, 0x4e, 0x3d, 0x1f, 0x2f, 0x0f, 0x09, 0x50, 0x3e, 0x59, 0x65, 0x33, 0x56, 0x34, 0x01, 0x54, 0x88, 0x4e, 0x3b, 0x35, 0x28, 0x2d, 0x55, 0x48, 0xc4, 0xfe, 0x31, 0x02, 0xae, 0x6f, 0xfe, 0xf4, 0xbe, 0x26, 0x26, 0x24, 0x1f, 0x2b, 0x29, 0x21, 0x01, 0xc4, 0x1b, 0x1d, 0x29, 0x11, 0x0c, 0x43, 0x72, 0x47, 0xdb, 0x6f, 0x1a, 0x1e, 0x4d, 0x3c, 0x3b, 0x47, 0x19, 0x15, 0x30, 0x39, 0x6a, 0x57, 0x40, 0x5d, 0x30, 0x02, 0x57, 0x01, 0x4a, 0x88, 0x59, 0x4b, 0x75, 0x25, 0x12, 0x3d, 0x2a, 0x39, 0x40, 0x5a, 0x6c, 0x6c, 0xb4, 0xfe, 0x36, 0x2c, 0x1d, 0x01, 0x1e, 0x2b, 0x01, 0x29, 0x20, 0x22, 0x29, 0x00, 0x04, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xd6, 0x02, 0xe4, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x44, 0x00, 0x50, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x07, 0x23, 0x15, 0x14, 0x07, 0x17, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x04, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x05, 0xd6, 0x6f, 0x81, 0x1f, 0x66, 0x44, 0x75, 0x45, 0x1c, 0x5f, 0x38, 0x46, 0x69, 0x18, 0x04, 0x17, 0x69, 0x46, 0x40, 0x68, 0x3c, 0x3c, 0x68, 0x3f, 0x43, 0x66, 0x1f, 0x03, 0x1e, 0x66, 0x43, 0x38, 0x5d, 0x1c, 0x30, 0x2e, 0xfc, 0x2c, 0x05, 0xeb, 0xf0, 0xa9, 0xad, 0x01, 0x05, 0x57, 0x4b, 0x4e, 0x60, 0xfc, 0x80, 0x42, 0x42, 0x35, 0x35, 0x43, 0x44, 0x34, 0x01, 0xa1, 0x43, 0x42, 0x35, 0x35, 0x42, 0x42, 0x34, 0x02, 0x78, 0xfd, 0x88, 0xb3, 0x28, 0x2e, 0x48, 0x2e, 0x32, 0x43, 0x3a, 0x3a, 0x43, 0x39, 0x68, 0x44, 0x45, 0x6a, 0x39, 0x3f, 0x3c, 0x3c, 0x3f, 0x31, 0x2c, 0x0b, 0x46, 0x3c, 0x36, 0x6c, 0x6c, 0x4d, 0xad, 0x17, 0x0c, 0x43, 0x4f, 0x5f, 0x4c, 0xc1, 0x43, 0x34, 0x36, 0x44, 0x44, 0x37, 0x35, 0x41, 0x41, 0x35, 0x37, 0x44, 0x44, 0x36, 0x35, 0x42, 0x00, 0x01, 0xfd, 0xe1, 0x00, 0x00, 0x01, 0x4a, 0x04, 0x02, 0x00, 0x18, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x20, 0x11, 0x15, 0x01, 0x4a, 0x6f, 0x81, 0x6f, 0x73, 0x6a, 0x97, 0x95, 0x6b, 0x7c, 0xb4, 0xc8, 0x01, 0x7e, 0x02, 0xe4, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x09, 0x4b, 0x5e, 0x5f, 0x4a, 0x26, 0x2f, 0x7c, 0x90, 0xfe, 0xf4, 0x12, 0x00, 0x02, 0xff, 0x2a, 0x02, 0xd4, 0x00, 0xc3, 0x04, 0x05, 0x00, 0x12, 0x00, 0x1e, 0x00, 0x00, 0x03, 0x37, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x36, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0xd6, 0x01, 0x01, 0x75, 0x60, 0x3a, 0x58, 0x30, 0x01, 0x63, 0x01, 0x31, 0x2a, 0x2d, 0x35, 0x91, 0x1d, 0x16, 0x16, 0x1e, 0x1e, 0x16, 0x16, 0x1d, 0x02, 0xd4, 0x60, 0x62, 0x6f, 0x2b, 0x4b, 0x2e, 0x0b, 0x06, 0x22, 0x2f, 0x3b, 0x33, 0x5f, 0x5f, 0x1e, 0x1e, 0x15, 0x16, 0x1e, 0x1e, 0x16, 0xff, 0xff, 0x00, 0x33, 0x03, 0x36, 0x00, 0xcf, 0x03, 0xd1, 0x00, 0x03, 0x00, 0x79, 0x01, 0x1d, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xff, 0xa6, 0x02, 0xe4, 0x00, 0xea, 0x03, 0xf0, 0x00, 0x0f, 0x00, 0x00, 0x03, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x5a, 0x54, 0x52, 0x4c, 0x52, 0x03, 0x72, 0x01, 0x1e, 0x1b, 0x1d, 0x20, 0x02, 0xe4, 0x50, 0x51, 0x6b, 0x60, 0x51, 0x23, 0x27, 0x2e, 0x2c, 0x4b, 0x00, 0x02, 0xff, 0xa6, 0x02, 0xe4, 0x01, 0x22, 0x04, 0x05, 0x00, 0x12, 0x00, 0x1e, 0x00, 0x00, 0x03, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x07, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x36, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x5a, 0x6d, 0x59, 0x36, 0x53, 0x2d, 0x01, 0x63, 0x02, 0x2f, 0x2a, 0x2d, 0x36, 0x8b, 0x17, 0x0f, 0x11, 0x16, 0x16, 0x11, 0x0f, 0x17, 0x02, 0xe4, 0x50, 0x62, 0x6f, 0x2b, 0x4b, 0x2e, 0x0b, 0x06, 0x22, 0x2f, 0x3b, 0x33, 0x4f, 0x4d, 0x16, 0x16, 0x10, 0x11, 0x16, 0x17, 0x10, 0x00, 0x02, 0xff, 0xe5, 0xff, 0xaf, 0x02, 0xf8, 0x04, 0x09, 0x00, 0x3d, 0x00, 0x49, 0x00, 0x00, 0x00, 0x16, 0x07, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x35, 0x34, 0x36, 0x36, 0x33, 0x06, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x02, 0x90, 0x68, 0x01, 0x68, 0x02, 0x32, 0x2a, 0x2f, 0x32, 0x8e, 0x8b, 0xb5, 0x25, 0x33, 0x2b, 0x24, 0x2c, 0x58, 0x76, 0x5d, 0x53, 0x36, 0x47, 0x12, 0x7a, 0x74, 0x04, 0x3b, 0x31, 0x2c, 0x2f, 0x3c, 0x30, 0x3b, 0x47, 0x62, 0x68, 0x4f, 0x5b, 0xfe, 0x8e, 0x01, 0x78, 0x2e, 0x61, 0x48, 0x3c, 0x1e, 0x16, 0x16, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x04, 0x09, 0x62, 0x57, 0x24, 0x31, 0x3e, 0x37, 0x4c, 0x6c, 0xb7, 0x1c, 0x21, 0x1e, 0x1d, 0x53, 0x5d, 0x4a, 0x5f, 0x2a, 0x19, 0x84, 0x01, 0x00, 0x2c, 0x33, 0x2b, 0x21, 0x2b, 0x27, 0x03, 0x4a, 0x4a, 0x4e, 0x4b, 0x5a, 0x6c, 0x4d, 0x3a, 0x62, 0x3c, 0xb2, 0x1e, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x00, 0xff, 0xff, 0xff, 0x25, 0x00, 0x00, 0x01, 0xab, 0x03, 0xfa, 0x00, 0x22, 0x00, 0x17, 0x00, 0x00, 0x00, 0x07, 0x00, 0x79, 0x01, 0xf9, 0xff, 0xf6, 0x00, 0x01, 0xff, 0x25, 0x00, 0x00, 0x01, 0xcc, 0x03, 0xfa, 0x00, 0x25, 0x00, 0x00, 0x00, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x01, 0x7d, 0x4f, 0x05, 0x74, 0x02, 0x1e, 0x1e, 0x20, 0x1e, 0x6f, 0x6f, 0x81, 0x6f, 0x73, 0x28, 0x35, 0x36, 0x29, 0x7d, 0x69, 0x73, 0x85, 0x33, 0x0f, 0x40, 0x31, 0x03, 0xeb, 0x5e, 0x56, 0x25, 0x28, 0x2c, 0x23, 0x51, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x28, 0x36, 0x4b, 0x4b, 0x36, 0x45, 0x3e, 0x71, 0x84, 0x5a, 0x23, 0x28, 0x00, 0x02, 0xff, 0x25, 0x00, 0x00, 0x01, 0xe9, 0x03, 0xfa, 0x00, 0x27, 0x00, 0x33, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x07, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x06, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x01, 0x92, 0x57, 0x01, 0x68, 0x01, 0x2a, 0x25, 0x27, 0x2e, 0x6f, 0x6f, 0x81, 0x6f, 0x73, 0x28, 0x35, 0x36, 0x29, 0x7d, 0x69, 0x73, 0x83, 0x34, 0x12, 0x4a, 0x37, 0x08, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x1e, 0x16, 0x03, 0xf8, 0x56, 0x45, 0x0e, 0x07, 0x21, 0x2a, 0x36, 0x2e, 0x4b, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x28, 0x36, 0x4b, 0x4b, 0x36, 0x45, 0x3e, 0x71, 0x84, 0x58, 0x27, 0x2f, 0x89, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x16, 0x1e, 0x00, 0xff, 0xff, 0xfd, 0xe1, 0x00, 0x00, 0x01, 0xab, 0x04, 0x02, 0x00, 0x22, 0x02, 0x5b, 0x00, 0x00, 0x00, 0x07, 0x00, 0x79, 0x01, 0xf9, 0xff, 0xf6, 0x00, 0x01, 0xfd, 0xe1, 0x00, 0x00, 0x01, 0xcc, 0x04, 0x02, 0x00, 0x25, 0x00, 0x00, 0x00, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x01, 0x7d, 0x4f, 0x05, 0x74, 0x02, 0x1e, 0x1e, 0x20, 0x1e, 0x6f, 0x6f, 0x81, 0x6f, 0x73, 0x6a, 0x97, 0x95, 0x6b, 0x7c, 0xb4, 0xc8, 0xfe, 0x56, 0x0c, 0x43, 0x39, 0x03, 0xeb, 0x5e, 0x56, 0x25, 0x28, 0x2c, 0x23, 0x51, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x09, 0x4b, 0x5e, 0x5f, 0x4a, 0x26, 0x2f, 0x7c, 0x90, 0x77, 0x2b, 0x35, 0x00, 0x02, 0xfd, 0xe1, 0x00, 0x00, 0x01, 0xe9, 0x04, 0x02, 0x00, 0x27, 0x00, 0x33, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x07, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x15, 0x23, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x36, 0x36, 0x33, 0x06, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x01, 0x92, 0x57, 0x01, 0x68, 0x01, 0x2a, 0x25, 0x27, 0x2e, 0x6f, 0x6f, 0x81, 0x6f, 0x73, 0x6a, 0x97, 0x95, 0x6b, 0x7c, 0xb4, 0xc8, 0xfd, 0x56, 0x0e, 0x4e, 0x3f, 0x08, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x1e, 0x16, 0x03, 0xf8, 0x56, 0x45, 0x0e, 0x07, 0x21, 0x2a, 0x36, 0x2e, 0x4b, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x09, 0x4b, 0x5e, 0x5f, 0x4a, 0x26, 0x2f, 0x7c, 0x90, 0x76, 0x30, 0x3c, 0x89, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x16, 0x1e, 0x00, 0xff, 0xff, 0xfe, 0x2b, 0x02, 0xe0, 0x00, 0x41, 0x03, 0xe1, 0x00, 0x22, 0x00, 0x1e, 0x00, 0x00, 0x00, 0x07, 0x00, 0x79, 0x00, 0x8f, 0xff, 0xf9, 0x00, 0x01, 0xfe, 0x2b, 0x02, 0xe0, 0x00, 0x81, 0x03, 0xe1, 0x00, 0x1c, 0x00, 0x00, 0x12, 0x16, 0x15, 0x14, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x23, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x36, 0x36, 0x33, 0x33, 0x4e, 0x01, 0x6f, 0x02, 0x21, 0x1e, 0x21, 0x24, 0x16, 0x7a, 0x2d, 0x38, 0x39, 0x31, 0x31, 0x2e, 0x41, 0x50, 0x4a, 0x2a, 0x03, 0x47, 0x47, 0x03, 0xe1, 0x55, 0x43, 0x0d, 0x06, 0x1f, 0x29, 0x2b, 0x26, 0x24, 0x29, 0x46, 0x3e, 0x14, 0x69, 0x01, 0x13, 0x3c, 0x3e, 0x3c, 0x52, 0x00, 0x00, 0x02, 0xfe, 0x2b, 0x02, 0xe0, 0x00, 0xa1, 0x03, 0xea, 0x00, 0x1b, 0x00, 0x27, 0x00, 0x00, 0x12, 0x16, 0x07, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x17, 0x23, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x36, 0x36, 0x33, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x48, 0x59, 0x05, 0x58, 0x30, 0x2b, 0x2a, 0x33, 0x17, 0x02, 0x7a, 0x2d, 0x38, 0x39, 0x31, 0x31, 0x2e, 0x3f, 0x4f, 0x47, 0x28, 0x07, 0x53, 0x4a, 0x01, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x1e, 0x16, 0x03, 0xea, 0x5f, 0x4f, 0x26, 0x35, 0x35, 0x2d, 0x29, 0x29, 0x03, 0x46, 0x3e, 0x14, 0x69, 0x01, 0x12, 0x37, 0x38, 0x3b, 0x50, 0x79, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x16, 0x1e, 0xff, 0xff, 0xfe, 0x21, 0x02, 0xe1, 0x00, 0x46, 0x04, 0x24, 0x00, 0x22, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x07, 0x00, 0x79, 0x00, 0x94, 0xff, 0xf6, 0x00, 0x01, 0xfe, 0x21, 0x02, 0xe1, 0x00, 0x75, 0x04, 0x24, 0x00, 0x28, 0x00, 0x00, 0x12, 0x16, 0x15, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x16, 0x17, 0x23, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x36, 0x36, 0x33, 0x2c, 0x49, 0x01, 0x63, 0x02, 0x21, 0x1e, 0x21, 0x24, 0x11, 0x01, 0x03, 0x6e, 0x3f, 0x36, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x44, 0x4b, 0x4a, 0x34, 0x07, 0x45, 0x41, 0x03, 0xe1, 0x55, 0x44, 0x12, 0x1f, 0x29, 0x2b, 0x26, 0x20, 0x25, 0x01, 0x06, 0x2b, 0x1e, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x16, 0x51, 0x5c, 0x37, 0x49, 0x00, 0x02, 0xfe, 0x21, 0x02, 0xe1, 0x00, 0xa1, 0x04, 0x24, 0x00, 0x27, 0x00, 0x33, 0x00, 0x00, 0x12, 0x16, 0x07, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x14, 0x17, 0x23, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x36, 0x36, 0x33, 0x06, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x49, 0x58, 0x05, 0x58, 0x30, 0x2b, 0x2a, 0x33, 0x13, 0x05, 0x6e, 0x3f, 0x36, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x43, 0x4a, 0x49, 0x32, 0x09, 0x50, 0x46, 0x01, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x1e, 0x16, 0x03, 0xea, 0x61, 0x4d, 0x26, 0x35, 0x36, 0x2e, 0x24, 0x23, 0x02, 0x09, 0x2b, 0x1e, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x15, 0x4e, 0x58, 0x37, 0x4a, 0x79, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x16, 0x1e, 0x00, 0x00, 0x02, 0xff, 0x61, 0x00, 0x00, 0x01, 0x77, 0x03, 0xe1, 0x00, 0x13, 0x00, 0x1f, 0x00, 0x00, 0x02, 0x16, 0x16, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x21, 0x5d, 0x5b, 0x42, 0x71, 0x6f, 0x81, 0x6f, 0x73, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x01, 0xbb, 0x2d, 0x2d, 0x21, 0x21, 0x2d, 0x2d, 0x21, 0x03, 0xe0, 0x20, 0x69, 0x73, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x44, 0x3d, 0x13, 0x69, 0x17, 0x2d, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2d, 0x00, 0x00, 0x01, 0xff, 0x61, 0x00, 0x00, 0x01, 0xb7, 0x03, 0xe1, 0x00, 0x24, 0x00, 0x00, 0x01, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x01, 0x47, 0x02, 0x21, 0x1e, 0x21, 0x24, 0x14, 0x71, 0x6f, 0x81, 0x6f, 0x73, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x41, 0x50, 0x4a, 0x2a, 0x03, 0x47, 0x47, 0x44, 0x4e, 0x01, 0x03, 0x36, 0x1f, 0x29, 0x2b, 0x26, 0x23, 0x26, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x44, 0x3d, 0x13, 0x69, 0x01, 0x13, 0x3c, 0x3e, 0x3c, 0x52, 0x55, 0x43, 0x0d, 0x06, 0x00, 0x02, 0xff, 0x61, 0x00, 0x00, 0x01, 0xd7, 0x03, 0xea, 0x00, 0x22, 0x00, 0x2e, 0x00, 0x00, 0x00, 0x16, 0x07, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x1e, 0x02, 0x17, 0x36, 0x36, 0x33, 0x06, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x01, 0x7e, 0x59, 0x05, 0x58, 0x30, 0x2b, 0x2a, 0x33, 0x17, 0x71, 0x6f, 0x81, 0x6f, 0x73, 0x2c, 0x37, 0x38, 0x31, 0x31, 0x2e, 0x3f, 0x4f, 0x47, 0x28, 0x07, 0x53, 0x4a, 0x49, 0x1e, 0x16, 0x16, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x03, 0xea, 0x5f, 0x4f, 0x26, 0x35, 0x35, 0x2d, 0x28, 0x29, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x44, 0x3d, 0x13, 0x69, 0x01, 0x12, 0x37, 0x38, 0x3b, 0x50, 0x97, 0x1e, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0x00, 0x02, 0xff, 0x53, 0x00, 0x00, 0x01, 0x78, 0x04, 0x24, 0x00, 0x1e, 0x00, 0x2a, 0x00, 0x00, 0x02, 0x16, 0x16, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x2b, 0x53, 0x5c, 0x50, 0x76, 0x6f, 0x81, 0x6f, 0x79, 0x3c, 0x35, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x01, 0xc6, 0x2d, 0x2d, 0x21, 0x21, 0x2d, 0x2d, 0x21, 0x04, 0x24, 0x23, 0x81, 0x9c, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x29, 0x1d, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x5d, 0x2d, 0x21, 0x20, 0x2d, 0x2d, 0x20, 0x21, 0x2d, 0x00, 0x01, 0xff, 0x53, 0x00, 0x00, 0x01, 0xa7, 0x04, 0x24, 0x00, 0x2f, 0x00, 0x00, 0x01, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x07, 0x01, 0x43, 0x02, 0x21, 0x1e, 0x21, 0x24, 0x11, 0x02, 0x76, 0x6f, 0x81, 0x6f, 0x79, 0x3c, 0x35, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x44, 0x4b, 0x4a, 0x34, 0x07, 0x45, 0x41, 0x3f, 0x49, 0x01, 0x03, 0x36, 0x1f, 0x29, 0x2b, 0x26, 0x20, 0x25, 0x04, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x29, 0x1d, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x16, 0x51, 0x5c, 0x37, 0x49, 0x55, 0x44, 0x12, 0x00, 0x02, 0xff, 0x53, 0x00, 0x00, 0x01, 0xd3, 0x04, 0x24, 0x00, 0x2e, 0x00, 0x3a, 0x00, 0x00, 0x00, 0x16, 0x07, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x17, 0x17, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x2e, 0x02, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x16, 0x17, 0x36, 0x36, 0x33, 0x06, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x01, 0x7b, 0x58, 0x05, 0x58, 0x30, 0x2b, 0x2a, 0x33, 0x13, 0x03, 0x76, 0x6f, 0x81, 0x6f, 0x79, 0x3c, 0x35, 0x34, 0x3a, 0x32, 0x2f, 0x38, 0x36, 0x37, 0x29, 0x26, 0x3e, 0x37, 0x2e, 0x34, 0x32, 0x43, 0x4a, 0x49, 0x32, 0x09, 0x50, 0x46, 0x4b, 0x1e, 0x16, 0x16, 0x1d, 0x1d, 0x16, 0x16, 0x1e, 0x03, 0xea, 0x61, 0x4d, 0x26, 0x35, 0x36, 0x2e, 0x24, 0x23, 0x08, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x29, 0x1d, 0x08, 0x51, 0x07, 0x1b, 0x20, 0x44, 0x3e, 0x0f, 0x52, 0x15, 0x4e, 0x58, 0x37, 0x4a, 0x97, 0x1e, 0x1e, 0x16, 0x15, 0x1e, 0x1e, 0x15, 0xff, 0xff, 0xfe, 0x84, 0x03, 0x2e, 0x00, 0x47, 0x04, 0x43, 0x00, 0x02, 0x00, 0x7a, 0x07, 0x00, 0xff, 0xff, 0xff, 0xba, 0x00, 0x00, 0x01, 0x7d, 0x04, 0x43, 0x00, 0x22, 0x00, 0x15, 0x00, 0x00, 0x00, 0x03, 0x00, 0x7a, 0x01, 0x3d, 0x00, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf7, 0x03, 0x5b, 0x02, 0xe4, 0x00, 0x31, 0x00, 0x00, 0x01, 0x14, 0x07, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x27, 0x35, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x01, 0xc7, 0x29, 0xa0, 0x6a, 0x6d, 0x66, 0x56, 0x10, 0x26, 0x17, 0x14, 0x27, 0x2d, 0x30, 0x29, 0xfe, 0x7d, 0x29, 0x28, 0x25, 0x2b, 0x7c, 0x01, 0x6c, 0x5f, 0x66, 0x6d, 0x67, 0x50, 0x49, 0xfe, 0xa5, 0x03, 0x70, 0xfe, 0x6c, 0x02, 0x38, 0x54, 0x3d, 0x60, 0x59, 0x50, 0x5e, 0x05, 0x68, 0x05, 0x27, 0x23, 0x24, 0x29, 0x76, 0x2d, 0x37, 0x33, 0x29, 0x13, 0x07, 0x08, 0x5f, 0x6f, 0x78, 0x60, 0xd8, 0x49, 0x48, 0x40, 0x6c, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf7, 0x03, 0x0f, 0x02, 0xe4, 0x00, 0x29, 0x00, 0x00, 0x01, 0x14, 0x07, 0x33, 0x32, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x21, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x32, 0x36, 0x35, 0x35, 0x21, 0x35, 0x21, 0x15, 0x21, 0x01, 0xc7, 0x29, 0x4b, 0x6f, 0x74, 0x79, 0x3d, 0x3a, 0xfe, 0xea, 0x29, 0x28, 0x25, 0x2b, 0x7c, 0x01, 0x6c, 0x5f, 0x66, 0x6d, 0x67, 0x50, 0x49, 0xfe, 0xa5, 0x03, 0x24, 0xfe, 0xb8, 0x02, 0x38, 0x54, 0x3d, 0x71, 0x63, 0x5d, 0x5b, 0x34, 0x3a, 0x76, 0x2d, 0x37, 0x33, 0x29, 0x13, 0x07, 0x08, 0x5f, 0x6f, 0x78, 0x60, 0xd8, 0x49, 0x48, 0x40, 0x6c, 0x6c, 0x00, 0x01, 0xff, 0xeb, 0xfe, 0x98, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x3e, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x23, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x26, 0x37, 0x33, 0x06, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x05, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x4e, 0x66, 0x30, 0x79, 0x39, 0x34, 0x34, 0x3f, 0x53, 0x45, 0x70, 0x71, 0x79, 0x68, 0x45, 0x72, 0x42, 0x02, 0x72, 0x02, 0x4a, 0x3d, 0x35, 0x3d, 0x39, 0x39, 0x84, 0x92, 0x32, 0x2e, 0x22, 0x26, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x02, 0x73, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x3a, 0x60, 0x39, 0x2d, 0x3f, 0x40, 0x32, 0x37, 0x40, 0x5d, 0x59, 0x54, 0x60, 0x2f, 0x5f, 0x46, 0x37, 0x39, 0x2b, 0x25, 0x27, 0x2a, 0x77, 0x68, 0x3a, 0x5b, 0x1b, 0x13, 0x3b, 0x27, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x00, 0x01, 0xff, 0xeb, 0xfe, 0xa4, 0x02, 0x5e, 0x02, 0xe4, 0x00, 0x42, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x32, 0x16, 0x15, 0x07, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0x01, 0x05, 0x2c, 0x16, 0x13, 0x15, 0x1d, 0x4e, 0x67, 0x31, 0x02, 0x79, 0x02, 0x3a, 0x35, 0x34, 0x3f, 0x41, 0x37, 0x85, 0x7c, 0x01, 0x69, 0x50, 0x49, 0x2d, 0x3a, 0x31, 0x25, 0x1e, 0x1a, 0x0c, 0x4f, 0x67, 0x39, 0x2e, 0x30, 0x32, 0x2d, 0x22, 0x25, 0x57, 0x4a, 0x64, 0xfe, 0x8d, 0x02, 0x73, 0x85, 0xb1, 0x01, 0xc4, 0x1c, 0x20, 0x14, 0x1e, 0x08, 0x04, 0x3c, 0x61, 0x3a, 0x2f, 0x41, 0x40, 0x32, 0x36, 0x40, 0x01, 0xa7, 0x81, 0x2f, 0x36, 0x5a, 0x63, 0x2b, 0x26, 0x24, 0x27, 0x5c, 0x02, 0x58, 0x51, 0x53, 0x31, 0x1b, 0x58, 0x39, 0x3a, 0x5a, 0x1b, 0x13, 0x3b, 0x27, 0x3c, 0x44, 0x57, 0x6c, 0x6c, 0xb4, 0x00, 0x01, 0xff, 0xeb, 0xff, 0xf7, 0x02, 0x6e, 0x02, 0xe4, 0x00, 0x2a, 0x00, 0x00, 0x12, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x23, 0xcf, 0x37, 0x2e, 0x2b, 0x30, 0x2a, 0x34, 0x3c, 0x35, 0x3f, 0x4a, 0x6c, 0x01, 0x88, 0x75, 0x69, 0x84, 0x44, 0x30, 0x2f, 0x45, 0x63, 0x4f, 0x74, 0xfe, 0x79, 0x02, 0x83, 0x80, 0xbc, 0x01, 0xcb, 0x40, 0x1f, 0x21, 0x5f, 0x23, 0x23, 0x25, 0x29, 0x41, 0x3b, 0x6c, 0x71, 0x53, 0x4f, 0x36, 0x41, 0x08, 0x03, 0x09, 0x43, 0x33, 0x47, 0x44, 0x53, 0x6c, 0x6c, 0xad, 0x00, 0x02, 0x00, 0x1d, 0xfe, 0xba, 0x03, 0x5d, 0x02, 0xed, 0x00, 0x2b, 0x00, 0x37, 0x00, 0x00, 0x04, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x25, 0x07, 0x23, 0x35, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x11, 0x33, 0x15, 0x23, 0x11, 0x23, 0x00, 0x17, 0x17, 0x36, 0x36, 0x35, 0x34, 0x26, 0x27, 0x22, 0x06, 0x15, 0x02, 0x9b, 0x30, 0x3b, 0x2e, 0x26, 0x29, 0x2d, 0x37, 0x57, 0x7a, 0x43, 0x3e, 0xfe, 0xdb, 0x9a, 0x93, 0xcb, 0x42, 0x45, 0x33, 0x5f, 0x3f, 0x41, 0x60, 0x34, 0x2f, 0x37, 0xce, 0xee, 0x6f, 0x27, 0xfe, 0x13, 0x55, 0x11, 0x27, 0x2a, 0x31, 0x2a, 0x29, 0x33, 0x36, 0x30, 0x25, 0x2c, 0x28, 0x0c, 0x64, 0x0f, 0x59, 0x5d, 0x3e, 0x59, 0x12, 0x7f, 0x98, 0x78, 0x0f, 0x9d, 0x29, 0x61, 0x3f, 0x37, 0x57, 0x32, 0x30, 0x54, 0x35, 0x3a, 0x57, 0x2e, 0x6c, 0x01, 0xdb, 0x6c, 0xfd, 0x52, 0x02, 0x14, 0x2e, 0x09, 0x1e, 0x3b, 0x27, 0x25, 0x35, 0x01, 0x35, 0x26, 0x00, 0x01, 0xff, 0xeb, 0xff, 0x11, 0x02, 0xb6, 0x02, 0xe4, 0x00, 0x40, 0x00, 0x00, 0x12, 0x06, 0x15, 0x14, 0x16, 0x17, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x17, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x15, 0x06, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x35, 0x21, 0x35, 0x21, 0x15, 0x23, 0x15, 0x21, 0xfc, 0x2a, 0x1a, 0x17, 0x34, 0x38, 0x77, 0x81, 0x06, 0x50, 0x51, 0x25, 0x25, 0x2e, 0x23, 0x29, 0x1e, 0x24, 0x33, 0x42, 0x5d, 0x54, 0x4e, 0x1d, 0x2c, 0x10, 0x49, 0x43, 0x65, 0x69, 0x40, 0x6f, 0x47, 0x67, 0x9e, 0x58, 0x39, 0x37, 0x28, 0x2d, 0x55, 0x48, 0xf1, 0xfe, 0x04, 0x02, 0xcb, 0x61, 0xfe, 0xc9, 0x01, 0xc4, 0x1b, 0x1d, 0x14, 0x1f, 0x08, 0x0d, 0x77, 0x61, 0x22, 0x1c, 0x1e, 0x1d, 0x0b, 0x4d, 0x0d, 0x43, 0x44, 0x3d, 0x48, 0x02, 0x23, 0x1f, 0x6e, 0x59, 0x43, 0x62, 0x34, 0x57, 0x02, 0x4b, 0x8e, 0x5d, 0x4b, 0x75, 0x25, 0x12, 0x3d, 0x2a, 0x39, 0x40, 0x5a, 0x6c, 0x6c, 0xb4, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x02, 0xfd, 0x03, 0xfa, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x3e, 0x02, 0x33, 0x02, 0x0e, 0x99, 0x56, 0x7e, 0x3d, 0x60, 0x36, 0x55, 0x7a, 0x03, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x03, 0x57, 0x96, 0x62, 0x03, 0xfa, 0x46, 0x84, 0x58, 0x11, 0x0f, 0x3f, 0x53, 0x28, 0x53, 0x59, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x58, 0x7d, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x34, 0x03, 0xfb, 0x00, 0x18, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x33, 0x02, 0x36, 0xa5, 0x59, 0x7e, 0x87, 0x68, 0x67, 0x82, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0xc2, 0xa6, 0x03, 0xfb, 0x46, 0x84, 0x59, 0x12, 0x0f, 0x5e, 0x5e, 0x53, 0x5a, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x86, 0x91, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0x6d, 0x03, 0xfc, 0x00, 0x17, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x20, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x33, 0x02, 0x5e, 0xb2, 0x5d, 0x7f, 0x91, 0x7c, 0xff, 0x01, 0x08, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0xcb, 0xb8, 0x03, 0xfc, 0x47, 0x84, 0x5b, 0x11, 0x0d, 0x62, 0x5e, 0xae, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x88, 0x90, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0xa4, 0x03, 0xfd, 0x00, 0x17, 0x00, 0x00, 0x00, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x33, 0x02, 0xca, 0xda, 0x7f, 0x9c, 0x8e, 0x8a, 0x93, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0xd3, 0xca, 0x03, 0xfd, 0x9d, 0x8b, 0x11, 0x0d, 0x62, 0x60, 0x52, 0x5d, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x8a, 0x8f, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x03, 0xdc, 0x03, 0xfe, 0x00, 0x15, 0x00, 0x00, 0x00, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x21, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x12, 0x21, 0x02, 0xf8, 0xe4, 0x7f, 0xfe, 0xb8, 0x9c, 0x9b, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x0b, 0x01, 0xb2, 0x03, 0xfe, 0x9d, 0x8e, 0x11, 0x0e, 0xc4, 0x52, 0x5e, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x01, 0x1a, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x13, 0x03, 0xff, 0x00, 0x17, 0x00, 0x00, 0x00, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x33, 0x03, 0x26, 0xed, 0x7f, 0xb1, 0xb4, 0xad, 0xa4, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0xe5, 0xee, 0x03, 0xff, 0x9d, 0x91, 0x10, 0x0e, 0x65, 0x61, 0x53, 0x5e, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x8d, 0x8e, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x4b, 0x03, 0xff, 0x00, 0x18, 0x00, 0x00, 0x00, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x21, 0x03, 0x53, 0xf8, 0x7f, 0xba, 0xc8, 0x80, 0x9f, 0x4e, 0x03, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x06, 0xee, 0x00, 0xff, 0x03, 0xff, 0x9e, 0x91, 0x10, 0x01, 0x0c, 0x68, 0x60, 0x24, 0x4d, 0x40, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x8e, 0x8d, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0x82, 0x04, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 0x04, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x21, 0x03, 0x81, 0x01, 0x01, 0x7e, 0xc6, 0xda, 0x8d, 0xa9, 0x50, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x06, 0xf7, 0x01, 0x11, 0x04, 0x00, 0x9d, 0x94, 0x0f, 0x0c, 0x69, 0x61, 0x24, 0x4e, 0x40, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x8f, 0x8d, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xba, 0x04, 0x01, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x04, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x3e, 0x02, 0x33, 0x03, 0xae, 0x01, 0x0c, 0x7f, 0x5a, 0xc3, 0xa0, 0x99, 0xb4, 0x53, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x04, 0x6f, 0xf0, 0xc5, 0x04, 0x01, 0x9f, 0x95, 0x0f, 0x01, 0x0b, 0x47, 0x5a, 0x2c, 0x24, 0x4e, 0x41, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x60, 0x7d, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x04, 0xf1, 0x04, 0x02, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x04, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x3e, 0x02, 0x33, 0x03, 0xdc, 0x01, 0x15, 0x7e, 0x5e, 0xd0, 0xad, 0xa5, 0xc0, 0x55, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x04, 0x72, 0xfb, 0xd1, 0x04, 0x02, 0x9e, 0x98, 0x0f, 0x01, 0x0b, 0x48, 0x5a, 0x2d, 0x25, 0x4e, 0x41, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x61, 0x7d, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x29, 0x04, 0x03, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x33, 0x03, 0x9d, 0x01, 0x14, 0x78, 0x7f, 0x61, 0xdd, 0xb9, 0xb1, 0xcb, 0x59, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x04, 0x75, 0x01, 0x07, 0xdd, 0x04, 0x03, 0x4a, 0x8a, 0x64, 0x0f, 0x01, 0x0a, 0x49, 0x5c, 0x2d, 0x26, 0x4e, 0x41, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x62, 0x7d, 0x40, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x61, 0x04, 0x04, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x33, 0x03, 0xc4, 0x01, 0x21, 0x7c, 0x7f, 0x65, 0xe9, 0xc7, 0xbd, 0xd6, 0x5c, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x04, 0x78, 0x01, 0x12, 0xea, 0x04, 0x04, 0x4b, 0x8a, 0x66, 0x0d, 0x0a, 0x49, 0x5d, 0x2e, 0x26, 0x4f, 0x41, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x62, 0x7e, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0x98, 0x04, 0x05, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x33, 0x03, 0xec, 0x01, 0x2d, 0x7f, 0x80, 0x68, 0xf6, 0xd4, 0xc8, 0xe2, 0x5e, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x04, 0x7b, 0x01, 0x1e, 0xf6, 0x04, 0x05, 0x4b, 0x8b, 0x67, 0x0e, 0x0b, 0x4a, 0x5d, 0x2f, 0x27, 0x4f, 0x41, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x63, 0x7e, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x05, 0xd0, 0x04, 0x06, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0x14, 0x01, 0x3a, 0x82, 0x80, 0x6c, 0xfe, 0xfd, 0xe0, 0xd4, 0xed, 0x62, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x7e, 0x01, 0x28, 0x01, 0x03, 0x04, 0x06, 0x4c, 0x8c, 0x69, 0x0c, 0x01, 0x09, 0x4b, 0x5e, 0x30, 0x27, 0x4f, 0x42, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x64, 0x7e, 0x40, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x08, 0x04, 0x07, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x23, 0x22, 0x06, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0x3d, 0x01, 0x46, 0x85, 0x7f, 0x70, 0xfe, 0xf1, 0xee, 0xe2, 0xf8, 0x64, 0x04, 0x70, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x80, 0x01, 0x35, 0x01, 0x0f, 0x04, 0x07, 0x4c, 0x8d, 0x69, 0x0d, 0x01, 0x09, 0x4c, 0x5f, 0x30, 0x28, 0x4f, 0x42, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x65, 0x7e, 0x40, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x40, 0x04, 0x08, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x24, 0x23, 0x22, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0x64, 0x01, 0x53, 0x89, 0x81, 0x73, 0xfe, 0xe5, 0xfb, 0xec, 0xfe, 0xfd, 0x68, 0x04, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x84, 0x01, 0x3f, 0x01, 0x1b, 0x04, 0x08, 0x4d, 0x8d, 0x6a, 0x0c, 0x09, 0x4d, 0x5f, 0x31, 0x28, 0x50, 0x42, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x65, 0x7e, 0x41, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x06, 0x77, 0x04, 0x09, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x24, 0x21, 0x22, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0x8c, 0x01, 0x5f, 0x8c, 0x80, 0x77, 0xfe, 0xd8, 0xfe, 0xf8, 0xf8, 0xfe, 0xf1, 0x6a, 0x04, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x87, 0x01, 0x4a, 0x01, 0x28, 0x04, 0x09, 0x4d, 0x8e, 0x6c, 0x0b, 0x08, 0x4e, 0x60, 0x32, 0x29, 0x50, 0x42, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x67, 0x7e, 0x40, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xae, 0x04, 0x0a, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0xb4, 0x01, 0x6b, 0x8f, 0x7f, 0x7b, 0xfe, 0xcb, 0xfe, 0xec, 0xfe, 0xfb, 0xfe, 0xe7, 0x6e, 0x04, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x89, 0x01, 0x56, 0x01, 0x34, 0x04, 0x0a, 0x4e, 0x8e, 0x6d, 0x0c, 0x01, 0x08, 0x4e, 0x61, 0x33, 0x29, 0x50, 0x43, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x67, 0x7e, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x06, 0xe7, 0x04, 0x0b, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x04, 0xdb, 0x01, 0x79, 0x93, 0x80, 0x7f, 0xfe, 0xbe, 0xfe, 0xdf, 0xfe, 0xf0, 0xfe, 0xdb, 0x71, 0x04, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x8d, 0x01, 0x61, 0x01, 0x40, 0x04, 0x0b, 0x4e, 0x90, 0x6d, 0x0c, 0x01, 0x08, 0x4f, 0x62, 0x33, 0x2a, 0x50, 0x43, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x67, 0x7f, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x1e, 0x04, 0x0c, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x05, 0x03, 0x01, 0x84, 0x97, 0x80, 0x82, 0xfe, 0xb1, 0xfe, 0xd1, 0xfe, 0xe6, 0xfe, 0xcf, 0x73, 0x05, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x90, 0x01, 0x6c, 0x01, 0x4c, 0x04, 0x0c, 0x4f, 0x90, 0x6f, 0x0a, 0x01, 0x05, 0x50, 0x64, 0x34, 0x2a, 0x51, 0x43, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x68, 0x7f, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x56, 0x04, 0x0c, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x23, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x05, 0x2b, 0x01, 0x91, 0x9a, 0x80, 0x86, 0xfe, 0xa5, 0xfe, 0xc4, 0xfe, 0xd9, 0xfe, 0xc4, 0x76, 0x05, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x93, 0x01, 0x77, 0x01, 0x59, 0x04, 0x0c, 0x4f, 0x91, 0x6f, 0x0a, 0x06, 0x51, 0x64, 0x34, 0x2a, 0x51, 0x43, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x69, 0x7e, 0x41, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x07, 0x8d, 0x04, 0x0d, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x05, 0x53, 0x01, 0x9d, 0x9d, 0x7f, 0x8a, 0xfe, 0x97, 0xfe, 0xb8, 0xfe, 0xcc, 0xfe, 0xba, 0x79, 0x05, 0x6f, 0x6f, 0x81, 0x6f, 0x6f, 0x05, 0x96, 0x01, 0x82, 0x01, 0x66, 0x04, 0x0d, 0x50, 0x92, 0x70, 0x0a, 0x01, 0x06, 0x51, 0x65, 0x35, 0x2a, 0x52, 0x43, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x6a, 0x7e, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x07, 0xc6, 0x04, 0x0e, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x05, 0x7a, 0x01, 0xab, 0xa1, 0x82, 0x8d, 0xfe, 0x8c, 0xfe, 0xaa, 0xfe, 0xc1, 0xfe, 0xaf, 0x7d, 0x05, 0x6f, 0x6f, 0x81, 0x6f, 0x70, 0x05, 0x98, 0x01, 0x8e, 0x01, 0x71, 0x04, 0x0e, 0x50, 0x93, 0x72, 0x09, 0x01, 0x06, 0x52, 0x66, 0x35, 0x2b, 0x51, 0x44, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x6a, 0x7f, 0x41, 0x00, 0x00, 0x01, 0xff, 0xeb, 0x00, 0x00, 0x07, 0xfd, 0x04, 0x0f, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x04, 0x16, 0x15, 0x15, 0x27, 0x35, 0x34, 0x26, 0x24, 0x21, 0x20, 0x04, 0x06, 0x07, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x36, 0x36, 0x24, 0x21, 0x05, 0xa3, 0x01, 0xb6, 0xa4, 0x81, 0x91, 0xfe, 0x7f, 0xfe, 0x9e, 0xfe, 0xb5, 0xfe, 0xa3, 0x80, 0x05, 0x6f, 0x6f, 0x81, 0x6f, 0x70, 0x05, 0x9b, 0x01, 0x9a, 0x01, 0x7e, 0x04, 0x0f, 0x50, 0x94, 0x73, 0x09, 0x01, 0x05, 0x53, 0x67, 0x36, 0x2b, 0x52, 0x44, 0x6c, 0xfd, 0x88, 0x02, 0x78, 0x6c, 0x6b, 0x7f, 0x41, 0x00, 0x00, 0x02, 0x00, 0x5b, 0xff, 0xf9, 0x01, 0x07, 0x02, 0xc6, 0x00, 0x03, 0x00, 0x0f, 0x00, 0x00, 0x13, 0x03, 0x23, 0x03, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0xfa, 0x10, 0x76, 0x11, 0x29, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0x02, 0xc6, 0xfe, 0x1d, 0x01, 0xe3, 0xfd, 0x33, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x00, 0x02, 0x00, 0x25, 0x02, 0x4a, 0x01, 0x47, 0x03, 0x1e, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x07, 0x23, 0x27, 0x21, 0x07, 0x23, 0x27, 0x9d, 0x0c, 0x5f, 0x0d, 0x01, 0x22, 0x0d, 0x5f, 0x0d, 0x03, 0x1e, 0xd4, 0xd4, 0xd4, 0xd4, 0x00, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x00, 0x03, 0x47, 0x02, 0xe4, 0x00, 0x1b, 0x00, 0x1f, 0x00, 0x00, 0x01, 0x07, 0x33, 0x15, 0x23, 0x07, 0x23, 0x37, 0x23, 0x07, 0x23, 0x37, 0x23, 0x35, 0x33, 0x37, 0x23, 0x35, 0x33, 0x37, 0x33, 0x07, 0x33, 0x37, 0x33, 0x07, 0x33, 0x15, 0x21, 0x23, 0x07, 0x33, 0x02, 0xac, 0x21, 0x7f, 0x9a, 0x24, 0x85, 0x24, 0xb6, 0x24, 0x84, 0x24, 0x97, 0xb2, 0x21, 0x96, 0xb1, 0x23, 0x84, 0x23, 0xb6, 0x23, 0x85, 0x23, 0x80, 0xfe, 0xe0, 0xb6, 0x21, 0xb6, 0x01, 0xc1, 0x9a, 0x7d, 0xaa, 0xaa, 0xaa, 0xaa, 0x7d, 0x9a, 0x7d, 0xa6, 0xa6, 0xa6, 0xa6, 0x7d, 0x9a, 0x00, 0x00, 0x03, 0x00, 0x35, 0xff, 0xa9, 0x02, 0x37, 0x03, 0x14, 0x00, 0x23, 0x00, 0x2a, 0x00, 0x31, 0x00, 0x00, 0x24, 0x06, 0x06, 0x07, 0x15, 0x23, 0x35, 0x26, 0x26, 0x27, 0x33, 0x16, 0x17, 0x35, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x37, 0x35, 0x33, 0x15, 0x16, 0x16, 0x17, 0x23, 0x26, 0x26, 0x27, 0x15, 0x1e, 0x02, 0x15, 0x00, 0x16, 0x17, 0x35, 0x06, 0x06, 0x15, 0x12, 0x36, 0x35, 0x34, 0x26, 0x27, 0x15, 0x02, 0x37, 0x35, 0x67, 0x46, 0x40, 0x64, 0x7a, 0x02, 0x96, 0x06, 0x44, 0x48, 0x58, 0x40, 0x7d, 0x63, 0x40, 0x60, 0x73, 0x07, 0x97, 0x03, 0x23, 0x1d, 0x4b, 0x57, 0x40, 0xfe, 0x90, 0x28, 0x26, 0x24, 0x2a, 0xb4, 0x2b, 0x2a, 0x27, 0x95, 0x5b, 0x3b, 0x05, 0x51, 0x52, 0x09, 0x67, 0x58, 0x48, 0x0f, 0xbf, 0x12, 0x24, 0x50, 0x45, 0x57, 0x6e, 0x08, 0x51, 0x51, 0x08, 0x64, 0x58, 0x1d, 0x2b, 0x09, 0xbd, 0x13, 0x23, 0x4f, 0x45, 0x01, 0x13, 0x29, 0x0d, 0xad, 0x05, 0x2c, 0x25, 0xfe, 0x74, 0x30, 0x22, 0x21, 0x28, 0x0d, 0xaf, 0x00, 0x05, 0x00, 0x25, 0xff, 0xf4, 0x03, 0x18, 0x02, 0xc8, 0x00, 0x0b, 0x00, 0x0f, 0x00, 0x18, 0x00, 0x24, 0x00, 0x2c, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x25, 0x01, 0x23, 0x01, 0x04, 0x15, 0x14, 0x33, 0x32, 0x36, 0x35, 0x34, 0x23, 0x00, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x36, 0x15, 0x14, 0x33, 0x32, 0x35, 0x34, 0x23, 0x25, 0x59, 0x46, 0x46, 0x59, 0x59, 0x46, 0x46, 0x59, 0x02, 0x82, 0xfe, 0x77, 0x88, 0x01, 0x88, 0xfe, 0x6e, 0x37, 0x1b, 0x1e, 0x39, 0x01, 0x19, 0x59, 0x46, 0x46, 0x57, 0x57, 0x46, 0x47, 0x58, 0x65, 0x39, 0x38, 0x38, 0x02, 0x72, 0x56, 0x56, 0x4c, 0x4d, 0x56, 0x56, 0x4d, 0x96, 0xfd, 0x44, 0x02, 0xbc, 0x48, 0x4e, 0x4f, 0x27, 0x28, 0x4e, 0xfe, 0x70, 0x55, 0x55, 0x4d, 0x4d, 0x56, 0x56, 0x4d, 0x4e, 0x4e, 0x4f, 0x4f, 0x4e, 0x00, 0x00, 0x02, 0x00, 0x23, 0xff, 0xf4, 0x03, 0x0a, 0x02, 0xc9, 0x00, 0x29, 0x00, 0x31, 0x00, 0x00, 0x21, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x07, 0x23, 0x36, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x17, 0x36, 0x36, 0x37, 0x37, 0x33, 0x07, 0x06, 0x07, 0x17, 0x24, 0x37, 0x27, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x5e, 0x4c, 0x61, 0x8c, 0x4d, 0x75, 0x40, 0x4e, 0x4c, 0x1b, 0x18, 0x32, 0x5d, 0x3e, 0x3f, 0x5a, 0x2c, 0x03, 0x88, 0x01, 0x22, 0x1d, 0x1c, 0x25, 0x1e, 0x22, 0xb0, 0x02, 0x02, 0x01, 0x39, 0x92, 0x46, 0x14, 0x17, 0xa9, 0xfe, 0x71, 0x3f, 0xac, 0x61, 0x44, 0x38, 0x4b, 0x57, 0x35, 0x61, 0x40, 0x45, 0x6e, 0x22, 0x21, 0x3d, 0x23, 0x30, 0x4d, 0x2c, 0x30, 0x50, 0x31, 0x21, 0x23, 0x21, 0x1a, 0x19, 0x31, 0x24, 0xae, 0x02, 0x04, 0x02, 0x5f, 0x7b, 0x27, 0x23, 0xa7, 0x68, 0x3a, 0xaa, 0x2b, 0x4f, 0x2d, 0x3d, 0x00, 0x01, 0x00, 0x25, 0x02, 0x4a, 0x00, 0x9d, 0x03, 0x1e, 0x00, 0x03, 0x00, 0x00, 0x13, 0x07, 0x23, 0x27, 0x9d, 0x0c, 0x5f, 0x0d, 0x03, 0x1e, 0xd4, 0xd4, 0x00, 0x01, 0x00, 0x6b, 0xff, 0x3b, 0x01, 0xd3, 0x03, 0x9c, 0x00, 0x0f, 0x00, 0x00, 0x16, 0x02, 0x35, 0x34, 0x12, 0x37, 0x33, 0x15, 0x06, 0x02, 0x15, 0x14, 0x12, 0x17, 0x15, 0x23, 0xd6, 0x6b, 0x70, 0x6b, 0x8d, 0x6e, 0x73, 0x6d, 0x65, 0x8d, 0x67, 0x01, 0x24, 0xa7, 0xab, 0x01, 0x2d, 0x60, 0x0d, 0x69, 0xfe, 0xda, 0x9c, 0x98, 0xfe, 0xe5, 0x68, 0x0e, 0x00, 0x01, 0x00, 0x12, 0xff, 0x3b, 0x01, 0x7a, 0x03, 0x9c, 0x00, 0x0f, 0x00, 0x00, 0x17, 0x35, 0x36, 0x12, 0x35, 0x34, 0x02, 0x27, 0x35, 0x33, 0x16, 0x12, 0x15, 0x14, 0x02, 0x07, 0x21, 0x65, 0x6d, 0x73, 0x6e, 0x8d, 0x6b, 0x70, 0x6b, 0x61, 0xc5, 0x0e, 0x68, 0x01, 0x1b, 0x98, 0x9c, 0x01, 0x26, 0x69, 0x0d, 0x60, 0xfe, 0xd3, 0xab, 0xa7, 0xfe, 0xdc, 0x5e, 0x00, 0x00, 0x01, 0x00, 0x44, 0x01, 0x68, 0x01, 0xc1, 0x02, 0xe2, 0x00, 0x11, 0x00, 0x00, 0x01, 0x17, 0x07, 0x17, 0x07, 0x27, 0x17, 0x23, 0x37, 0x07, 0x27, 0x37, 0x27, 0x37, 0x17, 0x27, 0x33, 0x07, 0x01, 0x8f, 0x32, 0x82, 0x82, 0x34, 0x6c, 0x17, 0x68, 0x16, 0x6b, 0x37, 0x82, 0x81, 0x33, 0x6f, 0x17, 0x69, 0x18, 0x02, 0xae, 0x5a, 0x2f, 0x2f, 0x5d, 0x59, 0x8a, 0x8a, 0x5b, 0x60, 0x2f, 0x2d, 0x5c, 0x58, 0x8b, 0x8b, 0x00, 0x01, 0x00, 0x52, 0x00, 0x65, 0x02, 0x50, 0x02, 0x63, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x23, 0x15, 0x23, 0x35, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x02, 0x50, 0xbd, 0x84, 0xbd, 0xbd, 0x84, 0xbd, 0x01, 0x27, 0xc2, 0xc2, 0x7a, 0xc2, 0xc2, 0x00, 0x00, 0x01, 0x00, 0x0f, 0xff, 0x7a, 0x00, 0xde, 0x00, 0x93, 0x00, 0x03, 0x00, 0x00, 0x37, 0x03, 0x23, 0x13, 0xde, 0x75, 0x5a, 0x41, 0x93, 0xfe, 0xe7, 0x01, 0x19, 0x00, 0xff, 0xff, 0x00, 0x47, 0x01, 0x2a, 0x01, 0xef, 0x01, 0xa0, 0x00, 0x02, 0x03, 0xf8, 0x00, 0x00, 0x00, 0x01, 0x00, 0x2c, 0xff, 0xf9, 0x00, 0xd8, 0x00, 0x9d, 0x00, 0x0b, 0x00, 0x00, 0x16, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x5d, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0x07, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x00, 0x00, 0x01, 0x00, 0x25, 0xff, 0x4b, 0x01, 0xbc, 0x03, 0xb3, 0x00, 0x03, 0x00, 0x00, 0x01, 0x01, 0x23, 0x01, 0x01, 0xbc, 0xfe, 0xf2, 0x89, 0x01, 0x0e, 0x03, 0xb3, 0xfb, 0x98, 0x04, 0x68, 0x00, 0x00, 0x02, 0x00, 0x35, 0x00, 0x02, 0x02, 0x51, 0x02, 0xe7, 0x00, 0x0b, 0x00, 0x1b, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x24, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x35, 0x7d, 0x91, 0x91, 0x7d, 0x7d, 0x91, 0x91, 0x7d, 0x01, 0x92, 0x13, 0x39, 0x38, 0x38, 0x39, 0x13, 0x12, 0x3a, 0x38, 0x38, 0x3a, 0x12, 0x02, 0x23, 0xc4, 0xc4, 0xad, 0xae, 0xc6, 0xc6, 0xae, 0x4a, 0x65, 0x40, 0x40, 0x65, 0x4a, 0x4c, 0x67, 0x3f, 0x3f, 0x67, 0x4c, 0x00, 0x01, 0x00, 0x24, 0x00, 0x00, 0x01, 0x15, 0x02, 0xd9, 0x00, 0x05, 0x00, 0x00, 0x13, 0x35, 0x33, 0x11, 0x23, 0x11, 0x24, 0xf1, 0x90, 0x02, 0x58, 0x81, 0xfd, 0x27, 0x02, 0x58, 0x00, 0x01, 0x00, 0x2c, 0x00, 0x0a, 0x02, 0x1b, 0x02, 0xe9, 0x00, 0x19, 0x00, 0x00, 0x37, 0x3e, 0x02, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x07, 0x21, 0x15, 0x21, 0x35, 0x61, 0x60, 0x72, 0x4c, 0x30, 0x32, 0x32, 0x36, 0x01, 0x88, 0x04, 0x87, 0x68, 0x72, 0x7a, 0x54, 0x6c, 0x57, 0x01, 0x27, 0xfe, 0x12, 0x9e, 0x50, 0x6b, 0x74, 0x38, 0x33, 0x3a, 0x43, 0x3a, 0x78, 0x7c, 0x79, 0x63, 0x4e, 0x8e, 0x69, 0x4a, 0x74, 0x68, 0x00, 0x01, 0x00, 0x2d, 0xff, 0xfb, 0x02, 0x1d, 0x02, 0xea, 0x00, 0x2a, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x3c, 0x83, 0x6b, 0x49, 0x68, 0x35, 0x41, 0x2d, 0x3a, 0x41, 0x37, 0x6b, 0x4b, 0x71, 0x8e, 0x04, 0x88, 0x02, 0x3f, 0x37, 0x33, 0x37, 0x4c, 0x50, 0x1d, 0x1d, 0x8e, 0x33, 0x30, 0x2f, 0x33, 0x04, 0x89, 0x02, 0x7d, 0x6d, 0x33, 0x57, 0x37, 0x3f, 0x57, 0x0f, 0x04, 0x12, 0x5c, 0x48, 0x3c, 0x5e, 0x35, 0x72, 0x6f, 0x31, 0x3b, 0x39, 0x2d, 0x3c, 0x34, 0x73, 0x5f, 0x2b, 0x30, 0x33, 0x27, 0x00, 0x02, 0x00, 0x2f, 0x00, 0x00, 0x02, 0x71, 0x02, 0xd0, 0x00, 0x0a, 0x00, 0x0d, 0x00, 0x00, 0x37, 0x35, 0x01, 0x33, 0x11, 0x33, 0x15, 0x23, 0x15, 0x23, 0x35, 0x13, 0x03, 0x33, 0x2f, 0x01, 0x47, 0xa3, 0x58, 0x58, 0x8c, 0x09, 0xcd, 0xcd, 0x8e, 0x6e, 0x01, 0xd4, 0xfe, 0x38, 0x7a, 0x8e, 0x8e, 0x01, 0xac, 0xfe, 0xce, 0x00, 0x00, 0x01, 0x00, 0x4f, 0x00, 0x00, 0x02, 0x4e, 0x02, 0xdb, 0x00, 0x1f, 0x00, 0x00, 0x01, 0x21, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x11, 0x21, 0x02, 0x1f, 0xfe, 0xbc, 0x15, 0x4e, 0x2c, 0x50, 0x66, 0x2e, 0x83, 0x79, 0x72, 0x88, 0x09, 0x88, 0x09, 0x3f, 0x31, 0x3b, 0x3c, 0x3d, 0x3b, 0x2a, 0x38, 0x0c, 0x86, 0x01, 0xc4, 0x02, 0x60, 0xab, 0x1a, 0x21, 0x46, 0x6d, 0x3e, 0x73, 0x8c, 0x72, 0x5c, 0x28, 0x30, 0x4a, 0x3d, 0x3e, 0x41, 0x2a, 0x23, 0x01, 0xac, 0x00, 0x00, 0x02, 0x00, 0x45, 0xff, 0xfe, 0x02, 0x46, 0x02, 0xea, 0x00, 0x1b, 0x00, 0x27, 0x00, 0x00, 0x00, 0x26, 0x23, 0x22, 0x06, 0x07, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x01, 0xa5, 0x31, 0x2e, 0x45, 0x41, 0x01, 0x18, 0x5c, 0x36, 0x41, 0x64, 0x38, 0x39, 0x6e, 0x4c, 0x68, 0x77, 0x2f, 0x7e, 0x88, 0x69, 0x74, 0x09, 0x82, 0x9b, 0x48, 0x43, 0x3d, 0x36, 0x3f, 0x3d, 0x3b, 0x02, 0x4d, 0x2a, 0x6f, 0x7d, 0x28, 0x2d, 0x38, 0x6b, 0x4b, 0x47, 0x6f, 0x3e, 0x5c, 0xa5, 0x79, 0xb7, 0xbb, 0x72, 0x55, 0xb6, 0x3e, 0x3b, 0x3b, 0x44, 0x42, 0x38, 0x3a, 0x44, 0x00, 0x01, 0x00, 0x23, 0x00, 0x00, 0x02, 0x05, 0x02, 0xd7, 0x00, 0x06, 0x00, 0x00, 0x01, 0x01, 0x23, 0x01, 0x21, 0x35, 0x21, 0x02, 0x05, 0xfe, 0xf6, 0x8e, 0x01, 0x0c, 0xfe, 0xaa, 0x01, 0xe2, 0x02, 0x6f, 0xfd, 0x91, 0x02, 0x5f, 0x78, 0x00, 0x00, 0x03, 0x00, 0x3a, 0xff, 0xf0, 0x02, 0x49, 0x02, 0xe7, 0x00, 0x1a, 0x00, 0x26, 0x00, 0x32, 0x00, 0x00, 0x12, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x4b, 0x37, 0x6f, 0x50, 0x50, 0x6f, 0x37, 0x36, 0x2d, 0x37, 0x3e, 0x45, 0x78, 0x4b, 0x4b, 0x77, 0x45, 0x3e, 0x37, 0x01, 0x00, 0x3b, 0x33, 0x32, 0x3b, 0x3d, 0x30, 0x30, 0x3e, 0xa7, 0x47, 0x45, 0x3b, 0x3b, 0x44, 0x46, 0x39, 0x01, 0xb6, 0x6d, 0x36, 0x59, 0x35, 0x35, 0x59, 0x36, 0x37, 0x53, 0x17, 0x18, 0x5c, 0x3f, 0x44, 0x65, 0x36, 0x36, 0x65, 0x44, 0x3f, 0x5d, 0x17, 0xbe, 0x36, 0x36, 0x32, 0x2d, 0x36, 0x37, 0x2d, 0xca, 0x3a, 0x36, 0x32, 0x3f, 0x40, 0x31, 0x35, 0x3b, 0x00, 0x00, 0x02, 0x00, 0x41, 0xff, 0xff, 0x02, 0x3a, 0x02, 0xea, 0x00, 0x1b, 0x00, 0x27, 0x00, 0x00, 0x36, 0x16, 0x33, 0x32, 0x36, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x27, 0x33, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0xdf, 0x39, 0x30, 0x3e, 0x38, 0x17, 0x53, 0x30, 0x40, 0x67, 0x3c, 0x84, 0x72, 0x8e, 0x75, 0x2d, 0x6d, 0x5e, 0x4a, 0x68, 0x37, 0x04, 0x82, 0x9e, 0x3c, 0x3f, 0x36, 0x36, 0x3f, 0x3d, 0x3d, 0xa1, 0x2f, 0x67, 0x7a, 0x20, 0x24, 0x35, 0x69, 0x4b, 0x6f, 0x83, 0xb6, 0xb7, 0x82, 0xa6, 0x56, 0x39, 0x5d, 0x38, 0xb4, 0x40, 0x36, 0x3b, 0x41, 0x43, 0x37, 0x35, 0x43, 0x00, 0xff, 0xff, 0x00, 0x2c, 0xff, 0xf9, 0x00, 0xd8, 0x02, 0x3b, 0x00, 0x22, 0x02, 0xa1, 0x00, 0x00, 0x00, 0x07, 0x02, 0xa1, 0x00, 0x00, 0x01, 0x9e, 0xff, 0xff, 0x00, 0x29, 0xff, 0x7a, 0x00, 0xf8, 0x02, 0x37, 0x00, 0x27, 0x02, 0xa1, 0x00, 0x19, 0x01, 0x9a, 0x00, 0x02, 0x02, 0x9f, 0x1a, 0x00, 0x00, 0x01, 0x00, 0x4f, 0x00, 0x84, 0x01, 0xd9, 0x02, 0x44, 0x00, 0x05, 0x00, 0x00, 0x25, 0x27, 0x37, 0x33, 0x07, 0x17, 0x01, 0x29, 0xda, 0xda, 0xb0, 0xda, 0xda, 0x84, 0xe0, 0xe0, 0xe0, 0xe0, 0x00, 0x02, 0x00, 0x60, 0x00, 0xaf, 0x02, 0x81, 0x02, 0x19, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x05, 0x15, 0x21, 0x35, 0x02, 0x81, 0xfd, 0xdf, 0x02, 0x21, 0xfd, 0xdf, 0x02, 0x19, 0x7a, 0x7a, 0xf0, 0x7a, 0x7a, 0x00, 0x00, 0x01, 0x00, 0x59, 0x00, 0x84, 0x01, 0xe4, 0x02, 0x44, 0x00, 0x05, 0x00, 0x00, 0x13, 0x33, 0x17, 0x07, 0x23, 0x37, 0x59, 0xb1, 0xda, 0xda, 0xb1, 0xdb, 0x02, 0x44, 0xe0, 0xe0, 0xe0, 0x00, 0x00, 0x02, 0x00, 0x22, 0xff, 0xf9, 0x01, 0xef, 0x02, 0xd2, 0x00, 0x17, 0x00, 0x23, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x07, 0x23, 0x27, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x26, 0x36, 0x36, 0x33, 0x02, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x70, 0x7f, 0x7e, 0x68, 0x04, 0x7b, 0x05, 0x2d, 0x57, 0x5e, 0x33, 0x2c, 0x2e, 0x33, 0x84, 0x01, 0x36, 0x69, 0x47, 0x67, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0x02, 0xd2, 0x71, 0x63, 0x62, 0x67, 0x4d, 0xaa, 0x2e, 0x3d, 0x2c, 0x34, 0x32, 0x2c, 0x3d, 0x60, 0x36, 0xfd, 0x27, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x00, 0x00, 0x02, 0x00, 0x47, 0xff, 0x2b, 0x03, 0xd3, 0x02, 0x90, 0x00, 0x39, 0x00, 0x47, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x37, 0x33, 0x03, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x17, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x02, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0xce, 0xaa, 0x5b, 0x39, 0x6c, 0x4a, 0x34, 0x40, 0x09, 0x1d, 0x5c, 0x33, 0x4c, 0x56, 0x3e, 0x6e, 0x45, 0x56, 0x20, 0x09, 0x75, 0x2f, 0x03, 0x14, 0x18, 0x24, 0x31, 0x19, 0x94, 0x87, 0x73, 0xba, 0x69, 0x93, 0x87, 0x61, 0x4a, 0x14, 0x5f, 0x74, 0x70, 0xa8, 0x5c, 0x89, 0xf3, 0x97, 0x4f, 0x3c, 0x23, 0x2e, 0x29, 0x25, 0x38, 0x1f, 0x28, 0x28, 0x02, 0x90, 0x56, 0x9c, 0x66, 0x52, 0x92, 0x5a, 0x2b, 0x28, 0x27, 0x2d, 0x5b, 0x4f, 0x4b, 0x82, 0x4f, 0x3c, 0x34, 0xfe, 0xf2, 0x13, 0x10, 0x18, 0x18, 0x44, 0x66, 0x33, 0x79, 0x85, 0x6f, 0xbf, 0x75, 0x7c, 0x86, 0x23, 0x5c, 0x28, 0x55, 0x9c, 0x67, 0x93, 0xf0, 0x8a, 0xfd, 0xd1, 0x2a, 0x46, 0x28, 0x2a, 0x34, 0x2d, 0x48, 0x28, 0x29, 0x30, 0x00, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x02, 0xbb, 0x00, 0x07, 0x00, 0x0a, 0x00, 0x00, 0x25, 0x21, 0x07, 0x23, 0x13, 0x33, 0x13, 0x23, 0x27, 0x03, 0x03, 0x01, 0xf1, 0xfe, 0xea, 0x2e, 0x93, 0xfb, 0xa3, 0xfb, 0x94, 0x54, 0x65, 0x65, 0x85, 0x85, 0x02, 0xbb, 0xfd, 0x45, 0xf5, 0x01, 0x24, 0xfe, 0xdc, 0x00, 0x00, 0x03, 0x00, 0x45, 0x00, 0x00, 0x02, 0x58, 0x02, 0xba, 0x00, 0x10, 0x00, 0x19, 0x00, 0x22, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x21, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x25, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x15, 0x33, 0x02, 0x0c, 0x4c, 0x37, 0x68, 0x47, 0xfe, 0xd3, 0x01, 0x20, 0x47, 0x67, 0x35, 0x41, 0x36, 0xff, 0x00, 0x80, 0x32, 0x36, 0x36, 0x32, 0x80, 0xc0, 0x39, 0x3c, 0x33, 0x8a, 0x8d, 0x01, 0x5b, 0x60, 0x3e, 0x38, 0x55, 0x30, 0x02, 0xba, 0x2e, 0x52, 0x34, 0x3d, 0x52, 0x11, 0x34, 0x2d, 0x2a, 0x2a, 0x2e, 0xfe, 0x29, 0x30, 0x2c, 0x2d, 0x33, 0xbc, 0x00, 0x00, 0x01, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xcd, 0x02, 0xc3, 0x00, 0x1d, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x23, 0x5d, 0xa1, 0x64, 0x75, 0xb0, 0x23, 0xa1, 0x18, 0x57, 0x39, 0x3d, 0x5f, 0x35, 0x35, 0x5f, 0x3d, 0x39, 0x57, 0x18, 0xa1, 0x23, 0xaf, 0x76, 0x64, 0xa1, 0x5d, 0x01, 0xc5, 0xa3, 0x5b, 0x78, 0x6a, 0x32, 0x32, 0x39, 0x68, 0x46, 0x45, 0x69, 0x39, 0x33, 0x32, 0x6b, 0x77, 0x5b, 0xa2, 0x67, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x02, 0xa9, 0x02, 0xba, 0x00, 0x0a, 0x00, 0x13, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x23, 0x11, 0x33, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x11, 0x33, 0x01, 0xa7, 0xa7, 0x5b, 0x5b, 0xa7, 0x6e, 0xf4, 0xf4, 0x69, 0x78, 0x78, 0x6e, 0x63, 0x63, 0x02, 0xba, 0x56, 0x9f, 0x69, 0x69, 0x9d, 0x56, 0x02, 0xba, 0xfd, 0xbd, 0x78, 0x6d, 0x6d, 0x7b, 0xfe, 0x33, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x02, 0xbb, 0x00, 0x0b, 0x00, 0x00, 0x13, 0x15, 0x33, 0x15, 0x23, 0x15, 0x21, 0x15, 0x21, 0x11, 0x21, 0x15, 0xd1, 0xeb, 0xeb, 0x01, 0x09, 0xfe, 0x6b, 0x01, 0x95, 0x02, 0x49, 0xaf, 0x6f, 0xb9, 0x72, 0x02, 0xbb, 0x72, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x01, 0xf4, 0x02, 0xba, 0x00, 0x09, 0x00, 0x00, 0x01, 0x15, 0x21, 0x15, 0x33, 0x15, 0x23, 0x11, 0x23, 0x11, 0x01, 0xf4, 0xfe, 0xdd, 0xdf, 0xdf, 0x8c, 0x02, 0xba, 0x71, 0xb3, 0x6f, 0xfe, 0xd9, 0x02, 0xba, 0x00, 0x01, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xdd, 0x02, 0xc3, 0x00, 0x21, 0x00, 0x00, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x0e, 0x02, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x02, 0x2b, 0x18, 0x54, 0x38, 0x3e, 0x60, 0x36, 0x37, 0x62, 0x41, 0x50, 0x66, 0x10, 0xf0, 0x01, 0x7a, 0x0e, 0x5c, 0x91, 0x5a, 0x65, 0xa3, 0x5d, 0x5d, 0xa3, 0x64, 0x76, 0xae, 0x21, 0x01, 0xe8, 0x2c, 0x2e, 0x38, 0x68, 0x44, 0x46, 0x68, 0x38, 0x55, 0x4c, 0x6b, 0x7a, 0x49, 0x7c, 0x4b, 0x5b, 0xa2, 0x67, 0x67, 0xa3, 0x5b, 0x73, 0x68, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x88, 0x02, 0xba, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x11, 0x23, 0x11, 0x21, 0x11, 0x23, 0x11, 0x33, 0x11, 0x21, 0x11, 0x02, 0x88, 0x8c, 0xfe, 0xd5, 0x8c, 0x8c, 0x01, 0x2b, 0x02, 0xba, 0xfd, 0x46, 0x01, 0x29, 0xfe, 0xd7, 0x02, 0xba, 0xfe, 0xe1, 0x01, 0x1f, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x00, 0xd1, 0x02, 0xba, 0x00, 0x03, 0x00, 0x00, 0x13, 0x11, 0x23, 0x11, 0xd1, 0x8c, 0x02, 0xba, 0xfd, 0x46, 0x02, 0xba, 0x00, 0x01, 0x00, 0x24, 0xff, 0xf9, 0x01, 0xdc, 0x02, 0xba, 0x00, 0x0f, 0x00, 0x00, 0x01, 0x11, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x01, 0xdc, 0x76, 0x63, 0x64, 0x7b, 0x8c, 0x01, 0x29, 0x27, 0x26, 0x28, 0x02, 0xba, 0xfe, 0x16, 0x66, 0x71, 0x74, 0x68, 0x2d, 0x32, 0x30, 0x2a, 0x01, 0xea, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x80, 0x02, 0xba, 0x00, 0x0a, 0x00, 0x00, 0x21, 0x03, 0x11, 0x23, 0x11, 0x33, 0x11, 0x13, 0x33, 0x01, 0x01, 0x01, 0xcf, 0xfe, 0x8c, 0x8c, 0xfe, 0xa9, 0xfe, 0xe0, 0x01, 0x28, 0x01, 0x37, 0xfe, 0xc9, 0x02, 0xba, 0xfe, 0xc7, 0x01, 0x39, 0xfe, 0xa6, 0xfe, 0xa0, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x01, 0xb7, 0x02, 0xba, 0x00, 0x05, 0x00, 0x00, 0x37, 0x33, 0x15, 0x21, 0x11, 0x33, 0xd1, 0xe6, 0xfe, 0x8e, 0x8c, 0x6f, 0x6f, 0x02, 0xba, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x03, 0x3e, 0x02, 0xba, 0x00, 0x0c, 0x00, 0x00, 0x01, 0x11, 0x23, 0x11, 0x03, 0x23, 0x03, 0x11, 0x23, 0x11, 0x33, 0x13, 0x13, 0x03, 0x3e, 0x8c, 0xbb, 0x6a, 0xbc, 0x8c, 0x9f, 0xde, 0xde, 0x02, 0xba, 0xfd, 0x46, 0x01, 0xc6, 0xfe, 0x3a, 0x01, 0xc6, 0xfe, 0x3a, 0x02, 0xba, 0xfd, 0xf9, 0x02, 0x07, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x9a, 0x02, 0xbb, 0x00, 0x09, 0x00, 0x00, 0x21, 0x23, 0x01, 0x11, 0x23, 0x11, 0x33, 0x01, 0x11, 0x33, 0x02, 0x9a, 0x8c, 0xfe, 0xc3, 0x8c, 0x8c, 0x01, 0x3d, 0x8c, 0x01, 0xdf, 0xfe, 0x21, 0x02, 0xbb, 0xfe, 0x20, 0x01, 0xe0, 0x00, 0x02, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x02, 0xc4, 0x00, 0x0f, 0x00, 0x1f, 0x00, 0x00, 0x04, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x3e, 0x02, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x01, 0x27, 0xa4, 0x60, 0x60, 0xa4, 0x62, 0x63, 0xa3, 0x5f, 0x5f, 0xa4, 0x62, 0x3f, 0x60, 0x36, 0x36, 0x60, 0x3f, 0x3f, 0x61, 0x36, 0x36, 0x61, 0x3f, 0x07, 0x5c, 0xa3, 0x67, 0x66, 0xa3, 0x5c, 0x5c, 0xa3, 0x66, 0x67, 0xa3, 0x5c, 0x7d, 0x39, 0x6a, 0x46, 0x46, 0x69, 0x38, 0x38, 0x69, 0x46, 0x46, 0x6a, 0x39, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x02, 0x42, 0x02, 0xba, 0x00, 0x0c, 0x00, 0x14, 0x00, 0x00, 0x00, 0x06, 0x06, 0x23, 0x23, 0x11, 0x23, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x06, 0x36, 0x35, 0x34, 0x23, 0x23, 0x15, 0x33, 0x02, 0x42, 0x35, 0x71, 0x56, 0x75, 0x8c, 0x01, 0x01, 0x51, 0x72, 0x39, 0xc8, 0x38, 0x72, 0x6f, 0x6f, 0x01, 0xaa, 0x62, 0x3c, 0xfe, 0xf4, 0x02, 0xba, 0x38, 0x62, 0x3e, 0x65, 0x35, 0x30, 0x66, 0xcb, 0x00, 0x02, 0x00, 0x23, 0xff, 0x85, 0x02, 0xfb, 0x02, 0xc4, 0x00, 0x13, 0x00, 0x23, 0x00, 0x00, 0x05, 0x27, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x17, 0x00, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x02, 0x4d, 0x6a, 0x2c, 0x2e, 0x62, 0xa4, 0x60, 0x60, 0xa4, 0x62, 0x63, 0xa3, 0x5f, 0x4f, 0x44, 0xa0, 0xfd, 0xb8, 0x36, 0x61, 0x3f, 0x3f, 0x60, 0x36, 0x36, 0x60, 0x3f, 0x3f, 0x61, 0x36, 0x7b, 0x7f, 0x0b, 0x5c, 0xa3, 0x67, 0x66, 0xa3, 0x5c, 0x5c, 0xa3, 0x66, 0x5d, 0x99, 0x30, 0xb4, 0x01, 0x94, 0x6a, 0x39, 0x39, 0x6a, 0x46, 0x46, 0x69, 0x38, 0x38, 0x69, 0x46, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x02, 0x4f, 0x02, 0xba, 0x00, 0x0e, 0x00, 0x17, 0x00, 0x00, 0x21, 0x03, 0x23, 0x11, 0x23, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x13, 0x01, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x01, 0xad, 0x9a, 0x42, 0x8c, 0x01, 0x06, 0x51, 0x72, 0x39, 0x50, 0x4f, 0xa7, 0xfe, 0x82, 0x75, 0x39, 0x38, 0x38, 0x39, 0x75, 0x01, 0x10, 0xfe, 0xf0, 0x02, 0xba, 0x39, 0x61, 0x3c, 0x45, 0x6f, 0x15, 0xfe, 0xe5, 0x01, 0x79, 0x37, 0x31, 0x30, 0x35, 0x00, 0x00, 0x01, 0x00, 0x33, 0xff, 0xf9, 0x02, 0x2d, 0x02, 0xc4, 0x00, 0x2c, 0x00, 0x00, 0x16, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x1e, 0x02, 0x15, 0x14, 0x06, 0x06, 0x23, 0xed, 0x75, 0x44, 0x01, 0x96, 0x03, 0x37, 0x30, 0x31, 0x38, 0x26, 0x39, 0x32, 0x44, 0x55, 0x3d, 0x3e, 0x70, 0x48, 0x6c, 0x87, 0x07, 0x9a, 0x02, 0x39, 0x2f, 0x29, 0x31, 0x25, 0x37, 0x32, 0x44, 0x56, 0x3e, 0x3a, 0x70, 0x4d, 0x07, 0x32, 0x5e, 0x40, 0x2b, 0x32, 0x2f, 0x26, 0x1f, 0x28, 0x17, 0x0e, 0x14, 0x27, 0x4f, 0x42, 0x3e, 0x5c, 0x31, 0x69, 0x5e, 0x24, 0x2f, 0x2a, 0x28, 0x1c, 0x25, 0x17, 0x0f, 0x14, 0x28, 0x50, 0x41, 0x38, 0x60, 0x39, 0x00, 0x01, 0x00, 0x20, 0x00, 0x00, 0x02, 0x20, 0x02, 0xba, 0x00, 0x07, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x02, 0x20, 0xba, 0x8c, 0xba, 0x02, 0xba, 0x71, 0xfd, 0xb7, 0x02, 0x49, 0x71, 0x00, 0x00, 0x01, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x02, 0xba, 0x00, 0x13, 0x00, 0x00, 0x13, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x11, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x11, 0xcf, 0x4a, 0x43, 0x44, 0x4a, 0x8d, 0x4d, 0x81, 0x4f, 0x4e, 0x7f, 0x4a, 0x02, 0xba, 0xfe, 0x50, 0x47, 0x4b, 0x4b, 0x47, 0x01, 0xb0, 0xfe, 0x51, 0x59, 0x7b, 0x3e, 0x3e, 0x7b, 0x59, 0x01, 0xaf, 0x00, 0x01, 0x00, 0x0e, 0x00, 0x00, 0x02, 0xb8, 0x02, 0xba, 0x00, 0x06, 0x00, 0x00, 0x01, 0x01, 0x23, 0x01, 0x33, 0x13, 0x13, 0x02, 0xb8, 0xff, 0x00, 0xaa, 0xff, 0x00, 0x96, 0xc0, 0xbf, 0x02, 0xba, 0xfd, 0x46, 0x02, 0xba, 0xfd, 0xd5, 0x02, 0x2b, 0x00, 0x00, 0x01, 0x00, 0x16, 0xff, 0xff, 0x03, 0xea, 0x02, 0xba, 0x00, 0x0c, 0x00, 0x00, 0x01, 0x03, 0x23, 0x03, 0x03, 0x07, 0x03, 0x33, 0x13, 0x13, 0x33, 0x13, 0x13, 0x03, 0xea, 0xc3, 0xa5, 0x83, 0x89, 0xa4, 0xbc, 0x96, 0x7b, 0x8e, 0x9c, 0x86, 0x7c, 0x02, 0xba, 0xfd, 0x46, 0x01, 0xf1, 0xfe, 0x0f, 0x01, 0x02, 0xbb, 0xfd, 0xe2, 0x02, 0x1e, 0xfd, 0xe5, 0x02, 0x1b, 0x00, 0x01, 0x00, 0x26, 0x00, 0x00, 0x02, 0x88, 0x02, 0xba, 0x00, 0x0b, 0x00, 0x00, 0x21, 0x27, 0x07, 0x23, 0x13, 0x03, 0x33, 0x17, 0x37, 0x33, 0x03, 0x13, 0x01, 0xe7, 0x97, 0x89, 0x9e, 0xdc, 0xdf, 0xa1, 0x97, 0x88, 0x9e, 0xdb, 0xdf, 0xeb, 0xeb, 0x01, 0x60, 0x01, 0x5a, 0xea, 0xea, 0xfe, 0xa1, 0xfe, 0xa5, 0x00, 0x00, 0x01, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x02, 0xba, 0x00, 0x08, 0x00, 0x00, 0x01, 0x03, 0x15, 0x23, 0x35, 0x03, 0x33, 0x13, 0x13, 0x02, 0x70, 0xec, 0x8c, 0xed, 0x9e, 0x96, 0x95, 0x02, 0xba, 0xfe, 0x39, 0xf3, 0xf3, 0x01, 0xc7, 0xfe, 0xc1, 0x01, 0x3f, 0x00, 0x00, 0x01, 0x00, 0x32, 0x00, 0x00, 0x02, 0x0e, 0x02, 0xba, 0x00, 0x09, 0x00, 0x00, 0x37, 0x21, 0x15, 0x21, 0x35, 0x01, 0x21, 0x35, 0x21, 0x15, 0xd4, 0x01, 0x3a, 0xfe, 0x24, 0x01, 0x38, 0xfe, 0xc8, 0x01, 0xdc, 0x76, 0x76, 0x6c, 0x01, 0xd8, 0x76, 0x6c, 0x00, 0x01, 0x00, 0x87, 0xff, 0x3b, 0x01, 0x82, 0x03, 0x9c, 0x00, 0x07, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x33, 0x15, 0x23, 0x11, 0x01, 0x82, 0x77, 0x77, 0xfb, 0x03, 0x9c, 0x72, 0xfc, 0x85, 0x74, 0x04, 0x61, 0x00, 0x00, 0x01, 0x00, 0xad, 0xff, 0x4b, 0x02, 0x53, 0x03, 0xb3, 0x00, 0x03, 0x00, 0x00, 0x05, 0x01, 0x33, 0x01, 0x01, 0xca, 0xfe, 0xe3, 0x88, 0x01, 0x1e, 0xb5, 0x04, 0x68, 0xfb, 0x98, 0x00, 0x01, 0x00, 0x6e, 0xff, 0x3b, 0x01, 0x69, 0x03, 0x9c, 0x00, 0x07, 0x00, 0x00, 0x05, 0x23, 0x35, 0x33, 0x11, 0x23, 0x35, 0x33, 0x01, 0x69, 0xfb, 0x77, 0x77, 0xfb, 0xc5, 0x74, 0x03, 0x7b, 0x72, 0x00, 0x00, 0x01, 0x00, 0x21, 0x00, 0xa7, 0x02, 0x87, 0x02, 0xbc, 0x00, 0x06, 0x00, 0x00, 0x37, 0x23, 0x13, 0x33, 0x13, 0x23, 0x03, 0xb0, 0x8f, 0xf0, 0x86, 0xf0, 0x90, 0xa2, 0xa7, 0x02, 0x15, 0xfd, 0xeb, 0x01, 0x6f, 0x00, 0x00, 0x01, 0x00, 0x6b, 0xff, 0x53, 0x02, 0xb6, 0xff, 0xd8, 0x00, 0x03, 0x00, 0x00, 0x05, 0x15, 0x21, 0x35, 0x02, 0xb6, 0xfd, 0xb5, 0x28, 0x85, 0x85, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x51, 0x00, 0xf0, 0x03, 0x2c, 0x00, 0x03, 0x00, 0x00, 0x13, 0x15, 0x27, 0x35, 0xf0, 0xe6, 0x02, 0xb5, 0x64, 0x69, 0x72, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x02, 0x33, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x21, 0x43, 0x73, 0x47, 0x3e, 0x5d, 0x1c, 0x8d, 0x8d, 0x1b, 0x5f, 0x3e, 0x46, 0x73, 0x43, 0x01, 0xb4, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x27, 0x44, 0x28, 0x01, 0x6b, 0x82, 0x46, 0x32, 0x26, 0x4f, 0xfd, 0xd6, 0x51, 0x27, 0x33, 0x48, 0x83, 0x55, 0x31, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x27, 0x49, 0x33, 0x00, 0x00, 0x02, 0x00, 0x45, 0xff, 0xf7, 0x02, 0x85, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x11, 0x33, 0x11, 0x04, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0xec, 0x5f, 0x3d, 0x47, 0x73, 0x43, 0x43, 0x73, 0x47, 0x3e, 0x5d, 0x1c, 0x8c, 0x8c, 0x01, 0x25, 0x29, 0x43, 0x27, 0x26, 0x43, 0x29, 0x29, 0x43, 0x26, 0x27, 0x43, 0x29, 0x02, 0x01, 0x32, 0x46, 0x81, 0x55, 0x55, 0x83, 0x48, 0x31, 0x27, 0x4f, 0x02, 0xe4, 0xfe, 0xf5, 0x90, 0x49, 0x26, 0x27, 0x4a, 0x32, 0x32, 0x4a, 0x27, 0x28, 0x4a, 0x33, 0x00, 0x00, 0x01, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x38, 0x02, 0x33, 0x00, 0x1a, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x21, 0x46, 0x7c, 0x50, 0x67, 0x87, 0x17, 0x97, 0x0c, 0x39, 0x2a, 0x3c, 0x46, 0x46, 0x3c, 0x55, 0x1a, 0x97, 0x17, 0x88, 0x66, 0x50, 0x7c, 0x46, 0x01, 0x6b, 0x81, 0x47, 0x67, 0x5d, 0x24, 0x29, 0x57, 0x50, 0x4f, 0x57, 0x4c, 0x5a, 0x6a, 0x47, 0x81, 0x56, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x11, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x21, 0x43, 0x74, 0x47, 0x36, 0x62, 0x1d, 0x8e, 0x8e, 0x1a, 0x5e, 0x3e, 0x46, 0x74, 0x43, 0x01, 0xb4, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x27, 0x44, 0x28, 0x01, 0x6b, 0x82, 0x46, 0x2f, 0x27, 0x01, 0x07, 0xfd, 0x1c, 0x52, 0x29, 0x32, 0x48, 0x83, 0x55, 0x31, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x27, 0x49, 0x33, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0x33, 0x00, 0x17, 0x00, 0x1e, 0x00, 0x00, 0x00, 0x07, 0x21, 0x16, 0x16, 0x33, 0x32, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x02, 0x48, 0x04, 0xfe, 0x6b, 0x05, 0x4a, 0x36, 0x4e, 0x21, 0x97, 0x18, 0x88, 0x63, 0x50, 0x7f, 0x47, 0x46, 0x7e, 0x52, 0x4f, 0x7d, 0x45, 0x91, 0x01, 0x4c, 0x37, 0x34, 0x47, 0x08, 0x01, 0x03, 0x18, 0x3c, 0x44, 0x43, 0x50, 0x67, 0x47, 0x82, 0x55, 0x56, 0x82, 0x46, 0x44, 0x7d, 0x51, 0x28, 0x36, 0x41, 0x3f, 0x38, 0x00, 0x00, 0x01, 0x00, 0x15, 0x00, 0x00, 0x01, 0x43, 0x03, 0x0c, 0x00, 0x11, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x36, 0x17, 0x15, 0x26, 0x06, 0x15, 0x15, 0x33, 0x01, 0x43, 0x61, 0x8e, 0x3f, 0x3f, 0x74, 0x75, 0x33, 0x28, 0x61, 0x01, 0xb7, 0xfe, 0x49, 0x01, 0xb7, 0x73, 0x1c, 0x66, 0x60, 0x03, 0x76, 0x01, 0x24, 0x2f, 0x17, 0x00, 0x00, 0x02, 0x00, 0x21, 0xfe, 0xef, 0x02, 0x62, 0x02, 0x33, 0x00, 0x1f, 0x00, 0x2f, 0x00, 0x00, 0x00, 0x16, 0x17, 0x35, 0x33, 0x11, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x16, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x01, 0x5c, 0x5e, 0x1b, 0x8d, 0x3e, 0x7c, 0x58, 0x76, 0x97, 0x0a, 0x8b, 0x0b, 0x49, 0x34, 0x3d, 0x4c, 0x1b, 0x5f, 0x3d, 0x46, 0x74, 0x43, 0x43, 0x73, 0x47, 0xb7, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x27, 0x44, 0x28, 0x02, 0x33, 0x31, 0x27, 0x4f, 0xfd, 0xd2, 0x4d, 0x79, 0x47, 0x6e, 0x5f, 0x26, 0x2d, 0x49, 0x4a, 0x56, 0x27, 0x34, 0x48, 0x83, 0x55, 0x54, 0x82, 0x46, 0xeb, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x27, 0x49, 0x33, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x55, 0x02, 0xe4, 0x00, 0x14, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x11, 0x23, 0x11, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0x36, 0x36, 0x33, 0x01, 0xbc, 0x62, 0x37, 0x8c, 0x42, 0x39, 0x3a, 0x43, 0x8c, 0x8c, 0x1b, 0x5a, 0x37, 0x02, 0x32, 0x37, 0x6b, 0x4b, 0xfe, 0xbb, 0x01, 0x32, 0x42, 0x47, 0x47, 0x42, 0xfe, 0xce, 0x02, 0xe4, 0xff, 0x24, 0x29, 0x00, 0x00, 0x02, 0x00, 0x36, 0x00, 0x00, 0x00, 0xe2, 0x03, 0x10, 0x00, 0x0b, 0x00, 0x0f, 0x00, 0x00, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x17, 0x11, 0x23, 0x11, 0x67, 0x31, 0x31, 0x25, 0x25, 0x31, 0x31, 0x25, 0x45, 0x8c, 0x02, 0x6c, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x42, 0xfd, 0xd6, 0x02, 0x2a, 0x00, 0x00, 0x02, 0xff, 0xe3, 0xfe, 0xf8, 0x00, 0xe1, 0x03, 0x10, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x13, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x66, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0x45, 0x5b, 0x55, 0x3e, 0x28, 0x20, 0x1a, 0x8c, 0x02, 0x6c, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0xfd, 0x39, 0x5c, 0x51, 0x77, 0x19, 0x1c, 0x02, 0x86, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x43, 0x02, 0xe4, 0x00, 0x0a, 0x00, 0x00, 0x21, 0x27, 0x15, 0x23, 0x11, 0x33, 0x11, 0x37, 0x33, 0x03, 0x13, 0x01, 0x8d, 0xbc, 0x8c, 0x8c, 0xba, 0xb6, 0xf4, 0xf6, 0xec, 0xec, 0x02, 0xe4, 0xfe, 0x5b, 0xeb, 0xfe, 0xea, 0xfe, 0xec, 0x00, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x00, 0xd1, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x00, 0x13, 0x11, 0x23, 0x11, 0xd1, 0x8c, 0x02, 0xe4, 0xfd, 0x1c, 0x02, 0xe4, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x03, 0xd8, 0x02, 0x32, 0x00, 0x22, 0x00, 0x00, 0x00, 0x16, 0x15, 0x11, 0x23, 0x11, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x03, 0x5b, 0x7d, 0x8c, 0x42, 0x39, 0x39, 0x43, 0x8c, 0x42, 0x39, 0x3a, 0x43, 0x8c, 0x8c, 0x1b, 0x55, 0x33, 0x41, 0x66, 0x1c, 0x1b, 0x67, 0x3c, 0x02, 0x32, 0x7d, 0x70, 0xfe, 0xbb, 0x01, 0x32, 0x41, 0x45, 0x45, 0x41, 0xfe, 0xce, 0x01, 0x32, 0x41, 0x45, 0x45, 0x41, 0xfe, 0xce, 0x02, 0x2a, 0x43, 0x23, 0x28, 0x37, 0x33, 0x30, 0x3a, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x02, 0x55, 0x02, 0x32, 0x00, 0x13, 0x00, 0x00, 0x00, 0x16, 0x15, 0x11, 0x23, 0x11, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0x36, 0x36, 0x33, 0x01, 0xdb, 0x7a, 0x8c, 0x42, 0x39, 0x3a, 0x43, 0x8c, 0x8c, 0x1c, 0x57, 0x34, 0x02, 0x32, 0x7d, 0x70, 0xfe, 0xbb, 0x01, 0x32, 0x42, 0x47, 0x47, 0x42, 0xfe, 0xce, 0x02, 0x2a, 0x45, 0x24, 0x29, 0x00, 0x02, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x02, 0x33, 0x00, 0x0f, 0x00, 0x1c, 0x00, 0x00, 0x16, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x3e, 0x02, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0xeb, 0x80, 0x49, 0x4b, 0x82, 0x50, 0x50, 0x82, 0x4b, 0x4d, 0x83, 0x51, 0x26, 0x43, 0x28, 0x53, 0x3c, 0x3c, 0x51, 0x4f, 0x3c, 0x09, 0x47, 0x82, 0x55, 0x55, 0x82, 0x47, 0x47, 0x82, 0x55, 0x55, 0x82, 0x47, 0x7a, 0x25, 0x4a, 0x35, 0x4f, 0x55, 0x55, 0x4f, 0x4f, 0x55, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xf8, 0x02, 0x85, 0x02, 0x33, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x11, 0x23, 0x11, 0x33, 0x15, 0x04, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0xec, 0x5f, 0x3d, 0x47, 0x73, 0x43, 0x43, 0x73, 0x47, 0x3d, 0x5d, 0x1d, 0x8c, 0x8c, 0x01, 0x25, 0x29, 0x43, 0x27, 0x26, 0x43, 0x29, 0x29, 0x43, 0x26, 0x27, 0x43, 0x29, 0x02, 0x00, 0x33, 0x46, 0x81, 0x55, 0x55, 0x83, 0x48, 0x32, 0x26, 0xfe, 0xa9, 0x03, 0x32, 0x50, 0x91, 0x49, 0x26, 0x27, 0x4a, 0x32, 0x32, 0x4a, 0x27, 0x28, 0x4a, 0x33, 0x00, 0x00, 0x02, 0x00, 0x21, 0xfe, 0xf8, 0x02, 0x62, 0x02, 0x32, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x33, 0x11, 0x23, 0x11, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x21, 0x45, 0x76, 0x47, 0x3b, 0x5b, 0x1c, 0x8d, 0x8d, 0x1c, 0x5e, 0x3b, 0x46, 0x75, 0x44, 0x01, 0xb4, 0x2a, 0x43, 0x26, 0x25, 0x43, 0x2a, 0x2a, 0x43, 0x25, 0x26, 0x43, 0x2a, 0x01, 0x69, 0x81, 0x48, 0x2d, 0x23, 0x48, 0xfc, 0xce, 0x01, 0x54, 0x24, 0x30, 0x49, 0x82, 0x53, 0x32, 0x4a, 0x26, 0x26, 0x49, 0x33, 0x33, 0x4b, 0x26, 0x26, 0x4a, 0x33, 0x00, 0x01, 0x00, 0x45, 0x00, 0x00, 0x01, 0x7b, 0x02, 0x32, 0x00, 0x0c, 0x00, 0x00, 0x12, 0x36, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0xec, 0x57, 0x38, 0x25, 0x42, 0x43, 0x8c, 0x8c, 0x02, 0x00, 0x32, 0x93, 0x3e, 0x4d, 0xfe, 0xec, 0x02, 0x2a, 0x56, 0x00, 0x01, 0x00, 0x27, 0xff, 0xf7, 0x01, 0xf3, 0x02, 0x33, 0x00, 0x2a, 0x00, 0x00, 0x16, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x1e, 0x02, 0x17, 0x14, 0x06, 0x06, 0x23, 0xd5, 0x6c, 0x3f, 0x03, 0x8d, 0x04, 0x37, 0x29, 0x28, 0x2d, 0x37, 0x3c, 0x3e, 0x4f, 0x39, 0x35, 0x63, 0x43, 0x63, 0x76, 0x06, 0x86, 0x03, 0x31, 0x29, 0x26, 0x29, 0x38, 0x3b, 0x3c, 0x4e, 0x39, 0x01, 0x35, 0x63, 0x42, 0x09, 0x31, 0x54, 0x33, 0x20, 0x2a, 0x20, 0x19, 0x1b, 0x1b, 0x10, 0x0f, 0x20, 0x42, 0x38, 0x2e, 0x4c, 0x2c, 0x63, 0x54, 0x21, 0x27, 0x1c, 0x19, 0x1c, 0x1d, 0x0f, 0x0f, 0x20, 0x43, 0x37, 0x30, 0x4c, 0x2b, 0x00, 0x00, 0x01, 0x00, 0x19, 0x00, 0x00, 0x01, 0x64, 0x02, 0xb3, 0x00, 0x12, 0x00, 0x00, 0x13, 0x11, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x35, 0x11, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x15, 0xe8, 0x1b, 0x20, 0x41, 0x58, 0xb1, 0x42, 0x42, 0x8d, 0x7c, 0x01, 0xb7, 0xfe, 0xf4, 0x1c, 0x19, 0x76, 0xac, 0x01, 0x0b, 0x73, 0x89, 0x89, 0x73, 0x00, 0x00, 0x01, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x02, 0x2a, 0x00, 0x14, 0x00, 0x00, 0x01, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x11, 0x33, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x02, 0x50, 0x8d, 0x1b, 0x57, 0x33, 0x41, 0x64, 0x39, 0x8c, 0x42, 0x39, 0x3a, 0x42, 0x02, 0x2a, 0xfd, 0xd6, 0x46, 0x24, 0x29, 0x37, 0x6b, 0x4a, 0x01, 0x45, 0xfe, 0xcf, 0x42, 0x47, 0x47, 0x42, 0x01, 0x31, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x00, 0x00, 0x02, 0x4d, 0x02, 0x2a, 0x00, 0x06, 0x00, 0x00, 0x25, 0x13, 0x33, 0x03, 0x23, 0x03, 0x33, 0x01, 0x2c, 0x8c, 0x95, 0xcd, 0xaa, 0xcc, 0x96, 0x81, 0x01, 0xa9, 0xfd, 0xd6, 0x02, 0x2a, 0x00, 0x01, 0x00, 0x07, 0x00, 0x00, 0x03, 0x45, 0x02, 0x2a, 0x00, 0x0c, 0x00, 0x00, 0x01, 0x03, 0x23, 0x03, 0x03, 0x23, 0x03, 0x33, 0x13, 0x13, 0x33, 0x13, 0x13, 0x03, 0x45, 0xa2, 0x97, 0x65, 0x65, 0x98, 0xa3, 0x8e, 0x62, 0x6a, 0x94, 0x68, 0x62, 0x02, 0x2a, 0xfd, 0xd6, 0x01, 0x83, 0xfe, 0x7d, 0x02, 0x2a, 0xfe, 0x5a, 0x01, 0xa6, 0xfe, 0x5b, 0x01, 0xa5, 0x00, 0x00, 0x01, 0x00, 0x08, 0x00, 0x00, 0x02, 0x15, 0x02, 0x2a, 0x00, 0x0b, 0x00, 0x00, 0x21, 0x27, 0x07, 0x23, 0x13, 0x03, 0x33, 0x17, 0x37, 0x33, 0x03, 0x13, 0x01, 0x77, 0x72, 0x65, 0x96, 0xb5, 0xb7, 0x9e, 0x71, 0x66, 0x96, 0xb6, 0xb8, 0xac, 0xac, 0x01, 0x16, 0x01, 0x14, 0xab, 0xab, 0xfe, 0xec, 0xfe, 0xea, 0x00, 0x00, 0x01, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x02, 0x2a, 0x00, 0x07, 0x00, 0x00, 0x01, 0x01, 0x23, 0x13, 0x03, 0x33, 0x13, 0x13, 0x02, 0x57, 0xfe, 0xa9, 0x95, 0x78, 0xde, 0x9d, 0x8f, 0x91, 0x02, 0x2a, 0xfc, 0xd0, 0x01, 0x14, 0x02, 0x1c, 0xfe, 0x7d, 0x01, 0x83, 0x00, 0x01, 0x00, 0x26, 0x00, 0x00, 0x01, 0xbc, 0x02, 0x2a, 0x00, 0x09, 0x00, 0x00, 0x37, 0x33, 0x15, 0x21, 0x35, 0x13, 0x23, 0x35, 0x21, 0x15, 0xc5, 0xf7, 0xfe, 0x6a, 0xf2, 0xf1, 0x01, 0x92, 0x73, 0x73, 0x71, 0x01, 0x46, 0x73, 0x71, 0x00, 0x00, 0x01, 0x00, 0x6e, 0xff, 0x39, 0x01, 0xab, 0x03, 0x9e, 0x00, 0x30, 0x00, 0x00, 0x13, 0x36, 0x36, 0x35, 0x34, 0x27, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x15, 0x23, 0x22, 0x15, 0x14, 0x17, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x06, 0x15, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x36, 0x35, 0x34, 0x26, 0x27, 0x6e, 0x30, 0x31, 0x09, 0x0a, 0x5d, 0x4d, 0x45, 0x2a, 0x3e, 0x08, 0x01, 0x08, 0x34, 0x35, 0x35, 0x34, 0x08, 0x01, 0x08, 0x1e, 0x20, 0x2a, 0x45, 0x4d, 0x5d, 0x0a, 0x09, 0x31, 0x30, 0x01, 0xa2, 0x04, 0x2c, 0x25, 0x2a, 0x4f, 0x5e, 0x2b, 0x4e, 0x57, 0x76, 0x3b, 0x1c, 0x54, 0x0a, 0x5d, 0x24, 0x35, 0x46, 0x0a, 0x02, 0x0b, 0x45, 0x36, 0x22, 0x5d, 0x0c, 0x54, 0x1b, 0x1f, 0x1c, 0x77, 0x57, 0x4e, 0x2c, 0x5e, 0x4f, 0x29, 0x25, 0x2c, 0x04, 0x00, 0x00, 0x01, 0x00, 0x54, 0xff, 0x87, 0x00, 0xe1, 0x03, 0x28, 0x00, 0x03, 0x00, 0x00, 0x17, 0x23, 0x11, 0x33, 0xe1, 0x8d, 0x8d, 0x79, 0x03, 0xa1, 0x00, 0x01, 0x00, 0x51, 0xff, 0x39, 0x01, 0x8e, 0x03, 0x9e, 0x00, 0x30, 0x00, 0x00, 0x00, 0x06, 0x15, 0x14, 0x17, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x27, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x35, 0x34, 0x23, 0x23, 0x35, 0x33, 0x32, 0x16, 0x15, 0x14, 0x07, 0x06, 0x15, 0x14, 0x16, 0x17, 0x15, 0x01, 0x5e, 0x31, 0x09, 0x0a, 0x5d, 0x4d, 0x45, 0x2a, 0x20, 0x1e, 0x08, 0x01, 0x08, 0x34, 0x35, 0x35, 0x34, 0x08, 0x01, 0x08, 0x3e, 0x2a, 0x45, 0x4d, 0x5d, 0x0a, 0x09, 0x31, 0x30, 0x01, 0x31, 0x2c, 0x25, 0x29, 0x4f, 0x5e, 0x2c, 0x4e, 0x57, 0x77, 0x1c, 0x1f, 0x1b, 0x54, 0x0c, 0x5d, 0x22, 0x36, 0x45, 0x0b, 0x02, 0x0a, 0x46, 0x35, 0x24, 0x5d, 0x0a, 0x54, 0x1c, 0x3b, 0x76, 0x57, 0x4e, 0x2b, 0x5e, 0x4f, 0x2a, 0x25, 0x2c, 0x04, 0x6d, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00, 0xdf, 0x02, 0x30, 0x01, 0x9d, 0x00, 0x19, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x17, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x31, 0x5c, 0x45, 0x1e, 0x31, 0x1c, 0x17, 0x21, 0x12, 0x1a, 0x23, 0x04, 0x68, 0x11, 0x5d, 0x45, 0x1e, 0x2f, 0x1d, 0x19, 0x1f, 0x12, 0x1a, 0x24, 0x05, 0x66, 0x01, 0x41, 0x5c, 0x13, 0x12, 0x0e, 0x0e, 0x20, 0x20, 0x61, 0x5c, 0x13, 0x12, 0x0e, 0x0e, 0x21, 0x1f, 0x00, 0x00, 0x02, 0x00, 0x5b, 0xff, 0x6c, 0x01, 0x07, 0x02, 0x39, 0x00, 0x0b, 0x00, 0x0f, 0x00, 0x00, 0x12, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x07, 0x33, 0x13, 0x23, 0xd7, 0x30, 0x30, 0x25, 0x26, 0x31, 0x31, 0x26, 0x3e, 0x76, 0x10, 0x97, 0x02, 0x39, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0xea, 0xfe, 0x1d, 0x00, 0x00, 0x01, 0x00, 0x37, 0xff, 0xa9, 0x02, 0x34, 0x02, 0x5b, 0x00, 0x1e, 0x00, 0x00, 0x24, 0x36, 0x37, 0x33, 0x06, 0x06, 0x07, 0x15, 0x23, 0x35, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x33, 0x15, 0x16, 0x16, 0x17, 0x23, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x6f, 0x39, 0x0a, 0x82, 0x07, 0x75, 0x58, 0x40, 0x6f, 0x7a, 0x7a, 0x6f, 0x40, 0x58, 0x75, 0x07, 0x82, 0x17, 0x59, 0x3e, 0x48, 0x48, 0x3e, 0x6f, 0x25, 0x22, 0x4c, 0x64, 0x08, 0x55, 0x55, 0x0a, 0x8e, 0x6c, 0x6c, 0x8e, 0x0a, 0x55, 0x55, 0x08, 0x64, 0x4c, 0x47, 0x4e, 0x45, 0x45, 0x4e, 0x00, 0x00, 0x01, 0x00, 0x27, 0xff, 0xfd, 0x02, 0x3c, 0x02, 0xdd, 0x00, 0x26, 0x00, 0x00, 0x25, 0x15, 0x21, 0x27, 0x36, 0x36, 0x35, 0x34, 0x27, 0x23, 0x35, 0x33, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x33, 0x15, 0x23, 0x16, 0x15, 0x14, 0x06, 0x07, 0x02, 0x3c, 0xfe, 0x1b, 0x16, 0x2d, 0x2a, 0x02, 0x6f, 0x53, 0x14, 0x3b, 0x6a, 0x45, 0x6f, 0x75, 0x03, 0x81, 0x01, 0x30, 0x33, 0x2f, 0x37, 0x0b, 0x0b, 0xbc, 0xa3, 0x02, 0x21, 0x22, 0x6d, 0x70, 0x48, 0x2c, 0x5b, 0x44, 0x07, 0x10, 0x60, 0x44, 0x37, 0x44, 0x63, 0x34, 0x7b, 0x60, 0x30, 0x37, 0x38, 0x3a, 0x1a, 0x33, 0x23, 0x60, 0x10, 0x08, 0x2b, 0x55, 0x22, 0x00, 0x02, 0x00, 0x3c, 0x00, 0x9e, 0x01, 0xf5, 0x02, 0x57, 0x00, 0x1b, 0x00, 0x27, 0x00, 0x00, 0x00, 0x07, 0x17, 0x07, 0x27, 0x06, 0x23, 0x22, 0x27, 0x07, 0x27, 0x37, 0x26, 0x35, 0x34, 0x37, 0x27, 0x37, 0x17, 0x36, 0x33, 0x32, 0x17, 0x37, 0x17, 0x07, 0x16, 0x15, 0x06, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0xde, 0x21, 0x38, 0x39, 0x3f, 0x2e, 0x37, 0x38, 0x2c, 0x3e, 0x3a, 0x39, 0x1f, 0x20, 0x3a, 0x3a, 0x40, 0x2a, 0x39, 0x39, 0x2a, 0x40, 0x39, 0x38, 0x21, 0xa3, 0x31, 0x30, 0x23, 0x23, 0x30, 0x2f, 0x23, 0x01, 0x3e, 0x2e, 0x38, 0x3a, 0x3e, 0x16, 0x16, 0x3e, 0x3a, 0x39, 0x2b, 0x3d, 0x3d, 0x2d, 0x3a, 0x3a, 0x40, 0x15, 0x15, 0x40, 0x3a, 0x39, 0x2c, 0x3f, 0x5f, 0x32, 0x2d, 0x2e, 0x32, 0x32, 0x2e, 0x2e, 0x31, 0x00, 0x01, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x02, 0xba, 0x00, 0x18, 0x00, 0x00, 0x01, 0x33, 0x15, 0x07, 0x07, 0x15, 0x33, 0x15, 0x23, 0x15, 0x23, 0x35, 0x23, 0x35, 0x33, 0x35, 0x27, 0x27, 0x35, 0x33, 0x03, 0x33, 0x13, 0x13, 0x33, 0x01, 0xda, 0x72, 0xa5, 0x23, 0xc8, 0xc8, 0x8c, 0xc8, 0xc8, 0x23, 0xa5, 0x72, 0x97, 0x9e, 0x95, 0x94, 0x9e, 0x01, 0x99, 0x61, 0x02, 0x43, 0x09, 0x61, 0x89, 0x89, 0x61, 0x09, 0x44, 0x01, 0x61, 0x01, 0x21, 0xfe, 0xba, 0x01, 0x46, 0x00, 0x00, 0x02, 0x00, 0x69, 0xff, 0x87, 0x00, 0xf5, 0x03, 0x28, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x33, 0x11, 0x23, 0x13, 0x23, 0x11, 0x33, 0x69, 0x8c, 0x8c, 0x8c, 0x8c, 0x8c, 0x03, 0x28, 0xfe, 0x71, 0xfd, 0xee, 0x01, 0x8f, 0x00, 0x02, 0x00, 0x24, 0xff, 0x26, 0x02, 0x22, 0x02, 0xc2, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x00, 0x24, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x26, 0x27, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x16, 0x16, 0x15, 0x14, 0x07, 0x26, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x02, 0x00, 0x35, 0x65, 0x44, 0x61, 0x76, 0x02, 0x8c, 0x06, 0x48, 0x26, 0x2a, 0x1b, 0x41, 0x3f, 0x5b, 0x59, 0x38, 0x3a, 0x50, 0x35, 0x65, 0x44, 0x61, 0x76, 0x02, 0x8c, 0x02, 0x27, 0x25, 0x26, 0x2a, 0x1b, 0x41, 0x3f, 0x5b, 0x59, 0x72, 0xf9, 0x3c, 0x31, 0x31, 0x3b, 0x3c, 0x31, 0x31, 0x3b, 0x23, 0x51, 0x30, 0x4e, 0x2e, 0x5f, 0x51, 0x4e, 0x21, 0x1f, 0x16, 0x21, 0x21, 0x19, 0x24, 0x57, 0x40, 0x34, 0x50, 0x17, 0x36, 0x51, 0x30, 0x4e, 0x2e, 0x5f, 0x51, 0x26, 0x28, 0x21, 0x1f, 0x16, 0x21, 0x21, 0x19, 0x24, 0x57, 0x40, 0x69, 0x32, 0x74, 0x35, 0x35, 0x27, 0x27, 0x35, 0x35, 0x27, 0x00, 0x02, 0x00, 0x0a, 0x02, 0x6c, 0x01, 0x48, 0x02, 0xf1, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x32, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x30, 0x26, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x9d, 0x26, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x02, 0x6c, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x00, 0x03, 0x00, 0x2a, 0xff, 0xf8, 0x02, 0xe7, 0x02, 0xc4, 0x00, 0x0f, 0x00, 0x1f, 0x00, 0x3b, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x0e, 0x02, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x23, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x17, 0x33, 0x26, 0x26, 0x23, 0x01, 0xef, 0x9f, 0x59, 0x59, 0x9f, 0x66, 0x67, 0x9f, 0x59, 0x59, 0x9f, 0x67, 0x5a, 0x86, 0x48, 0x48, 0x86, 0x5a, 0x59, 0x86, 0x48, 0x48, 0x85, 0x5a, 0x40, 0x64, 0x39, 0x39, 0x64, 0x3f, 0x4d, 0x70, 0x11, 0x7b, 0x0b, 0x29, 0x22, 0x2e, 0x35, 0x35, 0x2e, 0x20, 0x2d, 0x09, 0x7b, 0x11, 0x6f, 0x4e, 0x02, 0xc4, 0x5b, 0xa3, 0x68, 0x68, 0xa3, 0x5b, 0x5b, 0xa3, 0x68, 0x68, 0xa3, 0x5b, 0x33, 0x4b, 0x8b, 0x5d, 0x5c, 0x8b, 0x4d, 0x4d, 0x8b, 0x5c, 0x5d, 0x8b, 0x4b, 0x4f, 0x38, 0x67, 0x44, 0x44, 0x68, 0x38, 0x55, 0x46, 0x1c, 0x1e, 0x43, 0x40, 0x40, 0x42, 0x1e, 0x1c, 0x48, 0x53, 0x00, 0x00, 0x02, 0x00, 0x1c, 0x01, 0x5c, 0x01, 0xaa, 0x02, 0xc6, 0x00, 0x11, 0x00, 0x1d, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x1c, 0x2d, 0x4c, 0x2e, 0x52, 0x29, 0x6c, 0x6c, 0x12, 0x3d, 0x29, 0x2f, 0x4e, 0x2d, 0x6f, 0x35, 0x25, 0x25, 0x34, 0x34, 0x25, 0x25, 0x35, 0x02, 0x47, 0x52, 0x2d, 0x34, 0x2e, 0xfe, 0xa1, 0x2d, 0x17, 0x1b, 0x2e, 0x53, 0x35, 0x2e, 0x34, 0x34, 0x2d, 0x2d, 0x34, 0x34, 0x2d, 0x00, 0x00, 0x02, 0x00, 0x2d, 0x00, 0x78, 0x01, 0xd9, 0x01, 0xd6, 0x00, 0x05, 0x00, 0x0b, 0x00, 0x00, 0x37, 0x27, 0x37, 0x33, 0x07, 0x17, 0x33, 0x27, 0x37, 0x33, 0x07, 0x17, 0x85, 0x58, 0x58, 0x85, 0x5c, 0x5c, 0x4b, 0x59, 0x59, 0x84, 0x5c, 0x5c, 0x78, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0x00, 0x00, 0x01, 0x00, 0x29, 0x00, 0xc3, 0x02, 0x77, 0x01, 0xb6, 0x00, 0x05, 0x00, 0x00, 0x01, 0x15, 0x23, 0x35, 0x21, 0x35, 0x02, 0x77, 0x8c, 0xfe, 0x3e, 0x01, 0xb6, 0xf3, 0x87, 0x6c, 0xff, 0xff, 0x00, 0x47, 0x01, 0x2a, 0x01, 0xef, 0x01, 0xa0, 0x00, 0x02, 0x02, 0xa0, 0x00, 0x00, 0x00, 0x04, 0x00, 0x2d, 0x01, 0x1c, 0x01, 0xd6, 0x02, 0xc5, 0x00, 0x0f, 0x00, 0x1b, 0x00, 0x29, 0x00, 0x31, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x36, 0x06, 0x07, 0x17, 0x23, 0x27, 0x23, 0x15, 0x23, 0x35, 0x33, 0x32, 0x16, 0x15, 0x07, 0x33, 0x32, 0x36, 0x35, 0x34, 0x23, 0x23, 0x01, 0x3f, 0x61, 0x36, 0x36, 0x61, 0x3d, 0x3d, 0x61, 0x37, 0x37, 0x61, 0x3d, 0x48, 0x57, 0x57, 0x48, 0x48, 0x56, 0x56, 0x48, 0x5e, 0x15, 0x13, 0x34, 0x4e, 0x2b, 0x06, 0x43, 0x69, 0x23, 0x2a, 0x74, 0x20, 0x07, 0x0a, 0x11, 0x20, 0x02, 0xc5, 0x36, 0x61, 0x3e, 0x3d, 0x60, 0x37, 0x37, 0x60, 0x3d, 0x3e, 0x61, 0x36, 0xfe, 0x8a, 0x59, 0x48, 0x49, 0x59, 0x59, 0x49, 0x49, 0x58, 0xb3, 0x20, 0x08, 0x52, 0x4b, 0x4b, 0xd6, 0x27, 0x1f, 0x13, 0x08, 0x08, 0x0f, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x78, 0x01, 0x88, 0x02, 0xdc, 0x00, 0x03, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x01, 0x88, 0xfe, 0x82, 0x02, 0xdc, 0x64, 0x64, 0x00, 0x02, 0x00, 0x1b, 0x01, 0x5b, 0x01, 0xa1, 0x02, 0xc1, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x1b, 0x6d, 0x57, 0x56, 0x6c, 0x6d, 0x57, 0x56, 0x6c, 0x01, 0x18, 0x32, 0x24, 0x23, 0x32, 0x31, 0x24, 0x23, 0x33, 0x02, 0x61, 0x60, 0x61, 0x51, 0x52, 0x62, 0x62, 0x52, 0x30, 0x35, 0x35, 0x31, 0x30, 0x34, 0x34, 0x30, 0x00, 0x01, 0x00, 0x53, 0x00, 0x77, 0x02, 0x51, 0x02, 0x6f, 0x00, 0x0f, 0x00, 0x00, 0x01, 0x15, 0x33, 0x15, 0x21, 0x35, 0x33, 0x35, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x15, 0x01, 0x95, 0xbc, 0xfe, 0x02, 0xbd, 0xbd, 0xbd, 0x85, 0xbc, 0x01, 0x6d, 0x7c, 0x7a, 0x7a, 0x7c, 0x7a, 0x88, 0x88, 0x7a, 0x00, 0x01, 0x00, 0x1e, 0x01, 0x60, 0x01, 0x43, 0x02, 0xc8, 0x00, 0x18, 0x00, 0x00, 0x13, 0x33, 0x15, 0x21, 0x35, 0x37, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x95, 0xac, 0xfe, 0xe1, 0x72, 0x1f, 0x1f, 0x14, 0x10, 0x1f, 0x05, 0x6c, 0x03, 0x50, 0x45, 0x2c, 0x40, 0x21, 0x30, 0x39, 0x01, 0xb5, 0x55, 0x50, 0x4d, 0x15, 0x29, 0x16, 0x12, 0x16, 0x25, 0x34, 0x40, 0x20, 0x33, 0x1d, 0x24, 0x37, 0x21, 0x00, 0x01, 0x00, 0x11, 0x01, 0x5b, 0x01, 0x48, 0x02, 0xc8, 0x00, 0x26, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x23, 0x18, 0x51, 0x48, 0x3f, 0x53, 0x22, 0x1e, 0x20, 0x25, 0x56, 0x43, 0x4a, 0x51, 0x03, 0x6c, 0x06, 0x27, 0x13, 0x18, 0x1a, 0x16, 0x23, 0x1f, 0x2f, 0x16, 0x13, 0x25, 0x06, 0x66, 0x02, 0x8a, 0x3e, 0x3c, 0x2d, 0x1e, 0x27, 0x07, 0x03, 0x09, 0x2a, 0x1e, 0x2c, 0x38, 0x3e, 0x36, 0x26, 0x15, 0x12, 0x12, 0x15, 0x39, 0x26, 0x11, 0x13, 0x21, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x51, 0x00, 0xf0, 0x03, 0x2c, 0x00, 0x03, 0x00, 0x00, 0x13, 0x07, 0x35, 0x37, 0xf0, 0xe6, 0xe6, 0x02, 0xba, 0x69, 0x64, 0x77, 0x00, 0x01, 0x00, 0x4b, 0xfe, 0xf8, 0x02, 0x5b, 0x02, 0x2a, 0x00, 0x14, 0x00, 0x00, 0x01, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x27, 0x11, 0x23, 0x11, 0x33, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x02, 0x5b, 0x8d, 0x1a, 0x59, 0x3a, 0x2c, 0x1f, 0x8b, 0x8b, 0x43, 0x39, 0x39, 0x43, 0x02, 0x2a, 0xfd, 0xd6, 0x55, 0x2c, 0x30, 0x13, 0xfe, 0xec, 0x03, 0x32, 0xfe, 0xcf, 0x41, 0x46, 0x46, 0x41, 0x01, 0x31, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00, 0x00, 0x02, 0x4f, 0x02, 0xba, 0x00, 0x0f, 0x00, 0x00, 0x21, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x21, 0x02, 0x4f, 0x77, 0x41, 0x78, 0x12, 0x76, 0x77, 0x33, 0x6a, 0x50, 0x01, 0x42, 0x02, 0x4e, 0xfd, 0xb2, 0x01, 0x16, 0x77, 0x5b, 0x3a, 0x5f, 0x39, 0xff, 0xff, 0x00, 0x33, 0x00, 0xf4, 0x00, 0xdf, 0x01, 0x98, 0x00, 0x07, 0x02, 0xa1, 0x00, 0x07, 0x00, 0xfb, 0x00, 0x00, 0x00, 0x01, 0x00, 0x0a, 0xfe, 0xf8, 0x01, 0x1d, 0x00, 0x07, 0x00, 0x12, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x15, 0xd2, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x58, 0x2b, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x7e, 0x32, 0x00, 0x00, 0x01, 0x00, 0x14, 0x01, 0x60, 0x00, 0xb8, 0x02, 0xc0, 0x00, 0x05, 0x00, 0x00, 0x13, 0x35, 0x33, 0x11, 0x23, 0x11, 0x14, 0xa4, 0x6b, 0x02, 0x6e, 0x52, 0xfe, 0xa0, 0x01, 0x0e, 0x00, 0x02, 0x00, 0x1c, 0x01, 0x5b, 0x01, 0xa6, 0x02, 0xc5, 0x00, 0x0f, 0x00, 0x1b, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x1c, 0x33, 0x59, 0x39, 0x39, 0x5a, 0x32, 0x33, 0x5a, 0x39, 0x39, 0x59, 0x32, 0x01, 0x1c, 0x33, 0x25, 0x24, 0x31, 0x31, 0x24, 0x24, 0x34, 0x02, 0x46, 0x52, 0x2d, 0x2d, 0x52, 0x36, 0x35, 0x52, 0x2e, 0x2e, 0x52, 0x35, 0x2e, 0x34, 0x34, 0x2f, 0x2d, 0x33, 0x33, 0x2d, 0x00, 0x02, 0x00, 0x32, 0x00, 0x78, 0x01, 0xde, 0x01, 0xd6, 0x00, 0x05, 0x00, 0x0b, 0x00, 0x00, 0x13, 0x27, 0x33, 0x17, 0x07, 0x23, 0x25, 0x27, 0x33, 0x17, 0x07, 0x23, 0x8d, 0x5b, 0x84, 0x59, 0x59, 0x84, 0x01, 0x2b, 0x5c, 0x84, 0x59, 0x59, 0x84, 0x01, 0x27, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0xaf, 0x00, 0x04, 0x00, 0x25, 0x00, 0x00, 0x02, 0xb7, 0x02, 0xc0, 0x00, 0x05, 0x00, 0x09, 0x00, 0x14, 0x00, 0x17, 0x00, 0x00, 0x13, 0x35, 0x33, 0x11, 0x23, 0x11, 0x25, 0x01, 0x23, 0x01, 0x13, 0x23, 0x15, 0x23, 0x35, 0x23, 0x35, 0x37, 0x33, 0x15, 0x33, 0x27, 0x07, 0x33, 0x25, 0xa4, 0x6b, 0x01, 0xf2, 0xfe, 0x81, 0x86, 0x01, 0x80, 0xec, 0x2a, 0x6c, 0xbe, 0x95, 0x95, 0x2a, 0x92, 0x59, 0x59, 0x02, 0x6e, 0x52, 0xfe, 0xa0, 0x01, 0x0e, 0x4d, 0xfd, 0x45, 0x02, 0xbb, 0xfd, 0x86, 0x41, 0x41, 0x3a, 0xe6, 0xe0, 0x93, 0x92, 0x00, 0x00, 0x03, 0x00, 0x25, 0xff, 0xff, 0x02, 0xc1, 0x02, 0xc0, 0x00, 0x05, 0x00, 0x09, 0x00, 0x22, 0x00, 0x00, 0x13, 0x23, 0x35, 0x33, 0x11, 0x23, 0x01, 0x01, 0x23, 0x01, 0x13, 0x33, 0x15, 0x21, 0x35, 0x37, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x23, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x5e, 0x39, 0xa4, 0x6b, 0x01, 0xed, 0xfe, 0x86, 0x86, 0x01, 0x79, 0x4f, 0xac, 0xfe, 0xe1, 0x72, 0x1f, 0x1f, 0x14, 0x10, 0x1f, 0x05, 0x6c, 0x03, 0x50, 0x45, 0x2c, 0x40, 0x21, 0x30, 0x39, 0x02, 0x6e, 0x52, 0xfe, 0xa0, 0x01, 0x5c, 0xfd, 0x44, 0x02, 0xbc, 0xfd, 0x98, 0x55, 0x50, 0x4d, 0x15, 0x29, 0x16, 0x12, 0x16, 0x25, 0x34, 0x40, 0x20, 0x33, 0x1d, 0x24, 0x37, 0x21, 0x00, 0x04, 0x00, 0x29, 0x00, 0x00, 0x03, 0x14, 0x02, 0xc8, 0x00, 0x26, 0x00, 0x2a, 0x00, 0x35, 0x00, 0x38, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x07, 0x15, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x33, 0x32, 0x35, 0x34, 0x26, 0x23, 0x22, 0x07, 0x23, 0x25, 0x01, 0x23, 0x01, 0x13, 0x23, 0x15, 0x23, 0x35, 0x23, 0x35, 0x37, 0x33, 0x15, 0x33, 0x27, 0x07, 0x33, 0x30, 0x51, 0x48, 0x3f, 0x53, 0x22, 0x1e, 0x20, 0x25, 0x56, 0x43, 0x4a, 0x51, 0x03, 0x6c, 0x06, 0x27, 0x13, 0x18, 0x1a, 0x16, 0x23, 0x1f, 0x2f, 0x16, 0x13, 0x25, 0x06, 0x66, 0x02, 0x8b, 0xfe, 0x76, 0x86, 0x01, 0x8a, 0xe1, 0x2b, 0x6b, 0xbe, 0x8f, 0x9a, 0x2b, 0x92, 0x5a, 0x5a, 0x02, 0x8a, 0x3e, 0x3c, 0x2d, 0x1e, 0x27, 0x07, 0x03, 0x09, 0x2a, 0x1e, 0x2c, 0x38, 0x3e, 0x36, 0x26, 0x15, 0x12, 0x12, 0x15, 0x39, 0x26, 0x11, 0x13, 0x21, 0x63, 0xfd, 0x44, 0x02, 0xbc, 0xfd, 0x85, 0x41, 0x41, 0x3a, 0xe6, 0xe0, 0x98, 0x98, 0x00, 0x00, 0x02, 0x00, 0x2b, 0xff, 0x5d, 0x01, 0xf8, 0x02, 0x36, 0x00, 0x0b, 0x00, 0x23, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x02, 0x26, 0x35, 0x34, 0x36, 0x33, 0x37, 0x33, 0x17, 0x23, 0x22, 0x06, 0x17, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x16, 0x06, 0x06, 0x23, 0x01, 0x79, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0xa9, 0x7f, 0x7e, 0x68, 0x04, 0x7b, 0x05, 0x2d, 0x58, 0x5e, 0x01, 0x33, 0x2c, 0x2e, 0x33, 0x84, 0x01, 0x36, 0x69, 0x47, 0x02, 0x36, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0xfd, 0x27, 0x71, 0x63, 0x62, 0x67, 0x4d, 0xaa, 0x2e, 0x3f, 0x2c, 0x32, 0x32, 0x2c, 0x3d, 0x60, 0x36, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0xe3, 0x00, 0x91, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xe3, 0x00, 0x91, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0x99, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0xc8, 0x00, 0x91, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0x73, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0xaa, 0x00, 0x91, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0x82, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0xbd, 0x00, 0x91, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0xd1, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcc, 0x00, 0xea, 0x00, 0x91, 0x00, 0x02, 0x00, 0x09, 0x00, 0x00, 0x03, 0x6f, 0x02, 0xbb, 0x00, 0x0f, 0x00, 0x12, 0x00, 0x00, 0x01, 0x15, 0x33, 0x15, 0x23, 0x15, 0x21, 0x15, 0x21, 0x35, 0x23, 0x07, 0x23, 0x01, 0x21, 0x15, 0x01, 0x11, 0x03, 0x02, 0x69, 0xe8, 0xe8, 0x01, 0x06, 0xfe, 0x6d, 0xf5, 0x45, 0x99, 0x01, 0x74, 0x01, 0xf2, 0xfe, 0x6d, 0xbc, 0x02, 0x4d, 0xb4, 0x6c, 0xbe, 0x6f, 0x83, 0x83, 0x02, 0xbb, 0x6e, 0xfe, 0xa2, 0x01, 0x66, 0xfe, 0x9a, 0x00, 0x01, 0x00, 0x23, 0xfe, 0xf6, 0x02, 0xcd, 0x02, 0xc3, 0x00, 0x2f, 0x00, 0x00, 0x24, 0x36, 0x37, 0x33, 0x06, 0x06, 0x07, 0x15, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x01, 0xbd, 0x57, 0x18, 0xa1, 0x1f, 0x97, 0x66, 0x37, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x59, 0x8d, 0x50, 0x5d, 0xa1, 0x64, 0x75, 0xb0, 0x23, 0xa1, 0x18, 0x57, 0x39, 0x3d, 0x5f, 0x35, 0x35, 0x5f, 0x3d, 0x77, 0x33, 0x32, 0x60, 0x75, 0x0b, 0x29, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x75, 0x0a, 0x5f, 0x9a, 0x5f, 0x67, 0xa3, 0x5b, 0x78, 0x6a, 0x32, 0x32, 0x39, 0x68, 0x46, 0x45, 0x69, 0x39, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0x88, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x88, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x99, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0x6c, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x82, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0x62, 0x00, 0x91, 0xff, 0xff, 0x00, 0x12, 0x00, 0x00, 0x00, 0xf8, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0x08, 0x00, 0x91, 0xff, 0xff, 0x00, 0x12, 0x00, 0x00, 0x00, 0xf8, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x08, 0x00, 0x91, 0xff, 0xff, 0xff, 0xf7, 0x00, 0x00, 0x01, 0x20, 0x03, 0x99, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0xff, 0xed, 0x00, 0x91, 0xff, 0xff, 0xff, 0xec, 0x00, 0x00, 0x01, 0x2a, 0x03, 0x82, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0xff, 0xe2, 0x00, 0x91, 0x00, 0x02, 0x00, 0x07, 0x00, 0x00, 0x02, 0xb2, 0x02, 0xba, 0x00, 0x0e, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x23, 0x11, 0x23, 0x35, 0x33, 0x11, 0x33, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x15, 0x33, 0x15, 0x23, 0x15, 0x33, 0x01, 0xb0, 0xa7, 0x5b, 0x5b, 0xa7, 0x6e, 0xf5, 0x46, 0x46, 0xf5, 0x68, 0x78, 0x78, 0x6d, 0x63, 0xa7, 0xa7, 0x63, 0x02, 0xba, 0x56, 0x9f, 0x69, 0x69, 0x9d, 0x56, 0x01, 0x1f, 0x7a, 0x01, 0x21, 0xfd, 0xb8, 0x7c, 0x6e, 0x6e, 0x7b, 0xac, 0x7a, 0xad, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x9a, 0x03, 0x73, 0x00, 0x22, 0x02, 0xc1, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0xb4, 0x00, 0x91, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x01, 0x06, 0x00, 0x91, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x01, 0x06, 0x00, 0x91, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0x99, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0xea, 0x00, 0x91, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0x73, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0xcd, 0x00, 0x91, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0x82, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0xe0, 0x00, 0x91, 0x00, 0x01, 0x00, 0x62, 0x00, 0x7b, 0x02, 0x3c, 0x02, 0x51, 0x00, 0x0b, 0x00, 0x00, 0x25, 0x27, 0x07, 0x27, 0x37, 0x27, 0x37, 0x17, 0x37, 0x17, 0x07, 0x17, 0x01, 0xe0, 0x92, 0x91, 0x5b, 0x91, 0x8d, 0x5b, 0x8d, 0x8d, 0x5c, 0x8d, 0x92, 0x7b, 0x92, 0x91, 0x5b, 0x92, 0x8d, 0x5b, 0x8d, 0x8d, 0x5b, 0x8d, 0x93, 0x00, 0x00, 0x03, 0x00, 0x18, 0xff, 0xf9, 0x02, 0xf9, 0x02, 0xc4, 0x00, 0x19, 0x00, 0x22, 0x00, 0x2b, 0x00, 0x00, 0x01, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x37, 0x33, 0x00, 0x17, 0x01, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x24, 0x27, 0x01, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x02, 0x96, 0x2a, 0x2e, 0x5f, 0xa4, 0x62, 0x3c, 0x6f, 0x2d, 0x38, 0x61, 0x64, 0x2a, 0x2f, 0x60, 0xa4, 0x62, 0x3c, 0x6e, 0x2e, 0x37, 0x61, 0xfd, 0xba, 0x25, 0x01, 0x30, 0x35, 0x4a, 0x3f, 0x61, 0x36, 0x01, 0xab, 0x25, 0xfe, 0xd0, 0x37, 0x49, 0x3f, 0x60, 0x36, 0x02, 0x4f, 0x2f, 0x7a, 0x47, 0x67, 0xa3, 0x5c, 0x24, 0x21, 0x3e, 0x6e, 0x30, 0x7b, 0x46, 0x66, 0xa3, 0x5c, 0x23, 0x21, 0x3c, 0xfe, 0x51, 0x3b, 0x01, 0x4d, 0x27, 0x38, 0x69, 0x46, 0x52, 0x39, 0xfe, 0xb3, 0x27, 0x39, 0x6a, 0x46, 0x00, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0xd9, 0x00, 0x91, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xd9, 0x00, 0x91, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0x99, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0xbe, 0x00, 0x91, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0x82, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0xb4, 0x00, 0x91, 0xff, 0xff, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xcc, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xbb, 0x00, 0x91, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x02, 0x42, 0x02, 0xbb, 0x00, 0x0e, 0x00, 0x17, 0x00, 0x00, 0x00, 0x06, 0x06, 0x23, 0x23, 0x15, 0x23, 0x11, 0x33, 0x15, 0x33, 0x32, 0x16, 0x16, 0x15, 0x06, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x15, 0x33, 0x02, 0x42, 0x35, 0x71, 0x56, 0x75, 0x8c, 0x8b, 0x76, 0x51, 0x72, 0x39, 0xc9, 0x39, 0x39, 0x39, 0x6f, 0x6f, 0x01, 0x26, 0x60, 0x3c, 0x8a, 0x02, 0xbb, 0x88, 0x38, 0x60, 0x3d, 0x69, 0x38, 0x31, 0x31, 0x38, 0xd2, 0x00, 0x00, 0x01, 0x00, 0x34, 0xff, 0xf6, 0x02, 0xa4, 0x03, 0x03, 0x00, 0x35, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x17, 0x16, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x34, 0x3c, 0x77, 0x55, 0x4a, 0x6e, 0x39, 0x2c, 0x27, 0x15, 0x13, 0x27, 0x3b, 0x4c, 0x44, 0x71, 0x60, 0x5f, 0x75, 0x0a, 0x87, 0x03, 0x2c, 0x26, 0x23, 0x25, 0x25, 0x32, 0x54, 0x49, 0x23, 0x21, 0x1d, 0x1b, 0x39, 0x31, 0x3e, 0x39, 0x8c, 0x02, 0x65, 0x65, 0x39, 0x31, 0x51, 0x2f, 0x31, 0x40, 0x24, 0x13, 0x17, 0x0b, 0x11, 0x1a, 0x15, 0x1b, 0x4f, 0x3d, 0x4d, 0x5e, 0x62, 0x59, 0x26, 0x2b, 0x1c, 0x1c, 0x1c, 0x23, 0x11, 0x1d, 0x3e, 0x2f, 0x21, 0x34, 0x20, 0x1d, 0x26, 0x17, 0x24, 0x29, 0x3d, 0x3a, 0xfd, 0xe9, 0x02, 0x25, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x02, 0xd3, 0x00, 0xd2, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x00, 0xd2, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x03, 0x08, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc7, 0x00, 0xb6, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x02, 0xe2, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0xce, 0x00, 0x99, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x02, 0xfa, 0x00, 0xac, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x03, 0x40, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcc, 0x00, 0xd8, 0x00, 0x00, 0x00, 0x03, 0x00, 0x21, 0xff, 0xf7, 0x04, 0x15, 0x02, 0x33, 0x00, 0x29, 0x00, 0x30, 0x00, 0x40, 0x00, 0x00, 0x00, 0x07, 0x21, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x15, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x35, 0x33, 0x15, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x06, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x04, 0x15, 0x05, 0xfe, 0x55, 0x08, 0x53, 0x34, 0x30, 0x3e, 0x0d, 0x97, 0x17, 0x7e, 0x5a, 0x3d, 0x65, 0x1d, 0x80, 0x1f, 0x60, 0x3b, 0x46, 0x74, 0x43, 0x43, 0x76, 0x49, 0x74, 0x43, 0x7e, 0x24, 0x5e, 0x3d, 0x4a, 0x73, 0x41, 0x91, 0x01, 0x50, 0x3c, 0x37, 0x51, 0x0a, 0xfc, 0x44, 0x28, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x01, 0x0c, 0x1e, 0x3f, 0x44, 0x24, 0x1f, 0x50, 0x67, 0x32, 0x29, 0x52, 0x52, 0x29, 0x32, 0x48, 0x83, 0x55, 0x55, 0x81, 0x46, 0x57, 0x4e, 0x4e, 0x2d, 0x2a, 0x45, 0x7d, 0x4f, 0x21, 0x39, 0x44, 0x43, 0x3a, 0xd1, 0x27, 0x49, 0x33, 0x33, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x00, 0x01, 0x00, 0x21, 0xfe, 0xf6, 0x02, 0x38, 0x02, 0x33, 0x00, 0x2c, 0x00, 0x00, 0x24, 0x37, 0x33, 0x06, 0x06, 0x07, 0x15, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x87, 0x1a, 0x97, 0x15, 0x71, 0x55, 0x37, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x44, 0x67, 0x39, 0x46, 0x7c, 0x50, 0x67, 0x87, 0x17, 0x97, 0x0c, 0x39, 0x2a, 0x3c, 0x46, 0x46, 0x3c, 0x6f, 0x4c, 0x51, 0x66, 0x0a, 0x27, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x73, 0x0a, 0x4b, 0x79, 0x4d, 0x56, 0x81, 0x47, 0x67, 0x5d, 0x24, 0x29, 0x57, 0x50, 0x4f, 0x57, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x03, 0x2e, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0xb2, 0x00, 0x02, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x03, 0x2e, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xb2, 0x00, 0x02, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x03, 0x0a, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0x96, 0x00, 0x02, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0xf3, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0x8c, 0x00, 0x02, 0xff, 0xff, 0x00, 0x18, 0x00, 0x00, 0x00, 0xfe, 0x03, 0x2c, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x02, 0xd3, 0x0e, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x18, 0x00, 0x00, 0x00, 0xfe, 0x03, 0x2c, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x03, 0x06, 0x0e, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xfd, 0x00, 0x00, 0x01, 0x26, 0x03, 0x08, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x03, 0xc7, 0xf3, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xf2, 0x00, 0x00, 0x01, 0x30, 0x02, 0xf1, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x02, 0xfa, 0xe8, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf8, 0x02, 0x5d, 0x02, 0xe5, 0x00, 0x1d, 0x00, 0x2c, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x26, 0x27, 0x07, 0x35, 0x37, 0x26, 0x27, 0x33, 0x16, 0x17, 0x37, 0x15, 0x07, 0x02, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x1c, 0x41, 0x4b, 0x82, 0x53, 0x50, 0x81, 0x4b, 0x49, 0x7c, 0x4c, 0x4d, 0x3e, 0x18, 0x29, 0x74, 0x47, 0x18, 0x2f, 0x86, 0x0d, 0x17, 0x70, 0x43, 0x7c, 0x42, 0x28, 0x28, 0x42, 0x25, 0x26, 0x40, 0x27, 0x51, 0x3b, 0x02, 0x44, 0xab, 0x5c, 0x68, 0x93, 0x4a, 0x47, 0x82, 0x55, 0x55, 0x81, 0x46, 0x2d, 0x37, 0x34, 0x24, 0x40, 0x17, 0x1a, 0x27, 0x0b, 0x17, 0x23, 0x40, 0x15, 0xfd, 0xdf, 0x25, 0x4b, 0x36, 0x36, 0x4b, 0x25, 0x25, 0x4b, 0x36, 0x50, 0x56, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x55, 0x02, 0xe2, 0x00, 0x22, 0x02, 0xe1, 0x00, 0x00, 0x00, 0x03, 0x03, 0xce, 0x00, 0x9f, 0x00, 0x00, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x03, 0x33, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0xc2, 0x00, 0x07, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x03, 0x33, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xc2, 0x00, 0x07, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x03, 0x0f, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0xa6, 0x00, 0x07, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x02, 0xe9, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0x89, 0x00, 0x07, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x02, 0xf8, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0x9c, 0x00, 0x07, 0x00, 0x03, 0x00, 0x49, 0x00, 0x37, 0x02, 0x47, 0x02, 0x94, 0x00, 0x0b, 0x00, 0x0f, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x17, 0x15, 0x21, 0x35, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x01, 0x25, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0xfc, 0xfe, 0x02, 0xdc, 0x31, 0x31, 0x26, 0x25, 0x30, 0x30, 0x25, 0x01, 0xf0, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x4e, 0x7a, 0x7a, 0xfe, 0x95, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0x00, 0x00, 0x03, 0x00, 0x15, 0xff, 0xf7, 0x02, 0x65, 0x02, 0x33, 0x00, 0x17, 0x00, 0x1f, 0x00, 0x28, 0x00, 0x00, 0x01, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x07, 0x23, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x17, 0x37, 0x33, 0x00, 0x17, 0x37, 0x26, 0x23, 0x22, 0x06, 0x15, 0x24, 0x27, 0x07, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x02, 0x17, 0x20, 0x23, 0x4d, 0x83, 0x51, 0x60, 0x49, 0x26, 0x55, 0x4d, 0x20, 0x22, 0x4b, 0x82, 0x50, 0x63, 0x49, 0x27, 0x55, 0xfe, 0x49, 0x12, 0xd0, 0x25, 0x30, 0x3c, 0x51, 0x01, 0x1c, 0x12, 0xcf, 0x22, 0x2e, 0x26, 0x43, 0x28, 0x01, 0xd5, 0x25, 0x62, 0x39, 0x55, 0x82, 0x47, 0x33, 0x2a, 0x54, 0x26, 0x62, 0x39, 0x55, 0x82, 0x47, 0x34, 0x2b, 0xfe, 0xb8, 0x27, 0xe3, 0x1b, 0x55, 0x4f, 0x31, 0x27, 0xe3, 0x19, 0x25, 0x4a, 0x35, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x02, 0xd3, 0x00, 0xc8, 0x00, 0x00, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x00, 0xc8, 0x00, 0x00, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x08, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc7, 0x00, 0xac, 0x00, 0x00, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x02, 0xfa, 0x00, 0xa2, 0x00, 0x00, 0xff, 0xff, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xec, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x00, 0xac, 0x00, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xf8, 0x02, 0x85, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x22, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x11, 0x23, 0x11, 0x33, 0x11, 0x04, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0xed, 0x5b, 0x3c, 0x47, 0x76, 0x44, 0x44, 0x76, 0x47, 0x3c, 0x5a, 0x1d, 0x8c, 0x8c, 0x01, 0x25, 0x29, 0x43, 0x26, 0x26, 0x43, 0x2a, 0x2a, 0x43, 0x26, 0x26, 0x43, 0x29, 0x02, 0x00, 0x32, 0x48, 0x81, 0x53, 0x53, 0x83, 0x48, 0x36, 0x2f, 0xfe, 0x9b, 0x03, 0xec, 0xfe, 0xf0, 0x8b, 0x4a, 0x25, 0x26, 0x4a, 0x33, 0x33, 0x4a, 0x26, 0x26, 0x4b, 0x33, 0xff, 0xff, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xec, 0x00, 0x00, 0x00, 0x03, 0x02, 0xfa, 0x00, 0x86, 0x00, 0x00, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0x6d, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0x01, 0x00, 0x9d, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x02, 0xdc, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0x01, 0x00, 0x8c, 0x00, 0x00, 0xff, 0xff, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xb3, 0x03, 0x96, 0x00, 0x22, 0x02, 0xb4, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0xbd, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x62, 0x03, 0x05, 0x00, 0x22, 0x02, 0xd4, 0x00, 0x00, 0x00, 0x03, 0x03, 0xca, 0x00, 0xac, 0x00, 0x00, 0x00, 0x02, 0x00, 0x1a, 0xff, 0x2a, 0x02, 0xbe, 0x02, 0xbb, 0x00, 0x18, 0x00, 0x1b, 0x00, 0x00, 0x04, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x27, 0x21, 0x07, 0x23, 0x13, 0x33, 0x13, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x0b, 0x02, 0x02, 0x99, 0x25, 0x2a, 0x2f, 0x3b, 0x51, 0x1f, 0x24, 0x2b, 0xfe, 0xea, 0x2e, 0x93, 0xfb, 0xa3, 0xfb, 0x30, 0x22, 0x1b, 0x1b, 0x17, 0xad, 0x65, 0x65, 0x82, 0x0f, 0x54, 0x0f, 0x38, 0x38, 0x1f, 0x37, 0x1a, 0x7b, 0x85, 0x02, 0xbb, 0xfd, 0x45, 0x18, 0x10, 0x1f, 0x12, 0x13, 0x16, 0x01, 0x77, 0x01, 0x24, 0xfe, 0xdc, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0x2a, 0x02, 0x6d, 0x02, 0x33, 0x00, 0x24, 0x00, 0x34, 0x00, 0x00, 0x04, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x33, 0x11, 0x23, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x26, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x02, 0x46, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x24, 0x29, 0x1b, 0x5f, 0x3e, 0x46, 0x73, 0x43, 0x43, 0x73, 0x47, 0x3e, 0x5d, 0x1c, 0x8d, 0x01, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0xbd, 0x44, 0x28, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x82, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x21, 0x39, 0x1b, 0x43, 0x27, 0x33, 0x48, 0x83, 0x55, 0x54, 0x82, 0x46, 0x32, 0x26, 0x4f, 0xfd, 0xd6, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0xf4, 0x27, 0x49, 0x33, 0x33, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xcd, 0x03, 0xc4, 0x00, 0x22, 0x02, 0xb6, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x01, 0x01, 0x00, 0x98, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x38, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xd6, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x00, 0xa9, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xcd, 0x03, 0x89, 0x00, 0x22, 0x02, 0xb6, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x01, 0x38, 0x00, 0x98, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x38, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xd6, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcb, 0x00, 0xdf, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xcd, 0x03, 0xa0, 0x00, 0x22, 0x02, 0xb6, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0xe6, 0x00, 0x98, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x38, 0x03, 0x08, 0x00, 0x22, 0x02, 0xd6, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc8, 0x00, 0x8d, 0x00, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0xa9, 0x03, 0x99, 0x00, 0x22, 0x02, 0xb7, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0xc5, 0x00, 0x91, 0x00, 0x03, 0x00, 0x21, 0xff, 0xf7, 0x03, 0x1c, 0x02, 0xe4, 0x00, 0x12, 0x00, 0x1e, 0x00, 0x2e, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x11, 0x33, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x00, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x00, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x21, 0x43, 0x74, 0x47, 0x36, 0x62, 0x1d, 0x8e, 0x8e, 0x1a, 0x5e, 0x3e, 0x46, 0x74, 0x43, 0x02, 0xfb, 0x3f, 0x3f, 0x32, 0x39, 0x74, 0xfe, 0xca, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x27, 0x44, 0x28, 0x01, 0x6b, 0x82, 0x46, 0x2f, 0x27, 0x01, 0x07, 0xfd, 0x1c, 0x52, 0x29, 0x32, 0x48, 0x83, 0x55, 0x01, 0x91, 0x30, 0x42, 0x47, 0x39, 0x3c, 0x13, 0x6d, 0xfe, 0x64, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x27, 0x49, 0x33, 0x00, 0xff, 0xff, 0x00, 0x07, 0x00, 0x00, 0x02, 0xb2, 0x02, 0xba, 0x00, 0x02, 0x03, 0x22, 0x00, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x9e, 0x02, 0xe4, 0x00, 0x1a, 0x00, 0x2a, 0x00, 0x00, 0x01, 0x23, 0x11, 0x23, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x00, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x02, 0x9e, 0x3c, 0x8e, 0x1a, 0x5e, 0x3e, 0x46, 0x74, 0x43, 0x43, 0x74, 0x47, 0x36, 0x62, 0x1d, 0x4c, 0x4c, 0x8e, 0x3c, 0xfe, 0xcb, 0x44, 0x28, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x02, 0x4e, 0xfd, 0xb2, 0x52, 0x29, 0x32, 0x48, 0x83, 0x55, 0x54, 0x82, 0x46, 0x2f, 0x27, 0x71, 0x4a, 0x4c, 0x4c, 0xfd, 0xda, 0x27, 0x49, 0x33, 0x33, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x6d, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0x01, 0x00, 0x42, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0xde, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x06, 0x03, 0x01, 0x6c, 0x02, 0x00, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x96, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0x62, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x03, 0x07, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0x8b, 0x00, 0x02, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x82, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x00, 0xbe, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0xf3, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x00, 0xe8, 0x00, 0x02, 0x00, 0x01, 0x00, 0x45, 0xff, 0x2a, 0x01, 0xe6, 0x02, 0xbb, 0x00, 0x1c, 0x00, 0x00, 0x04, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x23, 0x11, 0x21, 0x15, 0x21, 0x15, 0x33, 0x15, 0x23, 0x15, 0x21, 0x15, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0xbf, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x39, 0xf5, 0x01, 0x95, 0xfe, 0xf7, 0xeb, 0xeb, 0x01, 0x09, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0x82, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x3a, 0x2d, 0x02, 0xbb, 0x72, 0xaf, 0x6f, 0xb9, 0x72, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0x00, 0x02, 0x00, 0x21, 0xff, 0x37, 0x02, 0x48, 0x02, 0x33, 0x00, 0x27, 0x00, 0x2e, 0x00, 0x00, 0x00, 0x07, 0x21, 0x16, 0x16, 0x33, 0x32, 0x37, 0x33, 0x06, 0x06, 0x07, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x02, 0x48, 0x04, 0xfe, 0x6b, 0x05, 0x4a, 0x36, 0x4e, 0x21, 0x97, 0x13, 0x5c, 0x45, 0x17, 0x22, 0x1c, 0x1b, 0x17, 0x20, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x29, 0x5d, 0x70, 0x46, 0x7e, 0x52, 0x4f, 0x7d, 0x45, 0x91, 0x01, 0x4c, 0x37, 0x34, 0x47, 0x08, 0x01, 0x03, 0x18, 0x3c, 0x44, 0x43, 0x3f, 0x5c, 0x12, 0x0c, 0x11, 0x1f, 0x12, 0x12, 0x16, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x33, 0x26, 0x16, 0x94, 0x6c, 0x56, 0x82, 0x46, 0x44, 0x7d, 0x51, 0x28, 0x36, 0x41, 0x3f, 0x38, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x99, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0x6c, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x03, 0x0a, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0x96, 0x00, 0x02, 0xff, 0xff, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xdd, 0x03, 0x96, 0x00, 0x22, 0x02, 0xba, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0xd6, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xfe, 0xef, 0x02, 0x62, 0x03, 0x05, 0x00, 0x22, 0x02, 0xda, 0x00, 0x00, 0x00, 0x03, 0x03, 0xca, 0x00, 0xac, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xfa, 0x02, 0xdd, 0x03, 0x82, 0x00, 0x22, 0x02, 0xba, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x01, 0x33, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xfe, 0xef, 0x02, 0x62, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xda, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcb, 0x01, 0x08, 0x00, 0x00, 0x00, 0x02, 0x00, 0x23, 0xfe, 0xdf, 0x02, 0xdd, 0x02, 0xc3, 0x00, 0x21, 0x00, 0x2d, 0x00, 0x00, 0x01, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x37, 0x23, 0x35, 0x21, 0x15, 0x0e, 0x02, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x00, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x02, 0x2b, 0x18, 0x54, 0x38, 0x3e, 0x60, 0x36, 0x37, 0x62, 0x41, 0x50, 0x66, 0x10, 0xf0, 0x01, 0x7a, 0x0e, 0x5c, 0x91, 0x5a, 0x65, 0xa3, 0x5d, 0x5d, 0xa3, 0x64, 0x76, 0xae, 0x21, 0xfe, 0xfd, 0x40, 0x3e, 0x32, 0x39, 0x74, 0x01, 0xe8, 0x2c, 0x2e, 0x38, 0x68, 0x44, 0x46, 0x68, 0x38, 0x55, 0x4c, 0x6b, 0x7a, 0x49, 0x7c, 0x4b, 0x5b, 0xa2, 0x67, 0x67, 0xa3, 0x5b, 0x73, 0x68, 0xfd, 0xaf, 0x2e, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x03, 0x00, 0x21, 0xfe, 0xef, 0x02, 0x62, 0x03, 0x4b, 0x00, 0x0b, 0x00, 0x2b, 0x00, 0x3b, 0x00, 0x00, 0x00, 0x35, 0x34, 0x36, 0x33, 0x15, 0x22, 0x15, 0x15, 0x33, 0x15, 0x23, 0x16, 0x16, 0x17, 0x35, 0x33, 0x11, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x16, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x01, 0x10, 0x3f, 0x3e, 0x32, 0x39, 0x74, 0x3c, 0x5e, 0x1b, 0x8d, 0x3e, 0x7c, 0x58, 0x76, 0x97, 0x0a, 0x8b, 0x0b, 0x49, 0x34, 0x3d, 0x4c, 0x1b, 0x5f, 0x3d, 0x46, 0x74, 0x43, 0x43, 0x73, 0x47, 0xb7, 0x28, 0x44, 0x27, 0x27, 0x42, 0x29, 0x29, 0x43, 0x26, 0x27, 0x44, 0x28, 0x02, 0x8f, 0x32, 0x42, 0x48, 0x39, 0x3d, 0x12, 0x6e, 0x22, 0x31, 0x27, 0x4f, 0xfd, 0xd2, 0x4d, 0x79, 0x47, 0x6e, 0x5f, 0x26, 0x2d, 0x49, 0x4a, 0x56, 0x27, 0x34, 0x48, 0x83, 0x55, 0x54, 0x82, 0x46, 0xeb, 0x49, 0x27, 0x26, 0x49, 0x32, 0x32, 0x4b, 0x28, 0x27, 0x49, 0x33, 0xff, 0xff, 0xff, 0xd7, 0x00, 0x00, 0x01, 0x44, 0x03, 0x73, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0xff, 0xcf, 0x00, 0x91, 0xff, 0xff, 0xff, 0xde, 0x00, 0x00, 0x01, 0x4b, 0x02, 0xe2, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x03, 0xce, 0xd6, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xcd, 0x00, 0x00, 0x01, 0x4b, 0x03, 0x6d, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0x01, 0xff, 0xc3, 0x00, 0x91, 0xff, 0xff, 0xff, 0xd3, 0x00, 0x00, 0x01, 0x51, 0x02, 0xdc, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x03, 0x01, 0xc9, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xec, 0x00, 0x00, 0x01, 0x2b, 0x03, 0x96, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0xff, 0xe2, 0x00, 0x91, 0xff, 0xff, 0xff, 0xf2, 0x00, 0x00, 0x01, 0x31, 0x03, 0x05, 0x00, 0x22, 0x03, 0x7b, 0x00, 0x00, 0x00, 0x02, 0x03, 0xca, 0xe8, 0x00, 0x00, 0x00, 0x00, 0x01, 0xff, 0xf8, 0xff, 0x2b, 0x00, 0xdd, 0x02, 0xba, 0x00, 0x15, 0x00, 0x00, 0x16, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x11, 0x33, 0x11, 0x23, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0xb6, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x24, 0x29, 0x8c, 0x02, 0x2d, 0x22, 0x1c, 0x1b, 0x17, 0x81, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x21, 0x39, 0x1b, 0x02, 0xab, 0xfd, 0x46, 0x17, 0x11, 0x1f, 0x12, 0x12, 0x16, 0x00, 0x02, 0xff, 0xf8, 0xff, 0x2b, 0x00, 0xe2, 0x03, 0x10, 0x00, 0x0b, 0x00, 0x21, 0x00, 0x00, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x02, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x11, 0x33, 0x11, 0x23, 0x07, 0x06, 0x06, 0x15, 0x67, 0x31, 0x31, 0x25, 0x25, 0x31, 0x31, 0x25, 0x28, 0x1b, 0x17, 0x20, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x24, 0x29, 0x8c, 0x02, 0x2d, 0x22, 0x1c, 0x02, 0x6c, 0x2f, 0x23, 0x23, 0x2f, 0x2f, 0x23, 0x23, 0x2f, 0xfd, 0x29, 0x16, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x21, 0x39, 0x1b, 0x02, 0x1b, 0xfd, 0xd6, 0x17, 0x11, 0x1f, 0x12, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x00, 0xd1, 0x03, 0x82, 0x00, 0x22, 0x02, 0xbc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x00, 0x3f, 0x00, 0x91, 0x00, 0x01, 0x00, 0x4b, 0x00, 0x00, 0x00, 0xd7, 0x02, 0x2a, 0x00, 0x03, 0x00, 0x00, 0x13, 0x11, 0x23, 0x11, 0xd7, 0x8c, 0x02, 0x2a, 0xfd, 0xd6, 0x02, 0x2a, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x02, 0x80, 0x02, 0xba, 0x00, 0x0a, 0x00, 0x16, 0x00, 0x00, 0x21, 0x23, 0x03, 0x11, 0x23, 0x11, 0x33, 0x11, 0x13, 0x33, 0x01, 0x13, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x02, 0x80, 0xb1, 0xfe, 0x8c, 0x8c, 0xfe, 0xa9, 0xfe, 0xe0, 0x30, 0x11, 0x40, 0x3d, 0x32, 0x3a, 0x01, 0x37, 0xfe, 0xc9, 0x02, 0xba, 0xfe, 0xc7, 0x01, 0x39, 0xfe, 0xa6, 0xfe, 0x75, 0x39, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x02, 0x43, 0x02, 0xe4, 0x00, 0x0a, 0x00, 0x16, 0x00, 0x00, 0x21, 0x23, 0x27, 0x15, 0x23, 0x11, 0x33, 0x11, 0x37, 0x33, 0x03, 0x13, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x02, 0x43, 0xb6, 0xbc, 0x8c, 0x8c, 0xba, 0xb6, 0xf4, 0x10, 0x10, 0x40, 0x3d, 0x32, 0x39, 0xec, 0xec, 0x02, 0xe4, 0xfe, 0x5b, 0xeb, 0xfe, 0xea, 0xfe, 0xc1, 0x3a, 0x32, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xb7, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xbf, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x5d, 0x00, 0x91, 0xff, 0xff, 0x00, 0x12, 0x00, 0x00, 0x00, 0xf8, 0x03, 0xe6, 0x00, 0x22, 0x02, 0xdf, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x08, 0x00, 0xba, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x01, 0xb7, 0x02, 0xba, 0x00, 0x05, 0x00, 0x12, 0x00, 0x00, 0x37, 0x33, 0x15, 0x21, 0x11, 0x33, 0x12, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x33, 0xd1, 0xe6, 0xfe, 0x8e, 0x8c, 0x79, 0x3f, 0x3f, 0x1a, 0x19, 0x3a, 0x74, 0x6f, 0x6f, 0x02, 0xba, 0xfc, 0xe2, 0x33, 0x42, 0x48, 0x39, 0x1e, 0x20, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x00, 0xd5, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x0f, 0x00, 0x00, 0x13, 0x11, 0x23, 0x11, 0x12, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xd1, 0x8c, 0x90, 0x40, 0x3e, 0x33, 0x3a, 0x74, 0x02, 0xe4, 0xfd, 0x1c, 0x02, 0xe4, 0xfc, 0xb3, 0x2e, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x01, 0xbf, 0x02, 0xba, 0x00, 0x05, 0x00, 0x11, 0x00, 0x00, 0x37, 0x33, 0x15, 0x21, 0x11, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xd1, 0xe6, 0xfe, 0x8e, 0x8c, 0xee, 0x3f, 0x3d, 0x31, 0x39, 0x74, 0x6f, 0x6f, 0x02, 0xba, 0x34, 0x37, 0x42, 0x48, 0x39, 0x3d, 0x13, 0x6c, 0x00, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x01, 0x9e, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x0f, 0x00, 0x00, 0x13, 0x11, 0x23, 0x11, 0x04, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xd1, 0x8c, 0x01, 0x59, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0x02, 0xe4, 0xfd, 0x1c, 0x02, 0xe4, 0x37, 0x35, 0x42, 0x47, 0x39, 0x3c, 0x13, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x01, 0xb7, 0x02, 0xba, 0x00, 0x05, 0x00, 0x11, 0x00, 0x00, 0x13, 0x33, 0x11, 0x33, 0x15, 0x21, 0x00, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x45, 0x8c, 0xe6, 0xfe, 0x8e, 0x01, 0x0e, 0x26, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x02, 0xba, 0xfd, 0xb5, 0x6f, 0x01, 0x3e, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x00, 0x00, 0x02, 0x00, 0x45, 0x00, 0x00, 0x01, 0x79, 0x02, 0xe4, 0x00, 0x03, 0x00, 0x0f, 0x00, 0x00, 0x13, 0x33, 0x11, 0x23, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x45, 0x8c, 0x8c, 0xd6, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x26, 0x1c, 0x02, 0xe4, 0xfd, 0x1c, 0x01, 0x2a, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x00, 0x00, 0x01, 0x00, 0x09, 0x00, 0x00, 0x01, 0xc3, 0x02, 0xba, 0x00, 0x0d, 0x00, 0x00, 0x25, 0x15, 0x21, 0x11, 0x07, 0x35, 0x37, 0x11, 0x33, 0x11, 0x37, 0x15, 0x07, 0x15, 0x01, 0xc3, 0xfe, 0x8e, 0x48, 0x48, 0x8d, 0x58, 0x58, 0x6b, 0x6b, 0x01, 0x1b, 0x16, 0x71, 0x16, 0x01, 0x2e, 0xfe, 0xff, 0x1b, 0x72, 0x1b, 0xdc, 0x00, 0x01, 0x00, 0x09, 0x00, 0x00, 0x01, 0x1a, 0x02, 0xe4, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x07, 0x11, 0x23, 0x11, 0x07, 0x35, 0x37, 0x11, 0x33, 0x11, 0x37, 0x01, 0x1a, 0x43, 0x8c, 0x42, 0x42, 0x8c, 0x43, 0x01, 0x61, 0x16, 0xfe, 0xb5, 0x01, 0x1e, 0x15, 0x73, 0x15, 0x01, 0x53, 0xfe, 0xda, 0x15, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x9a, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc1, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xed, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x55, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xe1, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x00, 0xd8, 0x00, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x02, 0x9a, 0x02, 0xbb, 0x00, 0x09, 0x00, 0x15, 0x00, 0x00, 0x21, 0x23, 0x01, 0x11, 0x23, 0x11, 0x33, 0x01, 0x11, 0x33, 0x02, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x02, 0x9a, 0x8c, 0xfe, 0xc3, 0x8c, 0x8c, 0x01, 0x3d, 0x8c, 0xdc, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0x01, 0xdf, 0xfe, 0x21, 0x02, 0xbb, 0xfe, 0x20, 0x01, 0xe0, 0xfc, 0xe1, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x02, 0x55, 0x02, 0x32, 0x00, 0x13, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x16, 0x15, 0x11, 0x23, 0x11, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0x36, 0x36, 0x33, 0x13, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x01, 0xdb, 0x7a, 0x8c, 0x42, 0x39, 0x3a, 0x43, 0x8c, 0x8c, 0x1c, 0x57, 0x34, 0x10, 0x10, 0x3f, 0x3d, 0x31, 0x39, 0x02, 0x32, 0x7d, 0x70, 0xfe, 0xbb, 0x01, 0x32, 0x42, 0x47, 0x47, 0x42, 0xfe, 0xce, 0x02, 0x2a, 0x45, 0x24, 0x29, 0xfd, 0xa3, 0x35, 0x37, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x9a, 0x03, 0x99, 0x00, 0x22, 0x02, 0xc1, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0xd1, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x55, 0x03, 0x08, 0x00, 0x22, 0x02, 0xe1, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc8, 0x00, 0xbc, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0x6d, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0x01, 0x00, 0xc0, 0x00, 0x91, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x02, 0xe3, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x06, 0x03, 0x01, 0x7c, 0x07, 0x00, 0x00, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0x96, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0xdf, 0x00, 0x91, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x03, 0x0c, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0x9c, 0x00, 0x07, 0xff, 0xff, 0x00, 0x23, 0xff, 0xf9, 0x02, 0xee, 0x03, 0xa6, 0x00, 0x22, 0x02, 0xc2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcf, 0x00, 0xef, 0x00, 0x91, 0xff, 0xff, 0x00, 0x22, 0xff, 0xf7, 0x02, 0x5c, 0x03, 0x1c, 0x00, 0x22, 0x02, 0xe2, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcf, 0x00, 0xab, 0x00, 0x07, 0x00, 0x02, 0x00, 0x23, 0xff, 0xf8, 0x03, 0xf6, 0x02, 0xc4, 0x00, 0x19, 0x00, 0x29, 0x00, 0x00, 0x01, 0x33, 0x15, 0x23, 0x15, 0x21, 0x15, 0x21, 0x35, 0x06, 0x07, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x35, 0x21, 0x15, 0x21, 0x00, 0x16, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x02, 0xed, 0xeb, 0xeb, 0x01, 0x09, 0xfe, 0x6b, 0x50, 0x93, 0x5f, 0x9f, 0x5d, 0x5d, 0x9f, 0x5e, 0x47, 0x74, 0x29, 0x01, 0x95, 0xfe, 0xf7, 0xfd, 0xc6, 0x36, 0x61, 0x3f, 0x3f, 0x60, 0x36, 0x36, 0x60, 0x3f, 0x3f, 0x61, 0x36, 0x01, 0x97, 0x6b, 0xbd, 0x6f, 0x5d, 0x63, 0x02, 0x5c, 0xa3, 0x67, 0x67, 0xa3, 0x5c, 0x32, 0x31, 0x59, 0x6e, 0xfe, 0xcd, 0x68, 0x39, 0x39, 0x68, 0x45, 0x45, 0x68, 0x38, 0x38, 0x68, 0x45, 0x00, 0x03, 0x00, 0x21, 0xff, 0xf7, 0x03, 0xf5, 0x02, 0x33, 0x00, 0x23, 0x00, 0x2a, 0x00, 0x39, 0x00, 0x00, 0x00, 0x07, 0x21, 0x16, 0x16, 0x33, 0x32, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x06, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x03, 0xf5, 0x04, 0xfe, 0x6b, 0x04, 0x47, 0x37, 0x4e, 0x21, 0x97, 0x18, 0x89, 0x63, 0x41, 0x69, 0x24, 0x25, 0x71, 0x41, 0x50, 0x81, 0x49, 0x4b, 0x83, 0x50, 0x40, 0x6e, 0x26, 0x23, 0x6c, 0x42, 0x4f, 0x7d, 0x45, 0x91, 0x01, 0x4b, 0x38, 0x35, 0x48, 0x06, 0xfc, 0x43, 0x28, 0x28, 0x41, 0x27, 0x26, 0x3f, 0x27, 0x50, 0x3b, 0x01, 0x06, 0x18, 0x3f, 0x44, 0x43, 0x50, 0x67, 0x35, 0x31, 0x31, 0x35, 0x47, 0x82, 0x55, 0x55, 0x82, 0x47, 0x34, 0x30, 0x30, 0x34, 0x44, 0x7c, 0x51, 0x1e, 0x3b, 0x45, 0x44, 0x3c, 0xd1, 0x26, 0x4b, 0x35, 0x35, 0x4b, 0x26, 0x26, 0x4b, 0x35, 0x4f, 0x57, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x4f, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xc5, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xbb, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0x7b, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xe5, 0x00, 0x00, 0x00, 0x02, 0x03, 0x06, 0x76, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x45, 0xfe, 0xdf, 0x02, 0x4f, 0x02, 0xba, 0x00, 0x0e, 0x00, 0x17, 0x00, 0x23, 0x00, 0x00, 0x21, 0x23, 0x03, 0x23, 0x11, 0x23, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x27, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x13, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x02, 0x4f, 0xa2, 0x9a, 0x42, 0x8c, 0x01, 0x06, 0x51, 0x72, 0x39, 0x50, 0x4f, 0xd7, 0x75, 0x39, 0x38, 0x38, 0x39, 0x75, 0xab, 0x10, 0x3f, 0x3e, 0x32, 0x39, 0x01, 0x10, 0xfe, 0xf0, 0x02, 0xba, 0x39, 0x61, 0x3c, 0x45, 0x6f, 0x15, 0x5e, 0x37, 0x31, 0x30, 0x35, 0xfd, 0x8f, 0x3a, 0x32, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x45, 0xfe, 0xdf, 0x01, 0x7b, 0x02, 0x32, 0x00, 0x0c, 0x00, 0x18, 0x00, 0x00, 0x12, 0x36, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x11, 0x23, 0x11, 0x33, 0x15, 0x03, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0xec, 0x57, 0x38, 0x25, 0x42, 0x43, 0x8c, 0x8c, 0x0f, 0x10, 0x3f, 0x3d, 0x31, 0x39, 0x02, 0x00, 0x32, 0x93, 0x3e, 0x4d, 0xfe, 0xec, 0x02, 0x2a, 0x56, 0xfe, 0x01, 0x35, 0x37, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x02, 0x4f, 0x03, 0x99, 0x00, 0x22, 0x02, 0xc5, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0xa0, 0x00, 0x91, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0x8e, 0x03, 0x08, 0x00, 0x22, 0x02, 0xe5, 0x00, 0x00, 0x00, 0x02, 0x03, 0xc8, 0x5b, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x33, 0xff, 0xf9, 0x02, 0x2d, 0x03, 0xc4, 0x00, 0x22, 0x02, 0xc6, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0xab, 0x00, 0x98, 0xff, 0xff, 0x00, 0x27, 0xff, 0xf7, 0x01, 0xf3, 0x03, 0x33, 0x00, 0x22, 0x02, 0xe6, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x90, 0x00, 0x07, 0x00, 0x01, 0x00, 0x33, 0xfe, 0xf1, 0x02, 0x2d, 0x02, 0xc4, 0x00, 0x3d, 0x00, 0x00, 0x24, 0x06, 0x06, 0x07, 0x15, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x1e, 0x02, 0x15, 0x02, 0x2d, 0x2f, 0x5b, 0x3f, 0x37, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x60, 0x78, 0x01, 0x96, 0x03, 0x37, 0x30, 0x31, 0x38, 0x26, 0x39, 0x32, 0x44, 0x55, 0x3d, 0x3e, 0x70, 0x48, 0x6c, 0x87, 0x07, 0x9a, 0x02, 0x39, 0x2f, 0x29, 0x31, 0x25, 0x37, 0x32, 0x44, 0x56, 0x3e, 0x98, 0x58, 0x3c, 0x08, 0x2e, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x79, 0x0b, 0x6c, 0x57, 0x2b, 0x32, 0x2f, 0x26, 0x1f, 0x28, 0x17, 0x0e, 0x14, 0x27, 0x4f, 0x42, 0x3e, 0x5c, 0x31, 0x69, 0x5e, 0x24, 0x2f, 0x2a, 0x28, 0x1c, 0x25, 0x17, 0x0f, 0x14, 0x28, 0x50, 0x41, 0x00, 0x01, 0x00, 0x27, 0xfe, 0xf6, 0x01, 0xf3, 0x02, 0x33, 0x00, 0x3a, 0x00, 0x00, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x1e, 0x02, 0x17, 0x14, 0x06, 0x07, 0x15, 0x01, 0x7c, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x56, 0x6c, 0x04, 0x8d, 0x04, 0x37, 0x29, 0x28, 0x2d, 0x37, 0x3c, 0x3e, 0x4f, 0x39, 0x35, 0x63, 0x43, 0x63, 0x76, 0x06, 0x86, 0x03, 0x31, 0x29, 0x26, 0x29, 0x38, 0x3b, 0x3c, 0x4e, 0x39, 0x01, 0x5d, 0x51, 0x2d, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x73, 0x0b, 0x64, 0x46, 0x20, 0x2a, 0x20, 0x19, 0x1b, 0x1b, 0x10, 0x0f, 0x20, 0x42, 0x38, 0x2e, 0x4c, 0x2c, 0x63, 0x54, 0x21, 0x27, 0x1c, 0x19, 0x1c, 0x1d, 0x0f, 0x0f, 0x20, 0x43, 0x37, 0x40, 0x5a, 0x0a, 0x27, 0xff, 0xff, 0x00, 0x33, 0xff, 0xf9, 0x02, 0x2d, 0x03, 0xa0, 0x00, 0x22, 0x02, 0xc6, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0x90, 0x00, 0x98, 0xff, 0xff, 0x00, 0x27, 0xff, 0xf7, 0x01, 0xf3, 0x03, 0x0f, 0x00, 0x22, 0x02, 0xe6, 0x00, 0x00, 0x00, 0x06, 0x03, 0xc8, 0x74, 0x07, 0x00, 0x00, 0x00, 0x01, 0x00, 0x20, 0xfe, 0xf6, 0x02, 0x20, 0x02, 0xba, 0x00, 0x1a, 0x00, 0x00, 0x21, 0x15, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x23, 0x11, 0x23, 0x35, 0x21, 0x15, 0x23, 0x11, 0x01, 0x4f, 0x37, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x1d, 0xba, 0x02, 0x00, 0xba, 0x2d, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x79, 0x02, 0x49, 0x71, 0x71, 0xfd, 0xb7, 0x00, 0x01, 0x00, 0x19, 0xfe, 0xf8, 0x01, 0x7b, 0x02, 0xb3, 0x00, 0x26, 0x00, 0x00, 0x04, 0x16, 0x15, 0x14, 0x06, 0x23, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x26, 0x35, 0x11, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x15, 0x23, 0x11, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x27, 0x15, 0x01, 0x30, 0x4b, 0x4d, 0x38, 0x8e, 0x77, 0x18, 0x19, 0x19, 0x18, 0x3e, 0x46, 0x42, 0x42, 0x8d, 0x7c, 0x7c, 0x1b, 0x20, 0x41, 0x58, 0x0d, 0x06, 0x2b, 0x38, 0x35, 0x36, 0x3a, 0x52, 0x0e, 0x12, 0x12, 0x0d, 0x8e, 0x28, 0x6d, 0x01, 0x0b, 0x73, 0x89, 0x89, 0x73, 0xfe, 0xf4, 0x1c, 0x19, 0x76, 0x01, 0x2c, 0x00, 0xff, 0xff, 0x00, 0x20, 0x00, 0x00, 0x02, 0x20, 0x03, 0x99, 0x00, 0x22, 0x02, 0xc7, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0x81, 0x00, 0x91, 0x00, 0x02, 0x00, 0x19, 0x00, 0x00, 0x01, 0xac, 0x03, 0x2a, 0x00, 0x0c, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x03, 0x33, 0x15, 0x23, 0x11, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x35, 0x11, 0x23, 0x35, 0x33, 0x35, 0x33, 0x01, 0xa4, 0x08, 0x3f, 0x3f, 0x33, 0x3a, 0x74, 0xb3, 0x7c, 0x7c, 0x1b, 0x20, 0x41, 0x58, 0xb1, 0x42, 0x42, 0x8d, 0x03, 0x0a, 0x2b, 0x17, 0x39, 0x3c, 0x39, 0x21, 0x10, 0x6d, 0xff, 0x00, 0x73, 0xfe, 0xf4, 0x1c, 0x19, 0x76, 0xac, 0x01, 0x0b, 0x73, 0x89, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0x73, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0xa1, 0x00, 0x91, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x02, 0xe2, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0xce, 0x00, 0x8f, 0x00, 0x00, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0x6d, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0x01, 0x00, 0x94, 0x00, 0x91, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x02, 0xdc, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0x01, 0x00, 0x82, 0x00, 0x00, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0x96, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xca, 0x00, 0xb3, 0x00, 0x91, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x05, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0xca, 0x00, 0xa2, 0x00, 0x00, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0xd1, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcc, 0x00, 0xe0, 0x00, 0x91, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x40, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcc, 0x00, 0xce, 0x00, 0x00, 0xff, 0xff, 0x00, 0x43, 0xff, 0xf9, 0x02, 0x77, 0x03, 0xa6, 0x00, 0x22, 0x02, 0xc8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcf, 0x00, 0xc3, 0x00, 0x91, 0xff, 0xff, 0x00, 0x40, 0xff, 0xf9, 0x02, 0x50, 0x03, 0x15, 0x00, 0x22, 0x02, 0xe8, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcf, 0x00, 0xb1, 0x00, 0x00, 0x00, 0x01, 0x00, 0x43, 0xff, 0x2b, 0x02, 0x77, 0x02, 0xba, 0x00, 0x23, 0x00, 0x00, 0x01, 0x11, 0x14, 0x06, 0x07, 0x15, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x26, 0x26, 0x35, 0x11, 0x33, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x02, 0x77, 0x72, 0x5c, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0x20, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x3a, 0x5a, 0x6d, 0x8c, 0x4a, 0x43, 0x44, 0x4a, 0x02, 0xba, 0xfe, 0x51, 0x6d, 0x87, 0x15, 0x01, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x3b, 0x2d, 0x15, 0x87, 0x6d, 0x01, 0xaf, 0xfe, 0x50, 0x47, 0x4b, 0x4b, 0x47, 0x01, 0xb0, 0x00, 0x00, 0x01, 0x00, 0x40, 0xff, 0x29, 0x02, 0x5c, 0x02, 0x2a, 0x00, 0x24, 0x00, 0x00, 0x04, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x37, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x11, 0x33, 0x11, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x11, 0x33, 0x11, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x35, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x4c, 0x1b, 0x57, 0x33, 0x41, 0x64, 0x39, 0x8c, 0x42, 0x39, 0x3a, 0x42, 0x8d, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0x83, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x44, 0x30, 0x3a, 0x24, 0x29, 0x37, 0x6b, 0x4a, 0x01, 0x45, 0xfe, 0xcf, 0x42, 0x47, 0x47, 0x42, 0x01, 0x31, 0xfd, 0xd5, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0xff, 0xff, 0x00, 0x16, 0xff, 0xff, 0x03, 0xea, 0x03, 0x9d, 0x00, 0x22, 0x02, 0xca, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x01, 0x5e, 0x00, 0x95, 0xff, 0xff, 0x00, 0x07, 0x00, 0x00, 0x03, 0x45, 0x03, 0x08, 0x00, 0x22, 0x02, 0xea, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc7, 0x01, 0x08, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x03, 0x99, 0x00, 0x22, 0x02, 0xcc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc7, 0x00, 0xa0, 0x00, 0x91, 0xff, 0xff, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x03, 0x08, 0x00, 0x22, 0x02, 0xec, 0x00, 0x00, 0x00, 0x03, 0x03, 0xc7, 0x00, 0x90, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x03, 0x82, 0x00, 0x22, 0x02, 0xcc, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x00, 0x95, 0x00, 0x91, 0xff, 0xff, 0x00, 0x32, 0x00, 0x00, 0x02, 0x0e, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xcd, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x00, 0x9d, 0x00, 0x91, 0xff, 0xff, 0x00, 0x26, 0x00, 0x00, 0x01, 0xbc, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xed, 0x00, 0x00, 0x00, 0x02, 0x03, 0x06, 0x70, 0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x32, 0x00, 0x00, 0x02, 0x0e, 0x03, 0x82, 0x00, 0x22, 0x02, 0xcd, 0x00, 0x00, 0x00, 0x07, 0x03, 0xcb, 0x00, 0xd3, 0x00, 0x91, 0xff, 0xff, 0x00, 0x26, 0x00, 0x00, 0x01, 0xbc, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xed, 0x00, 0x00, 0x00, 0x03, 0x03, 0xcb, 0x00, 0xa7, 0x00, 0x00, 0xff, 0xff, 0x00, 0x32, 0x00, 0x00, 0x02, 0x0e, 0x03, 0x99, 0x00, 0x22, 0x02, 0xcd, 0x00, 0x00, 0x00, 0x07, 0x03, 0xc8, 0x00, 0x81, 0x00, 0x91, 0xff, 0xff, 0x00, 0x26, 0x00, 0x00, 0x01, 0xbc, 0x03, 0x08, 0x00, 0x22, 0x02, 0xed, 0x00, 0x00, 0x00, 0x02, 0x03, 0xc8, 0x55, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x36, 0xff, 0xf9, 0x02, 0xdb, 0x02, 0xc6, 0x00, 0x18, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x36, 0x36, 0x33, 0x12, 0x36, 0x37, 0x21, 0x16, 0x16, 0x33, 0x01, 0xea, 0x9b, 0x56, 0x55, 0x9a, 0x65, 0x64, 0x99, 0x54, 0x04, 0x02, 0x0b, 0x05, 0x69, 0x50, 0x3d, 0x5a, 0x14, 0x9c, 0x21, 0xad, 0x78, 0x4d, 0x6b, 0x07, 0xfe, 0x82, 0x03, 0x6a, 0x52, 0x02, 0xc6, 0x5a, 0xa3, 0x6a, 0x6a, 0xa2, 0x5a, 0x50, 0x98, 0x69, 0x24, 0x1d, 0x56, 0x66, 0x37, 0x31, 0x69, 0x7e, 0xfd, 0xb3, 0x58, 0x4c, 0x4a, 0x5a, 0x00, 0x01, 0xff, 0xc5, 0xff, 0x10, 0x01, 0x4d, 0x03, 0x09, 0x00, 0x19, 0x00, 0x00, 0x00, 0x06, 0x07, 0x07, 0x33, 0x07, 0x23, 0x03, 0x06, 0x06, 0x23, 0x23, 0x37, 0x33, 0x32, 0x36, 0x37, 0x13, 0x23, 0x37, 0x33, 0x37, 0x36, 0x36, 0x33, 0x07, 0x01, 0x13, 0x2a, 0x04, 0x03, 0x5b, 0x0b, 0x5d, 0x36, 0x09, 0x63, 0x56, 0x18, 0x0c, 0x15, 0x14, 0x16, 0x03, 0x36, 0x3c, 0x0c, 0x3c, 0x03, 0x0b, 0x76, 0x74, 0x0c, 0x02, 0x93, 0x22, 0x28, 0x1f, 0x73, 0xfe, 0x01, 0x5b, 0x4d, 0x76, 0x18, 0x1a, 0x01, 0xff, 0x73, 0x1f, 0x64, 0x5c, 0x76, 0x00, 0xff, 0xff, 0x00, 0x09, 0x00, 0x00, 0x03, 0x6f, 0x03, 0xbe, 0x00, 0x22, 0x03, 0x18, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x01, 0x97, 0x00, 0x92, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x04, 0x15, 0x03, 0x2c, 0x00, 0x22, 0x03, 0x38, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x01, 0xc9, 0x00, 0x00, 0x00, 0x02, 0x00, 0x33, 0xfe, 0xdf, 0x02, 0x2d, 0x02, 0xc4, 0x00, 0x2c, 0x00, 0x38, 0x00, 0x00, 0x16, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x16, 0x17, 0x1e, 0x02, 0x15, 0x14, 0x06, 0x06, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xed, 0x75, 0x44, 0x01, 0x96, 0x03, 0x37, 0x30, 0x31, 0x38, 0x26, 0x39, 0x32, 0x44, 0x55, 0x3d, 0x3e, 0x70, 0x48, 0x6c, 0x87, 0x07, 0x9a, 0x02, 0x39, 0x2f, 0x29, 0x31, 0x25, 0x37, 0x32, 0x44, 0x56, 0x3e, 0x3a, 0x70, 0x4d, 0x4b, 0x40, 0x3e, 0x32, 0x39, 0x74, 0x07, 0x32, 0x5e, 0x40, 0x2b, 0x32, 0x2f, 0x26, 0x1f, 0x28, 0x17, 0x0e, 0x14, 0x27, 0x4f, 0x42, 0x3e, 0x5c, 0x31, 0x69, 0x5e, 0x24, 0x2f, 0x2a, 0x28, 0x1c, 0x25, 0x17, 0x0f, 0x14, 0x28, 0x50, 0x41, 0x38, 0x60, 0x39, 0x5d, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x02, 0x00, 0x27, 0xfe, 0xdf, 0x01, 0xf3, 0x02, 0x33, 0x00, 0x2a, 0x00, 0x36, 0x00, 0x00, 0x16, 0x26, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x27, 0x2e, 0x02, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x1e, 0x02, 0x17, 0x14, 0x06, 0x06, 0x23, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xd5, 0x6c, 0x3f, 0x03, 0x8d, 0x04, 0x37, 0x29, 0x28, 0x2d, 0x37, 0x3c, 0x3e, 0x4f, 0x39, 0x35, 0x63, 0x43, 0x63, 0x76, 0x06, 0x86, 0x03, 0x31, 0x29, 0x26, 0x29, 0x38, 0x3b, 0x3c, 0x4e, 0x39, 0x01, 0x35, 0x63, 0x42, 0x3f, 0x3f, 0x3e, 0x32, 0x39, 0x74, 0x09, 0x31, 0x54, 0x33, 0x20, 0x2a, 0x20, 0x19, 0x1b, 0x1b, 0x10, 0x0f, 0x20, 0x42, 0x38, 0x2e, 0x4c, 0x2c, 0x63, 0x54, 0x21, 0x27, 0x1c, 0x19, 0x1c, 0x1d, 0x0f, 0x0f, 0x20, 0x43, 0x37, 0x30, 0x4c, 0x2b, 0x5c, 0x32, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x20, 0xfe, 0xdf, 0x02, 0x20, 0x02, 0xba, 0x00, 0x07, 0x00, 0x13, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x00, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x02, 0x20, 0xba, 0x8c, 0xba, 0x01, 0x48, 0x3f, 0x3e, 0x33, 0x3a, 0x74, 0x02, 0xba, 0x71, 0xfd, 0xb7, 0x02, 0x49, 0x71, 0xfc, 0xe1, 0x32, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x19, 0xfe, 0xdf, 0x01, 0x64, 0x02, 0xb3, 0x00, 0x12, 0x00, 0x1e, 0x00, 0x00, 0x13, 0x11, 0x14, 0x16, 0x33, 0x33, 0x15, 0x23, 0x22, 0x35, 0x11, 0x23, 0x35, 0x33, 0x35, 0x33, 0x15, 0x33, 0x15, 0x03, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0xe8, 0x1b, 0x20, 0x41, 0x58, 0xb1, 0x42, 0x42, 0x8d, 0x7c, 0x68, 0x11, 0x40, 0x3e, 0x32, 0x39, 0x01, 0xb7, 0xfe, 0xf4, 0x1c, 0x19, 0x76, 0xac, 0x01, 0x0b, 0x73, 0x89, 0x89, 0x73, 0xfe, 0x1e, 0x39, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0x33, 0x00, 0x17, 0x00, 0x1e, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x37, 0x21, 0x26, 0x26, 0x23, 0x22, 0x07, 0x23, 0x36, 0x36, 0x33, 0x12, 0x36, 0x37, 0x21, 0x16, 0x16, 0x33, 0x01, 0x82, 0x7f, 0x47, 0x46, 0x7e, 0x52, 0x4f, 0x7d, 0x45, 0x04, 0x01, 0x95, 0x05, 0x4a, 0x36, 0x4e, 0x21, 0x97, 0x18, 0x88, 0x63, 0x38, 0x47, 0x08, 0xfe, 0xf9, 0x01, 0x4c, 0x37, 0x02, 0x33, 0x47, 0x82, 0x55, 0x56, 0x82, 0x46, 0x44, 0x7d, 0x51, 0x1e, 0x18, 0x3c, 0x44, 0x43, 0x50, 0x67, 0xfe, 0x37, 0x3f, 0x38, 0x36, 0x41, 0x00, 0xff, 0xff, 0x00, 0x28, 0x01, 0xbe, 0x00, 0xf4, 0x02, 0xba, 0x00, 0x02, 0x03, 0xe0, 0x00, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x51, 0x01, 0x33, 0x03, 0x08, 0x00, 0x05, 0x00, 0x00, 0x13, 0x07, 0x35, 0x37, 0x17, 0x15, 0x9f, 0x95, 0x95, 0x94, 0x02, 0xa5, 0x54, 0x66, 0x51, 0x51, 0x66, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x51, 0x01, 0x33, 0x03, 0x08, 0x00, 0x05, 0x00, 0x00, 0x01, 0x07, 0x27, 0x35, 0x17, 0x37, 0x01, 0x33, 0x94, 0x95, 0x95, 0x94, 0x02, 0xa2, 0x51, 0x51, 0x66, 0x56, 0x56, 0x00, 0xff, 0xff, 0x00, 0x0a, 0x02, 0x78, 0x01, 0x88, 0x02, 0xdc, 0x00, 0x02, 0x03, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x56, 0x01, 0x49, 0x03, 0x05, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x06, 0x23, 0x22, 0x26, 0x35, 0x35, 0x33, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x15, 0x01, 0x49, 0x56, 0x4a, 0x48, 0x57, 0x4a, 0x26, 0x2f, 0x2f, 0x26, 0x4b, 0x02, 0xa8, 0x52, 0x53, 0x48, 0x14, 0x22, 0x23, 0x23, 0x22, 0x15, 0x00, 0x00, 0x01, 0x00, 0x0a, 0x02, 0x6c, 0x00, 0x8f, 0x02, 0xf1, 0x00, 0x0b, 0x00, 0x00, 0x12, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x30, 0x26, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x02, 0x6c, 0x26, 0x1c, 0x1c, 0x27, 0x27, 0x1c, 0x1c, 0x26, 0x00, 0x02, 0x00, 0x08, 0x02, 0x5a, 0x00, 0xf2, 0x03, 0x40, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0xf2, 0x43, 0x32, 0x31, 0x44, 0x44, 0x31, 0x32, 0x43, 0x45, 0x1c, 0x14, 0x14, 0x1c, 0x1c, 0x14, 0x14, 0x1c, 0x02, 0x99, 0x3f, 0x3f, 0x34, 0x34, 0x3f, 0x3f, 0x34, 0x17, 0x1b, 0x1b, 0x17, 0x15, 0x1d, 0x1d, 0x15, 0x00, 0x00, 0x01, 0x00, 0x0c, 0xff, 0x2a, 0x00, 0xf1, 0x00, 0x43, 0x00, 0x13, 0x00, 0x00, 0x33, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x37, 0xe5, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0x20, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x41, 0x4f, 0x28, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x2c, 0x4a, 0x22, 0x12, 0x00, 0x01, 0x00, 0x08, 0x02, 0x5e, 0x01, 0x75, 0x02, 0xe2, 0x00, 0x15, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x17, 0x16, 0x33, 0x32, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x26, 0x23, 0x22, 0x07, 0x23, 0x11, 0x41, 0x32, 0x15, 0x20, 0x14, 0x1e, 0x14, 0x25, 0x06, 0x4b, 0x09, 0x41, 0x32, 0x15, 0x20, 0x14, 0x1d, 0x15, 0x25, 0x07, 0x4a, 0x02, 0xa1, 0x41, 0x0d, 0x0c, 0x13, 0x2b, 0x42, 0x41, 0x0d, 0x0c, 0x14, 0x2c, 0x00, 0x00, 0x02, 0x00, 0x0a, 0x02, 0x59, 0x01, 0x7f, 0x03, 0x15, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x23, 0x37, 0x33, 0x17, 0x23, 0x37, 0x33, 0x62, 0x58, 0x48, 0x74, 0x4c, 0x59, 0x52, 0x74, 0x02, 0x59, 0xbc, 0xbc, 0xbc, 0x00, 0x00, 0x01, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xa6, 0x02, 0x2a, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x02, 0xa6, 0x4a, 0x8c, 0xe0, 0x8d, 0x49, 0x02, 0x2a, 0x6c, 0xfe, 0x42, 0x01, 0xbe, 0xfe, 0x42, 0x01, 0xbe, 0x6c, 0x00, 0xff, 0xff, 0x00, 0x16, 0xff, 0xff, 0x03, 0xea, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xca, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x01, 0x65, 0x00, 0x91, 0xff, 0xff, 0x00, 0x07, 0x00, 0x00, 0x03, 0x45, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xea, 0x00, 0x00, 0x00, 0x03, 0x02, 0xd3, 0x01, 0x04, 0x00, 0x00, 0xff, 0xff, 0x00, 0x16, 0xff, 0xff, 0x03, 0xea, 0x03, 0xc1, 0x00, 0x22, 0x02, 0xca, 0x00, 0x00, 0x00, 0x07, 0x03, 0x06, 0x01, 0xa9, 0x00, 0x95, 0xff, 0xff, 0x00, 0x07, 0x00, 0x00, 0x03, 0x45, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xea, 0x00, 0x00, 0x00, 0x03, 0x03, 0x06, 0x01, 0x52, 0x00, 0x00, 0xff, 0xff, 0x00, 0x16, 0xff, 0xff, 0x03, 0xea, 0x03, 0x83, 0x00, 0x22, 0x02, 0xca, 0x00, 0x00, 0x00, 0x07, 0x02, 0xfa, 0x01, 0x54, 0x00, 0x92, 0xff, 0xff, 0x00, 0x07, 0x00, 0x00, 0x03, 0x45, 0x02, 0xf1, 0x00, 0x22, 0x02, 0xea, 0x00, 0x00, 0x00, 0x03, 0x02, 0xfa, 0x00, 0xfe, 0x00, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x01, 0xda, 0x03, 0x73, 0x00, 0x22, 0x02, 0xb8, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0x4f, 0x00, 0x91, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf7, 0x02, 0x48, 0x02, 0xe4, 0x00, 0x22, 0x02, 0xd8, 0x00, 0x00, 0x00, 0x06, 0x03, 0xce, 0x79, 0x02, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x03, 0xbd, 0x00, 0x22, 0x02, 0xcc, 0x00, 0x00, 0x00, 0x07, 0x02, 0xd3, 0x00, 0xbb, 0x00, 0x91, 0xff, 0xff, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x03, 0x2c, 0x00, 0x22, 0x02, 0xec, 0x00, 0x00, 0x00, 0x03, 0x02, 0xd3, 0x00, 0xac, 0x00, 0x00, 0xff, 0xff, 0x00, 0x0b, 0x00, 0x00, 0x02, 0x70, 0x03, 0x73, 0x00, 0x22, 0x02, 0xcc, 0x00, 0x00, 0x00, 0x07, 0x03, 0xce, 0x00, 0x82, 0x00, 0x91, 0xff, 0xff, 0x00, 0x05, 0xfe, 0xfa, 0x02, 0x57, 0x02, 0xe2, 0x00, 0x22, 0x02, 0xec, 0x00, 0x00, 0x00, 0x02, 0x03, 0xce, 0x73, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x4f, 0x01, 0x2a, 0x02, 0x6f, 0x01, 0xa0, 0x00, 0x03, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x02, 0x6f, 0xfd, 0xe0, 0x01, 0xa0, 0x76, 0x76, 0x00, 0x01, 0x00, 0x4f, 0x01, 0x2a, 0x03, 0x50, 0x01, 0xa0, 0x00, 0x03, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x03, 0x50, 0xfc, 0xff, 0x01, 0xa0, 0x76, 0x76, 0x00, 0x01, 0x00, 0x1f, 0x01, 0xbe, 0x00, 0xec, 0x02, 0xba, 0x00, 0x03, 0x00, 0x00, 0x13, 0x23, 0x37, 0x33, 0xb3, 0x94, 0x6c, 0x61, 0x01, 0xbe, 0xfc, 0x00, 0x00, 0x01, 0x00, 0x28, 0x01, 0xbe, 0x00, 0xf4, 0x02, 0xba, 0x00, 0x03, 0x00, 0x00, 0x13, 0x33, 0x07, 0x23, 0x61, 0x93, 0x6c, 0x60, 0x02, 0xba, 0xfc, 0x00, 0x00, 0x01, 0x00, 0x0e, 0xff, 0x98, 0x00, 0xdb, 0x00, 0x94, 0x00, 0x03, 0x00, 0x00, 0x37, 0x33, 0x07, 0x23, 0x47, 0x94, 0x6c, 0x61, 0x94, 0xfc, 0x00, 0x02, 0x00, 0x1f, 0x01, 0xbe, 0x01, 0xb6, 0x02, 0xba, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x23, 0x37, 0x33, 0x17, 0x23, 0x37, 0x33, 0xb3, 0x94, 0x6c, 0x61, 0x91, 0x94, 0x6c, 0x61, 0x01, 0xbe, 0xfc, 0xfc, 0xfc, 0x00, 0x00, 0x02, 0x00, 0x28, 0x01, 0xbe, 0x01, 0xbe, 0x02, 0xba, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x33, 0x07, 0x23, 0x25, 0x33, 0x07, 0x23, 0x61, 0x93, 0x6c, 0x60, 0x01, 0x03, 0x93, 0x6c, 0x60, 0x02, 0xba, 0xfc, 0xfc, 0xfc, 0x00, 0x02, 0x00, 0x0f, 0xff, 0x98, 0x01, 0xa6, 0x00, 0x94, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x37, 0x33, 0x07, 0x23, 0x25, 0x33, 0x07, 0x23, 0x48, 0x93, 0x6c, 0x60, 0x01, 0x03, 0x94, 0x6c, 0x61, 0x94, 0xfc, 0xfc, 0xfc, 0x00, 0x00, 0x01, 0x00, 0x31, 0xfe, 0xf8, 0x02, 0x37, 0x03, 0x12, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x27, 0x13, 0x23, 0x13, 0x07, 0x35, 0x17, 0x27, 0x33, 0x07, 0x37, 0x02, 0x37, 0xcb, 0x0e, 0x8c, 0x0e, 0xcb, 0xcb, 0x0e, 0x8c, 0x0e, 0xcb, 0x01, 0xbe, 0x0c, 0xfd, 0x2e, 0x02, 0xd2, 0x0c, 0x6c, 0x0b, 0xf3, 0xf3, 0x0b, 0x00, 0x00, 0x01, 0x00, 0x32, 0xfe, 0xf8, 0x02, 0x37, 0x03, 0x12, 0x00, 0x13, 0x00, 0x00, 0x01, 0x11, 0x37, 0x15, 0x27, 0x17, 0x23, 0x37, 0x07, 0x35, 0x17, 0x11, 0x07, 0x35, 0x17, 0x27, 0x33, 0x07, 0x37, 0x15, 0x01, 0x6c, 0xcb, 0xcb, 0x0e, 0x8c, 0x0e, 0xca, 0xca, 0xca, 0xca, 0x0e, 0x8c, 0x0e, 0xcb, 0x01, 0xca, 0xfe, 0x77, 0x0b, 0x6c, 0x0c, 0xf4, 0xf4, 0x0c, 0x6c, 0x0b, 0x01, 0x89, 0x0c, 0x6c, 0x0b, 0xf3, 0xf3, 0x0b, 0x6c, 0x00, 0x01, 0x00, 0x64, 0x00, 0xc2, 0x01, 0x7c, 0x01, 0xd9, 0x00, 0x0f, 0x00, 0x00, 0x36, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0xc9, 0x40, 0x25, 0x25, 0x40, 0x26, 0x27, 0x41, 0x25, 0x25, 0x41, 0x27, 0xc2, 0x25, 0x40, 0x26, 0x27, 0x40, 0x25, 0x25, 0x40, 0x27, 0x26, 0x40, 0x25, 0x00, 0xff, 0xff, 0x00, 0x2c, 0xff, 0xf9, 0x02, 0x8f, 0x00, 0x9d, 0x00, 0x23, 0x02, 0xa1, 0x00, 0xdb, 0x00, 0x00, 0x00, 0x23, 0x02, 0xa1, 0x01, 0xb7, 0x00, 0x00, 0x00, 0x02, 0x02, 0xa1, 0x00, 0x00, 0x00, 0x07, 0x00, 0x24, 0xff, 0xf6, 0x04, 0x39, 0x02, 0xc6, 0x00, 0x0b, 0x00, 0x0f, 0x00, 0x19, 0x00, 0x25, 0x00, 0x31, 0x00, 0x3d, 0x00, 0x49, 0x00, 0x00, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x25, 0x01, 0x23, 0x01, 0x04, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x23, 0x12, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x24, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0x22, 0x26, 0x35, 0x26, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x20, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x24, 0x59, 0x46, 0x46, 0x59, 0x59, 0x46, 0x46, 0x59, 0x02, 0x63, 0xfe, 0x77, 0x88, 0x01, 0x88, 0xfe, 0x8d, 0x1d, 0x1a, 0x1b, 0x1e, 0x39, 0xda, 0x59, 0x46, 0x46, 0x58, 0x58, 0x46, 0x46, 0x59, 0x01, 0x5f, 0x59, 0x46, 0x46, 0x59, 0x59, 0x46, 0x46, 0x59, 0xdb, 0x1e, 0x1e, 0x1a, 0x1a, 0x1e, 0x1e, 0x1a, 0x01, 0x45, 0x1d, 0x1d, 0x1a, 0x1b, 0x1e, 0x1e, 0x1b, 0x02, 0x71, 0x55, 0x55, 0x4b, 0x4b, 0x56, 0x56, 0x4b, 0x96, 0xfd, 0x44, 0x02, 0xbc, 0x4a, 0x4c, 0x27, 0x26, 0x26, 0x27, 0x4c, 0xfe, 0x70, 0x54, 0x54, 0x4b, 0x4c, 0x55, 0x55, 0x4c, 0x4b, 0x54, 0x54, 0x4b, 0x4c, 0x55, 0x55, 0x4c, 0x4c, 0x26, 0x26, 0x27, 0x26, 0x26, 0x27, 0x26, 0x26, 0x26, 0x26, 0x27, 0x26, 0x26, 0x27, 0x26, 0x26, 0x00, 0x01, 0x00, 0x2d, 0x00, 0x78, 0x01, 0x0a, 0x01, 0xd6, 0x00, 0x05, 0x00, 0x00, 0x37, 0x27, 0x37, 0x33, 0x07, 0x17, 0x85, 0x58, 0x58, 0x85, 0x5c, 0x5c, 0x78, 0xaf, 0xaf, 0xaf, 0xaf, 0x00, 0x00, 0x01, 0x00, 0x32, 0x00, 0x78, 0x01, 0x0f, 0x01, 0xd6, 0x00, 0x05, 0x00, 0x00, 0x13, 0x27, 0x33, 0x17, 0x07, 0x23, 0x8d, 0x5b, 0x84, 0x59, 0x59, 0x84, 0x01, 0x27, 0xaf, 0xaf, 0xaf, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00, 0x00, 0x02, 0x32, 0x02, 0xbc, 0x00, 0x03, 0x00, 0x00, 0x01, 0x01, 0x23, 0x01, 0x02, 0x32, 0xfe, 0x77, 0x89, 0x01, 0x88, 0x02, 0xbc, 0xfd, 0x44, 0x02, 0xbc, 0x00, 0x00, 0x01, 0x00, 0x17, 0xff, 0xfa, 0x03, 0x03, 0x02, 0xc3, 0x00, 0x2d, 0x00, 0x00, 0x24, 0x36, 0x37, 0x33, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x23, 0x35, 0x33, 0x26, 0x35, 0x34, 0x37, 0x23, 0x35, 0x33, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x23, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x33, 0x15, 0x23, 0x06, 0x15, 0x14, 0x17, 0x33, 0x15, 0x23, 0x16, 0x16, 0x33, 0x01, 0xf4, 0x56, 0x19, 0xa0, 0x23, 0xaf, 0x75, 0x78, 0xb5, 0x23, 0x55, 0x45, 0x02, 0x02, 0x45, 0x56, 0x23, 0xb5, 0x77, 0x75, 0xaf, 0x23, 0xa0, 0x19, 0x56, 0x39, 0x3d, 0x5f, 0x1a, 0xc0, 0xd9, 0x02, 0x02, 0xd9, 0xc1, 0x1a, 0x60, 0x3d, 0x7a, 0x32, 0x30, 0x6b, 0x77, 0x81, 0x6c, 0x53, 0x18, 0x0c, 0x0e, 0x18, 0x53, 0x6c, 0x80, 0x78, 0x6a, 0x30, 0x31, 0x38, 0x33, 0x53, 0x18, 0x0e, 0x0c, 0x18, 0x53, 0x33, 0x3a, 0x00, 0x01, 0x00, 0x0b, 0xff, 0xf4, 0x02, 0xec, 0x02, 0xc0, 0x00, 0x1e, 0x00, 0x00, 0x01, 0x14, 0x06, 0x06, 0x23, 0x22, 0x27, 0x35, 0x07, 0x35, 0x37, 0x35, 0x07, 0x35, 0x37, 0x35, 0x33, 0x15, 0x37, 0x15, 0x07, 0x15, 0x37, 0x15, 0x07, 0x15, 0x16, 0x33, 0x32, 0x36, 0x35, 0x02, 0xec, 0x4c, 0xa4, 0x86, 0x5d, 0x81, 0x8a, 0x8a, 0x8d, 0x8d, 0x8f, 0x96, 0x96, 0x94, 0x94, 0x21, 0x2d, 0x82, 0x65, 0x01, 0xb9, 0x9d, 0xc7, 0x61, 0x1b, 0xe3, 0x1c, 0x5d, 0x1c, 0x48, 0x1d, 0x5a, 0x1e, 0xce, 0xb0, 0x1f, 0x5c, 0x1f, 0x48, 0x1e, 0x5c, 0x1e, 0x91, 0x07, 0xa4, 0x9d, 0x00, 0x02, 0x00, 0x16, 0x00, 0x00, 0x02, 0x6f, 0x02, 0xba, 0x00, 0x18, 0x00, 0x21, 0x00, 0x00, 0x13, 0x15, 0x33, 0x15, 0x23, 0x15, 0x23, 0x35, 0x23, 0x35, 0x33, 0x35, 0x23, 0x35, 0x33, 0x11, 0x21, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x27, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0xfe, 0xb2, 0xb2, 0x8c, 0x5c, 0x5c, 0x5c, 0x5c, 0x01, 0x01, 0x51, 0x72, 0x39, 0x35, 0x71, 0x56, 0x75, 0x72, 0x37, 0x38, 0x38, 0x37, 0x72, 0x01, 0x16, 0x48, 0x6e, 0x60, 0x60, 0x6e, 0x48, 0x6c, 0x01, 0x38, 0x37, 0x60, 0x3b, 0x39, 0x5f, 0x3a, 0x6c, 0x37, 0x2f, 0x2f, 0x37, 0x00, 0xff, 0xff, 0x00, 0x45, 0x00, 0x00, 0x00, 0xd1, 0x02, 0xe4, 0x00, 0x02, 0x02, 0xdf, 0x00, 0x00, 0x00, 0x02, 0x00, 0x19, 0x01, 0x61, 0x03, 0x17, 0x02, 0xc1, 0x00, 0x07, 0x00, 0x14, 0x00, 0x00, 0x13, 0x21, 0x15, 0x23, 0x11, 0x23, 0x13, 0x23, 0x25, 0x11, 0x23, 0x27, 0x07, 0x23, 0x27, 0x15, 0x23, 0x11, 0x33, 0x17, 0x37, 0x19, 0x01, 0x09, 0x50, 0x69, 0x01, 0x51, 0x02, 0xfe, 0x61, 0x02, 0x5b, 0x47, 0x5b, 0x5e, 0x8b, 0x55, 0x5c, 0x02, 0xc1, 0x52, 0xfe, 0xf2, 0x01, 0x0e, 0x52, 0xfe, 0xa0, 0xdd, 0xdd, 0xe5, 0xe5, 0x01, 0x60, 0xe2, 0xe2, 0x00, 0x00, 0x01, 0x00, 0x25, 0x00, 0x00, 0x02, 0xee, 0x02, 0xc4, 0x00, 0x23, 0x00, 0x00, 0x00, 0x06, 0x07, 0x33, 0x15, 0x21, 0x35, 0x36, 0x36, 0x35, 0x34, 0x26, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x17, 0x15, 0x21, 0x35, 0x33, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x02, 0xee, 0x38, 0x3a, 0x6a, 0xfe, 0xf0, 0x3e, 0x4b, 0x36, 0x61, 0x3f, 0x3f, 0x61, 0x35, 0x4a, 0x3f, 0xfe, 0xef, 0x6a, 0x39, 0x38, 0x5f, 0xa2, 0x63, 0x63, 0xa3, 0x5f, 0x01, 0x18, 0x80, 0x2c, 0x6c, 0x70, 0x20, 0x78, 0x51, 0x48, 0x6a, 0x38, 0x38, 0x6a, 0x48, 0x52, 0x78, 0x1f, 0x70, 0x6c, 0x2c, 0x80, 0x4e, 0x67, 0x9f, 0x58, 0x58, 0x9f, 0x67, 0x00, 0x00, 0x02, 0x00, 0x27, 0xff, 0xf9, 0x02, 0xca, 0x02, 0xc4, 0x00, 0x16, 0x00, 0x1e, 0x00, 0x00, 0x04, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x15, 0x15, 0x21, 0x15, 0x16, 0x33, 0x32, 0x36, 0x37, 0x17, 0x03, 0x26, 0x26, 0x23, 0x22, 0x07, 0x15, 0x21, 0x02, 0x27, 0xa6, 0x63, 0x9d, 0x5a, 0x50, 0x98, 0x69, 0x68, 0x9a, 0x50, 0xfe, 0x06, 0x49, 0x68, 0x47, 0x77, 0x3a, 0x34, 0x91, 0x1d, 0x55, 0x32, 0x68, 0x40, 0x01, 0x4c, 0x07, 0x51, 0x9a, 0x6a, 0x6a, 0xaa, 0x62, 0x5b, 0x97, 0x56, 0x3e, 0xad, 0x43, 0x3a, 0x3a, 0x3b, 0x01, 0xb0, 0x1d, 0x1e, 0x43, 0xa2, 0x00, 0x00, 0x02, 0x00, 0x24, 0xff, 0xf8, 0x02, 0x33, 0x02, 0xe4, 0x00, 0x19, 0x00, 0x27, 0x00, 0x00, 0x12, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x26, 0x26, 0x23, 0x22, 0x07, 0x35, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x24, 0x26, 0x23, 0x22, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x36, 0x35, 0x24, 0x4a, 0x7d, 0x4b, 0x24, 0x36, 0x17, 0x0a, 0x46, 0x41, 0x21, 0x27, 0x31, 0x38, 0x78, 0x84, 0x51, 0x8c, 0x58, 0x3e, 0x62, 0x3a, 0x01, 0x76, 0x32, 0x2a, 0x28, 0x40, 0x23, 0x31, 0x29, 0x28, 0x41, 0x24, 0x01, 0x49, 0x92, 0x55, 0x17, 0x19, 0x45, 0x4e, 0x0a, 0x4b, 0x10, 0xb4, 0x98, 0x7e, 0xbd, 0x65, 0x36, 0x70, 0x52, 0x8b, 0x40, 0x35, 0x5d, 0x39, 0x40, 0x41, 0x38, 0x5f, 0x39, 0x00, 0x00, 0x02, 0x00, 0x14, 0x00, 0x00, 0x02, 0xb6, 0x02, 0xbc, 0x00, 0x05, 0x00, 0x08, 0x00, 0x00, 0x01, 0x01, 0x15, 0x21, 0x35, 0x01, 0x03, 0x21, 0x03, 0x01, 0x9f, 0x01, 0x17, 0xfd, 0x5e, 0x01, 0x18, 0x88, 0x01, 0x82, 0xc1, 0x02, 0xbc, 0xfd, 0xb0, 0x6c, 0x6c, 0x02, 0x50, 0xfd, 0xb0, 0x01, 0xb0, 0x00, 0x00, 0x01, 0x00, 0x1a, 0x00, 0x00, 0x02, 0xce, 0x02, 0xbc, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x11, 0x23, 0x11, 0x21, 0x11, 0x23, 0x11, 0x23, 0x35, 0x02, 0xce, 0x4a, 0x8c, 0xfe, 0xf8, 0x8d, 0x49, 0x02, 0xbc, 0x6c, 0xfd, 0xb0, 0x02, 0x50, 0xfd, 0xb0, 0x02, 0x50, 0x6c, 0x00, 0x01, 0x00, 0x28, 0xff, 0xcb, 0x01, 0xd2, 0x02, 0xbc, 0x00, 0x0c, 0x00, 0x00, 0x01, 0x21, 0x17, 0x15, 0x05, 0x21, 0x15, 0x21, 0x35, 0x37, 0x27, 0x35, 0x21, 0x01, 0xd2, 0xfe, 0xd1, 0xfe, 0xfe, 0xff, 0x01, 0x32, 0xfe, 0x56, 0xf5, 0xf5, 0x01, 0xaa, 0x02, 0x50, 0xd0, 0x6c, 0xde, 0x6b, 0xa4, 0xd8, 0xd2, 0xa3, 0x00, 0x01, 0x00, 0x47, 0x01, 0x2a, 0x01, 0xef, 0x01, 0xa0, 0x00, 0x03, 0x00, 0x00, 0x01, 0x15, 0x21, 0x35, 0x01, 0xef, 0xfe, 0x58, 0x01, 0xa0, 0x76, 0x76, 0xff, 0xff, 0x00, 0x25, 0xff, 0x4b, 0x01, 0xbc, 0x03, 0xb3, 0x00, 0x02, 0x02, 0xa2, 0x00, 0x00, 0xff, 0xff, 0x00, 0x33, 0x00, 0xf4, 0x00, 0xdf, 0x01, 0x98, 0x00, 0x02, 0x03, 0x09, 0x00, 0x00, 0x00, 0x01, 0x00, 0x15, 0xff, 0xd6, 0x03, 0x5d, 0x03, 0x7b, 0x00, 0x08, 0x00, 0x00, 0x01, 0x01, 0x23, 0x27, 0x07, 0x27, 0x37, 0x17, 0x01, 0x03, 0x5d, 0xfd, 0xfd, 0x46, 0x8c, 0x4b, 0x28, 0xc5, 0x7d, 0x01, 0xaa, 0x03, 0x7b, 0xfc, 0x5b, 0xf8, 0x2c, 0x43, 0x75, 0xe1, 0x03, 0x02, 0x00, 0x03, 0x00, 0x1c, 0x00, 0xb8, 0x02, 0xc5, 0x01, 0xff, 0x00, 0x19, 0x00, 0x25, 0x00, 0x31, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x17, 0x36, 0x36, 0x33, 0x04, 0x36, 0x37, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x20, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x16, 0x16, 0x33, 0x02, 0x66, 0x5f, 0x2d, 0x4e, 0x2e, 0x36, 0x53, 0x27, 0x1d, 0x55, 0x33, 0x4d, 0x5e, 0x2d, 0x4e, 0x2e, 0x37, 0x52, 0x25, 0x1c, 0x57, 0x34, 0xfe, 0xd1, 0x35, 0x14, 0x1f, 0x2d, 0x19, 0x1d, 0x24, 0x24, 0x1d, 0x01, 0x60, 0x24, 0x23, 0x1e, 0x1d, 0x39, 0x13, 0x1b, 0x30, 0x1e, 0x01, 0xff, 0x57, 0x4c, 0x32, 0x4a, 0x28, 0x30, 0x29, 0x29, 0x30, 0x57, 0x4c, 0x32, 0x4a, 0x28, 0x31, 0x2c, 0x2a, 0x33, 0xe6, 0x20, 0x1b, 0x25, 0x25, 0x23, 0x20, 0x1f, 0x23, 0x23, 0x20, 0x20, 0x22, 0x23, 0x1e, 0x21, 0x23, 0x00, 0x01, 0xff, 0xd2, 0xff, 0x10, 0x01, 0x49, 0x03, 0xa5, 0x00, 0x13, 0x00, 0x00, 0x12, 0x36, 0x33, 0x33, 0x07, 0x23, 0x22, 0x06, 0x07, 0x03, 0x06, 0x06, 0x23, 0x23, 0x37, 0x33, 0x32, 0x36, 0x37, 0x13, 0x7d, 0x63, 0x55, 0x14, 0x0c, 0x10, 0x15, 0x15, 0x03, 0x58, 0x0a, 0x63, 0x56, 0x13, 0x0c, 0x11, 0x14, 0x15, 0x03, 0x59, 0x03, 0x58, 0x4d, 0x76, 0x18, 0x1a, 0xfc, 0xbb, 0x5b, 0x4d, 0x76, 0x18, 0x1a, 0x03, 0x45, 0x00, 0xff, 0xff, 0x00, 0x20, 0x00, 0x98, 0x02, 0x30, 0x02, 0x41, 0x00, 0x26, 0x02, 0xf1, 0x00, 0xb9, 0x00, 0x07, 0x02, 0xf1, 0x00, 0x00, 0x00, 0xa4, 0x00, 0x01, 0x00, 0x60, 0x00, 0x4f, 0x02, 0x81, 0x02, 0x78, 0x00, 0x13, 0x00, 0x00, 0x01, 0x33, 0x15, 0x23, 0x07, 0x21, 0x15, 0x21, 0x07, 0x23, 0x37, 0x23, 0x35, 0x33, 0x37, 0x21, 0x35, 0x21, 0x37, 0x33, 0x02, 0x33, 0x4e, 0xb3, 0x61, 0x01, 0x14, 0xfe, 0x88, 0x4f, 0x5a, 0x4f, 0x4f, 0xb4, 0x61, 0xfe, 0xeb, 0x01, 0x7a, 0x4e, 0x59, 0x02, 0x19, 0x7a, 0x76, 0x7a, 0x60, 0x60, 0x7a, 0x76, 0x7a, 0x5f, 0x00, 0x02, 0x00, 0x45, 0x00, 0x24, 0x01, 0xd3, 0x02, 0x44, 0x00, 0x05, 0x00, 0x09, 0x00, 0x00, 0x13, 0x17, 0x23, 0x27, 0x37, 0x33, 0x01, 0x21, 0x15, 0x21, 0xf9, 0xda, 0xb4, 0xda, 0xda, 0xb4, 0xfe, 0x7d, 0x01, 0x7f, 0xfe, 0x81, 0x01, 0x89, 0xbc, 0xbb, 0xbc, 0xfe, 0x4b, 0x6b, 0x00, 0x02, 0x00, 0x45, 0x00, 0x24, 0x01, 0xd3, 0x02, 0x44, 0x00, 0x05, 0x00, 0x09, 0x00, 0x00, 0x37, 0x37, 0x27, 0x33, 0x17, 0x07, 0x07, 0x21, 0x15, 0x21, 0x45, 0xd9, 0xd9, 0xb3, 0xdb, 0xdb, 0xb0, 0x01, 0x7f, 0xfe, 0x81, 0xcd, 0xbc, 0xbb, 0xbc, 0xbb, 0x3e, 0x6b, 0x00, 0x02, 0x00, 0x1a, 0x00, 0x61, 0x02, 0x17, 0x02, 0x5e, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x01, 0x07, 0x25, 0x25, 0x07, 0x17, 0x37, 0x27, 0x02, 0x17, 0xfe, 0xff, 0x01, 0x00, 0xff, 0x6f, 0x6f, 0x6f, 0x6f, 0x01, 0x60, 0xff, 0xff, 0xfe, 0xfe, 0x70, 0x70, 0x6f, 0x00, 0x02, 0x00, 0x15, 0x00, 0x00, 0x02, 0x36, 0x03, 0x0c, 0x00, 0x13, 0x00, 0x1f, 0x00, 0x00, 0x13, 0x21, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x11, 0x23, 0x35, 0x33, 0x35, 0x34, 0x36, 0x17, 0x15, 0x26, 0x06, 0x15, 0x36, 0x26, 0x35, 0x34, 0x36, 0x33, 0x32, 0x16, 0x15, 0x14, 0x06, 0x23, 0xe2, 0x01, 0x43, 0x8c, 0xb7, 0x8e, 0x3f, 0x3f, 0x72, 0x73, 0x30, 0x27, 0xd8, 0x30, 0x30, 0x25, 0x26, 0x31, 0x31, 0x26, 0x02, 0x2a, 0xfd, 0xd6, 0x01, 0xb7, 0xfe, 0x49, 0x01, 0xb7, 0x73, 0x1c, 0x66, 0x60, 0x03, 0x76, 0x01, 0x24, 0x2f, 0x26, 0x2e, 0x23, 0x23, 0x2e, 0x2e, 0x23, 0x23, 0x2e, 0xff, 0xff, 0x00, 0x15, 0x00, 0x00, 0x02, 0x2a, 0x03, 0x0c, 0x00, 0x22, 0x02, 0xd9, 0x00, 0x00, 0x00, 0x03, 0x02, 0xdf, 0x01, 0x59, 0x00, 0x00, 0x00, 0x02, 0x00, 0x58, 0x00, 0x00, 0x00, 0xef, 0x02, 0xc7, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x03, 0x23, 0x03, 0x13, 0x15, 0x23, 0x35, 0xef, 0x11, 0x76, 0x10, 0x97, 0x97, 0x02, 0xc7, 0xfe, 0x1c, 0x01, 0xe4, 0xfd, 0xd1, 0x98, 0x98, 0x00, 0x01, 0x00, 0x1e, 0xff, 0x64, 0x00, 0xb7, 0x00, 0x76, 0x00, 0x0c, 0x00, 0x00, 0x36, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x33, 0xb7, 0x46, 0x46, 0x1c, 0x1b, 0x44, 0x83, 0x2f, 0x33, 0x49, 0x4f, 0x3d, 0x1e, 0x22, 0x14, 0x81, 0x00, 0x00, 0x01, 0x00, 0x2f, 0x00, 0x00, 0x00, 0xc6, 0x00, 0x98, 0x00, 0x03, 0x00, 0x00, 0x37, 0x15, 0x23, 0x35, 0xc6, 0x97, 0x98, 0x98, 0x98, 0x00, 0x00, 0x02, 0x00, 0x44, 0x00, 0x00, 0x00, 0xdb, 0x02, 0x34, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x15, 0x23, 0x35, 0x13, 0x15, 0x23, 0x35, 0xdb, 0x97, 0x97, 0x97, 0x02, 0x34, 0x98, 0x98, 0xfe, 0x64, 0x98, 0x98, 0x00, 0x02, 0x00, 0x34, 0xff, 0x64, 0x00, 0xd1, 0x02, 0x30, 0x00, 0x03, 0x00, 0x10, 0x00, 0x00, 0x13, 0x15, 0x23, 0x35, 0x12, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x36, 0x35, 0x35, 0x23, 0x35, 0x33, 0xcb, 0x97, 0x9d, 0x46, 0x46, 0x1c, 0x1b, 0x44, 0x83, 0x02, 0x30, 0x98, 0x98, 0xfd, 0xff, 0x33, 0x49, 0x4f, 0x3d, 0x1e, 0x22, 0x14, 0x81, 0x00, 0x02, 0x00, 0x22, 0x00, 0x00, 0x01, 0xef, 0x02, 0xd2, 0x00, 0x17, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x23, 0x15, 0x23, 0x35, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x23, 0x26, 0x36, 0x36, 0x33, 0x13, 0x15, 0x23, 0x35, 0x01, 0x71, 0x7e, 0x7e, 0x68, 0x84, 0x2d, 0x58, 0x5d, 0x33, 0x2c, 0x2d, 0x34, 0x84, 0x01, 0x37, 0x69, 0x47, 0x0f, 0x98, 0x02, 0xd2, 0x70, 0x63, 0x63, 0x67, 0x4d, 0xaa, 0x2e, 0x3f, 0x2c, 0x32, 0x32, 0x2c, 0x3d, 0x60, 0x36, 0xfd, 0xc6, 0x98, 0x98, 0x00, 0x00, 0x02, 0x00, 0x58, 0xff, 0x69, 0x00, 0xef, 0x02, 0x30, 0x00, 0x03, 0x00, 0x07, 0x00, 0x00, 0x13, 0x33, 0x15, 0x23, 0x17, 0x33, 0x13, 0x23, 0x58, 0x97, 0x97, 0x10, 0x76, 0x11, 0x97, 0x02, 0x30, 0x98, 0x4b, 0xfe, 0x1c, 0x00, 0xff, 0xff, 0x00, 0x34, 0x00, 0xfc, 0x00, 0xcb, 0x01, 0x94, 0x00, 0x07, 0x04, 0x07, 0x00, 0x05, 0x00, 0xfc, 0x00, 0x00, 0x00, 0x02, 0x00, 0x2b, 0xff, 0x5b, 0x01, 0xf8, 0x02, 0x2d, 0x00, 0x03, 0x00, 0x1b, 0x00, 0x00, 0x01, 0x35, 0x33, 0x15, 0x02, 0x26, 0x35, 0x34, 0x36, 0x33, 0x35, 0x33, 0x15, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x32, 0x36, 0x35, 0x33, 0x16, 0x06, 0x06, 0x23, 0x01, 0x02, 0x98, 0xf1, 0x7e, 0x7e, 0x68, 0x84, 0x2d, 0x58, 0x5d, 0x33, 0x2c, 0x2d, 0x34, 0x84, 0x01, 0x37, 0x69, 0x47, 0x01, 0x95, 0x98, 0x98, 0xfd, 0xc6, 0x70, 0x63, 0x63, 0x67, 0x4d, 0xaa, 0x2e, 0x3f, 0x2c, 0x32, 0x32, 0x2c, 0x3d, 0x60, 0x36, 0x00, 0x00, 0x03, 0x00, 0x49, 0x00, 0x3e, 0x02, 0x47, 0x02, 0x8a, 0x00, 0x03, 0x00, 0x07, 0x00, 0x0b, 0x00, 0x00, 0x01, 0x15, 0x23, 0x35, 0x05, 0x15, 0x21, 0x35, 0x05, 0x15, 0x23, 0x35, 0x01, 0x94, 0x98, 0x01, 0x4b, 0xfe, 0x02, 0x01, 0x4b, 0x98, 0x02, 0x8a, 0x98, 0x98, 0xe7, 0x7d, 0x7d, 0xcd, 0x98, 0x98, 0x00, 0x01, 0x00, 0x22, 0x02, 0x3d, 0x00, 0xa7, 0x03, 0x33, 0x00, 0x0b, 0x00, 0x00, 0x12, 0x35, 0x34, 0x36, 0x33, 0x15, 0x22, 0x15, 0x15, 0x33, 0x15, 0x23, 0x22, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0x02, 0x76, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x01, 0x00, 0x22, 0x02, 0x3d, 0x00, 0xa7, 0x03, 0x33, 0x00, 0x0b, 0x00, 0x00, 0x12, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xa7, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0x02, 0xfa, 0x34, 0x42, 0x47, 0x39, 0x3d, 0x13, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x22, 0x02, 0x3d, 0x01, 0x50, 0x03, 0x33, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x35, 0x34, 0x36, 0x33, 0x15, 0x22, 0x15, 0x15, 0x33, 0x15, 0x23, 0x36, 0x35, 0x34, 0x36, 0x33, 0x15, 0x22, 0x15, 0x15, 0x33, 0x15, 0x23, 0x22, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0x98, 0x3f, 0x3f, 0x33, 0x3a, 0x74, 0x02, 0x76, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x39, 0x33, 0x42, 0x48, 0x39, 0x3e, 0x12, 0x6d, 0x00, 0x00, 0x02, 0x00, 0x22, 0x02, 0x3d, 0x01, 0x51, 0x03, 0x33, 0x00, 0x0b, 0x00, 0x17, 0x00, 0x00, 0x12, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0x16, 0x15, 0x14, 0x06, 0x23, 0x35, 0x32, 0x35, 0x35, 0x23, 0x35, 0x33, 0xa7, 0x3f, 0x3e, 0x32, 0x3a, 0x74, 0xbb, 0x40, 0x3e, 0x32, 0x39, 0x74, 0x02, 0xfa, 0x34, 0x42, 0x47, 0x39, 0x3d, 0x13, 0x6d, 0x3e, 0x2f, 0x41, 0x48, 0x39, 0x3d, 0x13, 0x6d, 0x00, 0xff, 0xff, 0x00, 0x32, 0x00, 0x00, 0x02, 0x81, 0x00, 0x98, 0x00, 0x22, 0x04, 0x07, 0x03, 0x00, 0x00, 0x23, 0x04, 0x07, 0x00, 0xe0, 0x00, 0x00, 0x00, 0x03, 0x04, 0x07, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x02, 0x34, 0x00, 0x1c, 0x00, 0x28, 0x00, 0x00, 0x24, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x16, 0x15, 0x11, 0x23, 0x35, 0x26, 0x36, 0x36, 0x35, 0x35, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x7d, 0x68, 0x3c, 0x34, 0x54, 0x30, 0x73, 0x73, 0x8d, 0x02, 0x39, 0x32, 0x2c, 0x3a, 0x08, 0x8c, 0x0a, 0x43, 0x6d, 0x44, 0x46, 0x71, 0x40, 0x8e, 0x6f, 0x43, 0x2c, 0x85, 0x30, 0x2f, 0x2b, 0x27, 0x29, 0x33, 0x2a, 0x4a, 0x30, 0x4d, 0x62, 0x35, 0x3f, 0x2f, 0x2a, 0x3c, 0x5f, 0x35, 0x3a, 0x6c, 0x49, 0xfe, 0xbb, 0x4f, 0x18, 0x1e, 0x3c, 0x29, 0x04, 0x26, 0x1f, 0x1e, 0x24, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x03, 0x2c, 0x00, 0x23, 0x03, 0x06, 0x00, 0xd2, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x03, 0x05, 0x00, 0x23, 0x03, 0xca, 0x00, 0xac, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x03, 0x08, 0x00, 0x23, 0x03, 0xc7, 0x00, 0xb6, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x02, 0xf1, 0x00, 0x23, 0x02, 0xfa, 0x00, 0xac, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x03, 0x2c, 0x00, 0x23, 0x02, 0xd3, 0x00, 0xd2, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x02, 0xdc, 0x00, 0x23, 0x03, 0x01, 0x00, 0x8c, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0x2a, 0x02, 0x2e, 0x02, 0x34, 0x00, 0x2d, 0x00, 0x39, 0x00, 0x00, 0x04, 0x37, 0x15, 0x06, 0x23, 0x22, 0x26, 0x35, 0x34, 0x36, 0x37, 0x35, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x33, 0x33, 0x26, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x16, 0x15, 0x11, 0x07, 0x06, 0x06, 0x15, 0x14, 0x16, 0x33, 0x26, 0x36, 0x36, 0x35, 0x35, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x07, 0x27, 0x2b, 0x2e, 0x3b, 0x51, 0x23, 0x28, 0x17, 0x68, 0x3c, 0x34, 0x54, 0x30, 0x73, 0x73, 0x8d, 0x02, 0x39, 0x32, 0x2c, 0x3a, 0x08, 0x8c, 0x0a, 0x43, 0x6d, 0x44, 0x46, 0x71, 0x40, 0x2f, 0x22, 0x1c, 0x1b, 0x17, 0xc2, 0x43, 0x2c, 0x85, 0x30, 0x2f, 0x2b, 0x27, 0x82, 0x0f, 0x54, 0x0f, 0x37, 0x38, 0x20, 0x39, 0x1b, 0x42, 0x26, 0x33, 0x2a, 0x4a, 0x30, 0x4d, 0x62, 0x35, 0x3f, 0x2f, 0x2a, 0x3c, 0x5f, 0x35, 0x3a, 0x6c, 0x49, 0xfe, 0xbb, 0x18, 0x11, 0x1f, 0x12, 0x12, 0x16, 0xe9, 0x1e, 0x3c, 0x29, 0x04, 0x26, 0x1f, 0x1e, 0x24, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x03, 0x40, 0x00, 0x23, 0x03, 0xcc, 0x00, 0xd8, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0xff, 0xff, 0x00, 0x21, 0xff, 0xf6, 0x02, 0x22, 0x02, 0xe2, 0x00, 0x23, 0x03, 0xce, 0x00, 0x99, 0x00, 0x00, 0x00, 0x02, 0x04, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x21, 0xff, 0xf8, 0x02, 0xa2, 0x02, 0xde, 0x00, 0x28, 0x00, 0x34, 0x00, 0x00, 0x21, 0x27, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x37, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x32, 0x16, 0x16, 0x17, 0x16, 0x15, 0x14, 0x07, 0x23, 0x36, 0x27, 0x26, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x17, 0x01, 0x24, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x02, 0x05, 0x4c, 0x1a, 0x65, 0x40, 0x3e, 0x63, 0x38, 0x2e, 0x50, 0x31, 0x20, 0x1e, 0x2e, 0x59, 0x3d, 0x3b, 0x57, 0x2f, 0x04, 0x02, 0x05, 0x87, 0x07, 0x02, 0x01, 0x22, 0x1c, 0x1a, 0x22, 0x0f, 0x13, 0x01, 0x65, 0xfe, 0x82, 0x38, 0x38, 0x28, 0x29, 0x37, 0x37, 0x29, 0x68, 0x32, 0x3e, 0x38, 0x62, 0x3d, 0x38, 0x5b, 0x37, 0x06, 0x28, 0x47, 0x26, 0x2d, 0x4e, 0x2f, 0x2a, 0x46, 0x28, 0x10, 0x0a, 0x14, 0x16, 0x14, 0x14, 0x1c, 0x23, 0x23, 0x19, 0x12, 0x23, 0x19, 0xfe, 0x21, 0x6c, 0x3a, 0x2b, 0x2a, 0x39, 0x38, 0x2b, 0x2b, 0x3a, 0x00, 0x01, 0x00, 0x32, 0x00, 0x00, 0x02, 0x21, 0x02, 0xd7, 0x00, 0x1a, 0x00, 0x00, 0x13, 0x36, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x07, 0x23, 0x3e, 0x02, 0x33, 0x32, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x07, 0x21, 0x15, 0x21, 0x35, 0xf5, 0x4f, 0x3f, 0x30, 0x32, 0x30, 0x35, 0x02, 0x88, 0x01, 0x41, 0x6d, 0x44, 0x4c, 0x6b, 0x36, 0x4b, 0x5f, 0x71, 0x01, 0x2a, 0xfe, 0x12, 0x01, 0x22, 0x4e, 0x61, 0x30, 0x2c, 0x33, 0x42, 0x3c, 0x51, 0x6f, 0x35, 0x36, 0x5f, 0x3d, 0x44, 0x80, 0x5d, 0x70, 0x74, 0x66, 0x00, 0x01, 0x00, 0x31, 0xff, 0xfb, 0x02, 0x2b, 0x02, 0xd6, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x27, 0x33, 0x16, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x23, 0x35, 0x37, 0x21, 0x35, 0x21, 0x15, 0x07, 0x01, 0xbf, 0x6c, 0x3e, 0x72, 0x4d, 0x6e, 0x8b, 0x04, 0x8b, 0x02, 0x3c, 0x36, 0x35, 0x3d, 0x42, 0x39, 0x65, 0xa1, 0xfe, 0xf2, 0x01, 0xb7, 0xad, 0x01, 0xb5, 0x73, 0x60, 0x45, 0x69, 0x39, 0x72, 0x6f, 0x31, 0x3b, 0x3e, 0x38, 0x39, 0x40, 0x5f, 0xa2, 0x76, 0x6a, 0xac, 0x00, 0x02, 0x00, 0x31, 0xff, 0xf7, 0x02, 0x2c, 0x02, 0xd6, 0x00, 0x13, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x37, 0x37, 0x33, 0x03, 0x36, 0x33, 0x12, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x14, 0x16, 0x33, 0x01, 0x8e, 0x65, 0x39, 0x41, 0x73, 0x48, 0x4a, 0x74, 0x41, 0x28, 0x2b, 0xb0, 0x99, 0xbd, 0x1e, 0x1e, 0x1e, 0x41, 0x41, 0x3a, 0x3a, 0x43, 0x43, 0x3a, 0x01, 0xd4, 0x39, 0x69, 0x45, 0x47, 0x70, 0x3f, 0x40, 0x72, 0x47, 0x38, 0x70, 0x3f, 0xff, 0xfe, 0xf6, 0x08, 0xfe, 0x99, 0x45, 0x3a, 0x3b, 0x45, 0x45, 0x3b, 0x3a, 0x45, 0x00, 0x00, 0x02, 0x00, 0x24, 0xff, 0xfc, 0x02, 0x21, 0x02, 0xdc, 0x00, 0x13, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x16, 0x16, 0x15, 0x14, 0x06, 0x07, 0x07, 0x23, 0x13, 0x06, 0x23, 0x22, 0x26, 0x26, 0x35, 0x34, 0x36, 0x36, 0x33, 0x02, 0x16, 0x33, 0x32, 0x36, 0x35, 0x34, 0x26, 0x23, 0x22, 0x06, 0x15, 0x01, 0x6c, 0x74, 0x41, 0x28, 0x2b, 0xb0, 0x9b, 0xbd, 0x18, 0x1f, 0x43, 0x68, 0x3a, 0x42, 0x74, 0x48, 0x7c, 0x42, 0x3a, 0x3a, 0x42, 0x42, 0x3a, 0x3a, 0x42, 0x02, 0xdc, 0x40, 0x71, 0x48, 0x3b, 0x71, 0x3e, 0xfd, 0x01, 0x05, 0x07, 0x3a, 0x6a, 0x46, 0x48, 0x71, 0x3f, 0xfe, 0xcd, 0x46, 0x46, 0x3c, 0x3b, 0x46, 0x45, 0x3c, 0x00, 0x00, 0x00]
\ No newline at end of file
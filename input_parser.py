@@ -0,0 +1,349 @@
+# incremental parser for the calculator input. it's fed the Window.buttons / Window.next_buttons keys
+# one press at a time and keeps an operator-precedence (pratt style) parse state after every key,
+# so "Del" is just dropping the last state and "=" only has to hand the finished trees to sympy.
+#
+# no sympy import at module level on purpose, the window process never needs it (see to_sympy)
+
+
+DIGITS = set("0123456789")
+SYMBOLS = {"x", "y"}
+CONSTANTS = {"pi", "e"}
+FUNCTIONS = {"sin", "cos", "tan", "cot", "sec", "csc", "ln", "log", "exp"}
+SEPARATORS = {"DX", "DY"}
+
+# binding power and right associativity
+BINARY = {
+    "+": (1, False),
+    "-": (1, False),
+    "*": (2, False),
+    "/": (2, False),
+    "**": (4, True),
+}
+NEG_POWER = 3  # -x**2 is -(x**2), but -x*y is (-x)*y
+
+KEYS = DIGITS | SYMBOLS | CONSTANTS | FUNCTIONS | SEPARATORS | set(BINARY) | {"(", ")", "."}
+
+
+class ParseError(Exception):
+
+    def __init__(self, message: str, position: int = None):
+        super().__init__(message)
+        self.message = message
+        self.position = position  # index of the offending key
+
+
+class ParseState:
+
+    # immutable, every key press makes a new one from the previous.
+    # operands and operators are cons lists (head, tail) so making a new state never copies the stacks
+    __slots__ = ("operands", "operators", "expect_operand", "in_number", "after_function", "depth", "section", "m_tree", "n_tree", "error")
+
+    def __init__(self, operands=None, operators=None, expect_operand=True, in_number=False, after_function=False,
+                 depth=0, section=0, m_tree=None, n_tree=None, error=None):
+        self.operands = operands
+        self.operators = operators
+        self.expect_operand = expect_operand
+        self.in_number = in_number
+        self.after_function = after_function
+        self.depth = depth
+        self.section = section  # 0 = reading M, 1 = reading N, 2 = done
+        self.m_tree = m_tree
+        self.n_tree = n_tree
+        self.error = error  # ParseError, sticks to every later state
+
+    def replace(self, **changes):
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return ParseState(**fields)
+
+
+def _push(stack, item):
+    return (item, stack)
+
+
+def _reduce_one(operands, operators):
+    op, operators = operators
+    match op:
+        case ("neg",):
+            a, operands = operands
+            return _push(operands, ("neg", a)), operators
+        case ("bin", symbol):
+            b, operands = operands
+            a, operands = operands
+            return _push(operands, ("bin", symbol, a, b)), operators
+    raise ParseError(f"can't reduce {op[0]}")
+
+
+def _should_reduce(top, power, right):
+    match top:
+        case ("neg",):
+            return NEG_POWER > power or (NEG_POWER == power and not right)
+        case ("bin", symbol):
+            top_power = BINARY[symbol][0]
+            return top_power > power or (top_power == power and not right)
+    return False  # "(" and functions stop the reduction
+
+
+def _reduce_all(state, position):
+    # end of M or N, fold everything that's left into one tree
+    if state.after_function:
+        raise ParseError("expected ( after function", position)
+    if state.expect_operand:
+        raise ParseError("incomplete expression", position)
+    if state.depth:
+        raise ParseError("unclosed (", position)
+
+    operands, operators = state.operands, state.operators
+    while operators is not None:
+        operands, operators = _reduce_one(operands, operators)
+
+    tree, rest = operands
+    return tree
+
+
+def _end_number(state, position):
+    if state.in_number and state.operands[0][1] == ".":
+        raise ParseError("bad number", position)
+    return state.replace(in_number=False)
+
+
+def _operand(state, node, key, position):
+    # two operands in a row is implicit multiplication, "2x" or "x(y+1)"
+    if not state.expect_operand:
+        state = _binary(state, "*", position)
+    return state.replace(operands=_push(state.operands, node), expect_operand=False, in_number=key in DIGITS or key == ".")
+
+
+def _binary(state, symbol, position):
+    power, right = BINARY[symbol]
+    operands, operators = state.operands, state.operators
+
+    while operators is not None and _should_reduce(operators[0], power, right):
+        operands, operators = _reduce_one(operands, operators)
+
+    return state.replace(operands=operands, operators=_push(operators, ("bin", symbol)), expect_operand=True)
+
+
+def _step(state: ParseState, key: str, position: int) -> ParseState:
+    if key not in KEYS:
+        raise ParseError(f"unknown key {key}", position)
+
+    if state.section == 2:
+        raise ParseError("nothing can follow DY", position)
+
+    if state.after_function and key != "(":
+        raise ParseError("expected ( after function", position)
+
+    # digits and "." keep growing the number on top of the stack
+    if key in DIGITS or key == ".":
+        if state.in_number:
+            _, literal = state.operands[0]
+            if key == "." and "." in literal:
+                raise ParseError("bad number", position)
+            return state.replace(operands=_push(state.operands[1], ("num", literal + key)))
+        return _operand(state, ("num", key), key, position)
+
+    state = _end_number(state, position)
+
+    if key in SYMBOLS:
+        return _operand(state, ("sym", key), key, position)
+
+    if key in CONSTANTS:
+        return _operand(state, ("const", key), key, position)
+
+    if key in FUNCTIONS:
+        if not state.expect_operand:
+            state = _binary(state, "*", position)
+        return state.replace(operators=_push(state.operators, ("func", key)), after_function=True)
+
+    if key == "(":
+        if not state.expect_operand:
+            state = _binary(state, "*", position)
+        return state.replace(operators=_push(state.operators, ("(",)), depth=state.depth + 1, expect_operand=True, after_function=False)
+
+    if key == ")":
+        if state.depth == 0:
+            raise ParseError("unbalanced )", position)
+        if state.expect_operand:
+            raise ParseError("missing operand before )", position)
+
+        operands, operators = state.operands, state.operators
+        while operators[0] != ("(",):
+            operands, operators = _reduce_one(operands, operators)
+        _, operators = operators
+
+        if operators is not None and operators[0][0] == "func":
+            (_, name), operators = operators
+            a, operands = operands
+            operands = _push(operands, ("call", name, a))
+
+        return state.replace(operands=operands, operators=operators, depth=state.depth - 1, expect_operand=False)
+
+    if key in BINARY:
+        if state.expect_operand:
+            match key:
+                case "-":
+                    return state.replace(operators=_push(state.operators, ("neg",)))
+                case "+":
+                    return state  # unary plus does nothing
+            raise ParseError(f"missing operand before {key}", position)
+        return _binary(state, key, position)
+
+    # DX / DY
+    if key == "DX":
+        if state.section != 0:
+            raise ParseError("DX already entered", position)
+        return ParseState(section=1, m_tree=_reduce_all(state, position))
+
+    if state.section != 1:
+        raise ParseError("DY before DX", position)
+    return ParseState(section=2, m_tree=state.m_tree, n_tree=_reduce_all(state, position))
+
+
+class InputParser:
+
+    def __init__(self):
+        self.keys = []
+        self.states = [ParseState()]  # states[i] is the state after the first i keys
+        self.text = ""  # what the calculator screen shows
+
+    @property
+    def state(self):
+        return self.states[-1]
+
+    @property
+    def error(self):
+        return self.state.error
+
+    def push(self, key: str):
+        state = self.state
+        if state.error is None:
+            try:
+                state = _step(state, key, len(self.keys))
+            except ParseError as e:
+                state = state.replace(error=e)
+
+        self.keys.append(key)
+        self.states.append(state)
+        self.text += key
+
+    def pop(self):
+        if not self.keys:
+            return
+        key = self.keys.pop()
+        self.states.pop()
+        self.text = self.text[:-len(key)]
+
+    def clear(self):
+        self.keys.clear()
+        del self.states[1:]
+        self.text = ""
+
+    def finish(self):
+        # (M tree, N tree) for "M DX N DY", or ParseError
+        state = self.state
+        if state.error is not None:
+            raise state.error
+        if state.section != 2:
+            raise ParseError("expected M DX N DY", len(self.keys))
+        return state.m_tree, state.n_tree
+
+
+def tokenize(text: str):
+    # splits typed text (batch files, tests) into the same keys the buttons produce, longest match first
+    keys = sorted(KEYS, key=len, reverse=True)
+    tokens = []
+    i = 0
+    while i < len(text):
+        if text[i].isspace():
+            i += 1
+            continue
+        for key in keys:
+            if text.startswith(key, i):
+                tokens.append(key)
+                i += len(key)
+                break
+        else:
+            raise ParseError(f"unexpected {text[i]!r}", i)
+    return tokens
+
+
+def parse_text(text: str):
+    parser = InputParser()
+    for key in tokenize(text):
+        parser.push(key)
+    return parser.finish()
+
+
+def to_postfix(tree):
+    # flat list for shipping to the worker, deep trees would blow the recursion limit in pickle
+    out = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        match node:
+            case ("neg", a):
+                stack.append(("op", "neg"))
+                stack.append(a)
+            case ("bin", symbol, a, b):
+                stack.append(("op", symbol))
+                stack.append(b)
+                stack.append(a)
+            case ("call", name, a):
+                stack.append(("op", name))
+                stack.append(a)
+            case _:
+                out.append(node)
+    return out
+
+
+class _Terms(list):
+    # a sum that's still being collected, so a long a + b + c + ... becomes one Add instead of n nested ones
+    pass
+
+
+def from_postfix(postfix):
+    # sympy is only imported where the math runs (worker processes), not in the window
+    import sympy
+
+    def value(item):
+        return sympy.Add(*item) if isinstance(item, _Terms) else item
+
+    stack = []
+    for node in postfix:
+        match node:
+            case ("num", literal):
+                stack.append(sympy.Rational(literal))
+            case ("sym", name):
+                stack.append(sympy.Symbol(name))
+            case ("const", "pi"):
+                stack.append(sympy.pi)
+            case ("const", "e"):
+                stack.append(sympy.E)
+            case ("op", "neg"):
+                stack.append(-value(stack.pop()))
+            case ("op", "+" | "-" as symbol):
+                b, a = value(stack.pop()), stack.pop()
+                terms = a if isinstance(a, _Terms) else _Terms([a])
+                terms.append(b if symbol == "+" else -b)
+                stack.append(terms)
+            case ("op", "*" | "/" | "**" as symbol):
+                b, a = value(stack.pop()), value(stack.pop())
+                match symbol:
+                    case "*":
+                        stack.append(a * b)
+                    case "/":
+                        stack.append(a / b)
+                    case "**":
+                        stack.append(a ** b)
+            case ("op", name):
+                function = sympy.log if name == "ln" else getattr(sympy, name)
+                stack.append(function(value(stack.pop())))
+            case _:
+                raise ParseError(f"bad node {node!r}")
+
+    return value(stack.pop())
+
+
+def to_sympy(tree):
+    return from_postfix(to_postfix(tree))
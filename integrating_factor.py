@@ -0,0 +1,301 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+from sympy import Symbol, diff, exp, integrate, lambdify, nsimplify, powsimp, simplify, symbols
+
+from zero_test import DEFAULT_BUDGET, SAMPLE_RANGE, BudgetExceeded, equal_within_budget, time_limit
+
+
+# integrating factors for M dx + N dy = 0 when it isn't exact.
+#
+# a factor mu(z) of one combination z of x and y exists iff  R = (N_x - M_y) / (z_y M - z_x N)  only depends
+# on z, and then mu = exp(integral of R dz). x^a y^b works iff  b x M - a y N + x y (M_y - N_x) = 0  for some a, b.
+#
+#   screen   numpy only: R at pairs of random points with the same z has to agree, and a, b come out of a
+#            least squares fit. a few ms for every candidate, and it throws out nearly all of them
+#   try      what passed is worked out for real (integrate, then check mu M, mu N is exact). with more than one
+#            left they go to a process pool, the first factor found cancels the others, all within one budget
+#
+# a candidate that's already running when another one wins isn't waited on, it stops at the deadline on its own
+
+
+t = Symbol("t")
+x, y = symbols("x y")
+
+SCREEN_POINTS = 24
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _pair_x(xs, ys, other):
+    return xs, other
+
+
+def _pair_y(xs, ys, other):
+    return other, ys
+
+
+def _pair_xy(xs, ys, other):
+    return other, xs * ys / other
+
+
+def _pair_x_plus_y(xs, ys, other):
+    return other, xs + ys - other
+
+
+# name -> (z, partials (z_x, z_y), second point with the same z, y in terms of t and x)
+CANDIDATES = {
+    "x": (x, (1, 0), _pair_x, None),
+    "y": (y, (0, 1), _pair_y, None),
+    "xy": (x * y, (y, x), _pair_xy, t / x),
+    "x+y": (x + y, (1, 1), _pair_x_plus_y, t - x),
+}
+
+POWER = "x^a y^b"
+
+
+class FactorResult:
+
+    def __init__(self):
+        self.factor = None  # mu, M dx + N dy = 0 times mu is exact
+        self.kind = None  # which candidate found it
+        self.status = None  # "found", "none", "timed out" or "error"
+        self.certain = False
+        self.screened = []  # candidates that passed the screen
+        self.parallel = False
+        self.error = None
+        self.failures = {}  # candidate -> what sympy raised on it, those count as tried and not working
+        self.timings = {}  # "screen" and each candidate tried -> seconds
+        self.elapsed = 0.0
+
+    def to_dict(self):
+        return {
+            "factor": None if self.factor is None else str(self.factor),
+            "kind": self.kind,
+            "status": self.status,
+            "certain": self.certain,
+            "screened": list(self.screened),
+            "parallel": self.parallel,
+            "error": self.error,
+            "failures": dict(self.failures),
+            "timings": dict(self.timings),
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self):
+        return f"FactorResult(status={self.status!r}, kind={self.kind!r}, factor={self.factor})"
+
+
+def _sample(f, xs, ys):
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(f(xs, ys), dtype=complex), np.shape(xs))
+
+
+def screen(M, N, dm_dy, dn_dx):
+    # [(candidate, args for try_candidate)] of the ones that could work, cheapest first
+    if not (M.free_symbols | N.free_symbols) <= {x, y}:
+        # parameters can't be sampled, everything goes through to the symbolic check
+        return [(name, ()) for name in CANDIDATES] + [(POWER, None)]
+
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(*SAMPLE_RANGE, SCREEN_POINTS)
+    ys = rng.uniform(*SAMPLE_RANGE, SCREEN_POINTS)
+    other = rng.uniform(*SAMPLE_RANGE, SCREEN_POINTS)
+
+    passed = []
+    for name, (z, (z_x, z_y), pair, _) in CANDIDATES.items():
+        f = lambdify((x, y), (dn_dx - dm_dy) / (z_y * M - z_x * N), modules="numpy")
+        a, b = _sample(f, xs, ys), _sample(f, *pair(xs, ys, other))
+        finite = np.isfinite(a) & np.isfinite(b)
+        if finite.sum() >= SCREEN_POINTS // 3 and np.allclose(a[finite], b[finite], rtol=1e-7, atol=1e-10):
+            passed.append((name, ()))
+
+    # b x M - a y N = x y (N_x - M_y), solved for a and b at every point together
+    A0, A1, rhs = (_sample(lambdify((x, y), part, modules="numpy"), xs, ys) for part in (-y * N, x * M, x * y * (dn_dx - dm_dy)))
+    finite = np.isfinite(A0) & np.isfinite(A1) & np.isfinite(rhs)
+    if finite.sum() >= SCREEN_POINTS // 3:
+        A = np.stack([A0[finite], A1[finite]], axis=1)
+        (a, b), *_ = np.linalg.lstsq(A, rhs[finite], rcond=None)
+        if np.allclose(A @ np.array([a, b]), rhs[finite], rtol=1e-7, atol=1e-10) and abs(a.imag) < 1e-9 and abs(b.imag) < 1e-9:
+            passed.append((POWER, (a.real, b.real)))
+
+    return passed
+
+
+def _factor_of(name, args, M, N, dm_dy, dn_dx):
+    # mu for one candidate, or None when it doesn't work out symbolically
+    if name == POWER:
+        if args is None:
+            return None
+        a, b = (nsimplify(value, tolerance=1e-8, rational=True) for value in args)
+        return x ** a * y ** b
+
+    z, (z_x, z_y), _, y_of_t = CANDIDATES[name]
+    R = (dn_dx - dm_dy) / (z_y * M - z_x * N)
+    match name:
+        case "x":
+            R_t = simplify(R).subs(x, t)
+            other = y
+        case "y":
+            R_t = simplify(R).subs(y, t)
+            other = x
+        case _:
+            R_t = simplify(R.subs(y, y_of_t))
+            other = x
+    if R_t.has(other):
+        return None
+
+    return powsimp(simplify(exp(integrate(R_t, t)).subs(t, z)))
+
+
+def try_candidate(name, args, M, N, dm_dy, dn_dx, deadline: float):
+    # (name, mu or None, certain, seconds, error or None). deadline is time.time(), the same clock in every process.
+    # whatever sympy raises (NotImplementedError from integrate, PolynomialError, ...) only fails this candidate
+    start = time.perf_counter()
+    try:
+        with time_limit(deadline - time.time()):
+            mu = _factor_of(name, args, M, N, dm_dy, dn_dx)
+            if mu is not None:
+                lhs, rhs = diff(mu * M, y), diff(mu * N, x)
+    except BudgetExceeded:
+        mu = None
+    except Exception as e:
+        return name, None, False, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    if mu is None:
+        return name, None, False, time.perf_counter() - start, None
+
+    # outside the time_limit above, equal_within_budget keeps its own
+    try:
+        verdict = equal_within_budget(lhs, rhs, deadline - time.time())
+    except Exception as e:
+        return name, None, False, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    if verdict.is_zero:
+        return name, mu, verdict.certain, time.perf_counter() - start, None
+    return name, None, False, time.perf_counter() - start, None
+
+
+_pool = None
+_pool_ready = []
+_warm_barrier = None
+
+
+def _watch_parent():
+    # the pool lives inside the evaluator's worker, which gets killed rather than closed on a cancel
+    multiprocessing.parent_process().join()
+    os._exit(0)
+
+
+def _init_pool_worker(barrier):
+    global _warm_barrier
+    _warm_barrier = barrier
+    threading.Thread(target=_watch_parent, daemon=True).start()
+    import engine
+    engine.warm_up()
+
+
+def _ping():
+    # holds the worker until every other one has warmed up and pinged too, so one fast worker can't answer
+    # two pings and leave another one cold
+    try:
+        _warm_barrier.wait(timeout=60)
+    except threading.BrokenBarrierError:
+        pass
+    return os.getpid()
+
+
+def get_pool(workers: int = DEFAULT_WORKERS):
+    # the shared pool once every worker has warmed up, None before that (or when there's no room for one).
+    # never blocks, the first call only starts it. whoever uses it calls shutdown_pool before their process
+    # ends, a spawned process joins its children on the way out and would wait on the idle workers forever
+    global _pool
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return None
+
+    if _pool is None:
+        context = multiprocessing.get_context("spawn")
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_pool_worker,
+                                    initargs=(context.Barrier(workers),))
+        _pool_ready.extend(_pool.submit(_ping) for _ in range(workers))
+        return None
+
+    if not all(future.done() for future in _pool_ready):
+        return None
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_ready.clear()
+
+
+def find_integrating_factor(M, N, dm_dy=None, dn_dx=None, budget: float = DEFAULT_BUDGET, workers: int = DEFAULT_WORKERS) -> FactorResult:
+    result = FactorResult()
+    start = time.perf_counter()
+    deadline = time.time() + budget
+
+    dm_dy = diff(M, y) if dm_dy is None else dm_dy
+    dn_dx = diff(N, x) if dn_dx is None else dn_dx
+
+    try:
+        with time_limit(budget):
+            candidates = screen(M, N, dm_dy, dn_dx)
+    except BudgetExceeded:
+        candidates = None
+    except Exception:
+        # numpy choked on it, skip the screen and try everything
+        candidates = [(name, ()) for name in CANDIDATES]
+    result.timings["screen"] = time.perf_counter() - start
+
+    if candidates is None:
+        result.status = "timed out"
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    result.screened = [name for name, _ in candidates]
+
+    def finish(name, mu, certain):
+        result.factor, result.kind, result.certain, result.status = mu, name, certain, "found"
+
+    try:
+        pool = get_pool(workers) if len(candidates) > 1 else None
+        if pool is None:
+            for name, args in candidates:
+                _, mu, certain, seconds, error = try_candidate(name, args, M, N, dm_dy, dn_dx, deadline)
+                result.timings[name] = seconds
+                if error is not None:
+                    result.failures[name] = error
+                if mu is not None:
+                    finish(name, mu, certain)
+                    break
+        else:
+            result.parallel = True
+            pending = {pool.submit(try_candidate, name, args, M, N, dm_dy, dn_dx, deadline) for name, args in candidates}
+            while pending and result.status is None:
+                done, pending = wait(pending, timeout=max(deadline - time.time(), 0), return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    name, mu, certain, seconds, error = future.result()
+                    result.timings[name] = seconds
+                    if error is not None:
+                        result.failures[name] = error
+                    if mu is not None and result.status is None:
+                        finish(name, mu, certain)
+            for future in pending:
+                future.cancel()
+    except Exception as e:
+        result.status = "error"
+        result.error = str(e)
+
+    if result.status is None:
+        result.status = "timed out" if time.time() >= deadline else "none"
+
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -1,9 +1,20 @@
-import os
+import time
+STARTUP_TIME = time.perf_counter()
+
+from collections import deque
+
+import numpy as np
 from pyray import *
 from raylib import ffi
 
-from font_hex import font_hex
-from font_hex_italic import font_hex_italic
+from font_assets import FONT_PATH, FONT_ITALIC_PATH
+from font_atlas import FONT_SIZE, FONT_GLYPHS, FONT_ITALIC_GLYPHS
+from backend import gfx
+from text_cache import text_cache
+from input_view import InputView
+from animation import button_arrays
+from ui_input import InputDispatcher, InputSnapshot
+from profiler import profiler
 
 
 vertex_shader_code = """
@@ -67,109 +78,142 @@ HOVERED_REC_EXPAND_SPEED = 700
 
 class Button:
 
+    # thin view over button_arrays, the per-frame animation state lives there (see animation.py)
+
     def __init__(self, pos: Vector2, text: str, font: Font, font_size: int = 60, width: int = 125, height: int = 125, roundness: int = 1):
 
-        self.position = pos
+        self.arrays = button_arrays
+        self.index = self.arrays.add(pos.x, pos.y, width, height)
+
         self.original_position = Vector2(pos.x, pos.y)  # Save original position
         self.text = text
         self.roundness = roundness
-        self.width = width
-        self.height = height
-        self.original_width = self.width  # Save original width
-        self.original_height = self.height  # Save original height
+        self.original_width = width  # Save original width
+        self.original_height = height  # Save original height
         self.color = fade(RAYWHITE, 0.5)
         self.hovered_color = WHITE
         self.text_color = MATTE_BLACK
         self.font = font
         self.font_size = font_size
         self.original_font_size = self.font_size  # Save original font size
+        self.pressed_font_size = int(self.original_font_size * 0.9)  # 10% smaller while held down
+
+        # reused every frame instead of building new structs in draw
+        self.rec = Rectangle(0, 0, 0, 0)
+        self.hover_rec = Rectangle(0, 0, 0, 0)
+        self.text_pos = Vector2(0, 0)
+
+    @property
+    def x(self):
+        return self.arrays.x[self.index]
+
+    @property
+    def y(self):
+        return self.arrays.y[self.index]
 
-        self.hovered_size = Vector2(1, 1)
-        self.hovered_pos = Vector2((self.position.x + self.width / 2), (self.position.y + self.height / 2))
+    @property
+    def width(self):
+        return self.arrays.width[self.index]
 
-        self.is_being_clicked = False  # Track clicking state
+    @property
+    def height(self):
+        return self.arrays.height[self.index]
 
-        self.is_active = False # for modes
+    @property
+    def is_active(self):  # for modes
+        return self.arrays.active[self.index]
+
+    @is_active.setter
+    def is_active(self, value):
+        self.arrays.active[self.index] = value
+
+    @property
+    def is_being_clicked(self):
+        return self.arrays.clicked[self.index]
 
     def draw(self, is_shrinking=False, is_expanding=False):
-        current_width = self.width
-        current_height = self.height
-        current_position = Vector2(self.position.x, self.position.y)
+        i = self.index
+        arrays = self.arrays
+        x, y, width, height = float(arrays.x[i]), float(arrays.y[i]), float(arrays.width[i]), float(arrays.height[i])
+
+        current_width = width
+        current_height = height
         current_font_size = self.font_size
 
-        if (self.is_hovered() and is_mouse_button_down(MouseButton.MOUSE_BUTTON_LEFT)) or self.is_active:
-            self.is_being_clicked = True
-            if not self.is_active: 
-                current_width = self.width - 5
-                current_height = self.height - 5
-                current_font_size = int(self.original_font_size * 0.9)  # Reduce font size by 10%
+        is_being_clicked = arrays.clicked[i]
+        if is_being_clicked and not arrays.active[i]:
+            current_width = width - 5
+            current_height = height - 5
+            current_font_size = self.pressed_font_size
+
+        current_x = x + (width - current_width) / 2
+        current_y = y + (height - current_height) / 2
+
+        rec = self.rec
+        rec.x, rec.y, rec.width, rec.height = current_x, current_y, current_width, current_height
+        gfx.draw_rectangle_rounded(rec, self.roundness, 0, self.color)
+
+        if arrays.hovered[i] or is_being_clicked:
+            hover = self.hover_rec
+            if is_being_clicked:
+                hover.x, hover.y, hover.width, hover.height = current_x, current_y, current_width, current_height
             else:
-                current_width = self.width 
-                current_height = self.height 
-                current_font_size = self.original_font_size 
-            current_position.x = self.position.x + (self.width - current_width) / 2
-            current_position.y = self.position.y + (self.height - current_height) / 2
-        else:
-            self.is_being_clicked = False
-
-        rec = Rectangle(current_position.x, current_position.y, current_width, current_height)
-        draw_rectangle_rounded(rec, self.roundness, 0, self.color)
-
-        hover_width = self.hovered_size.x if not self.is_being_clicked else current_width
-        hover_height = self.hovered_size.y if not self.is_being_clicked else current_height
-        hover_x = self.hovered_pos.x if not self.is_being_clicked else current_position.x + (current_width - hover_width) / 2
-        hover_y = self.hovered_pos.y if not self.is_being_clicked else current_position.y + (current_height - hover_height) / 2
-
-        if self.is_hovered() or self.is_being_clicked:
-            draw_rectangle_rounded(Rectangle(hover_x, hover_y, hover_width, hover_height), self.roundness, 0, self.hovered_color)
-            if not self.is_being_clicked:
-                self.hovered_size = vector2_add(self.hovered_size, vector2_scale(Vector2(HOVERED_REC_EXPAND_SPEED, HOVERED_REC_EXPAND_SPEED), get_frame_time()))
-                self.hovered_size = vector2_clamp(self.hovered_size, Vector2(1, 1), Vector2(self.width, self.width))
-                self.hovered_pos = vector2_subtract(self.hovered_pos, vector2_scale(Vector2(HOVERED_REC_EXPAND_SPEED / 2, HOVERED_REC_EXPAND_SPEED / 2), get_frame_time()))
-                self.hovered_pos = vector2_clamp(self.hovered_pos, self.position, Vector2(self.position.x + self.width / 2, self.position.y + self.height / 2))
-        else:
-            self.hovered_size = vector2_subtract(self.hovered_size, vector2_scale(Vector2(HOVERED_REC_EXPAND_SPEED, HOVERED_REC_EXPAND_SPEED), get_frame_time()))
-            self.hovered_size = vector2_clamp(self.hovered_size, Vector2(1, 1), Vector2(self.width, self.height))
-            self.hovered_pos = vector2_add(self.hovered_pos, vector2_scale(Vector2(HOVERED_REC_EXPAND_SPEED / 2, HOVERED_REC_EXPAND_SPEED / 2), get_frame_time()))
-            self.hovered_pos = vector2_clamp(self.hovered_pos, self.position, Vector2(self.position.x + self.width / 2, self.position.y + self.height / 2))
+                hover.x, hover.y, hover.width, hover.height = arrays.hover_x[i], arrays.hover_y[i], arrays.hover_w[i], arrays.hover_h[i]
+            gfx.draw_rectangle_rounded(hover, self.roundness, 0, self.hovered_color)
+
+        if is_shrinking or is_expanding:
+            return
 
-        text_size = measure_text_ex(self.font, self.text, current_font_size, 0)
-        text_x = current_position.x + (current_width - text_size.x) / 2
-        text_y = current_position.y + (current_height - text_size.y) / 2
+        text_width, text_height = text_cache.measure(self.font, self.text, current_font_size)
+        text_x = current_x + (current_width - text_width) / 2
+        text_y = current_y + (current_height - text_height) / 2
 
-        if self.text == "/" and not is_shrinking and not is_expanding:
-            draw_text("÷", int(text_x - 3), int(text_y - 1), current_font_size + 15, self.text_color)
-        elif not is_shrinking and not is_expanding: 
-            draw_text_ex(self.font, self.text, Vector2(text_x, text_y), current_font_size, 0, self.text_color)
+        if self.text == "/":
+            gfx.draw_text("÷", int(text_x - 3), int(text_y - 1), current_font_size + 15, self.text_color)
+        else:
+            self.text_pos.x, self.text_pos.y = text_x, text_y
+            gfx.draw_text_ex(self.font, self.text, self.text_pos, current_font_size, 0, self.text_color)
+
+    def static_key(self, is_flipping=False):
+        # None while anything about the button is moving, otherwise what its idle look depends on
+        i = self.index
+        if is_flipping or self.arrays.hovered[i] or self.arrays.hover_w[i] > 1 or self.arrays.hover_h[i] > 1:
+            return None
+        return (bool(self.arrays.active[i]), float(self.arrays.width[i]), float(self.arrays.x[i]), float(self.arrays.y[i]))
 
     def is_hovered(self):
-        mouse_pos = get_mouse_position()
-        return check_collision_point_rec(mouse_pos, Rectangle(self.position.x, self.position.y, self.width, self.height))
+        # worked out for every button at once in ButtonArrays.update
+        return bool(self.arrays.hovered[self.index])
 
-    def is_clicked(self):
-        return is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT) and self.is_hovered()
 
 
 
 
 BUTTONS_FLIPPING_SPEED = 750
 
-font_data = bytes(font_hex)
-font_data_italic = bytes(font_hex_italic)
+# the slope field covers the key pad while it's up
+PLOT_RECT = Rectangle(88, 350, 575, 725)
 
-from sympy import *
+from evaluator import Evaluator
+from input_parser import InputParser, ParseError
+from slope_field import SlopeField
+from curves import Curves
 
 class Window:
 
 
     def __init__(self, width, height, title):
 
-        set_config_flags(ConfigFlags.FLAG_VSYNC_HINT)
-        init_window(width, height, title.encode())
-        set_target_fps(60)        
+        # sympy loads and warms up in the worker process while the window and fonts come up
+        self.evaluator = Evaluator()
+        self.first_frame_time = None
+        self.exit_after_first_frame = False  # --startup-check, see startup_budget.py
+        self.warmup_reported = False
+
+        gfx.open_window(width, height, title)
 
-        self.target = load_render_texture(APP_WIDTH, APP_HEIGHT)
-        set_texture_filter(self.target.texture, TextureFilter.TEXTURE_FILTER_BILINEAR)
+        self.target = gfx.load_render_texture(APP_WIDTH, APP_HEIGHT)
+        gfx.set_texture_filter(self.target.texture, TextureFilter.TEXTURE_FILTER_BILINEAR)
 
         self.camera = Camera2D(
             Vector2(360, 240),
@@ -178,22 +222,19 @@ class Window:
             1.0
         )
       
-        with open("vertex_shader.glsl", "w") as f:
-            f.write(vertex_shader_code)
-        with open("fragment_shader.glsl", "w") as f:
-            f.write(fragment_shader_code)
+        # compiled straight from the strings, nothing gets written next to the app
+        self.shader = gfx.load_shader_from_memory(vertex_shader_code, fragment_shader_code)
 
+        # uniform locations are looked up once, values go through buffers that get reused every frame
+        self.time_loc = gfx.get_shader_location(self.shader, "iTime")
+        self.resolution_loc = gfx.get_shader_location(self.shader, "resolution")
+        self.time_value = ffi.new("float[1]")
+        self.resolution_value = ffi.new("float[2]")
 
-        self.shader = load_shader("vertex_shader.glsl".encode(), "fragment_shader.glsl".encode())
+        self.update_resolution()
 
-        resolution = (get_screen_width(), get_screen_height())
-        resolution_ptr = ffi.new("float[2]", resolution)
-        set_shader_value(self.shader, get_shader_location(self.shader, b"resolution"), resolution_ptr, ShaderUniformDataType.SHADER_UNIFORM_VEC2)   
-
-        self.font = load_font_ex("Cubano.ttf", 320, None, 0)
-        # self.font = load_font_from_memory(".ttf", font_data, len(font_data), 320, None, 0)
-        self.fontItalic = load_font_ex("Poppins-Bold.ttf", 320, None, 0)
-        # self.fontItalic = load_font_from_memory(".ttf", font_data_italic, len(font_data_italic), 320, None, 0)
+        self.font = gfx.load_font(FONT_PATH, FONT_SIZE, FONT_GLYPHS)
+        self.fontItalic = gfx.load_font(FONT_ITALIC_PATH, FONT_SIZE, FONT_ITALIC_GLYPHS)
 
         self.buttons = {
             "1" : Button(Vector2(88, 500), "1", self.font),
@@ -261,159 +302,169 @@ class Window:
 
         self.equal_button.color = fade(GOLDEN_YELLOW, 0.5)
 
+        # indices into button_arrays, True is the base page
+        self.page_indices = {
+            True: np.array([button.index for button in self.buttons.values()]),
+            False: np.array([button.index for button in self.next_buttons.values()]),
+        }
+        self.fixed_indices = np.array([button.index for button in (*self.button_modes.values(), self.more_button, self.equal_button)])
+
+        # clicks are routed to exactly one of these per frame, see ui_input.py
+        self.input_state = InputSnapshot()
+        self.dispatcher = InputDispatcher(button_arrays)
+        for key, button in (*self.buttons.items(), *self.next_buttons.items()):
+            self.dispatcher.on_click(button, lambda key=key: self.press_key(key))
+        for key, button in self.button_modes.items():
+            self.dispatcher.on_click(button, lambda key=key: self.select_mode(key))
+        self.dispatcher.on_click(self.equal_button, self.is_exact)
+        self.dispatcher.on_click(self.more_button, self.flip_page)
+
         # buttons flipping animation
         self.is_buttons_shriking = False
         self.is_buttons_expanding = False
 
         self.in_base_page = True
 
+        # panel, screen background and every idle button, rebuilt only when one of them changes
+        self.static_layer = gfx.load_render_texture(APP_WIDTH, APP_HEIGHT)
+        self.static_key = None
+        self.static_buttons = set()
+        self.use_static_layer = True
+        self.frame_times = deque(maxlen=600)
+
+        # every key goes through the parser, self.input is just what the screen shows
+        self.parser = InputParser()
         self.input = ""
+        self.input_view = InputView(self.font, 85)  # draws only the keys that are on screen
+        self.status = ""  # verdict / progress line on the calculator screen
+
+        # direction field of the last checked equation, TAB shows / hides it
+        self.slope_field = SlopeField(PLOT_RECT, self.fontItalic)
+        self.curves = Curves(PLOT_RECT)  # solution curves on top, worked out on a background thread
+        self.plot_mode = False
 
 
 
 
     def draw_contents(self):
 
-        if is_key_down(KeyboardKey.KEY_RIGHT):
+        snapshot = self.input_state
+
+        if KeyboardKey.KEY_RIGHT in snapshot.keys_down:
             self.camera.offset.x -= 5
 
-        elif is_key_down(KeyboardKey.KEY_LEFT):
+        elif KeyboardKey.KEY_LEFT in snapshot.keys_down:
             self.camera.offset.x += 5
 
 
-        draw_rectangle_rounded(Rectangle(50, 75, 650, 1050), 0.1, 0, fade(MATTE_BLACK, 0.15))
-        # draw_rectangle_rounded(Rectangle(50, 75, 650, 1050), 0.1, 0, fade(RAYWHITE, 0.45))
+        if self.use_static_layer:
+            # the layer is premultiplied, see draw_static_layer
+            gfx.begin_blend_mode(BlendMode.BLEND_ALPHA_PREMULTIPLY)
+            gfx.draw_texture_rec(self.static_layer.texture, Rectangle(0, 0, APP_WIDTH, -APP_HEIGHT), Vector2(0, 0), WHITE)
+            gfx.end_blend_mode()
+        else:
+            self.draw_static_contents()
 
         if self.in_base_page:
-            for key, button in self.buttons.items():
-                if button.is_clicked():
-                    self.camera.offset = Vector2(360, 240)
-                    if key != "Del" and key != "C": self.input += key
-                    match key:
-                        case "Del":
-                            self.input = self.input[:-1]
-
-                        case "C":
-                            self.input = ""
-                            
-                            
-                button.draw(self.is_buttons_shriking, self.is_buttons_expanding)
+            for button in self.buttons.values():
+                if button not in self.static_buttons:
+                    button.draw(self.is_buttons_shriking, self.is_buttons_expanding)
 
             # buttons flipping animation
-            if all(button.width <= 0 for button in self.buttons.values()) and not self.is_buttons_expanding:
+            if (button_arrays.width[self.page_indices[True]] <= 0).all() and not self.is_buttons_expanding:
                 self.is_buttons_shriking = False
                 self.is_buttons_expanding = True
 
-            if all(button.width >= 125 for button in self.buttons.values()) and not self.is_buttons_shriking and self.is_buttons_expanding:
+            if (button_arrays.width[self.page_indices[True]] >= 125).all() and not self.is_buttons_shriking and self.is_buttons_expanding:
                 self.is_buttons_expanding = False
                 self.in_base_page = not self.in_base_page
 
         else:
-            for key, button in self.next_buttons.items():
-                if button.is_clicked():
-                    if button.is_clicked():
-                        self.camera.offset = Vector2(360, 240)
-                        if key != "Del": self.input += key
-                    match key:
-                        case "Del":
-                            self.input = self.input[:-1]
-
-                button.draw(self.is_buttons_shriking, self.is_buttons_expanding)
+            for button in self.next_buttons.values():
+                if button not in self.static_buttons:
+                    button.draw(self.is_buttons_shriking, self.is_buttons_expanding)
 
             # buttons flipping animation too
-            if all(button.width <= 0 for button in self.next_buttons.values()) and not self.is_buttons_expanding:
+            if (button_arrays.width[self.page_indices[False]] <= 0).all() and not self.is_buttons_expanding:
                 self.is_buttons_shriking = False
                 self.is_buttons_expanding = True
 
-            if all(button.width >= 125 for button in self.next_buttons.values()) and not self.is_buttons_shriking and self.is_buttons_expanding:
+            if (button_arrays.width[self.page_indices[False]] >= 125).all() and not self.is_buttons_shriking and self.is_buttons_expanding:
                 self.is_buttons_expanding = False
                 self.in_base_page = not self.in_base_page
 
-        for key, button in self.button_modes.items():
-                if button.is_clicked():
-                    match key:
-                        case "BASE":
-                            button.is_active = True
-                            self.button_modes["INVERSE"].is_active = False
-                            self.button_modes["HYPERBOLA"].is_active = False
-                        case "INVERSE":
-                            button.is_active = True
-                            self.button_modes["BASE"].is_active = False
-                            self.button_modes["HYPERBOLA"].is_active = False
-                        case "HYPERBOLA":
-                            button.is_active = True
-                            self.button_modes["BASE"].is_active = False
-                            self.button_modes["INVERSE"].is_active = False
-
-                        case "HOMO":
-                            button.is_active = True
-                            self.button_modes["EXACT"].is_active = False
-
-                        case "EXACT":
-                            button.is_active = True
-                            self.button_modes["HOMO"].is_active = False
-                
+        for button in self.button_modes.values():
+            if button not in self.static_buttons:
                 button.draw()
 
         # buttons flipping animation too too
         if self.is_buttons_shriking and not self.is_buttons_expanding:
-            for button in self.buttons.values() if self.in_base_page else self.next_buttons.values():
-                button.width -= int(BUTTONS_FLIPPING_SPEED * get_frame_time())
-                button.position.x += int(BUTTONS_FLIPPING_SPEED / 2 * get_frame_time())
+            button_arrays.flip(self.page_indices[self.in_base_page], -int(BUTTONS_FLIPPING_SPEED * gfx.get_frame_time()), int(BUTTONS_FLIPPING_SPEED / 2 * gfx.get_frame_time()))
 
         if self.is_buttons_expanding and not self.is_buttons_shriking:
-            for button in self.buttons.values() if self.in_base_page else self.next_buttons.values(): 
-                button.width += int(BUTTONS_FLIPPING_SPEED * get_frame_time())
-                button.position.x -= int(BUTTONS_FLIPPING_SPEED / 2 * get_frame_time())
+            button_arrays.flip(self.page_indices[self.in_base_page], int(BUTTONS_FLIPPING_SPEED * gfx.get_frame_time()), -int(BUTTONS_FLIPPING_SPEED / 2 * gfx.get_frame_time()))
+
 
+        for button in (self.more_button, self.equal_button):
+            if button not in self.static_buttons:
+                button.draw()
+
+        if self.plot_mode:
+            start = profiler.start()
+            self.slope_field.draw()
+            self.curves.draw(self.slope_field.window)
+            profiler.stop("plot", start)
+
+        start = profiler.start()
 
-        self.more_button.draw()
-        self.equal_button.draw()
-        if self.equal_button.is_clicked():
-            self.is_exact()
+        # input changed while the worker was still on the old one, drop it
+        if self.evaluator.is_busy() and self.evaluator.current_text != self.input:
+            self.evaluator.cancel()
+            self.status = ""
 
-        if self.more_button.is_clicked():
-            if not self.is_buttons_shriking and not self.is_buttons_expanding:
-                self.is_buttons_shriking = True
+        result = self.evaluator.poll()
+        if result is not None:
+            self.show_result(result)
 
+        profiler.stop("math", start)
 
-        
         screen_rect = Rectangle(100, 165, 550, 150)
-        draw_rectangle_rounded(screen_rect, 0.1, 0, fade(MATTE_BLACK, 0.1))
 
-        if check_collision_point_rec(get_mouse_position(), screen_rect):
-            # draw_rectangle_rounded(screen_rect, 0.1, 0, fade(MATTE_BLACK, 0.2))
+        if snapshot.is_inside(screen_rect):
+            # gfx.draw_rectangle_rounded(screen_rect, 0.1, 0, fade(MATTE_BLACK, 0.2))
 
             # right side
-            draw_rectangle_rounded(Rectangle(100, 165, 50, 150), 0.25, 0, fade(MATTE_BLACK, 0.2))
+            gfx.draw_rectangle_rounded(Rectangle(100, 165, 50, 150), 0.25, 0, fade(MATTE_BLACK, 0.2))
             # right arrow
-            draw_text_ex(self.fontItalic, "<", Vector2(110, 200), 85, 0, fade(RAYWHITE, 0.2))
+            gfx.draw_text_ex(self.fontItalic, "<", Vector2(110, 200), 85, 0, fade(RAYWHITE, 0.2))
 
-            if check_collision_point_rec(get_mouse_position(), Rectangle(100, 165, 50, 150)): 
-                if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT):
+            if snapshot.is_inside(Rectangle(100, 165, 50, 150)):
+                if snapshot.pressed:
                     self.camera.offset.x += 10
-                elif is_mouse_button_down(MouseButton.MOUSE_BUTTON_LEFT):
+                elif snapshot.down:
                     self.camera.offset.x += 5
 
             # left side
-            draw_rectangle_rounded(Rectangle(600, 165, 50, 150), 0.25, 0, fade(MATTE_BLACK, 0.2))
+            gfx.draw_rectangle_rounded(Rectangle(600, 165, 50, 150), 0.25, 0, fade(MATTE_BLACK, 0.2))
             # left arrow
-            draw_text_ex(self.fontItalic, ">", Vector2(610, 200), 85, 0, fade(RAYWHITE, 0.2))
+            gfx.draw_text_ex(self.fontItalic, ">", Vector2(610, 200), 85, 0, fade(RAYWHITE, 0.2))
 
-            if check_collision_point_rec(get_mouse_position(), Rectangle(600, 165, 50, 150)):
-                if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT):
+            if snapshot.is_inside(Rectangle(600, 165, 50, 150)):
+                if snapshot.pressed:
                     self.camera.offset.x -= 10
-                elif is_mouse_button_down(MouseButton.MOUSE_BUTTON_LEFT):
+                elif snapshot.down:
                     self.camera.offset.x -= 5
 
+        start = profiler.start()
+
         # Begin scissor mode to clip text outside the rectangle bounds
-        begin_scissor_mode(int(screen_rect.x), int(screen_rect.y), int(screen_rect.width), int(screen_rect.height))
+        gfx.begin_scissor_mode(int(screen_rect.x), int(screen_rect.y), int(screen_rect.width), int(screen_rect.height))
 
         # Use Camera2D to handle text scrolling
-        begin_mode_2d(self.camera)
+        gfx.begin_mode_2d(self.camera)
 
-        # Measure the width of the full input text
-        text_width = measure_text_ex(self.font, self.input, 85, 0).x
+        # width of the full input, a running sum over the keys
+        text_width = self.input_view.width
         max_visible_width = screen_rect.width - 30  # Leave padding on the sides
 
         # Dynamically adjust the text position
@@ -425,103 +476,352 @@ class Window:
             overflow_offset = text_width - max_visible_width  # Calculate overflow offset
             text_x = screen_rect.x + screen_rect.width - 30 - max_visible_width - overflow_offset
 
-        # Draw the text at the calculated position
-        draw_text_ex(self.font, self.input, Vector2(text_x, 230), 85, 0, MATTE_BLACK)
+        # Draw the part of the text that's inside screen_rect at the current camera offset
+        visible_left = screen_rect.x - self.camera.offset.x + self.camera.target.x
+        self.input_view.draw(text_x, 230, visible_left, visible_left + screen_rect.width, MATTE_BLACK)
 
-        end_mode_2d()
+        gfx.end_mode_2d()
 
         # End scissor mode
-        end_scissor_mode()
+        gfx.end_scissor_mode()
 
+        if self.evaluator.is_busy():
+            dots = "." * (1 + int(gfx.get_time() * 3) % 3)
+            label = "warming up" if not self.evaluator.ready else f"checking {self.evaluator.elapsed():.1f}s"
+            gfx.draw_text_ex(self.fontItalic, label + dots, Vector2(125, 175), 30, 0, fade(MATTE_BLACK, 0.6))
+        elif self.parser.error is not None:
+            gfx.draw_text_ex(self.fontItalic, self.parser.error.message, Vector2(125, 175), 30, 0, fade(RED, 0.6))
+        elif self.status:
+            # the solution can be longer than the screen, keep it inside
+            gfx.begin_scissor_mode(int(screen_rect.x), int(screen_rect.y), int(screen_rect.width), int(screen_rect.height))
+            gfx.draw_text_ex(self.fontItalic, self.status, Vector2(125, 175), 30, 0, fade(MATTE_BLACK, 0.6))
+            gfx.end_scissor_mode()
 
+        profiler.stop("text", start)
 
-    def is_exact(self):
-        try:
-            # Separate the expression for M and N assuming they are separated by 'D'            
-            dx = self.input[:self.input.index("DX")].strip()  # Expression for M
-            dy = self.input[len(dx)+2:self.input.index("DY")].strip()  # Expression for N
 
-            # dx = dx.replace("D", "")
 
-            print("Dx: ", dx)
-            print("Dy: ", dy)
+    def update_buttons(self):
+        button_arrays.visible[:button_arrays.count] = False
+        button_arrays.visible[self.page_indices[self.in_base_page]] = True
+        button_arrays.visible[self.fixed_indices] = True
 
-            # Convert them into symbolic expressions
-            M = sympify(dx)
-            N = sympify(dy)
+        # one grid lookup for the button under the cursor, its handler runs if it was clicked.
+        # with the slope field up the key pad is under it, the mouse pans and zooms the field instead
+        if self.plot_mode and self.input_state.is_inside(PLOT_RECT):
+            hovered = -1
+        else:
+            hovered = self.dispatcher.dispatch(self.input_state)
+        if self.plot_mode:
+            self.slope_field.handle_input(self.input_state)
+
+        # then one vectorized hover animation step for every button on screen
+        button_arrays.update(hovered, self.input_state.down, gfx.get_frame_time(), HOVERED_REC_EXPAND_SPEED)
+
+    def press_key(self, key):
+        self.camera.offset = Vector2(360, 240)
+        self.press(key)
+
+    def select_mode(self, key):
+        match key:
+            case "BASE" | "INVERSE" | "HYPERBOLA":
+                group = ("BASE", "INVERSE", "HYPERBOLA")
+            case _:
+                group = ("HOMO", "EXACT")
+
+        for other in group:
+            self.button_modes[other].is_active = other == key
+
+    def flip_page(self):
+        if not self.is_buttons_shriking and not self.is_buttons_expanding:
+            self.is_buttons_shriking = True
+
+    def update_resolution(self):
+        self.resolution_value[0] = gfx.get_screen_width()
+        self.resolution_value[1] = gfx.get_screen_height()
+        gfx.set_shader_value(self.shader, self.resolution_loc, self.resolution_value, ShaderUniformDataType.SHADER_UNIFORM_VEC2)
+
+    def page_buttons(self):
+        return self.buttons if self.in_base_page else self.next_buttons
+
+    def draw_static_contents(self):
+        gfx.draw_rectangle_rounded(Rectangle(50, 75, 650, 1050), 0.1, 0, fade(MATTE_BLACK, 0.15))
+        # gfx.draw_rectangle_rounded(Rectangle(50, 75, 650, 1050), 0.1, 0, fade(RAYWHITE, 0.45))
+
+        # screen background
+        gfx.draw_rectangle_rounded(Rectangle(100, 165, 550, 150), 0.1, 0, fade(MATTE_BLACK, 0.1))
+
+    def update_static_layer(self):
+        # has to run outside gfx.begin_texture_mode(self.target), texture modes don't nest
+        if not self.use_static_layer:
+            self.static_buttons = set()
+            return
+
+        is_flipping = self.is_buttons_shriking or self.is_buttons_expanding
+        keys = []
+        static_buttons = set()
+
+        for button in self.page_buttons().values():
+            key = button.static_key(is_flipping)
+            keys.append(key)
+            if key is not None:
+                static_buttons.add(button)
+
+        for button in (*self.button_modes.values(), self.more_button, self.equal_button):
+            key = button.static_key()
+            keys.append(key)
+            if key is not None:
+                static_buttons.add(button)
+
+        key = (self.in_base_page, tuple(keys))
+        if key == self.static_key:
+            return
+
+        self.static_key = key
+        self.static_buttons = static_buttons
+        self.draw_static_layer()
+
+    def draw_static_layer(self):
+        gfx.begin_texture_mode(self.static_layer)
+        gfx.clear_background(BLANK)
+
+        # premultiplied alpha so overlapping translucent shapes composite the same as drawing them directly
+        gfx.rl_set_blend_factors_separate(RL_SRC_ALPHA, RL_ONE_MINUS_SRC_ALPHA, RL_ONE, RL_ONE_MINUS_SRC_ALPHA, RL_FUNC_ADD, RL_FUNC_ADD)
+        gfx.begin_blend_mode(BlendMode.BLEND_CUSTOM_SEPARATE)
+
+        self.draw_static_contents()
+        for button in self.static_buttons:
+            button.draw()
+
+        gfx.end_blend_mode()
+        gfx.end_texture_mode()
+
+    def press(self, key):
+        match key:
+            case "Del":
+                self.parser.pop()
+            case "C":
+                self.parser.clear()
+            case _:
+                self.parser.push(key)
+
+        self.input = self.parser.text
+        self.input_view.sync(self.parser.keys)
+        self.status = ""  # the old verdict was for the old input
 
-            x, y = symbols("x y")
+    def is_exact(self):
+        try:
+            trees = self.parser.finish()
+        except ParseError as e:
+            print(f"Error: {e.message}")
+            self.status = "ERROR"
+            return
+
+        # hand it to the worker, the result shows up in show_result a few frames later
+        self.status = ""
+        self.evaluator.submit(self.input, trees)
+
+    def show_result(self, result):
+        plot = result.get("plot")
+        if plot is not None:
+            self.slope_field.set_equation(plot["m"], plot["n"])
+            self.curves.set_equation(plot)
+        else:
+            self.slope_field.clear_equation()
+            self.curves.clear_equation()
+            self.plot_mode = False
+
+        if result["error"] is not None:
+            print(f"Error: {result['error']}")
+            self.status = "ERROR"
+            return
+
+        print("Dx: ", result["m"])
+        print("Dy: ", result["n"])
+        print("dM/dy: ", result["dm_dy"])
+        print("dN/dx: ", result["dn_dx"])
+
+        if result["exact"] is None:
+            print("Undecided (ran out of time)")
+            self.status = "UNDECIDED"
+        elif result["exact"]:
+            print("Exact")
+            self.status = "EXACT"
+
+            potential = result["potential"]
+            if potential is not None:
+                if potential["status"] == "solved":
+                    print(f"Solution: {potential['F']} = C")
+                    self.status = f"EXACT   {potential['F']} = C"
+                else:
+                    print(f"Solution: {potential['status']}")
+                    self.status = f"EXACT   ({potential['status']})"
+        else:
+            print("Not Exact")
+            self.status = "NOT EXACT"
 
+            factor = result["factor"]
+            if factor is not None:
+                timings = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in factor["timings"].items())
+                if factor["status"] == "found":
+                    print(f"Integrating factor: {factor['factor']} ({factor['kind']}) [{timings}]")
+                    self.status = f"NOT EXACT   mu = {factor['factor']}"
+                else:
+                    print(f"Integrating factor: {factor['status']} [{timings}]")
 
-            #! Y COMES FIRST PUTANGINANG YAN INABOT PAKO NG PASKO KAKADEBUG
-            # Compute partial derivatives
-            expr1 = diff(M, y)  # dM/dx
-            expr2 = diff(N, x)  # dN/dy
+        if result["tier"] is not None:
+            timings = ", ".join(f"{tier} {seconds * 1000:.1f} ms" for tier, seconds in result["tier_timings"].items())
+            print(f"Decided by: {result['tier']} ({'certain' if result['certain'] else 'probabilistic'}) [{timings}]")
 
-            print("dM/dx: ", expr1)
-            print("dN/dy: ", expr2)
+        stats = result["cache"]
+        print(f"Cache: {'hit' if result['cached'] else 'miss'} (hits={stats['hits'] + stats['disk_hits']} misses={stats['misses']} size={stats['size']})")
 
-            # Compare the partial derivatives
-            if expr1.equals(expr2):
-                print("Exact")
-            else:
-                print("Not Exact")
+        canon = result["canon"]
+        print(f"Shared subtrees: {canon['dedup_ratio']:.2f}x, derivatives reused {canon['diff_hits']}/{canon['diff_hits'] + canon['diff_misses']}"
+              f"{', verdict reused' if result['shared'] else ''}")
 
-        except Exception as e:
-            print(f"Error: {e}")
+        terms = result["terms"]
+        if terms is not None:
+            print(f"Terms: {terms['reused']} reused, {terms['recomputed']} differentiated, {terms['compared']} compared")
 
   
     def run(self):
-
-        while not window_should_close():
-        
-            i_time = get_time()
-            set_shader_value(self.shader, get_shader_location(self.shader, b"iTime"), ffi.new("float[1]", [i_time]), ShaderUniformDataType.SHADER_UNIFORM_FLOAT)
-
-            scale = min(get_screen_width() / APP_WIDTH, get_screen_height() / APP_HEIGHT)
-            mouse = get_mouse_position()
-            virtual_mouse = vector2_zero()
-            virtual_mouse.x = (mouse.x - (get_screen_width() - APP_WIDTH * scale) * 0.5) / scale
-            virtual_mouse.y = (mouse.y - (get_screen_height() - APP_HEIGHT * scale) * 0.5) / scale
-            virtual_mouse = vector2_clamp(virtual_mouse, vector2_zero(), Vector2(APP_WIDTH, APP_HEIGHT))
-            set_mouse_offset(int(-(get_screen_width() - (APP_WIDTH * scale)) * 0.5), int(-(get_screen_height() - (APP_HEIGHT * scale)) * 0.5))
-            set_mouse_scale(1 / scale, 1 / scale)
-      
-            begin_texture_mode(self.target)
-            clear_background(WHITE)
-
-            begin_shader_mode(self.shader)
-            draw_rectangle(0, 0, APP_WIDTH, APP_HEIGHT, WHITE)
-            end_shader_mode()
-            self.draw_contents()
-            end_texture_mode()
-
-            begin_drawing()
-            clear_background(WHITE)
-            draw_texture_pro(
-                self.target.texture, 
-                Rectangle(0, 0, APP_WIDTH, -APP_HEIGHT), 
-                Rectangle((get_screen_width() - APP_WIDTH * scale) * 0.5, (get_screen_height() - APP_HEIGHT * scale) * 0.5, 
-                          APP_WIDTH * scale, APP_HEIGHT * scale), 
-                Vector2(0, 0), 
-                0, 
-                WHITE)
-            end_drawing()
+        while not gfx.window_should_close():
+            self.frame()
+            if self.exit_after_first_frame:
+                break
+
+    def frame(self):
+        # one whole frame, run() loops it and bench_frames.py drives it against the headless backend
+        frame_start = time.perf_counter()
+
+        if gfx.is_window_resized():
+            self.update_resolution()
+
+        self.time_value[0] = gfx.get_time()
+        gfx.set_shader_value(self.shader, self.time_loc, self.time_value, ShaderUniformDataType.SHADER_UNIFORM_FLOAT)
+
+        scale = min(gfx.get_screen_width() / APP_WIDTH, gfx.get_screen_height() / APP_HEIGHT)
+        gfx.set_mouse_offset(int(-(gfx.get_screen_width() - (APP_WIDTH * scale)) * 0.5), int(-(gfx.get_screen_height() - (APP_HEIGHT * scale)) * 0.5))
+        gfx.set_mouse_scale(1 / scale, 1 / scale)
+
+        # everything below reads input from this, nothing polls raylib on its own
+        self.input_state = gfx.capture_input()
+
+        # F2 flips the static layer cache, for comparing frame times
+        if KeyboardKey.KEY_F2 in self.input_state.keys_pressed:
+            self.use_static_layer = not self.use_static_layer
+            self.static_key = None
+            if self.frame_times:
+                print(f"Frame time: {sum(self.frame_times) / len(self.frame_times) * 1000:.3f} ms avg over {len(self.frame_times)} frames (static layer {'off' if self.use_static_layer else 'on'})")
+            self.frame_times.clear()
+
+        # F3 shows the per phase timings, see profiler.py
+        if KeyboardKey.KEY_F3 in self.input_state.keys_pressed:
+            profiler.toggle_overlay()
+
+        # TAB shows the direction field once an equation has been checked with =
+        if KeyboardKey.KEY_TAB in self.input_state.keys_pressed:
+            if self.slope_field.has_field:
+                self.plot_mode = not self.plot_mode
+            elif not self.evaluator.is_busy():
+                self.status = "PRESS = TO PLOT"
+
+        start = profiler.start()
+        self.update_buttons()
+        self.update_static_layer()
+        profiler.stop("update", start)
+
+        gfx.begin_texture_mode(self.target)
+        gfx.clear_background(WHITE)
+
+        start = profiler.start()
+        gfx.begin_shader_mode(self.shader)
+        gfx.draw_rectangle(0, 0, APP_WIDTH, APP_HEIGHT, WHITE)
+        gfx.end_shader_mode()
+        profiler.stop("shader", start)
+
+        start = profiler.start()
+        self.draw_contents()
+        profiler.stop("contents", start)
+        gfx.end_texture_mode()
+
+        gfx.begin_drawing()
+        gfx.clear_background(WHITE)
+        start = profiler.start()
+        gfx.draw_texture_pro(
+            self.target.texture, 
+            Rectangle(0, 0, APP_WIDTH, -APP_HEIGHT), 
+            Rectangle((gfx.get_screen_width() - APP_WIDTH * scale) * 0.5, (gfx.get_screen_height() - APP_HEIGHT * scale) * 0.5, 
+                      APP_WIDTH * scale, APP_HEIGHT * scale), 
+            Vector2(0, 0), 
+            0, 
+            WHITE)
+        profiler.stop("upscale", start)
+
+        profiler.draw_overlay()
+
+        # taken before end_drawing so the vsync wait isn't part of the number
+        self.frame_times.append(time.perf_counter() - frame_start)
+        profiler.stop("frame", frame_start)
+        gfx.end_drawing()
+
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - STARTUP_TIME
+            print(f"First frame: {self.first_frame_time * 1000:.1f} ms (sympy warm-up {'done' if self.evaluator.ready else 'still running'})", flush=True)
+
+        if not self.warmup_reported and self.evaluator.ready:
+            self.warmup_reported = True
+            print(f"Sympy warm-up: {self.evaluator.warmup_time * 1000:.1f} ms")
 
 
 
     def __del__(self):
-        close_window()
-        unload_shader(self.shader)
-        os.remove("vertex_shader.glsl")
-        os.remove("fragment_shader.glsl")
+        self.evaluator.close()
+        gfx.unload_render_texture(self.static_layer)
+        self.slope_field.unload()
+        self.curves.close()
+        # gpu resources have to go before the gl context does
+        gfx.unload_shader(self.shader)
+        gfx.close_window()
 
 
 
 def main():
+    import argparse
+    import sys
+
+    # headless modes never open the window, everything after --batch / --serve is for batch.py / service.py
+    if "--batch" in sys.argv[1:]:
+        import batch
+        sys.exit(batch.main(sys.argv[sys.argv.index("--batch") + 1:]))
+    if "--serve" in sys.argv[1:]:
+        import service
+        sys.exit(service.main(sys.argv[sys.argv.index("--serve") + 1:]))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", action="store_true", help="record per phase frame timings from the start (F3 toggles the overlay)")
+    parser.add_argument("--profile-out", metavar="FILE", help="write the timings to FILE on exit, .json or .csv")
+    parser.add_argument("--plot-grid", type=int, default=100, metavar="N", help="direction field segments per side")
+    parser.add_argument("--plot-window", type=float, nargs=4, default=(-5, 5, -5, 5), metavar=("XMIN", "XMAX", "YMIN", "YMAX"))
+    parser.add_argument("--startup-check", action="store_true", help="quit right after the first frame, for startup_budget.py")
+    args = parser.parse_args()
+
+    profiler.enabled = args.profile or args.profile_out is not None
+
     app = Window(500, 800, "DE")
+    app.exit_after_first_frame = args.startup_check
+    app.slope_field.set_grid(args.plot_grid)
+    app.slope_field.set_window(*args.plot_window)
     app.run()
 
+    if args.profile_out is not None:
+        profiler.dump(args.profile_out)
+        print(f"Profile: {args.profile_out}")
+
 
 if __name__ == "__main__":
+    # the evaluator worker is a spawned process, needed for the frozen build
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
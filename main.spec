@@ -1,18 +1,47 @@
 # -*- mode: python ; coding: utf-8 -*-
+import glob
+import os
 
+import sympy
+
+# run `python font_atlas.py` before building to ship prebaked font atlases,
+# otherwise they get baked into the user cache on first launch
+datas = [('assets/*.ttf', 'assets')]
+if glob.glob('assets/atlas/*.png'):
+    datas.append(('assets/atlas/*', 'assets/atlas'))
+
+# sympy subpackages the worker never imports, from `python startup_profile.py --sympy-usage`.
+# physics.units, testing, assumptions and logic stay, simplify / lambdify pull them in lazily
+excludes = [
+    'sympy.benchmarks', 'sympy.categories', 'sympy.crypto', 'sympy.diffgeom', 'sympy.holonomic',
+    'sympy.liealgebras', 'sympy.sandbox', 'sympy.stats', 'sympy.unify', 'sympy.vector',
+    'sympy.parsing.autolev', 'sympy.parsing.c', 'sympy.parsing.fortran', 'sympy.parsing.latex',
+    'sympy.physics.biomechanics', 'sympy.physics.continuum_mechanics', 'sympy.physics.control',
+    'sympy.physics.hep', 'sympy.physics.mechanics', 'sympy.physics.optics', 'sympy.physics.quantum',
+    'sympy.physics.vector', 'sympy.tensor.array.expressions', 'sympy.utilities._compilation',
+    # optional backends sympy / numpy only import when asked for
+    'matplotlib', 'IPython', 'pytest', 'tkinter', 'scipy', 'numexpr', 'pyglet', 'jax', 'tensorflow', 'torch', 'cupy',
+]
+
+# and every tests / benchmarks package in sympy
+sympy_dir = os.path.dirname(sympy.__file__)
+for root, dirs, files in os.walk(sympy_dir):
+    for name in dirs:
+        if name in ('tests', 'benchmarks'):
+            excludes.append('.'.join(['sympy', *os.path.relpath(os.path.join(root, name), sympy_dir).split(os.sep)]))
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     noarchive=False,
-    optimize=0,
+    optimize=1,  # bytecode compiled with -O (asserts stripped), docstrings kept since sympy edits some at import
 )
 pyz = PYZ(a.pure)
 
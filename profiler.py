@@ -0,0 +1,127 @@
+import csv
+import json
+import os
+import time
+
+import numpy as np
+
+
+# per phase frame timings in fixed size ring buffers, with an overlay (F3) showing p50/p95/p99.
+#
+#   start = profiler.start()
+#   ...
+#   profiler.stop("phase", start)
+#
+# while disabled start() is one attribute check and stop() returns straight away, so the calls can stay
+# in the frame loop for good
+
+
+RING_SIZE = 600  # 10 s at 60 fps
+PERCENTILES = (50, 95, 99)
+OVERLAY_REFRESH = 0.5  # seconds between percentile recomputes, np.percentile isn't free
+
+
+class Ring:
+
+    def __init__(self, size: int = RING_SIZE):
+        self.samples = np.zeros(size)
+        self.pos = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.samples[self.pos] = value
+        self.pos = (self.pos + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+
+    def values(self):
+        # oldest first
+        if self.count < len(self.samples):
+            return self.samples[:self.count].copy()
+        return np.roll(self.samples, -self.pos)
+
+    def percentiles(self):
+        if not self.count:
+            return (0.0,) * len(PERCENTILES)
+        return tuple(np.percentile(self.samples[:self.count], PERCENTILES))
+
+
+class Profiler:
+
+    def __init__(self, enabled: bool = False, size: int = RING_SIZE):
+        self.enabled = enabled
+        self.size = size
+        self.phases = {}  # name -> Ring, in the order they were first seen
+        self.show_overlay = False
+        self.overlay_lines = []
+        self.overlay_updated = 0.0
+
+    def start(self):
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, name: str, start: float):
+        if not self.enabled:
+            return
+        ring = self.phases.get(name)
+        if ring is None:
+            ring = self.phases[name] = Ring(self.size)
+        ring.add(time.perf_counter() - start)
+
+    def toggle_overlay(self):
+        # the overlay needs numbers, so showing it turns recording on as well
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enabled = True
+            self.overlay_updated = 0.0
+
+    def summary(self):
+        # {phase: {"p50": ms, "p95": ms, "p99": ms, "samples": n}}
+        out = {}
+        for name, ring in self.phases.items():
+            stats = {f"p{p}": float(value) * 1000 for p, value in zip(PERCENTILES, ring.percentiles())}
+            stats["samples"] = ring.count
+            out[name] = stats
+        return out
+
+    def lines(self):
+        now = time.perf_counter()
+        if now - self.overlay_updated >= OVERLAY_REFRESH:
+            self.overlay_updated = now
+            self.overlay_lines = ["phase          p50     p95     p99 ms"] + [
+                f"{name:<12} {stats['p50']:6.2f}  {stats['p95']:6.2f}  {stats['p99']:6.2f}"
+                for name, stats in self.summary().items()
+            ]
+        return self.overlay_lines
+
+    def draw_overlay(self, x: int = 10, y: int = 10, font_size: int = 20):
+        if not self.show_overlay:
+            return
+
+        from pyray import fade, BLACK, GREEN
+        from backend import gfx
+
+        lines = self.lines()
+        gfx.draw_rectangle(x - 5, y - 5, font_size * 19, (font_size + 4) * len(lines) + 10, fade(BLACK, 0.7))
+        for i, line in enumerate(lines):
+            gfx.draw_text(line, x, y + i * (font_size + 4), font_size, GREEN)
+
+    def dump(self, path: str):
+        # .json gets the summary plus raw samples, anything else is a long format csv (phase, sample, ms)
+        if os.path.splitext(path)[1].lower() == ".json":
+            data = {
+                "summary": self.summary(),
+                "samples": {name: (ring.values() * 1000).tolist() for name, ring in self.phases.items()},
+            }
+            with open(path, "w") as f:
+                json.dump(data, f, indent=1)
+            return
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("phase", "sample", "ms"))
+            for name, ring in self.phases.items():
+                for i, value in enumerate(ring.values()):
+                    writer.writerow((name, i, f"{value * 1000:.4f}"))
+
+
+profiler = Profiler()
@@ -0,0 +1,416 @@
+import argparse
+import bisect
+import json
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from canon import merge_stats
+from evaluator import DEFAULT_CACHE_PATH
+from input_parser import ParseError, from_postfix, parse_text, to_postfix
+
+
+# long running local service, so a grading tool pays for the sympy import and warm-up once instead of per call.
+#
+#   python service.py --port 8765        (or python main.py --serve --port 8765)
+#
+#   POST /   json-rpc 2.0, single calls or a batch array
+#            {"jsonrpc": "2.0", "id": 1, "method": "check", "params": {"input": "2xy DX x**2 DY", "deadline": 2}}
+#            params take "input" (calculator keys, parsed like the = button does) or "m" and "n" (the same keys,
+#            parsed as "m DX n DY"), optional "deadline" in seconds and "solve" for F(x, y) = C.
+#            the body has to be sent as application/json
+#   GET /stats   queue depth, counters and a latency histogram
+#
+# requests queue up and a dispatcher thread hands them to the pool in batches (up to --max-batch, or whatever
+# arrived within --batch-window of the first), one ipc round trip per batch instead of per request. a batch is
+# split evenly over the workers so nothing waits behind a slow item while another worker sits idle.
+# a deadline is both how long the caller waits and the sympy budget the worker gets for that item
+
+
+DEFAULT_PORT = 8765
+DEFAULT_DEADLINE = 10.0
+DEFAULT_MAX_BATCH = 16
+DEFAULT_BATCH_WINDOW = 0.005
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# json-rpc error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+DEADLINE_EXCEEDED = -32000
+
+
+class RpcError(Exception):
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+# worker side, the same check the window's evaluator worker runs
+
+_warm_barrier = None
+
+
+def _init_worker(cache_path, barrier):
+    global _warm_barrier
+    _warm_barrier = barrier
+    import engine
+    engine._init_worker(cache_path)
+    engine.warm_up()
+
+
+def _ping():
+    # holds the worker until every other one has warmed up and pinged too, so the pings can't double up on one
+    try:
+        _warm_barrier.wait(timeout=60)
+    except threading.BrokenBarrierError:
+        pass
+    return os.getpid()
+
+
+def _check_batch(items):
+    import engine
+
+    out = []
+    for payload, deadline, solve in items:
+        # items of a batch run one after another, so each gets whatever is left of its own deadline when it starts
+        budget = deadline - time.time()
+        if budget <= 0:
+            out.append({"m": None, "n": None, "exact": None, "error": "deadline exceeded before it started"})
+            continue
+
+        try:
+            m, n = (from_postfix(p) for p in payload)
+        except (ValueError, ParseError) as e:
+            out.append({"m": None, "n": None, "exact": None, "error": str(e)})
+            continue
+
+        result = engine.check_exact(m, n, cache=engine._worker_cache, budget=budget, solve=solve).to_dict()
+        del result["index"]
+        out.append(result)
+    return os.getpid(), engine.canon.stats(), out
+
+
+class Request:
+
+    def __init__(self, payload, deadline: float, solve: bool):
+        self.payload = payload  # postfix for m and n, parsed here already
+        self.solve = solve
+        self.received = time.perf_counter()
+        self.deadline = self.received + deadline
+        self.wall_deadline = time.time() + deadline  # for the worker, perf_counter isn't comparable across processes
+        self.future = Future()
+
+
+class LatencyHistogram:
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is everything slower
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+
+    def percentile(self, p: float):
+        # upper edge of the bucket the p-th request falls in
+        if not self.total:
+            return None
+        target = p / 100 * self.total
+        seen = 0
+        for edge, count in zip(self.buckets + (None,), self.counts):
+            seen += count
+            if seen >= target:
+                return edge
+        return None
+
+    def to_dict(self):
+        return {
+            "buckets_ms": {(f"<={edge}" if edge is not None else "inf"): count for edge, count in zip(self.buckets + (None,), self.counts)},
+            "count": self.total,
+            "mean_ms": self.sum_ms / self.total if self.total else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class ExactService:
+
+    def __init__(self, workers: int = None, cache_path: str = DEFAULT_CACHE_PATH, max_batch: int = DEFAULT_MAX_BATCH,
+                 batch_window: float = DEFAULT_BATCH_WINDOW, default_deadline: float = DEFAULT_DEADLINE):
+
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.default_deadline = default_deadline
+
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.in_flight = 0  # requests handed to the pool and not back yet
+        self.counts = {"requests": 0, "exact": 0, "not exact": 0, "undecided": 0, "errors": 0, "deadline exceeded": 0, "batches": 0}
+        self.latency = LatencyHistogram()
+        self.canon_stats = {}  # worker pid -> its latest canon table stats
+        self.started = time.perf_counter()
+
+        context = multiprocessing.get_context()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=_init_worker,
+                                            initargs=(cache_path, context.Barrier(self.workers)))
+        self.dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self.dispatcher.start()
+
+    def warm_up(self):
+        # one task per worker makes the pool start all of them, each warms up in its initializer before it answers.
+        # the pings wait on each other (see _ping), so one fast worker can't answer two and leave another cold
+        start = time.perf_counter()
+        pids = {future.result() for future in [self.executor.submit(_ping) for _ in range(self.workers)]}
+        return len(pids), time.perf_counter() - start
+
+    def submit(self, params) -> Request:
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params must be an object")
+
+        deadline = params.get("deadline", self.default_deadline)
+        # bool is an int, json true would otherwise be a 1 s deadline
+        if isinstance(deadline, bool) or not isinstance(deadline, (int, float)) or deadline <= 0:
+            raise RpcError(INVALID_PARAMS, "deadline must be a positive number of seconds")
+        solve = bool(params.get("solve", False))
+
+        if "input" in params:
+            text = str(params["input"])
+        elif "m" in params and "n" in params:
+            text = f"{params['m']} DX {params['n']} DY"
+        else:
+            raise RpcError(INVALID_PARAMS, "expected input, or m and n")
+
+        # same path as the = button: keys through InputParser, only the postfix goes to the worker.
+        # nothing from the request is ever handed to sympify
+        try:
+            trees = parse_text(text)
+        except ParseError as e:
+            raise RpcError(INVALID_PARAMS, e.message)
+        request = Request(tuple(to_postfix(tree) for tree in trees), deadline, solve)
+
+        self.queue.put(request)
+        return request
+
+    def wait(self, request: Request):
+        remaining = request.deadline - time.perf_counter()
+        try:
+            result = request.future.result(timeout=max(remaining, 0) + 0.05)
+        except TimeoutError:
+            # the worker's budget ends at the same deadline, so it gives up on this one shortly too
+            self._record(request, None)
+            raise RpcError(DEADLINE_EXCEEDED, "deadline exceeded")
+
+        self._record(request, result)
+        return result
+
+    def _record(self, request, result):
+        ms = (time.perf_counter() - request.received) * 1000
+        with self.lock:
+            self.counts["requests"] += 1
+            self.latency.add(ms)
+            if result is None:
+                self.counts["deadline exceeded"] += 1
+            elif result["error"] is not None:
+                self.counts["errors"] += 1
+            elif result["exact"] is None:
+                self.counts["undecided"] += 1
+            else:
+                self.counts["exact" if result["exact"] else "not exact"] += 1
+
+    def _dispatch(self):
+        while True:
+            batch = [self.queue.get()]
+            if batch[0] is None:
+                return
+
+            # whatever else shows up within the window rides along
+            window_end = time.perf_counter() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = window_end - time.perf_counter()
+                try:
+                    request = self.queue.get(timeout=timeout) if timeout > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self.queue.put(None)
+                    break
+                batch.append(request)
+
+            # items of one task run one after another, so the batch is spread over every worker
+            size = math.ceil(len(batch) / self.workers)
+            for start in range(0, len(batch), size):
+                chunk = batch[start:start + size]
+                items = [(request.payload, request.wall_deadline, request.solve) for request in chunk]
+
+                with self.lock:
+                    self.in_flight += len(chunk)
+                    self.counts["batches"] += 1
+
+                future = self.executor.submit(_check_batch, items)
+                future.add_done_callback(lambda future, chunk=chunk: self._finish(chunk, future))
+
+    def _finish(self, batch, future):
+        error = future.exception()
+        with self.lock:
+            self.in_flight -= len(batch)
+            if error is None:
+                pid, stats, results = future.result()
+                self.canon_stats[pid] = stats
+
+        for i, request in enumerate(batch):
+            if error is not None:
+                request.future.set_result({"m": None, "n": None, "exact": None, "error": f"worker failed: {error}"})
+            else:
+                request.future.set_result(results[i])
+
+    def stats(self):
+        with self.lock:
+            return {
+                "uptime": time.perf_counter() - self.started,
+                "workers": self.workers,
+                "queue_depth": self.queue.qsize(),
+                "in_flight": self.in_flight,
+                "counts": dict(self.counts),
+                "latency": self.latency.to_dict(),
+                "canon": merge_stats(self.canon_stats.values()),
+            }
+
+    def close(self):
+        self.queue.put(None)
+        self.dispatcher.join()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    service: ExactService = None  # set by serve()
+
+    def log_message(self, format, *args):
+        pass  # one line per request is too noisy for a local tool
+
+    def send_json(self, status: int, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        match self.path:
+            case "/stats":
+                self.send_json(200, self.service.stats())
+            case "/health":
+                self.send_json(200, {"ok": True})
+            case _:
+                self.send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.headers.get_content_type() != "application/json":
+            self.send_json(415, rpc_error(None, RpcError(INVALID_REQUEST, "content type must be application/json")))
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_json(200, rpc_error(None, RpcError(PARSE_ERROR, "parse error")))
+            return
+
+        if isinstance(body, list):
+            # json-rpc batch: everything goes in the queue first so it can share pool batches
+            if not body:
+                self.send_json(200, rpc_error(None, RpcError(INVALID_REQUEST, "empty batch")))
+                return
+            submitted = [self.start_call(call) for call in body]
+            self.send_json(200, [self.finish_call(call, state) for call, state in zip(body, submitted)])
+        else:
+            self.send_json(200, self.finish_call(body, self.start_call(body)))
+
+    def start_call(self, call):
+        # the Request, or the RpcError / method result to answer with right away
+        if not isinstance(call, dict) or call.get("jsonrpc") != "2.0" or "method" not in call:
+            return RpcError(INVALID_REQUEST, "invalid request")
+
+        match call["method"]:
+            case "check":
+                try:
+                    return self.service.submit(call.get("params", {}))
+                except RpcError as e:
+                    return e
+            case "stats":
+                return {"result": self.service.stats()}
+        return RpcError(METHOD_NOT_FOUND, f"method not found: {call['method']}")
+
+    def finish_call(self, call, state):
+        call_id = call.get("id") if isinstance(call, dict) else None
+        if isinstance(state, RpcError):
+            return rpc_error(call_id, state)
+        if isinstance(state, dict):
+            return {"jsonrpc": "2.0", "id": call_id, "result": state["result"]}
+
+        try:
+            result = self.service.wait(state)
+        except RpcError as e:
+            return rpc_error(call_id, e)
+        return {"jsonrpc": "2.0", "id": call_id, "result": result}
+
+
+def rpc_error(call_id, error: RpcError):
+    return {"jsonrpc": "2.0", "id": call_id, "error": {"code": error.code, "message": error.message}}
+
+
+def serve(host: str = "127.0.0.1", port: int = DEFAULT_PORT, **options):
+    service = ExactService(**options)
+    count, elapsed = service.warm_up()
+    print(f"Service: {count} workers warm in {elapsed * 1000:.0f} ms", flush=True)
+
+    Handler.service = service
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    print(f"Service: listening on http://{host}:{server.server_address[1]}", flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="service", description="local json-rpc exactness service with a warm worker pool")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind, keep it local (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: cpu count)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="most requests sent to a worker at once")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW, help="seconds to wait for a batch to fill")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE, help="default per request deadline in seconds")
+    parser.add_argument("--cache", metavar="PATH", default=DEFAULT_CACHE_PATH, help="sqlite result cache shared with the app")
+    parser.add_argument("--no-cache", action="store_true", help="keep results in memory only")
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, workers=args.workers, cache_path=None if args.no_cache else args.cache,
+          max_batch=args.max_batch, batch_window=args.batch_window, default_deadline=args.deadline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
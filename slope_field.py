@@ -0,0 +1,192 @@
+import time
+
+import numpy as np
+from pyray import Color, Image, PixelFormat, Rectangle, Vector2, WHITE, fade
+from raylib import ffi
+
+from backend import gfx
+
+
+# direction field of M dx + N dy = 0, i.e. dy/dx = -M/N, over a pannable / zoomable window.
+# the worker sends M and N as numpy code (engine.numpy_source, what lambdify would generate), they're
+# compiled once here and evaluated over the whole grid in one call each, so the window never needs sympy.
+# the segments are rasterized with numpy into a pixel buffer that's uploaded to one texture, and that's
+# only redone when the equation, the window or the grid changes. every other frame is one draw call
+
+
+DEFAULT_GRID = 100  # segments along each side
+DEFAULT_WINDOW = (-5.0, 5.0, -5.0, 5.0)  # xmin, xmax, ymin, ymax
+
+ZOOM_STEP = 0.9  # per wheel notch
+
+SEGMENT_COLOR = (51, 51, 51, 255)
+AXIS_COLOR = (51, 51, 51, 70)
+
+
+def compile_expr(code: str):
+    # (X, Y) -> array the shape of X. constants come back as scalars from numpy, those are broadcast
+    function = eval(f"lambda x, y: {code}", {"numpy": np})
+
+    def evaluate(X, Y):
+        with np.errstate(all="ignore"):
+            return np.broadcast_to(np.asarray(function(X, Y), dtype=float), np.shape(X))
+
+    return evaluate
+
+
+def compile_field(m_code: str, n_code: str):
+    # (X, Y) -> (M, N)
+    m, n = compile_expr(m_code), compile_expr(n_code)
+    return lambda X, Y: (m(X, Y), n(X, Y))
+
+
+class SlopeField:
+
+    def __init__(self, rect: Rectangle, font, grid: int = DEFAULT_GRID, window=DEFAULT_WINDOW):
+        self.rect = rect
+        self.font = font
+        self.grid = grid
+        self.window = list(window)
+
+        self.equation = None
+        self.field = None
+
+        self.width, self.height = int(rect.width), int(rect.height)
+        self.pixels = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        self.texture = None
+        self.built_key = None  # (equation, window, grid) the texture was last drawn for
+
+        self.dragging = False
+        self.last_mouse = (0.0, 0.0)
+
+        self.rebuilds = 0
+        self.rebuild_time = 0.0  # seconds, last rebuild
+        self.label = ""
+
+    @property
+    def has_field(self):
+        return self.field is not None
+
+    def set_equation(self, m_code: str, n_code: str):
+        if (m_code, n_code) == self.equation:
+            return
+        try:
+            field = compile_field(m_code, n_code)
+            # one tiny call to catch anything that only fails when it runs
+            field(np.zeros((1, 1)), np.zeros((1, 1)))
+        except Exception as e:
+            print(f"Slope field: {e}")
+            self.equation, self.field = None, None
+            return
+        self.equation, self.field = (m_code, n_code), field
+
+    def clear_equation(self):
+        self.equation, self.field = None, None
+
+    def set_grid(self, grid: int):
+        self.grid = max(2, grid)
+
+    def set_window(self, xmin: float, xmax: float, ymin: float, ymax: float):
+        if xmax > xmin and ymax > ymin:
+            self.window = [xmin, xmax, ymin, ymax]
+
+    def pan(self, dx: float, dy: float):
+        # dx, dy in pixels, dragging right moves the view left
+        xmin, xmax, ymin, ymax = self.window
+        shift_x = -dx * (xmax - xmin) / self.width
+        shift_y = dy * (ymax - ymin) / self.height
+        self.window = [xmin + shift_x, xmax + shift_x, ymin + shift_y, ymax + shift_y]
+
+    def zoom(self, factor: float, px: float, py: float):
+        # scales the window by factor around the point under pixel (px, py)
+        xmin, xmax, ymin, ymax = self.window
+        cx = xmin + px / self.width * (xmax - xmin)
+        cy = ymax - py / self.height * (ymax - ymin)
+        self.window = [cx + (xmin - cx) * factor, cx + (xmax - cx) * factor, cy + (ymin - cy) * factor, cy + (ymax - cy) * factor]
+
+    def handle_input(self, snapshot):
+        px, py = snapshot.mouse_x - self.rect.x, snapshot.mouse_y - self.rect.y
+
+        if snapshot.pressed and snapshot.is_inside(self.rect):
+            self.dragging = True
+            self.last_mouse = (px, py)
+        elif not snapshot.down:
+            self.dragging = False
+
+        if self.dragging and (px, py) != self.last_mouse:
+            self.pan(px - self.last_mouse[0], py - self.last_mouse[1])
+        self.last_mouse = (px, py)
+
+        if snapshot.wheel and snapshot.is_inside(self.rect):
+            self.zoom(ZOOM_STEP ** snapshot.wheel, px, py)
+
+    def rasterize(self):
+        width, height, grid = self.width, self.height, self.grid
+        xmin, xmax, ymin, ymax = self.window
+        pixels = self.pixels
+        pixels.fill(0)
+
+        # axes under the segments
+        if xmin < 0 < xmax:
+            pixels[:, int(-xmin / (xmax - xmin) * width)] = AXIS_COLOR
+        if ymin < 0 < ymax:
+            pixels[min(int(ymax / (ymax - ymin) * height), height - 1), :] = AXIS_COLOR
+
+        # segment centres in pixels and the points they sit on
+        cx = (np.arange(grid) + 0.5) * width / grid
+        cy = (np.arange(grid) + 0.5) * height / grid
+        CX, CY = np.meshgrid(cx, cy)
+        X = xmin + CX / width * (xmax - xmin)
+        Y = ymax - CY / height * (ymax - ymin)
+
+        M, N = self.field(X, Y)
+
+        # direction (N, -M) in world units, screen y points down so it becomes (N, M) scaled per axis
+        with np.errstate(all="ignore"):
+            sx = N * (width / (xmax - xmin))
+            sy = M * (height / (ymax - ymin))
+            length = np.hypot(sx, sy)
+            valid = np.isfinite(length) & (length > 0)  # M = N = 0 is a singular point, nothing to draw
+            ux = sx[valid] / length[valid]
+            uy = sy[valid] / length[valid]
+
+        # every segment sampled at the same steps along its length, all in one array
+        half = 0.4 * min(width, height) / grid
+        steps = np.linspace(-half, half, max(2, int(np.ceil(2 * half)) + 1))
+        xs = np.rint(CX[valid][:, None] + ux[:, None] * steps).astype(np.intp).ravel()
+        ys = np.rint(CY[valid][:, None] + uy[:, None] * steps).astype(np.intp).ravel()
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        pixels[ys[inside], xs[inside]] = SEGMENT_COLOR
+
+    def rebuild(self):
+        start = time.perf_counter()
+        self.rasterize()
+
+        if self.texture is None:
+            image = Image(ffi.from_buffer(self.pixels), self.width, self.height, 1, PixelFormat.PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
+            self.texture = gfx.load_texture_from_image(image)
+        else:
+            gfx.update_texture(self.texture, ffi.from_buffer(self.pixels))
+
+        xmin, xmax, ymin, ymax = self.window
+        self.label = f"x {xmin:.3g} .. {xmax:.3g}   y {ymin:.3g} .. {ymax:.3g}"
+        self.rebuilds += 1
+        self.rebuild_time = time.perf_counter() - start
+
+    def draw(self):
+        gfx.draw_rectangle_rounded(self.rect, 0.05, 0, Color(255, 255, 255, 235))
+        if self.field is None:
+            return
+
+        key = (self.equation, tuple(self.window), self.grid)
+        if key != self.built_key:
+            self.built_key = key
+            self.rebuild()
+
+        gfx.draw_texture_rec(self.texture, Rectangle(0, 0, self.width, self.height), Vector2(self.rect.x, self.rect.y), WHITE)
+        gfx.draw_text_ex(self.font, self.label, Vector2(self.rect.x + 10, self.rect.y + self.rect.height - 30), 25, 0, fade(Color(51, 51, 51, 255), 0.6))
+
+    def unload(self):
+        if self.texture is not None:
+            gfx.unload_texture(self.texture)
+            self.texture = None
@@ -0,0 +1,99 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from startup_profile import median, profile
+
+
+# fails (exit 1) when startup gets slower than its budget, for ci and before cutting a build.
+# times are from process start to the "First frame:" line, median of --repeat fresh launches.
+#
+#   python startup_budget.py               # import main + first frame against the headless backend, no display needed
+#   python startup_budget.py --window      # the real window (needs a display)
+#   python startup_budget.py --exe dist/main.exe
+#
+# the window process must never import sympy (it lives in the evaluator worker), that's checked too
+
+
+BUDGETS_MS = {
+    "import main": 250,
+    "first frame (headless)": 600,
+    "first frame (window)": 1500,
+    "first frame (exe)": 3000,
+}
+
+HEADLESS_FIRST_FRAME = """
+import sys
+from backend import HeadlessBackend, gfx
+gfx.use(HeadlessBackend())
+import main
+app = main.Window(500, 800, "DE")
+app.frame()
+print(f"sympy in window process: {'sympy' in sys.modules}", flush=True)
+app.evaluator.close()
+"""
+
+
+def time_to_first_frame(command):
+    # (seconds until the "First frame:" line, everything the process printed)
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONUNBUFFERED"] = "1"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+    elapsed = None
+    lines = []
+    for line in process.stdout:
+        lines.append(line.rstrip())
+        if elapsed is None and line.startswith("First frame:"):
+            elapsed = time.perf_counter() - start
+    process.wait()
+
+    if elapsed is None:
+        raise RuntimeError("no first frame:\n" + "\n".join(lines[-10:]))
+    return elapsed, lines
+
+
+def check(name: str, ms: float, budget: float):
+    ok = ms <= budget
+    print(f"{name:<26} {ms:8.1f} ms   budget {budget:8.1f} ms   {'ok' if ok else 'OVER'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="startup time budget check")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--window", action="store_true", help="launch the real window instead of the headless backend")
+    mode.add_argument("--exe", metavar="PATH", help="launch a frozen build")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, for slower ci machines")
+    args = parser.parse_args()
+
+    budgets = {name: ms * args.scale for name, ms in BUDGETS_MS.items()}
+    ok = True
+
+    if args.exe is not None:
+        name, command = "first frame (exe)", [args.exe, "--startup-check"]
+    elif args.window:
+        name, command = "first frame (window)", [sys.executable, "main.py", "--startup-check"]
+    else:
+        name, command = "first frame (headless)", [sys.executable, "-c", HEADLESS_FIRST_FRAME]
+
+        times = profile("main", args.repeat)
+        ok &= check("import main", times["main"][1] / 1000, budgets["import main"])
+
+    runs = [time_to_first_frame(command) for _ in range(args.repeat)]
+    ok &= check(name, median(seconds for seconds, _ in runs) * 1000, budgets[name])
+
+    if any("sympy in window process: True" in line for _, lines in runs for line in lines):
+        print("sympy was imported in the window process")
+        ok = False
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
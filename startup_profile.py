@@ -0,0 +1,119 @@
+import argparse
+import os
+import subprocess
+import sys
+
+
+# per module import time breakdown from python -X importtime, in fresh interpreters so nothing is cached
+#
+#   python startup_profile.py                 # import main, top 25 modules
+#   python startup_profile.py engine --top 40 # what the worker pays for
+#   python startup_profile.py --sympy-usage   # sympy subpackages the math never loads, for main.spec excludes
+
+
+def import_times(module: str):
+    # {module: (self us, cumulative us)} for one fresh `import module`
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # measure with .pyc files like a normal launch
+
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1])
+
+    times = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def profile(module: str, repeat: int):
+    runs = [import_times(module) for _ in range(repeat)]
+    names = set().union(*runs)
+    return {
+        name: (median(run.get(name, (0, 0))[0] for run in runs), median(run.get(name, (0, 0))[1] for run in runs))
+        for name in names
+    }
+
+
+def report(module: str, times, top: int):
+    total = times.get(module, (0, 0))[1]
+    print(f"import {module}: {total / 1000:.1f} ms, {len(times)} modules")
+
+    # self time summed per top level package, where the time actually goes
+    packages = {}
+    for name, (self_us, _) in times.items():
+        root = name.split(".")[0]
+        count, us = packages.get(root, (0, 0))
+        packages[root] = (count + 1, us + self_us)
+
+    print(f"\n{'package':<28} {'modules':>7} {'self ms':>9} {'share':>6}")
+    for root, (count, us) in sorted(packages.items(), key=lambda item: -item[1][1])[:top]:
+        print(f"{root:<28} {count:7d} {us / 1000:9.1f} {us / max(total, 1):6.0%}")
+
+    print(f"\n{'module':<48} {'self ms':>9} {'cumulative ms':>14}")
+    for name, (self_us, cumulative_us) in sorted(times.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"{name:<48} {self_us / 1000:9.1f} {cumulative_us / 1000:14.1f}")
+
+
+SYMPY_WORKLOAD = """
+import sys, engine
+engine.warm_up()
+for m, n in [("2*x*y + exp(x)", "x**2 + cos(y)"), ("y*exp(x*y) + 1/x", "x*exp(x*y) + log(y)"),
+             ("sin(x)*cos(y)", "-cos(x)*sin(y) + tan(y)"), ("x/(x**2 + y**2)", "y/(x**2 + y**2)"),
+             ("sqrt(x)*y", "x**(3/2)*2/3"), ("sin(x)**2 + cos(x)**2", "pi*E")]:
+    engine.check_exact(m, n, solve=True)
+print("\\n".join(name for name in sys.modules if name.startswith("sympy")))
+"""
+
+
+def sympy_usage():
+    # subpackages of sympy that never get imported while checking and solving a spread of equations
+    import pkgutil
+    import sympy
+
+    out = subprocess.run([sys.executable, "-c", SYMPY_WORKLOAD], capture_output=True, text=True, check=True)
+    loaded = set(out.stdout.split())
+
+    unused = []
+    packages = [("sympy", sympy.__path__)]
+    while packages:
+        name, path = packages.pop()
+        for info in pkgutil.iter_modules(path):
+            full = f"{name}.{info.name}"
+            if full in loaded:
+                if info.ispkg:
+                    packages.append((full, [os.path.join(path[0], info.name)]))
+            elif info.ispkg or info.name in ("conftest", "this"):
+                unused.append(full)
+
+    for name in sorted(unused):
+        print(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import time breakdown")
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=5, help="runs to take the median of")
+    parser.add_argument("--sympy-usage", action="store_true", help="list sympy subpackages the worker never imports")
+    args = parser.parse_args()
+
+    if args.sympy_usage:
+        sympy_usage()
+        return
+
+    report(args.module, profile(args.module, args.repeat), args.top)
+
+
+if __name__ == "__main__":
+    main()
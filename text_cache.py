@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+from backend import gfx
+
+
+# measure_text_ex walks every glyph of the string, but button labels and the input only change on a key press.
+# keyed by (font texture id, text, size, spacing), least recently used entries fall out past max_entries
+
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+class TextMeasureCache:
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def measure(self, font, text: str, font_size: float, spacing: float = 0):
+        key = (font.texture.id, text, font_size, spacing)
+
+        size = self.entries.get(key)
+        if size is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return size
+
+        self.misses += 1
+        measured = gfx.measure_text_ex(font, text, font_size, spacing)
+        size = (measured.x, measured.y)
+
+        self.entries[key] = size
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        return size
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
+
+
+text_cache = TextMeasureCache()
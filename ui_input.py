@@ -0,0 +1,105 @@
+from pyray import *
+
+
+# input is read once per frame into an InputSnapshot, the button under the cursor comes from a grid
+# over the button layouts, and clicks go straight to that button's handler instead of every button
+# asking "was I clicked?" on its own
+
+
+GRID_CELL = 75
+
+
+class InputSnapshot:
+
+    __slots__ = ("mouse_x", "mouse_y", "pressed", "down", "keys_down", "keys_pressed", "wheel")
+
+    # keys that something in the window reacts to while held
+    WATCHED_KEYS = (KeyboardKey.KEY_LEFT, KeyboardKey.KEY_RIGHT)
+
+    def __init__(self, mouse_x=0.0, mouse_y=0.0, pressed=False, down=False, keys_down=frozenset(), keys_pressed=frozenset(), wheel=0.0):
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.pressed = pressed  # left button went down this frame
+        self.down = down  # left button is held
+        self.keys_down = keys_down
+        self.keys_pressed = keys_pressed
+        self.wheel = wheel  # mouse wheel movement this frame
+
+    @classmethod
+    def capture(cls):
+        mouse = get_mouse_position()
+
+        keys_pressed = set()
+        key = get_key_pressed()
+        while key:
+            keys_pressed.add(key)
+            key = get_key_pressed()
+
+        return cls(
+            mouse.x,
+            mouse.y,
+            is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT),
+            is_mouse_button_down(MouseButton.MOUSE_BUTTON_LEFT),
+            frozenset(key for key in cls.WATCHED_KEYS if is_key_down(key)),
+            frozenset(keys_pressed),
+            get_mouse_wheel_move(),
+        )
+
+    def is_inside(self, rec):
+        # same rule as check_collision_point_rec
+        return rec.x <= self.mouse_x < rec.x + rec.width and rec.y <= self.mouse_y < rec.y + rec.height
+
+
+class GridIndex:
+
+    def __init__(self, arrays, cell: int = GRID_CELL):
+        self.arrays = arrays
+        self.cell = cell
+        self.cells = {}
+        self.version = None
+
+    def rebuild(self):
+        arrays = self.arrays
+        self.cells = {}
+
+        for i in range(arrays.count):
+            x, y, width, height = arrays.x[i], arrays.y[i], arrays.width[i], arrays.height[i]
+            if width <= 0 or height <= 0:
+                continue
+            for cx in range(int(x // self.cell), int((x + width) // self.cell) + 1):
+                for cy in range(int(y // self.cell), int((y + height) // self.cell) + 1):
+                    self.cells.setdefault((cx, cy), []).append(i)
+
+        self.version = arrays.layout_version
+
+    def query(self, x: float, y: float) -> int:
+        # index of the visible button under (x, y), or -1. only looks at the one cell the point is in
+        if self.version != self.arrays.layout_version:
+            self.rebuild()
+
+        arrays = self.arrays
+        for i in self.cells.get((int(x // self.cell), int(y // self.cell)), ()):
+            if arrays.visible[i] and arrays.x[i] <= x < arrays.x[i] + arrays.width[i] and arrays.y[i] <= y < arrays.y[i] + arrays.height[i]:
+                return i
+        return -1
+
+
+class InputDispatcher:
+
+    def __init__(self, arrays):
+        self.index = GridIndex(arrays)
+        self.handlers = {}  # button index -> callable
+        self.hovered = -1
+
+    def on_click(self, button, handler):
+        self.handlers[button.index] = handler
+
+    def dispatch(self, snapshot: InputSnapshot):
+        self.hovered = self.index.query(snapshot.mouse_x, snapshot.mouse_y)
+
+        if snapshot.pressed and self.hovered >= 0:
+            handler = self.handlers.get(self.hovered)
+            if handler is not None:
+                handler()
+
+        return self.hovered
@@ -0,0 +1,175 @@
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+from sympy import Poly, cancel, expand, lambdify, simplify, symbols
+from sympy.polys.polyerrors import PolynomialError
+
+
+# decides whether dM/dy - dN/dx is zero without handing everything to .equals(), which can hang on trig/log input.
+# cheapest tier first, every tier shares one time budget:
+#   structural -> expand/cancel -> numeric (numpy at random points) -> simplify
+
+
+x, y = symbols("x y")
+
+DEFAULT_BUDGET = 5.0
+SAMPLE_POINTS = 64
+SAMPLE_RANGE = (0.25, 2.75)  # positive so log/sqrt stay real for the usual textbook input
+MIN_FINITE_POINTS = 8
+
+
+class BudgetExceeded(BaseException):
+    # not an Exception, sympy has plenty of "except Exception:" fallbacks that would swallow the alarm and keep
+    # going past the budget. only the tier boundaries (equal_within_budget, solve_potential, ...) catch it
+    pass
+
+
+@contextmanager
+def time_limit(seconds: float):
+    # hard limit through SIGALRM when we can (main thread on unix), otherwise the budget is only checked between tiers
+    if seconds <= 0:
+        raise BudgetExceeded()
+
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise BudgetExceeded()
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class ZeroTestResult:
+
+    def __init__(self):
+        self.is_zero = None  # None means the budget ran out before any tier decided
+        self.tier = None
+        self.certain = False
+        self.timings = {}  # tier -> seconds
+
+    def to_dict(self):
+        return {
+            "is_zero": self.is_zero,
+            "tier": self.tier,
+            "certain": self.certain,
+            "timings": dict(self.timings),
+        }
+
+    def __repr__(self):
+        return f"ZeroTestResult(is_zero={self.is_zero}, tier={self.tier!r}, certain={self.certain})"
+
+
+def _structural(lhs, rhs):
+    if lhs == rhs or (lhs - rhs) == 0:
+        return True, True
+    return None, False
+
+
+def _algebraic(lhs, rhs):
+    difference = lhs - rhs
+    if expand(difference) == 0:
+        return True, True
+
+    cancelled = cancel(difference)
+    if cancelled == 0:
+        return True, True
+
+    # a nonzero polynomial/rational difference after cancel really is nonzero, but only when its coefficients
+    # are plain rationals. log(6) - log(2) - log(3) or sin(1)**2 + cos(1)**2 - 1 are "constants" cancel can't
+    # reduce, those go on to the numeric tier
+    if cancelled.is_rational_function(x, y):
+        numer, _ = cancelled.as_numer_denom()
+        try:
+            domain = Poly(numer, x, y).domain
+        except PolynomialError:
+            return None, False
+        if domain.is_ZZ or domain.is_QQ:
+            return False, True
+
+    return None, False
+
+
+def _numeric(lhs, rhs):
+    # anything besides x and y (a stray "e" symbol, parameters) can't be sampled
+    if not (lhs.free_symbols | rhs.free_symbols) <= {x, y}:
+        return None, False
+
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(*SAMPLE_RANGE, SAMPLE_POINTS)
+    ys = rng.uniform(*SAMPLE_RANGE, SAMPLE_POINTS)
+
+    f = lambdify((x, y), [lhs, rhs], modules="numpy")
+
+    with np.errstate(all="ignore"):
+        a, b = (np.broadcast_to(np.asarray(value, dtype=complex), xs.shape) for value in f(xs, ys))
+
+    finite = np.isfinite(a) & np.isfinite(b)
+    if finite.sum() < MIN_FINITE_POINTS:
+        return None, False
+
+    close = np.isclose(a[finite], b[finite], rtol=1e-9, atol=1e-12)
+    if close.all():
+        # agreeing everywhere we looked is strong evidence, not a proof
+        return True, False
+
+    # confirm the first disagreement with high precision so float noise can't flip the verdict
+    i = int(np.flatnonzero(finite)[np.argmin(close)])
+    point = {x: xs[i], y: ys[i]}
+    value = (lhs - rhs).evalf(30, subs=point)
+    if value.is_number and abs(value) > 1e-15:
+        return False, True
+
+    return None, False
+
+
+def _simplify(lhs, rhs):
+    if simplify(lhs - rhs) == 0:
+        return True, True
+    # simplify not reaching zero is only a strong hint
+    return False, False
+
+
+TIERS = (
+    ("structural", _structural),
+    ("algebraic", _algebraic),
+    ("numeric", _numeric),
+    ("simplify", _simplify),
+)
+
+
+def equal_within_budget(lhs, rhs, budget: float = DEFAULT_BUDGET) -> ZeroTestResult:
+    result = ZeroTestResult()
+    deadline = time.perf_counter() + budget
+
+    for name, tier in TIERS:
+        start = time.perf_counter()
+        try:
+            with time_limit(deadline - start):
+                verdict, certain = tier(lhs, rhs)
+        except BudgetExceeded:
+            result.timings[name] = time.perf_counter() - start
+            result.tier = "timeout"
+            break
+        except Exception:
+            # lambdify/numpy can choke on odd input, just move on to the next tier
+            verdict, certain = None, False
+
+        result.timings[name] = time.perf_counter() - start
+
+        if verdict is not None:
+            result.is_zero = verdict
+            result.tier = name
+            result.certain = certain
+            break
+
+    return result